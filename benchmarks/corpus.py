@@ -0,0 +1,253 @@
+"""Deterministic synthetic PDFs for tests and benchmarks.
+
+The same parameters and seed always produce the same document, so
+benchmark numbers from different releases are measured on identical input.
+
+Usage:
+    python benchmarks/corpus.py corpus/ --preset annotated
+    python benchmarks/corpus.py corpus/ --pages 200 --images-per-page 3 --duplicate-ratio 0.2
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import fitz
+from PIL import Image, ImageDraw
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+MARGIN = 36
+
+WORDS = (
+    "image figure scan annotation layer page chapter section table diagram "
+    "result method sample overlay caption plate margin index volume"
+).split()
+
+# Named parameter sets used by the benchmark suite
+PRESETS = {
+    "small": {"pages": 5, "images_per_page": 2},
+    "mixed": {
+        "pages": 40,
+        "images_per_page": 3,
+        "image_sizes": [(320, 240), (800, 600), (1600, 1200)],
+        "formats": ["jpeg", "png"],
+        "duplicate_ratio": 0.25,
+        "smask_ratio": 0.2,
+        "vector_figures": 2,
+    },
+    "annotated": {
+        "pages": 30,
+        "images_per_page": 1,
+        "overlay_pairs": 1,
+        "image_sizes": [(1200, 900)],
+    },
+    "large-images": {
+        "pages": 10,
+        "images_per_page": 1,
+        "image_sizes": [(4000, 3000)],
+    },
+}
+
+
+def make_image(rng, size, image_format="jpeg", alpha=False):
+    """Return the bytes of a deterministic test picture
+
+    Gradients plus random shapes keep the picture from compressing to
+    nothing while still depending only on the seed.
+    """
+    width, height = size
+    gradient = Image.linear_gradient("L").resize((width, height))
+    image = Image.merge(
+        "RGB",
+        (
+            gradient,
+            gradient.transpose(Image.Transpose.ROTATE_90).resize((width, height)),
+            Image.new("L", (width, height), rng.randrange(256)),
+        ),
+    )
+
+    draw = ImageDraw.Draw(image)
+    for _ in range(12):
+        x0, y0 = rng.randrange(width), rng.randrange(height)
+        x1, y1 = x0 + rng.randrange(1, width // 2 + 2), y0 + rng.randrange(1, height // 2 + 2)
+        color = tuple(rng.randrange(256) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.ellipse((x0, y0, x1, y1), fill=color)
+        else:
+            draw.rectangle((x0, y0, x1, y1), outline=color, width=max(1, width // 100))
+
+    if alpha:
+        # A soft alpha channel makes fitz store the image with an SMask
+        image.putalpha(gradient.transpose(Image.Transpose.FLIP_LEFT_RIGHT))
+        image_format = "png"
+
+    buffer = io.BytesIO()
+    if image_format == "jpeg":
+        image.save(buffer, "JPEG", quality=85)
+    else:
+        image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def make_annotation_layer(rng, size):
+    """Return PNG bytes of a black image with strokes, like a scanned overlay"""
+    width, height = size
+    image = Image.new("RGB", size, (0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for _ in range(6):
+        points = [(rng.randrange(width), rng.randrange(height)) for _ in range(4)]
+        draw.line(points, fill=(255, 255, 255), width=max(2, width // 200))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _image_slots(count):
+    """Split the page body into count stacked rectangles"""
+    top, bottom = 90, PAGE_HEIGHT - MARGIN
+    height = (bottom - top) / max(count, 1)
+    return [
+        fitz.Rect(MARGIN, top + i * height, PAGE_WIDTH - MARGIN, top + (i + 1) * height - 30)
+        for i in range(count)
+    ]
+
+
+def _draw_vector_figure(page, rng):
+    x0 = rng.uniform(MARGIN, PAGE_WIDTH / 2)
+    y0 = rng.uniform(100, PAGE_HEIGHT - 200)
+    color = (rng.random(), rng.random(), rng.random())
+    shape = page.new_shape()
+    shape.draw_rect(fitz.Rect(x0, y0, x0 + 120, y0 + 80))
+    shape.draw_circle(fitz.Point(x0 + 60, y0 + 40), 30)
+    shape.draw_bezier((x0, y0 + 80), (x0 + 40, y0), (x0 + 80, y0 + 160), (x0 + 120, y0 + 80))
+    shape.finish(color=color, width=1.5)
+    shape.commit()
+
+
+def generate_pdf(
+    path,
+    pages=10,
+    images_per_page=2,
+    image_sizes=((640, 480),),
+    formats=("jpeg",),
+    duplicate_ratio=0.0,
+    overlay_pairs=0,
+    smask_ratio=0.0,
+    vector_figures=0,
+    chapter_every=5,
+    seed=0,
+):
+    """Write a synthetic PDF and return a summary of what it contains
+
+    Args:
+        path: Output PDF path
+        pages (int): Number of pages
+        images_per_page (int): Plain images per page
+        image_sizes: (width, height) choices for the images
+        formats: Image formats to choose from ("jpeg", "png")
+        duplicate_ratio (float): Share of images that repeat an earlier image
+        overlay_pairs (int): Original + annotation overlay pairs per page
+        smask_ratio (float): Share of images that get an alpha channel (SMask)
+        vector_figures (int): Vector drawings per page
+        chapter_every (int): Pages per top-level bookmark (0 for none)
+        seed (int): Random seed; the same seed gives the same PDF
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+    produced = []
+    summary = {"pages": pages, "images": 0, "duplicates": 0, "overlay_pairs": 0, "smasks": 0}
+    toc = []
+
+    for page_index in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        page.insert_text((MARGIN, 50), f"Page {page_index + 1}", fontsize=16)
+        body = " ".join(rng.choice(WORDS) for _ in range(40))
+        page.insert_textbox(fitz.Rect(MARGIN, 60, PAGE_WIDTH - MARGIN, 90), body, fontsize=8)
+
+        if chapter_every and page_index % chapter_every == 0:
+            toc.append([1, f"Chapter {page_index // chapter_every + 1}", page_index + 1])
+            toc.append([2, f"Section {page_index + 1}.1", page_index + 1])
+
+        slots = _image_slots(images_per_page + overlay_pairs)
+        for slot_index, rect in enumerate(slots):
+            size = tuple(rng.choice(image_sizes))
+
+            if slot_index >= images_per_page:
+                # Original and overlay drawn at the same position
+                page.insert_image(rect, stream=make_image(rng, size, "jpeg"))
+                page.insert_image(rect, stream=make_annotation_layer(rng, size))
+                summary["overlay_pairs"] += 1
+                summary["images"] += 2
+            else:
+                if produced and rng.random() < duplicate_ratio:
+                    stream = rng.choice(produced)
+                    summary["duplicates"] += 1
+                else:
+                    alpha = rng.random() < smask_ratio
+                    stream = make_image(rng, size, rng.choice(formats), alpha)
+                    summary["smasks"] += alpha
+                    produced.append(stream)
+                page.insert_image(rect, stream=stream)
+                summary["images"] += 1
+
+            caption = f"Figure {page_index + 1}.{slot_index + 1}"
+            page.insert_text((rect.x0, rect.y1 + 14), caption, fontsize=9)
+
+        for _ in range(vector_figures):
+            _draw_vector_figure(page, rng)
+
+    if toc:
+        doc.set_toc(toc)
+    doc.save(str(path), deflate=True, no_new_id=True)
+    doc.close()
+    return summary
+
+
+def generate_preset(path, preset, seed=0):
+    """Generate one of the named PRESETS"""
+    return generate_pdf(path, seed=seed, **PRESETS[preset])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic test PDFs")
+    parser.add_argument("output_dir")
+    parser.add_argument("--preset", choices=sorted(PRESETS), action="append")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--images-per-page", type=int, default=2)
+    parser.add_argument("--size", default="640x480", help="e.g. 640x480,1600x1200")
+    parser.add_argument("--formats", default="jpeg", help="e.g. jpeg,png")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.0)
+    parser.add_argument("--overlay-pairs", type=int, default=0)
+    parser.add_argument("--smask-ratio", type=float, default=0.0)
+    parser.add_argument("--vector-figures", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    summaries = {}
+    if args.preset:
+        for preset in args.preset:
+            path = os.path.join(args.output_dir, f"{preset}.pdf")
+            summaries[path] = generate_preset(path, preset, args.seed)
+    else:
+        path = os.path.join(args.output_dir, "synthetic.pdf")
+        summaries[path] = generate_pdf(
+            path,
+            pages=args.pages,
+            images_per_page=args.images_per_page,
+            image_sizes=[tuple(map(int, size.split("x"))) for size in args.size.split(",")],
+            formats=args.formats.split(","),
+            duplicate_ratio=args.duplicate_ratio,
+            overlay_pairs=args.overlay_pairs,
+            smask_ratio=args.smask_ratio,
+            vector_figures=args.vector_figures,
+            seed=args.seed,
+        )
+    json.dump(summaries, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
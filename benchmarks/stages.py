@@ -0,0 +1,170 @@
+"""Stage benchmarks on a synthetic corpus.
+
+Times the extraction stages and PDF tools on PDFs from benchmarks/corpus.py
+and writes JSON that can be compared across releases.
+
+Usage:
+    python benchmarks/stages.py --runs 3 --output stages.json
+    python benchmarks/stages.py --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+import fitz
+from benchmarks.corpus import PRESETS, generate_preset
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util.image_handler import extract_to_ppt, process_page_images
+from src.util.pdf_tools import PDFTools
+
+
+def bench_extract_images(pdf_path, work_dir, image_format):
+    output_dir = tempfile.mkdtemp(dir=work_dir)
+    return {"images": extract_images_from_pdf(pdf_path, output_dir, image_format=image_format)}
+
+
+def bench_process_page_images(pdf_path, work_dir):
+    doc = fitz.open(pdf_path)
+    try:
+        images = sum(len(process_page_images(page, doc)) for page in doc)
+        return {"images": images, "pages": doc.page_count}
+    finally:
+        doc.close()
+
+
+def bench_extract_to_ppt(pdf_path, work_dir):
+    doc = fitz.open(pdf_path)
+    try:
+        images = [
+            doc.extract_image(img[0])["image"] for page in doc for img in page.get_images()
+        ]
+    finally:
+        doc.close()
+    output_dir = tempfile.mkdtemp(dir=work_dir)
+    extract_to_ppt(images, output_dir, "benchmark", open_when_done=False)
+    return {"images": len(images)}
+
+
+def bench_extract_text(pdf_path, work_dir):
+    with fitz.open(pdf_path) as doc:
+        page_count = doc.page_count
+    output_path = os.path.join(tempfile.mkdtemp(dir=work_dir), "text.txt")
+    success, message = PDFTools.export_text_with_options(pdf_path, output_path, 1, page_count)
+    if not success:
+        raise RuntimeError(message)
+    return {}
+
+
+def bench_split_and_merge(pdf_path, work_dir):
+    output_dir = tempfile.mkdtemp(dir=work_dir)
+    success, message = PDFTools.split_pdf_by_pages(pdf_path, output_dir, 10)
+    if not success:
+        raise RuntimeError(message)
+    parts = sorted(os.path.join(output_dir, name) for name in os.listdir(output_dir))
+    success, message = PDFTools.merge_pdfs(parts, os.path.join(work_dir, "merged.pdf"))
+    if not success:
+        raise RuntimeError(message)
+    return {"files": len(parts)}
+
+
+def bench_extract_bookmarks(pdf_path, work_dir):
+    PDFTools.extract_bookmarks(pdf_path)
+    return {}
+
+
+# (name, preset, function, extra arguments)
+BENCHMARKS = [
+    ("extract_images_jpeg", "mixed", bench_extract_images, ("JPEG",)),
+    ("extract_images_png", "mixed", bench_extract_images, ("PNG",)),
+    ("extract_images_auto", "mixed", bench_extract_images, ("AUTO",)),
+    ("extract_images_large", "large-images", bench_extract_images, ("JPEG",)),
+    ("process_page_images", "annotated", bench_process_page_images, ()),
+    ("extract_to_ppt", "mixed", bench_extract_to_ppt, ()),
+    ("pdf_tools_extract_text", "mixed", bench_extract_text, ()),
+    ("pdf_tools_split_merge", "mixed", bench_split_and_merge, ()),
+    ("pdf_tools_extract_bookmarks", "mixed", bench_extract_bookmarks, ()),
+]
+
+
+def run_benchmarks(runs, selected=None, seed=0):
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        corpus = {}
+        for name, preset, function, args in BENCHMARKS:
+            if selected and name not in selected:
+                continue
+            if preset not in corpus:
+                path = os.path.join(work_dir, f"{preset}.pdf")
+                corpus[preset] = (path, generate_preset(path, preset, seed))
+            pdf_path, summary = corpus[preset]
+
+            timings = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                counts = function(pdf_path, work_dir, *args)
+                timings.append(time.perf_counter() - started)
+
+            median = statistics.median(timings)
+            results[name] = {
+                "preset": preset,
+                "seconds_median": median,
+                "seconds_min": min(timings),
+                "runs": timings,
+                "pages_per_second": summary["pages"] / median if median else None,
+                **counts,
+            }
+
+    return {
+        "benchmark": "stages",
+        "python": sys.version.split()[0],
+        "pymupdf": fitz.VersionBind,
+        "platform": sys.platform,
+        "seed": seed,
+        "presets": {preset: PRESETS[preset] for preset in {r["preset"] for r in results.values()}},
+        "results": results,
+    }
+
+
+def compare(report, baseline):
+    """Return {name: current / baseline median time} for shared benchmarks"""
+    return {
+        name: result["seconds_median"] / baseline["results"][name]["seconds_median"]
+        for name, result in report["results"].items()
+        if name in baseline.get("results", {})
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--only", action="append", choices=[name for name, *_ in BENCHMARKS]
+    )
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.runs, args.only, args.seed)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report["relative_to_baseline"] = compare(report, json.load(f))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
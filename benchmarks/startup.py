@@ -0,0 +1,112 @@
+"""Startup benchmark: time from process launch to the first window paint.
+
+Each run starts a fresh interpreter, so the numbers include Python startup,
+imports, resource registration and building the main window.
+
+Usage:
+    python benchmarks/startup.py --runs 5 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+
+def measure_in_child():
+    """Build the main window and print the wall time of its first paint"""
+    imports_started = time.time()
+    from PyQt5.QtCore import QEvent, QObject, Qt, QTimer
+    from PyQt5.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    from src.ui.resources import register_resources
+
+    imports_done = time.time()
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and obj is window:
+                print(
+                    json.dumps(
+                        {
+                            "imports_started": imports_started,
+                            "imports_done": imports_done,
+                            "first_paint": time.time(),
+                        }
+                    ),
+                    flush=True,
+                )
+                QTimer.singleShot(0, app.quit)
+                obj.removeEventFilter(self)
+            return False
+
+    app = QApplication(sys.argv)
+    register_resources()
+    app.setStyle("Fusion")
+    app.setLayoutDirection(Qt.RightToLeft)
+
+    window = MainWindow()
+    paint_filter = FirstPaintFilter()
+    window.installEventFilter(paint_filter)
+    window.show()
+    app.exec_()
+
+
+def run_benchmark(runs):
+    results = []
+    for _ in range(runs):
+        launched = time.time()
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        results.append(
+            {
+                "interpreter_ms": (timings["imports_started"] - launched) * 1000,
+                "imports_ms": (timings["imports_done"] - timings["imports_started"]) * 1000,
+                "first_paint_ms": (timings["first_paint"] - launched) * 1000,
+            }
+        )
+
+    first_paint = [result["first_paint_ms"] for result in results]
+    return {
+        "benchmark": "startup",
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "runs": results,
+        "first_paint_ms_median": statistics.median(first_paint),
+        "first_paint_ms_min": min(first_paint),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure_in_child()
+        return
+
+    report = run_benchmark(args.runs)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,20 @@ if exist "*.spec" del /f /q *.spec
 echo Installing required packages...
 pip install pyinstaller pillow python-pptx pymupdf pyqt5 qtawesome
 
+echo Compiling resource bundle...
+python -m src.ui.resources
+
 echo Creating spec file and building...
 pyinstaller --name "PDF Image Extractor" ^
     --onefile ^
     --noconsole ^
     --icon "resources/icons/logo.ico" ^
     --add-data "resources;resources" ^
+    --add-data "src/modules/modules.json;src/modules" ^
+    --hidden-import "src.modules.image_extractor.widget" ^
+    --hidden-import "src.modules.bookmark_extractor.widget" ^
+    --hidden-import "src.modules.note_extractor.widget" ^
+    --hidden-import "src.modules.job_queue.widget" ^
     --hidden-import "PIL._tkinter_finder" ^
     --hidden-import "pptx" ^
     --hidden-import "fitz" ^
@@ -1,4 +1,6 @@
 from src.ui.app import run_app
+from src.util import profiling
 
 if __name__ == "__main__":
+    profiling.configure_process()
     run_app()
@@ -4,4 +4,6 @@ setup(
     name="pdf_imaging",
     version="0.1",
     packages=find_packages(),
+    package_data={"src.modules": ["modules.json"]},
+    entry_points={"console_scripts": ["pdf-imaging=src.cli:main"]},
 )
@@ -0,0 +1,401 @@
+"""Headless command-line entry point for image extraction.
+
+Usage:
+    python -m src.cli book.pdf scans/ -o extracted --jobs 4 --format png
+
+This module must not import PyQt5 so it can run on servers without Qt.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import fitz
+from .modules.pdf_processor import extract_images_from_pdf, extract_merged_images_from_pdf
+from .engine.cancellation import CancellationToken
+from .engine.estimate import Calibration, estimate, split_pages, total
+from .util import phash, profiling, telemetry, tiled
+from .util.image_catalog import ImageCatalog
+from .util.output_sink import open_sink
+from .util.paths import unique_output_dir
+from .util.sidecar import ImageSidecar
+
+
+FORMATS = {"jpg": "JPEG", "png": "PNG", "auto": "AUTO", "pptx": "PPTX"}
+
+
+def collect_pdfs(paths):
+    """Expand files and directories into a sorted list of (PDF path, name)
+
+    name is the path below the directory it was found in, without the
+    extension (just the file stem for PDFs given directly), so PDFs with
+    the same file name in different folders get different output folders.
+    """
+    pdfs = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            for pdf in sorted(path.rglob("*.pdf")):
+                pdfs.append((str(pdf), str(pdf.relative_to(path).with_suffix(""))))
+        else:
+            pdfs.append((str(path), path.stem))
+    return pdfs
+
+
+def parse_page_range(value):
+    """Parse 'START-END', 'START-' or 'PAGE' into a (start, end) tuple"""
+    try:
+        if "-" in value:
+            start, end = value.split("-", 1)
+            return int(start or 1), int(end) if end else None
+        return int(value), int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid page range: {value}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pdf-imaging", description="Extract images from PDF files"
+    )
+    parser.add_argument("paths", nargs="+", help="PDF files or directories")
+    parser.add_argument(
+        "-o", "--output", default="extracted", help="output directory"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of PDFs processed in parallel",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATS),
+        default="jpg",
+        help="output format (auto picks JPEG or PNG per image from its content; "
+        "pptx writes one presentation per PDF)",
+    )
+    parser.add_argument(
+        "--dedupe",
+        type=int,
+        nargs="?",
+        const=phash.DEFAULT_DISTANCE,
+        metavar="BITS",
+        help="keep one image per group of near-duplicates whose perceptual hashes "
+        f"differ in at most BITS bits (default {phash.DEFAULT_DISTANCE})",
+    )
+    parser.add_argument(
+        "--catalog",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="skip images stored by earlier runs (e.g. a previous edition) and link "
+        "to them; the catalog defaults to the cache directory",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only extract pages that changed since the last run into the output "
+        "directory and keep the images of the others",
+    )
+    parser.add_argument(
+        "--sidecar",
+        action="store_true",
+        help="select images from a per-PDF metadata index in the cache directory, "
+        "built on first use, instead of parsing the pages",
+    )
+    parser.add_argument(
+        "--encode-workers",
+        type=int,
+        help="threads encoding images within each PDF (default: CPUs / jobs)",
+    )
+    parser.add_argument(
+        "--pages", type=parse_page_range, help="page range, e.g. 3-10"
+    )
+    parser.add_argument(
+        "--min-size",
+        type=int,
+        default=100,
+        help="skip images smaller than this width/height (0 keeps all, "
+        "ignored with --merge-annotations)",
+    )
+    parser.add_argument(
+        "--archive",
+        choices=["zip", "tar"],
+        help="write each PDF's images to one OUTPUT/<name>.zip or .tar "
+        "instead of loose files",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        help="give up on a PDF after this many seconds",
+    )
+    parser.add_argument(
+        "--telemetry",
+        metavar="PATH",
+        help="append structured timing and throughput events to PATH (JSON lines)",
+    )
+    parser.add_argument(
+        "--tile-threshold",
+        type=float,
+        metavar="MP",
+        help=f"process images above MP megapixels in strips (default {tiled.THRESHOLD_MP})",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=profiling.MODES[1:],
+        help="write a per-stage timing report (see --profile-report)",
+    )
+    parser.add_argument(
+        "--profile-report",
+        metavar="PATH",
+        help="where to write the profiling report (JSON)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only print the estimated images, output size and time per range "
+        "of --range-pages pages",
+    )
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="record the throughput of this run for later --dry-run estimates",
+    )
+    parser.add_argument(
+        "--range-pages",
+        type=int,
+        default=100,
+        help="pages per estimated range with --dry-run",
+    )
+    parser.add_argument(
+        "--invert", action="store_true", help="remove black image backgrounds"
+    )
+    parser.add_argument(
+        "--merge-annotations",
+        action="store_true",
+        help="merge annotation overlay images onto their originals",
+    )
+    parser.add_argument(
+        "--annotated-only",
+        action="store_true",
+        help="with --merge-annotations, keep only images that had an overlay",
+    )
+    return parser
+
+
+def run_job(job):
+    """Extract one PDF and return its summary (runs inside a worker process)"""
+    started = time.perf_counter()
+    summary = {"path": job["pdf_path"], "output_dir": job["output_dir"]}
+    sink = None
+    catalog = None
+    sidecar = None
+    cancel = CancellationToken(timeout=job["timeout"])
+    # Learn the throughput for later dry runs; telemetry stays off otherwise
+    calibration = telemetry.add_sink(Calibration()) if job["calibrate"] else None
+
+    try:
+        if job["archive"]:
+            sink = open_sink(
+                os.path.dirname(job["output_dir"]),
+                job["archive"],
+                os.path.basename(job["output_dir"]),
+            )
+            summary["archive"] = sink.path
+        if job["catalog"] is not None:
+            catalog = ImageCatalog(job["catalog"] or None, job["dedupe_distance"])
+        if job["sidecar"] and not job["merge_annotations"]:
+            sidecar = ImageSidecar(job["pdf_path"])
+
+        # Progress messages go to stderr so stdout stays valid JSON
+        with contextlib.redirect_stdout(sys.stderr):
+            if job["merge_annotations"]:
+                count = extract_merged_images_from_pdf(
+                    job["pdf_path"],
+                    job["output_dir"],
+                    start_page=job["start_page"],
+                    end_page=job["end_page"],
+                    include_non_annotated=job["include_non_annotated"],
+                    output_format=job["format"],
+                    cancel=cancel,
+                    sink=sink,
+                    encode_workers=job["encode_workers"],
+                    dedupe_distance=job["dedupe_distance"],
+                )
+            else:
+                count = extract_images_from_pdf(
+                    job["pdf_path"],
+                    job["output_dir"],
+                    skip_small=job["min_size"] > 0,
+                    min_size=job["min_size"],
+                    start_page=job["start_page"],
+                    end_page=job["end_page"],
+                    should_invert=job["invert"],
+                    image_format=job["format"],
+                    cancel=cancel,
+                    sink=sink,
+                    encode_workers=job["encode_workers"],
+                    dedupe_distance=job["dedupe_distance"],
+                    catalog=catalog,
+                    incremental=job["incremental"],
+                    sidecar=sidecar,
+                )
+        summary["images"] = count
+        summary["error"] = None
+    except Exception as e:
+        summary["images"] = 0
+        summary["error"] = str(e)
+    finally:
+        if sink:
+            sink.close()
+        if catalog is not None:
+            catalog.close()
+        if sidecar is not None:
+            sidecar.close()
+        if calibration is not None:
+            telemetry.remove_sink(calibration)
+
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    return summary
+
+
+def build_jobs(args):
+    start_page, end_page = args.pages or (1, None)
+    output_format = FORMATS[args.format]
+    # Split the CPUs between the PDF worker processes
+    # (--jobs 0 runs the PDFs one at a time, like --jobs 1)
+    encode_workers = args.encode_workers or max(1, (os.cpu_count() or 1) // max(1, args.jobs))
+
+    jobs = []
+    taken = {}
+    for pdf_path, name in collect_pdfs(args.paths):
+        output_dir = unique_output_dir(args.output, name, taken, os.path.abspath(pdf_path))
+        if output_dir != os.path.join(args.output, name):
+            print(
+                f"Warning: {pdf_path} shares its output folder name; writing to {output_dir}",
+                file=sys.stderr,
+            )
+        jobs.append(
+            {
+                "pdf_path": pdf_path,
+                "output_dir": output_dir,
+                "format": output_format,
+                "start_page": start_page,
+                "end_page": end_page,
+                "min_size": args.min_size,
+                "invert": args.invert,
+                "archive": args.archive,
+                "timeout": args.timeout,
+                "encode_workers": encode_workers,
+                "dedupe_distance": args.dedupe,
+                "catalog": args.catalog,
+                "incremental": args.incremental,
+                "sidecar": args.sidecar,
+                "merge_annotations": args.merge_annotations,
+                "include_non_annotated": not args.annotated_only,
+                "calibrate": args.calibrate,
+            }
+        )
+    return jobs
+
+
+def estimate_job(job, range_pages):
+    """Dry-run estimate of one job, per range of range_pages pages"""
+    summary = {"path": job["pdf_path"]}
+    sidecar = None
+    try:
+        if job["sidecar"]:
+            sidecar = ImageSidecar(job["pdf_path"])
+            page_count = sidecar.page_count
+        else:
+            with fitz.open(job["pdf_path"]) as doc:
+                page_count = doc.page_count
+        end_page = min(job["end_page"] or page_count, page_count)
+        estimates = estimate(
+            job["pdf_path"],
+            split_pages(job["start_page"], end_page, range_pages),
+            job["format"],
+            skip_small=job["min_size"] > 0 and not job["merge_annotations"],
+            min_size=job["min_size"],
+            sidecar=sidecar,
+        )
+    except Exception as e:
+        return dict(summary, error=str(e), images=0, output_bytes=0, seconds=0)
+    finally:
+        if sidecar is not None:
+            sidecar.close()
+    return dict(
+        summary,
+        error=None,
+        ranges=[item._asdict() for item in estimates],
+        **total(estimates)._asdict(),
+    )
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.format == "pptx" and not args.merge_annotations:
+        parser.error("--format pptx requires --merge-annotations")
+    if args.format == "pptx" and args.archive:
+        parser.error("--archive cannot be used with --format pptx")
+    if args.catalog is not None and (args.archive or args.merge_annotations):
+        parser.error("--catalog cannot be used with --archive or --merge-annotations")
+    if args.incremental and (args.archive or args.merge_annotations):
+        parser.error("--incremental cannot be used with --archive or --merge-annotations")
+
+    if args.telemetry:
+        # Through the environment so worker processes report too
+        os.environ[telemetry.ENV_VAR] = args.telemetry
+
+    if args.tile_threshold:
+        # Read by the worker processes too
+        os.environ[tiled.THRESHOLD_ENV_VAR] = str(args.tile_threshold)
+
+    if args.profile:
+        os.environ[profiling.ENV_VAR] = args.profile
+        if args.profile_report:
+            os.environ[profiling.REPORT_ENV_VAR] = os.path.abspath(args.profile_report)
+    profiling.configure_process()
+
+    jobs = build_jobs(args)
+    if args.dry_run:
+        estimates = [estimate_job(job, args.range_pages) for job in jobs]
+        summary = {
+            "files": estimates,
+            "total_files": len(estimates),
+            "total_images": sum(item["images"] for item in estimates),
+            "output_bytes": sum(item["output_bytes"] for item in estimates),
+            "seconds": round(sum(item["seconds"] for item in estimates), 3),
+        }
+        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        return 1 if any(item["error"] for item in estimates) else 0
+    started = time.perf_counter()
+
+    if args.jobs <= 1 or len(jobs) <= 1:
+        results = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=args.jobs, initializer=profiling.configure_process
+        ) as executor:
+            results = list(executor.map(run_job, jobs))
+
+    failed = [result for result in results if result["error"]]
+    summary = {
+        "files": results,
+        "total_files": len(results),
+        "failed_files": len(failed),
+        "total_images": sum(result["images"] for result in results),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    profiling.disable()
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
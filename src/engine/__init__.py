@@ -0,0 +1 @@
+# Qt-free extraction engine
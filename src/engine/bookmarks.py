@@ -0,0 +1,25 @@
+import fitz
+from .cancellation import check_cancelled
+
+
+def export_bookmarks_text(pdf_path, output_path, progress=None, cancel=None):
+    """Write the outline of a PDF as an indented text list
+
+    Returns:
+        int: Number of bookmarks written
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        toc = doc.get_toc()
+    finally:
+        doc.close()
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        for i, (level, title, page) in enumerate(toc, 1):
+            check_cancelled(cancel)
+            indent = "  " * (level - 1)
+            f.write(f"{indent}- {title} (Page {page})\n")
+            if progress:
+                progress(i, len(toc))
+
+    return len(toc)
@@ -0,0 +1,66 @@
+import threading
+import time
+
+
+class CancelledError(Exception):
+    """Raised inside the engine when a job is cancelled"""
+
+
+class DeadlineExceededError(CancelledError):
+    """Raised when a job runs past its deadline"""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared between a job and its owner
+
+    By default the flag is a threading.Event. Pass a multiprocessing (or
+    Manager) event to cancel work running in another process. With a
+    timeout (in seconds) the token also cancels itself once that much time
+    has passed.
+    """
+
+    def __init__(self, event=None, timeout=None):
+        self._event = event or threading.Event()
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def expired(self):
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    @property
+    def cancelled(self):
+        return self._event.is_set() or self.expired
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise CancelledError("Job cancelled")
+        if self.expired:
+            raise DeadlineExceededError("Job timed out")
+
+
+def check_cancelled(cancel):
+    """Raise CancelledError if the (optional) token was cancelled"""
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+
+
+class CancellableWriter:
+    """Wrap a binary file so every write checks a cancellation token
+
+    Long saves (e.g. a presentation written by python-pptx) go through
+    many writes, so wrapping the target file makes them stoppable.
+    """
+
+    def __init__(self, fileobj, cancel):
+        self._file = fileobj
+        self._cancel = cancel
+
+    def write(self, data):
+        check_cancelled(self._cancel)
+        return self._file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
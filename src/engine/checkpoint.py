@@ -0,0 +1,163 @@
+import json
+import os
+import shutil
+from ..util.hashing import file_sha256
+
+
+CHECKPOINT_NAME = ".extract_checkpoint.jsonl"
+STAGING_NAME = ".extract_staging"
+
+
+def checkpoint_key(pdf_path, kind, options=None):
+    """Identify a run: the same PDF (by path, size and mtime) and settings"""
+    stat = os.stat(pdf_path)
+    return {
+        "pdf": os.path.abspath(pdf_path),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "kind": kind,
+        "options": options or {},
+    }
+
+
+class Checkpoint:
+    """Append-only manifest of the pages an extraction has completed
+
+    Every completed page is appended to <output_dir>/.extract_checkpoint.jsonl
+    with the files it produced and their SHA-256, and flushed to disk. When
+    a run with the same key starts again, the pages whose files still
+    verify are skipped; the first page with a missing or changed file, and
+    everything after it, is extracted again. Work that is only assembled at
+    the end (e.g. a presentation) keeps its per-page images in a staging
+    directory next to the manifest. complete() removes both.
+    """
+
+    def __init__(self, output_dir, key):
+        self.output_dir = output_dir
+        self.key = key
+        self.path = os.path.join(output_dir, CHECKPOINT_NAME)
+        self.staging_dir = os.path.join(output_dir, STAGING_NAME)
+        self.pages = {}
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._load()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    # Resuming
+
+    def next_page(self, start_page=1):
+        """First page from start_page on that still needs extracting"""
+        page = start_page
+        while page in self.pages:
+            page += 1
+        return page
+
+    def get(self, page, name, default=None):
+        """Value saved with a completed page's record"""
+        return self.pages.get(page, {}).get(name, default)
+
+    def staged_files(self, start_page, end_page):
+        """Yield (page, absolute_path, entry) for the files of completed pages"""
+        for page in range(start_page, end_page + 1):
+            for entry in self.get(page, "files", []):
+                yield page, os.path.join(self.output_dir, entry["name"]), entry
+
+    # Recording
+
+    def stage_path(self, name):
+        """Path inside the staging directory for an intermediate file"""
+        os.makedirs(self.staging_dir, exist_ok=True)
+        return os.path.join(self.staging_dir, name)
+
+    def record_page(self, page, files, **values):
+        """Append a completed page with the files it produced
+
+        files are paths inside the output directory; extra keyword values
+        (e.g. a running image count) are stored with the record. A file
+        entry may be a (path, info) tuple to store extra data per file.
+        """
+        entries = []
+        for item in files:
+            path, info = item if isinstance(item, tuple) else (item, {})
+            entries.append(
+                dict(
+                    info,
+                    name=os.path.relpath(path, self.output_dir),
+                    size=os.path.getsize(path),
+                    sha256=file_sha256(path),
+                )
+            )
+
+        record = dict(values, type="page", page=page, files=entries)
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.pages[page] = record
+
+    def complete(self):
+        """The run finished: remove the manifest and staged files"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    # Loading
+
+    def _load(self):
+        records = self._read_records()
+        if not records or records[0].get("key") != self.key:
+            # No checkpoint, or one from another file or other settings
+            self._rewrite([])
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            return
+
+        valid = []
+        for record in records[1:]:
+            if record.get("type") != "page" or not self._verify(record):
+                break
+            valid.append(record)
+            self.pages[record["page"]] = record
+
+        if len(valid) != len(records) - 1:
+            self._rewrite(valid)
+
+    def _read_records(self):
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # A line cut short by a crash ends the usable manifest
+                    break
+        return records
+
+    def _verify(self, record):
+        for entry in record.get("files", []):
+            path = os.path.join(self.output_dir, entry["name"])
+            try:
+                if os.path.getsize(path) != entry["size"] or file_sha256(path) != entry["sha256"]:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def _rewrite(self, records):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "header", "key": self.key}, ensure_ascii=False) + "\n")
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(temp_path, self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
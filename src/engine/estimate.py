@@ -0,0 +1,212 @@
+"""Dry-run estimates of an extraction's output count, size and duration.
+
+estimate() reads only the image list of each page (get_images(full=True))
+and the stored length of each image stream; nothing is decoded, so a
+thousand-page book is estimated in well under a second. The image count
+is exact for the size filter but an upper bound with near-duplicate
+removal or merged annotation overlays.
+
+Output size and time are the input bytes times the rates of the output
+format: output bytes per input byte and seconds per input megabyte.
+Calibration learns the rates from the "run" telemetry events of recent
+extractions; until a format has been run, DEFAULT_RATES are used.
+"""
+
+import contextlib
+import json
+import os
+import threading
+from collections import namedtuple
+import fitz
+from ..util.paths import get_cache_dir
+
+
+CALIBRATION_NAME = "throughput.json"
+MAX_SAMPLES = 20
+
+# (output bytes per input byte, seconds per input MB), measured on the
+# benchmark corpus
+DEFAULT_RATES = {
+    "JPEG": (1.5, 0.2),
+    "PNG": (7.5, 4.0),
+    "AUTO": (1.2, 1.0),
+    "PPTX": (1.5, 0.5),
+}
+
+# Runs that save images through save_image and count their bytes
+CALIBRATED_RUNS = ("extract_images", "extract_merged_images", "export_all_images")
+
+Estimate = namedtuple(
+    "Estimate", "start_page end_page images input_bytes output_bytes seconds"
+)
+
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """Hold an exclusive lock on path (created if missing) across processes"""
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class Calibration:
+    """Recent throughput per output format, kept in the cache directory
+
+    Register it as a telemetry sink (telemetry.add_sink) to learn from
+    every extraction run. Several processes (the GUI, CLI runs) can record
+    runs at once: each add() merges its sample into the file under a lock.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(get_cache_dir(), CALIBRATION_NAME)
+        self._lock = threading.Lock()
+        self.samples = self._read()
+
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def add(self, image_format, bytes_in, bytes_out, seconds):
+        """Record a run; only the last MAX_SAMPLES runs per format are kept"""
+        with self._lock, _file_lock(f"{self.path}.lock"):
+            # Start from the file: other processes may have added runs
+            samples = self._read()
+            runs = samples.setdefault(image_format, [])
+            runs.append([bytes_in, bytes_out, seconds])
+            del runs[:-MAX_SAMPLES]
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(samples, f)
+            os.replace(temp_path, self.path)
+            self.samples = samples
+
+    def rates(self, image_format):
+        """Return (output bytes per input byte, seconds per input MB)"""
+        samples = self.samples.get(image_format)
+        if not samples:
+            return DEFAULT_RATES.get(image_format, DEFAULT_RATES["JPEG"])
+        bytes_in = sum(sample[0] for sample in samples)
+        bytes_out = sum(sample[1] for sample in samples)
+        seconds = sum(sample[2] for sample in samples)
+        return bytes_out / bytes_in, seconds / (bytes_in / 1_000_000)
+
+    def emit(self, record):
+        if (
+            record["event"] == "run"
+            and record["run"] in CALIBRATED_RUNS
+            and record["ok"]
+            and record.get("bytes_in")
+        ):
+            self.add(
+                record.get("format", "JPEG"),
+                record["bytes_in"],
+                record["bytes_out"],
+                record["seconds"],
+            )
+
+
+def _stream_length(doc, xref):
+    """Stored (still encoded) length of a stream, without reading it"""
+    kind, value = doc.xref_get_key(xref, "Length")
+    if kind == "int":
+        return int(value)
+    # An indirect or missing /Length: read the raw stream
+    return len(doc.xref_stream_raw(xref) or b"")
+
+
+def split_pages(start_page, end_page, pages_per_range):
+    """Split a page range into (start, end) ranges of pages_per_range pages"""
+    return [
+        (start, min(start + pages_per_range - 1, end_page))
+        for start in range(start_page, end_page + 1, pages_per_range)
+    ]
+
+
+def estimate(
+    pdf_path,
+    page_ranges=None,
+    image_format="JPEG",
+    skip_small=True,
+    min_size=100,
+    calibration=None,
+    sidecar=None,
+):
+    """Estimate the output of extracting each (start, end) page range
+
+    Ranges are 1-based and inclusive; the default is the whole document.
+    Returns a list of Estimate, one per range, with the estimated number
+    of images, the bytes of their streams in the PDF, the output bytes
+    and the seconds. With the document's util.sidecar.ImageSidecar, the
+    PDF is not opened at all.
+    """
+    output_ratio, seconds_per_mb = (calibration or Calibration()).rates(image_format)
+    lengths = {}
+    estimates = []
+
+    def make(start_page, end_page, images, input_bytes):
+        return Estimate(
+            start_page,
+            end_page,
+            images,
+            input_bytes,
+            round(input_bytes * output_ratio),
+            input_bytes / 1_000_000 * seconds_per_mb,
+        )
+
+    if sidecar is not None:
+        minimum = min_size if skip_small else 0
+        for start_page, end_page in page_ranges or [(1, sidecar.page_count)]:
+            end_page = min(end_page or sidecar.page_count, sidecar.page_count)
+            records = sidecar.query(start_page, end_page, minimum, minimum)
+            estimates.append(
+                make(start_page, end_page, len(records), sum(item.length for item in records))
+            )
+        return estimates
+
+    with fitz.open(pdf_path) as doc:
+        for start_page, end_page in page_ranges or [(1, doc.page_count)]:
+            end_page = min(end_page or doc.page_count, doc.page_count)
+            images = 0
+            input_bytes = 0
+            for page_num in range(start_page - 1, end_page):
+                for xref, _, width, height, *_ in doc[page_num].get_images(full=True):
+                    if skip_small and (width < min_size or height < min_size):
+                        continue
+                    if xref not in lengths:
+                        lengths[xref] = _stream_length(doc, xref)
+                    images += 1
+                    input_bytes += lengths[xref]
+
+            estimates.append(make(start_page, end_page, images, input_bytes))
+    return estimates
+
+
+def total(estimates):
+    """Combine the estimates of several ranges or documents"""
+    return Estimate(
+        min((item.start_page for item in estimates), default=1),
+        max((item.end_page for item in estimates), default=0),
+        sum(item.images for item in estimates),
+        sum(item.input_bytes for item in estimates),
+        sum(item.output_bytes for item in estimates),
+        sum(item.seconds for item in estimates),
+    )
@@ -0,0 +1,492 @@
+import os
+import fitz
+from ..util.image_handler import (
+    save_image,
+    extract_to_ppt,
+    process_page_images,
+    save_processed_to_ppt,
+)
+from ..util import telemetry
+from ..util.phash import DuplicateFilter
+from ..util.spill_store import SpillStore
+from .cancellation import CancelledError, check_cancelled
+from .checkpoint import Checkpoint, checkpoint_key
+from .incremental import PageManifest, page_fingerprints
+
+
+def iter_page_images(
+    doc, start_page=1, end_page=None, include_non_annotated=True, progress=None, cancel=None
+):
+    """Yield (page_number, [(image_bytes, caption)]) with overlays merged
+
+    Args:
+        doc: Open fitz document
+        start_page (int): First page (1-based)
+        end_page (int): Last page (inclusive), defaults to the last page
+        include_non_annotated (bool): Also keep images without an overlay
+        progress: Called with (current, total) after each page
+        cancel: Optional CancellationToken checked before each image and
+            while annotation overlays are transformed
+    """
+    end_page = min(end_page or doc.page_count, doc.page_count)
+    total = end_page - start_page + 1
+
+    for page_num in range(start_page - 1, end_page):
+        check_cancelled(cancel)
+        with telemetry.stage("page"):
+            page_images = process_page_images(
+                doc[page_num], doc, include_non_annotated, cancel
+            )
+        telemetry.count(pages=1)
+        yield page_num + 1, page_images
+
+        if progress:
+            progress(page_num - start_page + 2, total)
+
+
+@telemetry.traced("collect_preview_images")
+def collect_preview_images(
+    pdf_path, start_page=1, end_page=None, options=None, progress=None, cancel=None
+):
+    """Return the merged image bytes of a page range for previewing
+
+    The images are returned in a SpillStore bounded by
+    options["memory_budget_mb"]; the caller closes it.
+    """
+    options = options or {}
+    doc = fitz.open(pdf_path)
+    try:
+        images = SpillStore(options.get("memory_budget_mb"))
+        for _, page_images in iter_page_images(
+            doc,
+            start_page,
+            end_page,
+            options.get("include_non_annotated", True),
+            progress,
+            cancel,
+        ):
+            images.extend(image_bytes for image_bytes, _ in page_images)
+        telemetry.count(images=len(images))
+        return images
+    finally:
+        doc.close()
+
+
+def _stage_page(checkpoint, page_number, page_images, **values):
+    """Write a page's merged images to the staging directory and record it"""
+    files = []
+    for index, (image_bytes, caption) in enumerate(page_images, 1):
+        path = checkpoint.stage_path(f"page_{page_number}_{index}.img")
+        with open(path, "wb") as f:
+            f.write(image_bytes)
+        files.append((path, {"caption": caption}))
+    checkpoint.record_page(page_number, files, **values)
+
+
+def _duplicate_filter(max_distance, checkpoint=None, start_page=1, first_page=1):
+    """DuplicateFilter knowing the images kept on already checkpointed pages"""
+    if max_distance is None:
+        return None
+    duplicates = DuplicateFilter(max_distance)
+    if checkpoint:
+        for page in range(start_page, first_page):
+            for index, value in enumerate(checkpoint.get(page, "hashes", []), 1):
+                duplicates.add(value, (page, index))
+    return duplicates
+
+
+def _drop_duplicates(duplicates, page_number, page_images):
+    """Return a page's (image_bytes, caption) tuples without near-duplicates,
+    and the hashes of the ones kept"""
+    if duplicates is None:
+        return page_images, []
+    kept, hashes = [], []
+    for index, image in enumerate(page_images, 1):
+        representative, value = duplicates.check(image[0], (page_number, index))
+        if representative is None:
+            kept.append(image)
+            hashes.append(value)
+    return kept, hashes
+
+
+def _read_staged(checkpoint, start_page, end_page, store):
+    """Add the staged images of a page range to store and return their captions"""
+    captions = []
+    for _, path, entry in checkpoint.staged_files(start_page, end_page):
+        store.add_file(path)
+        captions.append(entry.get("caption"))
+    return captions
+
+
+@telemetry.traced("export_presentation")
+def export_presentation(
+    pdf_path,
+    output_dir,
+    start_page=1,
+    end_page=None,
+    options=None,
+    progress=None,
+    cancel=None,
+    resume=False,
+):
+    """Merge overlays of a page range into a PowerPoint file
+
+    With resume, completed pages are checkpointed in output_dir (see
+    engine.checkpoint) so an interrupted run continues where it stopped.
+    Merged images past options["memory_budget_mb"] are spilled to disk.
+    With options["dedupe_distance"], only one image of each group of
+    near-duplicates (see util.phash) gets a slide.
+
+    Returns:
+        tuple: (image_count, output_path); output_path is None when the
+        page range has no images
+    """
+    options = options or {}
+    include_non_annotated = options.get("include_non_annotated", True)
+    with SpillStore(options.get("memory_budget_mb")) as images:
+        return _export_presentation(
+            pdf_path,
+            output_dir,
+            start_page,
+            end_page,
+            include_non_annotated,
+            options.get("dedupe_distance"),
+            images,
+            progress,
+            cancel,
+            resume,
+        )
+
+
+def _export_presentation(
+    pdf_path,
+    output_dir,
+    start_page,
+    end_page,
+    include_non_annotated,
+    dedupe_distance,
+    images,
+    progress,
+    cancel,
+    resume,
+):
+    doc = fitz.open(pdf_path)
+    checkpoint = None
+    captions = []
+    try:
+        end_page = min(end_page or doc.page_count, doc.page_count)
+        first_page = start_page
+        if resume:
+            checkpoint = Checkpoint(
+                output_dir,
+                checkpoint_key(
+                    pdf_path,
+                    "presentation",
+                    {
+                        "start_page": start_page,
+                        "end_page": end_page,
+                        "include_non_annotated": include_non_annotated,
+                        "dedupe_distance": dedupe_distance,
+                    },
+                ),
+            )
+            first_page = checkpoint.next_page(start_page)
+            telemetry.event(
+                "cache", name="checkpoint", hit_pages=first_page - start_page
+            )
+        duplicates = _duplicate_filter(dedupe_distance, checkpoint, start_page, first_page)
+
+        total = end_page - start_page + 1
+        skipped = first_page - start_page
+
+        def page_progress(current, _):
+            progress(skipped + current, total)
+
+        for page_number, page_images in iter_page_images(
+            doc,
+            first_page,
+            end_page,
+            include_non_annotated,
+            page_progress if progress else None,
+            cancel,
+        ):
+            page_images, hashes = _drop_duplicates(duplicates, page_number, page_images)
+            if checkpoint:
+                _stage_page(checkpoint, page_number, page_images, hashes=hashes)
+            else:
+                for image_bytes, caption in page_images:
+                    images.append(image_bytes)
+                    captions.append(caption)
+
+        if checkpoint:
+            captions = _read_staged(checkpoint, start_page, end_page, images)
+    finally:
+        doc.close()
+        if checkpoint:
+            checkpoint.close()
+
+    if not captions:
+        if checkpoint:
+            checkpoint.complete()
+        return 0, None
+
+    check_cancelled(cancel)
+    telemetry.count(images=len(captions))
+    output_name = os.path.splitext(os.path.basename(pdf_path))[0]
+    output_path = os.path.join(output_dir, f"{output_name}.pptx")
+    if not save_processed_to_ppt(zip(images, captions), output_path, cancel):
+        raise RuntimeError(f"Could not save {output_path}")
+    if checkpoint:
+        checkpoint.complete()
+    return len(captions), output_path
+
+
+@telemetry.traced("export_all_images")
+def export_all_images(
+    pdf_path,
+    output_dir,
+    should_invert=False,
+    export_to_ppt=False,
+    progress=None,
+    cancel=None,
+    sink=None,
+    resume=False,
+    memory_budget_mb=None,
+    dedupe_distance=None,
+    incremental=False,
+):
+    """Save every image of a PDF as a file, or collect them into a presentation
+
+    Progress is reported per image as (current, total). Images go to sink
+    instead of loose files when one is given. With resume (and no sink),
+    completed pages are checkpointed in output_dir so an interrupted run
+    continues from the first incomplete page. Images collected for the
+    presentation past memory_budget_mb are spilled to disk. With
+    dedupe_distance, near-duplicates of earlier images (see util.phash)
+    are left out. With incremental (image files only), pages unchanged
+    since the last run into output_dir keep their files (renumbered when
+    needed) instead of being extracted again (see engine.incremental).
+
+    Returns:
+        int: Number of images processed
+    """
+    with SpillStore(memory_budget_mb) as images:
+        return _export_all_images(
+            pdf_path,
+            output_dir,
+            should_invert,
+            export_to_ppt,
+            dedupe_distance,
+            images,
+            progress,
+            cancel,
+            sink,
+            resume,
+            incremental,
+        )
+
+
+def _export_all_images(
+    pdf_path,
+    output_dir,
+    should_invert,
+    export_to_ppt,
+    dedupe_distance,
+    images,
+    progress,
+    cancel,
+    sink,
+    resume,
+    incremental,
+):
+    doc = fitz.open(pdf_path)
+    checkpoint = None
+    manifest = None
+    try:
+        image_count = 0
+        first_page = 1
+
+        if resume and sink is None:
+            checkpoint = Checkpoint(
+                output_dir,
+                checkpoint_key(
+                    pdf_path,
+                    "images",
+                    {
+                        "should_invert": should_invert,
+                        "export_to_ppt": export_to_ppt,
+                        "dedupe_distance": dedupe_distance,
+                    },
+                ),
+            )
+            first_page = checkpoint.next_page(1)
+            image_count = checkpoint.get(first_page - 1, "images", 0)
+            telemetry.event("cache", name="checkpoint", hit_pages=first_page - 1)
+        duplicates = _duplicate_filter(dedupe_distance, checkpoint, 1, first_page)
+
+        fingerprints = {}
+        reusable = set()
+        if incremental and sink is None and not export_to_ppt:
+            manifest = PageManifest(
+                output_dir,
+                {
+                    "kind": "images",
+                    "should_invert": should_invert,
+                    "dedupe_distance": dedupe_distance,
+                },
+            )
+            fingerprints = page_fingerprints(doc)
+            # A resumed run already rewrote its first pages: only resume it
+            if first_page == 1:
+                reusable = manifest.prepare(fingerprints, doc.page_count)
+            telemetry.event("cache", name="page_manifest", hit_pages=len(reusable))
+
+        # First count total images
+        total_images = sum(len(page.get_images()) for page in doc)
+        # page -> files of the pages with an image that failed
+        failed_pages = {}
+        if progress and image_count:
+            progress(image_count, total_images)
+
+        for page_num in range(first_page - 1, doc.page_count):
+            page_files = []
+            hashes = []
+            page_failed = False
+
+            if page_num + 1 in reusable:
+                staged, values = manifest.reuse(fingerprints[page_num + 1])
+                hashes = values.get("hashes", [])
+                for index, value in enumerate(hashes, 1):
+                    if duplicates is not None:
+                        duplicates.add(value, (page_num + 1, index))
+                for staged_path, _ in staged:
+                    path = os.path.join(output_dir, f"image_{image_count:04d}.jpg")
+                    manifest.restore(staged_path, path)
+                    page_files.append(path)
+                    image_count += 1
+                total_images -= len(doc[page_num].get_images()) - len(staged)
+                if progress:
+                    progress(image_count, total_images)
+
+                if checkpoint:
+                    checkpoint.record_page(
+                        page_num + 1, page_files, images=image_count, hashes=hashes
+                    )
+                manifest.record(
+                    page_num + 1,
+                    fingerprints[page_num + 1],
+                    [(path, entry) for path, (_, entry) in zip(page_files, staged)],
+                    hashes=hashes,
+                )
+                continue
+
+            telemetry.count(pages=1)
+            for img in doc[page_num].get_images():
+                check_cancelled(cancel)
+
+                try:
+                    with telemetry.stage("extract_image"):
+                        base_image = doc.extract_image(img[0])
+                    image_bytes = base_image["image"]
+                    if duplicates is not None:
+                        representative, value = duplicates.check(
+                            image_bytes, (page_num + 1, len(hashes) + 1)
+                        )
+                        if representative is not None:
+                            total_images -= 1
+                            continue
+                        hashes.append(value)
+                    image_filename = f"image_{image_count:04d}.jpg"
+
+                    if export_to_ppt:
+                        if checkpoint:
+                            path = checkpoint.stage_path(image_filename)
+                            with open(path, "wb") as f:
+                                f.write(image_bytes)
+                            page_files.append(path)
+                        else:
+                            images.append(image_bytes)
+                    else:
+                        # Save as individual files
+                        saved_name = save_image(
+                            image_bytes,
+                            output_dir,
+                            image_filename,
+                            should_invert,
+                            sink=sink,
+                            cancel=cancel,
+                        )
+                        if not saved_name:
+                            # Not written: the page is extracted again next time
+                            page_failed = True
+                            total_images -= 1
+                            continue
+                        if checkpoint or manifest:
+                            page_files.append(os.path.join(output_dir, saved_name))
+
+                    image_count += 1
+                    if progress:
+                        progress(image_count, total_images)
+
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    telemetry.event(
+                        "error", stage="extract_image", page=page_num + 1, error=str(e)
+                    )
+                    page_failed = True
+                    continue
+
+            if page_failed:
+                # Not recorded, so a resumed run starts again from this page;
+                # its staged images still go into this run's presentation
+                failed_pages[page_num + 1] = page_files
+            elif checkpoint:
+                checkpoint.record_page(
+                    page_num + 1, page_files, images=image_count, hashes=hashes
+                )
+            if manifest and not page_failed:
+                manifest.record(
+                    page_num + 1, fingerprints[page_num + 1], page_files, hashes=hashes
+                )
+
+        if checkpoint and export_to_ppt:
+            for page in range(1, doc.page_count + 1):
+                if page in failed_pages:
+                    for path in failed_pages[page]:
+                        images.add_file(path)
+                else:
+                    _read_staged(checkpoint, page, page, images)
+        if manifest:
+            # Pages done before an interruption are known from the checkpoint
+            for page in range(1, first_page):
+                manifest.record(
+                    page,
+                    fingerprints[page],
+                    [(path, entry) for _, path, entry in checkpoint.staged_files(page, page)],
+                    hashes=checkpoint.get(page, "hashes", []),
+                )
+            manifest.save()
+    finally:
+        doc.close()
+        if checkpoint:
+            checkpoint.close()
+        if manifest:
+            manifest.close()
+
+    if export_to_ppt and images:
+        check_cancelled(cancel)
+        telemetry.count(images=len(images))
+        output_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        extract_to_ppt(
+            images,
+            output_dir,
+            output_name,
+            should_invert,
+            open_when_done=False,
+            cancel=cancel,
+        )
+
+    if checkpoint:
+        checkpoint.complete()
+    return image_count
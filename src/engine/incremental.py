@@ -0,0 +1,208 @@
+"""Re-extract only the pages of a revised PDF that changed.
+
+A page's fingerprint is the SHA-256 of its content streams and of the
+images it uses (their raw streams, soft masks and properties), so it
+changes when the page is edited or one of its images is replaced, but not
+when other pages are inserted, removed or reordered. Object numbers are
+left out because a revised PDF often renumbers its objects.
+
+PageManifest keeps the fingerprint of every page of the last complete run
+in <output_dir>/.extract_manifest.json, with the files the page produced
+and their SHA-256. The next run with the same settings sets aside the
+files of every page whose fingerprint still occurs in the document,
+extracts only the other pages, and moves the set-aside files to the names
+the new run gives them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from ..util.hashing import file_sha256
+from ..util.image_catalog import link_file
+
+
+MANIFEST_NAME = ".extract_manifest.json"
+STAGING_NAME = ".extract_reuse"
+
+
+def page_fingerprints(doc, start_page=1, end_page=None):
+    """Return {page_number: fingerprint} for a page range of an open document"""
+    end_page = min(end_page or doc.page_count, doc.page_count)
+    # Images shared by several pages are hashed once
+    image_digests = {}
+    fingerprints = {}
+
+    for page_num in range(start_page - 1, end_page):
+        page = doc[page_num]
+        digest = hashlib.sha256(page.read_contents())
+        for xref, smask, *info in page.get_images(full=True):
+            if xref not in image_digests:
+                image_digest = hashlib.sha256()
+                for stream_xref in (xref, smask):
+                    if stream_xref:
+                        stream = doc.xref_stream_raw(stream_xref) or b""
+                        image_digest.update(b"%d:" % len(stream) + stream)
+                image_digests[xref] = image_digest.hexdigest()
+            # Width, height, bpc, colour spaces, name and filter; not the referencer
+            digest.update(repr(info[:-1]).encode() + image_digests[xref].encode())
+        fingerprints[page_num + 1] = digest.hexdigest()
+    return fingerprints
+
+
+class PageManifest:
+    """Fingerprints and output files of the pages of the last run
+
+    Usage: prepare() with the fingerprints of the pages the run covers,
+    then for each page either reuse() it or extract it, record() every
+    page and save() once the run completes. Without save() (the run failed
+    or was cancelled) close() puts the set-aside files back.
+    """
+
+    def __init__(self, output_dir, options=None):
+        self.output_dir = output_dir
+        self.options = options or {}
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.staging_dir = os.path.join(output_dir, STAGING_NAME)
+        self.previous = {}
+        self.pages = {}
+        # fingerprint -> (previous record, [(staged path, original path)])
+        self._staged = {}
+        # Files of earlier pages that are no longer produced
+        self._stale = []
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("options") != self.options:
+            # Other settings produce other files
+            return
+        self.previous = {int(page): record for page, record in data["pages"].items()}
+
+    def _verify(self, record):
+        for entry in record["files"]:
+            path = os.path.join(self.output_dir, entry["name"])
+            try:
+                if os.path.getsize(path) != entry["size"] or file_sha256(path) != entry["sha256"]:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def prepare(self, fingerprints, page_count):
+        """Set aside the reusable files of the pages about to be extracted
+
+        fingerprints maps the pages the run covers to their fingerprints.
+        Files of earlier pages in that range (or past the end of the
+        document) that cannot be reused are deleted by save(); pages
+        outside it keep their records. Returns the set of pages that can
+        be reused.
+        """
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        wanted = set(fingerprints.values())
+
+        for page, record in sorted(self.previous.items()):
+            if page not in fingerprints and page <= page_count:
+                self.pages[page] = record
+                continue
+            if not self._verify(record):
+                # Overwritten or deleted since: not ours to touch
+                continue
+            paths = [os.path.join(self.output_dir, entry["name"]) for entry in record["files"]]
+            if record["fingerprint"] not in wanted or record["fingerprint"] in self._staged:
+                self._stale.extend(paths)
+                continue
+
+            os.makedirs(self.staging_dir, exist_ok=True)
+            staged = []
+            for index, path in enumerate(paths):
+                staged_path = os.path.join(self.staging_dir, f"{page}_{index}")
+                os.replace(path, staged_path)
+                staged.append((staged_path, path))
+            self._staged[record["fingerprint"]] = (record, staged)
+
+        return {page for page, value in fingerprints.items() if value in self._staged}
+
+    def reuse(self, fingerprint):
+        """Return [(staged path, file entry)] and the extra values of the
+        earlier page with this fingerprint, or None
+
+        Link each staged path to its new name with restore().
+        """
+        if fingerprint not in self._staged:
+            return None
+        record, staged = self._staged[fingerprint]
+        values = {
+            name: value
+            for name, value in record.items()
+            if name not in ("fingerprint", "files")
+        }
+        return [(path, entry) for (path, _), entry in zip(staged, record["files"])], values
+
+    @staticmethod
+    def restore(staged_path, path):
+        # A hard link, so a page repeated in the document can reuse it again
+        link_file(staged_path, path)
+
+    def record(self, page, fingerprint, files, **values):
+        """Record a page of this run with its files
+
+        files are paths, or (path, info) tuples to store extra data per
+        file; an info with a sha256 (e.g. an entry from reuse()) is not
+        hashed again.
+        """
+        entries = []
+        for item in files:
+            path, info = item if isinstance(item, tuple) else (item, {})
+            entries.append(
+                dict(
+                    info,
+                    name=os.path.relpath(path, self.output_dir),
+                    size=os.path.getsize(path),
+                    sha256=info["sha256"] if "sha256" in info else file_sha256(path),
+                )
+            )
+        self.pages[page] = dict(values, fingerprint=fingerprint, files=entries)
+
+    def save(self):
+        """The run completed: write the manifest and drop the files of the
+        earlier run that were neither reused nor written again"""
+        current = {
+            os.path.join(self.output_dir, entry["name"])
+            for record in self.pages.values()
+            for entry in record["files"]
+        }
+        for path in self._stale:
+            if path not in current and os.path.exists(path):
+                os.remove(path)
+        self._stale = []
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"options": self.options, "pages": self.pages}, f, ensure_ascii=False
+            )
+        os.replace(temp_path, self.path)
+        self._staged = {}
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def close(self):
+        """Put set-aside files that the run did not replace back in place"""
+        for _, staged in self._staged.values():
+            for staged_path, path in staged:
+                if not os.path.exists(path):
+                    os.replace(staged_path, path)
+        self._staged = {}
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
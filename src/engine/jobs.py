@@ -0,0 +1,428 @@
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from .cancellation import CancellationToken, CancelledError, DeadlineExceededError
+from .images import export_all_images, export_presentation
+from ..util import profiling, telemetry
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Rough peak memory of a job relative to the size of its PDF
+MEMORY_PER_PDF_BYTE = 4
+MEMORY_BASE_BYTES = 64 * 1024 * 1024
+
+
+def _run_images(job, progress, cancel):
+    """ExtractionWorker semantics: save every image, or one presentation"""
+    count = export_all_images(
+        job.pdf_path,
+        job.output_dir,
+        job.options.get("should_invert", False),
+        job.options.get("export_to_ppt", False),
+        progress,
+        cancel,
+        resume=True,
+        memory_budget_mb=job.options.get("memory_budget_mb"),
+        dedupe_distance=job.options.get("dedupe_distance"),
+        incremental=job.options.get("incremental", False),
+    )
+    return count, f"{count} images"
+
+
+def _run_presentation(job, progress, cancel):
+    """ImageExtractionThread semantics: merge overlays into a presentation"""
+    count, output_path = export_presentation(
+        job.pdf_path,
+        job.output_dir,
+        job.options.get("start_page", 1),
+        job.options.get("end_page"),
+        job.options,
+        progress,
+        cancel,
+        resume=True,
+    )
+    return count, output_path or "No images found"
+
+
+RUNNERS = {"images": _run_images, "presentation": _run_presentation}
+
+
+class _RunRecorder:
+    """Telemetry sink keeping the "run" events of a job's process"""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        if record["event"] == "run":
+            self.records.append(record)
+
+
+def _run_job(kind, job_data, cancel_event, progress_queue, record_runs):
+    """Run a job (in a pool process, or a thread)
+
+    Progress goes to progress_queue as (job_id, current, total). Returns
+    the result message, the last progress and, with record_runs, the
+    job's "run" telemetry events.
+    """
+    job = Job.from_dict(job_data)
+    # An optional per-job timeout (seconds) starts when the job does
+    cancel = CancellationToken(cancel_event, timeout=job.options.get("timeout"))
+    last_progress = [(0, 0)]
+
+    def progress(current, total):
+        last_progress[0] = (current, total)
+        progress_queue.put((job.id, current, total))
+
+    recorder = _RunRecorder()
+    if record_runs:
+        telemetry.add_sink(recorder)
+    try:
+        os.makedirs(job.output_dir, exist_ok=True)
+        _, message = RUNNERS[kind](job, progress, cancel)
+    finally:
+        telemetry.remove_sink(recorder)
+    return message, last_progress[0], recorder.records
+
+
+class Job:
+    def __init__(
+        self,
+        pdf_path,
+        output_dir,
+        kind="images",
+        options=None,
+        priority=0,
+        job_id=None,
+        state=QUEUED,
+        created=None,
+    ):
+        self.id = job_id or uuid.uuid4().hex
+        self.pdf_path = pdf_path
+        self.output_dir = output_dir
+        self.kind = kind
+        self.options = options or {}
+        self.priority = priority
+        self.state = state
+        self.created = created or time.time()
+        self.progress = (0, 0)
+        self.message = ""
+        self.attempts = 0
+        self.cancel_token = None
+
+    @property
+    def estimated_memory(self):
+        try:
+            size = os.path.getsize(self.pdf_path)
+        except OSError:
+            size = 0
+        return MEMORY_BASE_BYTES + size * MEMORY_PER_PDF_BYTE
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "pdf_path": self.pdf_path,
+            "output_dir": self.output_dir,
+            "kind": self.kind,
+            "options": self.options,
+            "priority": self.priority,
+            "state": self.state,
+            "created": self.created,
+            "message": self.message,
+            "attempts": self.attempts,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        job = cls(
+            data["pdf_path"],
+            data["output_dir"],
+            data.get("kind", "images"),
+            data.get("options"),
+            data.get("priority", 0),
+            data["id"],
+            data.get("state", QUEUED),
+            data.get("created"),
+        )
+        job.message = data.get("message", "")
+        job.attempts = data.get("attempts", 0)
+        return job
+
+
+class JobQueue:
+    """Persistent priority queue of extraction jobs run by a bounded pool
+
+    At most max_workers jobs run at once, each in its own worker process
+    (threads with processes=False, e.g. for tests), and a job is only
+    started when its estimated memory fits in what is left of
+    memory_budget_mb (a job is always started when nothing else is
+    running). The queue is saved to store_path on every state change; jobs
+    that were running when the app closed are queued again on the next
+    start. A calibration (engine.estimate.Calibration) learns the
+    throughput of the jobs run.
+    """
+
+    def __init__(
+        self,
+        store_path=None,
+        max_workers=2,
+        memory_budget_mb=2048,
+        calibration=None,
+        processes=True,
+    ):
+        self.store_path = store_path
+        self.max_workers = max_workers
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.jobs = []
+        self._lock = threading.RLock()
+        self.processes = processes
+        if processes:
+            # Cancellation events and progress cross the process boundary
+            # through a manager. Spawned, not forked: the GUI process has
+            # Qt and the progress thread running
+            context = multiprocessing.get_context("spawn")
+            self._manager = context.Manager()
+            self._progress = self._manager.Queue()
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=context,
+                initializer=profiling.configure_process,
+            )
+        else:
+            self._manager = None
+            self._progress = queue.Queue()
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._progress_thread = threading.Thread(target=self._read_progress, daemon=True)
+        self._progress_thread.start()
+        self._running = set()
+        self._closed = False
+        self.calibration = calibration
+        if calibration is not None and not processes:
+            telemetry.add_sink(calibration)
+        self._load()
+
+    # Queue management
+
+    def add(self, pdf_path, output_dir, kind="images", options=None, priority=0):
+        if kind not in RUNNERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+        job = Job(pdf_path, output_dir, kind, options, priority)
+        with self._lock:
+            self.jobs.append(job)
+            self._save()
+        self._schedule()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            for job in self.jobs:
+                if job.id == job_id:
+                    return job
+        raise KeyError(job_id)
+
+    def cancel(self, job_id):
+        with self._lock:
+            job = self.get(job_id)
+            if job.state == QUEUED:
+                job.state = CANCELLED
+                job.message = "Cancelled"
+            elif job.state == RUNNING:
+                job.cancel_token.cancel()
+            self._save()
+
+    def retry(self, job_id):
+        with self._lock:
+            job = self.get(job_id)
+            if job.state in (FAILED, CANCELLED):
+                job.state = QUEUED
+                job.message = ""
+                job.progress = (0, 0)
+                self._save()
+        self._schedule()
+
+    def remove(self, job_id):
+        with self._lock:
+            job = self.get(job_id)
+            if job.state == RUNNING:
+                raise ValueError("Cancel a running job before removing it")
+            self.jobs.remove(job)
+            self._save()
+
+    def set_priority(self, job_id, priority):
+        with self._lock:
+            self.get(job_id).priority = priority
+            self._save()
+        self._schedule()
+
+    def move(self, job_id, offset):
+        """Move a queued job up (negative offset) or down in the run order"""
+        with self._lock:
+            order = self.pending()
+            job = self.get(job_id)
+            if job not in order:
+                return
+            index = max(0, min(len(order) - 1, order.index(job) + offset))
+            order.remove(job)
+            order.insert(index, job)
+            # Re-number priorities so the new order sticks
+            for rank, queued_job in enumerate(order):
+                queued_job.priority = len(order) - rank
+            self._save()
+
+    def pending(self):
+        """Queued jobs in the order they will run"""
+        with self._lock:
+            queued = [job for job in self.jobs if job.state == QUEUED]
+        return sorted(queued, key=lambda job: (-job.priority, job.created))
+
+    def snapshot(self):
+        """Return a thread-safe copy of every job's display state"""
+        with self._lock:
+            return [
+                dict(job.to_dict(), progress=job.progress) for job in self.jobs
+            ]
+
+    def wait(self, timeout=None):
+        """Block until no job is queued or running (mainly for tests)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                busy = self._running or any(job.state == QUEUED for job in self.jobs)
+            if not busy:
+                return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.02)
+
+    def shutdown(self, cancel_running=True):
+        """Stop the pool; cancelled running jobs stay queued for next time"""
+        with self._lock:
+            self._closed = True
+            if cancel_running:
+                for job in self.jobs:
+                    if job.state == RUNNING:
+                        job.cancel_token.cancel()
+        self._executor.shutdown(wait=True)
+        self._progress.put(None)
+        self._progress_thread.join()
+        if self._manager is not None:
+            self._manager.shutdown()
+        if self.calibration is not None and not self.processes:
+            telemetry.remove_sink(self.calibration)
+
+    # Scheduling
+
+    def _memory_in_use(self):
+        return sum(job.estimated_memory for job in self.jobs if job.id in self._running)
+
+    def _schedule(self):
+        with self._lock:
+            if self._closed:
+                return
+            for job in self.pending():
+                if len(self._running) >= self.max_workers:
+                    break
+                fits = self._memory_in_use() + job.estimated_memory <= self.memory_budget
+                if self._running and not fits:
+                    continue
+
+                job.state = RUNNING
+                job.attempts += 1
+                job.message = ""
+                job.progress = (0, 0)
+                event = self._manager.Event() if self._manager else threading.Event()
+                job.cancel_token = CancellationToken(event)
+                self._running.add(job.id)
+                future = self._executor.submit(
+                    _run_job,
+                    job.kind,
+                    job.to_dict(),
+                    event,
+                    self._progress,
+                    self.processes,
+                )
+                future.add_done_callback(lambda future, job=job: self._finish(job, future))
+            self._save()
+            telemetry.event(
+                "queue",
+                running=len(self._running),
+                queued=sum(job.state == QUEUED for job in self.jobs),
+            )
+
+    def _read_progress(self):
+        while True:
+            item = self._progress.get()
+            if item is None:
+                return
+            job_id, current, total = item
+            with self._lock:
+                for job in self.jobs:
+                    # Updates can arrive after the job finished
+                    if job.id == job_id and job.state == RUNNING:
+                        job.progress = (current, total)
+
+    def _finish(self, job, future):
+        progress = None
+        try:
+            message, progress, runs = future.result()
+            if self.calibration is not None:
+                for record in runs:
+                    self.calibration.emit(record)
+            state = DONE
+        except DeadlineExceededError:
+            state, message = FAILED, "Timed out"
+        except CancelledError:
+            if self._closed:
+                # Interrupted by shutdown: run it again on the next start
+                state, message = QUEUED, "Interrupted"
+            else:
+                state, message = CANCELLED, "Cancelled"
+        except Exception as e:
+            state, message = FAILED, str(e)
+
+        with self._lock:
+            if progress is not None:
+                job.progress = progress
+            job.state = state
+            job.message = message
+            self._running.discard(job.id)
+            self._save()
+        self._schedule()
+
+    # Persistence
+
+    def _load(self):
+        if not self.store_path or not os.path.exists(self.store_path):
+            return
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read job queue {self.store_path}: {str(e)}")
+            return
+
+        self.jobs = [Job.from_dict(entry) for entry in data]
+        for job in self.jobs:
+            if job.state == RUNNING:
+                # Interrupted by a restart: run it again
+                job.state = QUEUED
+        self._schedule()
+
+    def _save(self):
+        if not self.store_path:
+            return
+        temp_path = f"{self.store_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump([job.to_dict() for job in self.jobs], f, indent=4, ensure_ascii=False)
+        os.replace(temp_path, self.store_path)
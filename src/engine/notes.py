@@ -0,0 +1,35 @@
+import fitz
+from ..modules.note_extractor.scanner import scan_annotations
+from .cancellation import check_cancelled
+
+
+def export_notes_text(pdf_path, output_path, progress=None, cancel=None):
+    """Write every annotation of a PDF, grouped by page, to a text file
+
+    Returns:
+        int: Number of annotations written
+    """
+
+    def report(current, total):
+        check_cancelled(cancel)
+        if progress:
+            progress(current, total)
+
+    doc = fitz.open(pdf_path)
+    try:
+        note_count = 0
+        with open(output_path, "w", encoding="utf-8") as f:
+            current_page = None
+            for record in scan_annotations(doc, progress_callback=report):
+                if record["page"] != current_page:
+                    current_page = record["page"]
+                    f.write(f"\nPage {current_page}:\n")
+
+                author = f" ({record['author']})" if record["author"] else ""
+                f.write(f"- [{record['type']}]{author} {record['content']}\n")
+                if record["text"]:
+                    f.write(f"  > {record['text']}\n")
+                note_count += 1
+        return note_count
+    finally:
+        doc.close()
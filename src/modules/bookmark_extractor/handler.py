@@ -1,23 +1,27 @@
-import fitz
 from PyQt5.QtCore import QObject, pyqtSignal
+from ...engine.cancellation import CancellationToken, CancelledError
+from ...engine.bookmarks import export_bookmarks_text
 
 
 class BookmarkExtractor(QObject):
     progress = pyqtSignal(int, int)  # current, total
     finished = pyqtSignal(bool, str)  # success, message
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cancel_token = CancellationToken()
+
     def extract_bookmarks(self, pdf_path, output_path):
         try:
-            doc = fitz.open(pdf_path)
-            toc = doc.get_toc()
-
-            with open(output_path, "w", encoding="utf-8") as f:
-                for level, title, page in toc:
-                    indent = "  " * (level - 1)
-                    f.write(f"{indent}- {title} (Page {page})\n")
-
-            doc.close()
+            export_bookmarks_text(
+                pdf_path, output_path, self.progress.emit, self.cancel_token
+            )
             self.finished.emit(True, "Bookmarks extracted successfully")
 
+        except CancelledError:
+            self.finished.emit(False, "Bookmark extraction cancelled")
         except Exception as e:
             self.finished.emit(False, f"Error extracting bookmarks: {str(e)}")
+
+    def stop(self):
+        self.cancel_token.cancel()
@@ -0,0 +1,302 @@
+import os
+import shutil
+from pathlib import Path
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QPushButton,
+    QLabel,
+    QProgressBar,
+    QFileDialog,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+    QComboBox,
+    QCheckBox,
+    QMessageBox,
+)
+from ..base_module import PDFModule
+from ...util.paths import get_cache_dir, output_dir_key, unique_output_dir
+from ...util.settings import Settings
+
+
+STATE_LABELS = {
+    "queued": "Queued",
+    "running": "Running",
+    "done": "Done",
+    "failed": "Failed",
+    "cancelled": "Cancelled",
+}
+
+KIND_LABELS = {"images": "Images", "presentation": "PowerPoint"}
+
+# Output format whose throughput a job kind is estimated with
+KIND_FORMATS = {"images": "JPEG", "presentation": "PPTX"}
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def format_duration(seconds):
+    if seconds < 60:
+        return f"{seconds:.0f} s"
+    return f"{seconds / 60:.0f} min"
+
+
+class JobQueueWidget(QWidget):
+    """Panel listing queued extraction jobs with their progress
+
+    The widget only renders snapshots of the engine's JobQueue, polled on a
+    timer, so worker threads never touch Qt objects.
+    """
+
+    COLUMNS = ["File", "Output", "Priority", "Status", "Progress"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        from ...engine.estimate import Calibration
+        from ...engine.jobs import JobQueue
+
+        self.settings = Settings()
+        self.queue = JobQueue(
+            os.path.join(get_cache_dir(), "job_queue.json"),
+            max_workers=self.settings.get_max_jobs(),
+            memory_budget_mb=self.settings.get_memory_budget_mb(),
+            calibration=Calibration(),
+        )
+        self.estimate_worker = None
+        self.init_ui()
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(250)
+        self.refresh()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # Create UI components
+        top_layout = QHBoxLayout()
+        self.add_button = QPushButton("Add PDFs")
+        self.add_button.setObjectName("primaryButton")
+        self.kind_combo = QComboBox()
+        for kind, label in KIND_LABELS.items():
+            self.kind_combo.addItem(label, kind)
+        self.incremental_checkbox = QCheckBox("Only changed pages")
+        self.incremental_checkbox.setToolTip(
+            "Keep the images of pages unchanged since the last extraction into the same folder"
+        )
+        top_layout.addWidget(self.add_button)
+        top_layout.addWidget(self.kind_combo)
+        top_layout.addWidget(self.incremental_checkbox)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+        button_layout = QHBoxLayout()
+        self.up_button = QPushButton("Move Up")
+        self.down_button = QPushButton("Move Down")
+        self.cancel_button = QPushButton("Cancel")
+        self.retry_button = QPushButton("Retry")
+        self.remove_button = QPushButton("Remove")
+        for button in (
+            self.up_button,
+            self.down_button,
+            self.cancel_button,
+            self.retry_button,
+            self.remove_button,
+        ):
+            button.setObjectName("actionButton")
+            button_layout.addWidget(button)
+
+        self.status_label = QLabel()
+        self.status_label.setProperty("class", "statusLabel")
+
+        # Add components to layout
+        layout.addLayout(top_layout)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+        layout.addWidget(self.status_label)
+        self.setLayout(layout)
+
+        # Connect signals
+        self.add_button.clicked.connect(self.add_pdfs)
+        self.kind_combo.currentIndexChanged.connect(self.update_incremental_checkbox)
+        self.up_button.clicked.connect(lambda: self.move_selected(-1))
+        self.down_button.clicked.connect(lambda: self.move_selected(1))
+        self.cancel_button.clicked.connect(lambda: self.apply_to_selected(self.queue.cancel))
+        self.retry_button.clicked.connect(lambda: self.apply_to_selected(self.queue.retry))
+        self.remove_button.clicked.connect(lambda: self.apply_to_selected(self.queue.remove))
+
+    def add_pdfs(self):
+        from ...ui.workers import EstimateWorker
+
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select PDFs", self.settings.get_last_directory(), "PDF files (*.pdf)"
+        )
+        if not file_paths:
+            return
+
+        self.settings.save_last_pdf_path(file_paths[-1])
+        kind = self.kind_combo.currentData()
+        options = {}
+        if kind == "images" and self.incremental_checkbox.isChecked():
+            options["incremental"] = True
+
+        # Estimating reads every page's image list: keep it off the UI thread
+        self.add_button.setEnabled(False)
+        self.status_label.setText("Estimating output...")
+        # Jobs save every image, small ones included
+        self.estimate_worker = EstimateWorker(
+            file_paths, KIND_FORMATS[kind], skip_small=False, calibration=self.queue.calibration
+        )
+        self.estimate_worker.finished.connect(
+            lambda results: self.queue_estimated(results, kind, options)
+        )
+        self.estimate_worker.start()
+
+    def queue_estimated(self, results, kind, options):
+        """Queue the estimated PDFs once the user confirms the estimate"""
+        self.add_button.setEnabled(True)
+        output_root = self.settings.get_default_output_dir()
+        if self.confirm_estimate(results, output_root):
+            # Same scheme as the command line: a PDF with the file name of
+            # another queued PDF gets a numbered folder
+            taken = {
+                output_dir_key(job["output_dir"]): os.path.abspath(job["pdf_path"])
+                for job in self.queue.snapshot()
+            }
+            for file_path, _ in results:
+                output_dir = unique_output_dir(
+                    output_root, Path(file_path).stem, taken, os.path.abspath(file_path)
+                )
+                self.queue.add(file_path, output_dir, kind, dict(options))
+        self.refresh()
+
+    def confirm_estimate(self, results, output_root):
+        """Show the estimated output of the PDFs; True to queue them"""
+        from ...engine.estimate import total
+
+        lines = []
+        estimates = []
+        for file_path, item in results:
+            if isinstance(item, str):
+                lines.append(f"{os.path.basename(file_path)}: {item}")
+                continue
+            estimates.append(item)
+            lines.append(
+                f"{os.path.basename(file_path)}: {item.images} images, "
+                f"{format_size(item.output_bytes)}, ~{format_duration(item.seconds)}"
+            )
+
+        overall = total(estimates)
+        lines.append("")
+        lines.append(
+            f"Total: {overall.images} images, {format_size(overall.output_bytes)}, "
+            f"~{format_duration(overall.seconds)}"
+        )
+        free = shutil.disk_usage(output_root).free
+        if free < overall.output_bytes:
+            lines.append(f"Only {format_size(free)} free in {output_root}")
+
+        reply = QMessageBox.question(
+            self,
+            "Estimated output",
+            "\n".join(lines),
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes,
+        )
+        return reply == QMessageBox.Yes
+
+    def update_incremental_checkbox(self):
+        # Presentations are always rebuilt
+        self.incremental_checkbox.setEnabled(self.kind_combo.currentData() == "images")
+
+    def selected_job_id(self):
+        row = self.table.currentRow()
+        if row < 0:
+            return None
+        return self.table.item(row, 0).data(Qt.UserRole)
+
+    def apply_to_selected(self, action):
+        job_id = self.selected_job_id()
+        if job_id:
+            try:
+                action(job_id)
+            except (KeyError, ValueError) as e:
+                self.status_label.setText(str(e))
+            self.refresh()
+
+    def move_selected(self, offset):
+        job_id = self.selected_job_id()
+        if job_id:
+            self.queue.move(job_id, offset)
+            self.refresh()
+
+    def refresh(self):
+        jobs = self.queue.snapshot()
+        selected = self.selected_job_id()
+        self.table.setRowCount(len(jobs))
+
+        for row, job in enumerate(jobs):
+            name_item = QTableWidgetItem(os.path.basename(job["pdf_path"]))
+            name_item.setData(Qt.UserRole, job["id"])
+            name_item.setToolTip(job["pdf_path"])
+            self.table.setItem(row, 0, name_item)
+            self.table.setItem(row, 1, QTableWidgetItem(KIND_LABELS[job["kind"]]))
+            self.table.setItem(row, 2, QTableWidgetItem(str(job["priority"])))
+
+            status_item = QTableWidgetItem(STATE_LABELS[job["state"]])
+            status_item.setToolTip(job["message"])
+            self.table.setItem(row, 3, status_item)
+
+            progress_bar = self.table.cellWidget(row, 4)
+            if progress_bar is None:
+                progress_bar = QProgressBar()
+                progress_bar.setObjectName("progressBar")
+                self.table.setCellWidget(row, 4, progress_bar)
+            current, total = job["progress"]
+            if job["state"] == "done":
+                current, total = 1, 1
+            progress_bar.setMaximum(max(total, 1))
+            progress_bar.setValue(current)
+
+            if job["id"] == selected:
+                self.table.selectRow(row)
+
+        running = sum(job["state"] == "running" for job in jobs)
+        queued = sum(job["state"] == "queued" for job in jobs)
+        self.status_label.setText(f"{running} running, {queued} queued")
+
+    def closeEvent(self, event):
+        self.refresh_timer.stop()
+        if self.estimate_worker is not None:
+            self.estimate_worker.wait()
+        self.queue.shutdown()
+        super().closeEvent(event)
+
+
+class JobQueueModule(PDFModule):
+    def __init__(self):
+        # No need to call super().__init__() for ABC classes
+        pass
+
+    def get_name(self) -> str:
+        return "Job Queue"
+
+    def get_description(self) -> str:
+        return "Queue several PDFs and extract them concurrently"
+
+    def get_widget(self) -> QWidget:
+        return JobQueueWidget()
@@ -0,0 +1,78 @@
+import fitz
+from ...util.word_index import WordIndex, annotation_quads
+
+
+# Text markup annotations whose value is the text they cover
+TEXT_MARKUP_TYPES = {
+    fitz.PDF_ANNOT_HIGHLIGHT,
+    fitz.PDF_ANNOT_UNDERLINE,
+    fitz.PDF_ANNOT_SQUIGGLY,
+    fitz.PDF_ANNOT_STRIKE_OUT,
+}
+
+
+def page_has_annotations(doc, page_num):
+    """Check for a non-empty /Annots entry without loading the page
+
+    Only the page dictionary is looked up through its xref, so pages
+    without annotations are never parsed.
+    """
+    page_xref = doc.page_xref(page_num)
+    kind, value = doc.xref_get_key(page_xref, "Annots")
+
+    if kind == "xref":
+        # Indirect array: resolve it to see whether it is empty
+        value = doc.xref_object(int(value.split()[0]), compressed=True)
+    elif kind != "array":
+        return False
+
+    return value.strip("[] \n") != ""
+
+
+def annotation_record(annot, page_num):
+    """Build a structured record for one annotation"""
+    info = annot.info
+    rect = annot.rect
+    return {
+        "type": annot.type[1],
+        "page": page_num + 1,
+        "rect": [round(rect.x0, 2), round(rect.y0, 2), round(rect.x1, 2), round(rect.y1, 2)],
+        "author": info.get("title", ""),
+        "subject": info.get("subject", ""),
+        "content": info.get("content", ""),
+        "modified": info.get("modDate", ""),
+        "text": "",
+    }
+
+
+def scan_annotations(doc, start_page=1, end_page=None, types=None, progress_callback=None):
+    """Yield annotation records for every annotated page in a range
+
+    Args:
+        doc: Open fitz document
+        start_page (int): First page (1-based)
+        end_page (int): Last page (inclusive), defaults to the last page
+        types (set): Annotation type codes to keep, None keeps all types
+        progress_callback: Called with (current, total) after each page
+    """
+    end_page = min(end_page or doc.page_count, doc.page_count)
+    total = end_page - start_page + 1
+
+    for page_num in range(start_page - 1, end_page):
+        if page_has_annotations(doc, page_num):
+            page = doc[page_num]
+            word_index = None
+            for annot in page.annots():
+                if types is not None and annot.type[0] not in types:
+                    continue
+
+                record = annotation_record(annot, page_num)
+                if annot.type[0] in TEXT_MARKUP_TYPES:
+                    # One text pass per page, shared by all its highlights
+                    if word_index is None:
+                        word_index = WordIndex(page)
+                    record["text"] = word_index.text_in_quads(annotation_quads(annot))
+                yield record
+
+        if progress_callback:
+            progress_callback(page_num - start_page + 2, total)
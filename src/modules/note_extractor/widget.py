@@ -7,7 +7,6 @@ from PyQt5.QtWidgets import (
     QFileDialog,
 )
 from ..base_module import PDFModule
-from .handler import NoteExtractor
 
 
 class NoteExtractorWidget(QWidget):
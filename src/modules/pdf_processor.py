@@ -1,9 +1,103 @@
+import contextlib
+import os
 import fitz
 from pathlib import Path
 from ..util.image_handler import save_image
+from ..engine.cancellation import check_cancelled
+from ..engine.images import iter_page_images, export_presentation
+from ..engine.incremental import PageManifest, page_fingerprints
+from ..util import telemetry
+from ..util.encoder import EncodePool
+from ..util.image_catalog import link_file
+from ..util.phash import DuplicateFilter
 
 
-def extract_images_from_pdf(pdf_path, output_dir, skip_small=True, min_size=100):
+def iter_pdf_images(
+    pdf_document,
+    start_page=1,
+    end_page=None,
+    skip_small=True,
+    min_size=100,
+    cancel=None,
+    duplicates=None,
+    skip_page=None,
+    sidecar=None,
+):
+    """
+    Yield (page_num, img_index, base_image) for the images of a page range.
+
+    page_num and img_index are 0-based; base_image is the dict returned by
+    fitz's extract_image. Small images are skipped when requested, and
+    near-duplicates of earlier images when duplicates (a util.phash
+    DuplicateFilter) is given. skip_page is called with each 1-based page
+    number in turn; pages it returns True for are skipped. With sidecar
+    (the util.sidecar.ImageSidecar of the document), pages are not parsed
+    and small images are left out before their streams are read.
+    """
+    end_page = min(end_page or len(pdf_document), len(pdf_document))
+
+    # 1-based page -> [(img_index, xref)] from the sidecar index
+    indexed = None
+    if sidecar is not None:
+        minimum = min_size if skip_small else 0
+        indexed = {}
+        for record in sidecar.query(start_page, end_page, minimum, minimum):
+            indexed.setdefault(record.page, []).append((record.index - 1, record.xref))
+
+    # Iterate through each page
+    for page_num in range(start_page - 1, end_page):
+        if skip_page and skip_page(page_num + 1):
+            continue
+        if indexed is None:
+            page = pdf_document[page_num]
+            images = [(img_index, img[0]) for img_index, img in enumerate(page.get_images())]
+        else:
+            images = indexed.get(page_num + 1, [])
+        telemetry.count(pages=1)
+
+        # Iterate through images on the page
+        for img_index, xref in images:
+            check_cancelled(cancel)
+            with telemetry.stage("extract_image"):
+                base_image = pdf_document.extract_image(xref)
+
+            if base_image:
+                width = base_image.get("width", 0)
+                height = base_image.get("height", 0)
+
+                # Skip small images if requested
+                if skip_small and (width < min_size or height < min_size):
+                    telemetry.event(
+                        "image_skipped", page=page_num + 1, width=width, height=height
+                    )
+                    continue
+
+                if duplicates is not None and duplicates.is_duplicate(
+                    base_image["image"], (page_num + 1, img_index + 1)
+                ):
+                    continue
+
+                yield page_num, img_index, base_image
+
+
+def extract_images_from_pdf(
+    pdf_path,
+    output_dir,
+    skip_small=True,
+    min_size=100,
+    start_page=1,
+    end_page=None,
+    should_invert=False,
+    image_format="JPEG",
+    progress=None,
+    cancel=None,
+    sink=None,
+    encode_workers=None,
+    dedupe_distance=None,
+    catalog=None,
+    incremental=False,
+    sidecar=None,
+):
     """
     Extract images from a PDF file and save them to the specified directory.
 
@@ -12,43 +106,258 @@ def extract_images_from_pdf(pdf_path, output_dir, skip_small=True, min_size=100)
         output_dir (str): Directory where images will be saved
         skip_small (bool): Skip small images that might be icons or artifacts
         min_size (int): Minimum width/height for images to be extracted
+        start_page (int): First page to extract (1-based)
+        end_page (int): Last page to extract (inclusive), defaults to the last page
+        should_invert (bool): Remove the black background of the images
+        image_format (str): "JPEG", "PNG" or "AUTO" (chosen per image)
+        progress: Called with (current, total) pages after each page
+        cancel: Optional CancellationToken checked before each image
+        sink: Optional output sink (e.g. a ZipSink) used instead of loose files
+        encode_workers (int): Threads encoding and writing the images
+            (default: util.encoder.default_workers())
+        dedupe_distance (int): Keep one image per group of near-duplicates
+            whose perceptual hashes differ in at most this many bits
+            (default: keep every image)
+        catalog: Optional util.image_catalog.ImageCatalog; images already
+            stored by an earlier run are linked instead of saved again, and
+            new ones are added to it (directory output only)
+        incremental (bool): Only extract the pages that changed since the
+            last run into output_dir and reuse the files of the others (see
+            engine.incremental; directory output only)
+        sidecar: Optional util.sidecar.ImageSidecar of pdf_path, used to
+            select the images without parsing the pages
     """
+    if catalog is not None and sink is not None:
+        raise ValueError("The image catalog needs directory output, not a sink")
+    if incremental and sink is not None:
+        raise ValueError("Incremental extraction needs directory output, not a sink")
+
     # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    if sink is None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
 
     # Open the PDF
     pdf_document = fitz.open(pdf_path)
-    image_count = 0
+    try:
+        image_count = 0
+        end_page = min(end_page or len(pdf_document), len(pdf_document))
+        total_pages = end_page - start_page + 1
+        last_page = start_page - 2
+        duplicates = None if dedupe_distance is None else DuplicateFilter(dedupe_distance)
+        variant = f"{image_format}:{'inverted' if should_invert else 'plain'}"
+        linked = 0
+        # (page, index, catalog fingerprint) of each submitted image
+        submitted = []
+        # page -> [(path, index)] of the files written
+        outputs = {}
 
-    # Iterate through each page
-    for page_num in range(len(pdf_document)):
-        page = pdf_document[page_num]
-        images = page.get_images()
+        manifest = PageManifest(
+            output_dir,
+            {
+                "kind": "images_by_page",
+                "skip_small": skip_small,
+                "min_size": min_size,
+                "should_invert": should_invert,
+                "image_format": image_format,
+                "dedupe_distance": dedupe_distance,
+            },
+        ) if incremental else None
+        fingerprints = {}
+        reusable = set()
+        reused = 0
+        if manifest:
+            fingerprints = page_fingerprints(pdf_document, start_page, end_page)
+            reusable = manifest.prepare(fingerprints, len(pdf_document))
+            telemetry.event("cache", name="page_manifest", hit_pages=len(reusable))
 
-        # Iterate through images on the page
-        for img_index, img in enumerate(images):
-            xref = img[0]
-            base_image = pdf_document.extract_image(xref)
+        def reuse_page(page_number):
+            """Restore the files of an unchanged page; True when it was reused"""
+            nonlocal reused
+            if page_number not in reusable:
+                return False
+            staged, values = manifest.reuse(fingerprints[page_number])
+            files = []
+            for staged_path, entry in staged:
+                if duplicates is not None and "hash" in entry:
+                    duplicates.add(entry["hash"], (page_number, entry["index"]))
+                path = os.path.join(
+                    output_dir,
+                    f"image_{page_number}_{entry['index']}{os.path.splitext(entry['name'])[1]}",
+                )
+                manifest.restore(staged_path, path)
+                files.append((path, entry))
+            manifest.record(page_number, fingerprints[page_number], files, **values)
+            reused += len(files)
+            return True
+
+        with contextlib.ExitStack() as stack:
+            if manifest:
+                stack.enter_context(manifest)
+            stack.enter_context(telemetry.run("extract_images", pdf=pdf_path, format=image_format))
+            pool = stack.enter_context(EncodePool(encode_workers))
+
+            for page_num, img_index, base_image in iter_pdf_images(
+                pdf_document,
+                start_page,
+                end_page,
+                skip_small,
+                min_size,
+                cancel,
+                duplicates,
+                reuse_page if manifest else None,
+                sidecar,
+            ):
+                if progress and page_num != last_page:
+                    progress(page_num - start_page + 1, total_pages)
+                last_page = page_num
 
-            if base_image:
                 # Get image info
                 image_bytes = base_image["image"]
                 image_ext = base_image["ext"]
-                width = base_image.get("width", 0)
-                height = base_image.get("height", 0)
 
-                # Skip small images if requested
-                if skip_small and (width < min_size or height < min_size):
-                    print(
-                        f"Skipping small image on page {page_num + 1} ({width}x{height})"
-                    )
+                image_filename = f"image_{page_num + 1}_{img_index + 1}.{image_ext}"
+
+                fingerprint = None
+                if catalog is not None:
+                    fingerprint = catalog.fingerprint(image_bytes)
+                    existing = catalog.lookup(fingerprint, variant)
+                    if existing:
+                        # Stored by an earlier run: link to it instead of encoding
+                        base_name = os.path.splitext(image_filename)[0]
+                        target = os.path.join(
+                            output_dir, base_name + os.path.splitext(existing)[1]
+                        )
+                        link_file(existing, target)
+                        catalog.add(fingerprint, variant, target, pdf_path, page_num + 1)
+                        outputs.setdefault(page_num + 1, []).append((target, img_index + 1))
+                        linked += 1
+                        continue
+                submitted.append((page_num + 1, img_index + 1, fingerprint))
+
+                pool.submit(
+                    save_image,
+                    image_bytes,
+                    output_dir,
+                    image_filename,
+                    should_invert,
+                    image_format,
+                    sink,
+                    cancel,
+                )
+            results = pool.wait()
+            image_count = linked + reused + sum(1 for name in results if name)
+
+            failed_pages = set()
+            for (page_number, index, fingerprint), name in zip(submitted, results):
+                if not name:
+                    failed_pages.add(page_number)
                     continue
+                path = os.path.join(output_dir, name)
+                outputs.setdefault(page_number, []).append((path, index))
+                if catalog is not None:
+                    catalog.add(fingerprint, variant, path, pdf_path, page_number)
 
-                image_filename = f"image_{page_num + 1}_{img_index + 1}.{image_ext}"
+            if manifest:
+                for page_number, fingerprint in fingerprints.items():
+                    if page_number in reusable or page_number in failed_pages:
+                        # Reused pages are recorded already; failed ones run again
+                        continue
+                    files = []
+                    for path, index in outputs.get(page_number, []):
+                        info = {"index": index}
+                        if duplicates is not None:
+                            info["hash"] = duplicates.hashes[page_number, index]
+                        files.append((path, info))
+                    manifest.record(page_number, fingerprint, files)
+                manifest.save()
+
+        if progress:
+            progress(total_pages, total_pages)
+    finally:
+        pdf_document.close()
+
+    return image_count
 
-                if save_image(image_bytes, output_dir, image_filename):
-                    image_count += 1
-                    print(f"Saved {image_filename} ({width}x{height})")
 
-    pdf_document.close()
+def extract_merged_images_from_pdf(
+    pdf_path,
+    output_dir,
+    start_page=1,
+    end_page=None,
+    include_non_annotated=True,
+    output_format="JPEG",
+    progress=None,
+    cancel=None,
+    sink=None,
+    encode_workers=None,
+    dedupe_distance=None,
+):
+    """
+    Extract images with their annotation overlays merged.
+
+    Args:
+        pdf_path (str): Path to the PDF file
+        output_dir (str): Directory where images (or the presentation) are saved
+        start_page (int): First page to extract (1-based)
+        end_page (int): Last page to extract (inclusive), defaults to the last page
+        include_non_annotated (bool): Also keep images without an annotation layer
+        output_format (str): "JPEG", "PNG", "AUTO" or "PPTX"
+        progress: Called with (current, total) pages after each page
+        cancel: Optional CancellationToken checked before each page
+        sink: Optional output sink for JPEG/PNG output instead of loose files
+        encode_workers (int): Threads encoding and writing the images
+        dedupe_distance (int): Keep one merged image per group of
+            near-duplicates (see extract_images_from_pdf)
+
+    Returns:
+        int: Number of images written
+    """
+    if sink is None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    if output_format == "PPTX":
+        image_count, _ = export_presentation(
+            pdf_path,
+            output_dir,
+            start_page,
+            end_page,
+            {
+                "include_non_annotated": include_non_annotated,
+                "dedupe_distance": dedupe_distance,
+            },
+            progress,
+            cancel,
+        )
+        return image_count
+
+    pdf_document = fitz.open(pdf_path)
+    image_count = 0
+    duplicates = None if dedupe_distance is None else DuplicateFilter(dedupe_distance)
+
+    try:
+        with telemetry.run(
+            "extract_merged_images", pdf=pdf_path, format=output_format
+        ), EncodePool(encode_workers) as pool:
+            for page_number, page_images in iter_page_images(
+                pdf_document, start_page, end_page, include_non_annotated, progress, cancel
+            ):
+                for img_index, (image_bytes, _) in enumerate(page_images):
+                    if duplicates is not None and duplicates.is_duplicate(
+                        image_bytes, (page_number, img_index + 1)
+                    ):
+                        continue
+                    image_filename = f"image_{page_number}_{img_index + 1}"
+                    pool.submit(
+                        save_image,
+                        image_bytes,
+                        output_dir,
+                        image_filename,
+                        image_format=output_format,
+                        sink=sink,
+                        cancel=cancel,
+                    )
+            image_count = sum(1 for name in pool.wait() if name)
+    finally:
+        pdf_document.close()
+
     return image_count
@@ -0,0 +1,107 @@
+import importlib
+import json
+import os
+from importlib import metadata
+
+
+ENTRY_POINT_GROUP = "pdf_imaging.modules"
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules.json")
+
+
+class ModuleSpec:
+    """Describes a PDFModule without importing it
+
+    The sidebar only needs the name and description; the module class is
+    imported and instantiated the first time load() is called.
+    """
+
+    def __init__(self, module_id, name, entry, description="", entry_point=None):
+        self.id = module_id
+        self.name = name
+        self.description = description
+        self.entry = entry
+        self._entry_point = entry_point
+        self._module = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self):
+        """Import the module class and return its (cached) instance"""
+        if self._module is None:
+            if self._entry_point is not None:
+                module_class = self._entry_point.load()
+            else:
+                module_path, class_name = self.entry.split(":")
+                module_class = getattr(importlib.import_module(module_path), class_name)
+            self._module = module_class()
+        return self._module
+
+
+class ModuleRegistry:
+    """Discovers PDF modules from registry files and package entry points
+
+    Built-in modules are listed in modules.json. Other packages can add
+    PDFModule subclasses under the "pdf_imaging.modules" entry point group,
+    e.g. ``my_tool = my_package.module:MyToolModule``.
+    """
+
+    def __init__(self, registry_files=(REGISTRY_FILE,), entry_point_group=ENTRY_POINT_GROUP):
+        self.registry_files = registry_files
+        self.entry_point_group = entry_point_group
+        self._specs = None
+
+    def specs(self):
+        """Return the discovered module specs in registration order"""
+        if self._specs is None:
+            specs = {}
+            for registry_file in self.registry_files:
+                for spec in self._read_registry_file(registry_file):
+                    specs.setdefault(spec.id, spec)
+            for spec in self._read_entry_points():
+                specs.setdefault(spec.id, spec)
+            self._specs = list(specs.values())
+        return self._specs
+
+    def get(self, module_id):
+        for spec in self.specs():
+            if spec.id == module_id:
+                return spec
+        raise KeyError(module_id)
+
+    @staticmethod
+    def _read_registry_file(registry_file):
+        try:
+            with open(registry_file, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Could not read module registry {registry_file}: {str(e)}")
+            return []
+
+        return [
+            ModuleSpec(
+                entry["id"],
+                entry["name"],
+                entry["entry"],
+                entry.get("description", ""),
+            )
+            for entry in entries
+        ]
+
+    def _read_entry_points(self):
+        all_entry_points = metadata.entry_points()
+        if hasattr(all_entry_points, "select"):
+            entry_points = all_entry_points.select(group=self.entry_point_group)
+        else:  # Python < 3.10
+            entry_points = all_entry_points.get(self.entry_point_group, [])
+
+        return [
+            ModuleSpec(
+                entry_point.name,
+                entry_point.name.replace("_", " ").title(),
+                entry_point.value,
+                entry_point=entry_point,
+            )
+            for entry_point in entry_points
+        ]
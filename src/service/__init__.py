@@ -0,0 +1 @@
+# Local HTTP extraction service
@@ -0,0 +1,441 @@
+"""Local HTTP extraction service.
+
+Other tools POST a PDF and receive its images as they are extracted:
+
+    curl --data-binary @book.pdf "http://127.0.0.1:8765/extract?format=zip" -o images.zip
+    curl --data-binary @book.pdf "http://127.0.0.1:8765/extract?format=ndjson&merge=1"
+
+Endpoints:
+    POST   /extract         Extract images; streams a ZIP, TAR or NDJSON response
+    GET    /jobs            List running requests
+    DELETE /jobs/<job_id>   Cancel a running request
+    GET    /health          Service status
+
+Cancelling a request ends its response at once and drops the page ranges
+not yet started; ranges already running in a worker process (at most one
+per worker) still run to completion and their images are discarded.
+
+Query parameters of /extract: format (ndjson|zip|tar), start, end, min_size,
+merge (merge annotation overlays), annotated_only, data (0 leaves the
+base64 image data out of NDJSON lines) and job_id.
+
+Run with:
+    python -m src.service.server --port 8765 --workers 4
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import fitz
+from PIL import Image
+from ..engine.cancellation import CancellationToken, CancelledError
+from ..engine.images import iter_page_images
+from ..modules.pdf_processor import iter_pdf_images
+from ..util import profiling, telemetry
+from ..util.output_sink import TarSink, ZipSink
+
+
+PAGES_PER_TASK = 4
+# How often a request waiting for a worker checks for cancellation
+CANCEL_POLL_SECONDS = 0.1
+CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "zip": "application/zip",
+    "tar": "application/x-tar",
+}
+ARCHIVE_SINKS = {"zip": ZipSink, "tar": TarSink}
+MAX_UPLOAD_BYTES = 1024 * 1024 * 1024
+# Rejected uploads up to this size are read and discarded so the client
+# gets the error response instead of a reset connection
+MAX_DISCARD_BYTES = 64 * 1024 * 1024
+
+
+def _warm_worker():
+    """Pool initializer: load the heavy libraries once per worker process"""
+    profiling.configure_process()
+    fitz.TOOLS.mupdf_warnings()
+    Image.init()
+
+
+def _page_count(pdf_path):
+    doc = fitz.open(pdf_path)
+    try:
+        return doc.page_count
+    finally:
+        doc.close()
+
+
+def _image_ext(image_bytes):
+    try:
+        return Image.open(io.BytesIO(image_bytes)).format.lower().replace("jpeg", "jpg")
+    except Exception:
+        return "bin"
+
+
+def _extract_pages(pdf_path, start_page, end_page, options):
+    """Extract the images of a page range (runs inside a worker process)
+
+    Returns a list of (page_number, index, ext, image_bytes) tuples.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        results = []
+        if options["merge"]:
+            for page_number, page_images in iter_page_images(
+                doc, start_page, end_page, options["include_non_annotated"]
+            ):
+                for index, (image_bytes, _) in enumerate(page_images, 1):
+                    results.append(
+                        (page_number, index, _image_ext(image_bytes), image_bytes)
+                    )
+        else:
+            for page_num, img_index, base_image in iter_pdf_images(
+                doc, start_page, end_page, options["min_size"] > 0, options["min_size"]
+            ):
+                results.append(
+                    (page_num + 1, img_index + 1, base_image["ext"], base_image["image"])
+                )
+        return results
+    finally:
+        doc.close()
+
+
+class ChunkedWriter:
+    """File-like object writing HTTP/1.1 chunked transfer encoding"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, data):
+        if data:
+            self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+        return len(data)
+
+    def flush(self):
+        self.wfile.flush()
+
+    def close(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class ExtractionService:
+    """Warm worker pool plus bookkeeping of running requests"""
+
+    def __init__(self, workers=None, max_concurrent=4):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_worker
+        )
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.jobs = {}
+        self.lock = threading.Lock()
+
+    def start_job(self, job_id):
+        token = CancellationToken()
+        with self.lock:
+            if job_id in self.jobs:
+                raise ValueError(f"Job {job_id} is already running")
+            self.jobs[job_id] = token
+            telemetry.event("service_queue", active=len(self.jobs))
+        return token
+
+    def finish_job(self, job_id):
+        with self.lock:
+            self.jobs.pop(job_id, None)
+
+    def cancel_job(self, job_id):
+        with self.lock:
+            token = self.jobs.get(job_id)
+        if token:
+            token.cancel()
+        return token is not None
+
+    def iter_images(self, pdf_path, options, cancel):
+        """Yield extracted images in page order while later pages are processed"""
+        page_count = self.executor.submit(_page_count, pdf_path).result()
+        end_page = min(options["end"] or page_count, page_count)
+        ranges = [
+            (start, min(start + PAGES_PER_TASK - 1, end_page))
+            for start in range(options["start"], end_page + 1, PAGES_PER_TASK)
+        ]
+
+        pending = deque()
+        range_iter = iter(ranges)
+
+        def submit_next():
+            page_range = next(range_iter, None)
+            if page_range is not None:
+                pending.append(
+                    self.executor.submit(_extract_pages, pdf_path, *page_range, options)
+                )
+
+        # Keep a bounded number of tasks per request in flight
+        for _ in range(self.workers):
+            submit_next()
+
+        try:
+            while pending:
+                # A running task cannot be interrupted, but its request can
+                # stop waiting for it
+                while not wait([pending[0]], timeout=CANCEL_POLL_SECONDS).done:
+                    cancel.raise_if_cancelled()
+                cancel.raise_if_cancelled()
+                results = pending.popleft().result()
+                submit_next()
+                yield from results
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self):
+        with self.lock:
+            for token in self.jobs.values():
+                token.cancel()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ExtractionRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    service = None  # set by make_server
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def reject(self, status, message, length=0):
+        """Send an error before the request body was read and close the
+        connection, so the unread body is not parsed as the next request
+
+        A body of up to MAX_DISCARD_BYTES (length) is read first.
+        """
+        self.close_connection = True
+        if 0 < length <= MAX_DISCARD_BYTES:
+            while length:
+                chunk = self.rfile.read(min(length, 1024 * 1024))
+                if not chunk:
+                    break
+                length -= len(chunk)
+        body = json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            with self.service.lock:
+                active = len(self.service.jobs)
+            self.send_json(
+                HTTPStatus.OK,
+                {"status": "ok", "workers": self.service.workers, "active": active},
+            )
+        elif path == "/jobs":
+            with self.service.lock:
+                jobs = sorted(self.service.jobs)
+            self.send_json(HTTPStatus.OK, {"jobs": jobs})
+        else:
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_DELETE(self):
+        path = urlparse(self.path).path
+        if path.startswith("/jobs/"):
+            job_id = path[len("/jobs/") :]
+            if self.service.cancel_job(job_id):
+                self.send_json(HTTPStatus.OK, {"cancelled": job_id})
+                return
+        self.send_json(HTTPStatus.NOT_FOUND, {"error": "Unknown job"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.reject(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return
+
+        if url.path != "/extract":
+            self.reject(HTTPStatus.NOT_FOUND, "Not found", length)
+            return
+
+        try:
+            options = self.parse_options(parse_qs(url.query))
+        except ValueError as e:
+            self.reject(HTTPStatus.BAD_REQUEST, str(e), length)
+            return
+
+        if length <= 0:
+            self.reject(HTTPStatus.LENGTH_REQUIRED, "PDF body required")
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self.reject(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "PDF too large")
+            return
+
+        if not self.service.slots.acquire(blocking=False):
+            self.reject(HTTPStatus.TOO_MANY_REQUESTS, "Service busy", length)
+            return
+
+        try:
+            cancel = self.service.start_job(options["job_id"])
+        except ValueError as e:
+            self.service.slots.release()
+            self.reject(HTTPStatus.CONFLICT, str(e), length)
+            return
+
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                temp_path = f.name
+                remaining = length
+                while remaining:
+                    chunk = self.rfile.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    remaining -= len(chunk)
+
+            if remaining:
+                # The client stopped sending before the whole PDF arrived
+                try:
+                    self.reject(HTTPStatus.BAD_REQUEST, "Incomplete PDF body")
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                return
+            self.stream_images(temp_path, options, cancel)
+        finally:
+            self.service.finish_job(options["job_id"])
+            self.service.slots.release()
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def parse_options(query):
+        def value(name, default):
+            return query.get(name, [default])[0]
+
+        output_format = value("format", "ndjson")
+        if output_format not in CONTENT_TYPES:
+            raise ValueError("format must be ndjson, zip or tar")
+
+        end = value("end", None)
+        return {
+            "format": output_format,
+            "start": max(1, int(value("start", 1))),
+            "end": int(end) if end else None,
+            "min_size": int(value("min_size", 100)),
+            "merge": value("merge", "0") == "1",
+            "include_non_annotated": value("annotated_only", "0") != "1",
+            "include_data": value("data", "1") == "1",
+            "job_id": value("job_id", None) or uuid.uuid4().hex,
+        }
+
+    def stream_images(self, pdf_path, options, cancel):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPES[options["format"]])
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("X-Job-Id", options["job_id"])
+        self.end_headers()
+
+        writer = ChunkedWriter(self.wfile)
+        archive_sink = ARCHIVE_SINKS.get(options["format"])
+        archive = archive_sink(writer) if archive_sink else None
+        image_count = 0
+        status = {"done": True}
+
+        try:
+            for page, index, ext, image_bytes in self.service.iter_images(
+                pdf_path, options, cancel
+            ):
+                name = f"image_{page}_{index}.{ext}"
+                if archive:
+                    archive.write(name, image_bytes)
+                else:
+                    line = {
+                        "page": page,
+                        "index": index,
+                        "name": name,
+                        "size": len(image_bytes),
+                        "sha256": hashlib.sha256(image_bytes).hexdigest(),
+                    }
+                    if options["include_data"]:
+                        line["data"] = base64.b64encode(image_bytes).decode("ascii")
+                    writer.write(json.dumps(line).encode("utf-8") + b"\n")
+                writer.flush()
+                image_count += 1
+        except CancelledError:
+            status = {"done": False, "cancelled": True}
+        except (BrokenPipeError, ConnectionResetError):
+            # Client went away: stop the remaining work
+            cancel.cancel()
+            return
+        except Exception as e:
+            status = {"done": False, "error": str(e)}
+
+        try:
+            if archive:
+                if not status["done"]:
+                    archive.write("ERROR.json", json.dumps(status).encode("utf-8"))
+                archive.close()
+            else:
+                status["images"] = image_count
+                writer.write(json.dumps(status).encode("utf-8") + b"\n")
+            writer.close()
+        except (BrokenPipeError, ConnectionResetError):
+            cancel.cancel()
+
+
+def make_server(host="127.0.0.1", port=8765, workers=None, max_concurrent=4):
+    """Create the HTTP server and its warm worker pool"""
+    service = ExtractionService(workers, max_concurrent)
+    handler = type(
+        "BoundExtractionRequestHandler", (ExtractionRequestHandler,), {"service": service}
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local PDF image extraction service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPUs)")
+    parser.add_argument(
+        "--max-concurrent", type=int, default=4, help="simultaneous extraction requests"
+    )
+    args = parser.parse_args(argv)
+
+    profiling.configure_process()
+    server = make_server(args.host, args.port, args.workers, args.max_concurrent)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+        profiling.disable()
+
+
+if __name__ == "__main__":
+    main()
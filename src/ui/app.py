@@ -2,11 +2,18 @@ import sys
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from src.ui.main_window import MainWindow
-from . import resources_rc
+from .resources import register_resources
+from ..util import profiling
+from ..util.settings import Settings
 
 
 def run_app():
     app = QApplication(sys.argv)
+    register_resources()
+
+    # The environment variable wins over the saved setting
+    if profiling.active_profiler() is None:
+        profiling.configure(Settings().get_profiling_mode())
 
     # Set application-wide style
     app.setStyle("Fusion")
@@ -29,112 +29,28 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QDir, QSettings, QFile, QTextStream
 from PyQt5.QtGui import QIcon, QFont, QFontDatabase, QPalette, QColor, QPixmap, QImage
-import qtawesome as qta  # For better icons, install with: pip install qtawesome
 from pathlib import Path
-from ..modules.pdf_processor import extract_images_from_pdf
 from ..util.settings import Settings
 from ..util.translations import Translations
-from . import resources_rc  # Change this line
-from pptx import Presentation
-from pptx.util import Inches
-import fitz
-from ..util.image_handler import save_image, extract_to_ppt, ImageExtractionThread
 import io
-from PIL import Image
 import os
 import sys
 
+# Heavy libraries (fitz, pptx, PIL, the extraction workers) are imported
+# where they are first used so the window can be shown before they load.
+
 # Add the project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 # Now use the imports
-from src.modules.image_extractor.widget import ImageExtractorModule
-from src.modules.bookmark_extractor.widget import BookmarkExtractorModule
-from src.modules.note_extractor.widget import NoteExtractorModule
-
-
-class ExtractionWorker(QThread):
-    """Worker thread for PDF processing to keep UI responsive"""
-
-    progress = pyqtSignal(int, int)  # current, total
-    finished = pyqtSignal(int)
-    error = pyqtSignal(str)
-
-    def __init__(self, pdf_path, output_dir, should_invert, export_to_ppt):
-        super().__init__()
-        self.pdf_path = pdf_path
-        self.output_dir = output_dir
-        self.should_invert = should_invert
-        self.export_to_ppt = export_to_ppt
-        self._is_running = True
-
-    def run(self):
-        try:
-            doc = fitz.open(self.pdf_path)
-            images = []
-            image_count = 0
-            total_images = 0
-
-            # First count total images
-            for page in doc:
-                total_images += len(page.get_images())
-
-            for page_num in range(len(doc)):
-                if not self._is_running:
-                    doc.close()
-                    return
-
-                page = doc[page_num]
-                image_list = page.get_images()
-
-                for img_index, img in enumerate(image_list):
-                    if not self._is_running:
-                        doc.close()
-                        return
-
-                    try:
-                        xref = img[0]
-                        base_image = doc.extract_image(xref)
-                        image_bytes = base_image["image"]
-
-                        if self.export_to_ppt:
-                            images.append(image_bytes)
-                        else:
-                            # Save as individual files
-                            image_filename = f"image_{image_count:04d}.jpg"
-                            save_image(
-                                image_bytes,
-                                self.output_dir,
-                                image_filename,
-                                self.should_invert,
-                            )
-
-                        image_count += 1
-                        self.progress.emit(image_count, total_images)
-
-                    except Exception as e:
-                        print(f"Error processing image: {str(e)}")
-                        continue
-
-            if self.export_to_ppt and self._is_running and images:
-                # Create PowerPoint with all images
-                extract_to_ppt(images, self.output_dir, self.should_invert)
-
-            doc.close()
-            if self._is_running:
-                self.finished.emit(image_count)
-
-        except Exception as e:
-            self.error.emit(str(e))
-
-    def stop(self):
-        self._is_running = False
+from src.modules.registry import ModuleRegistry
 
 
 class ImagePreviewLabel(QLabel):
-    def __init__(self, image_bytes, index):
+    def __init__(self, images, index):
         super().__init__()
-        self.image_bytes = image_bytes
+        # Read from the (possibly spilled) store when drawn, not kept per label
+        self.images = images
         self.index = index
         self.is_inverted = False
         self.setFixedSize(200, 200)
@@ -153,7 +69,13 @@ class ImagePreviewLabel(QLabel):
                 f"border: 2px solid {'red' if self.is_inverted else 'gray'}; margin: 2px;"
             )
 
+    @property
+    def image_bytes(self):
+        return self.images[self.index]
+
     def update_image(self):
+        from PIL import Image
+
         img = Image.open(io.BytesIO(self.image_bytes))
         if self.is_inverted:
             # Invert the image
@@ -244,11 +166,11 @@ class PreviewDialog(QDialog):
 
     def show_previews(self, images):
         cols = 4
-        for i, image_bytes in enumerate(images):
+        for i in range(len(images)):
             try:
                 row = i // cols
                 col = i % cols
-                label = ImagePreviewLabel(image_bytes, i)
+                label = ImagePreviewLabel(images, i)
                 self.grid_layout.addWidget(label, row, col)
                 self.preview_labels.append(label)
             except Exception as e:
@@ -315,26 +237,23 @@ class MainWindow(QMainWindow):
         self.module_stack = QStackedWidget()
         self.module_stack.setObjectName("moduleStack")
 
-        # Load modules
-        self.modules = [
-            ImageExtractorModule(),
-            BookmarkExtractorModule(),
-            NoteExtractorModule(),
-        ]
+        # Discover modules; their widgets are built on first selection
+        self.module_registry = ModuleRegistry()
+        self.module_specs = self.module_registry.specs()
+        self.module_widgets = {}
 
         # Add modules to UI
-        for module in self.modules:
+        for spec in self.module_specs:
             # Add to sidebar list
-            item = QListWidgetItem(module.get_name())
-            item.setToolTip(module.get_description())
+            item = QListWidgetItem(spec.name)
+            item.setToolTip(spec.description)
             self.module_list.addItem(item)
 
-            # Add to stacked widget
-            module_widget = module.get_widget()
-            self.module_stack.addWidget(module_widget)
+            # Placeholder until the module is first shown
+            self.module_stack.addWidget(QWidget())
 
         # Connect module selection
-        self.module_list.currentRowChanged.connect(self.module_stack.setCurrentIndex)
+        self.module_list.currentRowChanged.connect(self.show_module)
 
         # Select first module by default
         self.module_list.setCurrentRow(0)
@@ -353,6 +272,28 @@ class MainWindow(QMainWindow):
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
 
+    def show_module(self, index):
+        """Show a module, building its widget the first time it is selected"""
+        if index < 0:
+            return
+
+        if index not in self.module_widgets:
+            spec = self.module_specs[index]
+            try:
+                module_widget = spec.load().get_widget()
+            except Exception as e:
+                print(f"Error loading module {spec.id}: {str(e)}")
+                module_widget = QLabel(f"Could not load {spec.name}")
+                module_widget.setAlignment(Qt.AlignCenter)
+
+            placeholder = self.module_stack.widget(index)
+            self.module_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.module_stack.insertWidget(index, module_widget)
+            self.module_widgets[index] = module_widget
+
+        self.module_stack.setCurrentIndex(index)
+
     def create_menu_bar(self):
         """Create the application menu bar"""
         menubar = self.menuBar()
@@ -416,7 +357,9 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
-            # Clean up resources if needed
+            # Let module widgets stop their background work
+            for module_widget in self.module_widgets.values():
+                module_widget.close()
             event.accept()
         else:
             event.ignore()
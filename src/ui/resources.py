@@ -0,0 +1,80 @@
+"""Compiled Qt resource bundle.
+
+Icons and fonts listed in resources/resources.qrc are shipped as a binary
+resources/resources.rcc that is memory-mapped by Qt at startup, instead of
+importing a generated Python module holding every byte as a literal.
+
+Rebuild the bundle after changing resources.qrc:
+    python -m src.ui.resources
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+from PyQt5.QtCore import QResource
+
+
+def _resources_dir():
+    # PyInstaller unpacks the "resources" data folder next to the executable
+    base = getattr(sys, "_MEIPASS", None) or os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    )
+    return os.path.join(base, "resources")
+
+
+RCC_PATH = os.path.join(_resources_dir(), "resources.rcc")
+QRC_PATH = os.path.join(_resources_dir(), "resources.qrc")
+
+_registered = False
+
+
+def register_resources(rcc_path=RCC_PATH):
+    """Register the binary resource bundle with Qt (once)"""
+    global _registered
+    if _registered:
+        return True
+
+    _registered = QResource.registerResource(rcc_path)
+    if not _registered:
+        print(f"Could not register resource bundle: {rcc_path}")
+    return _registered
+
+
+def build_rcc(qrc_path=QRC_PATH, rcc_path=RCC_PATH):
+    """Compile a .qrc file into a binary .rcc bundle
+
+    PyQt5 only ships pyrcc5, which emits Python. Its tree, name and data
+    tables use the same layout as the binary format, so they are wrapped
+    in an rcc header instead of being executed at import time.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        module_path = os.path.join(temp_dir, "resources_rc.py")
+        subprocess.run(
+            [sys.executable, "-m", "PyQt5.pyrcc_main", qrc_path, "-o", module_path],
+            check=True,
+        )
+        with open(module_path, encoding="utf-8") as f:
+            source = f.read()
+
+    # Keep only the table definitions, not the registration code
+    tables = {}
+    exec(source.split("qt_version =")[0].replace("from PyQt5 import QtCore", ""), tables)
+    tree = tables["qt_resource_struct_v2"]
+    names = tables["qt_resource_name"]
+    data = tables["qt_resource_data"]
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    header = b"qres" + struct.pack(">IIII", 2, tree_offset, data_offset, names_offset)
+
+    with open(rcc_path, "wb") as f:
+        f.write(header + tree + data + names)
+    return rcc_path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {build_rcc()}")
@@ -1,10916 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x30\xf4\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x79\x9c\x5d\x55\x99\xef\xff\xef\xda\xfb\
-\x9c\x53\x43\x6a\x4a\x2a\x49\xa5\xa6\x53\x49\xea\x54\x55\xc8\x3c\
-\x11\x06\x6d\x66\xfd\x21\x0a\xa8\x0d\xad\x22\x28\x6a\xb7\x36\x76\
-\xa3\xdd\x7a\x6d\x69\x9b\x2b\x60\x3b\x80\xd2\xb4\x80\xa2\x82\x36\
-\xc8\xa0\xdd\x36\x57\x5a\x19\x1c\x2e\x82\x20\x08\x32\xb5\x0c\x21\
-\x24\x81\xcc\x54\x88\x21\x53\x55\xa5\xc6\x73\xf6\xfa\xfd\x11\xf5\
-\x22\x0d\x19\xaa\xf6\xaa\x7d\x4e\xad\xcf\xfb\xf5\xf2\x1f\x5e\xf2\
-\x3c\x0f\x75\xaa\xf6\xfe\x9e\x3d\xac\x25\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x57\x33\x49\x0f\x80\x03\
-\x5b\xb6\x6c\x59\xfa\xa5\x97\xf6\xce\xb2\x81\x9d\xa3\x20\xea\x52\
-\x64\xba\x64\x94\x35\x52\x9d\x95\x26\xc9\x9a\x2a\x19\x5b\x2d\xa9\
-\x56\x52\x90\xf4\xbc\xc0\x78\xb1\xb2\x91\x91\xe9\x95\xb5\x8f\x04\
-\x29\x73\xe1\x96\xf5\x6b\x1e\x49\x7a\x26\xa0\x54\x10\x00\x8a\xd0\
-\x94\x5c\xae\xa6\x7c\x58\xc7\x5a\x13\x1c\x6f\x22\x9d\x20\xa3\xb9\
-\x92\xd2\x49\xcf\x05\x14\x3b\x63\xec\xc3\x65\x61\xe1\xe4\x75\xeb\
-\xd6\xed\x49\x7a\x16\xa0\xd8\x11\x00\x8a\x44\xd3\xac\xae\x2e\xe5\
-\xa3\xf7\x2a\x30\x6f\x96\xd5\x72\x49\x61\xd2\x33\x01\x25\xaa\x27\
-\xb4\x99\xa5\x9b\x37\x3f\xf3\x42\xd2\x83\x00\xc5\x8c\x00\x90\xa0\
-\x99\x33\x67\xd6\x0d\x45\x99\xbf\x30\xd2\xfb\x24\x1d\x2d\x3e\x0f\
-\x20\x2e\x03\x65\xe1\xc8\x61\xeb\xd7\xaf\xdf\x98\xf4\x20\x40\xb1\
-\xe2\x84\x93\x80\xa6\xb6\xdc\x12\xd9\xe0\x02\x49\x6f\x97\x94\x49\
-\x7a\x1e\x60\x62\xb2\x7b\x94\x37\xb9\xee\xee\x35\x2f\x27\x3d\x09\
-\x50\x8c\x08\x00\xe3\xa8\xa9\x6d\xce\xd1\xb2\xd1\x3f\x4a\x7a\xab\
-\xf8\xd9\x03\xee\x59\x6d\x9f\x5c\x93\x9e\xbd\x72\xe5\xca\xbe\xa4\
-\x47\x01\x8a\x4d\x2a\xe9\x01\x7c\xd0\xd4\x36\xe7\x68\x1b\x15\xbe\
-\x20\x1b\x1d\x97\xf4\x2c\x80\x57\x8c\xa6\xed\xea\xcb\xaf\x94\xd4\
-\x21\x69\x38\xe9\x71\x80\x62\xc2\xb7\x50\x87\x5a\x5a\xe6\x4d\x89\
-\x82\xfc\x45\x92\xfd\x5b\xf1\x7a\x1e\x90\x1c\x6b\xd7\x76\x6f\x5e\
-\x3b\x47\x52\x94\xf4\x28\x40\xb1\x20\x00\xb8\x61\x9a\xb3\x9d\xe7\
-\x58\xa3\xcb\x65\x35\x2d\xe9\x61\x00\x48\xb2\x7a\xb2\x7b\xf3\x9a\
-\xc5\x49\x8f\x01\x14\x0b\x02\x40\xcc\x1a\xb2\x9d\xb3\x43\xab\x5b\
-\x64\x74\x64\xd2\xb3\x00\xf8\x53\xc6\x98\x7b\x5f\xdc\xb8\xfa\x84\
-\xa4\xe7\x00\x8a\x01\x97\xa5\x63\xd4\xd4\xda\x75\x7a\x28\x3d\xc6\
-\xc9\x1f\x28\x4e\xd6\xda\xe3\x9b\x67\x76\xfc\x38\xe9\x39\x80\x62\
-\xc0\x62\x33\x31\xc8\xe5\x72\x65\xe5\x55\xd3\xae\x90\xb1\x57\x48\
-\xaa\x48\x7a\x1e\x00\xfb\x61\x4d\x57\x55\x6d\xfd\xec\xbe\x3d\x3b\
-\xfe\x2b\xe9\x51\x80\x24\x11\x00\xc6\xa8\xb5\xb5\xab\x69\x38\x32\
-\x77\x4b\x7a\x87\xb8\xa5\x02\x94\x04\x23\x2d\xaa\xa9\x9b\x56\xdb\
-\xbb\xe7\xe5\x9f\x25\x3d\x0b\x90\x14\x02\xc0\x18\x34\x64\x3b\x67\
-\xcb\xe8\x1e\x49\xf3\x92\x9e\x05\xc0\xa1\xb1\xb2\x47\xd5\xd5\xd6\
-\xab\x67\xcf\x8e\xfb\x92\x9e\x05\x48\x02\x01\x60\x94\x1a\x5b\xbb\
-\x96\x07\xfb\x4e\xfe\xad\x49\xcf\x02\xe0\xd0\x19\x49\x56\x3a\xae\
-\xba\x7a\xca\xce\xde\x9e\x9d\xec\x22\x08\xef\x10\x00\x46\xa1\xb9\
-\xad\xeb\x04\xc9\xde\x25\x69\x4a\xd2\xb3\x00\x18\x23\x63\x4e\xae\
-\xaa\xad\x5f\xd7\xb7\x67\xc7\x53\x49\x8f\x02\x8c\x27\xee\x59\x1f\
-\xa2\x96\x99\x73\x8e\x8b\xa2\xe8\x27\x92\xca\x93\x9e\x05\x40\x6c\
-\xa2\x82\xa2\xb7\x6f\xdb\xf4\xfc\xed\x49\x0f\x02\x8c\x17\x02\xc0\
-\x21\x68\x69\x99\xb3\x20\x0a\xa2\xfb\x25\xd5\x25\x3d\x0b\x80\x78\
-\x59\xa9\x20\x6b\x4f\xd8\xba\x79\xed\xfd\x49\xcf\x02\x8c\x07\x02\
-\xc0\x41\x6a\x6d\xcd\xb5\x17\x4c\xf0\xa0\xa4\x86\x24\xe7\xa8\x33\
-\x52\xbb\x31\xca\x1a\xa3\x36\x23\x35\x18\xa3\x0a\xed\x7b\xf7\xb0\
-\xc2\xf0\x71\x62\x62\xf8\xaf\x42\xa4\x1f\x16\x12\x58\xb5\xd7\x98\
-\x91\xb4\xc2\x23\x36\x6e\x7c\xf6\xbf\xc7\xbf\x39\x30\xbe\xd8\x0c\
-\xe8\x20\x4c\x9b\x39\x6f\x46\x21\x1a\xf9\x99\x12\x38\xf9\x4f\x92\
-\x74\x44\x10\x68\x59\x20\x2d\x0f\x8c\x66\x73\x92\x87\x07\x1e\x4c\
-\xea\xd7\xdc\xda\x74\x5e\xf9\x87\x5a\x5a\x0e\x5b\xb0\x65\xcb\xaa\
-\xb5\x09\x4d\x01\x8c\x0b\x02\xc0\x81\x05\xe9\x68\xe4\x66\x49\xed\
-\xe3\xd6\x50\xd2\x82\xc0\xe8\x94\xc0\xe8\xe4\x20\x50\x25\xe7\x7c\
-\x60\xdc\x58\xa9\xcc\x06\x85\x27\x67\xcd\x9a\x75\xd8\xfa\xf5\xeb\
-\x37\x26\x3d\x0f\xe0\x0a\x01\xe0\x00\x1a\x5b\xbb\x2e\x91\xec\x89\
-\xe3\xd1\x2b\x2d\xe9\xb4\xd0\xe8\x7d\x61\xa8\x26\x4e\xfa\x40\x92\
-\x2a\x86\x0a\xe9\xa7\x9a\x9a\x3a\xdb\xbb\xbb\xd7\xbc\x9c\xf4\x30\
-\x80\x0b\xec\x05\xb0\x1f\x4d\xd9\x8e\x37\x19\x63\x3f\xe3\xba\x4f\
-\x28\xe9\x3d\xa1\xd1\x8f\x33\x29\x5d\x90\xe2\xe4\x0f\x14\x89\x1a\
-\xa5\xb4\x6a\xde\xbc\x79\x55\x49\x0f\x02\xb8\x40\x00\x78\x1d\xd3\
-\x67\xcd\x6a\x90\xcc\x8d\x72\xfc\x33\x5a\x12\x18\xdd\x92\x4e\xe9\
-\x13\xa9\x50\x53\x39\xf1\x03\xc5\x66\xea\xee\x9e\x91\xd5\xd2\x71\
-\xbc\xf6\x8b\x09\x87\x00\xf0\x3a\x52\x85\xcc\x75\x92\x66\xb8\xaa\
-\x5f\x61\xa4\x0b\xd3\xa1\xbe\x95\x0e\xd5\xce\xa7\x00\x14\x2d\x6b\
-\xd4\xd4\x94\xdd\xfa\x94\x38\x5e\x62\x82\xe1\x17\xfa\x35\x34\xb5\
-\x76\x9d\x2e\xd9\x53\x5d\xd5\x9f\x65\x8c\xfe\x2d\x9d\xd2\xe9\x81\
-\xe1\x3d\x4c\xa0\x24\xd8\x8e\xa6\xd6\xce\x27\x92\x9e\x02\x88\x13\
-\x01\xe0\x55\x9a\x9a\x9a\x2a\x65\xec\x57\x5d\xd5\x7f\x4b\x60\x74\
-\x53\x26\x54\x8e\x33\x3f\x50\x5a\x8c\x16\x35\xb7\x75\xdd\x93\xf4\
-\x18\x40\x5c\x08\x00\xaf\x62\x52\x55\x17\x4a\x9a\xe9\xa2\xf6\xbb\
-\xc3\x40\x17\xa7\x43\x95\xb9\x28\x0e\xc0\x39\x6b\xed\xf1\xcd\x33\
-\x3b\x7e\x9c\xf4\x1c\x40\x1c\x08\x00\xaf\xd0\xd2\x72\x58\x87\x95\
-\x3e\xe9\xa2\xf6\xdf\xa6\x02\x7d\x32\x15\xf0\x03\x07\x4a\x9c\x8d\
-\xcc\xa9\x4d\xd9\xce\xeb\x93\x9e\x03\x18\x2b\xce\x47\xaf\x10\x05\
-\x85\xcf\x48\xca\xc4\x5d\xf7\xbc\x54\xa0\xf7\x87\xfc\xa8\x81\x09\
-\xe4\xdc\xe6\x6c\x97\xb3\x5b\x85\xc0\x78\xe0\xac\xf4\x7b\x4d\xb3\
-\x67\x67\x25\x9d\x15\x77\xdd\x33\x42\xa3\x0f\x72\xf2\x07\x26\x9c\
-\x48\xf6\xe3\x2d\xd9\xce\x8b\x92\x9e\x03\x18\x2d\xce\x4c\x7f\x50\
-\x08\x2f\x50\xcc\xdf\xfe\x8f\x0f\x8c\x3e\x95\x0a\xe3\x2c\x09\xa0\
-\x48\x18\x49\x91\x74\x71\x53\x4b\xe7\xdf\x26\x3d\x0b\x30\x1a\x04\
-\x00\xed\xdb\xec\x47\xd6\x9c\x1b\x67\xcd\x46\x49\x17\xa6\x42\x7e\
-\xc0\x40\x82\x0e\x9f\x32\x59\xf3\x6a\x6b\xdc\x36\x09\x74\x55\x63\
-\xb6\xf3\x1c\xb7\x4d\x80\xf8\x71\x7e\x92\x94\x89\x46\x3e\xa6\x7d\
-\x3b\xea\xc6\x22\x2d\xe9\xd2\x74\xa8\x1a\x5e\xf5\x03\x12\x35\x29\
-\x95\xd2\x37\x96\x2f\x51\x7b\xd5\x24\x97\x6d\x8c\x91\x6e\x68\xc8\
-\xe6\x9c\xad\x1d\x02\xb8\x40\x00\x90\x02\x2b\xc5\x9a\xde\xff\x2a\
-\x0c\x34\x37\xe0\xec\x0f\x14\x83\xc9\x99\xb4\xae\x3d\x7c\xa9\x5a\
-\x2a\x62\xcb\xf8\xaf\x25\x08\x14\xdc\xd6\xd8\xda\x71\x8c\xcb\x26\
-\x40\x9c\xbc\x0f\x00\x4d\xd9\x8e\x13\x25\xb5\xc4\x55\x2f\x1b\x48\
-\x67\xa7\xbc\xff\xb1\x02\x45\x65\x7a\x79\x99\xae\x5d\xb1\x44\xd3\
-\xca\xdc\xad\xc2\x61\xa4\xd0\x04\xc1\xdd\x6d\x6d\x73\x97\x38\x6b\
-\x02\xc4\xc8\xfb\x33\x95\x91\x89\xf5\xdb\xff\x3f\x86\xa1\xd2\x71\
-\x16\x04\x10\x8b\xd6\xca\x4a\x5d\xbb\x62\x89\xea\x32\x0e\xff\x42\
-\xad\x4d\x8f\xd8\xfc\xc3\x33\x72\xb9\xb9\xee\x9a\x00\xf1\xf0\x3a\
-\x00\x4c\x9b\x36\xaf\xca\x4a\xef\x8c\xab\xde\xf1\x81\xd1\x72\x2e\
-\xfd\x03\x45\x2b\x57\x55\xa5\xeb\x56\x2c\x55\x75\xca\x69\x4c\xcf\
-\x04\xc3\xe1\xa3\x4d\xed\xed\xad\x2e\x9b\x00\x63\xe5\x75\x00\x48\
-\x97\x0f\x9f\x2a\x29\xb6\xa7\x83\x3e\xc0\x2b\x7f\x40\xd1\x9b\x53\
-\x5d\xad\x6b\x0e\x5f\xac\x8a\xd0\xe5\xdf\xab\xad\xd4\x48\xf8\x4c\
-\x53\x53\xe7\x54\x87\x4d\x80\x31\xf1\x3a\x00\x48\xe6\xc4\xb8\x2a\
-\x1d\x1d\x18\x1d\xc6\x97\x7f\xa0\x24\x2c\xae\xab\xd5\x95\x4b\x17\
-\x2a\x13\x38\x3d\x04\xd6\x28\x65\x9e\xcb\xe5\x72\x8e\xdf\x43\x04\
-\x46\xc7\xef\x00\x60\x74\x42\x5c\xa5\xce\x61\xb5\x3f\xa0\xa4\x1c\
-\x35\xb5\x5e\x97\x2d\x9e\xaf\x94\xd3\xdb\x76\xb6\xbe\x7f\x28\x58\
-\x29\xe5\xd8\x03\x0c\x45\xc7\xdb\xb3\x56\xe3\xac\xc3\xda\x24\xcd\
-\x8a\xa5\x96\xa4\xa5\xdc\xfb\x07\x4a\xce\x49\x0d\xd3\x75\xc9\xfc\
-\xb9\x72\xfa\xd7\x6b\xd4\xd2\x94\x0d\x56\xca\xe3\xe3\x2d\x8a\x93\
-\xb7\xbf\x90\x26\x8a\x4e\x8a\xab\xd6\x29\x21\xbb\xfc\x01\xa5\xea\
-\xb4\xe6\x46\x5d\x30\xb7\xcb\x75\x9b\xf6\xa6\xd6\xce\x27\x5c\x37\
-\x01\x0e\x85\xb7\xe7\x2d\x6b\x6d\x6c\x0b\x76\x9c\xe2\xf6\x3e\x22\
-\x00\xc7\xce\x6a\x6b\xd5\x5f\xe7\x62\xb9\x20\xf8\xfa\x8c\x16\x35\
-\xb7\x75\xdd\xe3\xb6\x09\x70\xf0\xbc\x3d\x73\x19\x99\xf9\x71\xd4\
-\x69\x36\x46\x59\x6f\x7f\x8a\xc0\xc4\xf1\x37\x1d\xed\x3a\x77\x56\
-\x9b\xd3\x1e\xd6\xda\xe3\x9b\xdb\x3a\x6e\x77\xda\x04\x38\x48\xbe\
-\x9e\xba\x8c\x64\x3b\xe3\x28\xb4\x82\x7b\xff\xc0\x84\xf1\x89\x39\
-\x1d\x3a\xa3\xb5\xd9\x69\x0f\x6b\xcd\xdb\x1a\xb3\x9d\x37\x3a\x6d\
-\x02\x1c\x04\x2f\x03\x40\x73\x73\xae\x59\x52\x55\x1c\xb5\x96\x71\
-\xfe\x07\x26\x0c\x23\xe9\xc2\x79\x73\x74\x72\x63\x83\xeb\x3e\xe7\
-\x34\x67\xbb\xbe\xea\xb4\x09\x70\x00\x5e\x06\x00\x85\x41\x6c\x4f\
-\xfc\x2c\xe0\xfe\x3f\x30\xa1\x84\xc6\xe8\x4b\x8b\xe6\xeb\x98\x69\
-\x6e\xd7\xf0\x89\x64\x3f\xde\x94\xed\xbc\xc8\x69\x13\x60\x3f\xbc\
-\x3c\x7b\x59\xab\x58\x02\x40\x99\xa4\x19\x5c\x01\x00\x26\x9c\x94\
-\x31\xba\x62\xc9\x02\x1d\x3e\x65\xb2\xb3\x1e\xbf\x3f\x74\x5c\xdc\
-\xd4\xd2\xf1\x31\x67\x4d\x80\xfd\xf0\x33\x00\xc8\x34\xc6\x51\xa7\
-\xcd\x18\x3f\x7f\x80\x80\x07\xca\xc2\x50\x57\x2d\x5b\xa4\x79\xb5\
-\x8e\x17\xf2\x0b\xcc\x57\x1b\xb3\x9d\xb1\x6e\x4a\x06\x1c\x0c\x2f\
-\xcf\x5f\x81\x89\xaa\xe3\xa8\x93\xe5\xdb\x3f\x30\xa1\x55\xa5\x52\
-\xfa\xc6\xf2\x25\x6a\xaf\x8a\x6d\xcb\x90\xd7\x62\x8c\x74\x43\x43\
-\x36\x77\xaa\xcb\x26\xc0\xab\x79\x19\x00\xac\x55\x2c\x01\xa0\xde\
-\x90\x00\x80\x89\x6e\x72\x26\xad\xeb\x0e\x5f\xaa\xd6\xca\x0a\x97\
-\x6d\x82\x40\xe6\xb6\x19\x2d\xb9\x63\x5d\x36\x01\x5e\xc9\xcb\x00\
-\x20\x63\x62\x09\x00\x95\x9c\xff\x01\x2f\x4c\x2b\x2f\xd3\xb7\x0e\
-\x5f\xaa\x69\x65\xee\x96\xf4\x37\x32\x61\x18\x04\xff\xb7\xad\x6d\
-\xee\x12\x67\x4d\x80\x57\xf0\x32\x00\x18\x1b\xcf\x2b\x80\xe5\x36\
-\x8e\x2a\x00\x4a\x41\x6b\x65\x85\xae\x3f\x62\x99\xea\x33\xee\x42\
-\x80\x95\xd2\x23\xca\x3f\xdc\xd0\xde\x1e\xcb\x42\x65\xc0\xfe\x78\
-\x19\x00\xac\x51\x2c\x37\xf4\x2a\xb8\x05\x00\x78\xa5\x6d\x52\xa5\
-\xbe\xb9\x62\xb1\xaa\x53\x69\x77\x4d\xac\x32\xe1\x48\xea\x37\x4d\
-\xed\xed\xad\xee\x9a\x00\x9e\x06\x00\xc5\xf4\xdf\x1d\x88\x4b\x00\
-\x80\x6f\xe6\x54\x57\xeb\x9a\xc3\x17\xab\x22\x0c\x1d\x76\xb1\x95\
-\x1a\x09\x57\x36\x34\x2c\x9c\xee\xb0\x09\x3c\xe7\x6b\x00\x00\x80\
-\x51\x5b\x5c\x57\xab\x2b\x97\x2e\x54\xc6\xed\x42\x60\xd5\x61\xd9\
-\xd0\xb3\xb9\x5c\xce\xf1\x7b\x88\xf0\x15\x01\x00\x00\x46\xe1\xa8\
-\xa9\xf5\xba\x6c\xf1\x7c\xa5\x9c\xee\x07\x62\xeb\x07\x86\x82\x55\
-\xd2\x71\xe5\x0e\x9b\xc0\x53\x04\x00\x00\x18\xa5\x93\x1a\xa6\xeb\
-\x92\xf9\x73\xe5\x34\x02\x18\x35\x35\x65\xbb\x9f\x11\xc7\x6b\xc4\
-\x8c\x5f\x28\x00\x18\x83\xd3\x9a\x1b\x75\xc1\xdc\xd8\xb6\x17\x79\
-\x3d\xed\x4d\xad\x9d\x4f\xb8\x6e\x02\xbf\x10\x00\x00\x60\x8c\xce\
-\x6a\x6b\xd5\x5f\xe7\x66\xb9\x6d\x62\xb4\xa8\xb9\xad\xeb\x5e\xb7\
-\x4d\xe0\x13\x02\x00\x00\xc4\xe0\x6f\x3a\xda\x75\xee\xac\x36\xa7\
-\x3d\xac\xb5\xc7\x35\xb7\x75\xdc\xee\xb4\x09\xbc\x41\x00\x00\x80\
-\x98\x7c\x62\x4e\x87\xce\x68\x6d\x76\xda\xc3\x5a\xf3\xb6\xc6\x6c\
-\xe7\x8d\x4e\x9b\xc0\x0b\x04\x00\x00\x88\x89\x91\x74\xe1\xbc\x39\
-\x3a\xb9\xb1\xc1\x75\x9f\x73\x9a\xb2\x9d\x57\x39\x6d\x82\x09\x8f\
-\x00\x00\x00\x31\x0a\x8d\xd1\x97\x16\xcd\xd7\x31\xd3\xa6\x3a\xed\
-\x63\xa5\xf3\x5b\xb2\x9d\x17\x3b\x6d\x82\x09\x8d\x00\x00\x00\x31\
-\x4b\x19\xa3\x2b\x96\x2c\xd0\xe1\x53\x26\x3b\xeb\x61\x24\x45\xd2\
-\x45\x4d\x2d\x1d\x1f\x73\xd6\x04\x13\x1a\x01\x00\x00\x1c\x28\x0b\
-\x43\x5d\xb5\x6c\x91\xe6\xd5\x3a\x5e\xc8\x2f\x30\x5f\x6d\xcc\x76\
-\x9e\xe3\xb6\x09\x26\x22\x02\x00\x00\x38\x52\x95\x4a\xe9\x1b\xcb\
-\x97\xa8\xbd\x2a\x96\xfd\xc7\x5e\x8f\x31\xd2\x0d\x0d\xd9\xdc\xa9\
-\x2e\x9b\x60\xe2\x21\x00\x00\x80\x43\x93\x33\x69\x5d\x77\xf8\x52\
-\xb5\x56\x56\xb8\x6c\x13\x04\x32\xb7\xcd\x68\xc9\x1d\xeb\xb2\x09\
-\x26\x16\x02\x00\x00\x38\x36\xad\xbc\x4c\xdf\x39\x62\x99\x1a\xcb\
-\xdd\x2d\xe9\x6f\x64\xc2\xc0\x84\x77\x37\xe7\x72\x47\x3a\x6b\x82\
-\x09\x85\x00\x00\x00\xe3\xa0\xb1\xbc\x5c\xd7\xad\x58\xaa\xfa\x4c\
-\x99\xbb\x26\xc6\xa6\xec\x48\x70\x5f\x43\x7b\xfb\x7c\x77\x4d\x30\
-\x51\x10\x00\x00\x60\x9c\xb4\x4d\xaa\xd4\x37\x57\x2c\x56\x75\x2a\
-\xed\xae\x89\x55\x26\x1c\x09\x1f\x99\x35\xcb\xf1\xb2\x84\x28\x79\
-\x04\x00\x00\x18\x47\x73\xaa\xab\x75\xcd\xe1\x8b\x55\x11\x86\x2e\
-\xdb\x54\x0c\x15\xd2\x4f\x37\x34\x2c\x9c\xee\xb2\x09\x4a\x1b\x01\
-\x00\x00\xc6\xd9\xe2\xba\x5a\x5d\xb9\x74\xa1\x32\x81\xd3\x43\x70\
-\x75\x58\x36\xf4\x6c\x2e\x97\x73\xfc\x1e\x22\x4a\x15\x01\x00\x00\
-\x12\x70\xd4\xd4\x7a\x7d\x79\xf1\x7c\xa5\x02\xe3\xb0\x8b\xad\x1f\
-\x18\x0a\x56\x49\xc7\xb9\x7b\xfa\x10\x25\x8b\x00\x00\x00\x09\x39\
-\xb1\x61\xba\x2e\x99\x3f\x57\x4e\x23\x80\x51\x53\x53\xb6\xfb\x19\
-\x71\xbc\xc7\xab\xf0\x0b\x01\x00\x09\x3a\xad\xb9\x51\x17\xcc\xed\
-\x72\xdd\xa6\xbd\xa9\xb5\xf3\x09\xd7\x4d\x50\x5a\x08\x00\x00\x90\
-\xb0\xb3\xda\x5a\x75\x5e\x6e\xb6\xdb\x26\x46\x8b\x9a\xdb\xba\xee\
-\x75\xdb\x04\xa5\x84\x00\x00\x00\x45\xe0\xa3\x1d\xb3\x75\xae\xe3\
-\x37\xf7\xac\xb5\xc7\x35\xb7\x75\xdc\xee\xb4\x09\x4a\x06\x01\x00\
-\x00\x8a\xc4\x27\xe6\x74\xe8\x8c\xd6\x66\xa7\x3d\xac\x35\x6f\x6b\
-\xcc\x76\xde\xe8\xb4\x09\x4a\x02\x01\x00\x00\x8a\x84\x91\x74\xe1\
-\xbc\x39\x7a\x4b\xd3\x0c\xd7\x7d\xce\x69\xca\x76\x5e\xe5\xb4\x09\
-\x8a\x1e\x01\x00\x00\x8a\x48\x68\x8c\xbe\xb8\x70\x9e\x8e\x99\x36\
-\xd5\x69\x1f\x2b\x9d\xdf\x92\xed\xbc\xd8\x69\x13\x14\x35\x02\x00\
-\x00\x14\x99\x94\x31\xba\x62\xc9\x02\x1d\x3e\x65\xb2\xb3\x1e\x46\
-\x52\x24\x5d\xd4\xd4\xd2\xf1\x31\x67\x4d\x50\xd4\x08\x00\x00\x50\
-\x84\xca\xc2\x50\x57\x2d\x5b\xa4\x79\xb5\x8e\x17\xf2\x0b\xcc\x57\
-\x1b\xb3\x9d\xe7\xb8\x6d\x82\x62\x44\x00\x00\x80\x22\x55\x95\x4a\
-\xe9\x1b\xcb\x97\x28\x57\x55\xe5\xb2\x8d\x31\xd2\x0d\x0d\xad\xb9\
-\xd3\x5d\x36\x41\xf1\x21\x00\x00\x40\x11\x9b\x9c\x49\xeb\xda\xc3\
-\x97\xa8\xb5\xb2\xc2\x65\x9b\x20\x30\xe6\xff\xcc\x68\xc9\x1d\xeb\
-\xb2\x09\x8a\x0b\x01\x00\x00\x8a\xdc\xb4\xf2\x32\x7d\xe7\x88\x65\
-\x6a\x2c\x77\xb7\xa4\xbf\x91\x09\x03\x13\xde\xdd\x9c\xcb\x1d\xe9\
-\xac\x09\x8a\x0a\x01\x00\x00\x4a\x40\x63\x79\xb9\xae\x5b\xb1\x54\
-\xf5\x99\x32\x77\x4d\x8c\x4d\xd9\x91\xe0\xbe\x86\xf6\xf6\xf9\xee\
-\x9a\xa0\x58\x10\x00\x00\xa0\x44\xb4\x4d\xaa\xd4\xb7\x56\x2c\x56\
-\x4d\x3a\xe5\xae\x89\x55\x26\x1c\x0e\x1f\x69\x6b\x5b\x38\xcb\x5d\
-\x13\x14\x03\x02\x00\x00\x94\x90\xae\xea\x6a\x5d\xb3\x7c\xb1\x2a\
-\xc2\xd0\x5d\x13\xa3\x8a\x61\x3b\xf4\x64\x43\xc3\xc2\xe9\xee\x9a\
-\x20\x69\x04\x00\x00\x28\x31\x8b\xea\xea\x74\xe5\xd2\x85\xca\x04\
-\xee\x0e\xe1\x46\xb6\x3a\x2c\x1b\x7a\x36\x97\xcb\x39\x7e\x0f\x11\
-\x49\x21\x00\x00\x40\x09\x3a\x6a\x6a\xbd\xbe\xbc\x78\xbe\x52\x81\
-\x71\xd8\xc5\xd6\x0f\x0c\x05\xab\xa4\xe3\xdc\x3d\x7d\x88\xc4\x10\
-\x00\x00\xa0\x44\x9d\xd8\x30\x5d\x9f\x9b\x3f\x57\x81\x71\x17\x02\
-\xac\x51\x53\x53\xb6\xfb\x19\x49\x0e\x1f\x3c\x40\x12\x08\x00\x00\
-\x50\xc2\x4e\x6d\x6e\xd4\x05\x87\x75\xba\x6e\xd3\xde\xd4\xda\xf9\
-\xb8\xeb\x26\x18\x5f\x04\x00\x00\x28\x71\xef\x69\x6b\xd5\x47\x3b\
-\x66\xbb\x6d\x62\xb4\xb0\xb1\xb5\xe3\x97\x6e\x9b\x60\x3c\x11\x00\
-\x00\x60\x02\x38\x2f\x37\x5b\x1f\x98\x35\xd3\x69\x0f\x63\xcc\xb1\
-\x4d\x6d\x1d\x77\x38\x6d\x82\x71\x43\x00\x00\x80\x09\xe2\xef\xe7\
-\xe4\x74\x66\x6b\xb3\xdb\x26\xd6\xbc\xb5\x31\xdb\x79\x93\xdb\x26\
-\x18\x0f\x04\x00\x00\x98\x20\x8c\xa4\x0b\xe7\xcd\xd1\x5b\x9a\x66\
-\xb8\xee\x73\x76\x53\xb6\xf3\x2a\xa7\x4d\xe0\x1c\x01\x00\x00\x26\
-\x90\xc0\x18\x7d\x71\xe1\x3c\x1d\x33\x6d\xaa\xd3\x3e\x56\x3a\xbf\
-\x25\xdb\x79\xb1\xd3\x26\x70\x8a\x00\x00\x00\x13\x4c\xca\x18\x5d\
-\xb1\x64\x81\x96\x4f\x99\xec\xac\x87\x91\x14\x49\x17\x35\xcf\xec\
-\xfa\x3b\x67\x4d\xe0\x14\x01\x00\x00\x26\xa0\xb2\x30\xd4\xd5\xcb\
-\x16\x69\x7e\xad\xdb\x85\xfc\x6c\x64\xaf\x98\x91\xed\x7c\xbf\xd3\
-\x26\x70\x82\x00\x00\x00\x13\x54\x55\x2a\xa5\x6f\x2c\x5f\xa2\x5c\
-\x55\x95\xcb\x36\x26\x90\xae\x6f\x68\xcd\x9d\xee\xb2\x09\xe2\x47\
-\x00\x00\x80\x09\xac\x2e\x93\xd6\x77\x8e\x58\xaa\x99\x93\x2a\x5d\
-\xb6\x31\xa1\x82\x1f\x36\xce\xec\x3a\xd9\x65\x13\xc4\x8b\x00\x00\
-\x00\x13\xdc\x94\x4c\x46\xd7\xae\x58\xaa\xc6\x72\x87\x4b\xfa\x1b\
-\x05\xa6\xa0\xdb\x9b\x73\xb9\x23\xdd\x35\x41\x9c\x08\x00\x00\xe0\
-\x81\xc6\xf2\x72\x5d\xb7\x62\xa9\xea\x33\x65\xee\x9a\x18\x9b\xb2\
-\x23\xc1\x7d\x0d\xed\xed\xf3\xdd\x35\x41\x5c\x08\x00\x00\xe0\x89\
-\xb6\x49\x95\xfa\xd6\x8a\xc5\xaa\x49\x3b\xdc\xd7\xc7\x2a\x13\x0e\
-\x87\x8f\xb4\xb5\x2d\x9c\xe5\xae\x09\xe2\x40\x00\x00\x00\x8f\x74\
-\x55\x57\xeb\x9a\xe5\x8b\x55\x11\x86\xee\x9a\x18\x55\x0c\xdb\xa1\
-\x27\x1b\x1a\x16\x4e\x77\xd7\x04\x63\x45\x00\x00\x00\xcf\x2c\xaa\
-\xab\xd3\x95\x4b\x17\x2a\x13\xb8\x3b\x05\x18\xd9\xea\xb0\x6c\xe8\
-\xd9\x5c\x2e\xe7\xf6\x3d\x44\x8c\x1a\x01\x00\x00\x3c\x74\xd4\xd4\
-\x7a\x7d\x79\xf1\x7c\xa5\x02\xe3\xb0\x8b\xad\x1f\x18\x0a\x56\x49\
-\xc7\x39\x7c\xfa\x10\xa3\x45\x00\x00\x00\x4f\x9d\xd8\x30\x5d\x9f\
-\x9b\x3f\x57\x81\x71\x17\x02\xac\x51\x53\x53\xb6\xfb\x19\x49\x0e\
-\x1f\x3c\xc0\x68\x10\x00\x00\xc0\x63\xa7\x36\x37\xea\x82\xc3\x3a\
-\x5d\xb7\x69\x6f\x6a\xed\x7c\xdc\x75\x13\x1c\x1a\x02\x00\x00\x78\
-\xee\x3d\x6d\xad\xfa\x68\xc7\x6c\xb7\x4d\x8c\x16\x36\xb6\x76\xfc\
-\xd2\x6d\x13\x1c\x0a\x02\x00\x00\x40\xe7\xe5\x66\xeb\x03\xb3\x66\
-\x3a\xed\x61\x8c\x39\xb6\xa9\xad\xe3\x0e\xa7\x4d\x70\xd0\x08\x00\
-\x00\x00\x49\xd2\xdf\xcf\xc9\xe9\xcc\xd6\x66\xb7\x4d\xac\x79\x6b\
-\x63\xb6\xf3\x26\xb7\x4d\x70\x30\x08\x00\x00\x00\x49\xfb\xb6\xf8\
-\xbd\x70\xde\x1c\xbd\xa5\x69\x86\xeb\x3e\x67\x37\x65\x3b\xaf\x72\
-\xda\x04\x07\x44\x00\x00\x00\xfc\x51\x60\x8c\xbe\xb8\x70\x9e\x8e\
-\x99\x36\xd5\x69\x1f\x2b\x9d\xdf\x92\xed\xbc\xd8\x69\x13\xec\x17\
-\x01\x00\x00\xf0\x27\x52\xc6\xe8\x8a\x25\x0b\xb4\x7c\xca\x64\x67\
-\x3d\x8c\xa4\x48\xba\xa8\x79\x66\xd7\xdf\x39\x6b\x82\xfd\x22\x00\
-\x00\x00\xfe\x87\xb2\x30\xd4\xd5\xcb\x16\x69\x7e\xad\xdb\x85\xfc\
-\x6c\x64\xaf\x98\x91\xed\x7c\xbf\xd3\x26\x78\x4d\x04\x00\x00\xc0\
-\x6b\xaa\x4a\xa5\x74\xed\x8a\x25\x9a\x53\x5d\xed\xb2\x8d\x09\xa4\
-\xeb\x9b\x66\x76\xbe\xcb\x65\x13\xfc\x4f\x04\x00\x00\xc0\xeb\xaa\
-\x4e\xa5\xf5\xad\x15\x4b\x34\x73\x52\xa5\xcb\x36\x46\x05\x7d\xaf\
-\x71\x66\xd7\xc9\x2e\x9b\xe0\x4f\x11\x00\x00\x00\xfb\x35\x25\x93\
-\xd1\xb5\x2b\x96\xaa\xb1\xdc\xe1\x92\xfe\x46\x81\x29\xe8\xf6\xe6\
-\x5c\xee\x48\x77\x4d\xf0\x4a\x04\x00\x00\xc0\x01\x35\x96\x97\xeb\
-\xba\x15\x4b\x55\x9f\x29\x73\xd7\xc4\xd8\x94\x1d\x09\xee\x6b\x68\
-\x6f\x9f\xef\xae\x09\xfe\x80\x00\x00\x00\x38\x28\x6d\x93\x2a\xf5\
-\xad\x15\x8b\x55\x93\x76\xb8\xaf\x8f\x55\x26\x1c\x0e\x1f\x69\x6b\
-\x5b\x38\xcb\x5d\x13\x48\x04\x00\x00\xc0\x21\xe8\xaa\xae\xd6\x35\
-\xcb\x17\xab\x22\x0c\xdd\x35\x31\xaa\x18\xb6\x43\x4f\x36\x34\x2c\
-\x9c\xee\xae\x09\x08\x00\x00\x80\x43\xb2\xa8\xae\x4e\x57\x2d\x5b\
-\xa4\x4c\xe0\xee\x14\x62\x64\xab\xc3\xb2\xc1\x55\xb9\x5c\xce\xed\
-\x7b\x88\x1e\x23\x00\x00\x28\x3a\x71\x1d\x98\x22\x6b\x63\xaa\x84\
-\x57\x3b\xb2\x7e\x8a\x2e\x5d\x34\x5f\xa1\x31\x2e\xdb\x4c\xe9\x1f\
-\x0e\x56\x49\x39\x87\x0f\x1e\xf8\x8b\x00\x00\xa0\xe8\x54\xc4\x54\
-\xa7\xbf\x50\x88\xa9\x12\x5e\xcb\x9b\x66\x4c\xd7\x3f\x2f\x98\xab\
-\xc0\x6d\x08\x68\x6a\xca\x06\x2b\x25\x39\x7c\xf0\xc0\x4f\x04\x00\
-\x00\x45\xa7\x42\xf1\x9c\x50\xf6\xe6\xf3\xb1\xd4\xc1\xeb\x3b\xb5\
-\xb9\x51\x9f\x9a\xd3\xe9\xba\x4d\x7b\x73\x6b\xe7\x63\xae\x9b\xf8\
-\x86\x00\x00\xa0\xe8\x4c\x8a\xa9\xce\xe6\xfe\x81\x98\x2a\x61\x7f\
-\xce\x9e\xd9\xaa\xbf\xe9\x68\x77\xda\xc3\x1a\x2d\x6a\x6c\xed\xb8\
-\xcf\x69\x13\xcf\x10\x00\x00\x14\x9d\xaa\x98\xae\x28\xf7\xe5\xf3\
-\x7a\x79\x68\x38\x9e\x62\xd8\xaf\xbf\xce\xcd\xd2\xfb\x67\xb6\x39\
-\xed\x61\x8c\x39\xa6\x39\xdb\x71\xbb\xd3\x26\x1e\x21\x00\x00\x28\
-\x3a\xd9\x18\x6f\x29\xff\xf7\xae\xdd\xf1\x15\xc3\x7e\x7d\xf2\xb0\
-\x0e\x9d\xd9\xda\xec\xb4\x87\x95\x79\x5b\x63\xb6\xf3\x26\xa7\x4d\
-\x3c\x41\x00\x00\x50\x74\x66\x18\xa3\x74\x4c\xb5\x7e\xb3\x63\x67\
-\x4c\x95\x70\x20\x46\xd2\x3f\xcd\x9b\xa3\x93\x1b\x1b\x5c\xf7\x39\
-\xbb\x29\xdb\x75\xa5\xd3\x26\x1e\x20\x00\x00\x28\x3a\xa1\xa4\x6c\
-\x4c\x4f\x96\xff\xdf\x97\x7e\xa7\x3c\xaf\x03\x8e\x9b\xd0\x18\x7d\
-\x69\xd1\x7c\x1d\x3b\x7d\x9a\xd3\x3e\x56\xf6\x63\x2d\xd9\xce\x4b\
-\x9c\x36\x99\xe0\x08\x00\x00\x8a\xd2\xec\x98\x8e\x4e\x3b\x87\x87\
-\xf5\xe0\xf6\x97\xe3\x29\x86\x83\x92\x32\x46\xff\xb2\x78\xbe\x96\
-\x4f\x99\xec\xac\x87\x91\x14\x49\x9f\x6d\x9e\xd9\xf5\x77\xce\x9a\
-\x4c\x70\x04\x00\x00\x45\x69\x99\x89\xef\xf0\x74\xc3\xfa\x4d\xb1\
-\xd5\xc2\xc1\x29\x0b\x43\x7d\x6d\xf9\x62\xcd\xaf\x75\xbb\x90\x9f\
-\x2d\xd8\x2b\x66\x64\x3b\xdf\xef\xb4\xc9\x04\x45\x00\x00\x50\x94\
-\x96\x07\xf1\x3d\x09\xf8\xd8\xce\x5d\x7a\x6c\xe7\xae\xd8\xea\xe1\
-\xe0\x4c\x0a\x43\x7d\x63\xf9\x12\x75\x54\xc7\xf5\x62\xe7\x6b\x30\
-\x32\x81\x74\xfd\x8c\x6c\xd7\x19\xee\x9a\x4c\x4c\x04\x00\x00\x45\
-\xa9\xcd\x48\xd3\x62\x7c\x1b\xe0\x8b\xcf\xae\xe6\x59\x80\x04\xd4\
-\x65\xd2\xfa\xf6\x8a\x65\x9a\x39\xa9\xd2\x65\x1b\x13\x58\xfb\x1f\
-\x8d\x33\xbb\x4e\x76\xd9\x64\xa2\x21\x00\x00\x28\x5a\x6f\x8c\x71\
-\xb3\x99\xb5\xbd\x7d\xba\x61\xdd\xc6\xd8\xea\xe1\xe0\x4d\xc9\x64\
-\xf4\x8d\xc3\x97\x68\x7a\xb9\xc3\x25\xfd\x8d\x02\x53\xb0\xb7\xb7\
-\xcc\xec\x38\xc2\x5d\x93\x89\x85\x00\x00\xa0\x68\xbd\x35\xc6\xdb\
-\x00\x92\xf4\xf5\xe7\x5f\x60\x5d\x80\x84\xb4\x54\x54\xe8\xba\xc3\
-\x97\x6a\x4a\x26\xe3\xae\x89\x51\xca\x46\xe6\xfe\x19\xd9\xdc\x5c\
-\x77\x4d\x26\x0e\x02\x00\x80\xa2\xb5\x28\x30\xca\xc6\x78\x94\xca\
-\x47\x56\x1f\x7f\xe2\x49\x6d\xd8\xdb\x1f\x5f\x51\x1c\xb4\xd9\x55\
-\x93\x74\xed\x8a\x25\xaa\x49\xbb\xdb\xd7\xc7\x4a\x99\xc0\x06\x8f\
-\xb5\xb5\x2d\x9c\xe5\xac\xc9\x04\x41\x00\x00\x50\xd4\xde\x12\xf3\
-\x9e\xf3\xbb\x86\x47\xf4\xd1\xc7\xfe\x5b\x2f\x0e\x0c\xc6\x5a\x17\
-\x07\xa7\xab\xba\x5a\x57\x2f\x5b\xac\xf2\x30\x74\xd7\xc4\xa8\x62\
-\xc4\x0e\x3e\xd9\xd0\xd0\x3e\xdd\x5d\x93\xd2\x47\x00\x00\x50\xd4\
-\xde\x19\x1a\x95\xc7\xb4\x3b\xe0\x1f\x6c\xee\x1f\xd0\x39\x0f\x3d\
-\xaa\xb5\xbd\x7d\xb1\xd6\xc5\xc1\x59\x3a\xb9\x4e\x5f\x5d\xb2\x50\
-\x69\xb7\xdb\x08\x57\x87\x65\xe1\xb3\x5d\x5d\x5d\xd5\x2e\x9b\x94\
-\x32\x02\x00\x80\xa2\x36\x45\x46\xef\x70\xf0\x65\x71\xfb\xd0\x90\
-\xde\xf3\xd0\xa3\xba\x79\xc3\xe6\xf8\x8b\xe3\x80\xde\x30\xad\x5e\
-\x97\x2f\x59\xa8\x54\xcc\xcf\x79\xbc\x4a\x7d\xdf\xa0\x5d\x2d\x1d\
-\x57\xee\xb2\x49\xa9\x22\x00\x00\x28\x7a\xe7\x84\x61\x6c\x7b\x03\
-\xbc\xd2\x50\xa1\xa0\xcb\x56\xad\xd6\xc7\x9e\x78\x52\xdd\xdc\x12\
-\x18\x77\x27\x34\x4c\xd3\xc5\xf3\x0e\x8b\xf9\xfa\xce\x9f\xb2\x56\
-\x8d\x4d\xd9\xee\x67\xb4\x6f\x85\x69\xbc\x82\x97\x3f\x90\xea\xda\
-\xfa\x0f\x4a\xca\x8e\xb5\xce\xd1\x81\xd1\x7c\xb7\xe9\x15\x80\xa4\
-\x49\x46\xea\x91\xd5\xd3\x8e\x5e\xe3\xdf\xb0\xb7\x5f\xb7\x6e\x7e\
-\x51\xbb\x47\x46\xd4\x59\x55\xa5\x49\x29\x77\x0f\xa9\xe1\x4f\xcd\
-\xa9\xa9\x56\x4d\x26\xa5\x07\xb6\xef\x70\xd9\x66\x4a\x75\x4d\xfd\
-\xe9\xbd\x3d\x3b\xbe\xe9\xb2\x49\xa9\x21\x00\x8c\x01\x01\x00\x18\
-\x3f\x0b\x82\x40\x77\x46\x91\x5c\x3d\xbf\x9f\xb7\x56\x4f\xed\xde\
-\xa3\xef\x6d\xdc\xac\x95\x3d\xbd\x4a\x99\x40\xd3\xcb\x33\x2a\x0b\
-\xbc\x3c\x4c\x8e\xab\x85\x75\xb5\x0a\x03\xa3\x47\x76\x38\x5c\xad\
-\xd1\x68\x46\x55\xcd\x94\x13\xfa\x7a\x76\xde\xe0\xae\x49\x69\x21\
-\xe6\x02\x28\x09\x55\x92\xfe\x3e\x0c\xf5\x4f\xf9\x82\xd3\x3e\x23\
-\xd6\xea\xde\x6d\xdb\x75\xef\xb6\xed\x0a\x8d\x51\x67\x75\xb5\x3a\
-\x6b\xaa\x34\x73\x52\xa5\x6a\xd3\x69\xd5\xa6\x5d\xdc\x8c\xc0\xac\
-\x49\x93\x74\x58\x4d\x8d\x56\xf5\xf4\x38\xeb\x61\x8c\x39\xa6\xb9\
-\xad\xe3\xf6\x17\x37\xae\x3d\xd5\x59\x93\x12\x42\x00\x00\x50\x32\
-\xde\x1c\x1a\xdd\x15\x19\x3d\x18\x8d\xcf\x92\xbe\x05\x6b\xb5\xaa\
-\xa7\xc7\xe9\x49\x09\xe3\xcb\x5a\xf3\xb6\xc6\x6c\xe7\x4d\x5b\x37\
-\xad\x39\x27\xe9\x59\x92\xc6\x43\x80\x00\x4a\xca\x45\xa9\x30\xd6\
-\x3d\x02\xe0\x1f\x23\x9d\xdd\x94\xed\xbc\x2a\xe9\x39\x92\x46\x00\
-\x00\x50\x52\x26\x1b\xe9\x9f\x53\xa1\x9f\x0f\x30\x21\x36\x56\x3a\
-\xbf\xb1\xb5\xf3\x33\x49\xcf\x91\x24\x02\x00\x80\x92\xb3\x2c\x30\
-\x3a\x2f\xc5\xe1\x0b\xa3\x67\x24\x19\xa3\xcf\x37\x65\x3b\xdf\x98\
-\xf4\x2c\x49\xe1\x2f\x08\x40\x49\x7a\x7f\x18\xe8\x2f\x42\x0e\x61\
-\x18\x13\x23\xab\xef\x27\x3d\x44\x52\xf8\xeb\x01\x50\xb2\x3e\x99\
-\x0a\xf4\xa6\x90\x07\x02\x30\x06\x46\x2d\xcd\xcd\xed\xc7\x27\x3d\
-\x46\x12\x08\x00\x00\x4a\x56\x20\xe9\x73\xa9\x50\xc7\x11\x02\x30\
-\x06\x36\x0c\x3f\x9e\xf4\x0c\x49\x20\x00\x00\x28\x69\x29\x49\x97\
-\xa6\x42\xbd\x83\xdb\x01\x18\x2d\xa3\xc5\x49\x8f\x90\x04\xfe\x62\
-\x00\x94\xbc\x50\xd2\x67\x52\x81\x3e\x48\x08\xc0\x68\x58\x79\xb9\
-\x63\x20\x7f\x2d\x00\x26\x8c\xf3\x52\x81\x2e\x4b\x07\xaa\x72\xba\
-\xbd\x0c\x26\x20\x2f\x7f\x61\x08\x00\x00\x26\x94\x13\x82\x40\xdf\
-\x2f\x0b\xb4\xc0\xed\x5e\xf3\x98\x40\x8c\x34\x90\xf4\x0c\x49\x20\
-\x00\x00\x98\x70\x66\xc8\xe8\xda\x4c\xa8\xf3\xc2\x40\xe5\x7e\x7e\
-\xb9\xc3\x21\xb0\xd2\x9e\xa4\x67\x48\x02\x01\x00\xc0\x84\x94\x92\
-\xf4\xc1\x54\xa0\xff\xc8\x84\x3a\x86\x5d\x3b\xb1\x7f\x0e\xb7\x21\
-\x2c\x5e\x04\x00\x00\x13\x5a\x93\x91\xfe\x25\x1d\xea\x9b\x99\x50\
-\xcb\x09\x02\x78\x95\xdf\x6f\x2b\x15\x25\x3b\x45\x32\xd8\x0d\x10\
-\x80\x17\x96\x19\xa3\x65\xe9\x50\x4f\x5b\xab\x1b\xf2\x91\x1e\x8c\
-\xac\xdc\x6e\x2c\x8c\x52\xe0\x73\x24\x24\x00\x00\xf0\xca\x02\x63\
-\xf4\x2f\xe9\x50\x3b\xac\xf4\xb3\x42\xa4\xdb\xad\xd5\xf3\xe3\xb4\
-\xbd\x30\x50\x4c\x08\x00\x00\xbc\x54\x6f\xa4\xb3\x52\x81\xce\x92\
-\xb4\x29\x92\x1e\xb3\x91\x1e\x89\xac\x1e\xb7\x56\xbb\xc9\x03\xf0\
-\x00\x01\x00\x80\xf7\xb2\x81\x94\x55\xa0\x77\x86\xfb\xee\x09\x77\
-\x5b\x69\xa3\xb5\xda\x68\xa5\x8d\x36\xd2\x6e\x6b\xd4\x2b\xab\x3e\
-\x49\x83\x56\x1a\x4e\x7a\x60\x48\x92\xfa\x44\x58\x1b\x0b\x02\x00\
-\x00\xbc\x82\x91\xd4\x6c\xa4\x66\x63\x74\xb4\xa4\x7d\xeb\x0c\xa2\
-\x18\xfd\x47\x21\xd2\xe5\x79\x2f\x9f\xdf\x8b\x05\x6f\x01\x00\x00\
-\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\
-\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\
-\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\
-\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\
-\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\
-\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\
-\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\
-\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\
-\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\
-\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\
-\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\
-\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\
-\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\
-\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\
-\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\
-\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\
-\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\
-\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\
-\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\
-\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\
-\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\
-\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\
-\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\
-\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\
-\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\
-\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\
-\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\
-\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\
-\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\
-\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\
-\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\
-\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\
-\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\
-\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\
-\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\
-\x00\xe0\x21\x02\x00\x00\x00\x1e\x22\x00\x00\x00\xe0\x21\x02\x00\
-\x00\x00\x1e\x22\x00\x00\x00\xe0\xa1\x54\xd2\x03\xa0\xf4\x65\x96\
-\x2d\x55\x2a\xd7\x9e\xf4\x18\xff\x8f\xb5\xb2\xbd\xbd\xb2\x03\x83\
-\xb2\x83\x03\x8a\xfa\xf6\xca\xf6\xf5\xa9\xf0\x62\xb7\xec\xc8\x48\
-\xd2\xd3\xed\x57\xf9\x71\xc7\x2a\x68\x98\x3e\xee\x7d\x6d\xdf\x5e\
-\x29\x2a\xc8\x0e\x0c\xaa\xb0\x63\x87\xa2\x97\x5f\x56\xb4\x63\xa7\
-\xec\xf0\xf0\xb8\xcf\x12\x87\xd4\xec\x59\xca\x2c\x5b\x9a\xf4\x18\
-\xe3\x6a\xe0\xce\x9f\xc8\xf6\xf7\x27\x3d\x06\x4a\x08\x01\x00\x63\
-\x56\x71\xea\x5b\x35\xe9\xac\x77\x27\x3d\xc6\x81\x15\x0a\xca\x6f\
-\x79\x51\xf9\x0d\x1b\x94\x5f\xb7\x5e\xf9\x35\x6b\x35\xf4\xeb\x87\
-\x54\xd8\xfa\x52\xd2\x93\xfd\xd1\xa4\x73\xcf\x51\xd9\xd1\x47\x25\
-\x3d\xc6\x3e\x85\x82\x0a\xdd\x5b\x95\x5f\xbf\x41\x23\xcf\xad\xd6\
-\xf0\x6f\x9f\xd4\xc8\x93\x4f\xa9\xb0\x7d\x7b\xd2\x93\x1d\x50\xd9\
-\x91\x47\xa8\xf6\xe2\xff\x9d\xf4\x18\xe3\x6a\xe8\xa1\xdf\xa8\x40\
-\x00\xc0\x21\x20\x00\xc0\x1f\x61\xa8\x54\x5b\x56\xa9\xb6\xac\x74\
-\xec\x31\x7f\xfc\xc7\xf9\xf5\xeb\x35\xf4\xeb\x87\x35\xf4\xc0\x83\
-\x1a\xfa\xd5\x83\x25\xfb\xad\x37\x76\x61\xa8\xb0\xb5\x45\x61\x6b\
-\x8b\xca\x8e\x79\xe3\x1f\xff\x71\x7e\xed\xf3\x1a\xbc\xff\x57\x1a\
-\xbc\xf7\x3e\x0d\x3f\xf6\xb8\x14\x45\x09\x0e\x09\x60\xb4\x08\x00\
-\xf0\x5e\x6a\xd6\x2c\xa5\x66\xcd\xd2\xa4\xf7\xbe\x47\x51\x4f\xaf\
-\x06\x7f\xf2\x53\xf5\x7d\xf7\x26\xe5\x9f\x7f\x21\xe9\xd1\x8a\x52\
-\xaa\x23\xa7\xaa\x8e\x9c\xaa\x3e\xf4\x01\x15\xb6\xbe\xa4\x81\xdb\
-\xef\x54\xff\x7f\xde\xaa\xfc\xc6\x4d\x49\x8f\x06\xe0\x10\xf0\x10\
-\x20\xf0\x0a\x41\x4d\xb5\x2a\xdf\x75\xa6\xa6\xdf\xf9\x23\xd5\x5f\
-\x7f\x9d\x77\xf7\x91\x0f\x55\xd8\x38\x43\x55\x1f\xfe\x90\xa6\xff\
-\xec\x4e\x4d\xf9\xc6\xd7\x94\x39\x7c\x79\xd2\x23\x01\x38\x48\x04\
-\x00\xe0\xb5\x18\xa3\xb2\x37\x1c\xad\xa9\xdf\xbf\x49\x53\xbe\x75\
-\xcd\xbe\xdb\x06\x78\x7d\x41\xa0\xf2\x13\x8f\xd7\xd4\x5b\xbe\xab\
-\xa9\xff\x7e\xb3\x32\xcb\x97\x25\x3d\x11\x80\x03\x20\x00\x00\x07\
-\x50\x7e\xfc\xb1\x9a\x76\xd7\x8f\x55\xf3\xe9\xff\x25\x53\x5e\x9e\
-\xf4\x38\x45\x2f\xb3\x74\x89\xa6\xde\xf2\x5d\x4d\xfe\xca\xa5\x0a\
-\xa6\xd6\x27\x3d\x0e\x80\xd7\x41\x00\x00\x0e\x82\x49\xa7\x55\xf5\
-\xa1\x0f\x68\xda\x6d\xff\xa9\xf4\x61\x73\x92\x1e\xa7\xf8\x19\xa3\
-\x8a\xd3\x4f\xd5\xf4\x9f\xde\xa9\xca\x33\xff\x3c\xe9\x69\x00\xbc\
-\x06\x02\x00\x70\x08\x52\xed\xb3\x35\xf5\x07\xdf\x53\xc5\xdb\x4f\
-\x4b\x7a\x94\x92\x10\xd4\x54\xab\xee\x0b\x9f\xd3\x94\xaf\x5f\xa9\
-\xa0\xae\x2e\xe9\x71\x00\xbc\x02\x01\x00\x38\x44\xa6\xac\x4c\x93\
-\x2f\xfb\xa2\xaa\x3e\x78\x6e\xd2\xa3\x94\x8c\xf2\x37\x9d\xb4\xef\
-\xea\xc9\x9c\xae\xa4\x47\x01\xf0\x7b\x04\x00\x60\x34\x8c\x51\xcd\
-\x05\x9f\x52\xf5\x79\x1f\x49\x7a\x92\x92\x11\x36\x37\x69\xea\xbf\
-\xdf\xac\xf2\x93\x4e\x4c\x7a\x14\x00\x22\x00\x00\x63\x52\xfd\xf7\
-\x1f\xd3\xa4\xf7\x9d\x9d\xf4\x18\x25\xc3\x54\x56\x6a\xca\xd5\xff\
-\xaa\xca\x33\xde\x99\xf4\x28\x80\xf7\x08\x00\xc0\x18\xd5\x7e\xe6\
-\xd3\x2a\xfb\xb3\x37\x24\x3d\x46\xe9\x08\x43\xd5\x7d\xfe\x12\x55\
-\xbe\xeb\xcc\xa4\x27\x01\xbc\x46\x00\x00\xc6\x2a\x08\x34\xf9\xf2\
-\xcb\x14\xce\x68\x48\x7a\x92\xd2\x11\x04\xaa\xbb\xe4\xb3\xaa\x38\
-\xe5\xe4\xa4\x27\x01\xbc\x45\x00\x00\x62\x10\x4c\x9e\xac\xba\x4b\
-\xbf\x20\x19\x93\xf4\x28\xa5\x23\x08\x54\xf7\xe5\x2f\x29\xb3\xe2\
-\xf0\xa4\x27\x01\xbc\x44\x00\x00\x62\x52\x76\xf4\x51\xaa\x38\xfd\
-\xd4\xa4\xc7\x28\x29\x26\x93\xd1\x94\xaf\x7d\x55\x61\x73\x73\xd2\
-\xa3\x00\xde\x21\x00\x00\x31\xaa\xf9\xf8\xf9\x32\x99\x4c\xd2\x63\
-\x94\x94\xa0\xae\x4e\x93\xaf\xfc\x17\x99\x74\x3a\xe9\x51\x00\xaf\
-\xb0\x1b\x20\x8a\xd6\xde\xef\xfd\xbb\x0a\xdd\xdd\xa3\xfa\x77\x83\
-\xea\x6a\x05\xd3\xa7\x2b\x9c\xd1\xa0\xcc\x92\xc5\xe3\xb6\x84\x6f\
-\xd8\xdc\xa4\xca\x33\xff\x5c\x7b\x6f\xf9\xfe\xb8\xf4\x3b\x58\xbd\
-\x5f\xff\xa6\xec\xc0\xeb\xef\x15\x6f\xca\xca\x65\x2a\x2b\x14\x36\
-\x36\xee\xdb\x32\xb9\x23\x37\xae\x41\x26\xb3\x70\x81\xaa\xfe\xf6\
-\x3c\xf5\xfe\xeb\x55\xe3\xd6\x73\x34\x06\x7f\x7e\xb7\x86\x7f\xfb\
-\x64\xd2\x63\xbc\x26\xbb\x67\x4f\xd2\x23\xa0\xc4\x10\x00\x50\xb4\
-\x06\x7e\x7c\xbb\x86\x9f\xf8\xed\x98\xeb\x98\x8a\x72\x95\x1d\x79\
-\x84\x2a\xdf\xf3\x2e\x95\x1f\x77\x6c\x0c\x93\xed\x5f\xd5\x47\x3f\
-\xa2\xfe\x1f\xde\x26\x3b\x30\xe8\xbc\xd7\xc1\xda\x7b\xd3\x2d\x8a\
-\x76\xee\x3c\xe8\xff\xbf\x29\x2f\x57\x66\xc9\x62\x95\xbf\xf9\x24\
-\x55\xbc\xed\xad\x0a\x6a\x6b\x1c\x4e\xb7\x4f\xf5\x87\xff\x52\x43\
-\xbf\xb8\x57\xc3\x4f\x3d\xed\xbc\xd7\x68\x0d\x3d\xf8\x6b\xed\xfd\
-\xfe\x7f\x24\x3d\x06\x10\x0b\x6e\x01\x60\xc2\xb3\x03\x83\x1a\xbc\
-\xf7\x3e\xed\xfc\xf0\x47\xb5\xe3\x7d\x1f\x50\xfe\x85\x75\x4e\xfb\
-\x85\xd3\xa6\xa9\xe2\x2d\xa5\xfd\x74\xbb\x1d\x1c\xd4\xd0\x43\x0f\
-\x6b\xcf\x25\x9f\xd7\xb6\x37\x1e\xa7\x3d\x5f\xbc\xec\x90\x02\xc4\
-\xa8\x84\xa1\x6a\x3f\x7f\x89\x14\x86\x6e\xfb\x00\x90\x44\x00\x80\
-\x67\x86\x1e\x7e\x44\x2f\xbf\xeb\x2c\x0d\x3f\xf2\xa8\xd3\x3e\x15\
-\x6f\x7b\xab\xd3\xfa\xe3\xc9\x0e\x0d\x69\xef\x0d\x37\xea\x77\x6f\
-\x3e\x45\x03\x77\xdc\xe5\xb4\x57\x7a\x4e\x97\x26\xb1\x3e\x00\x30\
-\x2e\x08\x00\xf0\x4e\xd4\xd3\xab\x1d\x1f\xfc\xb0\x86\x1f\x7b\xdc\
-\x59\x8f\xb2\xa3\x8e\x50\x30\x6d\xaa\xb3\xfa\x49\x88\x7a\x7a\xb5\
-\xeb\x13\x9f\xd2\x9e\x4b\x3e\x2f\x15\x0a\xce\xfa\x54\xff\xdd\xf9\
-\x0a\xaa\xab\x9d\xd5\x07\xb0\x0f\x01\x00\x5e\xb2\xc3\xc3\xda\xf5\
-\xbf\x3e\xad\x68\x4f\x8f\x9b\x06\x61\x58\xf2\xb7\x01\x5e\xcf\xde\
-\x5b\xbe\xaf\x5d\x9f\xfc\xb4\x14\x45\x4e\xea\x07\x75\x75\x9a\xf4\
-\xbe\xf7\x3a\xa9\x0d\xe0\xff\x21\x00\xc0\x5b\x85\xee\xad\xea\xb9\
-\xf4\xcb\xce\xea\x97\x1d\x79\x84\xb3\xda\x49\x1b\xb8\xeb\x27\xea\
-\xb9\xec\x72\x67\xf5\x27\x9d\xfb\x7e\xae\x02\x00\x8e\x11\x00\xe0\
-\xb5\x81\x1f\xdd\xae\x42\xf7\x56\x27\xb5\xd3\xf3\xe7\x39\xa9\x5b\
-\x2c\xfa\xae\xff\xae\x06\x7e\xf2\x33\x27\xb5\x83\xda\x1a\x36\x0c\
-\x02\x1c\x23\x00\xc0\x6b\x36\x9f\x77\xf6\xce\x7e\x38\xa3\x41\xc1\
-\xd4\x7a\x27\xb5\x8b\xc5\x9e\x8b\xff\x59\xd1\x0e\x37\x6f\x07\x54\
-\xbe\xf7\x3d\x52\xc0\x21\x0a\x70\x85\xbf\x2e\x78\x6f\xf0\xde\x5f\
-\x3a\xab\x9d\x9e\x3b\xd7\x59\xed\x62\x10\xed\xda\xa5\xde\xab\xbf\
-\xee\xa4\x76\x2a\xdb\xaa\xb2\x37\x1e\xed\xa4\x36\x00\x02\x00\xa0\
-\xfc\x0b\xeb\x9c\xbd\xe3\x9e\x6a\x6d\x71\x52\xb7\x98\xf4\xff\xe0\
-\x56\x15\x36\x6f\x71\x52\xbb\xf2\x34\xf6\x56\x00\x5c\x21\x00\x00\
-\xd6\x6a\xf8\xe9\x67\x9c\x94\x0e\x6a\xdc\xaf\xa0\x97\x34\x9b\xcf\
-\x6b\xef\xcd\xdf\x73\x52\xbb\xfc\x4d\x27\xca\x54\x54\x38\xa9\x0d\
-\xf8\x8e\x00\x00\x48\xce\xee\x63\x9b\x1a\x3f\x9e\x64\xef\xbf\xed\
-\x47\xb2\x43\x43\xb1\xd7\x35\x15\x15\x2a\x7b\x03\xb7\x01\x00\x17\
-\x08\x00\x80\xa4\x68\xf7\x6e\x27\x75\x03\x4f\x02\x40\xb4\x7b\xb7\
-\x86\x1e\xf8\xb5\x93\xda\x65\x7f\xf6\x06\x27\x75\x01\xdf\x11\x00\
-\x00\x49\x76\xef\x5e\x27\x75\x4d\x45\xa5\x93\xba\xc5\x68\xf0\x9e\
-\x5f\x3a\xa9\x5b\x7e\xcc\x1b\x9d\xd4\x05\x7c\x47\x00\x00\xe4\xee\
-\x5e\xfd\xfe\xb6\xe0\x9d\x68\x86\xee\xff\x95\x93\xba\x61\x73\xb3\
-\xc2\xc6\x19\x4e\x6a\x03\x3e\x23\x00\x00\xda\xb7\xfc\xac\x0b\x51\
-\x9f\x3f\x01\xa0\xb0\x6d\x9b\x0a\x5b\x5f\x72\x52\x3b\xbd\x60\xbe\
-\x93\xba\x80\xcf\x08\x00\x80\xa4\xb0\xb5\xd5\x49\x5d\x57\xb7\x16\
-\x8a\xd5\xf0\x93\x4f\x39\xa9\x9b\x59\xb0\xc0\x49\x5d\xc0\x67\x04\
-\x00\x78\xcf\x54\x56\x2a\xbd\xd0\xcd\x37\xcc\xc2\xe6\xcd\x4e\xea\
-\x16\xab\xfc\xda\xb5\x4e\xea\xa6\xda\x67\x3b\xa9\x0b\xf8\x8c\x00\
-\x00\xef\x95\x1d\x7d\xa4\x4c\x2a\xe5\xa4\x76\x7e\xe3\x26\x27\x75\
-\x8b\x55\x6f\x60\x0c\x96\x00\x00\x10\x75\x49\x44\x41\x54\x7e\xc3\
-\x46\x27\x75\x53\xb3\x67\x39\xa9\x0b\xf8\x8c\x00\x00\xef\x55\xfd\
-\xe5\x07\xdd\x14\xb6\x56\xf9\xf5\x1b\xdc\xd4\x2e\x52\x05\x47\x81\
-\x27\x6c\x6d\x91\xc2\xd0\x49\x6d\xc0\x57\x6e\xbe\xf6\x00\x25\xa2\
-\xec\x98\x3f\x53\x66\xe9\x12\x27\xb5\xf3\xeb\xd6\x2b\xda\xb5\xcb\
-\x49\xed\x62\x55\xd8\xbe\xdd\x49\x5d\x93\x4e\x2b\x98\x5c\xa7\xe8\
-\xe5\x1d\x4e\xea\x1f\xac\xca\xf7\xbe\x5b\x65\xc7\x1f\x9b\xe8\x0c\
-\x7f\x30\x74\xff\x03\xce\x56\x60\x84\x1f\x08\x00\xf0\x56\xd8\xdc\
-\xac\xc9\x97\x7d\xd1\x59\xfd\xa1\x87\x7f\xe3\xac\x76\xb1\x8a\x76\
-\xb9\x59\x50\x49\x92\xc2\x29\xf5\x89\x07\x80\x74\x67\xa7\xd2\x9d\
-\x9d\x89\xce\xf0\x07\x91\xa3\xb0\x05\x7f\x70\x0b\x00\x5e\x0a\x5b\
-\x5b\x54\xff\xed\x6f\x2a\xa8\x9f\xe2\xac\xc7\xd0\x83\x0f\x39\xab\
-\x5d\xac\xec\xe0\xa0\xec\xc0\xa0\x93\xda\xc1\x94\xc9\x4e\xea\x02\
-\xbe\x22\x00\xc0\x2f\xc6\xa8\xe2\xad\xa7\x68\xda\x7f\xdd\xea\xf4\
-\xc9\xf2\x68\xd7\x2e\x0d\xdd\x77\xbf\xb3\xfa\xc5\xcc\x0e\xb9\x09\
-\x00\xa6\xa2\xdc\x49\x5d\xc0\x57\xdc\x02\x80\x17\x82\xfa\x29\x2a\
-\x3f\xe1\x04\x55\x9d\x7b\x8e\x52\x1d\x39\xe7\xfd\x06\x6e\xbf\x53\
-\x76\x64\xc4\x79\x9f\x62\x64\x87\x87\x9d\xd4\x35\xe5\x04\x00\x20\
-\x4e\x04\x00\x14\xad\x8a\xd3\x4e\x55\x66\xf9\xb2\x51\xfd\xbb\xa6\
-\xac\x4c\x41\x4d\x8d\x82\x29\x53\x94\x5e\x30\x5f\xa9\x99\x6d\x31\
-\x4f\xb7\x1f\x85\x82\xf6\x7e\xef\xdf\xc7\xaf\x5f\xb1\x71\x14\x00\
-\x54\x56\xe6\xa6\x2e\xe0\x29\x02\x00\x8a\xd6\xa4\xb3\xde\x9d\xf4\
-\x08\xa3\xd2\xff\xa3\xdb\x95\x5f\xb7\x3e\xe9\x31\x12\x63\x0b\x91\
-\x93\xba\xc6\x18\x27\x75\x01\x5f\xf1\x0c\x00\x10\x23\x3b\x3c\xac\
-\xde\xab\xaf\x49\x7a\x0c\x00\x38\x20\x02\x00\x10\xa3\xde\xab\xbe\
-\xa6\xc2\x8b\x2f\x26\x3d\x06\x00\x1c\x10\x01\x00\x88\xc9\xf0\x6f\
-\x9f\x54\xdf\x77\x6e\x48\x7a\x8c\x89\xcb\x26\x3d\x00\x30\xb1\x10\
-\x00\x80\x18\x44\x3b\x77\x6a\xd7\x27\xff\x41\x2a\x14\x92\x1e\x25\
-\x71\xae\xf6\x55\xb0\x79\x3f\xdf\xaa\x00\x5c\x21\x00\x00\x63\x64\
-\x87\x86\xb4\xf3\xa3\xe7\xab\xb0\x79\x4b\xd2\xa3\x14\x05\x93\xc9\
-\x38\xa9\xeb\xea\xf5\x42\xc0\x57\x04\x00\x60\x0c\xec\xc8\x88\x76\
-\x7d\xe2\x1f\x34\xfc\xc4\x6f\x93\x1e\xa5\x78\x64\xd2\x6e\xea\x7a\
-\xba\xae\x02\xe0\x0a\xaf\x01\x02\xa3\x64\x07\x06\xb5\xf3\xfc\x8f\
-\x6b\xe8\xfe\x07\x92\x1e\xa5\x78\x18\x23\x33\x69\x92\x93\xd2\xd1\
-\x9e\x1e\x27\x75\x01\x5f\x11\x00\x80\x51\x88\xb6\xbf\xac\x9d\xe7\
-\x7f\x9c\x6f\xfe\xaf\x12\x54\x57\x39\x7b\x06\x20\xda\xe9\xd7\xce\
-\x8a\x80\x6b\xdc\x02\x00\x0e\xd1\xd0\xc3\x8f\x68\xfb\xdb\xcf\xe0\
-\xe4\xff\x1a\x82\xba\x3a\x67\xb5\x7d\xdb\x5a\x19\x70\x8d\x2b\x00\
-\xc0\x41\xb2\xfd\xfd\xea\xbd\xfa\x1a\xf5\x5d\xff\x5d\x29\x72\xb3\
-\xda\x5d\xa9\x0b\x1b\x67\x38\xa9\x6b\xfb\xfb\x15\xed\xd9\xe3\xa4\
-\x36\xe0\x2b\x02\x00\x70\x10\x06\xee\xbc\x4b\x3d\x97\x5e\xae\xc2\
-\xb6\x6d\x49\x8f\x52\xd4\xc2\x36\x37\x7b\x2e\xe4\x37\x6c\x74\x52\
-\xf7\x50\xf5\x5c\x76\xb9\xfa\x6f\xfb\x51\xd2\x63\x48\xda\xb7\xf5\
-\x32\x30\x16\x04\x00\xe0\xf5\x44\x91\x06\xef\xfb\x95\x7a\xbf\x76\
-\x8d\x46\x9e\x7e\x26\xe9\x69\x4a\x42\xaa\x2d\xeb\xa4\x6e\x7e\xe3\
-\x26\x27\x75\x0f\x95\xed\xef\x57\xb4\x73\x67\xd2\x63\x00\xb1\x20\
-\x00\x00\xaf\x52\xd8\xb2\x45\xfd\x3f\xbe\x43\xfd\xb7\xde\xa6\xc2\
-\x16\xde\xed\x3f\x14\xe9\x79\x73\x9d\xd4\x1d\x59\xf5\x9c\x93\xba\
-\x80\xcf\x08\x00\x40\xa1\xa0\x91\x55\xcf\x69\xe8\xe1\xdf\x68\xf0\
-\xee\x7b\x34\xfc\xdf\xbf\x95\x2c\xeb\xce\x1e\x32\x63\x94\x9e\x3f\
-\xdf\x49\xe9\x91\x95\x2b\x9d\xd4\x05\x7c\x46\x00\x80\x57\xec\xc0\
-\xa0\xf2\x9b\x36\x29\xbf\xf6\x79\x8d\xac\x5e\xa3\xfc\x9a\x35\x1a\
-\x7e\xfc\x09\x45\x3d\xbd\x49\x8f\x56\xf2\x52\x1d\x39\x05\x35\xd5\
-\xf1\x17\xb6\x56\x23\x4f\x13\x00\x80\xb8\x11\x00\x50\xb4\xfa\xae\
-\xfb\x8e\xf2\x9b\x36\x8f\xea\xdf\xb5\x43\x43\xd2\xd0\x90\xec\xf0\
-\xb0\xa2\x9e\x5e\x45\x3b\x76\xa8\xb0\xed\x77\xb2\x7b\xf7\xc6\x3c\
-\x25\xfe\xa0\xfc\xf8\x63\x9d\xd4\x1d\x79\x6e\xb5\xa2\xdd\xbb\x9d\
-\xd4\x06\x7c\x46\x00\x40\xd1\x1a\xfc\xc5\x3d\xbc\x6b\x5f\x42\xca\
-\x8f\x3f\xde\x49\xdd\xa1\x5f\x3f\xe4\xa4\x2e\xe0\x3b\x16\x02\x02\
-\x30\x66\xa9\x99\x6d\xca\x2c\x59\xe4\xa4\xf6\xd0\x7d\xbf\x72\x52\
-\x17\xf0\x1d\x01\x00\xc0\x98\x55\xfe\xc5\x19\x92\x31\xb1\xd7\x8d\
-\x76\xec\xd4\xd0\xa3\x8f\xc5\x5e\x17\x00\x01\x00\xc0\x18\x05\x35\
-\xd5\xaa\x3c\xf3\x0c\x27\xb5\x07\x7e\xfa\x33\xa9\x50\x70\x52\x1b\
-\xf0\x1d\x01\x00\xc0\x98\x54\x7d\xf8\xaf\x14\xd4\xd6\x38\xa9\x3d\
-\x50\x24\xab\xee\x01\x13\x11\x01\x00\xc0\xa8\xa5\xda\x67\x6b\xd2\
-\xfb\xcf\x76\x52\x7b\xe4\xd9\x55\x1a\x7e\xea\x69\x27\xb5\x01\x10\
-\x00\x00\x8c\x92\xc9\x64\x34\xf9\x2b\x97\xca\x94\x95\x39\xa9\xbf\
-\xf7\xa6\x5b\x9c\xd4\x05\xb0\x0f\x01\x00\xc0\xa8\xd4\x7e\xf6\x9f\
-\x94\x9e\x3f\xcf\x49\xed\xc2\xd6\x97\x34\xf0\xe3\x3b\x9c\xd4\x06\
-\xb0\x0f\xeb\x00\x00\x38\x34\xc6\xa8\xe6\x53\x9f\xd8\xf7\xe4\xbf\
-\x23\x7d\xd7\x7e\x5b\x76\x64\xc4\x59\x7d\x00\x04\x00\x00\x87\xc0\
-\x64\x32\xaa\xbd\xe8\x42\x55\x9e\xf9\xe7\xce\x7a\xe4\x37\x6d\x56\
-\xff\x7f\xfe\x1f\x67\xf5\x01\xec\x43\x00\x00\x70\x50\xd2\x9d\x9d\
-\xaa\xfb\xca\x97\x94\x3e\x6c\x8e\xd3\x3e\x3d\x97\x7e\x45\x76\x78\
-\xd8\x69\x0f\x00\x04\x00\x00\x07\x90\x9a\xd9\xa6\xaa\xbf\xfa\x90\
-\x2a\xdf\xf9\x76\x29\x0c\x9d\xf6\x1a\xfa\xd5\x83\x1a\xbc\xfb\x17\
-\x4e\x7b\x00\xd8\x87\x00\x00\xe0\x4f\x05\x81\xd2\xb9\x9c\x32\x47\
-\x1f\xa9\x8a\x37\x9d\xa8\xcc\xf2\x65\x4e\x56\xf9\x7b\x35\xdb\xd7\
-\xa7\xdd\xff\xfb\x22\xe7\x7d\x00\xec\x43\x00\x00\x3c\x50\xf7\x85\
-\xcf\xed\xf7\xb2\xba\x49\x85\x32\x93\x26\x29\x9c\x3e\x5d\x61\xb6\
-\x55\x26\x93\x19\xc7\xe9\xf6\xd9\xf3\xa5\xaf\xa8\xd0\xbd\x75\xdc\
-\xfb\x02\xbe\x22\x00\x00\x1e\x28\x3f\xd1\xcd\x4e\x7d\x71\x19\xb8\
-\xe3\x2e\xf5\xff\xe7\xad\x49\x8f\x01\x78\x85\x75\x00\x00\x24\x2a\
-\xbf\x66\xad\x76\xff\xd3\x67\x93\x1e\x03\xf0\x0e\x01\x00\x40\x62\
-\x0a\xbf\xfb\x9d\x76\x7c\xe4\x6f\x64\x07\x06\x92\x1e\x05\xf0\x0e\
-\x01\x00\x40\x22\xa2\xde\x5e\xed\xfc\xcb\xbf\x56\xe1\xc5\x17\x93\
-\x1e\x05\xf0\x12\x01\x00\xc0\xb8\x8b\x7a\x7a\xb5\xf3\x43\x1f\xd1\
-\xc8\x73\xab\x93\x1e\x05\xf0\x16\x0f\x01\x02\x18\x57\xd1\x8e\x9d\
-\xda\xf1\xc1\xbf\xd2\xc8\xaa\xe7\x92\x1e\x05\xf0\x1a\x57\x00\x00\
-\x8c\x9b\xfc\x9a\xb5\xda\x7e\xe6\x7b\x38\xf9\x03\x45\x80\x00\x00\
-\x60\x5c\x0c\xde\xfd\x0b\x6d\x7f\xf7\xd9\x2a\x6c\xd9\x92\xf4\x28\
-\x00\xc4\x2d\x00\x00\x8e\xd9\xa1\x21\xf5\x5c\xfe\xaf\xda\x7b\xe3\
-\xcd\x92\xb5\x49\x8f\x03\xe0\xf7\x08\x00\x00\x9c\x19\x7e\xfc\x09\
-\xed\xbe\xf0\x22\xe5\x5f\x58\x97\xf4\x28\x00\x5e\x85\x00\x00\x20\
-\x76\xd1\xcb\x3b\xd4\xf3\xd5\xab\xf6\x6d\xeb\xcb\xb7\x7e\xa0\x28\
-\x11\x00\x00\xc4\x26\xea\xe9\xd5\xde\xeb\x6f\x50\xdf\xf5\x37\xca\
-\xf6\xf7\x27\x3d\x0e\x80\xfd\x20\x00\x00\x18\xb3\x42\xf7\x56\xed\
-\xfd\xee\x4d\xda\xfb\x83\x5b\x65\xf7\xee\x4d\x7a\x1c\x00\x07\x81\
-\x00\x00\x60\x54\xec\xe0\xa0\x06\xef\xbe\x47\xfd\xff\xf5\x23\x0d\
-\x3d\xf8\x90\x54\x28\x24\x3d\x12\x80\x43\x40\x00\x00\x70\xd0\xf2\
-\x1b\x36\x68\xf8\x91\xc7\x34\x78\xcf\xbd\x1a\x7a\xe8\x61\xd9\x81\
-\xc1\xa4\x47\x02\x30\x4a\x04\x00\x00\x7f\xc2\x0e\x0d\x29\x7a\xf9\
-\x65\x15\xb6\x6d\x57\x7e\xd3\x46\xe5\x9f\x7f\x41\xf9\xb5\xcf\x6b\
-\xf8\xc9\xa7\x15\xed\xdc\x99\xf4\x78\x00\x62\x42\x00\xc0\x98\xf5\
-\x5e\xf9\x35\xf5\x7d\xe7\xfa\xd8\xeb\x46\xbf\xdb\x1e\x7b\xcd\x62\
-\xb7\xfb\x53\xff\x28\x95\x97\x25\xd2\xdb\xf6\xf4\xc8\x8e\xe4\x27\
-\xc4\xc3\x7b\xfd\x3f\xbe\x43\x43\x0f\x3c\x18\x7b\xdd\xc2\xce\x5d\
-\xb1\xd7\x04\x92\x42\x00\xc0\x98\x45\xbb\x76\x49\xbb\x38\x30\xc6\
-\xa1\xb0\xdd\xbf\xd0\xe3\x82\xed\xeb\x53\xbe\xaf\x2f\xe9\x31\x80\
-\xa2\xc6\x52\xc0\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\
-\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\
-\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\
-\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\
-\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\
-\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\
-\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\
-\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\
-\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\
-\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\
-\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\
-\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\
-\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\
-\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\
-\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\
-\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\
-\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\
-\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\
-\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\
-\x88\x00\x00\x00\x80\x87\x08\x00\x00\x00\x78\x88\x00\x00\x00\x80\
-\x87\x08\x00\x00\x00\x78\xc8\xd7\x00\x10\xc5\x53\xc4\xc4\x51\x06\
-\x00\x30\x0a\x31\x1e\x83\x63\x39\x27\x94\x1a\x2f\x03\x80\xb1\xda\
-\x1b\x47\x9d\x01\x6b\xe3\x28\x03\x00\x18\x85\xc1\x98\x8e\xc1\x56\
-\xea\x8b\xa5\x50\x89\xf1\x32\x00\x58\x13\xcf\x87\x3d\xc8\x05\x00\
-\x00\x48\x4c\x2c\xdf\xe4\x24\x19\xa9\x37\xa6\x52\x25\xc5\xcb\x00\
-\x20\x6b\x63\xf9\xb0\xf7\x72\x01\x00\x00\x12\xb3\x57\xb1\x1d\x84\
-\x09\x00\xbe\x30\x26\x9e\x0f\x7b\x27\xb7\x00\x00\x20\x31\x3b\x63\
-\x3a\x04\xdb\x98\xce\x09\xa5\xc6\xcb\x00\x10\xd9\x20\x96\x0f\x7b\
-\x23\xe7\x7f\x00\x48\xcc\xa6\x98\xbe\x84\x19\x4b\x00\xf0\x86\x91\
-\xdd\x1a\x47\x9d\x4d\xd6\xfa\xf9\xe8\x28\x00\x24\x2c\x92\xb4\x29\
-\xae\x2b\x00\xb2\xdd\xf1\x54\x2a\x2d\x7e\x06\x80\xc0\x3c\x17\x47\
-\x9d\x21\x49\x2f\x71\x15\x00\x00\xc6\x5d\xb7\xb5\x1a\x8e\xa9\x56\
-\x18\x84\xab\x63\x2a\x55\x52\xfc\x0c\x00\x05\x1b\xdb\x87\xfd\x94\
-\xe5\x1a\x00\x00\x8c\xb7\x27\x63\xfc\xf2\x35\xa4\x30\x96\x2f\x85\
-\xa5\xc6\xcb\x00\xb0\x65\xcb\x9a\x6e\xc5\xf4\xd4\xe7\xe3\x11\x97\
-\x00\x00\x60\xbc\xc5\x78\xec\xed\xd9\xbe\x61\xe5\x4b\x71\x15\x2b\
-\x25\x5e\x06\x00\x49\x56\x32\x6b\xe3\x28\xf4\x18\x17\x00\x00\x60\
-\xdc\x3d\x1e\xc5\x73\xf0\x35\x92\x97\x97\xff\x25\x7f\x03\x80\xac\
-\xec\x33\x71\xd4\xd9\x62\xad\x36\xf0\x3a\x20\x00\x8c\x9b\x17\xac\
-\x55\x77\x6c\x0f\x00\x6a\x65\x3c\x95\x4a\x8f\xb7\x01\xc0\x18\x73\
-\x5f\x5c\xb5\xee\xe2\x36\x00\x00\x8c\x9b\x9f\x16\xe2\x3b\xe6\x1a\
-\xe9\x97\xb1\x15\x2b\x31\xde\x06\x00\x85\x23\x77\xc7\x55\xea\xa7\
-\xf9\x88\xd7\x01\x01\x60\x1c\x44\x92\x7e\x12\xe3\x97\xae\x28\x0c\
-\x7f\x19\x5b\xb1\x12\xe3\x6d\x00\xe8\x5e\xb7\x6e\x93\x91\xd6\xc5\
-\x51\x6b\xab\x78\x18\x10\x00\xc6\xc3\xa3\x91\xd5\xb6\xf8\x6e\xbb\
-\x3e\xbf\x75\xfd\xaa\x8d\x71\x15\x2b\x35\xde\x06\x00\x49\xb2\x56\
-\xf7\xc6\x55\xeb\xa6\x02\xd7\x00\x00\xc0\xb5\x1b\x63\x3c\xd6\x5a\
-\x99\x5f\xc4\x56\xac\x04\x79\x1d\x00\x24\xc5\x76\x1b\xe0\xa1\xc8\
-\x6a\x25\x57\x01\x00\xc0\x99\x67\xac\xd5\x23\x31\x1e\x67\x03\x89\
-\x00\xe0\xab\x91\xc1\xf4\x1d\x8a\x71\x1f\xe8\xeb\xb9\x0a\x00\x00\
-\xce\x7c\x3b\x1f\xeb\x31\xb6\xd7\xe6\x7b\xef\x8c\xb3\x60\xa9\xf1\
-\x3a\x00\x6c\xdf\xbe\xb2\xcf\x4a\x3f\x8c\xab\xde\x7d\x91\xd5\xa3\
-\x5c\x05\x00\x80\xd8\xfd\x26\xb2\x7a\x30\xce\xe3\xab\x31\xb7\x76\
-\x77\x77\xf7\xc7\x57\xb0\xf4\x78\x1d\x00\x24\xc9\x48\x37\xc5\x59\
-\xef\x4b\xf9\x82\x46\xe2\x2c\x08\x00\x9e\x1b\x91\xf4\x95\x7c\x21\
-\xd6\x9a\x71\x1f\xfb\x4b\x91\xf7\x01\xa0\x7b\xd3\x9a\x7b\x24\x6d\
-\x8e\xab\xde\x66\x2b\xdd\x1c\xef\x65\x2a\x00\xf0\xda\x77\x0b\x51\
-\xbc\xdb\xaf\x5b\xb3\xe9\xc5\x8d\xab\x63\x5b\x0b\xa6\x54\x79\x1f\
-\x00\x24\x45\xc6\xc4\x9b\x04\xaf\x2d\x44\x7a\x96\x5b\x01\x00\x30\
-\x66\x4f\x5b\x1b\xf7\xbd\x7f\xd9\x40\x37\x49\x2c\xdf\x42\x00\x90\
-\x34\x6c\xd2\x57\x4b\x1a\x88\xab\x5e\x5e\xd2\xa7\x47\x22\xf5\x90\
-\x01\x00\x60\xd4\x7a\x25\x5d\x38\x52\x50\xbc\x17\xff\x35\x98\x51\
-\xf0\xf5\x78\x4b\x96\xa6\x30\xe9\x01\x8a\x41\xff\xee\xed\x7d\xd5\
-\x35\xf5\x8d\x32\x5a\x11\x57\xcd\x3e\x49\x1b\xad\xd5\x49\x61\x20\
-\x13\x57\x51\x00\xf0\x44\x41\xd2\x3f\x8e\x44\x5a\x19\xf7\x5e\x2b\
-\x56\xdf\xdc\xb2\x69\xf5\x0f\xe2\x2d\x5a\x9a\xb8\x02\xf0\x07\x85\
-\xc2\x65\x92\x86\xe3\x2c\x79\x5f\x64\x75\x59\xcc\x0f\xae\x00\x80\
-\x0f\xfe\x35\x1f\xe9\x81\x98\x76\xfc\x7b\x85\x11\x9b\x0a\x2f\x8f\
-\xbb\x68\xa9\xe2\x0a\xc0\xef\xf5\xf6\xee\xea\xa9\xae\x9b\x3a\x5b\
-\xd2\x92\x38\xeb\xae\xb2\x52\x60\xa4\xa5\x01\xd7\x01\x00\xe0\x60\
-\x5c\x9b\x8f\x62\x5d\xf1\xef\x15\xfe\x6d\xeb\xc6\xd5\x37\xbb\x28\
-\x5c\x8a\x08\x00\xaf\x50\x5b\x5d\xb7\xd2\x9a\xe0\x23\x92\x52\x71\
-\xd6\x7d\x3c\xb2\xca\x18\x69\x31\x21\x00\x00\xf6\xeb\xdf\xf2\x91\
-\xbe\xe5\xe6\xe4\x3f\x58\x90\xce\xda\xbb\x67\xc7\x2e\x17\xc5\x4b\
-\x11\x01\xe0\x15\x7a\x7a\x76\xed\xac\xaa\x99\x5a\x66\x8c\x8e\x89\
-\xbb\xf6\xa3\x91\x55\x8f\xa4\x23\x03\xc3\x33\x01\x00\xf0\x2a\x56\
-\xd2\x55\xf9\x48\xff\xe6\x6e\x45\xd5\x2f\xbc\xb4\x69\xcd\x6d\xae\
-\x8a\x97\x22\x02\xc0\xab\xd4\xd5\x54\x3c\x6c\x4d\xfa\x2c\x49\x93\
-\xe3\xae\xbd\xd2\x5a\x6d\x92\xd5\xd1\x26\x50\x9a\x14\x00\x00\x92\
-\xa4\x7e\x2b\x7d\x36\x5f\xd0\x8f\xdc\xbd\x3e\xfd\x42\x26\x18\x3e\
-\x6b\xf7\xee\xdd\x79\x57\x0d\x4a\x11\x01\xe0\x55\x7a\x7a\x7a\xf2\
-\x55\xd5\x53\x57\x1b\xa3\xb3\x5d\xd4\x7f\xc1\x4a\xf7\x46\x56\xcb\
-\x4c\xa0\x29\x84\x00\x00\x9e\x5b\x6f\xad\x3e\x3e\x52\xd0\xe3\x0e\
-\x5f\x9b\x36\xc6\xbe\x6f\xf3\xc6\x75\xab\xdc\x75\x28\x4d\x04\x80\
-\xd7\xd0\xd7\xb3\xe3\xf9\xea\xda\xfa\x25\x92\xe6\xb8\xa8\xbf\x5b\
-\xd2\x1d\x91\x55\x9d\x91\xe6\x70\x4b\x00\x80\x87\x22\x49\xb7\x15\
-\x22\xfd\xc3\x48\xa4\xed\x2e\x1b\x59\xdd\xd6\xbd\x69\xed\xe7\x5d\
-\xb6\x28\x55\x9c\x7b\x5e\x47\x43\x7b\xfb\xf4\x70\x24\xfc\xad\xa4\
-\x46\x97\x7d\xe6\x06\x46\xff\x10\x06\x9a\xc7\x03\x82\x00\x3c\xb1\
-\xd6\x5a\x5d\x3a\x12\xe9\xa9\xb8\xdf\xf1\xff\x9f\xb6\xa5\x4d\xb8\
-\x64\xe3\xc6\x55\x5b\x5d\x37\x2a\x45\x9c\x75\xf6\xa3\xb9\xad\xeb\
-\x04\x6b\xed\xcf\xe5\xf8\x4a\x49\xca\x48\xef\x0c\x02\x9d\x1b\x06\
-\x9a\xc6\x27\x02\x60\x82\xfa\x9d\xb5\xba\xbe\x10\xe9\xb6\x82\x8d\
-\x7b\x75\xbf\xd7\x52\x08\x82\xe0\xa4\x2d\x1b\x9e\xfb\xa5\xfb\x56\
-\xa5\x89\x5b\x00\xfb\xd1\xbb\x67\xc7\xfa\xea\xda\xfa\x40\xd2\x71\
-\x2e\xfb\x44\xda\xf7\x80\xe0\x0f\x0a\x91\xb6\x49\x9a\x6d\x8c\x6a\
-\x08\x02\x00\x26\x88\x2d\xd6\xea\xeb\x05\xab\x4b\xf2\x91\x9e\xb1\
-\xfb\x9e\xf8\x77\xcd\x18\x73\xf1\x8b\x1b\x57\xdf\x38\x0e\xad\x4a\
-\x16\xa7\x99\x03\x0b\x9a\xb2\x9d\x3f\x95\xf4\xa6\x71\x6b\x28\x69\
-\x41\x60\x74\x4a\x60\x74\x72\x10\xa8\x92\x4f\x09\x40\x89\x19\x92\
-\xf4\x40\x64\x75\x47\xc1\xea\x61\x1b\x29\x3f\xbe\x7b\xa3\xdc\xdb\
-\xbd\x69\xcd\x9b\xa4\xf1\xb8\xd0\x50\xba\x38\xb5\x1c\x84\x7d\xcf\
-\x03\x04\x0f\x48\xa6\x63\xbc\x7b\x57\x1a\x69\x45\x60\xb4\xdc\x18\
-\x2d\x0f\x8c\xda\x0d\x1f\x19\x80\xe2\x63\xb5\xef\x2d\xa7\xc7\xa2\
-\x48\x8f\x45\x56\x8f\x58\xab\x81\x24\x36\x44\x33\x5a\xa3\x11\xbd\
-\xa1\xbb\x7b\xcd\xcb\x09\x74\x2f\x29\x9c\x4d\x0e\x52\x43\x5b\xd7\
-\xac\xd0\xda\x07\xe5\xf8\xa1\xc0\x03\xa9\x35\xfb\x6e\x11\xb4\x19\
-\x29\x6b\x8c\x66\xc8\xa8\xd2\x48\xe5\x92\x2a\x09\x07\x00\x1c\xeb\
-\xb7\x56\x83\xda\xf7\xee\xfe\x4b\xb2\xda\x64\xad\x36\x5a\x69\x9d\
-\xb5\xda\x93\xfc\x0e\xa8\xdd\x51\x10\xbc\xe1\xa5\x0d\xcf\x6d\x48\
-\x7a\x90\x52\xc0\x19\xe3\x10\x34\xb4\x1e\x36\x3f\x34\x85\xfb\xe5\
-\x60\x91\x20\x00\xc0\x98\xf4\x98\xc0\x1e\xfb\xe2\x86\xb5\xbf\x4d\
-\x7a\x90\x52\xc1\x6e\x80\x87\x60\xdb\xe6\x55\xcf\x44\x51\xf4\x0e\
-\x49\x83\x49\xcf\x02\x00\xf8\xa3\x41\x6b\xed\xa9\x9c\xfc\x0f\x0d\
-\x01\xe0\x10\xbd\xb4\xe5\xf9\xfb\x8c\x31\xa7\x48\xea\x49\x7a\x16\
-\x00\x80\xfa\x64\xa3\xd3\xb7\x6e\x5e\x7b\x7f\xd2\x83\x94\x1a\x6e\
-\x01\x8c\x52\x63\x76\xce\x32\xa3\xe8\x2e\x49\xd3\x93\x9e\x05\x00\
-\x3c\xb5\x4d\x26\x3a\xa5\x7b\xe3\xf3\x4f\x24\x3d\x48\x29\x22\x00\
-\x8c\xc1\xef\x1f\x0c\xfc\xb9\xa4\x5c\xd2\xb3\x00\x80\x67\xd6\x07\
-\x51\xf8\xff\x6d\xd9\xb2\x6a\x6d\xd2\x83\x94\x2a\x6e\x01\x8c\xc1\
-\xb6\x8d\xab\xd7\xa7\x4d\x78\x8c\x95\x1e\x49\x7a\x16\x00\xf0\x87\
-\x79\x28\x1f\x8e\x1c\xc5\xc9\x7f\x6c\x58\x09\x70\x8c\xf6\xec\x79\
-\xb9\xaf\x6f\xcf\x82\x1b\xaa\x6b\x7b\xcb\x24\xbd\x41\x5c\x55\x01\
-\x00\x57\xac\x64\xae\x9e\x5c\x9d\x7a\xef\x86\x35\x6b\x78\x0e\x6b\
-\x8c\x38\x59\xc5\xa8\xa9\xb5\xeb\x34\x19\x7b\xbd\xa4\x29\x49\xcf\
-\x02\x00\x13\xcc\x1e\x23\xf3\x97\x2f\x6e\x5a\x7d\x6b\xd2\x83\x4c\
-\x14\x04\x80\x98\xcd\x98\x39\x67\x66\x10\x45\x37\x6b\xdf\xd5\x00\
-\x00\xc0\xd8\xfd\x4a\xa9\xfc\xd9\xdd\xeb\xd6\x6d\x4a\x7a\x90\x89\
-\x84\x00\xe0\x86\x69\xce\x76\x9e\x63\x8d\x2e\x97\xd5\xb4\xa4\x87\
-\x01\x80\x12\xb5\xd3\xca\x7c\x6e\xeb\xa6\xd5\x57\x6b\xdf\xbe\x69\
-\x88\x11\xcf\x00\x38\xd2\xbb\x67\xc7\x93\x93\x6b\x9b\xbe\x1d\x29\
-\xaa\x90\xb4\x5c\x3c\x70\x09\x00\x07\xcb\x1a\xe9\x66\xe5\x75\xea\
-\xd6\x2d\x6b\xee\xd5\xf8\x6c\x20\xe8\x1d\xae\x00\x8c\x83\x96\x96\
-\x8e\x23\xa2\xc0\x7c\x5e\xd2\x49\x49\xcf\x02\x00\xc5\xcd\xfc\x3c\
-\xb2\xf6\xc2\x97\x36\xaf\x79\x34\xe9\x49\x26\x3a\x02\xc0\x38\x6a\
-\x9e\xd9\xb1\xd8\x46\xe6\x33\x92\xce\x10\x3f\x7b\x00\xf8\x03\x2b\
-\xe9\xce\x20\xb2\x9f\xdf\xb2\x65\xed\x6f\x92\x1e\xc6\x17\x9c\x84\
-\x12\xd0\x3c\xab\x73\x91\x8d\x74\x81\xac\xde\x21\xa9\x2c\xe9\x79\
-\x00\x20\x21\x43\x32\xfa\x61\x50\x30\x97\x6e\xd9\xb2\xfa\xa9\xa4\
-\x87\xf1\x0d\x01\x20\x41\x33\x67\xce\xac\x1b\x89\x32\xa7\x59\xe9\
-\x1c\x49\x27\x8a\xcf\x03\x80\x1f\x1e\xb7\x32\x37\x99\xbc\xbd\xa5\
-\xbb\x7b\xcd\xcb\x49\x0f\xe3\x2b\x4e\x38\x45\xa2\xa5\xe5\xb0\x8e\
-\x28\x28\x9c\x25\xe9\xcd\x92\x56\x48\x4a\x25\x3c\x12\x00\xc4\x25\
-\x2f\xe9\x37\x92\x7e\x1e\xda\xe8\x96\xcd\x9b\x9f\x7f\x21\xe9\x81\
-\x40\x00\x28\x4a\xd3\xa6\xcd\xab\x2a\xab\x1c\x39\x26\x8a\x74\x82\
-\x8c\x39\x5e\xb2\xf3\x25\x65\x92\x9e\x0b\x00\x0e\xd2\xb0\xa4\xa7\
-\x65\xcd\xbd\x51\x60\xef\x29\xf4\xa7\x7f\xb5\x7d\xfb\xca\xbe\xa4\
-\x87\xc2\x9f\x22\x00\x94\x84\xe3\x52\x2d\x2d\xdb\x66\xd9\x20\xdf\
-\x65\x8d\xe6\xc8\x9a\x4e\xc9\xb4\xc9\xd8\x5a\x59\x55\x49\xaa\x92\
-\x54\xf3\xfb\xff\xf1\x6a\x27\x00\x57\x0a\xda\xb7\x15\x7a\x8f\xa4\
-\x3e\x19\xf5\xc9\x9a\x3d\x92\xdd\x68\x8c\x56\x4b\xf6\x39\x53\x88\
-\x56\x6f\xd9\xd2\xba\x41\xfa\x65\x3e\xd9\x51\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0e\xdd\xff\x0f\x48\
-\xee\xee\x37\x32\x26\x5d\xb4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\x4b\xda\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x77\x78\x14\xd5\xfe\x06\xf0\x77\x37\xbb\
-\xc9\x6e\x3a\x09\x29\x40\x02\x21\x40\x68\x81\x00\x41\x3a\x22\x3d\
-\x62\x41\x9a\x14\x85\x20\x02\x0a\x2a\x8a\x78\x7f\x2a\x2a\x56\x14\
-\x41\xb0\x01\x16\x14\x04\x01\x01\x01\x29\xa2\xc2\x05\x04\x45\x04\
-\x85\xd0\x42\x91\xde\x6b\x12\xd2\xcb\xd6\xdf\x1f\x08\x57\xa4\x24\
-\x99\x39\xbb\x33\x3b\xfb\x7e\x9e\xc7\x47\x21\x39\xdf\xf3\xbd\x5c\
-\x60\xde\x3d\x73\xe6\x8c\x0e\xe4\x0e\x75\x01\xb4\x07\xd0\x18\x40\
-\x1d\x00\xd5\x01\xf8\x03\xa8\xa0\x64\x53\x44\x44\x65\x54\x00\xa0\
-\x10\xc0\x19\x00\x87\x00\xec\x01\xb0\x11\xc0\x56\x00\x25\x0a\xf6\
-\x45\x32\xe8\x94\x6e\x40\xc3\x6a\x02\x48\x05\x30\x10\x40\x35\x85\
-\x7b\x21\x22\x72\x85\x7c\x00\xdf\x01\xf8\x1a\xc0\x5a\x00\x4e\x65\
-\xdb\xa1\xf2\x60\x00\x10\xaf\x21\x80\x97\x00\xf4\x06\xa0\x57\xb8\
-\x17\x22\x22\x77\xd9\x0d\x60\x02\x80\x05\x60\x10\xf0\x08\x0c\x00\
-\xe2\x84\x02\x78\x13\xc0\x08\x00\x3e\x0a\xf7\x42\x44\xa4\x94\xdf\
-\x01\x3c\x01\x60\x87\xd2\x8d\xd0\xed\xf1\x42\x25\x46\x33\x5c\x59\
-\xfe\xea\x02\x7e\xea\x27\x22\xef\x16\x0b\xe0\x51\x5c\xb9\xbe\xfc\
-\x02\xae\x06\xa8\x16\x57\x00\xe4\x7b\x0a\xc0\x14\x00\x06\xa5\x1b\
-\x21\x22\x52\x99\x95\x00\xfa\xe3\xca\x26\x42\x52\x19\x06\x00\x79\
-\xc6\x03\x18\xab\x74\x13\x44\x44\x2a\xb6\x05\xc0\xbd\x00\x32\x95\
-\x6e\x84\xae\xc7\x00\x20\xdd\x1b\x00\x5e\x51\xba\x09\x22\x22\x0f\
-\xb0\x1b\x40\x47\x00\x19\x4a\x37\x42\xff\xc3\x00\x20\xcd\xe3\x00\
-\x3e\x51\xba\x09\x22\x22\x0f\xb2\x0b\x40\x27\x30\x04\xa8\x06\x03\
-\x40\xf9\x35\x05\xb0\x09\x80\x9f\xd2\x8d\x10\x11\x79\x18\xae\x04\
-\xa8\x08\x03\x40\xf9\xf8\xe3\xca\x6f\xe0\x1a\x4a\x37\x42\x44\xe4\
-\xa1\xb8\x12\xa0\x12\x7c\x64\xad\x7c\x5e\x02\x2f\xfe\x44\x44\x72\
-\x24\x01\x58\x07\xa0\xa2\xd2\x8d\x78\x3b\xae\x00\x94\x5d\x1c\x80\
-\xbf\x00\xf8\x2a\xdc\x07\x11\x91\x16\x70\x25\x40\x61\x5c\x01\x28\
-\xbb\xff\x03\x2f\xfe\x44\x44\xa2\x70\x25\x40\x61\x5c\x01\x28\x9b\
-\x8a\x00\x4e\x01\x30\x29\xdd\x08\x11\x91\xc6\x70\x25\x40\x21\x3c\
-\xbd\xae\x6c\xfa\x41\xc0\xc5\xdf\x60\x30\xe0\x9e\x6e\xf7\xa0\x4b\
-\xe7\x2e\x48\x4c\x6c\x80\x8a\x15\x2b\xc2\x68\x34\xde\xf2\xfb\x8d\
-\xbe\x46\x04\x05\x06\xca\x9d\x96\x88\xe8\xa6\xfe\xf8\xf3\x0f\x74\
-\xbb\xa7\x9b\xd2\x6d\x24\xe1\xca\x51\xea\x0c\x01\x6e\xc6\x00\x50\
-\x36\x0f\xc9\x2d\x90\x9c\xdc\x14\xef\x8c\x7f\x1b\x71\x71\xd5\x45\
-\xf4\x43\x44\xa4\x25\x0c\x01\x0a\xe0\x1e\x80\xd2\x85\x02\xb8\x43\
-\x4e\x81\xbb\x53\xee\xc6\x9c\xaf\xe6\xf0\xe2\x4f\x44\x9a\x11\x12\
-\x1c\x02\x1f\x1f\xa1\xef\x93\xbb\x1a\x02\xb8\x27\xc0\x4d\x18\x00\
-\x4a\xd7\x16\x32\xde\x9a\xd8\xa0\x41\x43\x4c\x7c\x77\xd2\x6d\x97\
-\xfa\x89\x88\x3c\x4d\x8d\x1a\x35\x30\xf9\xbd\x29\x0c\x01\x1e\x8c\
-\x01\xa0\x74\x8d\xa4\x0e\xd4\xe9\x74\x78\xfd\xb5\xd7\xe1\xe7\xc7\
-\x43\x03\x89\x48\x7b\xba\xdd\xdd\x0d\xef\x4f\xf9\x00\x06\x83\xd0\
-\xbb\xc9\x7c\x3a\xc0\x4d\x18\x00\x4a\x57\x5b\xea\xc0\x56\x2d\x5b\
-\x21\xb1\x7e\xa2\xc8\x5e\x88\x88\x54\x25\xa5\x6b\x0a\xde\x9b\x34\
-\x59\xf4\x4a\x40\x43\x70\x25\xc0\xe5\x18\x00\x4a\x17\x2b\x75\x60\
-\xa7\x4e\x9d\x45\xf6\x41\x44\xa4\x4a\xdd\xee\xee\xc6\xdb\x01\x1e\
-\x88\x01\xa0\x74\x41\x52\x07\x26\xd4\x4a\x10\xd9\x07\x11\x91\x6a\
-\xf1\x76\x80\xe7\x61\x00\x28\x9d\xbf\xd4\x81\x61\x61\x61\x22\xfb\
-\x20\x22\x52\x35\xde\x0e\xf0\x2c\x0c\x00\xa5\x93\xfc\x6b\xe4\x63\
-\x10\xfa\x87\x80\x88\x48\xf5\xb8\x12\xe0\x39\x18\x00\x88\x88\x48\
-\xa8\x94\xae\x29\x98\x32\xf9\x7d\xd1\x21\xa0\x21\x18\x02\x84\x62\
-\x00\x20\x22\x22\xe1\x18\x02\xd4\x8f\x01\x80\x88\x88\x5c\x82\x21\
-\x40\xdd\x18\x00\x88\x88\xc8\x65\x18\x02\xd4\x8b\x01\x80\x88\x88\
-\x5c\x8a\x21\x40\x9d\x18\x00\x88\x88\xc8\xe5\x18\x02\xd4\x87\x01\
-\x80\x88\x88\xdc\x82\x21\x40\x5d\x18\x00\x88\x88\xc8\x6d\x18\x02\
-\xd4\x83\x01\x80\x88\x88\xdc\x8a\x21\x40\x1d\x18\x00\x88\x88\xc8\
-\xed\x18\x02\x94\xc7\x00\x40\x44\x44\x8a\x60\x08\x50\x16\x03\x00\
-\x11\x11\x29\x86\x21\x40\x39\x0c\x00\x44\x44\xa4\x28\x86\x00\x65\
-\x30\x00\x10\x11\x91\xe2\x18\x02\xdc\x8f\x01\x80\x88\x88\x54\x81\
-\x21\xc0\xbd\x18\x00\x88\x88\x48\x35\x18\x02\xdc\x87\x01\x80\x88\
-\x88\x54\x85\x21\xc0\x3d\x18\x00\x88\x88\x48\x75\x18\x02\x5c\x8f\
-\x01\x80\x88\x88\x54\x89\x21\xc0\xb5\x18\x00\x88\x88\x48\xb5\x18\
-\x02\x5c\x87\x01\x80\x88\x88\x54\x8d\x21\xc0\x35\x18\x00\x88\x88\
-\x48\xf5\x18\x02\xc4\x63\x00\x20\x22\x22\x8f\xc0\x10\x20\x16\x03\
-\x00\x11\x11\x79\x0c\x86\x00\x71\x18\x00\x88\x88\xc8\xa3\x30\x04\
-\x88\xc1\x00\x40\x44\x44\x1e\x87\x21\x40\x3e\x06\x00\x22\x22\xf2\
-\x48\x0c\x01\xf2\x30\x00\x10\x11\x91\xc7\x62\x08\x90\x8e\x01\x80\
-\x88\x88\x3c\x1a\x43\x80\x34\x0c\x00\x44\x44\xe4\xf1\x18\x02\xca\
-\x8f\x01\x80\x88\x88\x34\x81\x21\xa0\x7c\x18\x00\x88\x88\x48\x33\
-\x18\x02\xca\x8e\x01\x80\x88\x88\x34\x85\x21\xa0\x6c\x18\x00\x88\
-\x88\x48\x73\x18\x02\x4a\xc7\x00\x40\x44\x44\x9a\xc4\x10\x70\x7b\
-\x0c\x00\x44\x44\xa4\x59\x0c\x01\xb7\xc6\x00\x40\x44\x44\x9a\xc6\
-\x10\x70\x73\x0c\x00\x44\x44\xa4\x79\x0c\x01\x37\x62\x00\x20\x22\
-\x22\xaf\xc0\x10\x70\x3d\x06\x00\x22\x22\xf2\x1a\x0c\x01\xff\xc3\
-\x00\x40\x44\x44\x5e\x85\x21\xe0\x0a\x06\x00\x22\x22\xf2\x3a\x0c\
-\x01\x0c\x00\x44\x44\xe4\xa5\xbc\x3d\x04\x30\x00\x10\x11\x91\xd7\
-\xf2\xe6\x10\xc0\x00\x40\x44\x44\x5e\xcd\x5b\x43\x00\x03\x00\x11\
-\x11\x79\x3d\x17\x86\x80\x5f\x00\x44\x8b\x2c\x2a\x0a\x03\x00\x11\
-\x11\x11\x5c\x16\x02\xea\x02\x58\x0f\x15\x86\x00\x06\x00\x22\x22\
-\xa2\xbf\x79\x53\x08\x60\x00\x20\x22\x22\xfa\x07\x6f\x09\x01\x0c\
-\x00\x44\x44\x44\xff\xe2\x0d\x21\x80\x01\x80\x88\x88\xe8\x26\xb4\
-\x1e\x02\x18\x00\x88\x88\x88\x6e\x41\xcb\x21\x80\x01\x80\x88\x88\
-\xe8\x36\x52\xba\xa6\xe0\xbd\x49\x93\xe1\xe3\xe3\x23\xb2\x6c\x5d\
-\x00\xab\x01\x84\x8b\x2c\x5a\x1e\x0c\x00\x44\x44\x44\xa5\xe8\x76\
-\x77\x37\xbc\x3f\xe5\x03\x57\x9c\x13\xf0\x03\x80\x00\x91\x45\xcb\
-\x8a\x01\x80\x88\x88\xa8\x0c\x5c\xb4\x12\xd0\x0c\xc0\x3c\x00\x3a\
-\x91\x45\xcb\x82\x01\x80\x88\x88\xa8\x8c\x5c\xb4\x12\xd0\x1d\xc0\
-\xb3\x22\x0b\x96\x05\x03\x00\x11\x11\x51\x39\xb8\x68\x25\xe0\x1d\
-\x00\x0d\x44\x16\x2c\x8d\xd0\x08\x43\x44\xda\x72\xe4\xc8\x11\x6c\
-\xdb\xbe\x0d\x87\x0e\x1d\xc2\xc9\x53\x27\x91\x99\x91\x89\xec\x9c\
-\xec\x6b\x5f\x37\xf8\x18\x10\x19\x19\x89\x1a\x35\x6a\xa0\x79\xf3\
-\xe6\x68\xd9\xa2\x25\x42\x43\x43\x15\xec\x98\xc8\x3d\xba\xdd\xdd\
-\x0d\x7a\xbd\x1e\xcf\x8e\x19\x0d\x9b\xcd\x26\xa2\xa4\x11\xc0\x74\
-\x00\x77\x02\x70\x8a\x28\x58\x1a\x06\x00\x22\xba\xc6\xe9\x74\xe2\
-\xb7\xdf\x7e\xc3\xd2\x65\x4b\xb1\x7a\xf5\x6a\x5c\xb8\x70\xa1\xcc\
-\x63\xa7\x4e\x9b\x0a\x3f\x3f\x3f\xdc\x7f\xdf\xfd\x18\x3a\x74\x28\
-\x92\x9b\x24\xbb\xb0\x53\x22\xe5\xa5\x74\x4d\x81\xc3\xe1\xc0\x98\
-\xe7\x9e\x85\xdd\x6e\x17\x51\xb2\x0d\x80\x1e\x00\x96\x8a\x28\x56\
-\x1a\xde\x02\x20\x22\x38\x1c\x0e\x7c\xbb\xf8\x5b\xb4\x6e\xdb\x1a\
-\x0f\xf4\x7c\x00\x73\xe6\xcc\x29\xd7\xc5\xff\xaa\x92\x92\x12\x7c\
-\xbb\xf8\x5b\xa4\xdc\x9d\x82\x51\x4f\x8f\x42\x66\x56\xa6\x0b\xba\
-\x25\x52\x0f\x17\xec\x09\x78\x19\x6e\xda\x10\xc8\x00\x40\xe4\xe5\
-\xf6\xec\xd9\x83\x0e\x9d\x3a\x60\xc4\xc8\x11\x38\x78\xf0\xa0\x90\
-\x9a\x4e\xa7\x13\xf3\xbf\x99\x8f\xd6\x6d\x5a\x63\xcb\xd6\x2d\x42\
-\x6a\x12\xa9\x95\xe0\x3d\x01\x8d\x71\x65\x25\xc0\xe5\x18\x00\x88\
-\xbc\xd8\xf4\xe9\xd3\xd1\x25\xa5\x0b\xd2\xd3\xd3\x5d\x52\x3f\x23\
-\x23\x03\x3d\x7b\xf5\xc4\xba\xf5\xeb\x5c\x52\x9f\x48\x2d\x04\xaf\
-\x04\x3c\x2c\xa2\x48\x69\x18\x00\x88\xbc\x90\xc3\xe1\xc0\x33\xa3\
-\x9f\xc1\xb8\xd7\xc6\xc1\x6a\xb5\xba\x74\x2e\x8b\xc5\x82\xd4\xc1\
-\xa9\xd8\xbd\x7b\xb7\x4b\xe7\xa1\xf2\xd3\xe9\xa4\xaf\x34\x5b\x5c\
-\xfc\xfb\xc6\x13\x09\x5c\x09\xe8\x0d\x40\xe8\x23\x06\x37\xc3\x4d\
-\x80\x44\x5e\xc6\xe9\x74\xe2\xd9\x31\xcf\x62\xee\xbc\xb9\x6e\x9b\
-\xb3\xb8\xb8\x18\x83\x1f\x19\x8c\x8d\x1b\x36\x22\x28\x28\xc8\x6d\
-\xf3\xd2\xed\x99\x4d\x66\xc9\x63\xf7\xee\x4d\xc7\xbd\xf7\xdf\x0b\
-\x5f\xa3\x51\x60\x47\xda\x60\x36\x9b\x91\x9f\x9f\x2f\xa7\x44\x18\
-\x80\x46\x00\xb6\x8b\xe9\xe8\xe6\x18\x00\x88\xbc\xcc\xc7\x53\x3f\
-\x76\xeb\xc5\xff\xaa\x93\xa7\x4e\x62\xfc\xdb\xe3\x31\xe1\x9d\x09\
-\x6e\x9f\x9b\x6e\x2e\x2c\x2c\x4c\xf2\x58\xa7\xd3\x89\x83\x07\xff\
-\x12\xd8\x0d\xfd\xcb\x9d\x70\x71\x00\xe0\x2d\x00\x22\x2f\xb2\x6d\
-\xfb\x36\x8c\x7f\x7b\xbc\x62\xf3\xcf\xfa\x6a\x16\x0e\x1f\x3e\xac\
-\xd8\xfc\x74\xbd\x4a\x95\x2a\x21\x30\x30\x50\xe9\x36\xe8\xe6\x12\
-\x5d\x3d\x01\x03\x00\x91\x97\xb0\xd9\x6c\x18\x33\x66\x8c\xa8\xe7\
-\x95\x25\xb1\xdb\xed\x98\x3c\x65\xb2\x62\xf3\xd3\xf5\x74\x3a\x1d\
-\x9a\x26\x37\x55\xba\x0d\xba\xb9\x04\x57\x4f\xc0\x00\x40\xe4\x25\
-\x16\x2c\x5c\x80\xbd\xfb\xf6\x2a\xdd\x06\x96\xaf\x58\x8e\xcc\x4c\
-\x9e\x0f\xa0\x16\x1d\x3b\x76\x54\xba\x05\xba\xb9\x68\x57\x4f\xc0\
-\x00\x40\xe4\x05\xec\x76\x3b\xde\xff\xe0\x7d\xa5\xdb\x00\x70\xe5\
-\xa9\x80\x25\x4b\x97\x28\xdd\x06\xfd\xad\x57\xcf\x5e\xf0\xf5\xf5\
-\x55\xba\x0d\xba\x91\xcb\x77\xcb\x32\x00\x10\x79\x81\x8d\xbf\x6c\
-\xc4\x89\x13\x27\x94\x6e\xe3\x9a\x9f\x7e\xfa\x49\xe9\x16\xe8\x6f\
-\x91\x91\x91\x18\x9c\x3a\x58\xe9\x36\xe8\x46\xd2\x1f\xd1\x28\x23\
-\x06\x00\x22\x2f\xb0\xe8\xdb\x45\x4a\xb7\x70\x9d\x2d\x5b\xb7\xa0\
-\xa0\xa0\x40\xe9\x36\xe8\x6f\x63\xc6\x8c\x41\x70\x70\xb0\xd2\x6d\
-\xd0\xf5\x5c\x7e\x1c\x30\x03\x00\x91\xc6\x39\x1c\x0e\xfc\xfc\xf3\
-\xcf\x4a\xb7\x71\x1d\x8b\xc5\x82\xb4\xb4\x34\xa5\xdb\xa0\xbf\x85\
-\x87\x85\xe3\xa5\xb1\x2f\x29\xdd\x06\xb9\x19\xcf\x01\x20\xd2\xb8\
-\xf4\xf4\x74\xd9\x9b\xee\x62\x62\x62\xd0\xb3\x47\x4f\x34\x6e\xdc\
-\x18\x11\x11\x11\x30\x9b\xcc\xc8\xcd\xcd\x45\xdf\xfe\x7d\x61\xb1\
-\x58\x24\xd5\xdc\xb5\x7b\x17\xda\xb6\x6d\x2b\xab\x2f\x12\xe7\xd1\
-\x21\x8f\x62\xef\xbe\xbd\x98\x33\x67\x8e\xd2\xad\x90\x9b\x30\x00\
-\x10\x69\xdc\xae\xdd\xbb\x64\x8d\x4f\x4d\x4d\xc5\x84\xb7\x27\xc0\
-\x78\x93\x13\xdf\x7a\xf6\xe8\x89\x05\x0b\x17\x48\xaa\x9b\xbe\xd7\
-\x35\xef\x1f\x20\xe9\x26\xbc\x3d\x01\x27\x8e\x9f\xc0\xc6\x5f\x36\
-\x2a\xdd\x0a\xb9\x01\x6f\x01\x10\x69\xdc\x81\x03\x07\x24\x8f\xad\
-\x5b\xa7\x2e\x26\x4e\x98\x78\xd3\x8b\x3f\x00\xb4\xbf\xab\xbd\xe4\
-\xda\x67\xcf\x9e\x95\x3c\x96\x5c\xc3\xd7\xd7\x17\x0b\x17\x2c\xc4\
-\xb0\xa1\xc3\x94\x6e\x85\xdc\x80\x01\x80\x48\xe3\xce\x9f\x3f\x2f\
-\x79\xec\xfd\xf7\xdf\x7f\xdb\x17\x9b\x34\x6a\xd4\x48\x72\xed\x73\
-\xe7\xce\x49\x1e\x4b\xae\x63\x30\x18\xf0\xce\xdb\xef\x60\xf2\xa4\
-\xc9\x08\x0d\x0d\x55\xba\x1d\x72\x21\x06\x00\x22\x8d\xcb\xcc\x92\
-\x7e\xff\xbf\x61\x83\x86\xb7\xfd\x7a\x95\x2a\x55\x24\xbf\x51\x8e\
-\x01\x40\xdd\x52\x53\x53\xb1\xed\x8f\x6d\x78\x62\xe4\x13\xf0\xf3\
-\xf3\x53\xba\x1d\x72\x01\x06\x00\x22\x8d\xcb\xcc\x90\x1e\x00\xa2\
-\xa3\x6f\x7f\x18\x99\xc9\x64\x92\xfc\x42\x99\xe2\xe2\x62\xb9\x6f\
-\x4c\x23\x17\x0b\x0d\x0d\xc5\xeb\xaf\xbd\x8e\xf4\xdd\xe9\x98\x3c\
-\x69\x32\xee\x4e\xb9\x1b\x11\x11\x11\x4a\xb7\x45\x82\x70\x13\x20\
-\x91\xc6\x15\x16\x16\x4a\x1e\x5b\x21\xac\x42\xa9\xdf\x13\xe0\x1f\
-\x20\xf9\x29\x03\x8b\x55\xda\x13\x04\xe4\x5e\x15\x2a\x54\x40\x6a\
-\x6a\x2a\x52\x53\x53\x01\x00\x39\x39\x39\xc8\xce\xce\x46\x4e\x4e\
-\x0e\x9c\x4e\xa7\xc2\xdd\xa9\x57\x51\x51\x11\xee\xbd\xff\x5e\xa5\
-\xdb\xb8\x25\x06\x00\x22\x8d\xf3\xf5\x93\x7e\xcc\xab\x5e\x57\xfa\
-\x22\xa1\xd1\x57\xfa\xfb\xe0\xad\x16\xab\xe4\xb1\xa4\x9c\x90\x90\
-\x10\x84\x84\x84\x28\xdd\x86\xea\xa9\x7d\x85\x8b\xb7\x00\x88\x34\
-\x4e\xce\xfd\xdb\xfc\x82\xd2\xff\x02\xf3\xf3\x95\x5e\x9f\x2b\x00\
-\x44\xca\x61\x00\x20\xd2\x38\xb3\x49\xfa\x91\xe2\xb9\xb9\xb9\xa5\
-\x7e\x8f\xcd\x6e\x93\x5c\xdf\x66\x95\x3e\x96\x88\xe4\x61\x00\x20\
-\xd2\x38\x39\x4b\xb5\x27\x4f\x9c\x2c\xf5\x7b\xe4\x9c\xe9\x6f\x32\
-\x99\x24\x8f\x25\x22\x79\x18\x00\x88\x34\x2e\x36\x36\x56\xf2\xd8\
-\x63\xc7\x8f\x95\xfa\x3d\x72\xee\x73\x06\x04\x04\x48\x1e\x4b\x44\
-\xf2\x30\x00\x10\x69\x5c\xd5\xaa\x55\x25\x8f\x3d\x74\xf8\x50\xa9\
-\xdf\x23\xe7\x29\x03\x7f\x7f\x7f\xc9\x63\x89\x48\x1e\x06\x00\x22\
-\x8d\x93\xb3\x02\xb0\x7d\xfb\xf6\xdb\x7e\x3d\x27\x27\x07\x56\xab\
-\xb4\x9d\xfc\x7e\x7e\x7e\x30\x18\xf8\x20\x12\x91\x52\x18\x00\x88\
-\x34\x2e\xbe\x7a\xbc\xe4\xb1\x27\x4e\x9c\xb8\xed\x33\xfe\x17\x2e\
-\x5c\x90\x5c\x9b\xef\x9f\x27\x52\x16\x03\x00\x91\xc6\xd5\xa9\x53\
-\x47\xd6\xa3\x80\x7f\xfc\xf9\xc7\x2d\xbf\x76\xfe\x82\xf4\xf7\x0c\
-\x44\x46\x46\x4a\x1e\x4b\x44\xf2\x31\x00\x10\x69\x9c\xaf\xaf\x2f\
-\x12\xeb\x27\x4a\x1e\xbf\x71\xe3\xad\x5f\x0d\x2b\xe7\x3c\xff\x4a\
-\x95\x2a\x49\x1e\x4b\x44\xf2\x31\x00\x10\x79\x81\x26\x4d\x9a\x48\
-\x1e\xbb\xfe\xe7\xf5\xb7\xfc\x9a\x9c\x5b\x00\x51\x91\x51\x92\xc7\
-\x12\x91\x7c\x0c\x00\x44\x5e\xa0\x71\xe3\xc6\x92\xc7\x1e\x3d\x7a\
-\x14\x27\x4e\x9c\xb8\xe9\xd7\xca\xf2\x98\xe0\xad\x94\xf6\xa2\x21\
-\x22\x72\x2d\x06\x00\x22\x2f\xd0\xaa\x65\x2b\x59\xe3\x57\xad\x5a\
-\x75\xd3\x9f\x3f\x7c\xf8\xb0\xe4\x9a\x0c\x00\x44\xca\x62\x00\x20\
-\xf2\x02\x31\x31\x31\xa8\x55\xab\x96\xe4\xf1\xcb\x57\x2c\xbf\xe9\
-\xcf\x1f\x3a\x54\xfa\x39\x01\xb7\x12\x1f\x2f\xfd\xe9\x04\x22\x92\
-\x8f\x01\x80\xc8\x4b\x74\x68\xdf\x41\xf2\xd8\xb4\x1d\x69\x38\x75\
-\xfa\xd4\x75\x3f\x97\x93\x93\x83\x8c\x8c\x0c\xc9\x35\x6b\xc4\xd7\
-\x90\x3c\x96\x88\xe4\x63\x00\x20\xf2\x12\xed\xdb\xb7\x97\x3c\xd6\
-\xe9\x74\x62\xd9\xb2\x65\xd7\xfd\xdc\xe1\x23\xd2\x97\xff\x4d\x26\
-\x13\x2a\x57\xae\x2c\x79\x3c\x11\xc9\xc7\x00\x40\xe4\x25\x5a\xb7\
-\x6a\x2d\xeb\x3c\x80\xaf\xe7\x7e\x0d\xa7\xd3\x79\xed\xc7\x07\x0f\
-\x1e\x94\x5c\x2b\xbe\x7a\x3c\xf4\x7a\xfe\xf5\x43\xa4\x24\xfe\x09\
-\x24\xf2\x12\x66\xb3\x19\x1d\x3b\x74\x94\x3c\xfe\xe8\xd1\xa3\xf8\
-\xed\xb7\xdf\xae\xfd\x78\xcf\x9e\x3d\x92\x6b\xd5\xac\x59\x53\xf2\
-\x58\x22\x12\x83\x01\x80\xc8\x8b\xf4\x78\xa0\x87\xac\xf1\xb3\xbf\
-\x9e\x7d\xed\xbf\x77\xef\xde\x2d\xb9\x4e\x42\x42\x82\xac\x3e\x88\
-\x48\x3e\x06\x00\x22\x2f\x92\x92\x92\x22\xeb\x0d\x7c\xab\x56\xad\
-\x42\x66\x66\x26\x1c\x0e\x07\xd2\xf7\xa6\x4b\xae\x93\x98\x28\xfd\
-\x64\x42\x22\x12\x83\x01\x80\xc8\x8b\x98\xcd\x66\x74\xe9\xdc\x45\
-\xf2\x78\x8b\xc5\x82\x85\x8b\x16\xe2\xc8\x91\x23\xc8\xcf\xcf\x97\
-\x5c\xa7\x41\x83\x06\x92\xc7\x12\x91\x18\x0c\x00\x44\x5e\xe6\x81\
-\x07\x1e\x90\x35\x7e\xce\xd7\x73\x64\x2d\xff\x07\x05\x05\xa1\x6a\
-\x6c\x55\x59\x3d\x10\x91\x7c\x0c\x00\x44\x5e\xa6\x4b\xe7\x2e\x08\
-\xab\x10\x26\x79\xfc\xe1\xc3\x87\x31\xe3\x8b\x19\x92\xc7\x27\x26\
-\x26\x42\xa7\xd3\x49\x1e\x4f\x44\x62\x30\x00\x10\x79\x19\x5f\x5f\
-\x5f\xf4\xed\xdb\x57\x56\x8d\x6d\xdb\xb7\x49\x1e\xdb\xb0\x41\x43\
-\x59\x73\x13\x91\x18\x0c\x00\x44\x5e\x68\xe0\xc3\x03\x15\x9b\x9b\
-\xf7\xff\x89\xd4\x81\x01\x80\xc8\x0b\x25\x24\x24\xa0\x45\xf3\x16\
-\x8a\xcc\xdd\xbc\x59\x73\x45\xe6\x25\xa2\xeb\x31\x00\x10\x79\xa9\
-\x81\x03\xdd\xbf\x0a\x10\x1e\x16\x8e\xb8\xb8\x38\xb7\xcf\x4b\x44\
-\x37\x62\x00\x20\xf2\x52\xdd\xef\xef\x2e\x6b\x33\xa0\x14\x4d\xef\
-\x68\xca\x0d\x80\x44\x2a\xc1\x00\x40\xe4\xa5\x4c\x26\x13\x06\x0f\
-\x1e\xec\xd6\x39\x9b\xdd\xd1\xcc\xad\xf3\x11\xd1\xad\x31\x00\x10\
-\x79\xb1\x61\x43\x87\xc9\x7a\x41\x50\x79\x31\x00\x10\xa9\x07\x03\
-\x00\x91\x17\x8b\x88\x88\x40\xcf\x1e\x3d\xdd\x32\x97\xd1\x68\x44\
-\xa3\x46\x8d\xdc\x32\x17\x11\x95\x8e\x01\x80\xc8\xcb\x8d\x1c\x39\
-\xd2\x2d\xf7\xe5\x1b\x25\x35\x82\xd9\x6c\x76\xf9\x3c\x44\x54\x36\
-\x0c\x00\x44\x5e\xae\x6e\x9d\xba\x68\x77\x67\x3b\x97\xcf\xd3\xb6\
-\x6d\x5b\x97\xcf\x41\x44\x65\xc7\x00\x40\x44\x78\xea\xa9\xa7\x5c\
-\x3e\x47\xeb\xd6\xad\x5d\x3e\x07\x11\x95\x1d\x03\x00\x11\xa1\xdd\
-\x9d\xed\x5c\x7a\x40\x8f\xaf\xaf\x2f\x37\x00\x12\xa9\x0c\x03\x00\
-\x11\x01\x00\x46\x3f\x33\xda\x65\xb5\x93\x93\x93\x79\xff\x9f\x48\
-\x65\x18\x00\x88\x08\x00\xd0\xa9\x53\x27\x34\x6e\xdc\xd8\x25\xb5\
-\xdb\xb6\xe1\xfd\x7f\x22\xb5\x61\x00\x20\xa2\x6b\xc6\x8c\x1e\xe3\
-\x92\xba\x6d\x5a\xb7\x71\x49\x5d\x22\x92\x8e\x01\x80\x88\xae\xe9\
-\xda\xb5\x2b\x12\x13\x13\x85\xd6\x0c\x08\x08\x40\xd3\xa6\x4d\x85\
-\xd6\x24\x22\xf9\x18\x00\x88\xe8\x1a\x9d\x4e\x87\x17\x9f\x7f\x51\
-\x68\xcd\xb6\x6d\xdb\xc2\xd7\xd7\x57\x68\x4d\x22\x92\x8f\x01\x80\
-\x88\xae\xd3\xb5\x6b\x57\xb4\x6a\xd5\x4a\x58\xbd\x0e\xed\x3b\x08\
-\xab\x45\x44\xe2\x30\x00\x10\xd1\x0d\xc6\xbe\x38\x56\x58\x2d\x06\
-\x00\x22\x75\x62\x00\x20\xa2\x1b\xb4\x68\xde\x02\x9d\x3b\x77\x96\
-\x5d\xa7\x7a\xf5\xea\x88\x8b\x8b\x93\xdf\x10\x11\x09\xc7\x00\x40\
-\x44\x37\xf5\xca\xcb\xaf\x40\xaf\x97\xf7\x57\xc4\xf9\xf3\xe7\x71\
-\xf2\xd4\x49\x41\x1d\x11\x91\x48\x0c\x00\x44\x74\x53\xf5\xea\xd6\
-\x43\xf7\xfb\xbb\xcb\xaa\x51\x54\x54\x84\x71\xe3\xc6\x09\xea\x88\
-\x88\x44\x62\x00\x20\xa2\x5b\xca\xcd\xcd\x95\x5d\xe3\xfb\x55\xdf\
-\x63\xed\xda\xb5\x02\xba\x21\x22\x91\x18\x00\x88\xe8\xa6\x72\x72\
-\x72\xf0\xeb\xa6\x5f\x85\xd4\x7a\xf1\xa5\x17\x51\x52\x52\x22\xa4\
-\x16\x11\x89\xc1\x00\x40\x44\x37\xf5\xd3\xea\x9f\x60\xb1\x58\x84\
-\xd4\x3a\x76\xec\x18\xa6\x4e\x9b\x2a\xa4\x16\x11\x89\xc1\x00\x40\
-\x44\x37\xb5\xf2\xfb\x95\x42\xeb\xbd\xff\xc1\xfb\x38\x71\xf2\x84\
-\xd0\x9a\x44\x24\x1d\x03\x00\x11\xdd\xa0\xa0\xa0\x00\x1b\x36\x6c\
-\x10\x5a\xb3\xb8\xb8\x18\xcf\xbf\xf0\xbc\xd0\x9a\x44\x24\x1d\x03\
-\x00\x11\xdd\x60\xcd\x9a\x35\x28\x2e\x2e\x16\x5e\x77\xed\xda\xb5\
-\x58\xb2\x64\x89\xf0\xba\x44\x54\x7e\x0c\x00\x44\x74\x03\xd1\xcb\
-\xff\xff\x34\xf6\xa5\xb1\xc8\xcc\xcc\x74\x59\x7d\x22\x2a\x1b\x06\
-\x00\x22\xba\x4e\x71\x71\x31\xd6\xad\x5f\xe7\xb2\xfa\x99\x59\x99\
-\x78\x65\xdc\x2b\x2e\xab\x4f\x44\x65\xc3\x00\x40\x44\xd7\xf9\x69\
-\xf5\x4f\x28\x28\x28\x70\xe9\x1c\x8b\xbe\x5d\x84\x35\x6b\xd6\xb8\
-\x74\x0e\x22\xba\x3d\x06\x00\x22\xba\xce\xd2\xa5\x4b\xdd\x32\xcf\
-\xf3\x2f\x3c\xef\xf2\xa0\x41\x44\xb7\xc6\x00\x40\x44\xd7\xe4\xe4\
-\xe4\xb8\x74\xf9\xff\x9f\x4e\x9d\x3e\x85\xf1\x6f\x8f\x77\xcb\x5c\
-\x44\x74\x23\x06\x00\x22\xba\x66\xe5\xf7\x2b\xdd\x7a\x62\xdf\x17\
-\x5f\x7e\x81\x4d\x9b\x36\xb9\x6d\x3e\x22\xfa\x1f\x06\x00\x22\xba\
-\xc6\x5d\xcb\xff\x57\x39\x1c\x0e\x8c\x7a\x7a\x14\xf2\xf2\xf2\xdc\
-\x3a\x2f\x11\x31\x00\x10\xd1\xdf\x2e\x5e\xbc\x88\xdf\x36\xff\xe6\
-\xf6\x79\x4f\x9e\x3a\x89\x71\xaf\xf1\x8d\x81\x44\xee\xc6\x00\x40\
-\x44\x00\x80\xa5\xdf\x2d\x85\xdd\x6e\x57\x64\xee\xaf\xbf\xfe\x9a\
-\x6f\x0c\x24\x72\x33\x06\x00\x22\x02\x70\x25\x00\x28\x69\xf4\x98\
-\xd1\xc8\xce\xce\x56\xb4\x07\x22\x6f\xc2\x00\x40\x44\x38\x74\xe8\
-\x10\xd2\xd2\xd2\x24\x8f\x37\x9b\xcd\xb2\x7b\x38\x77\xee\x1c\x5e\
-\x18\xfb\x82\xec\x3a\x44\x54\x36\x0c\x00\x44\x84\x05\x0b\x17\xc8\
-\x1a\x3f\xee\x95\x71\x68\xd1\xa2\x85\xec\x3e\x16\x2f\x5e\xcc\x77\
-\x05\x10\xb9\x09\x03\x00\x91\x97\x73\x38\x1c\x58\xbc\x64\xb1\xe4\
-\xf1\x46\xa3\x11\x3d\x7b\xf6\xc4\xb4\x8f\xa7\xc1\xdf\xdf\x5f\x76\
-\x3f\xff\x79\xfe\x3f\x38\x79\xea\xa4\xec\x3a\x44\x74\x7b\x0c\x00\
-\x44\x5e\x6e\xc3\xc6\x0d\x38\x73\xe6\x8c\xe4\xf1\x1d\x3b\x76\x44\
-\x78\x58\x38\xaa\x55\xab\x86\x17\x5f\x78\x51\x76\x3f\xb9\xb9\xb9\
-\x18\x31\x62\x04\x6c\x36\x9b\xec\x5a\x44\x74\x6b\x0c\x00\x44\x5e\
-\x4e\xee\xf2\x7f\x9f\xde\x7d\xae\xfd\xf7\x63\xc3\x1f\x43\xab\x56\
-\xad\xe4\xb6\x84\xad\x7f\x6c\xc5\x94\xf7\xa7\xc8\xae\x43\x44\xb7\
-\xc6\x00\x40\xe4\xc5\xf2\xf2\xf2\xf0\xe3\x8f\x3f\x4a\x1e\x1f\x14\
-\x14\x84\xae\x5d\xba\x5e\xfb\xb1\x5e\xaf\xc7\xc7\x1f\x7d\x8c\x80\
-\x80\x00\xd9\xbd\xbd\x37\xf9\x3d\x6c\xde\xbc\x59\x76\x1d\x22\xba\
-\x39\x06\x00\x22\x2f\xb6\x6c\xd9\x32\x14\x15\x15\x49\x1e\xdf\xfd\
-\xfe\xee\x30\x99\x4c\xd7\xfd\x5c\xb5\xaa\xd5\xf0\xf2\x4b\x2f\xcb\
-\x6d\x0d\x0e\x87\x03\x23\x9e\x18\xc1\x47\x03\x89\x5c\x84\x01\x80\
-\xc8\x8b\x89\x5c\xfe\xff\xa7\x47\x87\x3c\x8a\xd6\xad\x5b\xcb\xaa\
-\x0d\x00\x67\xce\x9c\xc1\x98\xe7\xc6\xc8\xae\x43\x44\x37\x62\x00\
-\x20\xf2\x52\x7f\xfd\xf5\x17\xb6\xfe\xb1\x55\xf2\xf8\xd8\x98\x58\
-\xb4\x6c\xd9\xf2\xa6\x5f\xd3\xeb\xf5\xf8\xe8\xc3\x8f\x10\x14\x14\
-\x24\xb9\xfe\x55\xcb\x57\x2c\xc7\x8c\x2f\x66\xc8\xae\x43\x44\xd7\
-\x63\x00\x20\xf2\x52\x5f\xcf\xfd\x5a\xd6\xf8\xfe\xfd\xfb\x43\xaf\
-\xbf\xf5\x5f\x21\xd5\xaa\x56\xc3\xc4\x77\x27\xca\x9a\xe3\xaa\x71\
-\xaf\x8e\xc3\x1f\x7f\xfe\x21\xa4\x16\x11\x5d\xc1\x00\x40\xe4\x85\
-\x2c\x16\x0b\xbe\xfd\xf6\x5b\xc9\xe3\x75\x3a\x1d\x1e\xec\xf3\x60\
-\xa9\xdf\xd7\xa7\x77\x1f\xf4\xee\xdd\x5b\xf2\x3c\x57\x59\xad\x56\
-\x0c\x1b\x3e\x0c\x99\x59\x99\xb2\x6b\x11\xd1\x15\x0c\x00\x44\x5e\
-\x68\xe5\xca\x95\xb2\x2e\xa6\x6d\xda\xb4\x41\x5c\x5c\x5c\x99\xbe\
-\x77\xe2\x84\x89\xa8\x56\xb5\x9a\xe4\xb9\xae\x3a\x73\xe6\x0c\x9e\
-\x78\xf2\x09\x38\x1c\x0e\xd9\xb5\x88\x88\x01\x80\xc8\x2b\xcd\x99\
-\x3b\x47\xd6\xf8\x01\xfd\x07\x94\xf9\x7b\x83\x83\x83\x31\x7d\xfa\
-\x74\x18\x0c\x06\x59\x73\x02\xc0\xda\xb5\x6b\xf1\xf1\xd4\x8f\x65\
-\xd7\x21\x22\x06\x00\x22\xaf\x73\xfc\xf8\x71\x59\xcf\xd7\x07\x07\
-\x07\xe3\xde\x7b\xee\x2d\xd7\x98\xe6\xcd\x9a\xe3\xd9\xd1\xcf\x4a\
-\x9e\xf3\x9f\xde\x7e\xe7\x6d\x6c\xfc\x65\xa3\x90\x5a\x44\xde\x8c\
-\x01\x80\xc8\xcb\x7c\x35\xfb\x2b\x38\x9d\x4e\xc9\xe3\x7b\xf6\xe8\
-\x29\xe9\xed\x7f\xcf\x8d\x79\x4e\xc8\x29\x81\x76\xbb\x1d\x8f\x8f\
-\x78\x1c\x17\x2e\x5c\x90\x5d\x8b\xc8\x9b\x31\x00\x10\x79\x11\x8b\
-\xc5\x22\xfb\xd9\xff\xfe\xfd\xfb\x4b\x1a\x77\xf5\x94\xc0\xe0\xe0\
-\x60\x59\xf3\x03\xc0\xa5\x4b\x97\x30\xec\xb1\x61\xb0\x5a\xad\xb2\
-\x6b\x11\x79\x2b\x06\x00\x22\x2f\xb2\x62\xc5\x0a\x64\x64\x64\x48\
-\x1e\x5f\xaf\x6e\x3d\x24\x37\x49\x96\x3c\xbe\x5a\xd5\x6a\x98\x32\
-\x59\xcc\x19\xff\x9b\x37\x6f\xc6\xd8\x97\xc6\x0a\xa9\x45\xe4\x8d\
-\x18\x00\x88\xbc\xc8\x17\x5f\x7e\x21\x6b\x7c\x6a\x6a\xaa\xec\x1e\
-\x1e\xe8\xfe\x00\x86\x3c\x32\x44\x76\x1d\x00\x98\xf5\xd5\x2c\xcc\
-\x9e\x3d\x5b\x48\x2d\x22\x6f\xc3\x00\x40\xe4\x25\xd2\xd3\xd3\xb1\
-\x6d\xfb\x36\xc9\xe3\x4d\x26\x13\x7a\xf5\xec\x25\xa4\x97\xb7\xde\
-\x7c\x0b\x49\x49\x49\x42\x6a\xbd\x30\xf6\x05\xbe\x34\x88\x48\x02\
-\x06\x00\x22\x2f\x21\xf7\xd3\x7f\xef\x5e\xbd\x11\x1a\x1a\x2a\xa4\
-\x17\x5f\x5f\x5f\x7c\x39\xe3\x4b\x21\xfb\x01\xac\x56\x2b\x1e\x19\
-\xf2\x08\x4e\x9c\x3c\x21\xa0\x33\x22\xef\xc1\x00\x40\xe4\x05\x72\
-\x72\x72\xb0\xf4\xbb\xa5\xb2\x6a\xa4\x0e\x92\xbf\xfc\xff\x4f\x71\
-\x71\x71\x98\x3e\x75\x3a\x74\x3a\x9d\xec\x5a\x99\x59\x99\x48\x1d\
-\x9c\x2a\xeb\xcd\x86\x44\xde\x86\x01\x80\xc8\x0b\xcc\xff\x66\x3e\
-\x0a\x0b\x0b\x25\x8f\x6f\xd0\xa0\x01\x1a\x37\x6e\x2c\xb0\xa3\x2b\
-\x52\x52\x52\x30\x6c\xe8\x30\x21\xb5\xd2\xd3\xd3\xf1\xf4\xe8\xa7\
-\x65\x3d\xe2\x48\xe4\x4d\x18\x00\x88\x34\xce\xe9\x74\x62\xd6\x57\
-\xb3\x64\xd5\x18\x3c\x68\xb0\x98\x66\x6e\xe2\xf5\xd7\x5e\x47\x8b\
-\xe6\x2d\x84\xd4\x5a\xba\x74\x29\x4f\x0a\x24\x2a\x23\x06\x00\x22\
-\x8d\x5b\xbb\x76\x2d\x8e\x1e\x3d\x2a\x79\x7c\x40\x40\x00\x7a\xf6\
-\xec\x29\xb0\xa3\xeb\x19\x8d\x46\xcc\x9a\x39\x0b\x95\x2a\x55\x12\
-\x52\xef\xcd\xb7\xde\xc4\x92\x25\x4b\x84\xd4\x22\xd2\x32\x06\x00\
-\x22\x8d\xfb\xec\xf3\xcf\x64\x8d\x7f\xb0\xcf\x83\x08\x0a\x0a\x12\
-\xd4\xcd\xcd\x45\x44\x44\xe0\x8b\x19\x5f\xc0\x68\x34\xca\xae\xe5\
-\x74\x3a\xf1\xf4\xe8\xa7\xf1\xe7\xb6\x3f\x05\x74\x46\xa4\x5d\x0c\
-\x00\x44\x1a\xb6\xff\xc0\x7e\xd9\xe7\xe6\x0f\x19\x22\xe6\x99\xfd\
-\xd2\x34\x6f\xd6\x1c\x6f\xbe\xf1\xa6\x90\x5a\xc5\xc5\xc5\x78\xe8\
-\xa1\x87\x70\xe4\xc8\x11\x21\xf5\x88\xb4\x88\x01\x80\x48\xc3\x3e\
-\xfd\xf4\x53\x59\x9b\xe2\xda\xdd\xd9\x0e\x75\xeb\xd4\x15\xd8\xd1\
-\xed\x0d\x7d\x74\x68\xb9\xde\x34\x78\x3b\x59\x97\xb3\xd0\xb7\x7f\
-\x5f\x64\x66\x4a\x7f\xed\x31\x91\x96\x31\x00\x10\x69\x54\x46\x46\
-\x06\x16\x2f\x59\x2c\xab\xc6\xa3\x8f\x3e\x2a\xa8\x9b\xb2\x9b\xf8\
-\xee\x44\x61\x4f\x1c\x1c\x3f\x7e\x1c\xa9\x83\x53\x51\x52\x52\x22\
-\xa4\x1e\x91\x96\x30\x00\x10\x69\xd4\xcc\x59\x33\x65\x5d\xf8\x62\
-\x63\x62\xd1\xb5\x4b\x57\x81\x1d\x95\x8d\xc9\x64\xc2\xdc\x39\x73\
-\x51\xb9\x72\x65\x21\xf5\xb6\x6c\xdd\x82\x91\x4f\x8c\x84\xc3\xe1\
-\x10\x52\x8f\x48\x2b\x18\x00\x88\x34\xc8\x62\xb1\xe0\xab\xd9\x5f\
-\xc9\xaa\x31\x64\xc8\x10\xf8\xf8\xf8\x88\x69\xa8\x9c\xa2\xa2\xa2\
-\xf0\xd5\xcc\xaf\xe0\xe7\xe7\x27\xa4\xde\xf2\x15\xcb\xf1\xe6\x5b\
-\x62\xf6\x17\x10\x69\x05\x03\x00\x91\x06\x2d\x59\xba\x04\x17\x2f\
-\x5e\x94\x3c\xde\x64\x32\xe1\xa1\x87\x1e\x12\xd8\x51\xf9\x35\x69\
-\xd2\x04\x1f\x7d\xf0\x91\x90\x93\x02\x01\xe0\xe3\xa9\x1f\xe3\x93\
-\x4f\x3f\x11\x52\x8b\x48\x0b\x18\x00\x88\x34\xc6\xe9\x74\x62\xda\
-\xb4\x69\xb2\x6a\xf4\xee\xd5\x1b\x61\x15\xc2\x04\x75\x24\x5d\xaf\
-\x5e\xbd\xf0\xf4\xa8\xa7\x85\xd5\x1b\xf7\xea\x38\xcc\xff\x66\xbe\
-\xb0\x7a\x44\x9e\x8c\x01\x80\x48\x63\xfe\xfb\xdf\xff\xe2\xc0\x5f\
-\x07\x24\x8f\xd7\xe9\x74\x18\x3e\x7c\xb8\xc0\x8e\xe4\x19\xfb\xe2\
-\x58\xdc\x9d\x72\xb7\x90\x5a\x4e\xa7\x13\xa3\x9f\x1d\x8d\x95\xdf\
-\xaf\x14\x52\x8f\xc8\x93\x31\x00\x10\x69\xcc\x47\x1f\x7f\x24\x6b\
-\x7c\xfb\xbb\xda\xa3\x5e\xdd\x7a\x82\xba\x91\x4f\xaf\xd7\x63\xc6\
-\xe7\x33\x90\xdc\x24\x59\x48\x3d\xbb\xdd\x8e\xc7\x1e\x7f\x0c\x6b\
-\xd7\xad\x15\x52\x8f\xc8\x53\x31\x00\x10\x69\x48\x5a\x5a\x1a\xb6\
-\x6c\xdd\x22\xab\xc6\xc8\x91\x23\x05\x75\x23\x8e\xc9\x64\xc2\xd7\
-\x73\xbe\x46\x6c\x4c\xac\x90\x7a\x16\x8b\x05\x8f\x0c\x79\x44\xf6\
-\xaf\x15\x91\x27\x63\x00\x20\xd2\x90\x0f\x3f\xfa\x50\xd6\xf8\xba\
-\x75\xea\xa2\xdd\x9d\xed\x04\x75\x23\x56\x64\x64\x24\xbe\xf9\xe6\
-\x1b\x04\x07\x07\x0b\xa9\x57\x54\x54\x84\x87\x07\x3e\x8c\xbd\xfb\
-\xf6\x96\x6b\x5c\x61\x61\x21\xb2\xb3\xb3\xaf\xfb\xc7\x6e\xb7\x0b\
-\xe9\x89\xc8\x9d\x0c\x4a\x37\x40\x44\x62\x1c\x3e\x7c\x18\x3f\xfe\
-\xf4\xa3\xac\x1a\x23\x46\x8c\x10\xb6\xeb\xde\x15\xea\xd4\xae\x83\
-\xaf\x66\x7d\x85\xbe\xfd\xfa\xc2\x6a\xb5\xca\xae\x97\x9d\x9d\x8d\
-\x3e\x0f\xf6\x41\x97\xce\x5d\x90\x97\x97\x87\xdc\xdc\x5c\x14\x14\
-\x14\xa0\xa0\xa0\x00\xf9\x05\xf9\xc8\xc9\xc9\x01\x00\x94\x94\x94\
-\xa0\xa8\xa8\xa8\x4c\x35\xf5\x7a\x3d\x82\x83\x83\x61\x32\x99\xe0\
-\xe7\xe7\x87\x90\x90\x10\x98\xfc\x4c\x08\x0b\x0f\x43\x44\xc5\x08\
-\x44\x46\x46\x22\x3c\x3c\x1c\x15\xc3\x2b\xa2\x72\xe5\xca\x88\x8b\
-\x8b\x43\x74\x74\xb4\xec\xff\x2d\x44\xe5\xc5\x00\x40\xa4\x11\xd3\
-\xa6\x4f\x93\x75\xd8\x4d\x64\x64\x24\x7a\xf7\xea\x2d\xb0\x23\xd7\
-\xb8\xb3\xed\x9d\x98\xfc\xde\x64\x8c\x7a\x7a\x94\x90\x7a\x17\x2f\
-\x5e\xc4\xdc\x79\x73\x85\xd4\x02\x00\x87\xc3\x81\xec\xec\xec\x72\
-\x8d\x31\x9b\xcd\xa8\x1e\x57\x1d\x71\x71\x71\x48\x48\x48\x40\x52\
-\x52\x12\x92\x92\x92\x50\x35\xb6\xaa\xb0\xbe\x88\xfe\x8d\x01\x80\
-\x48\x03\xce\x9d\x3b\x87\x85\x8b\x16\xca\xaa\x31\xf4\xd1\xa1\xf0\
-\xf5\xf5\x15\xd4\x91\x38\x99\x59\x99\x38\x7e\xfc\x38\x8e\x1f\x3b\
-\x8e\xe3\x27\x8e\x5f\xf9\xef\x13\xc7\x61\x34\x1a\x85\xac\x02\xa8\
-\x41\x51\x51\x11\xf6\xed\xdf\x87\x7d\xfb\xf7\xe1\x87\x1f\x7f\xb8\
-\xf6\xf3\x61\x15\xc2\xd0\xb8\x71\x63\xb4\x6d\xdb\x16\xed\xdb\xb7\
-\x47\xfd\x7a\xf5\x15\xec\x92\xb4\x86\x01\x80\x48\x03\xa6\x4e\x9b\
-\x0a\x8b\xc5\x22\x79\xbc\xbf\xbf\x3f\x06\x0f\x1e\x2c\xae\xa1\x72\
-\xca\xc8\xc8\xc0\x81\x03\x07\x70\xf4\xe8\x51\x1c\x3b\x7e\xec\xda\
-\x45\xfe\xf8\xf1\xe3\xc8\xcb\xcb\x53\xac\x2f\xa5\x65\x5d\xce\xc2\
-\xba\xf5\xeb\xb0\x6e\xfd\x3a\xbc\xf6\xfa\x6b\x88\x8e\x8e\x46\xc7\
-\x0e\x1d\xd1\xab\x57\x2f\xb4\x69\xdd\x06\x7a\x3d\xb7\x71\x91\x74\
-\x0c\x00\x44\x1e\xee\xd2\xa5\x4b\x98\x3d\x67\xb6\xac\x1a\x03\x1f\
-\x1e\xe8\x96\x83\x7f\x32\x33\x33\xb1\x7f\xff\x7e\x1c\x3c\x74\xf0\
-\xda\xbf\x0f\xec\x3f\x80\xcc\x2c\xbe\xb1\xaf\x2c\xce\x9f\x3f\x8f\
-\x79\xf3\xe7\x61\xde\xfc\x79\xa8\x1a\x5b\x15\xfd\xfa\xf5\xc3\x43\
-\x03\x1e\x42\x95\x2a\x55\x94\x6e\x8d\x3c\x10\x03\x00\x91\x87\x9b\
-\x36\x7d\x1a\x8a\x8b\x8b\x25\x8f\x37\x1a\x8d\x18\xf1\xf8\x08\x81\
-\x1d\x5d\x59\xd2\x4e\xdf\x9b\x8e\xf4\xf4\x74\xec\xdb\xb7\x8f\x17\
-\x7a\x17\x38\x79\xea\x24\x26\x4e\x9a\x88\x0f\x3e\xfc\x00\x83\x06\
-\x0e\xc2\xe8\x67\x46\x23\x2a\x2a\x4a\xe9\xb6\xc8\x83\x30\x00\x10\
-\x79\xb0\xac\xcb\x59\x98\xf5\xd5\x2c\x59\x35\x7a\xf5\xec\x85\x98\
-\x98\x18\xc9\xe3\xf3\xf3\xf3\xb1\x67\xcf\x1e\xec\xda\xbd\x0b\xbb\
-\x77\xef\xc6\xee\xdd\xbb\x71\xe8\xf0\x21\x3e\x1a\xe7\x26\x16\x8b\
-\x05\x5f\x7c\xf9\x05\xe6\xcd\x9f\x87\x27\x9f\x78\x12\xcf\x8e\x7e\
-\x16\x46\xa3\x51\xe9\xb6\xc8\x03\x30\x00\x10\x79\xb0\xcf\x3e\xfb\
-\x0c\x05\x05\x05\x92\xc7\xeb\xf5\x7a\x8c\x7a\xaa\xec\xbb\xe9\x0b\
-\x0a\x0a\xb0\x6b\xd7\x2e\xa4\xed\x48\xbb\x76\xc1\x3f\x76\xec\x18\
-\x5f\xb5\xab\x02\x45\x45\x45\x98\xf4\xde\x24\xac\x5d\xb7\x16\x9f\
-\x4c\xfb\x04\x35\x6b\xd6\x54\xba\x25\x52\x39\x06\x00\x22\x0f\x95\
-\x9b\x9b\x8b\x19\x5f\xcc\x90\x55\x23\xa5\x6b\x0a\x12\x12\x12\x6e\
-\xfa\x35\xa7\xd3\x89\xc3\x87\x0f\x63\x7b\xda\x76\x6c\xdb\xb6\x0d\
-\x7f\x6e\xfb\x13\x07\x0e\x1c\xe0\x27\x7b\x95\xdb\xb1\x63\x07\x3a\
-\x74\xea\x80\x39\xb3\xe7\xe0\xae\x76\x77\x29\xdd\x0e\xa9\x18\x03\
-\x00\x91\x87\xfa\x7c\xc6\xe7\xc8\xcd\xcd\x95\x55\x63\xd4\xa8\xff\
-\x7d\xfa\xb7\x5a\xad\xd8\xb1\x73\x07\xb6\x6e\xdd\x8a\xdf\xb7\xfc\
-\x8e\x3f\xfe\xf8\xa3\xdc\xcf\xb3\x93\x3a\x14\x16\x16\x62\xc0\x43\
-\x03\x30\xf3\x8b\x99\x48\x49\x49\x51\xba\x1d\x52\x29\x06\x00\x22\
-\x0f\x94\x93\x93\x23\xfb\xdd\xf6\x4d\x9a\x34\x41\x61\x61\x21\x26\
-\x4e\x9a\x88\xcd\xbf\x6f\xc6\xf6\xed\xdb\xcb\x7c\xda\x1d\xa9\x9f\
-\xc5\x62\xc1\x23\x8f\x3e\x82\xe5\xcb\x96\xa3\xd9\x1d\xcd\x94\x6e\
-\x87\x54\x88\x01\x80\xc8\x03\x4d\xff\x64\xfa\xb5\x63\x6a\xa5\x4a\
-\x4b\x4b\x43\xcf\x5e\x3d\x05\x75\x44\x6a\x64\xb5\x5a\x31\x74\xd8\
-\x50\xfc\xbc\xfe\x67\x84\x87\x85\x2b\xdd\x0e\xa9\x0c\x4f\x91\x20\
-\xf2\x30\x99\x59\x99\xf8\xec\xf3\xcf\x94\x6e\x83\x3c\xc4\xd9\xb3\
-\x67\xf1\xc2\x8b\x2f\x28\xdd\x06\xa9\x10\x03\x00\x91\x87\x99\x3a\
-\x75\x2a\xf2\xf3\xf3\x95\x6e\x83\x3c\xc8\xb2\x65\xcb\x90\xbe\x37\
-\x5d\xe9\x36\x48\x65\x18\x00\x88\x3c\xc8\xa5\x4b\x97\xf0\xe5\xcc\
-\x2f\x95\x6e\x83\xfe\xc1\x60\x30\xc0\x6c\x36\x2b\xdd\xc6\x6d\x39\
-\x9d\x4e\xbc\xf7\xde\x7b\x4a\xb7\x41\x2a\xc3\x3d\x00\x44\x1e\xe4\
-\xc3\x8f\x3e\x44\x61\x61\xa1\xd2\x6d\x78\xa4\xe0\xe0\x60\xd8\xed\
-\x76\x59\xe7\x26\xdc\x8c\xd3\xe9\xc4\x53\x4f\x3e\x85\x31\xcf\x8e\
-\x01\x80\x6b\xef\x2e\xc8\xc9\xcd\x81\xc3\xee\x40\x66\x56\x26\xb2\
-\x32\xb3\xae\xfc\x3b\x2b\x0b\x17\x2f\x5e\x44\x66\x66\x26\x8e\x9f\
-\x38\x8e\x63\xc7\x8e\xe1\xc2\x85\x0b\x42\xfb\xb9\x95\x35\xff\x5d\
-\x83\xfc\xfc\x7c\x04\x06\x06\xba\x65\x3e\x52\x3f\x06\x00\x22\x0f\
-\x90\x75\x39\x0b\xab\x56\xad\x92\x7d\xea\x9f\x16\x19\x8d\x46\x54\
-\xae\x5c\x19\xb1\xb1\xb1\x88\xa9\x12\x83\xe8\xe8\x68\x44\x46\x46\
-\x22\x3a\x3a\x1a\x51\x51\x51\x88\x8a\x8c\x42\x74\x74\x34\x4c\x26\
-\x13\x0e\x1e\x3c\x88\xde\x0f\xf6\xc6\xd9\xb3\x67\x85\xcd\x6f\xb7\
-\xdb\x31\x71\xd2\x44\xfc\xbe\xe5\x77\x7c\xf6\xc9\x67\x88\x8c\x8c\
-\x04\x00\x84\x86\x86\x02\x00\xaa\x57\xaf\x7e\xdb\xf1\x85\x85\x85\
-\x38\x76\xfc\x18\x0e\xfe\x75\x10\x69\x3b\xd2\x90\x96\x96\x86\xdd\
-\x7b\x76\x0b\x7f\x22\xc3\x62\xb1\x60\xe3\x2f\x1b\x71\x4f\xb7\x7b\
-\x84\xd6\x25\xcf\xa5\x53\xba\x01\x0f\x70\x10\x40\x2d\x29\x03\xd7\
-\xac\xfe\x2f\xe2\xaa\xc5\x49\x9e\xd8\xe8\x6b\x44\x10\xd3\xba\xd7\
-\xca\xcc\xcc\xc4\xaa\x55\xab\xb0\x62\xe5\x0a\x6c\xfa\x6d\x13\x6c\
-\x36\x9b\xd2\x2d\x29\xa6\x72\xe5\xca\x88\x8f\x8f\x47\xf5\xb8\xea\
-\x88\x89\x89\x41\x6c\x6c\x2c\xaa\x56\xad\x8a\xd8\x98\x58\x44\x47\
-\x47\xc3\xc7\xc7\xa7\xcc\xb5\x4e\x9e\x3a\x89\xde\x7d\x7a\xe3\xe8\
-\xd1\xa3\xc2\xfb\x8c\x88\x88\xc0\x67\x9f\x7e\x86\x3b\xdb\xde\x29\
-\xab\x8e\xcd\x66\xc3\xb6\x6d\xdb\xb0\xe6\xbf\x6b\xb0\x7a\xcd\x6a\
-\xfc\xf5\xd7\x5f\x42\xfa\x1b\x39\x62\x24\xde\x78\xfd\x0d\x21\xb5\
-\xa8\x74\xf9\xf9\xf9\x88\x8b\x8f\x93\x3a\x3c\x0f\x40\xb0\xb8\x6e\
-\x6e\xc4\x00\x50\x3a\x06\x00\x72\x9b\xcc\xcc\x4c\xac\xfc\x7e\x25\
-\x96\xaf\x58\x8e\xcd\x9b\x37\x7b\xd5\xa9\x7b\x61\x15\xc2\x50\xb3\
-\x66\x4d\xd4\xa8\x51\x03\xf1\xf1\xf1\xff\xfb\x77\x7c\x0d\xe1\xf7\
-\xd8\x2f\x5e\xbc\x88\x3e\x0f\xf6\xc1\xde\x7d\x7b\x85\xd6\x05\xae\
-\x1c\xaf\x3c\xe6\xd9\x31\x78\x6e\xcc\x73\xe5\x0a\x26\xb7\x93\x96\
-\x96\x86\x99\xb3\x66\x62\xf1\x92\xc5\xb2\x82\x60\xf7\xfb\xbb\xe3\
-\xcb\x2f\xb8\x87\xc4\x5d\x18\x00\x3c\x1f\x03\x00\xb9\x54\x49\x49\
-\x09\x7e\x5a\xfd\x13\x16\x7d\xbb\x08\xeb\xd7\xaf\x87\xd5\x6a\x55\
-\xba\x25\x97\x0a\x0e\x0e\x46\x9d\xda\x75\x50\xbb\x4e\x6d\xd4\xad\
-\x53\x17\x75\xea\xd4\x41\xdd\x3a\x75\x11\x11\x11\xe1\xd6\x3e\xb2\
-\xb3\xb3\xd1\x7f\x40\x7f\xfc\xb9\xed\x4f\x97\xd4\x6f\xd2\xa4\x09\
-\xde\x9f\xf2\x3e\xea\xd7\xab\x2f\xac\xe6\xfe\x03\xfb\x31\x62\xe4\
-\x08\xa4\xa7\x4b\xdb\xd1\xdf\xec\x8e\x66\xf8\x61\xd5\x0f\xc2\xfa\
-\xa1\xdb\x53\x7b\x00\xe0\x1e\x00\x22\x05\x38\x9d\x4e\x6c\xdd\xba\
-\x15\x0b\x17\x2d\xc4\x8a\x95\x2b\x64\x1f\xea\xa3\x46\x3a\x9d\x0e\
-\xd5\xab\x57\x47\xc3\x06\x0d\xd1\xa0\x41\x03\x24\x26\x26\xa2\x76\
-\x42\x6d\x59\x6f\x1e\x14\x29\x34\x34\x14\x4b\x16\x2f\xc1\x90\x47\
-\x87\x60\xed\xba\xb5\xc2\xeb\xa7\xa5\xa5\xa1\x53\xe7\x4e\x78\x62\
-\xe4\x13\x78\x6e\xcc\x73\x30\x99\x4c\xb2\x6b\xd6\xad\x53\x17\x2f\
-\x8f\x7d\x19\xfd\x06\xf4\x93\x34\x5e\xef\xc3\x07\xbf\xe8\x7f\x18\
-\x00\x88\xdc\xe8\xc2\x85\x0b\x98\x3b\x6f\x2e\xe6\xcd\x9b\x87\x93\
-\xa7\x4e\x2a\xdd\x8e\x30\x46\xa3\x11\x09\x09\x09\xd7\x2e\xf6\x0d\
-\x1b\x34\x44\x62\x62\xa2\xea\x77\x9c\xfb\xfb\xfb\x63\xee\xd7\x73\
-\xf1\xfc\x8b\xcf\x63\xf6\xec\xd9\xc2\xeb\x5b\xad\x56\x7c\xf0\xe1\
-\x07\x58\xb1\x72\x05\xa6\xbc\x37\x05\x6d\xda\xb4\x91\x5d\x73\xd9\
-\xf2\x65\x92\xc7\x56\x08\xad\x20\x7b\x7e\xd2\x0e\x06\x00\x22\x17\
-\x73\x3a\x9d\xd8\xf8\xcb\x46\xcc\x9e\x3d\x1b\x3f\xad\xfe\x49\x13\
-\x4b\xfc\xb1\x31\xb1\x48\x4e\x4e\x46\x93\x26\x4d\x90\x9c\x9c\x8c\
-\xa4\x86\x49\x42\x3e\xe1\x2a\xc1\x60\x30\x60\xf2\xa4\xc9\xa8\x56\
-\xb5\x1a\xde\x7c\xeb\x4d\x38\x9d\x4e\xe1\x73\x1c\x3d\x7a\x14\x3d\
-\x7a\xf5\x40\xcf\x9e\x3d\x31\xf6\xc5\xb1\xa8\x56\xb5\x9a\xa4\x3a\
-\x97\x2f\x5f\xc6\xf2\x15\xcb\x25\xf7\x51\x31\xa2\xa2\xe4\xb1\xa4\
-\x3d\x0c\x00\x44\x2e\x92\x99\x99\x89\x6f\x16\x7c\x83\xd9\x73\x66\
-\xe3\xd8\xb1\x63\x4a\xb7\x23\x99\xd9\x6c\x46\x72\x72\x32\x9a\x26\
-\x37\x45\x72\x72\x32\x92\x9b\x24\x5f\x7b\xd4\x4d\x4b\x46\x3d\x35\
-\x0a\xb1\xb1\xb1\x78\xf2\xa9\x27\x51\x52\x52\x22\xbc\xbe\xd3\xe9\
-\xc4\x92\x25\x4b\xb0\x72\xe5\x4a\xa4\x0e\x4a\xc5\x93\x4f\x3c\x89\
-\x2a\x55\xaa\x94\xab\xc6\x94\xf7\xa7\xc8\x7a\x3c\x30\xb9\x49\xb2\
-\xe4\xb1\xa4\x3d\xdc\x04\x58\x3a\x6e\x02\xa4\x72\x39\x72\xe4\x08\
-\xa6\x7d\x32\x0d\x0b\x17\x2e\x74\xc9\x85\xc4\xd5\x42\x43\x43\xd1\
-\xac\x59\x33\xb4\x6a\xd9\x0a\xcd\x9b\x37\x47\xa3\xa4\x46\x30\x1a\
-\x8d\x4a\xb7\xe5\x36\x5b\xb6\x6e\x41\xea\xe0\x54\x64\x66\x66\xba\
-\x74\x1e\xa3\xd1\x88\x9e\x3d\x7a\x62\xf0\xe0\xc1\xb8\xa3\xe9\x1d\
-\xa5\x7e\xff\x2f\xbf\xfe\x82\xbe\xfd\xfa\xca\x5a\x41\xda\xfa\xfb\
-\x56\xd4\xa8\x51\x43\xf2\x78\x2a\x1f\xb5\x6f\x02\x64\x00\x28\x1d\
-\x03\x00\x95\xc9\x9f\xdb\xfe\xc4\xd4\xa9\x53\xf1\xe3\x4f\x3f\xc2\
-\xe1\x70\x28\xdd\x4e\x99\x55\xac\x58\x11\x6d\x5a\xb7\x41\x8b\x16\
-\x2d\xd0\xb2\x65\x4b\xd4\xad\x53\x17\x7a\xbd\x77\x6f\x16\x3b\x7d\
-\xfa\x34\x52\x1f\x49\xc5\xae\x5d\xbb\xdc\x32\x5f\x42\x42\x02\xba\
-\xdf\xdf\x1d\x1d\x3b\x76\x44\xa3\xa4\x46\x30\x18\xfe\xb7\x38\x6b\
-\xb7\xdb\xb1\x78\xc9\x62\x3c\xff\xc2\xf3\xb2\xde\x01\x11\x1b\x13\
-\x8b\x1d\x69\x3b\x44\xb4\x4b\x65\xc4\x00\xe0\xf9\x18\x00\xe8\x96\
-\x9c\x4e\x27\x56\xaf\x5e\x8d\xa9\xd3\xa6\x62\xcb\xd6\x2d\x4a\xb7\
-\x53\x26\x66\xb3\x19\xad\x5a\xb6\x42\xbb\x3b\xdb\xe1\xce\x76\x77\
-\xa2\x7e\xbd\xfa\xd0\xe9\xf8\x57\xc1\xbf\x95\x94\x94\x60\xcc\x73\
-\x63\xb0\x60\xe1\x02\xb7\xce\x6b\x32\x99\x50\xa7\x4e\x1d\x44\x46\
-\x46\xc2\x6a\xb1\x22\x7d\x6f\x3a\x2e\x5d\xba\x24\xbb\xee\x98\x67\
-\xc7\xe0\xc5\x17\x5e\x14\xd0\x21\x95\x95\xda\x03\x00\xf7\x00\x10\
-\x49\xb4\x76\xed\x5a\x8c\x7f\x67\x3c\xf6\xec\xd9\xa3\x74\x2b\xb7\
-\xe5\xe3\xe3\x83\x46\x49\x8d\xd0\xae\x5d\x3b\xb4\xbb\xb3\x1d\xee\
-\xb8\xe3\x0e\xf8\xfa\xfa\x2a\xdd\x96\xea\xf9\xf9\xf9\x61\xea\xc7\
-\x53\x91\x94\x94\x84\x71\xaf\x8e\x73\xdb\xe6\xcd\xe2\xe2\x62\xec\
-\xdc\xb9\x53\x68\x4d\xbd\x5e\x8f\x7e\x7d\xa5\x3d\x3a\x48\xda\xc5\
-\x00\x40\x54\x4e\x9b\x37\x6f\xc6\xf8\xb7\xc7\x63\xeb\x1f\x5b\x95\
-\x6e\xe5\x96\xc2\xc3\xc3\xd1\xa1\x7d\x07\x74\xee\xd4\x19\x77\xb5\
-\xbf\x0b\x61\x15\xc2\x94\x6e\xc9\x63\x0d\x1b\x3a\x0c\x0d\x12\x1b\
-\x60\xf8\x02\x32\x97\xd3\x00\x00\x20\x00\x49\x44\x41\x54\xe3\xc3\
-\x85\xbe\x43\xc0\x9d\xba\x76\xe9\x5a\xea\x3b\x09\xc8\xfb\x30\x00\
-\x10\x95\xd1\xce\x9d\x3b\x31\xfe\xed\xf1\xf8\x79\xc3\xcf\x4a\xb7\
-\x72\x5b\x51\x51\x51\xd8\xfa\xfb\x56\xd5\x3f\x83\xef\x49\x5a\xb4\
-\x68\x81\x8d\x3f\x6f\xc4\x33\xa3\x9f\xc1\xaa\x1f\x56\x29\xdd\x4e\
-\xb9\x8d\x1a\x35\x4a\xe9\x16\x48\x85\xbc\x7b\xa7\x0f\x51\x19\x5c\
-\xbe\x7c\x19\xcf\x3e\xf7\x2c\x3a\x77\xed\xac\xfa\x8b\x3f\x00\xbc\
-\xf2\xf2\x2b\xbc\xf8\xbb\x40\x85\x0a\x15\x30\xfb\xab\xd9\x98\x36\
-\x75\x1a\xfc\xfd\xfd\x95\x6e\xa7\xcc\xee\xbd\xe7\xde\x32\x3d\x65\
-\x40\xde\x87\x01\x80\xe8\x16\x1c\x0e\x07\xbe\x9a\xfd\x15\xee\x68\
-\x7e\x07\xe6\xcc\x99\xe3\x92\x03\x62\x44\x6b\xdc\xb8\x31\x1e\xec\
-\xf3\xa0\xd2\x6d\x68\x5a\xdf\x07\xfb\x62\xed\x9a\xb5\x48\x4c\x4c\
-\x54\xba\x95\x52\x99\x4c\x26\xbc\xf6\xea\x6b\x4a\xb7\x41\x2a\xc5\
-\x00\x40\x74\x13\xe9\xe9\xe9\xe8\x76\x4f\x37\x3c\xf7\x9f\xe7\x90\
-\x9d\x9d\xad\x74\x3b\x65\xa2\xd3\xe9\xf0\xe6\x1b\x6f\x7a\xfd\x23\
-\x7c\xee\x90\x90\x90\x80\xb5\x6b\xd6\x62\xfc\x5b\xe3\x55\xbd\x1a\
-\xf0\xf2\x4b\x2f\x23\x2e\x2e\x4e\xe9\x36\x48\xa5\xf8\x37\x05\xd1\
-\x3f\x58\x2c\x16\xbc\x32\xee\x15\x74\xec\xdc\x11\xdb\xb6\x6f\x53\
-\xba\x9d\x72\xe9\xd9\xb3\x27\x5a\x34\x6f\xa1\x74\x1b\x5e\xc3\x60\
-\x30\xe0\xb1\xe1\x8f\x61\xc3\xfa\x0d\x42\xce\xf8\x17\xad\x63\x87\
-\x8e\x18\x3e\x6c\xb8\xd2\x6d\x90\x8a\x31\x00\x10\xfd\xed\xf0\xe1\
-\xc3\xe8\x92\xd2\x05\x9f\x7c\xfa\x09\xec\x76\xbb\xd2\xed\x94\x8b\
-\xd9\x6c\xc6\xab\xaf\xbc\xaa\x74\x1b\x5e\x29\x3e\x3e\x1e\xdf\x2d\
-\xf9\x0e\x1f\x7d\xf8\x91\x6a\x9e\xb6\x48\x48\x48\xc0\x8c\xcf\x67\
-\x70\x35\x88\x6e\x8b\xbf\x3b\x88\x00\x2c\x5c\xb4\x10\x1d\x3b\x77\
-\x94\xfc\x9e\x75\xa5\x8d\x7a\x6a\x14\x2a\x57\xae\xac\x74\x1b\x5e\
-\x4b\xa7\xd3\x61\x40\xff\x01\xd8\x91\xb6\x03\xe3\x5e\x19\xa7\xe8\
-\x26\xcc\xf8\xf8\x78\x2c\x5e\xb4\x18\xc1\xc1\x2e\x3d\x43\x86\x34\
-\x80\x01\x80\xbc\x5a\x5e\x5e\x1e\x86\x3f\x3e\x1c\x4f\x3c\xf9\x04\
-\x0a\x0a\x0a\xdc\x3a\x77\x74\x74\x34\x02\x02\x02\x64\xd7\x89\x89\
-\x89\xc1\x53\x4f\x3e\x25\xa0\x23\x92\x2b\x20\x20\x00\xa3\x9e\x1a\
-\x85\x2d\x9b\xb7\x60\xd0\xa0\x41\xd7\x1d\xe9\xeb\x0e\x0d\x1b\x36\
-\xc4\x8a\x65\x2b\x18\x06\xa9\x4c\x18\x00\xc8\x6b\x9d\x38\x79\x02\
-\x29\xdd\x52\xb0\x74\xe9\x52\xb7\xce\xdb\x34\xb9\x29\x3e\xff\xf4\
-\x73\xbc\xf1\xda\x1b\x42\x42\xc7\xab\xaf\xbc\xea\xb1\xaf\xe2\xd5\
-\xaa\xe8\xe8\x68\x4c\x79\x6f\x0a\x7e\xfb\xf5\x37\x0c\x1a\x34\x08\
-\x66\xb3\xd9\xe5\x73\xf6\xef\xd7\x1f\x3f\x7c\xff\x03\xa2\xa3\xa3\
-\x5d\x3e\x17\x69\x03\x0f\x00\x2f\x1d\xdf\x05\xa0\x41\xdb\xb6\x6f\
-\xc3\xc3\x03\x1f\x46\x46\x46\x86\x5b\xe6\xf3\xf5\xf5\xc5\xfd\xf7\
-\xdf\x8f\xe1\x43\x87\xa3\x49\x93\x26\xc8\xc8\xc8\x40\xeb\xb6\xad\
-\x65\xbf\x71\xae\x4d\x9b\x36\xf8\x6e\xc9\x77\x3c\xcb\x5f\xe5\xb2\
-\xb3\xb3\x31\x6f\xfe\x3c\xcc\x9c\x39\x13\x27\x4e\x9e\x10\x5a\xbb\
-\x5a\xb5\x6a\x98\xf0\xf6\x04\x74\xee\xdc\x59\x68\x5d\x92\x4f\xed\
-\xef\x02\xe0\xdf\x1a\xa5\x63\x00\xd0\x98\x4d\x9b\x36\xe1\xa1\x81\
-\x0f\xb9\x65\xc9\xdf\x6c\x36\x5f\x7b\xf7\xfb\x3f\x3f\x99\x0d\x7e\
-\x64\x30\xbe\x5f\xf5\xbd\xac\xda\xbe\xbe\xbe\xf8\x65\xc3\x2f\xa8\
-\x59\xb3\xa6\xdc\x36\xc9\x4d\x1c\x0e\x07\x36\x6c\xdc\x80\x1f\x7f\
-\xfc\x11\xab\xd7\xac\x96\x75\xb4\x70\xfd\x7a\xf5\x31\x74\xe8\x50\
-\xf4\xeb\xdb\xcf\xab\x5e\xd7\xec\x49\xd4\x1e\x00\x78\x14\x30\x79\
-\x95\x0d\x1b\x37\xe0\xe1\x81\x0f\xa3\xb8\xb8\xd8\xa5\xf3\x04\x06\
-\x06\x62\xc8\x23\x43\x30\x72\xc4\x48\x54\xac\x58\xf1\xba\xaf\x2d\
-\x59\xb2\x44\xf6\xc5\x1f\x00\x46\x3f\x33\x9a\x17\x7f\x0f\xa3\xd7\
-\xeb\xd1\xa1\x7d\x07\x74\x68\xdf\x01\x13\xdf\x9d\x88\x3d\x7b\xf6\
-\x60\xf5\x9a\xd5\x48\xdb\x91\x86\xf4\xf4\x74\x9c\x3b\x77\xee\x96\
-\x63\x43\x42\x42\x90\x98\x98\x88\xb6\x6d\xda\xa2\x4b\xe7\x2e\x68\
-\xd8\xb0\xa1\x1b\x3b\x27\x2d\x62\x00\x20\xaf\x91\x9e\x9e\x8e\xc1\
-\x8f\x0c\x76\xe9\xc5\x3f\x20\x20\x00\x23\x1e\x1f\x81\xc7\x86\x3f\
-\x86\x0a\x15\x2a\xdc\xf0\xf5\x0b\x17\x2e\xe0\x85\xb1\x2f\xc8\x9e\
-\xa7\x56\xad\x5a\x78\x7a\xd4\xd3\xb2\xeb\x90\x72\x74\x3a\x1d\x1a\
-\x36\x6c\x78\xdd\x85\xbc\xb8\xb8\x18\xa7\x4f\x9f\x46\x6e\x6e\x2e\
-\xf2\xf2\xf3\x60\xf0\x31\x20\x24\x34\x04\x11\x15\x23\x10\x15\x15\
-\xa5\x60\xb7\xa4\x45\x0c\x00\xe4\x15\xce\x9f\x3f\x8f\x01\x0f\x0f\
-\x40\x7e\x7e\xbe\x4b\xea\x1b\x0c\x06\x0c\x18\x30\x00\x2f\xfc\xdf\
-\x0b\x88\x8c\x8c\xbc\xe5\xf7\x8d\x1e\x33\x1a\x97\x2f\x5f\x96\x35\
-\x97\x4e\xa7\xc3\xe4\x49\x93\xf9\x4a\x5f\x0d\x32\x99\x4c\x5c\xd5\
-\x21\xb7\x61\x00\x20\xcd\x2b\x2a\x2a\xc2\xa0\xc1\x83\x5c\xf6\x2a\
-\xd7\x76\x77\xb6\xc3\x1b\x6f\xbc\x81\xfa\xf5\xea\xdf\xf6\xfb\x66\
-\x7c\x31\x03\x6b\xd6\xac\x91\x3d\xdf\x43\x03\x1e\x42\xab\x56\xad\
-\x64\xd7\x21\x22\xef\xc6\x00\x40\x9a\x37\xf6\xe5\xb1\x48\x4b\x4b\
-\x13\x5e\xb7\x52\xa5\x4a\x98\xf0\xce\x04\xdc\xd3\xed\x9e\x52\xbf\
-\x77\xdf\xfe\x7d\x78\xfd\x8d\xd7\x65\xcf\x19\x1e\x16\x8e\x57\x5e\
-\x79\x45\x76\x1d\x22\x22\x06\x00\xd2\xb4\xdf\x7f\xff\x1d\x73\xe7\
-\xce\x15\x5a\xd3\x60\x30\x60\xc8\x23\x43\xf0\xd2\xd8\x97\xca\x74\
-\x90\x4f\x41\x41\x01\x1e\x1d\xfa\xa8\x90\xbd\x07\x6f\xbd\xf5\x16\
-\xc2\xc3\xc2\x65\xd7\x21\x22\x62\x00\x20\xcd\x2a\x29\x29\xc1\xe8\
-\x31\xa3\x85\xbe\xc6\xb7\x56\xad\x5a\xf8\x74\xfa\xa7\x48\x4a\x4a\
-\x2a\xf3\x98\x67\x9f\x7b\x16\x87\x0e\x1d\x92\x3d\x77\xfb\xbb\xda\
-\xa3\x4f\xef\x3e\xb2\xeb\x10\x11\x01\x3c\x09\x90\x34\xec\xa3\x8f\
-\x3f\xc2\xe1\xc3\x87\x85\xd5\x1b\xd0\x7f\x00\xd6\xfd\x77\x5d\xb9\
-\x2e\xfe\x73\xe7\xcd\xc5\x92\x25\x4b\x64\xcf\x1d\x12\x12\x82\x0f\
-\x3f\xf8\x50\x76\x1d\x22\xa2\xab\xb8\x02\x40\x9a\x94\x9b\x9b\x8b\
-\x4f\x3f\xfb\x54\x48\x2d\xb3\xd9\x8c\x0f\xa6\x7c\x80\x5e\xbd\x7a\
-\x95\x6b\xdc\xce\x9d\x3b\xf1\xc2\x8b\xf2\x1f\xf9\x03\x80\x09\xef\
-\x4c\xe0\xf9\xee\x44\x24\x14\x03\x00\x69\xd2\xdc\x79\x73\x91\x93\
-\x93\x23\xbb\x4e\x78\x78\x38\xe6\xcf\x9b\x8f\xe4\x26\xc9\xe5\x1a\
-\x77\xfe\xfc\x79\x0c\x4c\x1d\x28\xe4\xbe\xff\x7d\xf7\xde\xc7\xa5\
-\x7f\x22\x12\x8e\x01\x80\x34\x69\xfe\xfc\xf9\xb2\x6b\xc4\xc5\xc5\
-\x61\xf1\xa2\xc5\x88\x8b\x8b\x2b\xd7\xb8\xe2\xe2\x62\x0c\x1a\x3c\
-\xe8\xb6\xa7\xba\x95\x55\x44\x44\x04\xde\x9b\xf4\x9e\xec\x3a\x44\
-\x44\xff\xc6\x00\x40\x9a\xf3\xd7\x5f\x7f\xe1\xc0\x5f\x07\x64\xd5\
-\x88\x8e\x8e\xc6\x92\xc5\x4b\x50\xad\x6a\xb5\x72\x8d\x73\x3a\x9d\
-\x78\xe6\xd9\x67\x84\x3d\x76\x38\x69\xe2\x24\x84\x87\x73\xd7\x3f\
-\x11\x89\xc7\x4d\x80\xa4\x39\xeb\xd6\xad\x93\x35\x3e\x30\x30\x10\
-\x0b\x17\x2c\x2c\xf7\xc5\x1f\x00\x26\xbd\x37\x09\x8b\x17\x2f\x96\
-\x35\xff\x55\x03\x07\x0e\xc4\xbd\xf7\xdc\x2b\xa4\x16\x11\xd1\xbf\
-\x31\x00\x90\xe6\x6c\x4f\xdb\x2e\x6b\xfc\x1b\xaf\x95\x7e\xaa\xdf\
-\xcd\xcc\x9c\x35\x13\x13\x27\x4d\x94\x35\xf7\x55\x75\x6a\xd7\xc1\
-\xdb\x6f\xbd\x2d\xa4\x16\x11\xd1\xcd\x30\x00\x90\xe6\xec\x3f\xb0\
-\x5f\xf2\xd8\x96\x2d\x5b\x62\xe0\xc0\x81\xe5\x1e\xb7\xe8\xdb\x45\
-\xc2\x76\xfc\xfb\xfb\xfb\x63\xe6\x97\x33\x61\x36\x9b\x85\xd4\x23\
-\x22\xba\x19\x2d\xed\x01\x08\x00\x90\x00\x20\x0e\x40\x85\xbf\x7f\
-\xec\x2f\xa0\xee\x8d\xaf\x74\x23\x55\x3b\x73\xe6\x8c\xe4\xb1\x4f\
-\x8e\x7c\x12\x3a\x9d\xae\x5c\x63\x7e\xfc\xe9\x47\x8c\x7a\x7a\x14\
-\x1c\x0e\x87\xe4\x79\xff\x69\xd2\xc4\x49\x48\x48\x48\x10\x52\x8b\
-\x88\xe8\x56\x3c\x39\x00\xd4\x04\xd0\x01\x40\x7b\x00\xad\x00\x54\
-\x55\xb6\x1d\x52\x03\x9b\xcd\x86\x82\x82\x02\xc9\xe3\xdb\xb6\x6d\
-\x5b\xae\xef\xff\xee\xbb\xef\xf0\xc4\x53\x4f\xc0\x66\xb3\x49\x9e\
-\xf3\x9f\xfa\xf7\xeb\x8f\xbe\x0f\xf6\x15\x52\x8b\x88\xe8\x76\x3c\
-\x2d\x00\x84\x01\xe8\x0d\x60\x10\x80\xd6\x0a\xf7\x42\x2a\x24\xe7\
-\x53\xb8\xc1\x60\x80\xc1\x50\xf6\x3f\x12\x33\xbe\x98\x81\x97\x5e\
-\x7e\x49\xd8\x27\xff\x7a\x75\xeb\xe1\xdd\x09\xef\x0a\xa9\x45\x44\
-\x54\x1a\x4f\xd9\x03\x50\x1d\xc0\x87\x00\xce\x00\xf8\x0c\xbc\xf8\
-\xd3\x2d\xf8\xfa\xfa\xc2\xd7\xd7\x57\xd2\x58\x9b\xcd\x56\xa6\xc7\
-\xf7\xec\x76\x3b\xde\x7c\xeb\x4d\xbc\x38\xf6\x45\x61\x17\xff\xf0\
-\xb0\x70\x7c\xfd\xf5\xd7\xf0\xf7\x17\x71\xd7\x8a\x88\xa8\x74\x6a\
-\x0f\x00\xd1\x00\xbe\x02\x70\x08\xc0\x28\x00\x26\x45\xbb\x21\x8f\
-\x10\x19\x19\x29\x79\xec\x07\x1f\x7e\x70\xdb\xaf\x5f\xb8\x70\x01\
-\xbd\xfa\xf4\xc2\x87\x1f\x89\x3b\x97\xdf\x68\x34\x62\xd6\xcc\x59\
-\x92\x1e\x3b\x24\x22\x92\x4a\xad\x01\xc0\x07\xc0\x93\x00\x0e\x00\
-\x48\xfd\xfb\xc7\x44\x65\x52\x3b\xa1\xb6\xe4\xb1\x6b\xd7\xad\xc5\
-\x82\x85\x0b\x6e\xf8\x79\xa7\xd3\x89\xef\x96\x7d\x87\x76\xed\xdb\
-\x61\xd3\xa6\x4d\x72\xda\xbb\xc1\x84\xb7\x27\xa0\x55\xab\x56\x42\
-\x6b\x12\x11\x95\x46\x8d\x01\x20\x12\xc0\x2a\x00\x1f\x03\x08\x51\
-\xb8\x17\xf2\x40\x8d\x1a\x35\x92\x35\xfe\x3f\xff\xf7\x1f\xac\x5d\
-\xbb\x16\x00\x50\x54\x54\x84\x1f\x7e\xfc\x01\x5d\x52\xba\x60\xd8\
-\xf0\x61\xc8\xc8\xc8\x10\xd1\xe2\x35\x43\x1f\x1d\x8a\xd4\xd4\x54\
-\xa1\x35\x89\x88\xca\x42\x6d\x9b\x00\xdb\x03\xf8\x06\x40\x94\xd2\
-\x8d\x90\xe7\x6a\x7f\x57\x7b\x4c\x9e\x32\x59\xf2\xf8\xa2\xa2\x22\
-\xf4\x1b\xd0\x0f\xb1\x31\xb1\xb8\x78\xe9\x22\x4a\x4a\x4a\x04\x76\
-\xf7\x3f\x29\x29\x29\x78\xeb\xcd\xb7\x5c\x52\x9b\x88\xa8\x34\x6a\
-\x5a\x01\xe8\x01\xe0\x07\xf0\xe2\x4f\x32\x35\x6d\xda\x14\x51\x51\
-\xf2\x7f\x1b\x9d\x3a\x7d\xca\x65\x17\xff\xd6\xad\x5b\xe3\xcb\x19\
-\x5f\x96\xeb\xa9\x03\x22\x22\x91\xd4\x12\x00\x9e\x00\xb0\x18\xdc\
-\xe4\x47\x02\x18\x0c\x06\x3c\xd8\xe7\x41\xa5\xdb\xb8\xa5\xa4\xa4\
-\x24\xcc\x9d\x33\x17\x7e\x7e\x7e\x4a\xb7\x42\x44\x5e\x4c\x0d\x01\
-\x60\x20\xae\xdc\xef\x57\x43\x2f\xa4\x11\xc3\x86\x0e\x93\xfc\x38\
-\xa0\x2b\xc5\xc7\xc7\x63\xc1\xfc\x05\x08\x0a\x0a\x52\xba\x15\x22\
-\xf2\x72\x4a\x5f\x74\xef\x03\x30\x13\x40\xf9\xce\x5e\x25\x2a\x45\
-\xe5\xca\x95\x31\xf0\xe1\xf2\x9f\xe9\xef\x4a\x75\x6a\xd7\xc1\x8a\
-\x65\x2b\x10\x11\x11\xa1\x74\x2b\x44\x44\x8a\x06\x80\x04\x00\xf3\
-\xa0\xbe\x8d\x88\xa4\x11\x2f\x3c\xff\x02\xc2\xc3\xc2\x95\x6e\x03\
-\xc0\x95\x27\x13\x96\x2f\x5f\x8e\xe8\xe8\x68\xa5\x5b\x21\x22\x02\
-\xa0\x5c\x00\x30\x01\x58\x04\x80\xeb\xa0\xe4\x32\x15\x2a\x54\xc0\
-\xf8\xb7\xc6\x2b\xdd\x06\xda\xb6\x6d\x8b\xe5\xdf\x2d\x57\x4d\x18\
-\x21\x22\x02\x94\x0b\x00\xef\x03\x48\x52\x68\x6e\xf2\x22\xbd\x7b\
-\xf7\x56\x74\x43\x60\xef\xde\xbd\xb1\xf0\x9b\x85\x08\x08\x08\x50\
-\xac\x07\x22\xa2\x9b\x51\x62\xf9\xbd\x05\x80\xe1\xae\x28\xac\xd7\
-\xe9\x50\x3d\x20\x18\xb1\xfe\x81\x08\xf3\x35\xc1\x57\x2f\x3f\xdf\
-\xac\x3a\x7b\x1c\x79\x36\xab\x80\xee\x48\x29\x13\xdf\x9d\x88\x7d\
-\xfb\xf7\x21\x3d\x3d\xdd\x6d\x73\x1a\x8d\x46\xbc\xf6\xea\x6b\x78\
-\x6c\xf8\x63\x6e\x9b\x93\x88\xa8\x3c\xdc\x1d\x00\x7c\x00\x7c\x02\
-\x81\x2b\x0f\x7a\x9d\x0e\x2d\xc3\xa3\xd1\x29\x3a\x16\x4d\x2b\x44\
-\xc2\x5f\xf0\x73\xd5\xbf\x5e\x3a\xc7\x00\xe0\xe1\x02\x03\x03\xb1\
-\xe4\xdb\x25\x48\xe9\x96\x82\x63\xc7\x8e\xb9\x7c\xbe\xf0\xf0\x70\
-\x7c\xf1\xf9\x17\xe5\x7e\xb5\x30\x11\x91\x3b\xb9\x3b\x00\x3c\x0c\
-\x40\xde\x39\xad\x7f\xd3\x01\xe8\x18\x15\x8b\xd4\xea\x75\x50\xd9\
-\xcc\xe5\x55\xba\xbd\xf0\xf0\x70\x2c\x59\xbc\x04\x7d\xfb\xf5\xc5\
-\xa1\x43\x87\x5c\x36\x4f\x8f\x1e\x3d\xf0\xf6\x5b\x6f\x73\xa7\x3f\
-\x11\xa9\x9e\x3b\xf7\x00\xe8\x01\xbc\x20\xa2\x50\x45\x3f\x13\x26\
-\x35\x6a\x8d\x17\xeb\x25\xf3\xe2\x4f\x65\x56\x35\xb6\x2a\x7e\xf8\
-\xfe\x07\x97\x7c\x32\xaf\x56\xb5\x1a\x16\x7c\xb3\x00\x33\x3e\x9b\
-\xc1\x8b\x3f\x11\x79\x04\x77\x06\x80\x9e\x00\xea\xc8\x2d\x52\x2f\
-\x24\x0c\x9f\xdf\xd1\x01\x8d\x2b\xf0\x2f\x59\x2a\xbf\x0a\x15\x2a\
-\x60\xc9\xb7\x4b\xf0\xe6\x1b\x6f\xc2\x64\x92\x7f\xf0\x64\x54\x54\
-\x14\x5e\x1d\xf7\x2a\x36\xfd\xba\x09\x9d\x3a\x76\x12\xd0\x21\x11\
-\x91\x7b\xb8\x33\x00\xc8\xde\xf8\x97\x14\x5a\x11\x93\x92\x5a\x23\
-\xc4\xa8\xbe\x13\xde\xc8\x73\xe8\xf5\x7a\x8c\x78\x7c\x04\xb6\xfd\
-\xb1\x0d\x43\x1f\x1d\x2a\xe9\x48\xde\x84\x84\x04\x4c\x79\x6f\x0a\
-\x76\x6c\xdf\x81\xa7\x9e\x7c\x0a\x66\xb3\xd9\x05\x9d\x12\x11\xb9\
-\x8e\xbb\x4e\xe0\x8b\x01\x70\x02\x32\x02\x47\xf5\x80\x60\x7c\xd4\
-\xe4\x4e\xe1\x9b\xfc\x4a\x33\x68\xcb\x5a\x9c\x29\xca\x97\x34\x76\
-\xcd\xea\xff\x22\xae\x5a\x9c\xe4\xb9\x8d\xbe\x46\x04\x05\x06\x4a\
-\x1e\x4f\x65\x93\x9b\x9b\x8b\x55\x3f\xac\xc2\xea\xd5\xab\xb1\x63\
-\xe7\x0e\x9c\x39\x73\xe6\x86\xef\x09\x0f\x0b\x47\xc3\x86\x0d\xd1\
-\xb2\x65\x4b\x74\xed\xda\x15\xf5\xeb\xd5\x57\xa0\x53\x22\xf2\x24\
-\xf9\xf9\xf9\x88\x8b\x8f\x93\x3a\x3c\x0f\x40\xb0\xb8\x6e\x6e\xe4\
-\xae\xab\xe9\x00\xc8\xb8\xf8\x9b\x7c\x7c\x30\x2e\xf1\x0e\xb7\x5f\
-\xfc\xc9\x3b\x04\x07\x07\xa3\x7f\xbf\xfe\xe8\xdf\xaf\x3f\x80\x2b\
-\x7f\x68\xb3\x2e\x67\x21\x27\x3b\x07\x41\x41\x41\x08\x0d\x0d\x45\
-\x68\x68\xa8\xc2\x5d\x12\x11\x89\xe5\xae\x2b\x6a\x8a\x9c\xc1\x83\
-\xab\xd7\x45\x55\x7f\x1e\x1a\x48\xee\x11\x18\x18\x88\xc0\xc0\x40\
-\x20\x56\xe9\x4e\x88\x88\x5c\xc7\x1d\x7b\x00\x4c\x00\x5a\x4a\x1d\
-\x1c\x6d\xf2\x47\x8f\x98\x78\x81\xed\x94\x8f\xd9\xc7\x47\xf2\xd8\
-\x00\x7f\x3e\xa1\x40\x44\x44\xea\xe4\x8e\x00\xd0\x12\x57\x42\x80\
-\x24\x0f\x56\xad\x05\x83\x4e\xb9\x77\x16\x45\x99\xfc\x25\x8d\x33\
-\x99\x4c\x08\x0b\x0b\x13\xdc\x0d\x11\x11\x91\x18\xee\xb8\xb2\x36\
-\x94\x3a\xd0\x4f\xef\x83\x4e\x51\x31\x22\x7b\x29\xb7\xe4\xb0\x48\
-\x49\xe3\x5a\xb7\x6a\x0d\x1f\x19\xab\x07\x44\x44\x44\xae\xe4\x8e\
-\x00\x90\x20\x75\x60\x93\xb0\x08\x04\x18\x8c\x22\x7b\x29\xb7\x4e\
-\x51\x31\x92\x1e\x3b\x4c\x1d\x94\xea\x82\x6e\x88\x88\x88\xc4\x70\
-\x47\x00\xa8\x2d\x75\x60\xa3\xd0\x8a\x22\xfb\x90\x24\xc0\x60\xc4\
-\xc8\x5a\x0d\xca\x35\xe6\x81\xee\x0f\xa0\x45\x0b\xc9\xdb\x1e\x88\
-\x88\x88\x5c\xce\x1d\x01\x40\xda\x1a\x3a\x80\xf8\xc0\x10\x91\x7d\
-\x48\xd6\x29\x2a\x16\xc3\x6b\xd4\x87\x4e\x57\xfa\xb1\x09\x77\xdd\
-\x75\x17\xde\x78\xfd\x4d\x37\x74\x45\x44\x44\x24\x9d\x3b\x1e\x03\
-\x94\x7c\x92\x4d\x25\x89\x1b\xf0\x5c\xa1\x6f\xd5\x5a\xa8\x19\x18\
-\x82\x4f\x0e\xa7\xe3\x58\x41\xee\x0d\x5f\x0f\x0d\x0d\xc5\x88\xc7\
-\x47\x62\xd0\xc0\x41\xbc\xf7\x4f\x44\x44\xaa\xe7\x8e\x00\x20\xf9\
-\x01\x7e\x7f\x85\xef\xff\xff\x5b\x72\x58\x24\x66\x34\xeb\x80\x43\
-\x79\xd9\x48\xcf\xc9\x44\x41\xc5\x0a\x88\x6c\xd3\x12\x09\x09\x09\
-\x68\xd1\xbc\x05\x7c\x7d\x79\x44\x31\x11\x11\x79\x06\x77\x04\x80\
-\xf2\x1f\xb4\xfe\x37\xe5\x1e\xfe\xbb\x35\x1d\x80\x84\xa0\x50\x24\
-\x04\x85\x22\xa0\x59\x63\x84\x3d\x32\x40\xe9\x96\x88\x88\x88\xca\
-\x4d\x8d\xd7\xd8\x6b\x0a\xed\x36\xa5\x5b\x20\x22\x22\xd2\x24\x55\
-\x07\x80\x0b\xc5\x45\x4a\xb7\x40\x44\x44\xa4\x49\xaa\x0e\x00\xc7\
-\x0a\x72\x94\x6e\x81\x88\x88\x48\x93\x54\x1d\x00\x76\x67\x67\x2a\
-\xdd\x02\x11\x11\x91\x26\xa9\x3a\x00\xfc\x91\x75\x01\x25\x76\xbb\
-\xd2\x6d\x10\x11\x11\x69\x8e\xaa\x03\x40\xa1\xcd\x86\x5f\x2e\x9d\
-\x55\xba\x0d\x22\x22\x22\xcd\x51\x75\x00\x00\x80\x85\x27\x0f\xc1\
-\xa9\x74\x13\x44\x44\x44\x1a\xa3\xfa\x00\x70\xac\x20\x17\xab\xcf\
-\x9d\x54\xba\x0d\x22\x22\x22\x4d\x51\x7d\x00\x00\x80\xcf\x8f\xa4\
-\x23\xb3\xa4\x58\xe9\x36\x88\x88\x88\x34\xc3\x23\x02\x40\x8e\xd5\
-\x82\xb7\xf6\xfd\x09\x9b\xc3\xa1\x74\x2b\x44\x44\x44\x9a\xe0\x11\
-\x01\x00\xb8\xf2\x48\xe0\x3b\xfb\xb7\xc3\xe1\xe4\x8e\x00\x22\x22\
-\x22\xb9\xdc\xf1\x2e\x00\x61\x36\x5c\x3c\x03\x9b\xd3\x81\xb1\xf5\
-\x9a\xc2\x4f\xcf\x37\xee\x11\x11\x11\x49\xe5\x31\x2b\x00\x57\x6d\
-\xba\x74\x0e\x4f\x6e\xdf\x88\x13\x05\x79\x4a\xb7\x42\x44\x44\xe4\
-\xb1\x3c\x2e\x00\x00\xc0\xd1\xfc\x5c\x0c\xdf\xf6\x33\xbe\x3c\xba\
-\x0f\x79\x36\xab\xd2\xed\x10\x11\x11\x79\x1c\x8f\xba\x05\xf0\x4f\
-\x36\x87\x03\xf3\x4f\x1c\xc4\xb2\x33\x47\x91\x12\x5d\x0d\x1d\xa3\
-\x62\x50\x3b\xb8\x02\x74\x4a\x37\x46\x44\x44\xe4\x01\xdc\x71\xbd\
-\xcc\x05\x10\xe4\x86\x79\x10\x6a\xf4\x43\xbd\x90\x0a\x88\xf5\x0f\
-\x42\x98\xaf\x1f\x4c\x3e\xae\xcd\x37\x7e\x71\xb1\x08\x68\xdd\xcc\
-\x65\xf5\x7d\x7c\x7c\x60\xf2\x33\xb9\xac\x3e\x91\xa7\xf3\x33\xf9\
-\xc1\xdf\xdf\x1f\xe1\x61\xe1\xa8\x5a\xb5\x2a\x62\x62\x62\x94\x6e\
-\x89\xe8\x9a\xfc\xfc\x7c\xc4\xc5\xc7\x49\x1d\x9e\x07\x20\x58\x5c\
-\x37\x37\xd2\x54\x00\x20\x22\xef\xe6\xef\xef\x8f\xa6\xc9\x4d\xd1\
-\xa6\x4d\x1b\x74\xed\xda\x15\xf5\xeb\xd5\x57\xba\x25\xf2\x62\x0c\
-\x00\x0c\x00\x44\xa4\x90\xc4\xc4\x44\xa4\x0e\x4a\xc5\x80\xfe\x03\
-\xe0\xe7\xe7\xa7\x74\x3b\xe4\x65\x18\x00\x18\x00\x88\x48\x61\x51\
-\x51\x51\x78\x76\xf4\xb3\x18\x9c\x3a\x18\x3e\x3e\x7c\x84\x98\xdc\
-\x43\xed\x01\xc0\x23\x9f\x02\x20\x22\x2a\x8f\x0b\x17\x2e\xe0\xf9\
-\x17\x9e\x47\xe7\xae\x9d\xb1\x7b\xf7\x6e\xa5\xdb\x21\x52\x05\x06\
-\x00\x22\xf2\x1a\xbb\x77\xef\x46\x4a\xb7\x14\x7c\xf6\xf9\x67\x70\
-\xf2\x54\x51\xf2\x72\x0c\x00\x44\xe4\x55\x2c\x16\x0b\x5e\x7a\xf9\
-\x25\x8c\x7a\x7a\x14\x6c\x36\x9b\xd2\xed\x10\x29\x86\x01\x80\x88\
-\xbc\xd2\x37\x0b\xbe\xc1\xb0\xe1\xc3\x18\x02\xc8\x6b\x31\x00\x10\
-\x91\xd7\x5a\xf9\xfd\x4a\x3c\x35\xea\x29\xde\x0e\x20\xaf\xc4\x00\
-\x40\x44\x5e\xed\xdb\xc5\xdf\xe2\xfd\x0f\xde\x57\xba\x0d\x22\xb7\
-\x53\x75\x00\xd0\xeb\x78\xb0\x2f\x11\xb9\xde\xbb\x13\xdf\xc5\xe6\
-\xcd\x9b\x95\x6e\x83\xc8\xad\x54\x1d\x00\xbe\x6d\xd6\x01\x77\x47\
-\xc5\xf0\x7c\x7f\x22\x72\x29\xbb\xdd\x8e\x91\x4f\x8e\x44\x61\x61\
-\xa1\xd2\xad\x10\xb9\x8d\xaa\x03\x40\x8d\x80\x60\x7c\x94\xd4\x12\
-\x8b\x9b\x77\x44\xab\xf0\x28\xa5\xdb\x21\x22\x0d\x3b\x7d\xfa\x34\
-\x3e\xf8\xf0\x03\xa5\xdb\x20\x72\x1b\x55\x9f\x04\xb8\xb3\x43\x0f\
-\x04\x18\xfe\xf7\x42\x9f\x03\x79\x39\x58\x78\xfa\x28\x56\x9d\x3f\
-\x85\xcb\xd6\x12\x51\xfd\x11\x11\x01\x00\x4c\x26\x13\x76\x6c\xdf\
-\x81\x88\x88\x08\xa5\x5b\x21\x0d\xe0\x49\x80\x02\xd5\x09\x0a\xc1\
-\xab\x75\x1b\xe3\xf7\xbb\xee\xc3\xec\xa6\xed\x30\x34\xae\x36\x1a\
-\x86\x84\xc1\xa0\xf3\xa8\xff\x19\x44\xa4\x52\xc5\xc5\xc5\x98\xfe\
-\xc9\x74\xa5\xdb\x20\x72\x0b\x8f\x5a\x01\xb8\x15\xab\xc3\x81\x23\
-\x05\xb9\x38\x5a\x90\x87\x8b\x25\xc5\xc8\xb0\x14\xa3\xc0\x66\x83\
-\xdd\xc7\x00\x9d\x2f\x5f\xa7\x4b\xa4\x55\x05\x56\x0b\xce\x15\xe6\
-\x61\x4f\xe6\x79\x14\xd9\xac\x42\x6a\x86\x86\x86\x62\x5f\xfa\x3e\
-\xf8\xfa\xfa\x0a\xa9\x47\xde\x4b\xed\x2b\x00\xa5\x5f\x5d\x3d\x80\
-\x51\xaf\x47\x9d\xa0\x50\xd4\x09\x0a\xbd\xee\xe7\x7d\xfc\x83\xe1\
-\x13\xc2\xa5\x3c\x22\xad\x2b\xb6\xdb\xb0\xfa\xe4\x41\x7c\xb0\x73\
-\x13\x8e\xe6\x66\xc9\xaa\x95\x9d\x9d\x8d\xd5\x6b\x56\xe3\xbe\x7b\
-\xef\x13\xd4\x1d\x91\x3a\x71\xed\x9c\x88\x3c\x9e\xc9\xc7\x80\xee\
-\xd5\xeb\x61\x4d\xf7\x47\xf1\x50\x42\x23\xd9\xf5\x56\x7e\xbf\x52\
-\x40\x57\x44\xea\xc6\x00\x40\x44\x9a\x61\xd4\xfb\xe0\xed\x96\x29\
-\x78\xb4\xde\x1d\xb2\xea\xfc\xfa\xeb\xaf\x3c\x1d\x90\x34\x8f\x01\
-\x80\x88\x34\xe7\xa5\xa6\x1d\xd0\x24\xa2\x8a\xe4\xf1\x97\x2e\x5d\
-\xc2\x91\x23\x47\x04\x76\x44\xa4\x3e\x0c\x00\x44\xa4\x39\x3e\x3a\
-\x1d\x5e\x6e\xda\x41\x56\x8d\x83\x87\x0e\x0a\xea\x86\x48\x9d\x18\
-\x00\x88\x48\x93\x92\x23\xab\xa0\x66\x48\xb8\xe4\xf1\x5c\x01\x20\
-\xad\x63\x00\x20\x22\xcd\x6a\x57\x25\x5e\xf2\xd8\x8c\x8c\x0c\x81\
-\x9d\x10\xa9\x0f\x03\x00\x11\x69\x56\x95\x00\xe9\x8f\x51\x17\x14\
-\x14\x08\xec\x84\x48\x7d\x18\x00\x88\x48\xb3\x42\xfc\xa4\x1f\x04\
-\x56\x5c\x5c\x2c\xb0\x13\x22\xf5\x61\x00\x20\x22\x22\xf2\x42\x0c\
-\x00\x44\x44\x44\x5e\x88\x01\x80\x88\x88\xc8\x0b\x31\x00\x10\x11\
-\x11\x79\x21\x06\x00\x22\x22\x22\x2f\xc4\x00\x40\x44\x44\xe4\x85\
-\x18\x00\x88\x88\x88\xbc\x10\x03\x00\x11\x11\x91\x17\x62\x00\x20\
-\x22\x22\xf2\x42\x0c\x00\x44\x44\x44\x5e\x88\x01\x80\x88\x88\xc8\
-\x0b\x31\x00\x10\x11\x11\x79\x21\x06\x00\x22\x22\x22\x2f\xc4\x00\
-\x40\x44\x44\xe4\x85\x18\x00\x88\x88\x88\xbc\x90\x41\xe9\x06\xbc\
-\x51\x81\xd5\x82\xbf\xb2\x2f\x21\xa3\xb8\x10\x56\xbb\x5d\x76\x3d\
-\x93\xc1\x00\x7f\x83\x11\x81\x46\x3f\x44\xfb\x07\x21\xc2\x1c\x20\
-\xa0\x4b\x52\xa3\x7c\x6b\x09\xec\x4e\xa7\xcb\xe7\x31\xe8\xf4\x08\
-\x30\xfa\xba\x7c\x1e\x22\x52\x0e\x03\x80\x1b\x1d\xb8\x7c\x09\x53\
-\x76\xfe\x8a\x9f\xcf\x1c\x81\x45\xc0\x85\xff\x56\x02\x8d\x7e\xa8\
-\x15\x12\x8e\x3b\xa2\x62\xd1\x2a\xba\x2a\x5a\x56\xaa\x06\x93\x8f\
-\x3a\xff\xaf\xb6\x3b\x9d\x48\xcf\x3c\x8f\xf3\x85\x79\xb0\x39\x1c\
-\x42\x6a\x1a\xf4\x57\x2e\x5e\x41\x46\x3f\x54\x34\xf9\xa3\x72\x60\
-\x08\x74\x42\x2a\xbb\x9f\xcd\xe9\xc0\x92\xc3\x7b\xb0\xf4\xe8\x5e\
-\xec\xbc\x74\x16\xc5\x76\x9b\xdb\xe6\xf6\x37\x18\x91\x1c\x59\x05\
-\xbd\x6a\x34\x40\xf7\xea\xf5\xa0\xd7\x79\xea\xaf\x22\x11\xdd\x8c\
-\x3a\xaf\x0a\x1a\x34\xef\xe0\x4e\x8c\xdb\xba\x46\xd8\x45\xee\x76\
-\xf2\xad\x25\xd8\x91\x71\x16\x3b\x32\xce\xe2\xf3\xbd\x5b\x11\x68\
-\xf4\x43\xb7\x6a\xb5\xf1\x60\xad\x86\xb8\x23\x32\xc6\xe5\xf3\x97\
-\x45\x81\xd5\x82\x4f\xf7\x6e\xc5\xdc\x03\x69\xc8\x2a\x29\x72\xe9\
-\x5c\x66\x83\x11\xf1\xc1\x61\x48\x08\xad\x88\x96\xd1\x55\xd1\xa6\
-\x52\x1c\xaa\x04\x86\xb8\x74\x4e\x11\x8e\xe7\x5d\xc6\xf0\xf5\x4b\
-\xf1\x57\xf6\x25\x45\xe6\x2f\xb4\x59\xf1\xeb\xd9\xe3\xf8\xf5\xec\
-\x71\xcc\xda\xbf\x0d\x9f\xde\xd5\x03\x95\x03\x82\x15\xe9\x85\x88\
-\xc4\x63\x00\x70\x83\xa5\x47\xd2\x31\xf6\xf7\x9f\x14\x9b\x3f\xdf\
-\x5a\x82\x45\x87\x77\x63\xd1\xe1\xdd\x68\x1a\x19\x83\xa7\x1a\xb6\
-\xc2\x5d\x55\xe2\x15\xeb\xe7\x58\xee\x65\x0c\x59\xff\x2d\x8e\xe6\
-\x64\xb9\x65\xbe\x22\x9b\x15\x7b\xb3\x2e\x60\x6f\xd6\x05\x7c\x77\
-\x74\x2f\x00\x20\x3e\x38\x0c\xdd\xe3\xeb\xe1\xc1\x9a\x0d\x55\x79\
-\x51\x3b\x95\x9f\x8d\x9e\x3f\x7c\x8d\xcc\xe2\x42\xa5\x5b\x01\x00\
-\xec\xca\x38\x87\x5e\x3f\xce\xc5\x8a\x7b\x52\x79\x8b\x89\x48\x23\
-\xb8\x09\xd0\xc5\x2e\x15\x15\xe0\xa5\x2d\xab\x95\x6e\xe3\x9a\x6d\
-\x17\x4f\x23\x75\xed\x22\xa4\xae\x5d\x84\xe3\x79\x97\xdd\x3e\x7f\
-\x56\x49\x11\x06\xfe\x77\xa1\xdb\x2e\xfe\xb7\x72\x34\x37\x0b\xef\
-\xef\xdc\x84\xd6\x4b\x3e\x41\xea\xda\x45\xf8\xf3\xe2\x69\x45\xfb\
-\xf9\x27\x27\x80\x27\x37\x2e\x57\xcd\xc5\xff\xaa\xb3\x05\xb9\x78\
-\x76\xd3\xf7\x4a\xb7\x41\x44\x82\x30\x00\xb8\xd8\xcc\xfd\x7f\xa2\
-\xd0\x66\x55\xba\x8d\x1b\x6c\x38\x73\x14\x5d\x96\x7f\x89\x39\x7f\
-\xa5\xb9\x75\xde\xf1\x7f\xae\xc7\xa9\xfc\x6c\xb7\xce\x79\x3b\x0e\
-\xa7\x13\x1b\xce\x1c\x45\xef\x1f\xe7\x62\xf0\xba\x6f\xb1\x2f\xeb\
-\x82\xd2\x2d\x61\xcd\xc9\x83\xd8\x99\x71\x4e\xe9\x36\x6e\xea\x97\
-\xb3\xc7\xb0\xe5\xc2\x49\xa5\xdb\x20\x22\x01\x18\x00\x5c\x6c\xcd\
-\xc9\x43\x4a\xb7\x70\x4b\x25\x76\x1b\x5e\xd9\xb2\x06\x8f\x6f\xf8\
-\xce\x2d\x21\xe5\x5c\x61\x1e\xbe\x3b\x9a\xee\xf2\x79\xa4\xfa\xf9\
-\xf4\x11\xdc\xfb\xfd\x57\x78\x67\xfb\x06\x97\x6e\xd2\x2c\xcd\xaa\
-\xe3\x07\x14\x9b\xbb\x2c\x56\x1d\x53\x77\x7f\x44\x54\x36\x0c\x00\
-\x2e\xe4\x70\x3a\x71\x3c\xd7\xfd\xcb\xec\xe5\xf5\xe3\x89\xbf\xd0\
-\x6f\xf5\x7c\x97\x2f\x39\xff\x7c\xfa\x88\x5b\x1e\x61\x93\xc3\xee\
-\x74\xe2\xd3\xf4\x2d\xb8\xe7\xfb\x59\x8a\xad\x06\xa4\xab\x60\x15\
-\xe2\x76\xd4\xde\x1f\x11\x95\x0d\x03\x80\x0b\x15\xd9\xac\xb0\x39\
-\x5d\xbf\xeb\x5f\x84\x5d\x19\xe7\xf0\xe0\x4f\xf3\x5c\xba\x23\xff\
-\x98\x07\x84\xa1\xab\x0e\x66\x67\xe0\x81\x1f\xbe\xc6\x8a\x63\xfb\
-\xdd\x3e\xf7\x65\x95\xdd\xfb\xff\xb7\x1c\x4b\xb1\xd2\x2d\x10\x91\
-\x00\x0c\x00\x2e\xe4\x84\xba\x3f\xed\xfe\xdb\xe1\x9c\x4c\xa4\xfe\
-\x77\x21\x0a\xac\x16\x97\xd4\xcf\xb7\x96\xb8\xa4\xae\xab\x94\xd8\
-\x6d\x78\xfa\xd7\x15\x98\xb1\xf7\x0f\xb7\xce\xeb\x50\xf9\xef\x9b\
-\x70\x93\xbf\xd2\x2d\x10\x91\x00\x0c\x00\x74\x9d\xdd\x99\xe7\x31\
-\xea\xd7\x15\x2a\xbf\x04\xb9\x8f\xc3\xe9\xc4\x5b\xdb\xd6\x63\xfa\
-\x9e\x2d\x4a\xb7\xa2\x1a\xc9\x11\x55\x94\x6e\x81\x88\x04\x60\x00\
-\xa0\x1b\xac\x3d\x75\x18\x5f\xee\xfb\x53\xe9\x36\x54\xe5\xdd\xb4\
-\x0d\xf8\x82\xbf\x26\xd0\x01\xe8\x5e\xbd\x9e\xd2\x6d\x10\x91\x00\
-\x0c\x00\x74\x53\x13\xb6\x6f\xc0\xe1\x9c\x4c\xa5\xdb\x50\x95\xf1\
-\xdb\xd6\x63\xf5\xc9\x83\x4a\xb7\xa1\xa8\x9e\x35\x12\x51\x37\x2c\
-\x52\xe9\x36\x88\x48\x00\x06\x00\xba\x29\xab\xc3\x8e\x97\x7e\x5f\
-\xcd\x5b\x01\xff\xe0\x70\x3a\xf1\xdc\x6f\x3f\xe0\x44\x9e\x7a\xce\
-\x31\x70\xa7\x06\xe1\xd1\x78\xab\x45\x57\xa5\xdb\x20\x22\x41\x18\
-\x00\xe8\x96\xb6\x5c\x38\x89\xb5\xa7\xd4\x7b\x8e\x81\x12\x72\x2d\
-\xc5\x18\xb9\x71\x19\x4a\xdc\xf8\x52\x1e\xa5\x5d\x5d\xf6\x5f\x98\
-\x32\x00\xfe\x06\xa3\xd2\xed\x10\x91\x20\x7c\x17\x80\x4a\xf9\xe8\
-\x74\x48\xa9\x56\xbb\x4c\xdf\x5b\x64\xb3\xe2\x7c\x61\x3e\xce\x16\
-\xe4\x20\xbb\x44\xec\x23\x5a\x1f\xed\xfa\x0d\x9d\x63\x6b\x09\xad\
-\xe9\xe9\xd2\x33\xcf\x63\xea\x9e\xdf\x31\xa6\x51\x5b\xa5\x5b\xb9\
-\x41\xb0\xaf\x49\xc8\x9b\x0f\x8d\x3e\x3e\x88\x34\x07\xa2\xe9\xdf\
-\x6f\x03\x6c\x54\xb1\x92\x80\xaa\x44\xa4\x26\x0c\x00\x2a\xe5\xa3\
-\xd7\x63\x7a\xbb\x07\xca\x35\xc6\xe1\x74\x62\x67\xc6\x59\xac\x3a\
-\x7e\x00\xf3\x0e\xee\x44\x91\x80\xd3\xfd\x76\x67\x9e\xc7\x6f\xe7\
-\x8e\xa3\x75\xa5\x38\xd9\xb5\xe4\x48\x0c\x8f\x46\xb5\xa0\xd0\x32\
-\x7d\x6f\x89\xdd\x86\x3c\x4b\x09\x8e\xe7\x5d\xc6\x85\xc2\x7c\x97\
-\xf4\xf3\x69\xfa\x16\xf4\xa8\x5e\x1f\xf1\x21\x61\x2e\xa9\x2f\xd5\
-\xaf\x3d\x1f\x47\xa8\x9f\x49\xe9\x36\x88\xc8\x03\x30\x00\x68\x88\
-\x5e\xa7\x43\x93\x88\x2a\x68\x12\x51\x05\x8f\x25\x36\xc7\xf8\x6d\
-\x3f\x63\xd9\xdf\x6f\xbf\x93\xe3\xdb\xc3\x7b\x14\x0f\x00\xfd\x6a\
-\x25\x61\x60\xed\xc6\xe5\x1e\x97\x59\x5c\x88\xdf\xce\x9d\xc0\xaa\
-\x13\x07\xb0\xee\xd4\x61\x58\x1d\x62\x8e\xf8\xb5\xd8\xed\x78\x65\
-\xeb\x1a\xcc\xeb\xd2\x4f\x48\x3d\x22\x22\x77\xe3\x1e\x00\x95\x92\
-\x7b\x62\x6e\xa4\x39\x10\x1f\xb6\xbd\x0f\xaf\x37\xeb\x0c\x1f\x9d\
-\xbc\x45\xe1\x9f\x4e\x1e\x44\x81\xcd\x35\x87\x03\x95\x95\xd4\x43\
-\x95\xc2\x4d\xfe\xb8\xbf\x7a\x5d\x7c\x76\x57\x0f\x6c\xec\x31\x1c\
-\x0f\x25\x34\x82\x5e\xe6\xaf\xc7\x55\x9b\xce\x1d\xc7\xa6\x73\xc7\
-\x85\xd4\x22\x22\x72\x37\x06\x00\x95\x12\x75\x8a\xe0\xe0\xba\xc9\
-\xb2\x77\x6e\x17\xd9\xac\xf8\xe3\xfc\x29\x21\xfd\x28\xa9\x4a\x60\
-\x08\xde\x6e\x99\x82\x6f\x53\x1e\x42\xd5\x32\xde\x4e\x28\xcd\xc7\
-\xbb\x36\x0b\xa9\x43\x44\xe4\x6e\x0c\x00\x5e\x60\x40\x42\x23\x3c\
-\x58\xab\xa1\xac\x1a\x5a\xfa\xa4\xdb\x34\x32\x06\x2b\xef\x19\x8c\
-\x3b\x22\x63\x64\xd7\xda\x72\xe1\x24\xfe\xb8\xe0\xf9\xe1\x88\x88\
-\xbc\x0f\x03\x80\x5a\x09\x7e\x00\xff\x85\x26\x77\x21\xc8\xd7\x4f\
-\xf2\xf8\xed\x97\xce\x08\xec\x46\x02\xc1\xbf\x1e\xa1\x7e\x26\xcc\
-\xe9\xdc\x17\x49\x02\x76\xb7\xcf\xdc\xbf\x4d\x40\x47\x44\x44\xee\
-\xc5\x00\xa0\x52\xa2\x5f\x24\x14\x6e\xf2\xc7\xc3\x09\xe5\xdf\x44\
-\x77\xd5\xd1\x9c\x2c\x81\xdd\x94\x9f\x2b\x5e\xac\xe4\x6f\x30\x62\
-\x56\xc7\x3e\xa8\x1c\x10\x2c\xab\xce\xda\x53\x87\x71\xd9\x85\x6f\
-\x51\x24\x22\x72\x05\x06\x00\x95\x72\xc5\x09\x7c\xf7\xc4\xd5\x91\
-\x3c\x36\xc7\x52\x8c\x4c\x05\x5f\x53\xab\x13\xf2\x74\xfb\x8d\xc2\
-\x4d\xfe\xf8\xb0\xed\x7d\xb2\x36\x06\x5a\x1d\x76\x2c\x3f\xba\x4f\
-\x60\x57\x44\x44\xae\xc7\x00\xe0\x45\x1a\x84\x47\x23\xd0\x28\xfd\
-\x36\x80\x92\x9f\x72\x5d\xf9\x6a\xe5\x66\x51\xb1\xe8\x5b\x2b\x49\
-\x56\x8d\xa5\x47\xd3\x05\x75\x43\x44\xe4\x1e\x0c\x00\x2a\xe5\x94\
-\xfb\x1c\xe0\x2d\x54\x0e\x08\x92\x3c\x36\xdf\xaa\xdc\xa3\x80\x2e\
-\xfa\xe5\xb8\x66\x4c\xa3\xb6\x08\x30\xf8\x4a\x1e\xbf\x27\xf3\xbc\
-\xa2\x2b\x24\x44\x44\xe5\xc5\x00\xa0\x52\xae\xba\xde\xc9\x59\x01\
-\xb0\x68\xf8\xfc\xfb\x08\x73\x00\xfa\x25\x48\x5f\x05\x70\x38\x9d\
-\xf8\xf5\xec\x31\x81\x1d\x11\x11\xb9\x16\x03\x80\x97\x39\x5f\x98\
-\x27\x79\x6c\xa0\x51\xfa\x27\x64\xb9\x5c\x79\x0b\xe0\xaa\x47\xea\
-\x26\xcb\xda\x0b\xb0\xe1\xcc\x51\x81\xdd\x10\x11\xb9\x16\x03\x80\
-\x8a\x89\xbe\xe4\x15\xd8\x2c\xb8\x58\x24\xfd\x6c\xfc\x00\x19\xab\
-\x07\x9e\x20\x36\x30\x14\xcd\xa3\xaa\x4a\x1e\xbf\x95\xe7\x01\x10\
-\x91\x07\x61\x00\xf0\x22\xeb\x4e\x1d\x81\xcd\xe1\x90\x34\x56\xaf\
-\xd3\x21\xda\x3f\x50\x70\x47\x65\xe7\xfa\xcf\xff\x57\xdc\x57\xbd\
-\xae\xe4\xb1\x67\x0b\x72\xf9\x38\x20\x11\x79\x0c\x06\x00\x15\x13\
-\xbd\x11\x70\xc9\x91\x3d\x92\xc7\xc6\x04\x86\xc0\xcf\x47\xfb\xef\
-\x8e\xea\x10\x53\x43\xd6\xf8\xbd\x59\x17\x04\x75\x42\x44\xe4\x5a\
-\x0c\x00\x2a\x26\xf2\xf2\xff\xeb\xd9\xe3\xb2\xee\x51\xd7\x0e\x8d\
-\x10\xd8\x4d\xf9\xb9\xea\xa9\x88\x7f\xab\xe4\x1f\x24\xeb\x15\xbf\
-\x7b\x33\x19\x00\x88\xc8\x33\x68\xff\x23\x9d\x07\xbb\xb2\xf1\x4d\
-\xfe\x01\x38\x59\x25\x45\x78\x69\xcb\x4f\xb2\x6a\xb4\x88\x96\x7e\
-\x6f\xdc\xd3\x24\x86\x45\x49\x3e\xf9\xf0\x58\xde\x65\xc1\xdd\x94\
-\xcf\x3d\xdf\xcf\x92\xb5\x91\xd1\xec\x63\x44\x94\x7f\x20\x9a\x45\
-\xc5\xe2\x81\xf8\x7a\x88\x0d\x14\xf3\xd2\x24\x22\x52\x1f\x06\x00\
-\x35\x13\x70\xfd\x2f\xb4\x59\x31\x7c\xfd\x12\x9c\xc8\xcb\x96\x55\
-\xa7\x75\xa5\x6a\xf2\x1a\xf1\x20\xb5\x42\x2a\x4a\x1e\x7b\xae\x20\
-\x57\x60\x27\xe5\x77\x3a\x3f\x47\x76\x8d\xbf\xb2\x2f\xe1\x97\xb3\
-\xc7\xf0\xe1\xae\xdf\x30\xa4\x5e\x53\xfc\x5f\x93\x76\x30\xe8\xb8\
-\x58\x48\xa4\x35\xfc\x53\xad\x66\x32\x2f\xfe\x67\x0b\x72\xf1\xe0\
-\x4f\xf3\xf0\xe7\xc5\xd3\xb2\xea\x54\x0f\xae\x80\x3a\x15\x22\xe5\
-\x35\x23\x93\xbb\x36\x01\x02\x40\x42\xa8\x9c\x00\x20\xfd\x31\x4b\
-\xb5\xb1\x3a\xec\xf8\x2c\x7d\x2b\x86\xad\x5f\x02\x9b\x53\xda\xe6\
-\x51\x22\x52\x2f\x06\x00\x15\x93\x7a\xdf\xbb\xc0\x66\xc1\x87\xbb\
-\x7e\x43\xa7\xe5\x5f\x60\x4f\xe6\x79\xd9\x7d\xf4\xaa\xd1\xc0\x45\
-\x27\xf1\x97\x9d\x3b\xce\x01\xb8\x2a\x41\xc6\x7e\x87\xb3\x85\xca\
-\xae\x00\xb8\xc2\xfa\xd3\x47\x30\x79\xc7\x2f\x4a\xb7\x41\x44\x82\
-\xf1\x16\x80\x8a\xe5\x94\x14\xc3\xe8\xe3\x73\xc3\xcf\xdb\x9d\x4e\
-\xe4\x5b\x4a\xae\xfb\x71\x46\x71\x01\x4e\xe6\x65\x63\xc3\x99\x23\
-\xd8\x70\xe6\x18\x72\x2d\xc5\x42\x7a\xf0\xf5\xf1\x41\x9f\x9a\x0d\
-\x84\xd4\xf2\x14\x51\x32\x1e\x77\xcc\xb3\x94\xc0\xe6\x74\x68\x6e\
-\xc9\xfc\x8b\x7d\x7f\x62\x60\xed\x26\xb2\xdf\x9c\x48\x44\xea\xc1\
-\x00\xa0\x62\xc9\x8b\x3e\x56\xba\x05\xf4\xab\x99\x84\x68\x7f\xe9\
-\xef\x0f\xf0\x44\xfe\x46\x5f\xe8\x75\x3a\x38\x24\xae\xc0\x94\xd8\
-\x6d\x30\xc8\x78\xaf\x80\x1a\x59\xec\x76\x2c\x3f\xb6\x0f\x23\x12\
-\x5b\x28\xdd\x0a\x11\x09\xa2\xad\x8f\x29\x24\x94\xd9\x60\xc4\x88\
-\x06\xde\xf7\x17\xbe\x0e\x80\xbf\x8c\x0b\x78\xb1\x4d\x9b\xef\x4c\
-\xd8\x26\x73\x2f\x09\x11\xa9\x0b\x03\x00\xdd\xd2\x53\x0d\x5b\xa9\
-\x67\xc9\xd7\x9d\xbb\x00\x01\x04\xc9\x78\xef\x41\xb1\xcd\x2a\xb0\
-\x13\xf5\xb8\x54\x54\xa0\x74\x0b\x44\x24\x10\x03\x00\xdd\x54\xed\
-\xd0\x08\x0c\xaf\xdf\x4c\xe9\x36\xae\x71\xe7\x26\x40\x00\xb2\x4e\
-\x3d\xb4\x6a\x74\xc7\x7c\xb0\xaf\xb6\xdf\x05\x41\xe4\x6d\x18\x00\
-\xe8\x06\xfe\x06\x23\xa6\xb5\xeb\x0e\xa3\xfe\xc6\x0d\x88\xde\xa2\
-\x58\xc6\xab\x8f\xcd\x3e\x46\x81\x9d\xa8\x87\xd2\xa7\x41\x12\x91\
-\x58\x0c\x00\x74\x1d\x1d\x80\x77\x5b\x75\x43\x2d\x19\xcf\xc2\x6b\
-\x41\xb1\x5d\xfa\x32\xbe\xd9\xa0\xcd\xbd\xb5\xdd\xaa\xd5\x51\xba\
-\x05\x22\x12\x88\x01\x80\xae\xf3\x52\xd3\x0e\xb8\x5f\xc6\x1b\xf1\
-\x5c\xc5\x4d\xaf\x02\x00\x00\x38\x9c\x4e\xe4\x5b\x2d\x92\xc7\x9b\
-\x0d\xda\x5b\x01\xb8\xab\x4a\x3c\x92\x23\xab\x28\xdd\x06\x11\x09\
-\xc4\x00\x40\xd7\x8c\x69\xd4\x16\xc3\x54\x74\xdf\xff\x9f\xdc\xb9\
-\x07\x20\xb3\xb8\x50\xf2\x6b\x93\x4d\x3e\x06\xcd\xdd\x3a\x89\xf6\
-\x0f\xc2\xc4\x56\xdd\x94\x6e\x83\x88\x04\xd3\xe6\x5a\x25\x95\x8b\
-\x8f\x4e\x87\x37\x9a\x77\xc1\xc3\xb5\x1b\x2b\xdd\x8a\x2a\x9c\x2b\
-\x94\x7e\x9c\xaf\x6a\x9e\x9a\x10\xa4\x4e\x85\x08\xcc\x68\xdf\x4b\
-\xd6\xe1\x48\x44\xa4\x4e\x0c\x00\x5e\x2e\xdc\xe4\x8f\x0f\xda\xde\
-\x87\x3b\x2b\x57\x57\xba\x15\xd5\x38\x94\x9d\x21\x79\xac\x16\x02\
-\x80\x0e\x40\xc3\x8a\x95\xd0\xa7\x66\x43\xf4\xaf\x95\x04\x83\x9e\
-\x0b\x85\x44\x5a\xc4\x00\xe0\xc5\xee\xae\x56\x1b\xe3\x5b\x74\x45\
-\xb8\xc9\x5f\xe9\x56\x4a\xe5\xce\x87\x00\xf7\x67\x5d\x94\x3c\xb6\
-\x4a\x60\x88\xc0\x4e\xca\x6f\xd5\xbd\x83\x11\xec\x6b\x92\x3c\x5e\
-\xaf\xd3\xa1\xa2\x39\x00\x26\x19\x8f\x41\x12\x91\x67\xe0\x9f\x72\
-\x2f\x54\x33\x24\x1c\xe3\x9a\x75\x42\x3b\x0f\xfa\xd4\xef\xce\x4d\
-\x80\xbb\x33\xcf\x49\x1e\x5b\x2d\x28\x54\x60\x27\xe5\x17\x13\x18\
-\x8a\x50\x3f\xe9\x01\x80\x88\xbc\x07\x03\x80\x17\x49\x0c\x8f\xc6\
-\x88\xc4\x16\xe8\x56\xad\x36\xf4\x3a\xa5\xdf\xef\xa7\x4e\x85\x36\
-\x2b\x76\x64\x9c\x95\x3c\xbe\x61\x78\x25\x81\xdd\x10\x11\xb9\x0e\
-\x03\x80\xc6\x55\x0f\xae\x80\x4e\xb1\xb5\xd0\x2b\x3e\x11\x75\xc3\
-\x22\x95\x6e\x47\x32\x77\x3d\x05\xb0\xf9\xdc\x09\x58\xec\x76\x49\
-\x63\x75\x00\x12\xc3\xa3\xc4\x36\x44\x44\xe4\x22\x0c\x00\x2a\xa5\
-\x03\x6e\x79\x2f\xd7\xa0\xd7\x23\xe0\x5f\x67\xd5\xfb\x1b\x8c\xf0\
-\x37\xf8\xa2\x52\x40\x10\xe2\x83\xc3\x50\x2b\xa4\x22\x9a\x45\xc7\
-\xa2\x92\x97\xbd\xc9\x4f\xae\xe5\xc7\xf6\x4a\x1e\x1b\x13\x18\x8a\
-\x0a\x7e\x66\x81\xdd\x10\x11\xb9\x0e\x03\x80\x4a\x05\x18\xfd\xb0\
-\xbb\xff\x33\x4a\xb7\xe1\x55\x72\x2c\xc5\x58\x7d\xf2\x90\xe4\xf1\
-\x2d\xa3\xab\x0a\xec\x86\x88\xc8\xb5\xf8\x7c\x0f\xd1\xdf\xe6\x1c\
-\x48\x43\x89\x8c\x77\x00\xb4\x8f\x89\x17\xd8\x0d\x11\x91\x6b\x31\
-\x00\x90\x47\x70\xf5\x0e\x80\x02\x9b\x05\xb3\xf6\x6f\x93\x3c\xde\
-\xa0\xd7\xa3\x6d\x25\xcf\x79\xaa\x82\x88\x88\x01\x80\x3c\x82\xd3\
-\xc5\xcf\x01\xbe\xbf\x73\x13\x32\x8b\x0b\x25\x8f\x6f\x16\x15\x8b\
-\x20\xbe\x2e\x97\x88\x3c\x08\x03\x00\x79\xbd\x3d\x99\xe7\x65\x7d\
-\xfa\x07\x80\x3e\x35\x1a\x08\xea\x86\x88\xc8\x3d\x18\x00\xc8\xab\
-\xe5\x59\x4a\xf0\xc4\xc6\x65\x92\x5f\xfe\x03\x00\x41\xbe\x7e\xb8\
-\xbb\x5a\x6d\x81\x5d\x11\x11\xb9\x1e\x03\x00\x79\xad\x12\xbb\x0d\
-\xc3\x7e\x5e\x8a\x13\x79\xd9\xb2\xea\x3c\x50\xbd\x9e\x26\x5f\x01\
-\x4c\x44\xda\xc6\x00\x40\x1e\x41\xf4\x1e\x80\x02\xab\x05\xc3\xd6\
-\x2f\xc1\xef\xe7\x4f\xc8\xaa\xe3\xa3\xd3\x61\x48\xbd\x3b\x04\x75\
-\x45\x44\xe4\x3e\x3c\x07\x80\xbc\xce\xb1\xdc\xcb\x18\xb9\x71\x19\
-\xf6\x65\x5d\x90\x5d\xeb\xde\xea\x75\x11\x1f\x1c\x26\xa0\x2b\x22\
-\x22\xf7\x62\x00\x20\x8f\x20\xe2\xf3\xbf\xc5\x6e\xc7\xec\x03\xdb\
-\x31\x65\xe7\xaf\x28\xb4\x59\x65\xd7\xd3\xeb\x74\x78\xaa\x41\x2b\
-\x01\x9d\x11\x11\xb9\x1f\x03\x00\x69\x5e\x66\x71\x21\x96\x1e\x49\
-\xc7\x57\x07\xb6\xe3\x74\x7e\x8e\xb0\xba\x7d\x6b\x25\xa1\x56\x68\
-\x45\x61\xf5\x88\x88\xdc\x89\x01\x80\x3c\x42\x66\x71\x21\xf6\x64\
-\x9e\xbf\xe9\xd7\x1c\x4e\x27\xf2\xac\x25\xd7\x7e\x5c\x64\xb3\x22\
-\xab\xb8\x10\x87\xb2\x33\xb1\xfd\xd2\x19\xec\xca\x38\x0b\xbb\xe0\
-\x3d\x04\x61\x7e\x66\x3c\xdf\xa4\x9d\xd0\x9a\x44\x44\xee\xc4\x00\
-\x40\x1e\x61\xf6\x81\xed\x98\x7d\x60\xbb\xd2\x6d\x5c\xf3\x62\xd3\
-\xf6\x7c\xf1\x0f\x11\x79\x34\x3e\x05\x40\x54\x4e\x1d\x63\x6a\xa2\
-\x4f\xcd\x86\x4a\xb7\x41\x44\x24\x0b\x03\x00\x51\x39\x54\x0e\x08\
-\xc6\xe4\x36\xf7\x40\xa7\x74\x23\x44\x44\x32\x31\x00\x10\x95\x91\
-\x9f\x8f\x01\xd3\xef\x7a\x80\x4b\xff\x44\xa4\x09\x0c\x00\x44\x65\
-\xe0\xa3\xd3\xe1\xa3\xb6\xf7\xa1\x71\xc5\xca\x4a\xb7\x42\x44\x24\
-\x04\x03\x00\x51\x29\x74\x00\x26\xb4\xbc\x1b\x29\x3c\xef\x9f\x88\
-\x34\x84\x4f\x01\x90\xdb\x18\xf4\x9e\x97\x37\x0d\x7a\x3d\x26\xb6\
-\xea\x86\x5e\x35\x12\x95\x6e\x85\x88\x48\x28\x06\x00\x72\x9b\x48\
-\x73\xa0\xd2\x2d\x94\x4b\x80\xd1\x17\x9f\xdd\xd5\x13\x6d\x2b\xc7\
-\x29\xdd\x0a\x11\x91\x70\x9a\x0e\x00\x62\x8f\x7e\x29\x3f\xa3\xde\
-\x47\xf2\x58\x5f\x0f\xfc\xb4\x5c\x9a\xaa\x81\xa1\x4a\xb7\x50\x66\
-\x09\xa1\x15\x31\xb5\x5d\x77\xd4\x0e\x8d\x70\xfb\xdc\x66\x1f\x23\
-\xb2\x51\x5c\xee\x71\x3a\x00\x66\x83\xa6\xff\x48\x13\x91\x40\xda\
-\xbb\xca\xfc\x93\x53\xfa\x3b\xde\x45\xf0\xf3\x31\x20\xd8\xd7\x24\
-\x69\x6c\x94\x7f\x90\xe0\x6e\x94\x97\x14\x51\x49\xe9\x16\x4a\xa5\
-\x03\x30\xa8\x4e\x13\xac\xbc\x77\xb0\x22\x17\x7f\x00\xa8\x1c\x18\
-\x2c\x69\x5c\x45\x73\x00\xfc\x7c\x18\x00\x88\xa8\x6c\xb4\x1d\x00\
-\xec\x36\xa5\x3b\x40\xb3\xa8\x18\x89\xe3\x62\x05\x77\xa2\xbc\xb8\
-\xa0\x0a\x68\x1a\x29\xed\xd7\xc3\x1d\x12\xc3\xa3\xb1\x20\x65\x00\
-\xde\x6c\xde\x05\x26\x05\x2f\xa4\x6d\x2b\x55\x97\x34\xae\x5d\xe5\
-\x78\xc1\x9d\x10\x91\x96\x69\x3a\x00\x38\x6d\x16\xa5\x5b\xc0\x83\
-\x12\x4e\x8c\xd3\x01\xe8\x5d\xb3\x81\xf8\x66\x54\xe0\xa5\xa6\xed\
-\x61\xd0\xa9\xeb\xb7\x5d\xd5\xa0\x50\x4c\x6a\xdd\x0d\x2b\xef\x49\
-\x45\x8b\xa8\xaa\x4a\xb7\x83\xfe\x09\x49\x30\x1b\x8c\xe5\x1a\xa3\
-\x03\xf0\x50\xed\x46\xae\x69\x88\x88\x34\x49\x5d\x7f\x13\x0b\xe6\
-\x74\x38\xe0\x14\xf0\xda\x57\x39\xba\x54\x4d\x40\x8b\xe8\xf2\x5d\
-\x54\x7a\xd6\x48\x44\xc3\xf0\x68\x17\x75\xa4\xac\x26\x11\x55\xf0\
-\x5a\xf3\xce\x8a\x9f\xa4\xa7\xd7\xe9\x70\x67\xe5\xea\x98\xd9\xb1\
-\x37\x36\xf6\x78\x0c\x0f\xd6\x6c\x08\xbd\x4e\xe9\xae\xae\x88\xf6\
-\x0f\xc2\x33\x49\xad\xcb\x35\xe6\xa1\xda\x8d\xd1\x24\xa2\x8a\x8b\
-\x3a\x22\x22\x2d\xd2\xfc\x0d\x43\x47\x49\x01\x7c\x0c\xca\x6d\x3e\
-\xd3\x01\x98\xde\xee\x01\xf4\xfe\x69\x2e\x8e\xe6\x64\x95\x34\x0a\
-\xb7\x9b\x00\x00\x0b\x3f\x49\x44\x41\x54\xfa\xfd\x4d\x22\xaa\x60\
-\x7c\x8b\xae\xae\x6f\x4c\x41\x03\x6b\x37\x46\xa4\x39\x00\x63\xb7\
-\xac\x46\x46\x51\x81\xdb\xe6\x0d\x34\xfa\xa1\x55\x74\x55\x74\x8a\
-\xad\x89\x0e\x31\x35\x11\x61\x0e\x70\xdb\xdc\xe5\xf5\x58\x62\x0b\
-\x9c\x2f\xcc\xc7\xac\xfd\xdb\x4a\xfd\xde\xae\x55\x13\xf0\x5a\xb3\
-\x4e\x6e\xe8\x8a\x88\xb4\x44\xfb\x01\xa0\x30\x0f\x3e\x01\xca\xee\
-\x3e\x0f\x37\xf9\x63\x59\xb7\x41\x18\xfb\xfb\x4f\x58\x75\xfc\xc0\
-\x4d\x9f\x4e\xf0\xd1\xe9\x30\x20\xa1\x11\x5e\xb9\xa3\xa3\x57\x6c\
-\xe4\xea\x5a\x35\x01\x6d\x2a\xc7\xe1\xbb\x23\x7b\xf1\xcb\xd9\x63\
-\x38\x9e\x7b\x19\x45\xf6\x1b\x57\x6b\xcc\x3e\x46\xf8\xfa\xdc\xfe\
-\x69\x8a\x90\x7f\x6d\xb4\x34\xfa\xf8\xa0\x82\x9f\x19\xa1\xbe\x26\
-\x84\x99\xfc\x91\x10\x5a\x11\x75\x2b\x44\x22\x36\x28\x54\xf1\x95\
-\x87\xb2\xd2\x01\x78\xad\x59\x27\x34\xae\x58\x19\x13\xd2\x36\xe0\
-\x6c\x41\xee\x0d\xdf\x53\xc1\xcf\x8c\x51\x49\xad\x31\xb8\x4e\xb2\
-\x6a\x56\x2f\x88\xc8\x73\x68\xfe\x4a\xe3\xb4\x59\xe0\x28\xca\x83\
-\xde\xac\xec\xae\xfa\x10\x5f\x13\xa6\xb5\x7b\x00\x4f\x34\xb8\x80\
-\x95\xc7\xf7\x63\x6f\xe6\x05\x5c\x2e\x29\x42\x45\x73\x00\x1a\x55\
-\xac\x8c\xfb\xaa\xd7\x45\x7c\x70\x98\xa2\x3d\xba\x5b\x80\xc1\x17\
-\x0f\xd7\x6e\x8c\x87\x6b\x37\x56\xba\x15\xd5\xea\x1e\x5f\x0f\xf7\
-\x54\xaf\x83\xad\xe7\x4f\x22\xed\xd2\x59\x64\x15\x17\x22\xd4\xcf\
-\x8c\xfa\x61\x51\x68\x53\x39\x4e\xd1\xcd\x8a\x44\xe4\xd9\xbc\xe2\
-\x6f\x0f\x7b\x5e\x16\xf4\xa6\x40\x40\x05\x9f\x92\xea\x85\x45\xa1\
-\x5e\x58\x94\xd2\x6d\x90\x07\x31\xe8\xf4\x68\x5d\x29\x0e\xad\x2b\
-\xc5\x29\xdd\x0a\x11\x69\x88\xa6\x37\x01\x5e\xe5\xb4\xdb\x60\xcf\
-\x2f\xfd\xfe\x3b\x11\x11\x91\xb7\xf0\x8a\x00\x00\x00\xf6\xfc\x6c\
-\x38\x8a\xf2\x95\x6e\x83\x88\x88\x48\x15\xbc\x26\x00\x00\x80\x2d\
-\xe7\x22\x9c\x96\xf2\x1f\xb1\x4a\x44\x44\xa4\x35\x5e\x15\x00\xe0\
-\x74\xc2\x9a\x75\x16\x8e\xa2\x3c\xa5\x3b\x21\x22\x22\x52\x94\x77\
-\x05\x00\x00\x70\x3a\x61\xcb\xbe\x08\x7b\x5e\x26\xe0\x54\xfa\x75\
-\x41\x44\x44\x44\xca\xf0\xbe\x00\xf0\x37\x7b\x7e\x36\xac\x19\xa7\
-\xe0\x28\xe6\xbe\x00\x22\x22\xf2\x3e\x5e\xf1\x18\xe0\xad\x38\x6d\
-\x56\xd8\x2e\x5f\x80\xce\x27\x0b\x7a\x73\x10\xf4\x26\x7f\xe8\x8c\
-\x7e\x4a\xb7\x45\x44\x44\xe4\x72\xee\x08\x00\x76\xe9\x03\xdd\xb3\
-\x44\xef\xb4\x5b\x61\xcf\xcf\x82\x3d\x3f\x0b\x3a\x9d\x1e\x30\x18\
-\xa1\xd3\xfb\x00\x7a\xaf\x5d\x20\x21\xd2\x04\x47\xe1\x8d\x27\x28\
-\x12\xd1\x15\xee\x08\x00\x05\x00\x24\x9d\xc5\x5b\x64\xb7\x21\xb8\
-\x9c\x6f\x45\x93\xcb\xe9\x74\x00\xd6\x12\x37\x45\x0f\x22\x72\x25\
-\x07\x9f\xfa\x21\xba\x25\x77\x7c\xc4\x95\xbc\xe5\xfe\x62\x09\xff\
-\xf0\x12\x11\x11\xb9\x82\x3b\x02\x40\x8e\xd4\x81\x47\x6f\xf2\x02\
-\x14\x22\x22\x22\x92\xcf\x1d\x01\xe0\xa8\xd4\x81\x69\xd9\x99\x22\
-\xfb\x20\x22\x22\xa2\xbf\xb9\x23\x00\x1c\x90\x3a\x70\x63\xc6\x79\
-\xde\x8b\x27\x22\x22\x72\x01\x55\x07\x80\x33\x45\x05\xf8\xf3\xf2\
-\x25\x91\xbd\x10\x11\x11\x11\xdc\x13\x00\x36\xc9\x19\x3c\xeb\xc4\
-\x41\x51\x7d\x10\x11\x11\xd1\xdf\xdc\x11\x00\xce\x02\xf8\x4b\xea\
-\xe0\x75\x17\xcf\x62\x57\x0e\x5f\xe5\x4b\x44\xe5\x67\x93\x71\xdc\
-\xb7\x9e\xe7\x80\x90\xc6\xb9\xeb\x77\xf8\x3a\xa9\x03\x9d\x00\xc6\
-\xed\xdb\x0e\x9b\xd3\x21\xb0\x1d\x22\xf2\x06\x97\x4a\x8a\x24\x8f\
-\x0d\x0c\x0c\x14\xd8\x09\x91\xfa\xb8\x2b\x00\x2c\x92\x33\x78\x5f\
-\x5e\x36\x26\x1d\xdc\x23\xaa\x17\x22\xf2\x12\xfb\xf2\xb2\x25\x8f\
-\x0d\x0a\x0a\x12\xd8\x09\x91\xfa\xb8\x2b\x00\xfc\x02\xe0\xb8\x9c\
-\x02\x33\x4f\x1c\xc4\x82\xd3\x92\x9f\x28\x24\x22\x2f\x53\x64\xb7\
-\xe1\xd7\x8c\x0b\x92\xc7\xc7\xc4\xc4\x08\xec\x86\x48\x7d\xdc\x15\
-\x00\x9c\x00\x66\xcb\x2d\xf2\xda\xfe\x34\x7c\x73\xea\x88\x80\x76\
-\x88\x48\xeb\x66\x9e\x38\x88\x22\xbb\x4d\xf2\xf8\x5a\x35\x6b\x09\
-\xec\x86\x48\x7d\xdc\xb9\xcb\x65\x3a\x80\x42\x39\x05\xec\x4e\x27\
-\xc6\xed\x4f\xc3\x5b\x07\x76\xc2\xea\xe0\x9e\x00\x22\xba\xb9\x03\
-\x79\x39\xf8\xec\x98\xe4\xbd\xc7\x30\x18\x0c\xa8\x5f\xbf\xbe\xc0\
-\x8e\x88\xd4\xc7\x9d\x01\xe0\x22\x80\x19\x22\x0a\xcd\x3e\x79\x08\
-\x3d\xb6\xac\xc5\xb6\xcb\x19\x22\xca\x11\x91\x86\x1c\x2b\xcc\xc3\
-\xe3\x3b\x37\xc9\xfa\xf4\x9f\xd4\x30\x89\x7b\x00\x48\xf3\xdc\xfd\
-\x9c\xcb\x24\x00\xf9\x22\x0a\xfd\x95\x9f\x83\xfe\x7f\xfe\x8c\x21\
-\xdb\x7f\xc5\x2f\x19\xe7\x61\x97\xf1\xb8\x0f\x11\x79\x3e\x87\xd3\
-\x89\xef\xce\x9e\x40\xef\x2d\xeb\x70\xa6\x48\xd6\x62\x23\x3a\x76\
-\xec\x28\xa8\x2b\x22\xf5\xd2\x29\x30\xe7\x7f\x00\x4c\x14\x5d\xb4\
-\xa2\xaf\x09\x6d\x2a\x46\x21\x39\xb4\x22\xaa\xfb\x07\x21\xd2\xcf\
-\x84\x00\x83\x01\x7e\x7a\x1f\xd1\x53\x11\x91\x4a\x64\x5b\x2d\xb8\
-\x50\x52\x84\x3f\x2f\x5f\xc2\xaa\xf3\xa7\x70\x28\x5f\xcc\x0b\xc4\
-\xfe\xd8\xf2\x07\xe2\xe3\xe3\x85\xd4\x22\xef\x95\x9f\x9f\x8f\xb8\
-\xf8\x38\xa9\xc3\xf3\x00\x04\x8b\xeb\xe6\x46\x4a\x04\x00\x23\x80\
-\x1d\x00\x78\x83\x8d\x88\x54\xa7\x45\xf3\x16\xf8\x7e\xe5\xf7\x4a\
-\xb7\x41\x1a\xa0\xf6\x00\xa0\xc4\x51\x57\x56\x00\x03\x00\x48\x3f\
-\xa1\x83\x88\xc8\x45\x9e\x1e\xf5\xb4\xd2\x2d\x10\xb9\x85\x52\x67\
-\x5d\xee\xc6\x95\x5b\x01\x44\x44\xaa\xd1\xa8\x51\x23\x74\xea\xd4\
-\x49\xe9\x36\x88\xdc\x42\xc9\xc3\xae\xa7\x01\x98\xa7\xe0\xfc\x44\
-\x44\xd7\xe8\xf5\x7a\x4c\x78\x67\x02\x74\x3a\x25\xee\x8c\x12\xb9\
-\x9f\xd2\x6f\xbb\x18\x02\x60\x8d\xc2\x3d\x10\x11\x21\x75\x50\x2a\
-\x9a\x26\x37\x55\xba\x0d\x22\xb7\x51\x3a\x00\x58\x00\xf4\x02\xb0\
-\x45\xe1\x3e\x88\xc8\x8b\xd5\xab\x5b\x0f\x6f\xbe\xf1\xa6\xd2\x6d\
-\x10\xb9\x95\xd2\x01\x00\xb8\x72\x2e\x40\x67\x00\xab\x95\x6e\x84\
-\x88\xbc\x4f\x58\x85\x30\xcc\x9a\x39\x0b\x26\x93\x49\xe9\x56\x88\
-\xdc\x4a\x0d\x01\x00\xb8\x12\x02\xee\x03\x30\x47\xe9\x46\x88\xc8\
-\x7b\x98\xcd\x66\xcc\x9f\x3f\x1f\x35\x6a\xd4\x50\xba\x15\x22\xb7\
-\x53\x4b\x00\x00\xae\x3c\x1e\x98\xfa\xf7\x3f\xf2\x8e\xf1\x22\x22\
-\x2a\x45\x48\x48\x08\x16\x2d\x58\xc4\xfb\xfe\xe4\xb5\xd4\x14\x00\
-\xae\x9a\x03\xa0\x15\x80\x9d\x4a\x37\x42\x44\xda\x54\xad\x5a\x35\
-\x7c\xbf\xf2\x7b\xb4\x6c\xd9\x52\xe9\x56\x88\x14\xa3\xc6\x00\x00\
-\x00\xbb\x00\x34\x05\xf0\x34\x80\x1c\x85\x7b\x21\x22\x0d\xb9\xff\
-\xbe\xfb\xf1\xf3\xba\x9f\x51\xb7\x4e\x5d\xa5\x5b\x21\x52\x94\x5a\
-\x03\x00\x00\xd8\x01\x7c\x04\x20\x01\xc0\xbb\xb8\x72\x2c\x22\x11\
-\x91\x24\x31\x31\x31\x98\xfd\xd5\x6c\xcc\xfc\x72\x26\x82\x83\x5d\
-\x7a\xc2\x2a\x91\x47\xf0\xa4\x13\x2f\x2a\x00\x78\x1c\xc0\x20\x00\
-\x75\x14\xee\x85\x88\x3c\x44\xa5\x4a\x95\xf0\xc4\xc8\x27\x90\x3a\
-\x28\x15\x66\xb3\x59\xe9\x76\xc8\x8b\xa8\xfd\x5d\x00\x9e\x14\x00\
-\xfe\xa9\x39\x80\xde\x00\x3a\x02\x48\x82\xba\x57\x32\x88\xc8\xcd\
-\xcc\x66\x33\xda\xdf\xd5\x1e\x7d\xfb\xf6\x45\xe7\x4e\x9d\xe1\xeb\
-\xeb\xab\x74\x4b\xe4\x85\xd4\x1e\x00\x0c\xae\x2c\xee\x42\x5b\xff\
-\xfe\x07\x00\xc2\x71\x25\x10\xd4\xc5\x95\xdb\x05\x71\x7f\xff\x5c\
-\x20\x80\x20\x00\x2e\x8b\xfc\x46\xa3\xd1\xd7\xdf\xec\x1f\xe0\xaa\
-\xfa\xd0\x81\xc7\x92\x12\xdd\x46\x70\x50\x30\x02\x02\x02\x10\x14\
-\x14\x84\x9a\x35\x6b\xa2\x46\x8d\x1a\x68\x76\x47\x33\x24\x27\x27\
-\xf3\xa2\x4f\x54\x0a\x5e\x5d\x64\x38\x74\xe0\xd0\x43\x4e\x60\xae\
-\xab\xea\x1b\x7d\x8d\x08\x0a\x0c\x74\x55\x79\x22\x22\x72\x21\xb5\
-\xaf\x00\x70\xe9\x5c\xc5\x9c\x4e\xa7\xd2\x2d\x10\x11\x91\x46\x31\
-\x00\xa8\x98\xd3\xc1\x00\x40\x44\x44\xae\xc1\x00\xa0\x62\x0e\x87\
-\x83\xab\x00\x44\x44\xe4\x12\x0c\x00\x2a\xe6\x74\x3a\x61\xb3\xdb\
-\x95\x6e\x83\x88\x88\x34\x88\x01\x40\xe5\xac\x16\xab\xd2\x2d\x10\
-\x11\x91\x06\x31\x00\xa8\x9c\xc5\x62\xe1\x6d\x00\x22\x22\x12\x8e\
-\x01\x40\xe5\x1c\x0e\x07\x2c\x16\x8b\xd2\x6d\x10\x11\x91\xc6\x30\
-\x00\x78\x80\xc2\xc2\x22\xae\x02\x10\x11\x91\x50\x0c\x00\x1e\xc0\
-\xe9\x74\xa2\xa8\xa8\x58\xe9\x36\x88\x88\x48\x43\x18\x00\x3c\x44\
-\x71\x71\x31\x4a\x4a\x4a\x94\x6e\x83\x88\x88\x34\x82\x01\xc0\x83\
-\x14\x14\x14\xc2\x6a\xb3\x29\xdd\x06\x11\x11\x69\x00\x03\x80\x87\
-\xc9\xcf\xcb\x87\xd5\xca\x47\x03\x89\x88\x48\x1e\x06\x00\x0f\xe3\
-\x74\x3a\x91\x97\x97\x8f\xa2\x22\x6e\x0c\x24\x22\x22\xe9\x18\x00\
-\x3c\x54\x51\x51\x31\x72\x73\xf3\x60\xb5\xf2\x96\x00\x11\x11\x95\
-\x9f\x41\xe9\x06\x48\x3a\xbb\xdd\x8e\xbc\xbc\x3c\x18\x7c\x7c\xe0\
-\xeb\xe7\x0b\x5f\x5f\x5f\xe8\xf5\xcc\x74\x44\x44\x54\x3a\x06\x00\
-\x0d\xb0\xd9\xed\xb0\x15\x16\xa1\xb0\xb0\x08\x7a\xbd\x1e\x3e\x3e\
-\x3e\xd0\xeb\xf5\xd0\xe9\x74\x4a\xb7\x46\x44\xe4\xb5\x0a\x8b\x8a\
-\x94\x6e\xe1\xb6\x18\x00\xca\x47\x07\xe0\x01\x00\xff\xdf\xde\xfd\
-\xbc\xc6\x51\xc6\x71\x1c\x7f\x87\x08\x66\x03\x8a\x52\x31\x47\xd1\
-\x12\x89\x9e\x6c\x82\xa0\x1e\xaa\x78\xd0\x22\xa8\x17\x21\x1e\x6a\
-\xf4\xa2\x5e\x44\xbd\x68\x2f\xa9\x3f\xe2\x1f\x20\x45\x90\x8a\xf1\
-\x47\x41\x6c\x82\xe0\x41\x2a\x8d\x90\x5a\x15\x8c\xd0\x88\xa4\x5a\
-\x51\x13\xc8\xa2\xb1\x3f\xb2\x69\xb0\x25\x4d\x8c\x9b\xec\xae\x87\
-\x11\x44\x34\x99\xcd\xcc\xb3\x33\xd9\xf5\xfd\xba\xec\x65\x9f\xe7\
-\xf9\x30\x7b\x78\xbe\x33\xcf\xf3\xcc\x0e\x00\x77\x74\xf7\x74\x5f\
-\xdb\xd9\xd9\x49\x4f\xcf\x4d\xec\xb9\x77\x0f\xfd\xfd\xfd\x14\x3a\
-\x0a\xb9\x06\xac\x56\xab\x54\xab\xd5\x5c\x33\x48\x92\xe0\x8f\xd5\
-\xed\x7d\x74\xdb\x5b\xc4\xfa\x75\x01\xa3\xc0\x9d\x1b\x7e\xa1\xab\
-\x8b\x03\xaf\x1e\xa0\xb7\xb7\x2f\xbb\x54\x92\xa4\x6d\x69\x79\x79\
-\x99\x5d\x7d\xb7\x24\x6d\xbe\x04\x5c\x19\x30\xce\xbf\xb8\x60\x5c\
-\x9f\x6b\x80\x2f\xd9\x64\xf2\x07\x98\x9f\x9f\x67\xe0\xb1\x01\x4e\
-\x4c\x9e\xc8\x26\x95\x24\x49\x09\x59\x00\xd4\xe7\x2d\x60\x67\x3d\
-\x5f\x2c\x97\xcb\x3c\xf3\xec\xd3\x2c\x2d\x2d\x35\x38\x92\x24\x49\
-\xc9\x59\x00\xc4\xbb\x1d\x78\x60\x2b\x0d\x16\x17\x17\x79\xf7\xd0\
-\x3b\x0d\x8a\x23\x49\x52\x7a\x16\x00\xf1\x1e\x4e\xd2\xe8\xc8\xc7\
-\x47\x42\xe7\x90\x24\x29\x18\x0b\x80\x78\xbd\x49\x1a\x15\x8b\x45\
-\x56\x56\x56\x42\x67\x91\x24\x29\x08\x0b\x80\x78\x3b\x92\x36\x2c\
-\x95\xe6\x43\xe6\x90\x24\x35\x91\xf5\x4a\xaa\x37\xb5\x36\xfc\x3c\
-\xb7\x05\x40\xbc\xd5\xa4\x0d\x4b\x0b\x0b\x21\x73\x48\x92\x9a\xc8\
-\xf9\x85\xf3\x69\x9a\x5f\x0a\x95\x63\x23\x16\x00\xf1\x12\x6f\xe7\
-\x9f\x99\x9e\x0e\x99\x43\x92\xd4\x44\xa6\x67\x52\xcd\x01\x0d\x3f\
-\x4a\x66\x01\x10\xef\x97\xa4\x0d\xc7\x8f\x8d\x87\xcc\x21\x49\x6a\
-\x22\xc7\xd2\xcd\x01\x89\xe7\x9e\x7a\x59\x00\xc4\x4b\x5c\xc2\x4d\
-\x7c\x35\xc1\xd4\xc9\xa9\x90\x59\x24\x49\x4d\x60\x6e\x6e\x8e\xa3\
-\x63\x47\xd3\x74\xf1\x63\xa8\x2c\x1b\xb1\x00\x88\x97\x78\x06\xaf\
-\xd5\x6a\x0c\xbd\x32\xc4\xea\x6a\xe2\x6d\x04\x92\xa4\x26\x53\xa9\
-\x54\xd8\xff\xe2\x20\x6b\x6b\x6b\x69\xba\x39\x19\x2a\xcf\x46\x2c\
-\x00\xe2\x7d\x01\x54\x92\x36\x3e\x75\xea\x3b\x9e\xdf\xf7\x1c\xe5\
-\x72\x39\x60\x24\x49\xd2\x76\x54\xa9\x54\x78\x79\xe8\x25\x26\x26\
-\x26\xd2\x76\x75\x3c\x44\x9e\xcd\x58\x00\xc4\xbb\x08\xa4\x7a\xb9\
-\xff\xd8\x27\x63\x0c\x3c\xfa\x08\xb3\xb3\xb3\x81\x22\x49\x92\xb6\
-\x9b\xd3\x67\x4e\xf3\xc4\x93\x8f\x33\x32\x3a\x92\xb6\xab\x19\xa0\
-\x18\x20\xd2\xa6\xda\x1b\x3d\x40\x8b\xe8\x00\xee\x4b\xd3\xc1\xd9\
-\x73\x67\x39\x3c\x72\x98\x62\x71\x96\xb6\xb6\x36\x3a\x0a\x1d\x14\
-\x3a\x0a\xb4\xb7\xfb\x13\x48\x52\x33\x5a\x5f\x5f\xa7\x54\x2a\x31\
-\xf9\xf5\x24\xc3\xc3\x6f\x32\xb8\x7f\x90\x62\x31\xc8\xbc\xfd\x1a\
-\xf0\x79\x88\x8e\x36\xe3\xdf\x01\xd7\x67\x07\xf0\x2b\x51\x21\x20\
-\x49\x52\xa3\x54\x81\x6e\xa0\xe1\x8f\x8c\x5d\x02\xa8\xcf\x22\xf0\
-\x76\xde\x21\x24\x49\x2d\xef\x03\x32\x98\xfc\xc1\x27\x00\x5b\x71\
-\x1d\xf0\x13\x70\x79\xde\x41\x24\x49\x2d\xa9\x0a\xec\x02\xbe\xcd\
-\x62\x30\x17\xa0\xeb\x77\x91\x68\xf2\xdf\x9d\x77\x10\x49\x52\x4b\
-\x3a\x48\x86\x4f\x9b\x7d\x02\xb0\x35\x05\xa2\xb3\x99\xdd\x79\x07\
-\x91\x24\xb5\x94\x73\xc0\xcd\xc0\x6f\x59\x0d\xe8\x1e\x80\xad\xf9\
-\x1d\x78\xe8\xaf\x4f\x49\x92\x42\xa8\x02\x03\x64\x38\xf9\x83\x4b\
-\x00\x49\xcc\x03\x25\xe0\xfe\xbc\x83\x48\x92\x5a\xc2\x20\x70\x28\
-\xeb\x41\x2d\x00\x92\xf9\x86\x68\xf9\xe4\xae\x9c\x73\x48\x92\x9a\
-\xdb\x1b\xc0\xbe\x3c\x06\xb6\x00\x48\xee\x33\xe0\x32\xdc\x14\x28\
-\x49\x4a\xe6\x20\xf0\x14\x50\xcb\x63\x70\x0b\x80\x74\x8e\x03\x0b\
-\xc0\x3d\x78\x2d\x25\x49\xf5\xa9\x02\x2f\x10\xdd\xf9\xe7\x32\xf9\
-\x83\xa7\x00\x42\xb9\x15\x18\x05\xae\xcf\x3b\x88\x24\x69\x5b\x5b\
-\x20\xda\xf0\x37\x96\x77\x10\xef\x5a\xc3\x38\x03\x0c\x13\x5d\xcf\
-\xdb\xf0\x74\x85\x24\xe9\x9f\x6a\xc0\x7b\xc0\x83\x64\xf4\xa2\x9f\
-\x38\x16\x00\xe1\xac\x01\xe3\xc0\x87\xc0\xd5\x44\xe7\x39\x2d\x04\
-\x24\xe9\xff\xad\x06\x7c\x04\xec\x05\x5e\x07\x56\xf2\x8d\xf3\x37\
-\x97\x00\x1a\xe7\x06\xa2\xc7\x3c\x7b\x81\x9d\x39\x67\x91\x24\x65\
-\x6b\x0e\x78\x9f\xe8\x78\xdf\x0f\x39\x67\xf9\x4f\x16\x00\xd9\xe8\
-\x06\xee\x06\xfa\x80\x1b\x89\xf6\x0a\x5c\x01\x5c\x85\xbf\x81\x24\
-\x35\xb3\x0b\xc0\x25\xe0\x67\xa2\xff\x8b\x99\x02\x3e\x05\xbe\xcf\
-\x33\x54\x3d\xfe\x04\xab\xd9\xab\x27\x2b\xa3\x5f\x9d\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x4c\xa9\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
-\x41\x54\x78\x9c\xec\xdd\x77\x74\x14\x55\xe3\xc6\xf1\xef\xec\x66\
-\xb3\xa9\x10\x3a\x52\x44\x94\xaa\x82\x52\x94\x8e\x08\x76\x10\x95\
-\x5e\x6c\x08\xa2\x82\x0d\x04\x0b\x3f\x7d\x55\x6c\x14\x0b\x0a\x82\
-\xbe\x8a\x0d\x95\x22\x22\x20\xa8\x48\x6f\x22\x52\x04\x0b\x08\x2a\
-\x2f\x8a\x14\xe9\x09\x29\x9b\xb6\xfb\xfb\x23\x46\x11\xd2\x76\x76\
-\x36\xd9\xcd\x3c\x9f\x73\x72\x3c\x32\xb9\x77\x6e\x92\xd9\xb9\xcf\
-\xdc\xb9\x73\x07\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\x44\
-\x44\x44\x24\x9c\x18\x25\xdd\x00\x3f\x45\x02\xe7\x00\x0d\x80\x7a\
-\x40\x2d\x20\xf6\xaf\xaf\xb2\x25\xd8\x2e\x29\x3d\x3c\x40\x1a\x90\
-\x08\xfc\x01\xec\x02\x7e\x05\x7e\x00\x92\x4a\xb0\x5d\x22\x22\x96\
-\x0a\xf5\x00\x10\x0d\xb4\x02\x2e\x05\x3a\x02\x17\x03\x11\x25\xda\
-\x22\xb1\xab\x6c\xe0\x47\x60\x2d\xb0\x04\xf8\x9c\x9c\xa0\x20\x22\
-\x12\x96\x42\x31\x00\x38\x80\xf6\xc0\x2d\x40\x77\x20\xbe\x64\x9b\
-\x23\x92\xa7\x14\xe0\x33\xe0\x5d\x72\xc2\x80\xb7\x64\x9b\x23\x22\
-\x12\xbe\x62\x81\xe1\xc0\x6e\xc0\xa7\x2f\x7d\x85\xd1\xd7\xcf\xc0\
-\x7d\x40\x0c\x22\x22\x52\x64\x65\x81\x47\x81\x43\x94\xfc\x89\x5c\
-\x5f\xfa\x0a\xe4\x6b\x1f\x70\x17\xe0\x42\x44\x44\xf2\x65\x00\x37\
-\x01\x07\x28\xf9\x13\xb7\xbe\xf4\x65\xe5\xd7\x0e\xa0\x03\x22\x22\
-\x72\x9a\x86\xc0\x0a\x4a\xfe\x44\xad\x2f\x7d\x05\xeb\xcb\x0b\xbc\
-\x89\x9e\x4e\x11\x11\xf9\xdb\xcd\x40\x32\x25\x7f\x82\xd6\x97\xbe\
-\x8a\xe3\xeb\x37\x72\x9e\x64\x11\x11\xb1\xad\x38\x60\x1a\x25\x7f\
-\x42\xd6\x97\xbe\x8a\xfb\x2b\x1d\xb8\x17\x11\x91\x10\xe2\x2c\xa6\
-\xfd\x54\x01\x96\x02\x57\x16\xd3\xfe\x44\x42\x89\x13\xb8\x1a\xa8\
-\x01\x7c\x81\x1e\x19\x14\x91\x10\x50\x1c\xeb\x00\x9c\x03\x2c\xfa\
-\xeb\xbf\x22\x76\xb7\x18\xe8\x46\xce\x6d\x30\x11\x91\x12\x13\xec\
-\x00\x70\x2e\x39\x57\xfe\x55\x83\xbc\x1f\x91\x70\xf2\x35\x70\x0d\
-\x70\xac\xa4\x1b\x22\x22\xf6\x15\xcc\x00\x70\x26\x39\xcb\xa6\xd6\
-\x08\xe2\x3e\x44\xc2\xd5\x56\xa0\x13\x70\xa4\xa4\x1b\x22\x22\xf6\
-\x14\xac\x00\x50\x11\x58\x45\xce\xe3\x7e\x41\x55\xbd\xbc\x41\x99\
-\x18\x88\x75\x43\x42\x6c\x11\x7f\x9c\x7c\xbe\xcd\x67\x5d\xb3\xfc\
-\xda\x6f\xc8\xd6\x5b\xd8\x4e\x4a\x6a\x21\x69\x8b\xf7\x9b\xfb\x77\
-\x4f\x49\xf3\x91\x94\x0a\x49\x29\x3e\x0e\x1c\xf1\x91\x1d\xfc\x3b\
-\xf5\xeb\x81\xcb\xd0\xed\x00\x11\x29\x01\xc1\x38\x85\x47\x00\xcb\
-\x80\x76\x56\x57\x5c\x31\xde\xa0\x53\x63\x83\x0e\xe7\x3b\xb8\xa8\
-\x8e\x83\xfa\xd5\x0d\x62\xdd\x79\x7c\x63\x61\x3f\x55\x41\x01\xc0\
-\x28\xe4\x9b\x0a\xaa\xdb\xe4\x7e\x01\x7c\xf9\x6e\x33\x82\xba\xdf\
-\xdc\x6d\xf9\x86\x9f\x82\x7e\x1f\x16\xec\x37\xdf\x7d\x17\xf4\xfb\
-\xb0\x68\xbf\x79\xee\xff\xaf\xed\x9e\x0c\xd8\xbe\xdb\xcb\xb7\x3b\
-\xbd\x2c\x5a\x9f\xcd\x92\x0d\xd9\x24\xa7\x05\x25\x22\x7e\x09\x5c\
-\x0b\x64\x04\xa3\x72\x11\x91\xfc\x04\x23\x00\x3c\x07\x3c\x6c\x55\
-\x65\x4e\x07\x5c\x7f\xb1\x83\x9b\x3b\x38\xb9\xaa\x89\x03\x57\xee\
-\x73\x0b\x41\xe8\x10\x15\x00\x0a\x2a\x6b\xaf\x00\x70\xaa\xf4\x4c\
-\x98\xb3\x32\x8b\x29\x73\x32\x59\xff\xa3\xe5\x43\x03\x33\x81\x7e\
-\xe8\xe9\x00\x11\x29\x46\x56\x07\x80\xab\x80\x85\xe4\xbc\xd1\x2f\
-\x20\x4e\x07\xdc\xd2\xc1\xc9\x43\x37\x38\xa9\x7b\x86\x9f\x9d\x8f\
-\x02\x40\xd1\xb7\x2b\x00\x14\x29\x00\x9c\xbc\x6d\xd5\xb7\x5e\x1e\
-\x99\x92\xce\xc6\x9f\x2c\xed\xaf\xa7\x00\x43\xac\xac\x50\x44\xa4\
-\x20\x56\x06\x80\x72\xc0\x76\x72\x9e\xf9\x0f\xc8\xc5\x75\x0c\x26\
-\x0f\x76\xd1\xf4\xec\x02\x9a\xa7\x00\x60\xc9\x7e\x15\x00\xfc\x0f\
-\x00\x60\xe0\xf3\xc1\xb4\x2f\x32\x19\x39\x31\x83\xe3\xc9\x96\xdd\
-\x1a\x18\x09\x3c\x6f\x55\x65\x22\x22\x05\xb1\x32\x00\x4c\x26\xe7\
-\x4d\x68\xa6\x39\x1d\xf0\x58\xcf\x08\x1e\xed\xee\xc4\x51\xd8\x18\
-\x82\x02\x80\x25\xfb\x55\x00\x30\x17\x00\x72\xed\x3d\xe4\x63\xd0\
-\x73\x1e\x96\x6d\xcc\x2e\xa4\x51\x45\x92\x4d\xce\x82\x41\x8b\xad\
-\xa8\x4c\x44\xa4\x20\x56\x05\x80\xe6\xe4\xcc\x68\x36\x3d\xf4\x5f\
-\x2e\x16\x3e\x1a\x11\x41\xc7\xf3\xff\xba\xc9\x6f\xf1\x49\xbe\x28\
-\xdb\x15\x00\x0a\x2a\xab\x00\x90\xdf\xef\x22\xdb\x0b\x8f\xbf\x91\
-\xc1\xf3\x1f\x66\xe0\x0b\x7c\x30\xe0\x28\x70\x11\xb0\x2b\xe0\x9a\
-\x44\x44\x0a\x60\xd5\x52\xc0\x1f\x91\xf3\xdc\xbf\x29\xd5\xca\x19\
-\x2c\x7d\xdc\x45\x8b\xba\x0e\x8a\xd4\xe1\x15\xb6\xdd\x92\xb2\xc5\
-\x1b\x00\x0a\xec\xf0\x4a\x64\xbf\xa7\x6e\x0f\x5e\x00\xf0\x6f\xbb\
-\xf5\x01\xc0\xff\xb2\xff\xfe\x26\x87\x01\x1d\x9b\x3b\xa9\x53\xd3\
-\xc1\x67\x5f\x65\x05\xfa\xf8\x60\x34\x70\x29\x39\xef\xcd\xc8\x0c\
-\xa8\x26\x11\x91\x02\x04\x3c\x59\x8f\x9c\xc5\x4c\x5a\x9b\x2d\x5c\
-\xb9\xac\xc1\xf2\x27\x23\x68\x74\xa6\x95\x77\x23\x44\x8a\x5f\x9f\
-\xcb\x23\xf8\xf8\xb9\x68\x62\xa3\x02\x3e\x96\x1b\x03\x6f\x61\xed\
-\x2d\x3a\x11\x91\x7f\xb1\x62\x04\xe0\x4d\xa0\xb6\x99\x82\x71\x51\
-\xb0\xf8\x3f\xae\x53\x3a\x7f\x8d\x00\xe4\xb9\x41\x23\x00\xff\x6c\
-\x08\xe1\x63\xe3\x9c\x1a\x0e\x5a\x9e\xef\xe4\xa3\x65\x59\x64\x05\
-\x36\x2d\xe0\x3c\xe0\x30\xf0\x4d\x40\xb5\x88\x88\xe4\x23\xd0\x11\
-\x80\x16\x40\x47\xb3\x85\x5f\xbf\x23\x82\x66\x05\xcd\xf4\x17\x09\
-\x43\x97\x34\x75\x32\xed\x89\x28\x9c\x81\x8f\xaf\x3d\x0f\x34\x09\
-\xbc\x45\x22\x22\xa7\x0b\xf4\x14\x75\xbb\xd9\x82\x83\x3a\x39\xe8\
-\xd7\xd6\x8a\x3b\x10\x22\xa1\xa7\x6b\xbb\x08\xa6\x3c\xe4\xc6\x08\
-\x2c\xdf\xba\x81\x19\x40\x9c\x25\x8d\x12\x11\x39\x49\x20\xb7\x00\
-\xa2\x81\xa9\x40\x94\xbf\x05\xab\x94\x35\x98\xff\xa0\x8b\xa8\xc8\
-\xbc\xb6\xea\x16\x40\x9e\x1b\x74\x0b\xe0\x9f\x0d\x61\x72\x6c\x5c\
-\x58\xd7\x49\xf9\x32\x06\x8b\xbe\x0e\xe8\x5e\x40\x05\x72\x5e\xa5\
-\x3d\x3b\x90\x4a\x44\x44\x4e\x15\x48\x00\xe8\x09\xf4\x37\x53\xf0\
-\xf5\xc1\x11\x5c\x5c\x27\xbf\x13\xb9\x02\x40\x9e\x1b\x14\x00\xfe\
-\xd9\x10\x46\xc7\xc6\x45\xe7\x3a\x39\x74\xcc\xc7\xa6\xc0\x56\x0d\
-\x3c\x1f\xf8\x0d\xd8\x12\x48\x25\x22\x22\x27\x0b\x64\x0c\xbe\xa7\
-\x99\x42\xe7\xd5\x34\xe8\xab\xa1\x7f\xb1\x91\xe7\xef\x75\xd3\xaa\
-\x51\xc0\xf3\x6d\x27\x01\xf5\x2d\x68\x8e\x88\x08\x60\x3e\x00\x38\
-\x80\x0e\x66\x0a\x3e\x72\xbd\x13\x87\xe6\xfd\x89\x8d\x44\xba\x60\
-\xfa\x53\x51\x54\xad\x10\xd0\x81\x1f\x0b\x4c\x27\x67\x5e\x80\x88\
-\x48\xc0\xcc\x06\x80\x26\xe4\xac\xfd\xef\x97\x0a\xf1\xd0\xb3\x95\
-\xae\xfe\xc5\x7e\xce\xa8\x68\x30\xf3\x99\x28\x22\x5d\x01\x55\xd3\
-\x84\x9c\xb7\x6d\x8a\x88\x04\xcc\x6c\x6f\xdc\xc1\x4c\xa1\x7e\x6d\
-\x9d\x44\x46\x98\xdc\xa3\x48\x98\x6b\x79\xbe\x93\xb1\x43\x03\xbe\
-\x80\xbf\x1f\xb8\xc6\x82\xe6\x88\x88\xcd\x99\x0d\x00\x4d\xcd\x14\
-\xea\xa5\xab\x7f\xb1\xb9\xbb\xba\xbb\xe8\xd2\x36\xa0\x14\x6c\x00\
-\xef\x00\x67\x58\xd2\x20\x11\xb1\x2d\xb3\x3d\xb2\xdf\x93\x91\x62\
-\xdc\x39\xaf\xf9\x15\xb1\x33\xc3\x80\xd7\x1f\x71\x73\x46\xc5\x80\
-\x3e\x0b\x95\x80\x0f\xb1\xee\x5d\x1e\x22\x62\x43\x66\x02\x80\x01\
-\xd4\xf3\xb7\x50\x9b\xfa\x0e\x0d\xff\x8b\x00\x15\xcb\x1a\x4c\xfd\
-\xbf\xa8\xc2\x5f\x79\x5d\xb0\x0e\xc0\x48\x4b\x1a\x24\x22\xb6\x64\
-\xe6\x14\x54\x15\x88\xf7\xb7\xd0\xf9\x35\x75\xf5\x2f\x92\xab\xd3\
-\x45\x4e\xee\xeb\x1d\xd8\x8c\x40\x60\x34\x39\xcb\x71\x8b\x88\xf8\
-\xcd\x4c\x00\xa8\x60\x66\x47\xf5\xab\x29\x00\x88\x9c\xec\xa9\x3b\
-\xdc\x5c\x74\x6e\x40\xa3\xf8\x2e\x72\x6e\x05\x94\xb5\xa6\x45\x22\
-\x62\x27\x66\x02\x80\xdf\x57\xff\x00\x35\x4c\xc5\x06\x91\xd2\xcb\
-\x15\x01\x53\x1f\x75\x07\xfa\xfa\xe0\xb3\x81\xd7\x2c\x6a\x92\x88\
-\xd8\x48\xb1\x05\x80\xf8\x68\x8d\x00\x88\x9c\xaa\xde\x99\x0e\x9e\
-\xbf\x2f\xcf\x97\x62\xf8\xa3\x0f\x30\xdc\x82\xe6\x88\x88\x8d\x98\
-\x09\x00\xb1\x66\x76\x14\xab\xf5\xcb\x44\xf2\x34\xe0\x5a\x17\xdd\
-\x2e\x0d\x78\x86\xec\x58\xa0\x93\x05\xcd\x11\x11\x9b\x30\x13\x00\
-\x4c\xdd\xb4\xd4\xf2\xbf\x22\xf9\x9b\xfc\xb0\x9b\x33\xab\x06\xf4\
-\x21\x89\x00\x66\x91\xf3\xe6\x40\x11\x91\x42\x69\x65\x1e\x91\x10\
-\x90\x10\x67\x30\xf5\xd1\x28\x9c\x81\x7d\x22\xcb\x93\xf3\xda\xe0\
-\x18\x4b\x1a\x25\x22\xa5\x9a\x02\x80\x48\x88\x68\xd7\xc4\xc9\x23\
-\xb7\x06\x3c\x1f\xe0\x42\x60\x06\x39\x4f\x08\x88\x88\xe4\x4b\x01\
-\x40\x24\x84\x8c\x1a\x10\x49\x87\x66\x01\x2f\xf0\x77\x2d\x39\xcb\
-\x05\xeb\xf3\x2d\x22\xf9\xd2\x09\x42\x24\x84\x38\x1c\x30\xf5\xd1\
-\x28\xca\x97\x0d\x78\xd2\x4c\x3f\x60\x92\x05\x4d\x12\x91\x52\x4a\
-\x01\x40\x24\xc4\x54\xaf\x6c\x30\xf5\x51\x37\x46\xe0\x13\x67\xef\
-\x02\x9e\x09\xbc\x45\x22\x52\x1a\x29\x00\x88\x84\xa0\xab\x5b\x47\
-\x70\x4f\x2f\x4b\x6e\xe3\x8f\x22\x27\x04\xe8\x39\x1c\x11\xf9\x17\
-\x05\x00\x91\x10\xf5\xec\x50\x37\x97\x34\xb5\xe4\x85\x7f\xa3\x80\
-\xff\x92\xf3\xa8\xa0\x88\x08\xa0\x00\x20\x12\xb2\x22\x9c\x30\xfd\
-\xe9\x28\xce\xaa\x66\xc9\xc7\x74\x10\xb0\x14\xa8\x62\x45\x65\x22\
-\x12\xfe\x14\x00\x44\x42\x58\xf9\xb2\x06\x1f\x3e\x1d\x45\xb4\x35\
-\x2b\x69\xb6\x07\xbe\x01\xda\x5a\x52\x9b\x88\x84\x35\x05\x00\x91\
-\x10\xd7\xb4\x81\x83\x49\x0f\x46\x59\x55\xdd\x99\xc0\x4a\xe0\x25\
-\xb4\x60\x90\x88\xad\x29\x00\x88\x84\x81\xfe\x57\x47\xf0\xd0\x2d\
-\x01\x2f\x12\x94\xcb\x01\xdc\x0f\xec\x04\x06\x62\x72\x79\x6f\x11\
-\x09\x6f\x0a\x00\x22\x61\xe2\x89\xc1\x91\xdc\xd6\xd5\xd2\x05\xfe\
-\xaa\x03\x6f\x02\xdb\x80\xfb\x80\xb2\x56\x56\x2e\x22\xa1\x4d\xb3\
-\x82\x45\xc2\x84\x61\xc0\xc4\x07\xdd\x1c\x4b\xf2\xf1\xc9\x8a\x2c\
-\x2b\xab\xae\x07\x4c\x00\x9e\x05\x16\x03\x0b\x81\xe5\xc0\x2e\xc0\
-\x6b\xe5\x8e\x24\x28\xca\x60\x7e\x14\x27\x02\x93\xaf\x78\xff\x4b\
-\x2c\x60\x76\x68\xca\x41\x60\xa1\x33\x1a\x08\xe4\xde\x58\xb9\x00\
-\xca\x9e\x00\x52\x81\x24\xe0\x77\xe0\x37\xc0\xd2\x0f\x65\x71\x50\
-\x00\x10\x09\x23\x4e\x07\xbc\xf3\x64\x14\xc7\x86\xa7\xb1\x62\x53\
-\xb6\xd5\xd5\xc7\x00\xd7\xfd\xf5\x05\x39\x27\xb8\x6d\xc0\x41\x72\
-\x4e\x74\x49\x85\x35\x8f\x9c\xce\x28\x90\xfd\x9b\x9d\xee\x68\x00\
-\x09\x01\xec\x3b\x8a\x9c\x0e\xc5\xac\x04\xcc\xaf\xb5\x10\x89\xc9\
-\xd7\xac\x4b\xc8\xc8\x00\xfe\x47\xce\xe7\x65\x35\x39\xf3\x6c\xb6\
-\x02\x96\x7f\x48\xad\xa4\x00\x20\x12\x66\xdc\x2e\xf8\x68\x6c\x14\
-\xd7\xdc\xeb\x61\xc3\xb6\xa0\x9e\x5f\x62\x80\xe6\xc1\xdc\x81\x48\
-\x29\x11\x09\xd4\xff\xeb\xeb\x86\xbf\xfe\xed\x38\xf0\x05\xf0\x01\
-\xb0\x08\xc8\x2c\x99\xa6\xe5\x4f\x73\x00\x44\xc2\x50\x7c\x8c\xc1\
-\xc2\x97\xa3\x69\xd7\x44\xf3\xf7\x44\x42\x54\x02\xd0\x07\xf8\x14\
-\xd8\x4f\xce\xbb\x39\xea\x94\x68\x8b\x4e\xa1\x00\x20\x12\xa6\xca\
-\xc4\x1a\xcc\x7f\x31\x86\xab\xdb\x68\x20\x4f\x24\xc4\x55\x00\x86\
-\x02\x3f\x91\xf3\xba\xee\x26\x25\xdb\x9c\x1c\x0a\x00\x22\x61\x2c\
-\xda\x0d\xb3\xc7\x45\x33\xb4\x97\x65\x8f\x08\x8a\x48\xf0\x38\x81\
-\xde\xc0\x66\xe0\x43\xa0\x5a\x49\x36\x46\x01\x40\x24\xcc\x39\x1d\
-\xf0\xc2\x30\x37\x13\x1f\x8c\xc2\x6d\xe9\x53\x82\x22\x12\x44\x7d\
-\xc9\x19\x11\x78\x00\x28\x91\x4f\xae\x02\x80\x48\x29\x71\xfb\x0d\
-\x2e\x56\xbc\x11\x43\x9d\x9a\xfa\x58\x8b\x84\x89\x78\xe0\x79\xe0\
-\x2b\xe0\x9c\xe2\xde\xb9\xce\x14\x22\xa5\x48\x93\xfa\x4e\xd6\xbd\
-\x13\xc3\x80\xae\x2e\x0c\xbd\x00\x58\x24\x5c\x34\x07\x36\x02\xdd\
-\x8b\x73\xa7\x0a\x00\x22\xa5\x4c\x7c\x8c\xc1\x94\x47\xa2\x58\x3c\
-\x39\x86\xfa\xb5\xf4\x11\x17\x09\x13\x09\xc0\x6c\xe0\x39\xcc\xaf\
-\x29\xe1\x17\x9d\x1d\x44\x4a\xa9\xb6\x17\x3a\xd9\xf8\x41\x2c\xaf\
-\x3e\x1c\xc5\x19\x15\x35\x1c\x20\x12\x26\x1e\x06\xde\xa5\x18\xe6\
-\x05\x28\x00\x88\x94\x62\xae\x08\x18\x78\xbd\x8b\x1f\x67\xc7\x32\
-\xe6\x5e\x37\xb5\xce\xd0\x47\x5e\x24\x0c\xdc\x04\xcc\x25\xb0\xd5\
-\x29\x0b\xa5\xb3\x81\x88\x0d\xc4\x44\x19\xdc\xdf\x2f\x92\x6d\x1f\
-\xc7\x32\x7b\x7c\x34\xd7\xb4\x8d\xd0\x13\x03\x22\xa1\xed\x1a\x72\
-\xd6\x0c\x08\xda\x42\x1f\x5a\x41\x44\xc4\x46\x9c\x0e\xe8\xd2\x2e\
-\x82\x2e\xed\x22\x48\x4a\xf1\xf1\xf9\x57\x59\x7c\xb6\x26\x9b\x75\
-\x5b\xb3\xf9\xfd\x80\xde\xfb\x23\x12\x62\xba\x02\xaf\x03\x83\x00\
-\x9f\xd5\x95\x2b\x00\x88\xd8\x54\x99\x58\x83\x5e\x57\xb8\xe8\x75\
-\x45\xce\x50\xc0\xfe\xc3\x3e\x36\xfe\x98\xcd\xaf\x7f\x78\xf9\xdf\
-\x5e\x2f\xbb\xf7\xf9\x38\x74\xcc\x47\x9a\xc7\x87\x27\x03\x8e\x9f\
-\x38\xe5\xfc\x63\xe4\xdc\x62\x88\x8b\x36\x3f\xbf\x20\x2e\xd6\x20\
-\xc2\xe4\x6a\xc6\x4e\x67\xce\xcf\xe0\x97\x93\xbe\x3d\x26\xda\x20\
-\xd2\xe4\x28\x88\x61\x40\xd9\xf8\x53\xf6\xed\x47\x53\xa2\xa3\x0c\
-\xdc\x27\xaf\xdd\xe4\xe7\x8f\x51\xb6\x8c\x81\x51\x94\xc7\x3c\xf2\
-\xf8\x16\x77\xa4\x41\x74\x54\xfe\xdb\x0b\x13\x1f\x67\xe0\x74\x16\
-\xb5\xec\xbf\xbf\xc9\xe5\x82\xd8\x18\x03\x5f\x41\x65\x0b\xd8\x16\
-\x17\x63\xe0\x2a\xe8\x6f\x96\x6f\x59\x03\x87\x13\xca\xc4\x1b\xf9\
-\xf7\xa2\x85\xfc\x3c\xd1\x31\x06\xee\x48\x83\xe3\x89\x5e\xd2\xd3\
-\xe1\x78\xa2\x8f\xdf\xf6\x64\xf3\xcb\xae\x6c\xbe\xdd\x9a\xcd\xba\
-\x0d\x99\x9c\x38\xf5\x33\x62\x8d\xdb\xc8\x59\x4a\xf8\x51\xab\x2b\
-\x56\x00\x10\x11\x00\xce\xa8\x68\x70\xed\x25\xa7\x9c\x12\x8a\x74\
-\xa2\xce\xe7\x9b\x8a\x50\xd6\xd4\xc9\xb8\x80\x93\xbc\x3f\x65\xf3\
-\xdc\xb7\xc9\x8e\xe9\x9f\xed\x45\xff\x5d\xf8\x0a\xd9\xee\xdf\x7e\
-\xf3\xf9\xc7\x7c\xca\xfa\x4e\xf9\x36\xeb\xf6\x7b\xea\xb6\xbc\xbf\
-\xc9\x6c\x00\x28\xfa\x7e\xf3\xd9\x60\x98\x3c\xe6\x4e\xda\x9e\x50\
-\xf6\x9f\xc4\xda\xa2\x79\xc4\xdf\xdb\xb2\xb3\x61\xfd\xc6\x4c\x3e\
-\xfa\x24\x83\x4f\x3e\x4d\xe7\xd8\x71\x4b\xc3\xc0\x28\x60\x1d\x39\
-\xaf\xea\xb6\x8c\xe6\x00\x88\x88\x88\x04\xc8\xe9\x84\xd6\x2d\x5c\
-\xbc\x34\x26\x96\xed\x1b\xcb\x31\xee\xa9\x58\x6a\x54\xb7\xac\x8b\
-\x35\x80\x77\x80\x1a\x56\x55\x08\x0a\x00\x22\x22\x22\x96\x8a\x8e\
-\x36\xb8\xe3\xb6\x28\x36\xaf\x49\xe0\xff\x46\xc6\x10\x1d\x65\xc9\
-\x63\xb8\x15\xc9\x79\x7f\x80\x65\xfd\xb6\x02\x80\x88\x88\x48\x10\
-\xb8\x23\x0d\x1e\xbc\x3f\x9a\xaf\x97\x97\xa5\x59\x13\x4b\xee\xb8\
-\xb7\x03\x06\x5a\x51\x11\x28\x00\x88\x88\x88\x04\xd5\x59\xb5\x9c\
-\x2c\x9a\x5b\x96\x21\xb7\x5b\xf2\x58\xff\x73\xe4\xbc\x5e\x38\x60\
-\x0a\x00\x22\x22\x22\x41\xe6\x72\xc1\x73\x4f\xc6\x32\x66\x74\x2c\
-\x8e\xc0\x7a\xde\x0a\xc0\xb3\x56\xb4\x49\x01\x40\x44\x44\xa4\x98\
-\xdc\x39\x28\x9a\x57\x5f\x8c\x0f\xf4\x65\x5d\xb7\x01\x67\x07\xda\
-\x16\x05\x00\x11\x11\x91\x62\xd4\xb7\x97\x9b\x71\x4f\xc7\x05\x52\
-\x45\x04\x30\x32\xd0\x76\x28\x00\x88\x88\x88\x14\xb3\xdb\x07\x44\
-\x31\xf0\x96\xa8\xc2\xbf\x31\x7f\x03\x80\x6a\x81\x54\xa0\x00\x20\
-\x22\x22\x52\x02\x9e\x79\x22\x96\x46\xe7\x99\x7e\x3a\xc0\x0d\xdc\
-\x19\xc8\xfe\x15\x00\x44\x44\x44\x4a\x40\x94\xdb\xe0\x8d\x57\xe3\
-\x0b\x5e\xde\xb8\x60\xfd\x31\xb5\xa0\x73\x0e\x05\x00\x11\x11\x91\
-\x12\xd2\xa0\xbe\x93\x3b\x06\x9a\x7e\x3c\xf0\x6c\xa0\x95\xd9\xc2\
-\x0a\x00\x22\x22\x22\x25\xe8\xa1\xe1\x31\x24\x94\x35\x7d\x21\xdf\
-\xcf\x6c\x41\x05\x00\x11\x11\x91\x12\x14\x1f\x6f\x30\xf8\x36\xd3\
-\xa3\x00\x57\x9a\x2d\xa8\x00\x20\x22\x22\x52\xc2\xee\x18\x14\x65\
-\xf6\xf5\xd4\x75\x80\x9a\x66\x0a\x2a\x00\x88\x88\x88\x94\xb0\x0a\
-\xe5\x1d\x5c\xd6\x29\xd2\x6c\xf1\x4b\xcc\x14\x52\x00\x10\x11\x11\
-\x09\x01\x3d\x6f\x70\x9b\x2d\xda\xc6\x4c\x21\x05\x00\x11\x11\x91\
-\x10\xd0\xa1\x7d\xa4\xd9\xf7\x04\xd4\x37\x53\x48\x01\x40\x44\x44\
-\x24\x04\x94\x4b\x30\x38\xaf\xa1\xa9\x85\x81\xea\x99\x29\xa4\x00\
-\x20\x22\x22\x12\x22\x9a\x5c\x68\x2a\x00\x54\x03\xfc\x7e\xb9\x80\
-\x02\x80\x88\x88\x48\x88\xa8\x73\xb6\xd3\x4c\x31\x03\xa8\xe1\x6f\
-\x21\x05\x00\x11\x11\x91\x10\x71\x56\x2d\xd3\xdd\x72\xbc\xbf\x05\
-\x14\x00\x44\x44\x44\x42\x44\x99\x78\xd3\xdd\xb2\x6e\x01\x88\x88\
-\x88\x84\xab\xb8\x38\xd3\x4b\x02\x6b\x04\x40\x44\x44\x24\x5c\x45\
-\x9a\x5e\x0b\x08\xbf\x4b\x2a\x00\x88\x88\x88\xd8\x90\x02\x80\x88\
-\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\
-\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\
-\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\
-\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\
-\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\
-\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\
-\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\
-\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\
-\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\
-\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\
-\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\
-\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\
-\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\
-\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\
-\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\
-\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\
-\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\
-\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\
-\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x45\x94\
-\x74\x03\x44\xa4\xf8\xa4\x67\xc2\x07\x9f\x65\x32\x7f\x65\x16\xbb\
-\xf6\x7a\x31\x0c\xa8\x5d\xcd\xc1\xb5\x97\x44\xd0\xff\x1a\x17\xee\
-\xc8\x92\x6e\xa1\x88\x14\x17\x05\x00\x11\x9b\xd8\xb2\x33\x9b\x3e\
-\x0f\x7b\xd8\xbd\xcf\xfb\xaf\x7f\xdf\xb1\xdb\xcb\x17\x5f\x65\x31\
-\xfe\xdd\x0c\xa6\x8f\x89\xe2\xc2\xfa\xce\x12\x6a\xa1\x88\x14\x27\
-\xdd\x02\x10\xb1\x81\xb5\x5b\xb2\xb9\xec\x8e\xb4\xd3\x3a\xff\x93\
-\xed\xde\xe7\xe5\xb2\x3b\xd2\x58\xb5\x39\xbb\x18\x5b\x26\x22\x25\
-\x45\x01\x40\xa4\x94\x5b\xf7\x5d\x36\xd7\x0f\x4f\x23\x39\xcd\x57\
-\xe8\xf7\xa6\xa4\xf9\xb8\x61\x58\x1a\x2b\x36\x2a\x04\x88\x94\x76\
-\x0a\x00\x22\xa5\xd8\xba\xef\xb2\xe9\x7a\x7f\x1a\x27\x52\x0b\xef\
-\xfc\x73\xa5\x7a\x7c\x74\x7f\x40\x21\x40\xa4\xb4\x53\x00\x10\x29\
-\xa5\xcc\x74\xfe\xb9\x14\x02\x44\x4a\x3f\x05\x00\x91\x52\x68\xdd\
-\x77\xd9\x74\x1d\x66\xae\xf3\xcf\x95\xea\xf1\xd1\x7d\xb8\x42\x80\
-\x48\x69\xa5\x00\x20\x52\xca\x58\xd1\xf9\xe7\x52\x08\x10\x29\xbd\
-\x14\x00\x44\x4a\x11\x2b\x3b\xff\x5c\x0a\x01\x22\xa5\x93\x02\x80\
-\x48\x29\x11\x8c\xce\x3f\x97\x42\x80\x48\xe9\xa3\x00\x20\x52\x0a\
-\x04\xb3\xf3\xcf\xa5\x10\x20\x52\xba\x28\x00\x88\x84\xb9\xe2\xe8\
-\xfc\x73\x29\x04\x88\x94\x1e\x0a\x00\x22\x61\xac\x38\x3b\xff\x5c\
-\x7f\x87\x80\x0d\x0a\x01\x22\xe1\x4c\x01\x40\x24\x4c\xad\xfb\x2e\
-\x9b\xae\xc3\x8b\xb7\xf3\xcf\xa5\x10\x20\x12\xfe\x14\x00\x44\xc2\
-\x50\x49\x76\xfe\xb9\xfe\x09\x01\x59\x25\xd6\x06\x11\x31\x4f\x01\
-\x40\x24\xcc\xe4\x74\xfe\x9e\x12\xed\xfc\x73\x29\x04\x88\x84\x2f\
-\x05\x00\x91\x30\x12\x4a\x9d\x7f\xae\xdc\x10\xb0\x5c\x21\x40\x24\
-\xac\x28\x00\x88\x84\x89\x50\xec\xfc\x73\xa5\x7a\x7c\xf4\x50\x08\
-\x10\x09\x2b\x0a\x00\x22\x61\x20\x94\x3b\xff\x5c\x0a\x01\x22\xe1\
-\x45\x01\x40\x24\xc4\x85\x43\xe7\x9f\x4b\x21\x40\x24\x7c\x28\x00\
-\x88\x84\xb0\x70\xea\xfc\x73\xfd\x1d\x02\xbe\x51\x08\x10\x09\x65\
-\x0a\x00\x22\x21\x6a\xdd\x77\xd9\x74\x7d\x20\xbc\x3a\xff\x5c\x0a\
-\x01\x22\xa1\x4f\x01\x40\x24\x04\x85\x73\xe7\x9f\x4b\x21\x40\x24\
-\xb4\x29\x00\x88\x84\x98\xb5\x5b\xb3\xb9\xd6\xa2\x61\xff\x86\xb5\
-\x1d\x9c\x77\x8e\xff\x1f\xf3\x86\xb5\x1d\x9c\x6f\xa2\xdc\xa9\x72\
-\x43\xc0\xca\x8d\x0a\x01\x22\xa1\x46\x01\x40\x24\x84\xac\xfb\x2e\
-\x9b\xeb\x47\x78\x48\x4e\x0b\xbc\xf3\xaf\x5f\xcb\xc1\xe7\x13\x63\
-\x28\x5f\xc6\xf0\xbb\x6c\x42\x19\x83\xcf\x5f\x8d\xe1\xfc\x3a\xd6\
-\x84\x80\x6e\xf7\x6b\x24\x40\x24\xd4\x28\x00\x88\x84\x08\x2b\x87\
-\xfd\xeb\xd7\x72\xb0\x68\x52\x0c\x55\x2b\xfa\xdf\xf9\xe7\xaa\x58\
-\xce\xda\x10\xa0\xdb\x01\x22\xa1\x45\x01\x40\x24\x04\x84\x5a\xe7\
-\x9f\x4b\x21\x40\xa4\xf4\x52\x00\x10\x29\x61\xeb\xbe\x0f\xcd\xce\
-\x3f\x97\x42\x80\x48\xe9\xa4\x00\x20\x52\x82\x42\xbd\xf3\xcf\x65\
-\x79\x08\x18\xa6\x10\x20\x52\xd2\x14\x00\x44\x4a\xc8\x57\x61\xd2\
-\xf9\xe7\x52\x08\x10\x29\x5d\x14\x00\x44\x4a\x40\xb8\x75\xfe\xb9\
-\xac\x0e\x01\x3d\x15\x02\x44\x4a\x8c\x02\x80\x48\x31\x5b\xf7\xbd\
-\xb5\xcf\xf9\x2f\x9e\x5c\x3c\x9d\x7f\xae\x60\x84\x80\x35\x9b\xb3\
-\x2d\x68\x99\x88\xf8\x43\x01\x40\xa4\x18\xed\x3b\xe4\xa3\xe7\x28\
-\x6b\x9e\xf3\x6f\x58\xdb\xc1\xa2\x89\x31\x54\x2e\x5f\x7c\x9d\x7f\
-\xae\x8a\xe5\x0c\x3e\x9f\x6c\x5d\x08\xe8\x3b\x32\x95\x3f\xfe\xf4\
-\x5a\xd0\x32\x11\x29\x2a\x05\x00\x91\x62\x34\x7a\x6a\x06\x87\x8e\
-\x85\x77\xe7\x9f\xcb\xca\x10\x70\xe4\xb8\x8f\xa7\xa6\xa4\x5b\xd0\
-\x2a\x11\x29\x2a\x05\x00\x91\x62\x92\x9e\x09\x1f\x2d\x0d\xfc\x7e\
-\x77\xbd\x33\x1d\x7c\xfe\x4a\x74\x89\x76\xfe\xb9\x72\x42\x40\x2c\
-\x8d\xea\x3a\x03\xae\x6b\xf6\x97\x99\xa4\x7a\xc2\xf7\xdd\x07\x22\
-\xe1\x46\x01\x40\xa4\x98\xfc\xb8\xcb\x1b\xf0\xd0\x7f\xc3\xda\x0e\
-\x96\x4c\x8e\xa6\x6a\x85\x92\xef\xfc\x73\x55\x2c\x67\xf0\x99\x05\
-\x73\x02\xd2\xd2\xe1\xc7\x5f\x74\x1b\x40\xa4\xb8\x28\x00\x88\x14\
-\x93\xa4\xe4\xc0\x3b\xff\x45\x13\x43\xe3\xca\xff\x54\xb9\x23\x01\
-\x81\x86\x80\xc4\x13\x1a\x01\x10\x29\x2e\x0a\x00\x22\xc5\x24\x90\
-\x8e\x3b\x94\x3b\xff\x5c\x56\x84\x80\x2a\x21\x34\xb2\x21\x52\xda\
-\x29\x00\x88\x14\x93\x06\xb5\x1c\xa6\x3a\xf0\x70\xe8\xfc\x73\x05\
-\x12\x02\x2a\x96\x33\x38\xb7\x4e\xe0\x73\x09\x44\xa4\x68\x14\x00\
-\x44\x8a\x89\xc3\x01\x77\xde\xe0\xf2\xab\x4c\x28\x4d\xf8\x2b\x2a\
-\xb3\x13\x03\xef\xe8\x19\x89\x53\x67\x24\x91\x62\xa3\x8f\x9b\x48\
-\x31\x1a\xd6\x37\x92\x0b\xea\x16\xed\x63\xd7\xf0\x2c\x07\x4b\x5e\
-\x0d\xad\x09\x7f\x45\x55\xb1\x9c\xc1\x67\x7e\x3c\x22\x78\x7e\x5d\
-\x27\xf7\xdf\x1c\x19\xe4\x56\x89\xc8\xc9\x14\x00\x44\x8a\x51\x4c\
-\x14\xcc\x1b\x1f\x4d\xf3\x86\x05\x7f\xf4\xda\x5c\xe0\x64\xf1\xab\
-\xe1\x75\xe5\x7f\xaa\x8a\xe5\x0c\x16\xbd\x1e\x4b\xfb\x66\x11\x05\
-\x7e\x5f\x93\x86\x4e\xe6\xbe\x12\x43\x6c\x74\xf8\xfe\xac\x22\xe1\
-\x48\x01\x40\xa4\x98\x9d\x51\xd1\x60\xf9\xe4\x18\x26\x0c\x73\xd3\
-\xf8\xa4\x2b\x64\xc3\x80\xa6\xf5\x1d\x4c\x79\xd8\xcd\xa2\x89\xd1\
-\x54\x4c\x08\xff\x0e\xb1\x7c\x59\x83\x85\x93\x63\x78\xed\x3f\xd1\
-\x34\x3d\xd7\x89\x71\xd2\x8f\xd4\xa8\xae\x93\x17\x46\x46\xb1\xfc\
-\xed\x58\xaa\x55\x0e\xff\x9f\x55\x24\xdc\x14\x1c\xcd\x45\x24\x28\
-\x22\x5d\x70\x57\x77\x17\x77\x76\x77\x91\x9c\xe6\xe3\x70\xa2\x8f\
-\x4a\x09\x46\xa9\xbc\x0a\x8e\x70\xc2\x2d\x5d\x5d\xdc\xd2\xd5\x45\
-\xaa\xc7\xc7\xc1\xa3\x3e\x2a\x96\x33\x88\x8b\x31\xd0\x43\x7f\x22\
-\x25\x47\x01\x40\xa4\x84\xc5\x45\xe7\x74\x86\x76\x10\x13\x65\x70\
-\x56\x35\x03\xec\xf1\xe3\x8a\x84\x34\xdd\x02\x10\x11\x11\xb1\x21\
-\x05\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\
-\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\
-\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\x00\x10\
-\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\
-\x21\x05\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\
-\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\
-\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\x00\
-\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\
-\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\
-\x00\x11\x11\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\
-\x11\x1b\x52\x00\x10\x11\x11\xb1\x21\x05\x00\x11\x11\x11\x1b\x52\
-\x00\x10\x11\x11\xb1\xa1\x88\x92\x6e\x80\x94\x4e\xbb\xff\xf4\x71\
-\xe0\xa8\x8f\xa4\x54\x1f\x49\xa9\x39\xff\x16\x1d\x09\x09\x71\x06\
-\x67\x55\x35\xa8\x56\xd1\xc0\x30\x4a\xb6\x8d\x22\xa1\x22\xf1\x84\
-\x8f\xfd\x07\xbd\x1c\x3c\xec\xe3\xc8\x71\x1f\x00\xf1\xb1\x06\xf1\
-\x71\x70\x46\x15\x07\x67\x56\xd3\xb5\x9a\x58\x4f\x01\x40\x02\x96\
-\x99\x05\x6b\x7e\xc8\xe6\xf3\x6f\xbc\xac\xdb\x96\xcd\xb6\xdd\x39\
-\x1d\x7f\x41\x62\xdc\xd0\xb4\x9e\x83\x16\x0d\x9d\x5c\x79\xb1\x83\
-\xb6\x8d\x9c\x44\x38\x8b\xa9\xc1\x22\x25\x28\x39\xd5\xc7\xaa\x6f\
-\xb2\xd8\xf8\x7d\x36\xdf\x6d\xcf\x66\xeb\x4f\xd9\xec\xfb\xd3\x5b\
-\x60\x99\xf8\x38\x83\x73\xeb\x38\x69\xd5\xcc\xc9\x15\xed\x5c\xb4\
-\x6a\x16\x81\x4b\x67\x6f\x09\x90\x0e\x21\x31\x6d\xdb\x6f\x5e\x5e\
-\x9d\x97\xc5\xcc\xe5\xd9\x24\xa6\x14\xdc\xe1\x9f\x2a\x35\x1d\xd6\
-\x7c\xef\x65\xcd\xf7\x5e\x5e\x98\x05\x15\xca\x18\xf4\xee\xe8\x64\
-\x70\x97\x08\xce\x3d\x4b\x57\x3b\x52\xba\xa4\x79\x7c\x7c\xba\x34\
-\x93\x0f\xe6\x65\xb0\x7a\x43\x16\xe9\x19\xfe\x95\x3f\x91\xec\x63\
-\xfd\x96\x2c\xd6\x6f\xc9\x62\xc2\xd4\x74\xca\xc4\x1b\xf4\xee\x12\
-\xc9\xe0\x7e\x91\x34\xac\xab\xe4\x2c\xe6\x28\x00\x88\xdf\x36\xed\
-\xf4\xf2\x7f\x6f\x65\xb2\xf4\xdb\x6c\xcb\xea\x3c\x92\xe4\x63\xf2\
-\xdc\x2c\x26\xcf\xcd\xe2\x9a\x16\x4e\x1e\xbb\xc5\x45\xb3\xfa\x0a\
-\x02\x12\xde\x8e\x1c\xf3\xf1\xea\xfb\xe9\xbc\x3e\x3d\x9d\xe3\x49\
-\xfe\x85\xe4\x82\x24\x9d\xf0\xf1\xc6\xf4\x74\xde\x98\x9e\xce\xa5\
-\xad\x23\x78\x72\x78\x34\x4d\xcf\x57\x10\x10\xff\xe8\x0c\x2b\x45\
-\xb6\xff\xa8\x8f\x5b\xc7\x65\xd0\xea\x5e\x8f\xa5\x9d\xff\xa9\x3e\
-\x5b\x9f\x4d\xeb\xa1\x1e\x06\x8e\xcd\xe0\xd0\x71\xeb\x4e\x9a\x22\
-\xc5\x25\x3d\x03\xc6\xbe\xee\xa1\xe1\x15\x49\x8c\x7d\xdd\x63\x69\
-\xe7\x7f\xaa\xe5\x5f\x65\x71\x49\xcf\x13\xdc\x36\x22\x95\x3f\x0f\
-\x17\x7c\x2b\x41\xe4\x64\x0a\x00\x52\x24\x9f\xae\xcb\xa6\xe9\x9d\
-\x1e\x3e\x58\x9a\x85\xaf\x18\xfa\x64\x9f\x0f\xa6\x7d\x99\x45\xe3\
-\x01\x1e\x3e\x5d\x1b\xbc\xb0\x21\x62\xb5\x75\xdf\x66\xd1\xa2\x5b\
-\x12\xa3\x27\x7a\x48\x49\x2b\x9e\x00\xeb\xf3\xc1\xac\x05\x19\x5c\
-\x7c\xed\x09\xe6\x2f\xce\x2c\x96\x7d\x4a\xf8\x53\x00\x90\x02\x79\
-\x7d\xf0\xc0\x6b\x99\x74\x7b\x22\x9d\xc3\x89\xc5\x7f\x35\x7e\x24\
-\xc9\x47\x8f\xc7\xd3\x79\x70\x4a\x06\xd9\xba\xb8\x91\x10\xe6\xf3\
-\xc1\x2b\xef\xa6\x73\xf5\x80\x64\x7e\xde\x5d\x32\x07\xeb\x91\x63\
-\x3e\xfa\xdd\x93\xc2\xc8\x67\x52\xc9\x56\x6e\x96\x42\x28\x00\x48\
-\xbe\x3c\x19\xd0\xf7\xe9\x0c\x5e\xf9\x24\xab\x44\xdb\xe1\xf3\xc1\
-\x84\xd9\x59\xf4\x79\x32\x9d\xb4\xf4\x12\x6d\x8a\x48\x9e\xb2\xbd\
-\x70\xc7\xa3\x69\x3c\x32\x3e\x8d\xcc\x92\xfd\xb8\x00\x30\x65\x5a\
-\x3a\xfd\xef\x4d\x26\xb5\x98\x46\x20\x24\x3c\x29\x00\x48\x9e\xd2\
-\x33\xe1\xba\xff\xa4\x33\x67\x4d\xe8\x5c\x46\xcc\x5b\x93\x4d\xf7\
-\xc7\x3c\x78\xfc\x9c\x41\x2d\x12\x4c\xd9\x5e\xb8\x7d\x54\x2a\x1f\
-\xcc\x0b\xad\x03\x73\xc1\xd2\x4c\xba\x0d\x4e\xc6\x93\xae\x10\x20\
-\x79\x53\x00\x90\xd3\x78\x7d\x70\xeb\xb8\x0c\x96\x6d\x09\xbd\x31\
-\xf7\x25\x9b\xb2\xe9\x37\xda\xa3\xdb\x01\x12\x32\xee\x7f\x2a\x8d\
-\x99\x0b\x43\xf3\xbe\xfb\x9a\x6f\xb2\xb8\xe5\xfe\x14\xb2\x42\x27\
-\xc7\x4b\x08\x51\x00\x90\xd3\x8c\x9a\x9a\xc9\xec\xd5\xa1\x7b\xc6\
-\x58\xf0\x55\x36\xff\x99\x1a\x5a\x57\x5b\x62\x4f\xef\x7c\x9c\xc1\
-\x5b\xb3\x43\xfb\x58\x5c\xb8\x2c\x93\x47\xc6\xa4\x96\x74\x33\x24\
-\x04\x29\x00\xc8\xbf\x7c\xb1\x21\x9b\x17\x3f\x0e\x81\x9b\x98\x85\
-\x78\x7e\x46\x26\x0b\xbe\x0a\xdd\x90\x22\xa5\xdf\x96\xed\xd9\x3c\
-\xf0\x5c\x5a\x49\x37\xa3\x48\x5e\x9b\x96\xae\xa7\x03\xe4\x34\x0a\
-\x00\xf2\xb7\x83\xc7\x7d\x0c\x7c\x21\xb3\x58\x1e\xf3\x0b\x94\xcf\
-\x07\x43\x5e\x4c\xe7\x48\x10\x9f\xaf\x16\xc9\x8f\xd7\x0b\xf7\x3d\
-\x95\x86\x27\x4c\x26\xa5\xfa\x7c\x30\x64\x54\x0a\x07\x0e\xe9\xde\
-\x99\xfc\x43\x01\x40\xfe\xf6\xd8\x3b\x59\x1c\x0c\xa3\x85\x77\x0e\
-\x1c\xf5\xf1\xe8\x1b\xa1\x3d\xfc\x2a\xa5\xd3\x07\xf3\x33\xd8\xf8\
-\x7d\x78\x8d\x40\x1d\x4f\xf2\xf1\xd8\xf8\xf0\x18\xb1\x90\xe2\xa1\
-\xa5\x80\x05\x80\x2d\xbf\x7a\x79\x67\x91\x35\x43\xff\x09\x09\x09\
-\x74\xec\xd4\x89\x96\x2d\x5a\x52\xb7\x5e\x5d\xe2\xe3\xcb\x90\x95\
-\x95\xc9\xe1\xc3\x87\xd9\xbd\x7b\x37\x6b\xd7\xae\x65\xed\x9a\x35\
-\x24\x25\x25\x05\xbc\xaf\x77\x3e\xcf\xe2\x9e\xee\x2e\xbd\x3f\x40\
-\x8a\x4d\x5a\xba\x8f\xc7\x5f\xf6\x58\x56\x5f\x54\x54\x14\x6d\xda\
-\xb4\xa1\x59\xb3\x66\xd4\x6f\xd0\x80\x9a\x35\x6b\x12\x13\x13\x43\
-\x52\x62\x22\x3b\x76\xee\x64\xdd\x57\x5f\xb1\x78\xf1\x62\x8e\x1d\
-\x3b\x16\xf0\xbe\x66\xcc\xcf\x60\x60\x5f\x37\x2d\x9a\xe8\xd4\x2f\
-\x0a\x00\xf2\x97\x27\xde\xcb\xc2\x1b\xe0\xc5\x7f\xf5\xea\xd5\x19\
-\xfe\xc0\x08\xba\x77\xef\x8e\xdb\xed\xce\xf7\xfb\x06\x0e\x1c\x44\
-\x4a\x4a\x0a\x33\x66\x4c\x67\xf2\xab\xaf\xb2\x6f\xdf\x3e\xd3\xfb\
-\xcc\xf6\xc2\x33\xd3\x32\xf9\xe0\xb1\xfc\xf7\x27\x62\xa5\x59\x0b\
-\x33\xf9\xf3\x70\xe0\x23\x65\x17\x5c\x70\x01\x43\x86\x0e\xa5\x73\
-\xe7\xce\xc4\xc5\xc5\xe5\xf9\x3d\xad\xdb\xb4\x61\xc0\x80\x01\x78\
-\x3c\x1e\x66\xcd\x9c\xc9\xd3\x4f\x3f\xcd\xc1\x83\x07\x4d\xef\xd3\
-\xe7\x83\xe7\x26\x79\x98\x3b\x35\xef\xfd\x89\xbd\xe8\xb2\x49\xd8\
-\xb9\xd7\xc7\xe7\xdf\x98\x1f\xce\x34\x0c\x83\x81\x03\x07\xb2\x66\
-\xed\x57\xf4\xeb\xd7\xaf\xc0\xce\x3f\x57\x6c\x6c\x2c\x03\x07\x0e\
-\x62\xe5\xaa\xd5\xdc\x74\xf3\xcd\x18\x86\x61\x7a\xff\x9f\xac\xca\
-\xe2\xf7\x3f\xc3\xe7\xd6\x85\x84\xb7\xd7\xa6\x07\x76\xdb\xa9\x7a\
-\xf5\xea\xbc\x39\x75\x2a\xcb\x57\xac\xa0\x77\xef\xde\xf9\x76\xfe\
-\x27\x8b\x8a\x8a\xe2\xe6\x5b\x6e\xe1\x9b\x0d\x1b\x18\x30\xe0\xb6\
-\x80\x3e\x2f\xcb\xd6\x66\xf2\xfd\x4f\xe1\x75\xfb\x42\x82\x43\x01\
-\x40\x98\x34\xd7\xfc\xd5\xbf\x61\x18\x8c\x1e\xfd\x14\x4f\x3f\xf3\
-\x0c\x51\x51\x51\x7e\x97\x8f\x8b\x8b\x63\xdc\xb8\xf1\x8c\x1b\x37\
-\x1e\x87\xc3\xdc\xe1\x98\x95\x0d\xef\x7c\xae\x19\xce\x12\x7c\xeb\
-\xbe\xcd\xe6\xbb\x00\x3a\xcf\xf6\xed\xdb\xb3\x7a\xcd\x1a\x7a\xf4\
-\xe8\x61\xea\x78\x4f\x48\x48\xe0\xa5\x09\x13\x18\x3b\x6e\xbc\xe9\
-\x10\xe0\xf3\xe5\x3c\x15\x20\xa2\x00\x60\x73\xd9\x5e\x02\x7a\xe6\
-\xff\xa9\xa7\x9e\x66\xe0\xa0\x41\x01\xb7\xe3\xc6\x9b\x6e\x62\xdc\
-\xf8\xe7\x4d\x97\x9f\xb9\x4c\x57\x34\x12\x7c\xf3\x02\x78\x94\xae\
-\x5d\xbb\x76\xcc\x9a\x35\x8b\xf2\xe5\xcb\x07\xdc\x8e\xc1\x83\x07\
-\xf3\xf2\x2b\xaf\x98\x2e\xff\xe9\xe2\x8c\x90\x58\xb2\x58\x4a\x96\
-\x02\x80\xcd\x7d\xbd\xdd\x6b\x7a\xe6\x7f\xf7\xee\x3d\xb8\x6d\xe0\
-\x40\xcb\xda\xd2\xbf\x7f\x7f\xfa\xf4\xe9\x6b\xaa\xec\xcf\x7f\x78\
-\xf9\xe9\x37\x3d\xe2\x24\xc1\xb5\xf8\x2b\x73\x01\xa0\x46\x8d\x1a\
-\xbc\xfb\xde\x7b\x44\x45\x47\x5b\xd6\x96\x5b\x6e\xb9\x85\x1b\x6f\
-\xbc\xd1\x54\xd9\x63\x89\x3e\x56\x7e\xad\x51\x33\xbb\x53\x00\xb0\
-\xb9\x85\xeb\xcd\x5d\x39\x57\xac\x58\x91\xd1\x4f\x3d\x65\x71\x6b\
-\xe0\xa9\xa7\x9f\xa6\x5c\xb9\x72\xa6\xca\xae\xfa\x4e\x01\x40\x82\
-\xe7\x8f\x03\x5e\x7e\xfa\xd5\xdc\x31\x36\x6e\xdc\x38\x4b\xae\xfc\
-\x4f\xf5\xdc\x98\x31\x54\xaf\x51\xc3\x54\xd9\xa5\xab\x35\x04\x60\
-\x77\x0a\x00\x36\xb7\x61\xa7\xb9\x13\xda\x88\x91\x23\x4d\x77\xd4\
-\x05\x89\x8b\x8b\xe3\xae\x21\x43\x4c\x95\x5d\xbd\x55\xb7\x01\xf2\
-\xe2\x74\x9a\x28\xa3\x33\xc3\x69\x96\xac\x35\xd7\x61\x36\x6b\xd6\
-\x8c\x6b\x3a\x77\xb6\xb8\x35\x39\xca\x94\x29\xc3\xb0\xfb\xef\x37\
-\x55\x76\xd3\xf7\x0a\x00\x76\xa7\x8f\xb9\x8d\xf9\x7c\xb0\xe5\x17\
-\xff\x87\xff\xe3\xe2\xe2\xe8\xd9\xb3\x57\x10\x5a\x94\xa3\x4f\x9f\
-\xbe\xa6\x26\x48\xad\xdf\xae\x00\x90\x97\x2a\xe5\xfd\xff\x5d\x56\
-\xa9\x60\x7e\x96\x79\x69\xb5\x62\xbd\xb9\x0e\x73\x90\x05\x73\x64\
-\x0a\xd2\xab\x77\x6f\xa2\x4d\xdc\x5a\xd8\xba\x2d\x9b\x6c\x7d\x64\
-\x6c\x4d\x01\xc0\xc6\xf6\x1d\xf5\x71\x2c\xd9\xff\x00\x70\xe9\xa5\
-\x97\x9a\x3a\xe1\x14\x55\xa5\x4a\x95\xb8\xe0\x82\x0b\xfc\x2e\xb7\
-\x7b\xbf\x8f\x3f\x8f\xe9\x71\xc0\x53\xb5\x6a\xec\xff\x10\x40\x9b\
-\x0b\x4d\x0c\x1b\x94\x62\x3e\x1f\xac\xfc\xc6\xff\x00\xe0\x74\x3a\
-\xb9\xea\xea\xab\x83\xd0\xa2\x7f\x94\x2d\x5b\x96\xce\x26\x46\x18\
-\x52\xd3\x7c\x5a\x1a\xd8\xe6\x14\x00\x6c\xec\x70\xa2\xb9\xce\xb2\
-\xf9\x45\x17\x59\xdc\x92\xd3\xb5\x6d\xdb\xce\x54\xb9\x6f\xb6\xe9\
-\x84\x76\xaa\x9e\x97\x45\x50\x36\xae\xe8\x57\xf4\x65\x62\x0d\x7a\
-\x5e\xe6\x0a\x62\x8b\xc2\xcf\xb6\x5f\xb2\x39\x78\xc4\xff\xcf\x4b\
-\x93\x26\x4d\x82\x72\xab\xec\x54\xad\x5a\xb5\x32\x55\xce\x8a\x05\
-\x8d\x24\x7c\x29\x00\xd8\xd8\xe1\x44\x73\xe5\xea\xd4\xa9\x63\x6d\
-\x43\xf2\xd0\xb4\x59\x33\x53\xe5\x56\x69\x1e\xc0\x69\x2a\x24\x18\
-\x3c\x33\xb4\xe8\x2b\x25\x3e\x7d\xb7\x9b\x8a\xe5\x74\x0b\xe0\x64\
-\xcb\x4d\x0e\xff\xb7\x6e\xdd\xc6\xe2\x96\xe4\xed\xec\x73\xce\x31\
-\x55\xee\xd0\x61\x05\x66\x3b\x53\x00\xb0\xb1\x14\x8f\xb9\xf4\x5f\
-\xb6\x6c\x82\xc5\x2d\x39\x5d\xd3\xa6\x4d\x4d\x95\x5b\xba\x59\x01\
-\x20\x2f\x83\x6e\x70\xf1\x9f\xc1\x6e\x0a\x5a\x3b\xc6\x30\xe0\xb1\
-\xc1\x6e\x6e\xef\xa6\xab\xff\x53\xad\x34\xf9\xb4\x4c\xab\xd6\xe6\
-\xae\xcc\xfd\x95\x90\x60\xee\x33\x99\xa5\x79\x80\xb6\xa6\x00\x60\
-\x63\x51\x91\xe6\xca\x65\x67\x07\xff\xac\x51\xb9\x72\x65\x6a\xd6\
-\xac\xe9\x77\xb9\x1f\xff\xe7\xe5\xc0\x51\x0d\x6b\xe6\x65\xd4\x6d\
-\x91\x2c\x9e\x1c\x43\x87\xe6\xce\x7f\xcd\xf2\x77\x3a\xe0\x92\x66\
-\x4e\x16\x4d\x8e\x61\xd4\x40\x93\x07\x45\x29\x96\x95\x0d\xab\x37\
-\xf9\x7f\xcc\x3b\x1c\x0e\x5a\xb4\x68\x19\x84\x16\x9d\x2e\x33\xd3\
-\xdc\x33\xfd\x2e\xfd\xb9\x6d\x4d\x2f\x03\xb2\xb1\x68\xb7\xb9\x61\
-\xde\x43\x87\x0e\x59\xdc\x92\xbc\xb5\x68\xd9\x92\x3d\x7b\xf6\xf8\
-\x55\xc6\xe7\x83\x25\x1b\xb3\xb9\xf1\x0a\x1d\xda\x79\x69\xdb\xc4\
-\xc9\x17\x93\x62\x38\x76\xc2\xc7\xae\x3f\xbc\x60\xc0\xd9\x35\x1c\
-\x24\xc4\x6b\xc8\x3f\x3f\xeb\xbe\xcd\xe2\x84\x89\xc9\xb2\xe7\x9e\
-\x7b\x6e\xb1\xdc\xff\x07\xd8\xb7\x77\xaf\xa9\x72\xee\x48\xfd\xdd\
-\xed\x4c\x23\x00\x36\x56\xde\xe4\x0b\xc1\x76\xec\xd8\x61\x6d\x43\
-\xf2\xd1\xbe\x5d\x7b\x53\xe5\xe6\xad\xd1\xb8\x66\x61\xca\xc5\x1b\
-\x34\x6b\xe8\xa4\x69\x43\xa7\x3a\xff\x42\x7c\x64\xf2\x3d\x13\x97\
-\x5d\x76\x99\xc5\x2d\xc9\xdf\x4f\x26\x3f\x93\xd5\xaa\xe8\x6f\x6f\
-\x67\x0a\x00\x36\x56\xa7\xba\xc3\xd4\x82\x2f\x9b\x36\x6e\xb4\xbe\
-\x31\x79\x68\xd7\xde\x5c\x00\x58\xfc\x4d\x36\xa9\x7a\xd7\x89\x58\
-\x20\x33\x0b\x3e\x31\xb9\xfe\x7f\xa7\xcb\x2e\xb7\xb8\x35\xf9\xfb\
-\x66\xfd\x7a\xbf\xcb\x38\x1c\x70\x66\x75\x3d\xee\x69\x67\x0a\x00\
-\x36\xe6\x76\x41\x2d\x13\x57\x00\x1b\x37\x6e\xc4\xeb\x0d\xfe\xec\
-\xe1\xaa\x55\xab\x52\xaf\x5e\x3d\xbf\xcb\xa5\xa6\xc3\x92\x0d\x9a\
-\x0c\x28\x81\x5b\xb2\x36\x8b\xa3\x26\xde\x95\x11\x17\x17\xc7\xc5\
-\x17\x5f\x1c\x84\x16\x9d\xce\xeb\xf5\xb2\x69\xd3\x26\xbf\xcb\xd5\
-\xa8\xea\xc0\xad\x39\x00\xb6\xa6\x00\x60\x73\xe7\xd5\xf2\xff\x10\
-\x48\x4a\x4a\xe2\xa7\xed\xdb\x83\xd0\x9a\xd3\x75\xea\xd4\xc9\x54\
-\xb9\x0f\x97\xe8\x36\x80\x04\x6e\xd6\xe7\x19\xa6\xca\x75\xec\xd8\
-\x91\xc8\xc8\xe2\xe9\x5d\x77\xee\xdc\x49\x62\xa2\xff\xcf\xf4\x5e\
-\x78\xbe\xae\xfe\xed\x4e\x01\xc0\xe6\x5a\x9f\x67\xee\x10\x58\xff\
-\xcd\x37\x16\xb7\x24\x6f\x66\x57\x51\x5b\xb0\x36\x8b\x23\x49\x7a\
-\x1a\x40\xcc\x4b\xf5\xf8\xf8\x6c\x85\xb9\x20\x79\xdd\xf5\x37\x58\
-\xdc\x9a\xfc\x7d\x63\xf2\xb3\x78\xf1\x85\x9a\x28\x6b\x77\x0a\x00\
-\x36\xd7\xd6\x64\x00\xd8\xb0\xa1\x78\x02\xc0\x45\x17\x5d\x44\xa5\
-\x4a\x95\xfc\x2e\x97\x91\x05\x73\x56\xea\x36\x80\x98\x37\x7f\x49\
-\x16\xc9\xa9\xfe\x87\x48\x77\x54\x14\x57\x5c\x71\x45\x10\x5a\x94\
-\xb7\x75\x5f\x7d\x65\xaa\xdc\x45\x17\x28\x00\xd8\x9d\x02\x80\xcd\
-\x35\xad\xeb\x30\xb5\x1e\xc0\xda\x35\x6b\x8a\x65\x1e\x80\xc3\xe1\
-\xe0\xca\x2b\xaf\x34\x55\x76\xea\x02\xbd\xef\x5c\xcc\x9b\xfc\xa1\
-\xb9\x99\xa4\x9d\x3a\x76\x22\x2e\xce\xe4\x23\x36\x26\xac\x58\xb9\
-\xd2\xef\x32\xae\x08\x68\xa2\x5b\x00\xb6\xa7\x00\x60\x73\x6e\x17\
-\x5c\x54\xdf\xff\xc3\xe0\xd0\xa1\x43\xfc\xf8\xe3\x8f\x41\x68\xd1\
-\xe9\xba\x5e\x77\x9d\xa9\x72\x9b\x77\x7a\xf9\x66\xbb\x96\x3a\x15\
-\xff\xad\xd9\x94\xc5\xa6\x1f\xcc\x8d\x20\xf5\xec\x15\xbc\x37\x65\
-\x9e\xea\xe7\x9f\x7f\x36\xb5\x06\x40\xe3\x86\x11\x44\x47\xe9\x11\
-\x40\xbb\x53\x00\x10\xd3\xb7\x01\x96\x2d\x5b\x6a\x71\x4b\xf2\xd6\
-\xb6\x6d\x5b\xce\xa8\x56\xcd\x54\xd9\xd7\xe6\x6a\x14\x40\xfc\x37\
-\x69\x9a\xb9\xc9\x7f\x09\x09\x09\x5c\x75\xd5\x55\x16\xb7\x26\x7f\
-\x2b\x57\xac\x30\x55\xae\x65\x53\x5d\xfd\x8b\x02\x80\x00\xed\x1b\
-\x99\x3b\x19\xac\x58\xbe\xdc\xe2\x96\xe4\xcd\xe1\x70\xd0\xbd\x7b\
-\x77\x53\x65\x3f\x5a\x9e\xc5\x7e\x13\x6f\x71\x2b\xcd\x0e\x1f\xf7\
-\x31\x6d\x61\x26\xa3\xff\x9b\xce\xe8\xff\xa6\x33\x6d\x41\x26\x87\
-\xf4\x1a\xe5\xbf\xfd\xfa\xbb\x97\x85\x2b\xcc\x05\xc7\x6e\xdd\xbb\
-\x13\x15\x15\x65\x71\x8b\xf2\xb7\xc2\x64\x00\xe8\xd0\x4a\xef\x7b\
-\x10\x2d\x05\x2c\x40\xbb\x46\x0e\x62\xdc\xf8\xbd\x78\xce\xa6\x4d\
-\x9b\x48\xcd\x67\x67\x76\x00\x00\x20\x00\x49\x44\x41\x54\x4a\x4a\
-\xa4\x4c\x99\xb2\xc1\x69\xd8\x49\x7a\xf6\xec\xc9\xa4\x89\x13\xfd\
-\x2e\x97\x9e\x09\xaf\xcc\xce\xe4\xb9\x3b\xf4\xc0\xb3\x27\x03\x1e\
-\x9b\x9c\xce\xeb\x1f\x67\x90\x71\x4a\xff\x16\xe9\x82\xc1\xdd\x23\
-\x19\x3d\xc4\x4d\x74\xd1\x5f\x1c\x58\x2a\x4d\xfe\x20\x1d\xb3\xd3\
-\x5b\xfa\xf5\xeb\x67\x6d\x63\x0a\x90\x9e\x9e\xce\x72\x13\x21\xdc\
-\x15\x01\x6d\x2f\xd6\xa9\x5f\x34\x02\x20\xe4\xbc\x14\xa8\x7d\x63\
-\xff\x47\x01\xb2\xb2\xb2\x58\xb6\x74\x59\x10\x5a\x74\xba\xfa\xf5\
-\xeb\x9b\x5e\x58\xe5\xbf\xf3\xb3\x38\x6e\x62\x2d\xf7\xd2\x24\x25\
-\xcd\xc7\x95\x43\x53\x99\x38\xe3\xf4\xce\x1f\x20\x23\x13\x26\xcd\
-\xc8\xe0\xaa\x21\xa9\xa4\xa4\xd9\xf7\x77\x75\xe4\xb8\x8f\x69\x26\
-\x6f\x1b\x35\x69\xd2\x84\x66\x26\x5f\x63\x6d\xc6\xaa\x55\xab\x48\
-\x4e\x4e\xf6\xbb\x5c\xd3\x46\x11\xc4\xc5\xea\xfe\xbf\x28\x00\xc8\
-\x5f\xae\x6c\x6e\xee\x50\x58\xb0\x60\x81\xc5\x2d\xc9\xdf\xad\x03\
-\x06\x98\x2a\x77\x22\xd5\xc7\xc4\xd9\xf6\x9e\x0b\x70\xef\xf8\x74\
-\xd6\x7f\x5f\xf8\xa4\xb6\x6f\x7e\xc8\xe6\xde\xb1\xf6\x5d\x47\x79\
-\xdc\x7f\xd3\x4d\x07\xa0\x41\xb7\xdf\x6e\x71\x6b\x0a\xb6\x70\xe1\
-\x42\x53\xe5\x2e\x6d\xa5\xab\x7f\xc9\xa1\x00\x20\x00\x5c\xd9\xdc\
-\xdc\x3c\x80\xe5\xcb\x97\x91\x9a\x9a\x6a\x71\x6b\xf2\xd6\xa5\x4b\
-\x17\x2a\x56\xac\x68\xaa\xec\x84\x8f\xb2\x38\x9c\x68\xcf\x2b\xdb\
-\x1f\x7e\xf5\xf2\xa1\x1f\x2f\xb4\x99\xfe\x45\x26\xdf\xfd\x6c\xbf\
-\xa7\x27\xfe\xf7\x87\x97\xff\xce\x34\x17\x7e\x2a\x54\xa8\x40\xb7\
-\x6e\xdd\x2c\x6e\x51\xfe\xbc\x5e\x2f\x9f\x7f\xf6\x99\xa9\xb2\x1d\
-\xdb\xe8\xfe\xbf\xe4\x50\x00\x10\x00\xea\x56\x37\xa8\x7d\x86\xff\
-\xc3\x82\x69\x69\x69\x2c\x59\xb2\x24\x08\x2d\x3a\x5d\x64\x64\x24\
-\x37\xde\x78\x93\xa9\xb2\x27\x52\x7d\x8c\xff\xd0\x9e\xa3\x00\xb3\
-\x17\x67\xe2\xf3\x23\xfb\xf8\x7c\x39\x65\xec\xe6\xc9\x89\x9e\x3c\
-\x6f\x8f\x14\xc5\x80\xdb\x6e\x2b\xd6\xc9\x7f\x1b\x37\x6e\xe4\xc0\
-\x81\x03\x7e\x97\xab\x50\xce\xa0\x45\x13\x8d\x00\x48\x0e\x05\x00\
-\xf9\xdb\xb5\x2d\xcd\x8d\x02\x2c\x5c\xf0\xa9\xc5\x2d\xc9\xdf\xc0\
-\x41\x83\x70\xbb\xcd\xcd\x52\x9b\x32\x37\x93\xdd\xfb\xed\x37\x0a\
-\xf0\xe3\x2e\xff\xaf\xe6\xb7\x99\x28\x13\xce\x36\xff\x98\xcd\xec\
-\x45\xe6\x7a\xff\xe8\xe8\x68\xee\xb8\xe3\x0e\x8b\x5b\x54\xb0\x8f\
-\x67\x7f\x64\xaa\xdc\x55\x1d\x5c\x38\xf5\x04\xa0\xfc\x45\x01\x40\
-\xfe\xd6\xbd\xad\xb9\x33\xc3\xd2\xa5\x4b\x39\x71\xe2\x84\xc5\xad\
-\xc9\x5b\xa5\x4a\x95\xe8\xdb\xb7\xaf\xa9\xb2\x9e\x0c\x78\x68\x8a\
-\xb9\xe7\xbb\xc3\xd9\xf1\x13\xfe\x87\x9e\xa3\x36\x7b\x8f\xc2\xff\
-\xbd\xe4\xf1\x6b\x94\xe4\x64\x37\xdf\x72\x8b\xe9\x5b\x53\x66\x64\
-\x65\x65\x31\x67\xce\x1c\x53\x65\xbb\x5c\xa6\xa7\x61\xe4\x1f\x0a\
-\x00\xf2\xb7\x96\xe7\x3a\xa8\x5e\xc1\xff\xdb\x00\xa9\xa9\xa9\xcc\
-\x9f\x3f\x3f\x08\x2d\xca\xdb\x5d\x43\x86\x12\x11\x61\x6e\x18\xf3\
-\x93\x55\x59\x2c\xdf\xac\x77\x04\xc8\x3f\xe6\x2f\xcb\x64\xd5\x06\
-\x73\x2f\xfd\x89\x8c\x8c\xe4\xee\xbb\xef\xb6\xb8\x45\x05\x5b\xb1\
-\x62\x05\x87\x0e\x1d\xf2\xbb\x5c\x74\x94\x41\xa7\x36\x1a\xfe\x97\
-\x7f\x28\x00\xc8\xdf\x1c\x06\xdc\x60\x72\x14\x60\xe6\x8c\x19\x16\
-\xb7\x26\x7f\xb5\x6a\xd5\x0a\x68\xc2\xd5\xfd\xaf\x64\x90\x6e\xbf\
-\x5b\xdc\x92\x87\x63\x89\x3e\x86\x3d\x93\x66\xba\xfc\x4d\x37\xdf\
-\x4c\x8d\x1a\x35\x2c\x6c\x51\xe1\x3e\x9a\x35\xd3\x54\xb9\x8e\xad\
-\x23\x88\x89\xd6\xe3\x7f\xf2\x0f\x05\x00\xf9\x97\xee\xed\xcc\x05\
-\x80\x0d\x1b\x36\xf0\xcb\x2f\x3f\x5b\xdc\x9a\xfc\x3d\x30\x62\x24\
-\x2e\x97\xb9\xe1\xcc\xed\xbb\xbd\x8c\x7d\xdf\x7e\xb7\x02\xe4\x74\
-\x0f\x8e\xf7\x70\xe0\xb0\xb9\xb1\xff\xe8\xe8\x68\x46\x8e\x18\x61\
-\x71\x8b\x0a\x96\x94\x94\xc4\xa7\x9f\x9a\x9b\x73\xd3\xa3\xb3\x86\
-\xff\xe5\xdf\x14\x00\xe4\x5f\x5a\x9f\xe7\xa0\x9a\x89\xdb\x00\x00\
-\x33\x67\x98\xbb\x32\x31\xa3\x56\xad\x5a\xf4\xbf\xb1\xbf\xe9\xf2\
-\xe3\x3e\xcc\xe4\xc7\xff\xd9\x6b\xa2\x9b\xfc\xdb\xa2\xd5\x59\x7c\
-\xf8\xa9\xf9\x20\x38\x78\xf0\x60\xaa\x54\xad\x6a\x61\x8b\x0a\x37\
-\x73\xe6\x4c\x53\x8f\xdd\xc6\xc6\x18\x5c\xd3\x49\x8f\xff\xc9\xbf\
-\x29\x00\xc8\xbf\x38\x0c\xe8\x7b\xa9\xb9\x51\x80\x59\xb3\x66\x92\
-\x99\x59\x7c\x63\xeb\xc3\x86\x0d\x27\x26\x26\xc6\x54\xd9\x8c\x4c\
-\xb8\xed\xb9\x74\xd3\x8f\x7d\x49\x78\x4b\x4a\xf6\x71\xcf\x53\xe6\
-\x87\xfe\xcb\x97\x2f\xcf\xfd\xc3\x86\x59\xd8\xa2\xa2\x79\xfb\xed\
-\xb7\x4d\x95\xbb\xf6\x32\x17\xb1\x1a\xfe\x97\x53\x28\x00\xc8\x69\
-\x6e\xbd\xc2\xdc\x44\xa1\x83\x07\x0f\x32\x6f\xee\x5c\x8b\x5b\x93\
-\xbf\x2a\x55\xaa\x30\x34\x80\x09\x58\xdf\xee\xf4\xf2\xe4\xdb\xba\
-\x15\x60\x47\x0f\x3f\xef\x61\xef\x9f\xe6\x47\x80\x1e\x79\xe4\x11\
-\x12\x12\x12\x2c\x6c\x51\xe1\xd6\xaf\x5f\xcf\x36\x93\xaf\xe0\xee\
-\x75\xad\x86\xff\xe5\x74\x0a\x00\x72\x9a\x06\x67\x1a\xb4\x68\x60\
-\xee\xd0\x78\xf3\xcd\x37\x2d\x6e\x4d\xc1\x86\x0e\xbd\x3b\xa0\x49\
-\x58\x2f\xcc\xc8\x64\xd5\x16\x3d\x15\x60\x27\xd3\x17\x66\xf2\xce\
-\x27\xe6\x83\x5f\x83\x06\x0d\x4c\x2f\x4b\x1d\x88\xb7\xa6\x4e\x35\
-\x55\xae\x52\x05\x43\xab\xff\x49\x9e\x14\x00\x24\x4f\xb7\x5e\x61\
-\xee\x36\xc0\xd6\xad\x5b\xd8\xb0\x61\x83\xc5\xad\xc9\x5f\x54\x54\
-\x14\x4f\x3c\xf1\xa4\xe9\xf2\x5e\x2f\xf4\x7f\x32\x9d\x3f\x0e\xda\
-\xeb\xb9\x77\xbb\xfa\x7e\x47\x36\xf7\x8c\x36\x3f\xf4\x0f\xf0\xdc\
-\x98\x31\xa6\x1f\x43\x35\x6b\xff\xbe\x7d\x7c\xf2\xc9\x27\xa6\xca\
-\xf6\xbb\xde\x4d\x84\x16\xff\x91\x3c\x28\x00\x48\x9e\x7a\x5e\xe2\
-\x24\xc6\xe4\x6b\x61\xa7\xbe\xf9\x86\xb5\x8d\x29\x44\x97\x6b\xaf\
-\xe5\x92\x4b\x2e\x31\x5d\xfe\xe0\x31\x1f\x3d\x1f\xf5\x90\x66\xdf\
-\x77\xe0\xd8\x42\xe2\x09\x1f\x7d\x1f\x48\x25\xd5\x63\x3e\xec\xf5\
-\xee\xd3\x87\x0e\x1d\x3a\x58\xd7\xa8\x22\x7a\xfd\xf5\xd7\xc9\xc8\
-\xf0\x7f\xd4\xc2\x30\xe0\xb6\xde\x36\x7f\xbf\xb3\xe4\x4b\x01\x40\
-\xf2\x54\x36\xd6\xa0\x47\x7b\x93\x4b\x03\x2f\x5c\xc8\xef\xbf\xff\
-\x6e\x71\x8b\x0a\x36\x6e\xfc\xf3\x44\x47\x47\x9b\x2e\xbf\x79\xa7\
-\x97\xbb\x9e\x57\x02\x28\xad\xbc\x5e\xb8\xed\xff\x52\xd9\xb5\xc7\
-\xfc\x7d\xff\x0a\x15\x2a\xf0\xcc\x33\xcf\x58\xd8\xaa\xa2\x49\x4e\
-\x4e\x36\x3d\xf9\xef\x92\x96\x11\x9c\x53\x4b\xa7\x79\xc9\x9b\x8e\
-\x0c\xc9\xd7\xd0\xae\xe6\x86\x39\xb3\xb2\xb2\x98\x34\x69\xa2\xc5\
-\xad\x29\x58\xad\x5a\xb5\x78\xf0\xa1\x87\x02\xaa\x63\xfa\xe2\x2c\
-\x5e\x9a\xa1\xc7\x02\x4a\xa3\xb1\x6f\xa6\xf3\xf9\x2a\x73\xab\xfd\
-\xe5\x7a\xf6\xd9\x67\xa9\x50\xa1\x82\x45\x2d\x2a\xba\x69\xef\xbd\
-\x47\x62\x62\xa2\xa9\xb2\x83\xfa\xea\xea\x5f\xf2\xa7\x00\x20\xf9\
-\x6a\x5a\xd7\x41\xeb\xf3\xcc\x1d\x22\x33\x67\xcc\xe0\xc0\xfe\xfd\
-\x16\xb7\xa8\x60\x83\x07\xdf\x41\x93\x26\x4d\x03\xaa\xe3\xff\x5e\
-\xcf\x60\xc9\x06\x4d\x0a\x2c\x4d\xde\xff\x34\x83\xa7\xa7\x78\x02\
-\xaa\xa3\x4b\x97\x2e\xf4\xea\xdd\xdb\xa2\x16\x15\x5d\x7a\x7a\x3a\
-\x13\x27\x9a\x0b\xd3\x55\x2a\x3a\xe8\xdc\x49\xb3\xff\x25\x7f\x0a\
-\x00\x52\xa0\xbb\xaf\x37\x37\x0a\x90\x91\x91\xc1\xe4\x29\x93\x2d\
-\x6e\x4d\xc1\x9c\x4e\x27\x53\x5e\x7b\x8d\xb8\xb8\x38\xd3\x75\x64\
-\x7b\xa1\xef\xe3\xe9\x6c\xd8\xae\x45\x82\x4a\x83\xcf\x56\x66\x32\
-\xe4\x89\x34\xd3\x2f\xfa\x01\xa8\x58\xb1\x22\x2f\xbc\xf8\xa2\x75\
-\x8d\xf2\xc3\xbb\xef\xbe\xcb\xbe\x7d\xfb\x4c\x95\xbd\xbd\x9f\x1b\
-\x97\x96\xfe\x97\x02\x28\x00\x48\x81\x6e\x68\xe3\xa4\x46\x45\x73\
-\x0b\x88\xbc\x3f\x6d\x9a\xa9\x97\x96\x04\xe2\xac\xb3\xce\xe2\xf1\
-\x27\x9e\x08\xa8\x8e\xa4\x14\x1f\xd7\x8e\xf4\xb0\xe5\x67\x85\x80\
-\x70\xb6\x66\x53\x16\x37\x3d\x98\x46\x56\x00\x03\x3a\x86\x61\x30\
-\x71\xd2\x24\x2a\x57\xae\x6c\x5d\xc3\x8a\xc8\xe3\xf1\xf0\xd2\x4b\
-\x2f\x99\x2a\x1b\x13\x65\x70\xbb\x86\xff\xa5\x10\x0a\x00\x52\xa0\
-\x08\x27\xdc\x79\xad\xb9\xcb\x88\xb4\xb4\x34\x5e\x9e\x30\xc1\xe2\
-\x16\x15\xee\xa6\x9b\x6e\xe6\xaa\xab\xae\x0a\xa8\x8e\x63\x27\x7c\
-\x74\x7e\xc0\xc3\x36\x2d\x17\x1c\x96\xbe\xdb\x91\x4d\x8f\xfb\x52\
-\x49\x4b\x0f\xec\xf1\xce\xc1\x77\xdc\x11\xf0\xb1\x64\xd6\x3b\xef\
-\xbc\xc3\x7e\x93\x57\xff\xfd\x6e\x88\xa4\x42\x39\xad\xfc\x27\x05\
-\x53\x00\x90\x42\xdd\xd1\xc5\x49\xd9\x58\x73\x27\x93\xf7\xde\x7b\
-\x97\xdd\xbb\x77\x5b\xdb\xa0\x22\x78\xf9\xe5\x57\x38\xf3\xcc\x33\
-\x03\xaa\xe3\x70\xa2\x8f\xab\x86\x7b\xf8\x39\x80\x99\xe3\xa1\x20\
-\x21\xde\xff\xbf\x5d\xf9\x32\xe1\xdb\x79\xfc\xf4\x3f\x2f\x5d\x87\
-\xa4\x90\x94\x1c\x58\xe7\xdf\xb4\x69\x53\x46\x8f\x1e\x6d\x51\xab\
-\xfc\x93\x9a\x9a\xca\x04\x93\x57\xff\x0e\x07\xdc\x73\x6b\x94\xc5\
-\x2d\x92\xd2\x48\x01\x40\x0a\x95\x10\x67\x30\xc4\xe4\x13\x01\x99\
-\x99\x99\x8c\x1d\xf3\x9c\xc5\x2d\x2a\x5c\xd9\x84\x04\xa6\x4e\x7d\
-\x0b\xb7\x3b\xb0\x61\xd0\x3f\x8f\xfa\xb8\x72\x98\x87\x5d\xfb\xc2\
-\x37\x04\x9c\x7b\xb6\xff\x1f\xf3\x06\xb5\xc3\xf3\xd4\xb0\xe9\xc7\
-\x6c\x2e\x1f\x90\xcc\xc1\x23\x81\x75\xfe\x09\x09\x09\xbc\xf5\xf6\
-\xdb\x44\x46\x96\xcc\x24\xba\x57\x5e\x79\x85\x03\x07\x0e\x98\x2a\
-\xdb\xa5\x93\x4b\x8f\xfe\x49\x91\xe8\x28\x91\x22\xb9\xf7\x86\x08\
-\x62\x4d\x5e\x54\xcc\x9b\x37\x8f\xef\xbe\xdb\x6a\x6d\x83\x8a\xa0\
-\x51\xe3\xc6\x3c\xfb\x5c\xe0\xe1\x63\xef\x21\x1f\x97\x0c\xf1\x84\
-\xed\xc4\xc0\x6e\x1d\x5d\x18\x7e\x5c\xd0\x1b\x06\xf4\xb8\x2c\xfc\
-\x66\x8f\x2d\xff\x26\x8b\xab\x07\xa7\x70\xe4\x78\x60\x9d\xbf\xd3\
-\xe9\x64\xea\x5b\x6f\x51\xab\x56\x2d\x8b\x5a\xe6\x9f\x03\x07\x0e\
-\x30\xf1\x95\x57\x4c\x95\x35\x0c\x18\x79\xa7\xae\xfe\xa5\x68\x14\
-\x00\xa4\x48\x2a\x96\x35\x18\xdc\xd9\xdc\x7a\xe2\x3e\x9f\x8f\xd1\
-\x4f\x9a\x5f\xae\x37\x10\xfd\xfb\xdf\xc8\xc0\x41\x83\x02\xae\xe7\
-\xe0\x31\x1f\x57\xdc\x97\xc6\x82\xb5\xe1\xf7\x88\xe0\x05\xf5\x1c\
-\xf4\xba\xbc\xe8\x7f\xbb\x1e\x97\x45\x70\x61\xfd\xf0\x5a\x3b\x76\
-\xee\xd2\x4c\xba\xdd\x93\x42\x72\x6a\xe0\x4b\x3a\x3f\x39\x7a\x34\
-\x1d\x3b\x76\xb4\xa0\x55\xe6\x3c\xfb\xec\xb3\xa4\xa4\xa4\x98\x2a\
-\x7b\xcd\xa5\x2e\x9a\x9c\x17\x5e\x7f\x3b\x29\x39\x0a\x00\x52\x64\
-\xc3\x7b\x46\x10\x6d\x72\x44\x7d\xed\xda\xb5\xcc\x9b\x37\xcf\xda\
-\x06\x15\xd1\xe8\xd1\x4f\xd1\xb1\x53\xa7\x80\xeb\x49\xf5\x40\xaf\
-\xff\xf3\x30\x65\x4e\xf8\x2d\x16\x34\xe9\x61\x37\x4d\x1b\x14\xde\
-\x31\x5c\x58\xdf\xc9\xab\xa3\xc2\xeb\x0a\xf2\xed\x39\x19\xdc\xf4\
-\x60\x1a\xe9\x16\xbc\xd8\xb1\x6f\xdf\xbe\x0c\x1d\x3a\x34\xf0\x8a\
-\x4c\xfa\xf1\xc7\x1f\xf9\xe0\xfd\xf7\x4d\x95\x35\x0c\x78\xe4\xee\
-\xf0\xfa\xdb\x49\xc9\x52\x00\x90\x22\xab\x5a\xce\xe0\x8e\x2e\xe6\
-\x87\x86\x9f\x78\xe2\x71\xd3\x57\x36\x81\x70\x3a\x9d\xbc\xfe\xfa\
-\x7f\x69\xd0\xa0\x41\xc0\x75\x65\x7b\xe1\xfe\x09\xe9\x3c\xf8\x6a\
-\x3a\xde\x30\xba\x23\x10\x1f\x63\xb0\x78\x4a\x34\x83\xbb\xb9\xf2\
-\x7c\x31\x4c\x84\x13\x6e\xef\xe6\x62\xc9\xeb\xd1\xc4\xc7\x84\xc7\
-\x04\xc0\xcc\x2c\x78\x60\xac\x87\xa1\x4f\x79\xc8\xb6\xe0\x6f\xd1\
-\xa1\x43\x07\x26\xbc\xfc\x72\xe0\x15\x99\xe4\xf3\xf9\x78\x60\xf8\
-\x70\xb2\xb3\xcd\x8d\x32\x75\xe9\xe4\xe2\xc2\x73\x75\xf5\x2f\x45\
-\xa7\x00\x20\x7e\x79\xb8\x8f\x8b\x84\x38\x73\x1d\xc4\x81\xfd\xfb\
-\x79\xa9\x84\x16\x54\x89\x8f\x8f\x67\xfa\xf4\x19\x54\xaf\x6e\xfe\
-\xd5\xc1\x27\x7b\x79\x66\x26\xdd\x1e\xf1\x70\x28\xc0\xfb\xcd\xc5\
-\x29\x36\xda\xe0\x95\x07\xa3\xd8\xf1\x49\x1c\x93\x1e\x8a\xe2\xde\
-\xbe\x91\xdc\xdd\x27\x92\x89\x0f\x47\xf1\xd3\xdc\x38\x5e\x79\x28\
-\x8a\xd8\xe8\xf0\xe8\xfc\xf7\x1d\xf4\x71\xe5\xa0\x14\xa6\xcc\xb0\
-\xe0\xb2\x1f\x68\xd4\xa8\x11\xef\x4d\x9b\x56\x62\x93\xfe\x20\x67\
-\xdd\x8c\xaf\xbf\xfe\xda\x54\x59\x87\x03\x46\xe9\xea\x5f\xfc\xa4\
-\x00\x20\x7e\xa9\x50\xc6\x60\x64\x2f\xf3\xa3\x00\xff\xfd\xef\xeb\
-\xfc\xfc\xf3\xcf\x16\xb6\xa8\xe8\xce\xa8\x56\x8d\x59\xb3\x66\x59\
-\xb6\x9e\xfb\xe7\xeb\xb2\xb8\xe8\xb6\x54\x56\x6c\x0e\xaf\x79\x01\
-\xd5\x2b\x1b\x0c\xba\xc1\xc5\xb8\xfb\xdc\x8c\x1f\xe6\x66\xd0\x0d\
-\x2e\xaa\x57\x0e\x8f\x8e\x1f\x60\xd5\xc6\x2c\x5a\xf7\x4b\xe6\xeb\
-\xad\xd6\xfc\xde\xcf\x3a\xeb\x2c\x66\x7d\xf4\x11\xf1\xf1\xf1\x96\
-\xd4\x67\xc6\x91\x23\x47\x78\xfc\xf1\xc7\x4d\x97\xef\x7d\x6d\x24\
-\x8d\x8a\x70\x8b\x47\xe4\x64\x0a\x00\xe2\xb7\x7b\xae\x77\x99\x5e\
-\x1d\x30\x33\x33\x93\x11\x23\x1e\xc0\x5b\x42\xe3\xe7\xe7\xd4\xa9\
-\xc3\xf4\xe9\x33\x2c\x3b\xd9\xef\x3f\xec\xe3\xea\xe1\x69\x3c\xfe\
-\x66\x46\x40\x2b\xce\x49\xe1\xbc\x5e\x78\xf1\xdd\x0c\xba\xdc\x99\
-\x1a\xf0\x63\x7e\xb9\xaa\x57\xaf\xce\xdc\x79\xf3\xa9\x52\xa5\xaa\
-\x25\xf5\x99\xf5\xd8\x63\x8f\x71\xf4\xe8\x51\x53\x65\xa3\xa3\x0c\
-\x1e\xbf\x5f\x57\xff\xe2\x3f\x05\x00\xf1\x5b\xb4\x1b\x1e\xbf\xd9\
-\xdc\x13\x01\x00\xdf\xac\x5f\xcf\x5b\x6f\x4d\xb5\xb0\x45\xfe\x69\
-\x7c\xc1\x05\x7c\x3c\x67\x0e\x09\x09\x09\x96\xd4\xe7\xf5\xc2\x98\
-\xf7\x32\xe8\x70\x57\x1a\xbb\xf6\x86\xd1\xc4\x80\x30\xf2\xbf\xbd\
-\x5e\x3a\xdf\x95\xca\xa3\x2f\x7b\x2c\x0b\x5a\x95\x2a\x55\x62\xce\
-\x27\x9f\x04\xbc\x60\x54\xa0\x96\x2f\x5f\xce\xf4\x0f\x3f\x34\x5d\
-\xfe\x9e\x5b\xdd\xd4\x38\x43\xa7\x72\xf1\x9f\x8e\x1a\x31\xe5\xa6\
-\xcb\x23\x68\x6c\x62\x81\x99\x5c\xcf\x3d\xfb\x2c\xbf\xfd\xf6\x9b\
-\x85\x2d\xf2\xcf\x05\x17\x5c\xc0\x87\xd3\xa7\x53\xa6\x4c\x19\xcb\
-\xea\xdc\xb0\x3d\x9b\x96\x03\xd3\x78\x75\x76\xa6\x25\x93\xd2\x24\
-\x67\xd2\xe5\x84\xf7\x32\x68\xde\x23\x99\x95\x1b\x02\x7b\x9d\xef\
-\xc9\xaa\x56\xad\xca\xa7\x0b\x16\x50\xb7\x6e\x3d\xcb\xea\x34\x23\
-\x31\x31\x91\xa1\x43\x86\xe0\x33\xf9\xb6\xa2\x4a\x15\x0c\x86\x0d\
-\xd2\x9a\xff\x62\x8e\x02\x80\x98\xe2\x74\xc0\xc4\x7b\x22\xfd\x5a\
-\x60\xe6\x64\xa9\xa9\xa9\x3c\x30\x7c\x98\xe9\x13\x9f\x15\x9a\x35\
-\x6b\xc6\xcc\x59\xb3\x2c\x1b\x09\x00\x48\x4c\xf1\x31\xfc\xe5\x74\
-\x5a\x0d\x4a\xe5\xeb\x1f\x74\x4f\x20\x10\xdb\x77\x79\xe9\x78\x6b\
-\x0a\xa3\x26\x78\x48\x4b\xb7\xae\xde\x33\xcf\x3c\x93\x85\x9f\x7d\
-\x4e\xbd\x7a\xf5\xad\xab\xd4\xa4\x47\x1e\x79\xc4\xf4\xdb\xfe\x00\
-\x1e\xbd\x27\x9a\x78\x93\x93\x72\x45\x14\x00\xc4\xb4\xd6\xe7\x39\
-\xb8\x29\x80\x15\xe3\xd6\xae\x5d\x5b\xa2\xb7\x02\x20\x67\xbd\xf7\
-\x79\xf3\xe7\x73\xc6\x19\x67\x58\x5a\xef\xd6\x9f\xbd\x74\x18\x92\
-\xc6\x1d\x63\xd2\x39\x9c\x18\x3e\x4f\x0a\x84\x82\xa4\x64\x1f\x8f\
-\x4f\x4a\xa7\x75\xbf\x64\x36\x58\x1c\xa2\xce\xa9\x53\x87\x85\x9f\
-\x7d\x4e\xed\xda\xb5\x2d\xad\xd7\x8c\x2f\xbe\xf8\x82\x0f\x3f\xf8\
-\xc0\x74\xf9\x8b\x1a\x3b\x19\xd0\xb3\xe4\x9e\x5a\x90\xf0\xa7\x00\
-\x20\x01\x79\x76\x90\xf9\xc7\x02\x01\x9e\x1a\x3d\x9a\x6d\xdb\xb6\
-\x59\xd8\x22\xff\x35\x68\xd0\x80\x05\x0b\x17\x52\xa7\x4e\x1d\x4b\
-\xeb\xf5\xf9\xe0\x9d\x85\x99\x34\xea\x97\xca\x94\x8f\x33\x49\x0f\
-\xbf\xf5\x83\x8a\x55\x46\x26\x4c\xfa\x30\x83\x73\xbb\x26\x33\xfe\
-\xad\x74\x4b\x16\xf6\x39\x59\xf3\xe6\xcd\xf9\xe2\x8b\x2f\xa8\x5e\
-\xbd\xba\xb5\x15\x9b\x70\x60\xff\x7e\xee\x0e\x60\xc1\x21\xa7\x13\
-\x26\x3c\x11\x83\x43\x67\x70\x09\x80\x0e\x1f\x09\x48\x95\x72\x06\
-\x4f\x04\x30\x21\x30\x3d\x3d\x9d\xbb\xee\xbc\x83\xb4\xb4\x34\x0b\
-\x5b\xe5\xbf\x1a\x35\x6a\xf0\xe9\x82\x05\xb4\x6c\xd9\xd2\xf2\xba\
-\x8f\x26\xf9\xb8\xff\xa5\x74\x1a\xf6\x4e\x61\xf2\xec\x4c\x3c\x16\
-\x77\x6c\xe1\xce\xeb\x85\x99\x5f\x64\x72\x61\xf7\x64\x1e\x7c\xc1\
-\xc3\xd1\x20\x8c\x98\x5c\x7d\xf5\xd5\xcc\x9b\x3f\xdf\xb2\x47\x40\
-\x03\xe1\xf5\x7a\xb9\xfd\xf6\xdb\x39\x7c\xf8\xb0\xe9\x3a\xee\xe8\
-\xef\xe6\x82\x86\x7a\xec\x4f\x02\xa3\x00\x20\x01\xbb\xb3\x6b\x04\
-\xcd\xea\x99\x3f\x94\x76\xee\xdc\xc9\x7f\xfe\xf3\x98\x85\x2d\x32\
-\xa7\x7c\xf9\xf2\xcc\x9e\xfd\x31\x7d\xfa\xf4\x09\x4a\xfd\x7b\x0f\
-\xfa\x18\x36\x21\x9d\xfa\x3d\x53\x98\x38\x2b\x93\x54\x4f\x50\x76\
-\x13\x36\x32\xb3\xe0\xa3\x45\x99\xb4\xb9\x31\x85\x01\xff\x97\xc6\
-\xee\x20\x3d\x41\x71\xe7\x9d\x77\xf2\xde\xb4\x69\x44\x47\x47\x07\
-\xa5\x7e\x7f\xbd\xf0\xc2\x0b\xac\x5e\xbd\xda\x74\xf9\x33\x2a\x3b\
-\x78\xec\x1e\x3d\xf6\x27\x81\x53\x00\x90\x80\x39\x1d\x30\x75\x44\
-\x24\x91\x01\xbc\x40\xee\xfd\x69\xd3\x98\x3f\xbf\x64\xde\x15\x70\
-\x32\x57\x64\x24\x2f\xbf\x32\x91\xff\x3c\xfe\x38\x4e\x67\x70\xae\
-\xb0\x0e\x1c\xf1\x31\xe2\x95\x74\xea\xf7\x4a\x61\xfc\xfb\x19\x1c\
-\x3c\x6a\xaf\x39\x02\xc7\x93\x7c\xbc\xf0\x4e\x3a\x0d\xbb\x26\x73\
-\xcb\xa8\x34\xb6\xee\x08\xce\x64\x49\xb7\xdb\xcd\xa4\x57\x5f\xe5\
-\xd9\xe7\x9e\x0b\xda\xdf\xd2\x5f\x5f\xad\x5d\xcb\xd8\x31\x63\x02\
-\xaa\xe3\xe5\x27\x34\xf1\x4f\xac\xa1\x00\x20\x96\x38\xef\x2c\x07\
-\xa3\xfa\x9b\xbf\x15\x00\x30\x7c\xd8\x30\x76\xec\xd8\x61\x51\x8b\
-\x02\x33\x74\xe8\xdd\xcc\x9a\xf5\x11\x95\x2a\x55\x0a\xda\x3e\x0e\
-\x1e\xf5\xf1\xd8\x6b\x19\x9c\xd3\x2d\x85\x5e\x8f\x78\xf8\x6c\x6d\
-\x56\xa9\x7e\x7c\x70\xe7\x6f\x5e\xee\x1f\xeb\xa1\x4e\xe7\x64\x1e\
-\x9d\x98\xce\xde\x3f\x83\xf7\xc3\x56\xaf\x5e\x9d\x05\x0b\x16\xd0\
-\xaf\x5f\xbf\xa0\xed\xc3\x5f\xfb\xf7\xed\xe3\xd6\x5b\x6f\x25\x2b\
-\xcb\xfc\xe3\x8c\xfd\xae\x8b\xe4\x9a\x4b\x03\xfb\x9c\x89\xe4\x52\
-\x00\x10\xcb\x3c\xd4\xc7\x45\xd3\xba\xe6\x0f\xa9\x94\x94\x14\x6e\
-\x1b\x70\x2b\x49\x89\x89\x16\xb6\xca\xbc\xb6\xed\xda\xb1\x62\xe5\
-\x2a\xda\xb5\x6b\x1f\xd4\xfd\x64\x66\xc1\xfc\x55\x59\x74\x7b\xd0\
-\xc3\x39\xd7\xa7\xf0\xe8\x94\x8c\x52\xb3\xa0\xd0\xde\x83\x5e\x26\
-\x4d\xcf\xa0\xe3\xc0\x14\x2e\xec\x91\xcc\xeb\x1f\x65\x90\x92\x16\
-\xdc\x11\x8f\x4b\x3a\x74\x60\xd9\xb2\x65\x34\x6b\xde\x3c\xa8\xfb\
-\xf1\x47\x66\x66\x26\x03\x06\x0c\xe0\xe0\xc1\x83\xa6\xeb\xa8\x5a\
-\xc9\xc1\xb8\x51\xa1\x71\x1b\x43\x4a\x07\x05\x00\xb1\x4c\x84\x13\
-\xfe\x3b\x3c\x12\x57\x00\xb7\x02\x76\xed\xda\xc5\xdd\x77\x0f\x2d\
-\xb1\xa5\x82\x4f\x55\xb1\x62\x45\x66\xcc\x9c\xc9\x88\x91\x23\x89\
-\x88\x08\xe0\x07\x2b\xa2\x03\x47\x7c\x3c\xff\x7e\x06\xe7\xf6\x4a\
-\xa5\xc5\xad\xa9\xfc\xe7\xb5\x0c\xd6\x7d\x97\x1d\x56\x23\x03\x7f\
-\x1e\xf1\x31\x65\x56\x4e\xa7\x5f\xb7\x73\x32\x23\x5f\xf0\xb0\x6e\
-\x6b\x36\xc1\x5e\xf2\xc1\xe5\x72\x31\x7a\xf4\x68\xe6\xcc\x99\x43\
-\xa5\xca\x95\x83\xbb\x33\x3f\x8d\x1c\x31\xc2\xf4\x8b\x7e\x72\x4d\
-\x7a\x2a\x9a\x84\x32\x1a\xfa\x17\xeb\x98\x39\x9a\x7a\x00\x1f\xf9\
-\x5b\x68\xf3\x58\x17\x4d\x6a\x9f\xb2\xbb\x53\xfe\xd7\x77\xf2\x3f\
-\x16\xd6\xb2\x82\xb6\x9b\x2c\xeb\xfb\xd7\xb6\x7c\xbe\x29\x08\xfb\
-\x05\xf0\xe5\xbb\xad\x08\xbf\x0f\x0b\x7e\x57\xf9\x9e\x9b\x0b\xfa\
-\x7d\xe4\x53\xef\xd8\x19\x99\x3c\xfa\x56\x60\xcf\xbc\xdd\x3f\x6c\
-\x18\x0f\x3d\xf4\x70\x1e\x0b\x0d\x59\x73\x02\xcc\x7f\x01\xa3\xfc\
-\xeb\xdf\xbc\x79\x13\x43\x87\x0c\x61\xd7\xae\x5d\x96\xb4\xc1\x1f\
-\xe5\xcb\x18\x5c\x76\xb1\x93\xab\xdb\x44\xd0\xe9\x22\x27\x95\xcb\
-\x1b\x58\x71\x6c\xe4\x7f\xdc\x15\xa1\xfc\x5f\xdb\x8e\x26\xc2\x9a\
-\x6f\xb3\x59\xb5\x29\x8b\x55\x9b\xb2\xf9\xf1\xd7\xec\x62\x7f\x55\
-\x72\xc3\x86\x0d\x99\xf2\xda\x6b\x34\x6e\xdc\xb8\x08\xdf\x9d\xf7\
-\x0f\x65\x76\x51\xab\xc2\xea\x7f\xf3\xcd\x37\x18\x39\x62\x44\x40\
-\x35\xde\xda\x23\x92\x49\x4f\xc5\x14\x65\x77\xff\xfe\xc7\x82\xce\
-\x75\x05\x6c\x2f\x74\x5b\x91\xcb\xe6\xfd\x4d\x05\x1e\x77\x41\x39\
-\xf7\xff\xf3\xfb\x28\xfc\x5c\x67\xe5\x7e\x4f\xdd\x6e\x9c\xbe\xff\
-\x53\xca\x7e\xf7\x43\x16\xed\x2f\x3f\x5e\x48\x85\x79\xea\x09\xcc\
-\xf6\xa7\x80\x02\xc0\xa9\xfb\x57\x00\xc8\xa7\x6c\xd1\x03\x80\xd7\
-\x07\x57\x3d\x94\xce\xf2\x2d\xe6\x27\x77\x19\x86\xc1\x4b\x13\x26\
-\xe4\x31\x23\xbf\xe4\x02\x00\xe4\xac\x60\xf8\xcc\xd3\x4f\xf1\xd6\
-\x5b\x6f\x95\xe8\x28\x45\xed\x6a\x0e\x5a\x9c\xef\xe4\xa2\xf3\x1c\
-\x34\xae\xeb\xe4\xbc\x73\x1c\x94\xcf\xeb\xea\xd0\xe2\x00\x90\x94\
-\xe2\x63\xe7\x6e\x2f\x3f\xed\xf6\xb2\x65\x87\x97\x55\x9b\xb2\xf8\
-\xf1\x57\x6f\xb1\x77\xf8\xb9\x9c\x4e\x27\x43\xef\xbe\x9b\x47\x1e\
-\x79\x04\xb7\xbb\xa8\x4b\xe2\x16\x5f\x00\x58\xf4\xc5\x17\xf4\xef\
-\xdf\x8f\xec\x6c\xf3\x9f\x85\xfa\xe7\x38\x59\x3d\x3b\x8e\x98\x28\
-\x7f\xce\x49\x0a\x00\x79\x6e\x50\x00\x28\x68\xd7\x45\xa2\x00\x60\
-\xf1\x7e\xa1\x74\x05\x00\x80\x7d\x47\x7c\x34\xbb\xd3\x13\xd0\x2a\
-\x78\x2e\x97\x8b\x0f\xa7\x4f\xa7\x5d\xbb\x76\x45\xdb\xa9\x1f\xcc\
-\x06\x80\x5c\x9b\x37\x6f\x62\xf8\xb0\x61\x6c\xdf\xbe\xdd\x92\xf6\
-\x58\xa1\x5a\x25\x83\x7a\xb5\x1c\xd4\xaa\xea\xe0\xac\x6a\x0e\x6a\
-\x55\x35\xa8\x58\xde\xa0\x4a\x79\x07\x95\xca\x19\xc4\x44\x41\x42\
-\xfc\xbf\x7f\xbe\x93\x8f\xbb\xc4\x64\x1f\x47\x13\xff\xfa\x4a\xfa\
-\xe7\xbf\xbf\xfc\xee\xe3\xa7\xdd\xd9\xec\xd8\xed\x65\xef\xc1\xd0\
-\x79\x62\xa1\x71\xe3\xc6\xbc\xf4\xd2\x4b\x34\x69\xda\xd4\xcf\x92\
-\xc5\x13\x00\xb6\x6e\xdd\x4a\xe7\x6b\xae\x26\x25\x25\xc5\x74\x4d\
-\x51\x6e\x58\x31\x33\x9e\xf3\xeb\x17\xf0\x14\x83\x02\x40\x11\xb6\
-\x29\x00\xe4\x25\xf8\x37\x35\xc5\x96\xaa\x55\x30\x78\x63\x44\x24\
-\xdd\xfe\x93\x6e\xfa\xde\x6f\x66\x66\x26\x03\x6f\xbb\x8d\x4f\x17\
-\x2c\xa0\x7e\xfd\x92\x5f\xb7\xfd\x64\x4d\x9b\x36\x63\xf1\x92\xa5\
-\xbc\xf6\xda\x14\x5e\x7a\xf1\xc5\x80\x4e\xf2\x56\xd9\x77\xc8\xc7\
-\xbe\x43\xd9\x40\xc1\x57\x9b\x91\x2e\x88\xfd\xeb\x6a\x32\xf7\x4f\
-\x93\x9c\xea\x0b\x9b\xd7\x19\xc7\xc4\xc4\x30\x6a\xd4\x28\x06\xdf\
-\x71\x47\xb1\xcc\xcb\x30\xe3\x8f\x3f\xfe\xa0\x4f\xef\xde\x01\x1f\
-\x17\xcf\x3d\x18\x5d\x70\xe7\x2f\x12\x00\x4d\x02\x94\xa0\xe9\xd2\
-\xd2\xc9\xd0\xeb\x03\x3b\x41\x27\x25\x25\xd1\xaf\x6f\x5f\xf6\xed\
-\xdd\x6b\x51\xab\xac\xe3\x72\xb9\xb8\xe7\x9e\x7b\xf9\x6a\xdd\xd7\
-\xf4\xee\xdd\x07\xc3\xba\x4b\xc8\xa0\xca\xc8\x84\x63\x27\x7c\x1c\
-\x3b\xe1\xe3\xf8\x5f\x5f\xe1\xd0\xf9\x3b\x1c\x0e\xfa\xf4\xe9\xc3\
-\x86\x8d\x1b\x19\x32\x74\x68\xc8\x76\xfe\x87\x0e\x1d\xe2\x86\xeb\
-\xaf\xe3\xc0\x81\xfd\x01\xd5\xd3\xf5\x72\x17\xb7\xf7\xd5\x9b\xfe\
-\x24\x78\x14\x00\x24\xa8\xc6\x0e\x8e\xa4\xf5\x79\x81\x1d\x66\x7b\
-\xf7\xee\xa5\x67\xcf\x9e\x1c\x3a\x74\xc8\xa2\x56\x59\xab\x6a\xd5\
-\xaa\xbc\x32\x71\x22\x9f\x7f\xfe\x05\x6d\xda\xb4\x29\xe9\xe6\x94\
-\x4a\xad\x5a\xb5\x62\xf1\xe2\x25\xbc\x3a\x79\x8a\xe5\x2f\x6e\xb2\
-\x52\x62\x62\x22\xdd\xbb\xdd\xc0\x2f\xbf\xfc\x12\x50\x3d\xf5\xce\
-\x76\xf2\xfa\x33\xf9\x4c\xfa\x13\xb1\x88\x02\x80\x04\x55\x64\x04\
-\xcc\x7a\xdc\x4d\xf5\x8a\x81\x5d\x1d\xff\xfa\xeb\xaf\xf4\xea\xd9\
-\x93\xe3\xc7\x8f\x59\xd4\x32\xeb\x35\x69\xda\x94\x4f\xe6\xce\xe5\
-\xd3\x05\x0b\x68\xd5\xaa\x55\x49\x37\xa7\x54\x38\xef\xbc\xf3\x78\
-\xeb\xed\xb7\x59\xb0\xf0\x33\x2e\x6c\xd2\xc4\xc2\xfb\xf4\xd6\x4b\
-\x4b\x4b\xa3\x6f\x9f\x3e\x7c\xff\xfd\xf7\x01\xd5\x13\x17\x6b\xf0\
-\xe1\xcb\x31\x5a\xed\x4f\x82\x4e\x01\x40\x82\xae\x4a\x39\x83\x19\
-\x8f\xb9\x03\x5a\x2a\x18\x60\xfb\xf6\xed\xf4\xeb\xdb\x97\xe4\xe4\
-\x64\x6b\x1a\x16\x24\x2d\x5a\xb4\x60\xde\xfc\xf9\xbc\xff\xc1\x07\
-\xb4\x68\xd1\xa2\xa4\x9b\x13\x96\x2e\x6c\xd2\x84\x69\xd3\xde\x67\
-\xe5\xaa\xd5\x5c\x77\xdd\xf5\x25\xdd\x9c\x42\xa5\xa5\xa5\xd1\xaf\
-\x6f\x5f\xd6\xad\x5b\x17\x50\x3d\x86\x01\x6f\x8c\x89\xa1\xc1\x39\
-\xba\xef\x2f\xc1\xa7\x00\x20\xc5\xa2\xe5\xb9\x0e\x26\x0c\x0d\xfc\
-\xdd\xe5\x9b\x37\x6f\xa6\x7f\xbf\xbe\x9c\x38\x71\xc2\x82\x56\x05\
-\xd7\x15\x57\x5c\xc1\xa7\x0b\x16\xb0\x60\xe1\x42\xae\xbc\xf2\x4a\
-\x1c\x7a\x77\x6b\xa1\x3a\x76\xec\xc8\xdc\xb9\xf3\x58\xba\x74\x19\
-\xd7\x74\xee\x1c\x16\xf3\x2a\x52\x53\x53\xe9\xdd\xab\x17\x2b\x56\
-\xac\x08\xb8\xae\x91\x83\xa3\xb8\xb6\x93\x96\xfa\x95\xe2\xa1\x33\
-\x92\x14\x9b\xdb\xbb\x44\x70\x67\xd7\xc0\x27\x6e\xad\x5f\xbf\x9e\
-\xde\xbd\x7a\x92\x78\xdc\xd4\xa3\x32\xc5\xee\xe2\x8b\x2f\x66\xda\
-\xfb\xef\xb3\xee\xeb\xaf\x19\x32\x64\x08\xe5\xca\x95\x2b\xe9\x26\
-\x85\x94\xb8\xb8\x38\x6e\xbb\xed\x36\xd6\xac\x5d\xcb\x47\xb3\x67\
-\xd3\xae\x7d\x70\x97\x5e\xb6\x52\x4a\x4a\x0a\xbd\x7a\xf6\x0c\xe8\
-\xed\x7e\xb9\x6e\xb8\xd2\xc5\xa3\x7a\xcb\x9f\x14\x23\x05\x00\x29\
-\x56\x13\x86\x46\xd2\xb9\x65\xe0\xc3\x9b\x9b\x37\x6f\xa6\x47\x8f\
-\xee\x1c\x3d\x7a\xd4\x82\x56\x15\x8f\xda\xb5\x6b\xf3\xc4\x93\xa3\
-\xd9\xfa\xdd\xf7\x4c\x9c\x38\x89\xb6\x6d\xdb\xda\x7a\x54\xe0\xc2\
-\x26\x4d\x18\x37\x6e\x1c\x3f\xfc\xf8\x23\xe3\x9f\x7f\x9e\x86\x0d\
-\x1b\x96\x74\x93\xfc\x92\x94\x94\x44\x8f\xee\xdd\x59\xbb\x76\x6d\
-\xc0\x75\xb5\x68\x12\xc1\x1b\x63\x62\xb0\xf1\xe1\x20\x25\x40\x0b\
-\x01\x9d\xba\x7f\x2d\x04\x94\x4f\x59\xff\x57\x99\xcb\x6f\x7b\x72\
-\x1a\x74\x1a\xe1\x61\xf3\xce\xc0\x97\x8f\x6b\xd8\xb0\x21\x33\x66\
-\xce\xa2\x4a\x95\x2a\x7e\x95\x0b\x74\x21\x20\xff\xeb\xcd\xbb\xfe\
-\xbd\x7b\xf7\xf2\xf1\xec\xd9\x7c\xfc\xf1\xc7\x6c\xdf\xbe\x2d\xa0\
-\x7d\x87\x83\x5a\xb5\x6a\xd1\xad\x7b\x77\x7a\xf5\xea\x45\xbd\x7a\
-\xf5\xf2\xf9\xae\xfc\x7f\x89\xd6\xdc\x11\x08\x7c\x21\xa0\x3f\x0f\
-\x1c\xa0\x47\x8f\x1e\xfc\xf0\xc3\x0f\x01\xb7\xe6\xec\x33\x1d\x2c\
-\x9f\x1e\x4f\x85\x72\x26\xce\x39\xf9\x6e\xd7\x42\x40\x79\x6e\xd0\
-\x42\x40\x05\xed\xba\x48\x14\x00\x2c\xde\x2f\xd8\x2b\x00\x00\xec\
-\x3f\xe6\xa3\xdd\x3d\x1e\x7e\xfb\x33\xf0\x95\xe5\x6a\xd6\xac\xc9\
-\xf4\xe9\x33\xa8\x53\xb7\x6e\x91\xcb\x84\x4a\x00\x38\xd9\xff\xfe\
-\xf7\x3f\x3e\x5b\xb8\x90\xcf\x3e\xfb\x8c\x4d\x9b\x36\x86\xcc\x0b\
-\x91\x02\xd5\xb0\x61\x43\x3a\x77\xe9\x42\xe7\xce\x9d\x03\x5a\xab\
-\x1f\x42\x23\x00\xfc\xfa\xeb\xaf\x74\xef\xd6\x8d\xdf\x7e\xfb\x2d\
-\xe0\x96\x94\x4f\x30\x58\xf6\x41\x3c\x75\x6a\x17\x70\xe9\xaf\x00\
-\x60\x62\xbf\xf9\x6c\x50\x00\x28\x68\xd7\x45\xa2\x00\x60\xf1\x7e\
-\xc1\x7e\x01\x00\x03\xb6\xed\xf6\x72\xe9\xb0\x74\x8e\x9e\x08\x3c\
-\x04\x24\x24\x94\xe3\xbd\x69\xd3\xb8\xf8\xe2\x8b\x8b\xf4\xfd\xa1\
-\x18\x00\x4e\x76\xec\xe8\x51\x56\xaf\x59\xcd\xaa\x95\x2b\x59\xb9\
-\x72\xa5\x25\x9d\x4d\x71\xa9\x50\xa1\x02\xed\xdb\xb7\xa7\xc3\xa5\
-\x97\xd2\xa1\x43\x07\x6a\xd4\xa8\xe1\x67\x0d\xa1\x1b\x00\xbe\xfd\
-\xf6\x5b\x7a\xf7\xea\x65\xc9\x9a\x14\x71\xb1\x06\x0b\xa6\xc6\xd1\
-\xbc\x91\x33\x08\x9f\x6f\x05\x80\x3c\x37\x28\x00\x14\xb4\xeb\x22\
-\x51\x00\xb0\x78\xbf\x60\xcf\x00\x00\xf0\xcd\x76\x2f\x57\x3d\x94\
-\xce\x89\xd4\xc0\x43\x40\x54\x54\x14\xaf\x4e\x9e\x42\xe7\xce\x9d\
-\x0b\xfd\xde\x50\x0f\x00\xa7\xda\xbf\x7f\x1f\x9b\x37\x6d\x62\xc3\
-\x86\x0d\x6c\xda\xbc\x99\x1f\xbe\xff\x3e\x24\x96\x1f\x8e\x88\x88\
-\xa0\x6e\xdd\xba\x34\x6d\xda\x94\x8b\x5b\xb4\xe4\xa2\x8b\x2e\xa2\
-\x6e\xdd\xba\x38\x1c\x81\xfc\x1e\x43\x33\x00\xcc\x9d\x3b\x97\x21\
-\x77\xdd\x45\x5a\x5a\x5a\xc0\x2d\x88\x72\xc3\x9c\xd7\xe2\x68\x7f\
-\x71\x44\x41\x4d\x2a\x7c\x5b\xbe\xdb\x15\x00\xf2\xdc\xa0\x00\xf0\
-\x2f\xa1\xb9\x96\xa6\xd8\xc6\xc5\x0d\x1d\xcc\x79\x2a\x92\xae\xa3\
-\xd2\x49\x4b\x0f\xac\x2e\x8f\xc7\xc3\xed\x83\x06\xf2\xf0\xc3\x8f\
-\x70\xcf\xbd\xf7\x86\xc5\x23\x64\x45\x55\xad\x5a\x35\xaa\x55\xab\
-\x46\x97\x6b\xaf\x05\xc0\xe7\xf3\xf1\xfb\xef\xbf\xb3\x6d\xdb\x36\
-\x7e\xda\xbe\x9d\x5f\x7e\xf9\x85\xdf\x7f\xff\x9d\xdf\x7f\xff\x9d\
-\x03\x07\x0e\x58\x7e\xfb\x20\x2e\x2e\x8e\xb3\x6a\xd7\xa6\xf6\x59\
-\x67\x51\xfb\xec\xb3\xa9\x57\xaf\x1e\xe7\x9e\x7b\x2e\x0d\xea\x37\
-\x20\xb2\xc8\x6f\xe1\x0b\x4f\x3e\x9f\x8f\xf1\xe3\xc6\x31\x66\xcc\
-\x18\x7c\x66\x5f\x6c\x71\x12\x57\x04\x4c\x7b\x31\xf6\x9f\xce\x5f\
-\xa4\x84\xe8\x08\x94\x12\x77\xc9\x05\x4e\x66\xfc\xc7\x4d\xcf\xc7\
-\xd3\xc9\xc8\x0a\xac\x2e\xaf\xd7\xcb\xb3\xcf\x3e\xc3\x0f\x3f\xfe\
-\xc0\xcb\x2f\xbf\x42\x74\x74\xb4\x35\x8d\x0c\x31\x86\x61\x50\xab\
-\x56\x2d\x6a\xd5\xaa\xc5\xd5\x57\x5f\x7d\xf2\x16\x32\x32\x32\x38\
-\x78\xf0\x20\x87\x0f\x1f\xe6\xf0\xe1\x43\x1c\x39\x72\x94\xc4\xe3\
-\xc7\xf1\xa4\x7b\x48\x4e\x4e\x26\x2b\x33\x8b\xc4\xc4\x44\x00\xe2\
-\xe2\x62\x89\x70\xe5\x3c\x77\x1e\x15\x15\x45\x5c\x6c\x2c\x71\x71\
-\x71\x94\x4d\x48\xa0\x72\xa5\x4a\x54\xac\x54\x89\xaa\x55\xab\x12\
-\x1f\x1f\xff\xaf\x7d\xd8\x45\x5a\x5a\x1a\x77\x0f\x1d\xca\x9c\x39\
-\x73\x2c\xa9\xcf\xe9\x84\xd7\x9f\x89\xe1\x9a\x0e\xae\xfc\xaf\x44\
-\x45\x8a\x89\x02\x80\x84\x84\xab\x5b\x38\x79\x6f\x94\x9b\x1b\x9f\
-\x49\xb7\xe4\xc5\x34\xf3\xe7\xcd\x63\xd7\xaf\xbf\xf2\xf6\x3b\xef\
-\x52\xb3\x66\xcd\xc0\x2b\x0c\x23\x91\x91\x91\xd4\xa8\x51\xa3\x48\
-\xf7\xde\x4b\xd1\x20\x89\xe5\x7e\xf9\xe5\x17\x6e\xb9\xf9\x66\xb6\
-\x6d\xb3\xe6\xe9\x0c\xa7\x13\xde\x78\x36\x86\xde\x5d\x02\x5f\x10\
-\x4b\xc4\x0a\x7a\xea\x54\x42\x46\xb7\xf6\x4e\x3e\xb4\x60\xc9\xe0\
-\x5c\x3f\xfc\xf0\x03\x57\x5e\x71\x39\xcb\x96\x2e\xb5\xa6\x42\xb1\
-\x8d\x4f\x3f\xfd\x94\x8e\x97\x5e\x6a\x59\xe7\x1f\xe1\x84\xa9\x63\
-\xd4\xf9\x4b\x68\x51\x00\x90\x90\x72\x7d\x5b\x27\xb3\x9e\x74\x13\
-\x65\xd1\x79\xf2\xe8\xd1\xa3\xf4\xef\xdf\x8f\xa7\x9e\x1a\x4d\x66\
-\x66\xa6\x35\x95\x4a\xa9\x95\x91\x91\xc1\xa3\xff\xf7\x7f\xdc\x72\
-\xf3\xcd\x96\x2d\x37\xed\x8a\x80\x77\x9e\x8f\xa5\xe7\x35\xea\xfc\
-\x25\xb4\x28\x00\x48\xc8\xb9\xa6\x85\x93\x4f\x9e\x71\x13\x63\xd1\
-\xdc\x32\x9f\xcf\xc7\xab\x93\x26\x71\xfd\x75\x5d\xf9\xe3\x8f\x3f\
-\xac\xa9\x54\x4a\x9d\x9d\x3b\x76\x70\xc5\xe5\x97\xf3\xea\xab\xaf\
-\x5a\x32\xd9\x0f\x72\x66\xfb\xbf\xff\x62\x2c\x37\x5c\xa1\xf5\xfd\
-\x25\xf4\x28\x00\x48\x48\xea\xd4\xd4\xc9\xa7\x63\xa2\x28\x1b\x6b\
-\xdd\x4d\xea\x4d\x9b\x36\xd1\xa9\x53\x47\xe6\xcc\xf9\xd8\xb2\x3a\
-\x25\xfc\xf9\x7c\x3e\xa6\x4e\x7d\x93\x4b\x2e\xb9\x84\xad\x5b\xb7\
-\x5a\x56\x6f\xd9\x78\x83\x79\xaf\xc7\xd1\xa5\xa3\x3a\x7f\x09\x4d\
-\x0a\x00\x12\xb2\xda\x35\x76\xb0\x6c\x82\x9b\x6a\x15\xad\x0b\x01\
-\x89\xc7\x8f\x33\xe4\xae\xbb\xb8\x6d\xc0\x00\x0e\x1f\x3e\x6c\x59\
-\xbd\x12\x9e\xf6\xed\xdb\x47\xef\x5e\xbd\x18\x39\x62\x04\x1e\x8f\
-\xc7\xb2\x7a\xab\x56\x72\xf0\xe5\xbb\x71\xb4\x6d\xae\x79\xd6\x12\
-\xba\x14\x00\x24\xa4\x35\x3a\xdb\xc1\x9a\x49\x51\x9c\x57\xd0\x52\
-\xa9\x26\x2c\x5c\xb8\x90\xf6\xed\xda\x31\x7f\xfe\x7c\x4b\xeb\x95\
-\xf0\xe0\xf3\xf9\x78\xe7\xed\xb7\x69\xd5\xb2\x05\x4b\x96\x2c\xb6\
-\xb4\xee\x3a\xb5\x1c\x2c\x7d\x3f\x8e\xf3\xeb\x05\xfe\xd2\x2b\x91\
-\x60\x52\x00\x90\x90\x57\xa3\x92\xc1\xf2\x09\x6e\x2e\xb9\xc0\xda\
-\x13\xea\x91\x23\x47\xb8\x7d\xd0\x20\x06\xdc\x7a\x2b\x7b\xf7\xee\
-\xb5\xb4\x6e\x09\x5d\xbb\x76\xed\xa2\xeb\xb5\x5d\x18\x3e\x7c\x98\
-\x65\x13\xfd\x72\xb5\xbb\x28\x82\xe5\x1f\xc4\x73\x56\x75\x9d\x5a\
-\x25\xf4\xe9\x28\x95\xb0\x90\x10\x67\xb0\x60\xac\x9b\xfe\x97\x5b\
-\x3f\xa4\xfa\xd9\x67\x9f\xd1\xae\x6d\x5b\x26\x4f\x9e\xac\x27\x05\
-\x4a\xb1\xb4\xb4\x34\x9e\x7b\xf6\x59\xda\xb4\x6e\x6d\xc9\x2b\x7c\
-\x4f\x35\xa0\x47\x24\x9f\xbe\x11\x47\xf9\x04\x2d\xae\x20\xe1\x41\
-\x01\x40\xc2\x86\xdb\x05\x6f\x3f\xec\x66\xdc\x5d\x91\x38\x2d\x3e\
-\x72\x53\x52\x52\x78\xf2\x89\x27\xb8\xfc\xb2\x4e\x7c\xfd\xf5\xd7\
-\xd6\x56\x2e\x25\x6e\xde\xdc\xb9\xb4\xb8\xf8\x62\xc6\x8f\x1f\x4f\
-\x7a\xba\x75\xf7\xfa\x01\x9c\x0e\x18\xfb\x60\x14\x93\x9e\x88\xc6\
-\xa5\x5b\xfe\x12\x46\x14\x00\x24\xec\xdc\xdf\xd3\xc5\xa7\x63\xa3\
-\x28\x1f\x6f\xfd\x95\xd6\xf6\xed\xdb\xb9\xae\xeb\xb5\xdc\x36\x60\
-\x00\xbb\x76\xed\xb2\xbc\x7e\x09\x8c\xbf\x4f\xe7\x6d\xd9\xb2\x85\
-\xeb\xba\x76\x65\xc0\x80\x01\x41\x79\x04\xb4\x7c\x82\xc1\x9c\xc9\
-\xb1\xdc\x7d\x53\xe9\x7e\x1f\x82\x94\x4e\x0a\x00\x12\x96\x2e\x6b\
-\xe6\xe4\xab\x29\x51\x9c\x7f\x76\x70\x0e\xe1\x85\x0b\x17\xd0\xbe\
-\x5d\x5b\x46\x8c\x78\x40\x4f\x0b\x84\x90\xa2\x2e\x5d\xbc\x67\xcf\
-\x1e\x86\x0d\x1b\xc6\x65\x9d\x3a\xb1\x7a\xf5\xea\xa0\xb4\xa5\xc9\
-\xb9\x4e\x56\xcf\x88\xe3\xb2\x36\xba\xec\x97\xf0\xa4\x00\x20\x61\
-\xeb\xec\x6a\x0e\x56\x4f\x8a\xe6\xe6\xab\x82\x73\x02\xce\xcc\xcc\
-\x64\xda\x7b\xef\xd1\xba\x55\x4b\x5e\x78\xfe\x79\x92\x92\x92\x82\
-\xb2\x1f\xb1\xce\x9f\x7f\xfe\xc9\x43\x0f\x3e\xc8\x45\xcd\x9b\xf3\
-\xee\x3b\xef\x58\xfe\x56\xc4\x5c\x77\xf4\x8d\x64\xd9\xfb\x71\x9a\
-\xec\x27\x61\x4d\x47\xaf\x84\xb5\xd8\x28\x78\xf3\x41\x37\xef\x3c\
-\xe2\x26\x3e\x26\x38\x93\xaf\x12\x13\x13\x19\x37\x6e\x2c\xcd\x9b\
-\x35\x65\xfc\xf8\x71\x7f\xbf\x49\x4f\x42\xc7\x9e\x3d\x7b\x18\x39\
-\x62\x04\x17\x5e\x70\x01\x6f\xbc\xf1\x06\x19\x19\x19\x41\xd9\x4f\
-\x7c\x9c\xc1\xdb\x63\x63\x78\x71\x54\x34\x91\x5a\xdf\x47\xc2\x9c\
-\x02\x80\x94\x0a\xfd\x2e\x8f\xe0\xeb\xd7\xa2\xb8\xb0\x6e\xf0\x0e\
-\xe9\xc4\xc4\x44\x9e\x1f\x3f\x9e\xe6\xcd\x9a\x32\x66\xcc\x73\x1c\
-\x3c\x78\x30\x68\xfb\x92\xa2\xf9\xf5\x97\x5f\xb8\xf7\xde\x7b\x69\
-\xde\xac\x19\x53\xa7\x4e\x25\x3d\x3d\x3d\x68\xfb\x6a\xdd\x34\x82\
-\xf5\x1f\xc7\xd1\xeb\x1a\xf5\xfc\x52\x3a\x28\x00\x48\xa9\x51\xb7\
-\x46\xce\x2d\x81\xfb\x7a\xba\x70\x04\xf1\x49\xac\xa4\xa4\x24\x5e\
-\x7a\xf1\x45\x9a\x35\x6d\xc2\xfd\xf7\xdd\x6b\xd9\x1b\xe3\xa4\x68\
-\x7c\x3e\x1f\x2b\x57\xac\xa0\x6f\x9f\x3e\xb4\x68\xd1\x82\xf7\xa7\
-\x4d\x0b\xea\xe3\x9b\xae\x08\x78\xe2\xde\x28\xbe\x78\x3b\x96\x5a\
-\xd5\x74\xca\x94\xd2\x43\x47\xb3\x94\x2a\x6e\x17\x8c\x1f\x12\xc9\
-\x92\x09\x51\x9c\x1d\xe4\x93\x75\x46\x46\x06\xd3\xa7\x4f\xe7\xd2\
-\x0e\x97\xd0\xb3\x47\x0f\xbe\xf8\xe2\x73\xb2\xb2\xb2\x82\xba\x4f\
-\x3b\x4b\x49\x49\xe1\xbd\x77\xdf\xa5\x6d\x9b\x36\xdc\x70\xc3\x0d\
-\x2c\x5a\xb4\x28\x68\xf7\xf8\x73\x35\x38\xc7\xc1\xb2\x69\x71\x8c\
-\x1c\xe4\xb6\xfc\xd1\x53\x91\x92\xa6\xe9\xab\x52\x2a\xb5\x6d\xec\
-\xe4\xdb\xb7\xa2\x79\xfa\xdd\x0c\x5e\x98\x91\x89\xd7\x9a\x97\xbb\
-\xe5\x6b\xd5\xaa\x95\xac\x5a\xb5\x92\xca\x95\x2b\xd3\xbb\x4f\x1f\
-\x6e\xbc\xf1\x46\x6a\xd7\xae\x1d\xdc\x9d\xda\xc4\xd6\x2d\x5b\x78\
-\xf7\xdd\x77\xf9\xf8\xe3\xd9\x24\x27\x27\x17\xcb\x3e\x23\x9c\x70\
-\xef\x2d\x6e\x1e\x1d\x12\x85\x5b\x6f\xf1\x95\x52\xca\xcc\x40\x69\
-\x0f\xe0\x23\x7f\x0b\x6d\x1e\xeb\xa2\x49\xed\x53\x76\x77\xca\xff\
-\xfa\x4e\xfe\xc7\xc2\x5a\x56\xd0\x76\x93\x65\x7d\xff\xda\x96\xcf\
-\x37\x05\x61\xbf\x00\xbe\x7c\xb7\x15\xe1\xf7\x61\xc1\xef\x2a\xdf\
-\xfe\xb1\xa0\xdf\x87\x45\x7f\xa3\x3c\xf7\x5d\xd0\xef\xc3\xcf\xfd\
-\x2e\xff\x36\x9b\x21\x2f\x64\xf0\xeb\xde\xe0\x5e\x2d\xfe\xab\x09\
-\x86\x41\x9b\x36\x6d\xe8\xd9\xab\x17\xd7\x5c\x73\x0d\x65\xcb\x96\
-\xcd\xbb\x71\x45\xae\xaf\xc8\xdf\x19\xa4\x7a\xfd\xdb\x87\xb9\x7a\
-\xff\xa9\xff\xb7\xdf\x7e\xe3\x93\x4f\x3e\x61\xd6\xcc\x19\xec\xd8\
-\xb1\x23\x90\xca\xfc\xd6\xe4\x5c\x27\x53\x9e\x8c\xa6\x51\xfd\x53\
-\x96\x9e\x2e\xd2\x71\x57\xf4\xf3\x86\xaf\x90\xed\xfe\xed\x37\x9f\
-\x7f\x2c\xe8\x5c\x17\x94\xfd\x9e\xba\x2d\xef\x6f\xca\xff\x7c\x67\
-\xd5\x7e\xf3\xd9\x60\x14\xe5\x5c\x67\xe5\x7e\x4f\xdd\x6e\x9c\xbe\
-\xff\x53\xca\x7e\xf7\x43\x16\xed\x2f\x3f\x5e\x48\x85\x79\xea\x09\
-\xcc\xf6\xa7\x80\x02\xc0\xa9\xfb\x57\x00\xc8\xa7\x6c\xf8\x06\x00\
-\x00\x4f\x06\x8c\xff\x30\x83\xf1\xd3\x33\xf1\x04\x67\x82\x78\xbe\
-\x22\x23\x23\xb9\xf4\xd2\x4b\xb9\xee\xfa\xeb\xb9\xea\xaa\xab\x89\
-\x8b\x8b\xf3\xbb\x0e\x3b\x04\x80\x7d\xfb\xf6\x31\x6f\xde\x3c\x3e\
-\x99\xf3\x09\x9b\x36\x6d\x34\xd1\xae\xc0\xc4\xc5\x18\x8c\xba\xd3\
-\xcd\xd0\x9b\xdc\x44\xe4\xf5\xda\x09\x05\x80\xa2\x6f\x57\x00\xc8\
-\x67\x7b\x68\x05\x00\xdd\x02\x10\x5b\x88\x8a\x84\xc7\x6e\x8d\xa4\
-\xef\xe5\x11\xdc\xf7\x72\x06\x8b\x37\x64\x17\xdb\xbe\x33\x32\x32\
-\x58\xb4\x68\x11\x8b\x16\x2d\x22\x2a\x2a\x8a\xb6\x6d\xdb\x72\xf9\
-\xe5\x57\x70\xd9\xe5\x97\x51\xb3\xe6\x99\xc5\xd6\x8e\x50\xe3\xf5\
-\x7a\xd9\xb2\x65\x0b\x8b\x16\x2d\xe2\xcb\x2f\xbf\xe4\xfb\xef\xbe\
-\xc3\xe7\xef\x52\x7f\x16\x30\x0c\xe8\x79\xb5\x8b\x67\x86\x45\x51\
-\xad\x8a\x6e\xf4\x8b\x7d\x28\x00\x88\xad\xd4\xa9\xe1\x60\xe1\xf8\
-\x28\x66\x2f\xcf\xe2\xe1\xd7\x32\xf8\xfd\xcf\xe2\xed\x70\x3c\x1e\
-\x0f\x4b\x96\x2c\x61\xc9\x92\x25\xf0\x10\xd4\xaf\x5f\x9f\x4e\x97\
-\x5d\x46\xdb\xb6\xed\x68\xd1\xa2\x05\xf1\xf1\xf1\xc5\xda\x9e\xe2\
-\xf6\xdb\x6f\xbf\xb1\x76\xcd\x1a\x56\xaf\x59\xc3\xb2\x65\xcb\x38\
-\x7c\xe8\x50\x89\xb6\xa7\x51\x7d\x27\xcf\x3f\x14\x45\xdb\x66\x3a\
-\x15\x8a\xfd\xe8\xa8\x17\x5b\xea\x71\x69\x04\x5d\xda\x44\x30\xe9\
-\xe3\x4c\xc6\x7d\x90\xc9\xf1\xe4\xe2\xbf\xf2\x04\xd8\xb1\x63\x07\
-\x3b\x76\xec\x60\xf2\xab\xaf\xe2\x74\x3a\x39\xff\xfc\xf3\x69\xd9\
-\xb2\x15\xad\x5b\xb7\xa6\x49\xd3\xa6\x54\xad\x5a\xb5\x44\xda\x65\
-\x85\xac\xac\x2c\xb6\x6f\xdf\xce\xb7\xdf\x7e\xcb\xfa\xf5\xeb\x59\
-\xbb\x66\x0d\x7b\xf6\xec\x29\xe9\x66\x01\x70\x46\x25\x07\xa3\xee\
-\x74\x73\x4b\x37\xeb\x5f\x2c\x25\x12\x2e\x34\x07\xe0\xd4\xfd\x6b\
-\x0e\x40\x3e\x65\xc3\x7b\x0e\x40\x41\xdb\x0e\x27\xf9\x78\xe6\xdd\
-\x4c\xde\x98\x9f\x49\x46\x88\xbd\x0d\xb8\x72\xe5\xca\x34\x6a\xd4\
-\x98\xc6\x17\x34\xa6\x71\xe3\xc6\x34\x6c\xd8\x90\x33\xcf\x3c\x13\
-\x97\x2b\xbf\xc5\x68\x4a\x66\x0e\xc0\xf1\xe3\xc7\xd9\xb9\x73\x27\
-\x3b\x7e\xfa\xe9\xaf\x4e\x7f\x33\xdf\x7f\xff\x3d\x1e\x8f\xb5\x6f\
-\xde\x0b\x54\xd9\x78\x83\xe1\x03\xdc\x0c\xed\x1f\x49\x74\x94\x9f\
-\xc7\xb4\xe6\x00\x14\x7d\xbb\xe6\x00\xe4\xb3\x5d\x73\x00\x44\x42\
-\x4a\x85\x32\x06\x2f\xde\x13\xc9\xd0\x6e\x11\x3c\xfb\x5e\x26\x33\
-\x96\x64\x91\x55\x7c\x53\x04\x0a\x74\xf0\xe0\x41\x96\x2e\x5d\xc2\
-\xd2\xa5\x4b\xfe\xfe\x37\x97\xcb\x45\xcd\x9a\x35\xa9\x53\xa7\x0e\
-\x75\xea\xd4\xa1\xe6\x99\x67\x52\xbd\x7a\x75\x2a\x55\xaa\x44\xf5\
-\xea\x35\xa8\x54\xa9\x12\x11\x11\xd6\x7e\xb4\x53\x53\x53\xb2\x6a\
-\x59\xde\x00\x00\x0c\x1e\x49\x44\x41\x54\x39\x74\xf0\x20\x7b\xf7\
-\xee\x65\xcf\x1f\x7f\xb0\x67\xcf\x1e\xfe\xd8\xb3\x87\xdf\x7f\xdf\
-\xc3\x8e\x1d\x3f\xf1\xe7\x9f\x7f\x5a\xba\x3f\xab\xc5\x44\x19\xdc\
-\xde\x2b\x92\x91\x03\xdd\x94\x4f\xc8\x39\xe3\x96\xcc\x98\x8f\x48\
-\xe8\x50\x00\x10\xf9\xcb\x39\xd5\x1d\x4c\x1d\xe5\x66\xd4\x2d\x2e\
-\xc6\x4c\xcb\xe4\xc3\x2f\x43\x27\x08\x9c\x2c\x33\x33\x93\x5d\xbb\
-\x76\xb1\x6b\xd7\x2e\xbe\xfc\xf2\xcb\xd3\xb6\x3b\x1c\x0e\xca\x97\
-\x2f\x4f\x7c\x7c\x3c\x65\xca\x94\x21\x21\x21\x81\xf8\xf8\x78\xe2\
-\xe2\xe3\x89\x74\xfd\xf3\x50\xbb\xcb\x15\x41\x6c\x5c\x1c\xe9\x1e\
-\x0f\x69\x1e\x0f\xe9\x1e\x0f\x1e\x8f\x87\xf4\xf4\x74\x52\x53\x53\
-\x39\x72\xf4\x28\xc7\x8e\x1e\xe5\xc8\x91\x23\x41\x5d\x62\x37\x98\
-\xe2\x63\x0d\x06\xf7\x8a\xe4\xde\x9b\xdc\x54\x2a\x5f\x84\xd1\x23\
-\x11\x1b\x51\x00\x10\x39\xc5\x39\xd5\x1d\xbc\xf1\xb0\x9b\x51\x37\
-\x47\x32\xf6\xfd\x0c\x3e\xf8\x32\x2b\xe4\x6e\x0d\x14\xc4\xeb\xf5\
-\x72\xf8\xf0\x61\x5b\xbf\xc6\x38\xa1\x8c\xc1\x90\xbe\x91\x0c\xed\
-\xe7\xa6\x5c\x59\xf5\xfa\x22\x79\xd1\xf4\x17\x91\x7c\xd4\xae\x66\
-\xf0\xda\x83\x6e\x7e\xfd\x28\x86\x47\x6f\x75\x51\x51\x1d\x49\xc8\
-\xab\x5d\xc3\xc1\x53\xf7\x45\xb1\x7d\x61\x3c\x8f\xde\x15\xa5\xce\
-\x5f\xa4\x00\x1a\x01\x10\x29\x44\xe5\x72\x06\x8f\x0d\x88\xe4\xc1\
-\x9b\x22\xf9\x68\x69\x16\x2f\x4c\xcf\x64\xdb\xff\x8a\x6f\x55\x41\
-\x29\x5c\xab\x0b\x9d\x0c\xed\xe7\xe6\xba\x4e\x2e\x9c\x79\x2d\xe2\
-\x23\x22\xa7\x51\x00\x10\x29\x22\xb7\x0b\x6e\xbc\x2a\x82\xfe\x57\
-\xba\x58\xbe\x29\x9b\xb7\x17\x66\x32\x6f\x55\x16\xe9\x61\x74\x7b\
-\xa0\x34\x29\x5f\xd6\xa0\x6f\x67\x17\xb7\x5e\x1f\xc9\x79\x75\x1d\
-\xe8\x06\xbf\x88\x7f\x14\x00\x44\xfc\x64\x18\xd0\xb1\xb9\x93\x8e\
-\xcd\x9d\x1c\x4f\xf6\x31\x7b\x59\x16\xff\x9d\x97\xc9\xd6\x9f\x35\
-\x2a\x10\x6c\x0e\x07\xb4\x68\xec\xa4\x7f\x17\x17\x7d\x3a\xbb\x88\
-\xc9\xeb\x51\x3e\x11\x29\x12\x05\x00\x91\x00\x24\xc4\x19\x0c\xea\
-\xea\x62\x50\x57\x17\x1b\x7f\xf2\x32\x6b\x69\x26\x1f\x2f\xcf\xe2\
-\x8f\x83\x7a\xc8\xcc\x4a\x4d\xcf\x75\xd2\xe3\x0a\x17\x3d\xae\x8c\
-\xa0\x46\x55\x4d\x5d\x12\xb1\x82\x02\x80\x88\x45\x9a\x37\x74\xd0\
-\xbc\xa1\x9b\xb1\x43\xdd\xac\xfb\x21\x9b\x8f\x96\x66\x31\x67\x45\
-\x16\x07\x8e\x28\x0c\x98\xd1\xa8\x9e\x93\xee\x97\x47\xd0\xe3\x4a\
-\x17\x67\xd7\x50\xa7\x2f\x62\x35\x05\x00\x11\x8b\x19\x06\xb4\x6e\
-\xe4\xa4\x75\x23\x27\x2f\xdc\xeb\x66\xcb\xcf\x5e\x96\x6d\xca\x62\
-\xe1\x9a\x6c\xbe\xfe\x31\x1b\xaf\xee\x14\xe4\x29\x2a\x12\x5a\x37\
-\x89\xe0\xea\x76\x11\x74\xed\x18\x41\x4d\x5d\xe9\x8b\x04\x95\x02\
-\x80\x48\x10\x39\x1c\xd0\xb4\xbe\x83\xa6\x0d\x22\x19\xd1\x1f\xfe\
-\x3c\xea\xe3\x8b\x75\x59\x2c\xfe\x26\x9b\xd5\x5b\xb2\x6d\x3d\x3a\
-\xe0\x70\x40\xa3\xba\x4e\xda\x37\x77\x72\xe9\xc5\x11\x5c\x72\x51\
-\x04\xd1\xee\xbf\x36\xea\xd6\xbe\x48\xd0\x29\x00\x88\x14\xa3\x2a\
-\xe5\x0d\x6e\xe9\xec\xe2\x96\xce\x39\x6b\xf9\xef\xdc\xe3\x65\xed\
-\xd6\x6c\x56\x6f\xcd\x66\xcd\x16\x2f\xbf\xed\x2f\xbd\xc3\x03\x91\
-\xae\x9c\x0e\xbf\xd5\x05\x4e\xda\x37\x8f\xa0\x6d\x53\x27\x09\x65\
-\xd4\xd3\x8b\x94\x14\x05\x00\x91\x12\x54\xb7\xa6\x83\xba\x35\x1d\
-\xdc\x7a\x6d\x4e\x20\x38\x78\xd4\xc7\xb7\x3b\xbd\x7c\xbb\x23\x9b\
-\xad\x3b\xbd\x7c\xbb\xc3\xcb\xee\x30\x0c\x05\x51\x91\x50\xef\x2c\
-\x27\x4d\x1a\x38\x68\x7a\xae\x93\xe6\xe7\x3a\x39\xbf\xae\x93\xc8\
-\xdc\x77\x18\x15\xf6\x12\x2a\x11\x09\x3a\x05\x00\x91\x10\x52\xb9\
-\xbc\xc1\x95\x2d\x9d\x5c\xd9\xf2\x9f\xd5\x6c\x8e\x25\xfb\xd8\xf9\
-\x9b\x97\x9d\xbf\x79\xf9\x79\x8f\x8f\x5f\xf6\x78\xf9\x79\x8f\x97\
-\x5f\xf6\x78\x49\x2b\xc1\x25\xfa\x9d\x0e\xa8\x5a\xd1\xa0\x56\x35\
-\x07\xb5\xab\x3b\x68\x70\x96\x83\x06\x67\x3b\x69\x58\xdb\xc1\x59\
-\xd5\x1d\x5a\x90\x47\x24\xc4\x29\x00\x88\x84\xb8\x72\xf1\x06\x2d\
-\xce\x77\xd2\xe2\xfc\x53\x7b\x54\x83\xa3\x49\x3e\xf6\x1f\xf1\xb1\
-\xef\x90\x97\x3f\x8f\xf8\xf8\xe3\xa0\x8f\x83\x47\x7d\x24\x26\xfb\
-\x38\x91\xe2\x23\x29\xd5\x47\x52\x32\x1c\x3b\xe1\x23\x29\xc5\x87\
-\xf7\x94\x97\x1b\xf9\x80\xec\x6c\x70\x3a\x21\x2e\x06\x5c\x11\x06\
-\x71\xd1\x10\x11\x61\x10\x17\x03\x15\x12\x0c\x2a\x97\x33\x28\x5f\
-\xd6\xa0\x42\x82\x41\x85\xb2\x06\x35\xaa\x38\xa8\x59\xd5\xa0\x7a\
-\x15\x07\xae\x88\x9c\x76\x88\x48\xf8\x51\x00\x10\x09\x63\xe5\xcb\
-\xe4\x74\xce\xe7\x9d\x9d\xcf\x8c\xf9\x42\xfa\xe6\x02\xdf\xcb\x5e\
-\x58\x79\xf5\xfb\x22\x61\x4d\xcf\xd9\x88\x88\x88\xd8\x90\x02\x80\
-\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\
-\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\
-\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\
-\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\
-\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\
-\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\
-\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\
-\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\
-\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\
-\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\
-\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\
-\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\
-\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\
-\x88\x88\x88\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\
-\x0d\x29\x00\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\
-\x88\x88\x88\xd8\x90\x02\x80\x88\x88\x88\x0d\x29\x00\x88\x88\x88\
-\xd8\x90\x99\x00\x90\x6d\x66\x47\x5e\x9f\x99\x52\x22\x22\x22\xf6\
-\xe1\xf5\x9a\x2e\xea\x77\xdf\x6c\x26\x00\xa4\x98\x28\x43\x4a\xba\
-\x99\x52\x22\x22\x22\xf6\x91\x9c\x6c\xfa\x6a\xf9\x84\xbf\x05\xcc\
-\x04\x00\xbf\x77\x02\x90\x94\xaa\x21\x00\x11\x11\x91\x82\x04\x10\
-\x00\x92\xfd\x2d\x50\x6c\x01\x60\xef\x51\x33\xa5\x44\x44\x44\xec\
-\xe3\x8f\x7d\xa6\xef\x01\x24\xf9\x5b\xc0\x4c\x00\x38\x62\xa2\x0c\
-\x3f\xed\xd3\x08\x80\x88\x88\x48\x41\x7e\xf9\xd5\xd4\x34\x3b\x30\
-\xd1\x37\x9b\x09\x00\x07\x30\x31\x0a\xf0\xc3\xef\x0a\x00\x22\x22\
-\x22\x05\xd9\xf6\x53\x96\x99\x62\x89\xc0\x9f\xfe\x16\x32\x13\x00\
-\x7c\xc0\x4e\x7f\x0b\x7d\xb5\xd3\x4b\x86\xa9\x9f\x4b\x44\x44\xa4\
-\xf4\x4b\xcf\xf0\xf1\xcd\x46\x53\x1d\xe5\x0e\x33\x85\xcc\xae\x03\
-\xf0\x93\xbf\x05\x52\xd3\x61\xfd\xcf\x1a\x05\x10\x11\x11\xc9\xcb\
-\x37\x1b\xb2\xf0\x78\x4c\xf5\x93\xc5\x1a\x00\xbe\x35\x53\x68\xd6\
-\x3a\xf3\x0f\x38\x8a\x88\x88\x94\x66\x73\x3f\x35\xfd\xbc\xbc\xa9\
-\x3e\xd9\x6c\x00\x58\x6e\xa6\xd0\xf4\xb5\xd9\xba\x0d\x20\x22\x22\
-\x72\x8a\x8c\x4c\xf8\x64\xbe\xe9\x00\xb0\xd4\x4c\x21\xb3\x01\x60\
-\x0b\xe0\xf7\x83\x7d\x47\x4e\xc0\xcc\xaf\x34\x0a\x20\x22\x22\x72\
-\xb2\x8f\x3f\x49\xe7\xe8\x31\x53\xc3\xff\x87\x80\xef\xcd\x14\x34\
-\x1b\x00\xbc\xc0\x0a\x33\x05\xc7\xcc\xcd\xd6\xb2\xc0\x22\x22\x22\
-\x7f\xc9\xce\x86\x17\x5f\x49\x35\x5b\x7c\x39\x39\x93\xf3\xfd\x16\
-\xc8\xcb\x80\x3e\x32\x53\x68\xdb\x1f\x3e\x3e\x58\xad\x51\x00\x11\
-\x11\x11\x80\x19\x1f\x79\xf8\xd9\xfc\xf3\xff\xa6\xfa\x62\x00\xc3\
-\x6c\x41\x20\x0a\xd8\x0f\x24\xf8\x5b\xb0\x4a\x59\x83\x9f\x26\xb8\
-\x48\x88\xfb\xf7\xbf\xfb\x4e\x6e\x52\x61\x2d\x2b\x68\xbb\xc9\xb2\
-\xbe\x7f\x6d\xcb\xe7\x9b\x82\xb0\x5f\x00\x5f\xbe\xdb\x8a\xf0\xfb\
-\xb0\xe0\x77\x95\x6f\x7c\x2c\xe8\xf7\x61\xd1\xdf\x28\xcf\x7d\x17\
-\xf4\xfb\xb0\xf8\xd8\xf0\x15\xb2\xfd\xf4\x6d\xd6\x1d\x1b\xbe\x42\
-\xb6\x17\xbc\x2d\xf0\x63\x23\xff\xe3\xae\x08\xe5\x2d\xf8\x7d\x14\
-\x7e\xdc\xf9\xb3\xcd\xbf\xdf\x87\x7f\xc7\x5d\x21\xdb\xfe\xde\x5e\
-\xf4\xdf\x85\xff\xc7\x9d\x3f\xdb\x0b\xfe\x5d\x04\x76\xdc\xf9\x53\
-\x36\xef\x6f\x2a\xf0\xb8\x0b\xca\xb9\xff\x9f\xdf\x87\xa9\x63\xce\
-\xf4\x7e\x4f\xdd\x6e\x9c\xb6\xff\xe3\x49\x3e\x2e\x6a\x7b\x8c\x43\
-\x87\x4d\x5d\x18\x27\x02\x67\x00\x69\x66\x0a\x07\x32\x02\xe0\x01\
-\x66\x9b\x29\xf8\x67\xa2\x8f\xe1\xef\x69\x36\xa0\x88\x88\xd8\xdb\
-\x23\xff\x49\x36\xdb\xf9\x03\xfc\x7f\x7b\xf7\x12\x1a\x57\x15\xc7\
-\x71\xfc\x9b\x49\xab\xd6\xc6\x5a\x2a\x82\x54\x44\x7c\xd6\x47\x55\
-\x44\x5b\x51\xb0\x0f\x29\x4a\x15\xbb\xd0\xe2\x46\x6b\x57\x05\x5d\
-\xb5\x74\x21\x04\x17\x55\x51\xc4\x85\x88\x88\x6e\x2a\x08\xb5\x52\
-\x6d\xd1\x85\x0b\x85\xd0\x87\x7d\x81\xd8\x56\xdb\x28\x16\xd3\x1a\
-\xdf\x7d\x28\xda\x24\xa4\x69\x92\x99\x24\x2e\x6e\x1b\x92\x32\xc9\
-\x4c\xe6\x9e\x33\x77\x9a\xf9\x7e\x96\x39\xb9\xe7\x7f\xee\x3c\xb8\
-\xbf\xe4\x9e\x73\xee\x27\x54\x78\xf1\x87\x74\x01\x00\x60\x7d\xa5\
-\x07\x7e\xb0\x63\x90\x8d\xbb\xbc\x15\x20\x49\xaa\x4f\x1f\x6f\xe9\
-\x63\xd3\xe6\x54\x8f\xca\xad\xf8\x1a\x0c\xe9\x03\xc0\x37\x54\xb8\
-\xfc\x00\xe0\xf9\xf5\x05\xf6\x1d\x75\x46\xa0\x24\xa9\xbe\x1c\xf8\
-\xae\xc0\xda\xe6\x09\x3f\xc0\x6f\xa4\x16\x60\x7f\x9a\x0e\xd2\x06\
-\x00\x80\xd7\x2a\x3d\xb0\xbb\x17\x1e\x7b\x3d\x4f\xdb\x71\x43\x80\
-\x24\xa9\x3e\x1c\xf9\x79\x80\xa7\x56\x74\xd1\xd3\x93\xea\xda\xf7\
-\x6a\xda\x71\x84\x08\x00\x3b\x80\x3d\x95\x1e\xfc\x4f\x17\x2c\x5a\
-\x57\xa0\xf5\x37\x43\x80\x24\x69\x72\xfb\xe1\xc7\x02\x8f\x2f\xef\
-\xe4\xdf\xff\x52\xdd\x02\xdf\x01\xec\x4e\x3b\x96\x10\x01\x00\x60\
-\x35\x50\xf1\x1a\x86\xe3\xa7\x86\x58\xb8\x2e\xcf\xd6\x56\xe7\x04\
-\x48\x92\x26\xa7\xed\x3b\xf3\x3c\xfa\x44\x27\x27\x4e\xa6\xba\xd6\
-\x15\x80\x35\x21\xc6\xd3\x18\xa2\x13\x92\xe5\x80\x57\x02\xf3\x2b\
-\xed\xa0\x37\x0f\x1b\x77\x0f\xd2\xdb\x0f\x8b\xe7\xe6\xc8\x95\x8a\
-\x26\x19\x2d\x5f\x89\x5f\x77\x8c\x86\xaa\xd7\x3d\xbf\x3d\xde\x32\
-\xc0\x89\xb5\x87\x5f\x06\x38\xf1\x63\xeb\xe4\xb3\x51\x76\xdf\x75\
-\xf2\x7a\x04\x5e\x06\x18\xb6\xee\x18\x3f\xf4\xbb\x32\xba\x21\xa3\
-\xcf\xc6\xc0\x20\xbc\xf1\x56\x0f\x6b\x5e\xe8\xa6\xb7\xb7\x44\x9d\
-\xd2\xde\x06\x36\xa4\xee\x85\xd2\xa7\x3c\x11\x97\x93\x3c\x25\xf0\
-\xaa\xb4\x1d\xdd\x7b\x43\x03\xef\xae\x9a\xca\xbc\x1b\xc7\x19\x5e\
-\x84\x37\xd2\x7d\x00\xc6\x3b\x36\x5e\x00\x70\x1f\x80\xca\x8e\x0d\
-\xf1\xd9\x70\x1f\x80\x10\x75\x47\xb6\x97\xff\x5a\xb8\x0f\x40\xcc\
-\xba\x63\x34\x34\x54\x7f\x1f\x80\x03\x07\x0b\xac\x6d\x3e\xcd\xc1\
-\xd6\x20\x4b\xdf\x8f\x01\xb7\x02\x5d\x21\x3a\x0b\x19\x00\x00\x1e\
-\x06\xbe\x24\xc0\xad\x85\x5c\x03\x3c\xb3\xa0\x91\xe6\x27\x1b\x99\
-\x33\x7b\x82\x17\x1f\x03\x40\xf9\xed\x06\x00\x03\xc0\x78\x0c\x00\
-\xe5\xb5\x0d\xb7\x1b\x00\x46\xb7\xd5\x6f\x00\x68\x3b\x3a\xc0\x9b\
-\xef\x9c\x61\xf3\x67\x7d\x0c\x86\xb9\xbb\x3d\x40\x72\x8d\xdd\x1e\
-\xa4\x37\xc2\x07\x00\x48\x66\x26\xbe\x18\xaa\xb3\x5c\x03\x2c\x9b\
-\x97\x63\xe5\xe2\x46\x96\xde\x9d\xe3\xa2\x29\x67\x1b\x0c\x00\x41\
-\xea\x1a\x00\x0c\x00\xe3\x32\x00\x94\xd7\x36\xdc\x6e\x00\x18\xdd\
-\x56\x5f\x01\xa0\x3f\x0f\x2d\xdb\xfa\xd9\xb4\xa5\x8f\x2f\x5a\xfa\
-\x43\x5d\xf8\xcf\x79\x19\x78\x29\x64\x87\x31\x02\x40\x23\xb0\x15\
-\x58\x14\xba\xe3\x59\x4d\xf0\xd0\x1d\x39\x16\xcf\xcd\x31\xff\xa6\
-\x1c\x37\xcf\x6e\xe0\xb2\x69\x45\x7e\xd1\x00\x50\x7e\xbb\x01\xc0\
-\x00\x30\x1e\x03\x40\x79\x6d\xc3\xed\x06\x80\xd1\x6d\x93\x3b\x00\
-\x74\x77\x0f\x71\xa4\x7d\x80\x6f\x0f\x15\xf8\x6a\x4f\x9e\xdd\x7b\
-\xf3\x9c\xea\x88\xb2\xa2\x6d\x1b\xf0\x08\x29\x26\xdb\x17\x13\x23\
-\x00\x00\xcc\x02\x76\x01\xb7\x47\xea\x7f\xd8\xec\x59\x0d\xcc\x98\
-\x06\x4d\x97\xc0\xcc\xe9\x65\x9e\x4e\xa9\x2f\x45\x2c\xb1\x5e\xed\
-\x58\xfd\x96\x2a\x52\x95\xba\x45\x04\xae\x5b\xf6\xfb\x1e\xf3\x7c\
-\x2f\xe8\xd7\xb2\x82\x4e\x6a\xe0\x7c\x83\x7f\xdf\x6b\xe0\x9c\x4a\
-\xfc\xb0\x0a\x75\xab\x20\x65\xdd\x8a\x03\xc0\x59\x9d\x9d\x43\x9c\
-\xee\x19\xa2\xab\x6b\x88\x13\x7f\x57\x65\xe5\xda\xf7\xc0\x02\xa0\
-\x23\x74\xc7\x31\xdf\xc2\xab\x81\xbd\xc0\xb5\x11\x6b\x48\x92\x34\
-\x59\xfd\x09\x3c\x00\xfc\x11\xa3\xf3\x50\xfb\x00\x14\xf3\x17\xb0\
-\x94\x64\x89\xa0\x24\x49\x2a\xdf\x31\x60\x09\x91\x2e\xfe\x10\x37\
-\x00\x00\x1c\x26\x49\x2f\x6d\x91\xeb\x48\x92\x34\x59\xb4\x03\x0b\
-\x81\x9f\x62\x16\x89\x1d\x00\x00\x7e\x25\x09\x01\x5f\x57\xa1\x96\
-\x24\x49\x17\xb2\xfd\xc0\xfd\xc0\xd1\xd8\x85\x42\xed\x04\x58\xca\
-\x19\xe0\x23\x60\x06\x70\x5f\x95\x6a\x4a\x92\x74\x21\xf9\x10\x58\
-\x4e\x84\x09\x7f\xc5\x64\x31\x8f\x73\x05\xf0\x1e\xd0\x94\x41\x6d\
-\x49\x92\x6a\x4d\x37\xf0\x1c\xc9\x1f\xca\x55\x53\xad\xff\x00\x8c\
-\xd4\x0a\x7c\x0a\xdc\x06\x5c\x9f\x41\x7d\x49\x92\x6a\x45\x0b\xb0\
-\x0c\xd8\x59\xed\xc2\xd5\x98\x03\x50\x4c\x1b\xc9\xec\xc6\x65\x44\
-\x9c\xe1\x28\x49\x52\x8d\x3a\x0e\xac\x24\xd9\xe0\x27\xfa\xfd\xfe\
-\x62\xb2\xf8\x0f\xc0\x48\x6d\xc0\xfb\x40\x27\x70\x27\x30\x3d\xdb\
-\xe1\x48\x92\x14\xd5\x49\xe0\x15\x92\x8b\xff\xbe\x2c\x07\x92\xd5\
-\x5e\x4e\xc5\x5c\x0a\xac\x02\x56\x03\xd7\x65\x3c\x16\x49\x92\x42\
-\x6a\x27\x79\x94\xef\x7a\x92\x89\xf1\x99\xab\xa5\x00\x30\xd2\x3d\
-\xc0\xb3\xc0\xd3\xc0\x15\x19\x8f\x45\x92\xa4\x4a\x74\x02\x9f\x03\
-\x1b\x48\xf6\xf3\x8f\xbe\xe3\xfc\x44\xd4\x6a\x00\x38\x67\x0a\x70\
-\x17\xc9\x7c\x81\x25\xc0\x83\xc0\xc5\x99\x8e\x48\x92\xa4\xe2\x0a\
-\xc0\x21\x92\x07\xe2\x6d\x05\xf6\x00\xbd\x99\x8e\x68\x1c\xb5\x1e\
-\x00\xce\x37\x95\x64\xe5\xc0\x2d\xc0\x1c\xe0\x1a\x92\xe5\x84\x4d\
-\xc0\xcc\x0c\xc7\x25\x49\xaa\x1f\x1d\x24\x4b\xf7\xba\x81\xdf\x49\
-\xe6\xb3\x1d\x06\x7e\x01\xf2\x19\x8e\x4b\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
-\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
-\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
-\x34\x89\xfd\x0f\xec\x15\xdb\xa0\x53\x22\x3d\x26\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x1d\xed\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
-\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
-\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
-\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
-\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1d\x6a\x49\x44\
-\x41\x54\x78\x9c\xed\xdd\x7b\x94\x9d\x65\x61\xef\xf1\xdf\xcc\x24\
-\x33\x93\x7b\x02\x51\x88\x84\x24\x10\x09\x37\x15\x04\xbc\x9c\x6a\
-\x44\x63\x50\xb9\x48\x6b\x2b\xa2\x3d\xf5\x82\xd6\x65\x95\x53\xed\
-\x29\x0a\x58\x6b\x8f\xb5\xb4\x8b\x28\xd5\xd2\x5a\x44\x8f\xa5\xb5\
-\x7a\x3c\x80\xc5\x3b\x4a\x2b\x20\x0a\xc7\x16\x15\x10\x8b\x20\x41\
-\x10\xc2\x35\x1a\x0c\xb9\x67\x32\x99\x99\xf3\xc7\x10\x0b\x91\x90\
-\xc9\x7e\xdf\x3d\x7b\xef\x79\x3e\x9f\xb5\xf6\x5a\x30\x99\xf7\x79\
-\x9f\xc5\x5a\xe4\xf9\xee\xf7\x9a\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x40\xa7\xea\x6a\xf1\xfe\xbb\x93\x2c\x4c\x72\x70\x92\
-\xd9\x49\x66\x3e\xfa\xe9\x69\xe5\xa4\x98\x70\xd6\x26\xd9\x9c\xe4\
-\x97\x49\xee\x48\xf2\xb3\x24\xdb\x5b\x3a\x23\x80\x16\x1b\xef\x00\
-\x98\x9f\x64\x59\x92\x97\x24\x39\x2a\xa3\x0b\x7f\xdf\x38\xcf\x01\
-\x06\x33\x1a\x01\xdf\x4f\xf2\xed\x24\xd7\x64\x34\x0c\x00\x8a\x31\
-\x1e\x01\xb0\x38\xc9\xeb\x93\xbc\x36\xa3\x0b\x3e\xb4\xa3\x55\x49\
-\x2e\x4e\xf2\xd9\x24\xff\xd9\xe2\xb9\x00\x74\xac\x9e\x24\xbf\x9b\
-\xe4\xda\x24\xc3\x49\x46\x7c\x7c\x3a\xe8\xf3\xa3\x24\x6f\x8d\xa3\
-\x53\x00\x63\xd6\x9b\xe4\xf7\x33\x7a\x38\xb5\xd5\x7f\x89\xfb\xf8\
-\x54\xfd\xdc\x9f\xe4\x8c\x24\xd3\x03\xc0\x2e\x2d\x4b\x72\x5b\x5a\
-\xff\x97\xb6\x8f\x4f\xdd\x9f\x07\x92\xbc\x21\xad\xbf\x68\x16\xa0\
-\xad\xcc\x4f\x72\x59\x5a\xff\x97\xb4\x8f\x4f\xb3\x3f\x57\x25\x39\
-\x24\x00\x13\x40\xd5\xdb\xed\x4e\x4e\x72\x45\x46\xaf\xe8\x87\x89\
-\xee\x80\x24\x6f\x49\xb2\x31\xc9\xf5\x2d\x9e\x0b\x40\x4b\x4c\x4a\
-\x72\x6e\x5c\xe0\xe7\x53\xee\xe7\x33\x71\x6d\x00\xd0\xc1\x1a\x39\
-\xa7\x39\x3b\xc9\x57\x92\x2c\xad\x79\x2e\xd0\x69\x6e\x4a\x72\x42\
-\x92\x87\x5a\x3d\x11\x80\x3d\xb5\xa7\x01\xb0\x6f\x92\x6f\x24\x39\
-\xb2\x09\x73\x81\x4e\xf4\xb3\x24\xaf\x48\xb2\xb2\xd5\x13\x01\xd8\
-\x13\x7b\x12\x00\x0b\x93\x7c\x2b\xa3\xe7\x41\x81\xff\xb2\x3a\xc9\
-\xcb\x93\xdc\xdc\xea\x89\x00\x8c\xd5\x58\x03\x60\x6e\x46\x1f\xea\
-\xe3\x0a\x68\x78\x62\x6b\x93\x1c\x97\xe4\x86\x56\x4f\x04\x60\x2c\
-\xba\xc7\xf0\x3b\x53\x33\x7a\xce\xdf\xe2\x0f\xbb\x36\x27\xc9\x37\
-\x93\x1c\xdd\xea\x89\x00\x8c\xc5\xee\x02\xa0\x2b\xc9\xe7\x92\xfc\
-\xb7\x71\x98\x0b\x74\xba\x39\x19\xbd\x2d\xf6\x88\x56\x4f\x04\x60\
-\x77\x76\x77\x0a\xe0\x8f\x92\x7c\xb4\xa9\x13\xe8\x4a\x16\xed\xd3\
-\x9b\x25\xf3\x7b\xb3\xe0\xa9\x93\x33\x7b\x7a\x4f\xba\xc7\x72\x5c\
-\x02\xc6\x68\xed\x86\xa1\xdc\xb7\x66\x30\x2b\xef\xdb\x96\xbb\x1e\
-\xd8\x96\xe1\x91\xa6\xef\x72\x4d\x92\xe5\x71\x4d\x00\xd0\xc6\x9e\
-\x2c\x00\x9e\x9b\xd1\xf3\xfe\xbd\x75\xef\x74\xc6\xd4\xee\xfc\xce\
-\xd2\x99\x39\xf1\x79\x33\xf2\xe2\x23\xa6\x65\xee\xac\xaa\xcf\x23\
-\x82\xb1\x79\x64\xe3\x50\xae\xfd\xcf\xcd\xf9\xfa\xf7\x36\xe6\xd2\
-\x6b\xd6\xe5\x97\x1b\x86\x9a\xb5\x2b\x11\x00\xb4\xb5\x5d\x05\x40\
-\x5f\x46\xff\xe2\xaa\xf5\xf5\xbd\x4f\xdf\xaf\x37\x67\x9d\x3a\x37\
-\xaf\x5b\x36\x2b\xd3\xfa\x7d\xcd\xa7\xb5\xb6\x6d\x1f\xc9\x65\xdf\
-\x59\x9f\x15\x97\xac\xc9\xcd\x77\x6e\x6d\xc6\x2e\x44\x00\xd0\xb6\
-\x76\x15\x00\xef\x4b\x72\x4e\x5d\x3b\x99\x3b\xab\x27\xe7\xfe\xfe\
-\x3e\x79\xd3\xcb\x67\xa7\xa7\xdb\xfb\x54\x68\x2f\x23\x23\xc9\xe7\
-\xbf\xb3\x2e\x67\x5c\xb8\x3a\xf7\xfd\x62\xb0\xee\xe1\x45\x00\xd0\
-\x96\x9e\x68\x35\x3e\x20\xc9\x2d\x19\xbd\xfa\xbf\xb2\x53\x5f\x3c\
-\x2b\x17\xbc\x6b\x5e\xf6\x9a\xe1\x30\x3f\xed\x6d\xe3\x96\xe1\x9c\
-\x71\xe1\x43\xf9\xe4\xe5\x6b\xeb\x1e\x5a\x04\x00\x6d\xe7\x89\x02\
-\xe0\x73\x49\x5e\x57\x75\xe0\xc9\x93\xba\x72\xfe\xe9\xfb\xe6\xed\
-\xaf\xdc\xab\xea\x50\x30\xae\x2e\xfe\xd6\xba\xbc\xf9\xbc\x07\xb2\
-\x65\x60\xb8\xce\x61\x45\x00\xd0\x56\x76\x0e\x80\xc5\x49\x7e\x92\
-\xd1\x97\xfd\x34\x6c\x6a\x5f\x77\x2e\xfd\xb3\xf9\x39\xf1\x79\x33\
-\xaa\x0c\x03\x2d\x73\xfd\x6d\x5b\x72\xd2\x9f\xde\x93\x35\xeb\x6a\
-\xbd\x48\xd0\xc3\x82\x80\xb6\xb1\xf3\x95\x78\xef\x4d\xc5\xc5\xbf\
-\x6f\x72\x57\xbe\x7a\xce\x02\x8b\x3f\x1d\xed\x79\x87\x4e\xc9\x95\
-\x1f\x5a\x54\xf7\x1d\x2a\x9e\x13\x00\xb4\x8d\xc7\x1e\x01\xd8\x37\
-\xc9\x3d\xa9\x70\xdb\x5f\x57\x57\x72\xe9\xfb\xf7\xcf\xab\x5f\x34\
-\xb3\xf2\xc4\xa0\x1d\xdc\x7c\xe7\xd6\x2c\x3f\xf3\xee\xba\x8f\x04\
-\x38\x1d\x00\xb4\xdc\x63\x8f\x00\xfc\x5e\x2a\xde\xf3\x7f\xd6\xa9\
-\x73\x2d\xfe\x4c\x28\x47\x2c\xee\xcf\x55\x1f\xae\xfd\x48\xc0\xdc\
-\x8c\xbe\x58\xcb\x63\x83\x81\x96\x79\xec\x11\x80\x9b\x93\x3c\xab\
-\xd1\x81\x9e\x73\xf0\x94\x7c\xf7\x6f\x0f\xc8\xa4\x1e\xb7\xf9\x31\
-\xf1\x38\x12\x00\x4c\x34\x3b\x8e\x00\x1c\x91\x0a\x8b\x7f\x4f\x77\
-\x57\x3e\xfe\xae\x79\x16\x7f\x26\xac\x23\x16\xf7\x37\xe3\x9a\x80\
-\xb9\x49\xae\x8c\x6b\x02\x80\x16\xd8\x11\x00\x27\x55\x19\xe4\x4d\
-\x2f\x9f\x9d\xa3\x97\x4c\xa9\x61\x3a\xd0\xbe\x44\x00\x30\x91\xec\
-\x08\x80\x65\x8d\x0e\xd0\xd3\xdd\x95\xb3\x5e\x3b\xb7\xa6\xe9\x40\
-\x7b\x73\x4d\x00\x30\x51\x74\x27\xe9\x4f\x85\xd7\xfd\x9e\xfc\x1b\
-\x33\x72\xd0\x7e\xb5\xbf\x2f\x08\xda\xd6\xb3\x0e\x6c\xca\x91\x00\
-\xb7\x08\x02\xe3\xaa\x3b\xc9\x31\x49\x1a\x3e\x7e\xff\xc6\x97\xcd\
-\xae\x6f\x36\xd0\x21\x9c\x0e\x00\x3a\x5d\x77\x92\xc3\x1a\xdd\x78\
-\xe6\xd4\xee\x9c\xf0\xdc\xe9\x35\x4e\x07\x3a\x87\x08\x00\x3a\x59\
-\x77\x92\x43\x1a\xdd\xf8\xd8\x23\xa6\x65\xf2\x24\x57\xfe\x53\x2e\
-\xd7\x04\x00\x9d\xaa\x3b\xc9\x92\x46\x37\x5e\xfa\xcc\x5a\x5e\x18\
-\x08\x1d\xcd\x35\x01\x40\x27\xea\x4e\xb2\xa0\xd1\x8d\x0f\x5d\xd0\
-\x57\xe3\x54\xa0\x73\x39\x1d\x00\x74\x9a\xee\x24\x0d\xbf\xb5\x67\
-\xc9\x7c\x01\x00\x3b\x88\x00\xa0\x93\x74\x27\x69\xf8\xe1\xfd\x35\
-\xff\x45\x07\x1d\xcf\x35\x01\x40\xa7\xe8\x4e\xd2\xf0\x65\xfc\xd3\
-\xa7\xec\xfc\x36\x61\xe0\x59\x07\x36\x25\x02\xe6\x24\xf9\x66\x44\
-\x00\x50\x93\xee\x54\x78\x03\x60\xaf\x3b\x00\xe0\x09\x89\x00\xa0\
-\xdd\xf9\x0a\x0f\x4d\x22\x02\x80\x76\x26\x00\xa0\x89\x44\x00\xd0\
-\xae\x04\x00\x34\x99\x08\x00\xda\x91\x00\x80\x71\x20\x02\x80\x76\
-\x23\x00\x60\x9c\x88\x00\xa0\x9d\x08\x00\x18\x47\x22\x00\x68\x17\
-\x02\x00\xc6\x99\x08\x00\xda\x81\x00\x80\x16\x10\x01\x40\xab\x09\
-\x00\x68\x11\x11\x00\xb4\x92\x00\x80\x16\x6a\xe2\xab\x84\x45\x00\
-\xf0\xa4\x04\x00\xb4\x58\x93\xde\x22\x28\x02\x80\x27\x25\x00\xa0\
-\x0d\x88\x00\x60\xbc\x09\x00\x68\x13\x22\x00\x18\x4f\x02\x00\xda\
-\x88\x08\x00\xc6\x8b\x00\x80\x36\x23\x02\x80\xf1\x20\x00\xa0\x0d\
-\x89\x00\xa0\xd9\x04\x00\xb4\x29\x11\x00\x34\x93\x00\x80\x36\x26\
-\x02\x80\x66\x11\x00\xd0\xe6\x44\x00\xd0\x0c\x02\x00\x3a\x80\x08\
-\x00\xea\x26\x00\xa0\x43\x88\x00\xa0\x4e\x5d\x49\x46\x1a\xdd\x78\
-\xe4\xca\xc3\x6b\x9c\x0a\x30\x16\x37\xdf\xb9\x35\xcb\xcf\xbc\x3b\
-\x6b\xd6\x0d\xd5\x39\xec\x9a\x24\x1f\x49\x32\x5c\xe7\xa0\xc0\xaf\
-\x0c\x25\x59\xff\xe8\x67\x6d\x92\x95\x49\xee\x49\x0b\xff\x9f\x13\
-\x00\xd0\x81\x9a\x14\x01\xc0\xf8\xda\x9a\xd1\x10\xb8\x31\xc9\xd5\
-\x8f\x7e\xee\x1f\xaf\x9d\x0b\x00\xe8\x50\x22\x00\x26\xa4\x9f\x24\
-\xb9\x38\xc9\x67\x92\xdc\xd5\xcc\x1d\xb9\x06\x00\x3a\x54\x93\xae\
-\x09\x00\x5a\xeb\x90\x24\x1f\x48\xf2\xd3\x24\xd7\x26\x79\x5d\x92\
-\xa6\xfc\x4f\x2e\x00\xa0\x83\x89\x00\x98\xb0\xba\x92\xbc\x30\xc9\
-\xe7\x92\xdc\x91\xe4\x5d\x49\xfa\xeb\xdc\x81\x00\x80\x0e\x27\x02\
-\x60\xc2\x3b\x20\xc9\xdf\x24\xb9\x25\xc9\xf1\x75\x0d\x2a\x00\x60\
-\x02\xd8\x11\x01\x7b\xcf\x14\x01\x30\x81\x2d\x4e\xf2\xf5\x24\x9f\
-\x4f\x32\xbf\xea\x60\x02\x00\x26\x88\x23\x16\xf7\xe7\xaa\x0f\x3b\
-\x12\x00\x05\x78\x75\x92\x1f\x27\x39\xa5\xca\x20\x02\x00\x26\x10\
-\xa7\x03\xa0\x18\x33\x93\x5c\x92\xe4\xfc\x24\xbd\x8d\x0c\x20\x00\
-\x60\x82\x71\x3a\x00\x8a\xd1\x95\xe4\x9d\x49\xfe\x2d\xc9\xac\x3d\
-\xdd\x58\x00\xc0\x04\xe4\x74\x00\x14\xe5\xd8\x24\xd7\x25\xd9\x6f\
-\x4f\x36\x12\x00\x30\x41\x39\x12\x00\x45\x79\x46\x46\x9f\x1b\xb0\
-\x60\xac\x1b\x08\x00\x98\xc0\x1c\x09\x80\xa2\x1c\x90\xe4\xaa\x24\
-\x4f\x1d\xcb\x2f\x0b\x00\x98\xe0\x8e\x58\xdc\x9f\xab\xcf\x5b\x94\
-\x85\xfb\x4c\x6e\xf5\x54\x80\xe6\x7b\x7a\x92\xaf\x24\x99\xb6\xbb\
-\x5f\x14\x00\x50\x80\x67\x1e\xd0\x9f\xef\x5f\x70\x60\xfe\xe0\x95\
-\x7b\xa5\x77\x52\x57\xab\xa7\x03\x34\xd7\xf3\x92\x7c\x7a\x77\xbf\
-\xe4\x65\x40\x50\x98\x75\x9b\x86\x72\xd5\x4d\x9b\x72\xcf\xea\xc1\
-\xac\x5e\xbb\xbd\xd5\xd3\x81\xce\xb5\xb5\x27\x19\x1a\xdb\xf7\xe8\
-\xa1\xe1\x64\xdd\xe6\xed\x59\xf5\xf0\xb6\xac\x7c\x70\x6b\xee\x5e\
-\x33\x90\x91\x86\x57\xdf\x31\x7b\x67\x92\xbf\xdb\xd5\x1f\x0a\x00\
-\x00\x68\xd4\xfa\xde\x64\xf3\x9e\x9f\x5e\xfb\xc5\xfa\xed\xb9\xe6\
-\xb6\xf5\xb9\xfc\x87\x8f\xe4\xb2\xef\xaf\xcd\xc6\xad\x4d\x79\xab\
-\xe7\x40\x92\x17\x24\xb9\xe1\x89\xfe\x50\x00\x00\x40\x15\x0d\x46\
-\xc0\x0e\x9b\x06\x86\xf3\xb9\xef\x3e\x9c\x15\x5f\x7b\x20\x77\xae\
-\x1e\xa8\x71\x62\x49\x92\xdb\x92\x1c\x99\x64\xdb\xce\x7f\x20\x00\
-\x00\xa0\x8a\x91\x24\x8f\xf4\x27\x03\xd5\xee\xb6\x19\x1a\x1e\xc9\
-\x45\xdf\x5e\x93\xf7\x5e\x72\x6f\x1e\xde\x58\xeb\xe9\xb9\xb3\x93\
-\xac\xd8\xf9\x87\x02\x00\x00\xaa\x1a\xe9\x4a\x1e\x9e\x92\x6c\xaf\
-\x7e\x91\xed\xc3\x1b\xb7\xe7\xed\xff\x78\x77\x3e\x7f\xfd\x2f\x6b\
-\x98\x58\x92\x64\x53\x92\xc3\x92\xac\x7a\xec\x0f\xdd\x05\x00\x00\
-\x55\x75\x8d\x24\xb3\xb7\x8e\x7e\xad\xae\x68\xef\xe9\x93\x72\xe9\
-\x1f\x3e\x3d\x1f\x7b\xe3\xc2\x4c\xea\xa9\xe5\xae\x9d\x69\x49\xce\
-\xd9\xf9\x87\x02\x00\x00\xea\x30\x69\x38\x99\xfe\x6b\xa7\xda\x1b\
-\x76\xfa\x71\xfb\xe4\xeb\xef\x59\x92\xe9\xfd\xb5\x3c\xc8\xeb\x77\
-\x93\x1c\xf4\xd8\x1f\x08\x00\x00\xa8\xcb\xb4\xc1\xd1\x10\xa8\xc9\
-\x71\xcf\x98\x95\x2f\xff\xf1\x41\xe9\xab\xfe\xfc\x8e\x9e\x24\xef\
-\x79\xec\x0f\x04\x00\x00\xd4\x69\x66\x7d\x47\x01\x92\x64\xd9\x61\
-\x33\xf3\x99\xb7\x2f\x4e\x57\xf5\xb3\x01\x6f\x48\xb2\xcf\x8e\x7f\
-\x11\x00\x00\x50\xa7\xde\xa1\xa4\xaf\xde\xfb\xfa\x4f\x79\xde\x5e\
-\x79\xf7\x09\xf3\xaa\x0e\xd3\x97\xe4\x75\x3b\xfe\x45\x00\x00\x40\
-\xdd\xa6\x0e\xd6\x3e\xe4\x5f\xbe\x66\x7e\x8e\x3e\x60\xb7\x8f\xf8\
-\xdf\x9d\xd7\xef\xf8\x07\x01\x00\x00\x75\xeb\x1b\x4a\x26\xd7\x77\
-\x2d\x40\x92\x4c\xee\xe9\xca\xc7\x4f\x5b\x94\xee\x6a\xa7\x02\x8e\
-\x4a\x72\x78\x22\x00\x00\xa0\x39\xa6\xd4\x7f\x14\xe0\x39\x07\x4e\
-\xcb\x1b\x96\xce\xad\x3a\xcc\x49\x89\x00\x00\x80\xe6\x98\xb2\xbd\
-\x96\xe7\x02\xec\xec\x4f\x7f\x73\xbf\xaa\xcf\x07\x58\x96\x08\x00\
-\x00\x68\x8e\xae\x24\x93\xeb\x7f\xc9\xcf\xe2\x7d\xfa\x72\xd2\x91\
-\xb3\xab\x0c\xf1\xc2\x24\x7d\x93\x6a\x9a\x4f\x65\x23\x23\xc9\x8d\
-\x77\x6c\xc9\x0f\x56\x6e\xcd\x23\x1b\x9b\xf2\x56\x24\x00\x18\x5f\
-\xdb\x7a\x92\x81\x9e\xcc\x9e\xd6\x93\x63\x0e\x98\x96\xa3\x16\x4d\
-\xab\xe3\x76\xbe\xbc\x61\xe9\xdc\x7c\xe9\x86\xb5\x8d\x6e\x3e\x35\
-\xc9\xd1\x6d\x11\x00\x5f\xb8\x6e\x7d\xde\xfb\xa9\xd5\x59\x79\x5f\
-\xbd\xf7\x4e\x02\x40\x3b\x39\x78\x5e\x7f\xce\x7d\xed\xfe\xf9\xad\
-\xa3\xe7\x54\x1a\xe7\xc4\x23\x67\x67\x7a\x7f\x4f\x95\xd7\x08\x1f\
-\xd6\xd2\x53\x00\x23\x23\xc9\x19\x17\x3e\x94\xdf\xf9\xc0\xbd\x16\
-\x7f\x00\x26\xbc\xdb\x1f\xdc\x9a\x57\x7d\xf4\x8e\xbc\xe7\xff\xde\
-\x5b\x69\x9c\xde\x49\x5d\x59\x7a\xf0\xf4\x2a\x43\x1c\xdc\xd2\x00\
-\x58\x71\xc9\x9a\x7c\xe4\x5f\x1e\x6e\xe5\x14\x00\x60\xdc\x9d\x77\
-\xf9\x83\xf9\xf0\xe5\x0f\x56\x1a\xe3\xd8\x43\x66\x56\xd9\xbc\x75\
-\x01\xf0\xb3\x87\xb6\xe5\x03\x9f\xfe\x79\xab\x76\x0f\x00\x2d\xf5\
-\x67\xff\x72\x7f\xee\x59\x33\xd0\xf0\xf6\x87\xed\x37\xa5\xca\xee\
-\x17\xb4\x2c\x00\x2e\xf8\xca\xda\x0c\x0c\x8e\xb4\x6a\xf7\x00\xd0\
-\x52\x5b\x07\x87\x73\xc1\x95\x8d\x7f\x11\x3e\x68\xdf\xfe\x2a\xbb\
-\x9f\xd9\xb2\x00\xb8\xe2\x7b\x1b\x5a\xb5\x6b\x00\x68\x0b\x57\xfc\
-\x68\x5d\xc3\xdb\xce\x9d\x51\xe9\x3a\xfe\x19\x2d\x0b\x80\xbb\x57\
-\xd7\xff\x84\x24\x00\xe8\x24\x77\xfd\xbc\xf1\x53\x00\x33\xfa\x7b\
-\xaa\xec\xba\x75\x01\xb0\x71\x4b\xbd\xcf\x48\x06\x80\x4e\x53\xe1\
-\x36\xbe\xf4\x4d\xae\xf4\x40\x81\x3e\x4f\x02\x04\x80\x02\x09\x00\
-\x00\x28\x90\x00\x00\x80\x02\x09\x00\x00\x28\x90\x00\x00\x80\x02\
-\x09\x00\x00\x28\x50\x5b\xbc\x0d\x70\x4f\xbd\xf6\x7f\x9e\xd5\xea\
-\x29\x00\xd0\x61\x36\x0d\x25\x1b\x9a\x74\x07\xfa\x35\x1f\x5b\xd1\
-\x9c\x81\x9b\xa8\x23\x03\xe0\xad\x7f\x7e\x6e\xab\xa7\x00\x40\x87\
-\x79\x70\x5b\xf2\x40\x93\x9e\x41\xd7\x89\x01\xe0\x14\x00\x00\x14\
-\x48\x00\x00\x40\x81\x04\x00\x00\x14\x48\x00\x00\x40\x81\x04\x00\
-\x00\x14\x48\x00\x00\x40\x81\x04\x00\x00\x14\x48\x00\x00\x40\x81\
-\x04\x00\x00\x14\x48\x00\x00\x40\x81\x04\x00\x00\x14\x48\x00\x00\
-\x40\x81\x04\x00\x00\x14\xa8\x23\xdf\x06\x78\xf1\x47\x9b\xf7\xd6\
-\xa5\xe9\xb3\x66\x67\xc9\x51\xc7\xe4\xa0\x23\x8e\x4a\x57\x57\x57\
-\xd3\xf6\x33\x32\x32\x92\x3b\x6e\xbe\x31\x2b\x6f\xfc\x41\x36\xae\
-\x7b\xa4\x69\xfb\x01\x60\xd4\xfa\xa1\x64\xc3\x50\xab\x67\xd1\x3e\
-\xba\x92\x8c\x34\xba\xf1\xc8\x95\x87\x37\xbe\xe3\xe5\x3f\x6e\x78\
-\xdb\xf1\xb0\xff\x41\x07\xe7\xad\x7f\x7e\x6e\x5e\x70\xd2\x6f\xd5\
-\x3e\xf6\xb5\x5f\xf9\x42\x3e\xf5\x81\xf7\xe6\xbe\x9f\xae\xac\x7d\
-\x6c\x00\x3a\xcb\x9b\x8f\x7d\x4a\x5e\x7a\xf8\xcc\x2c\x3b\x7c\x66\
-\xf6\x9d\x35\x79\x8f\xb6\xed\xfa\xbd\xef\x35\xbc\x5f\x01\xb0\x1b\
-\xaf\x79\xe7\xbb\xf3\xb6\x73\x3e\x5c\xcb\x58\x23\x23\x23\xb9\xf0\
-\x7d\xef\xce\xbf\x7c\xec\x23\xb5\x8c\x07\xc0\xc4\xd1\xd5\x95\x1c\
-\xbe\xdf\x94\xfc\xf6\x73\xf6\xca\x69\x2f\x9a\x9b\x45\x4f\xe9\xdb\
-\xfd\x36\x15\x02\xc0\x35\x00\xbb\x71\xe9\xdf\x9e\x97\x4b\xce\xaf\
-\x27\x00\x2e\xfe\xe8\x0a\x8b\x3f\x00\x4f\x68\x64\x24\xb9\xe5\xbe\
-\x2d\xf9\xe0\x17\xef\xcf\xe2\x3f\xbe\x39\x2f\x3b\xf7\xf6\x5c\xf2\
-\x1f\xbf\xcc\xe0\x50\xc3\xdf\xd3\x9f\x94\x23\x00\x63\x30\xa9\xb7\
-\x37\xff\xf4\x83\xdb\x32\x6f\xd1\x81\x0d\x8f\xf1\xd0\xaa\xbb\xf3\
-\xa6\xa3\x0f\xc9\xe0\xc0\x40\x8d\x33\x03\x60\xa2\x5b\x38\xb7\x2f\
-\x7f\x72\xf2\xbc\xbc\xe5\xc5\x4f\x49\x4f\xf7\xe3\xaf\x4d\x73\x04\
-\xa0\xc9\xb6\x6f\xdb\x96\xaf\x5e\xf4\x89\x4a\x63\x7c\xf9\x93\x7f\
-\x6f\xf1\x07\x60\x8f\xdd\xb3\x66\x20\x6f\xbb\xe8\xee\x1c\xf9\x27\
-\xb7\xe4\x6b\x37\xd5\x77\xd1\xb8\x00\x18\xa3\xef\x5f\x79\x45\x4b\
-\xb7\x07\xa0\x6c\xb7\xdc\xb7\x25\xaf\xfc\xeb\x95\x79\xdd\xdf\xdf\
-\x99\x35\x1b\xb6\x57\x1e\xaf\x23\x6f\x03\x6c\x85\x87\xee\xfe\x59\
-\xa5\xed\x57\xaf\xba\xa7\xa6\x99\x00\x50\xb2\x8b\xff\xfd\xe1\x7c\
-\xeb\xd6\xf5\xb9\xf0\xcd\x8b\x2a\x8d\x23\x00\xc6\x68\x52\x77\x57\
-\x96\xcd\x68\x7c\xfb\xee\xc6\x2f\xb5\x00\x80\xc7\x59\xbd\x6e\x30\
-\xaf\xfa\xe8\x1d\x95\xc6\x70\x0a\x60\x8c\x16\x2d\x5a\xd4\xd2\xed\
-\x01\xa0\x4e\x02\x60\x8c\x8e\x3f\xfe\xf8\x96\x6e\x0f\x00\x75\x12\
-\x00\x63\xd0\xdf\xdf\x9f\x77\xbc\xe3\x1d\x95\xc6\x38\xfd\xf4\xd3\
-\xd3\xd7\xb7\xfb\x87\x3a\x00\xc0\x78\x10\x00\x63\x70\xce\x39\xe7\
-\x64\xc1\x82\x05\x95\xc6\x58\xb8\x70\x61\x3e\xf8\xc1\x0f\xd6\x34\
-\x23\x00\xa8\x46\x00\xec\xc6\x7b\xde\xf3\x9e\x9c\x71\xc6\x19\xb5\
-\x8c\x75\xe6\x99\x67\xd6\x36\x16\x00\x54\x21\x00\x76\xe1\xd0\x43\
-\x0f\xcd\x97\xbf\xfc\xe5\x7c\xe8\x43\x1f\xaa\x75\xdc\xf3\xce\x3b\
-\x2f\x5f\xfa\xd2\x97\x72\xc8\x21\x87\xd4\x3a\x2e\x00\xec\x89\x8e\
-\x7c\x14\xf0\x59\x67\x9d\xd5\xf0\xb6\x4f\xa6\xbf\xbf\x3f\xfb\xed\
-\xb7\x5f\x8e\x39\xe6\x98\x3c\xfb\xd9\xcf\x6e\xca\x3e\x1e\xeb\xc6\
-\x1b\x6f\xcc\x0d\x37\xdc\x90\xfb\xef\xbf\x3f\x5b\xb7\x6e\x6d\xfa\
-\xfe\xa0\x13\xdd\x72\xcb\x2d\xb9\xfc\xf2\xcb\x9b\xbe\x9f\x9e\xee\
-\xae\x1c\x38\x7f\x66\x0e\x5a\x30\x2b\xf3\xf7\x99\x96\x39\x33\x5d\
-\xb3\x43\x4d\x06\xd7\x67\x68\xdb\xfa\xac\xdb\x38\x94\x55\x3f\x1f\
-\xcc\xca\xfb\xb6\xe5\xee\xd5\xdb\x32\xd2\xe2\xbb\xc3\x3b\x32\x00\
-\x46\x5a\xfd\x5f\x0d\x18\x17\x37\xdf\x7c\x73\x96\x2f\x5f\x9e\x35\
-\x6b\xd6\x34\x65\xfc\xbd\x66\xf5\xe5\xd4\x97\x2d\xce\xf1\x2f\xd8\
-\x3f\x4b\x8f\x9a\x97\xd9\x33\x7a\x9b\xb2\x1f\x0a\xb7\x65\x55\xb2\
-\xf9\xde\xc7\xfd\xe8\x17\xeb\xb6\xe7\x9a\x1f\x6e\xce\xe5\xd7\x6f\
-\xc8\x65\xd7\xae\xcf\xc6\x2d\xc3\xe3\x3e\x2d\x01\x00\xb4\xa5\x66\
-\x2e\xfe\x47\x1e\xbc\x77\xce\x3a\xed\xc8\xfc\xf6\xb2\x03\xd2\x3b\
-\xd9\x99\x50\x9a\xec\x09\x02\xe0\xb1\x36\x6d\x1d\xce\xe7\xae\x5e\
-\x97\x15\x17\xaf\xc9\x9d\x0f\x6c\x1b\xb7\x69\x09\x00\xa0\xed\x34\
-\x6b\xf1\xdf\x7f\xdf\xe9\xf9\xeb\x3f\x7e\x7e\x5e\xbd\xfc\xc0\x74\
-\x75\xed\xfe\xf7\xa1\x16\xbb\x09\x80\x1d\x86\x86\x47\x72\xd1\x15\
-\x8f\xe4\xbd\x9f\x5a\x9d\x87\xd7\x0f\x35\x7d\x5a\xd2\x17\x68\x2b\
-\xcd\x5a\xfc\xdf\xf6\xea\x43\x73\xdb\x17\x5e\x93\x53\x8e\xb3\xf8\
-\xd3\x9e\x7a\xba\xbb\xf2\xd6\x13\xe6\xe4\xf6\x7f\x3a\x28\xa7\x1c\
-\x3b\xb3\xe9\xfb\x13\x00\x40\xdb\x68\xc6\xe2\x3f\xb5\x7f\x52\x2e\
-\x3e\xf7\xa5\xb9\xf0\x7d\x4b\x33\x6d\x8a\xd7\x9f\xd0\xfe\xf6\x9e\
-\xd9\x93\x4b\xdf\xbf\x7f\x3e\xf6\x87\xf3\x32\xa9\xa7\x79\xb5\x2a\
-\x00\x80\xb6\xd0\x8c\xc5\x7f\xf6\x8c\xde\xfc\xeb\x05\x27\xe4\xd4\
-\x97\x2f\xae\x6d\x4c\x18\x2f\xa7\xff\xe6\x5e\xf9\xfa\x5f\x2d\xc8\
-\xf4\x29\xcd\x59\xaa\x05\x00\xd0\x72\xcd\x58\xfc\xe7\xce\xee\xcf\
-\x35\x9f\x7a\x65\x5e\xf8\xec\x7d\x6b\x1b\x13\xc6\xdb\x71\x47\x4f\
-\xcf\x97\x3f\xb8\x20\x7d\x93\xeb\x3f\x12\x20\x00\x80\x96\x6a\xd6\
-\xe2\x7f\xe5\x27\x4e\xcc\x11\x4b\xf6\xae\x6d\x4c\x68\x95\x65\xcf\
-\x9e\x96\xcf\x9c\x3d\xbf\xf6\x6b\x57\x04\x00\xd0\x32\xcd\x58\xfc\
-\xe7\xcc\xec\xcb\x15\x17\x9c\x60\xf1\x67\x42\x39\xe5\xd8\x99\x79\
-\xf7\x29\x73\x6b\x1d\x53\x00\x00\x2d\xd1\xac\x6f\xfe\xdf\xfa\xdf\
-\x27\xe5\xe8\x43\xeb\xfd\x8b\x12\xda\xc1\x5f\xbe\xf9\xa9\x39\x7a\
-\xc9\x94\xda\xc6\x13\x00\xc0\xb8\xf3\xcd\x1f\xf6\xdc\xe4\x49\x5d\
-\xf9\xc4\x1f\xcd\x4b\x4f\x77\x3d\xe7\x02\x04\x00\x30\xae\x7c\xf3\
-\x87\xc6\x1d\xbd\x64\x4a\x5e\x7f\xdc\xac\x5a\xc6\x12\x00\xc0\xb8\
-\xf1\xcd\x1f\xaa\xfb\xd3\xff\xfe\x94\x5a\x9e\x0f\x20\x00\x80\x71\
-\xe1\x9b\x3f\xd4\x63\xf1\xd3\x7a\x73\xd2\xf3\xa7\x57\x1e\x47\x00\
-\x00\x4d\xe7\x9b\x3f\xd4\xeb\x0d\xc7\xcd\xae\x3c\x86\x00\x00\x9a\
-\xca\x37\x7f\xa8\xdf\x89\xcf\x9f\x51\xf9\x09\x81\x02\x00\x68\x1a\
-\xdf\xfc\xa1\x39\x7a\x27\x75\x65\xe9\x33\xa7\x56\x1a\x43\x00\x00\
-\x4d\xe1\x9b\x3f\x34\xd7\xb1\xcf\x9a\x56\x69\x7b\x01\x00\xd4\xce\
-\x37\x7f\x68\xbe\x43\x17\xf4\x55\xda\xde\xbb\x31\x81\x5a\x79\xb6\
-\x3f\x8c\x8f\x25\xfb\xf7\x56\xda\xde\x11\x00\xa0\x36\xbe\xf9\xc3\
-\xf8\x99\x3b\xb3\xda\x77\x78\x01\x00\xd4\xa2\x59\x8b\xff\x37\x2f\
-\x3c\xd1\x39\x7f\x78\x02\x33\xa6\xba\x0b\x00\x68\x31\x8b\x3f\x8c\
-\xbf\xbe\xc9\xd5\x9e\x06\x28\x00\x80\x4a\x2c\xfe\xd0\x99\x04\x00\
-\xd0\x30\x8b\x3f\x74\x2e\x01\x00\x34\xc4\xe2\x0f\x9d\x4d\x00\x00\
-\x7b\xcc\xe2\x0f\x9d\x4f\x00\x00\x7b\xc4\xe2\x0f\x13\x83\x00\x00\
-\xc6\xcc\xe2\x0f\x13\x87\x00\x00\xc6\xc4\xe2\x0f\x13\x8b\x00\x00\
-\x76\xcb\xe2\x0f\x13\x8f\x00\x00\x9e\x94\xc5\x1f\x26\x26\x01\x00\
-\xec\x92\xc5\x1f\x26\x2e\x01\x00\x3c\x21\x8b\x3f\x4c\x6c\x02\x00\
-\xf8\x35\x16\x7f\x98\xf8\x04\x00\xf0\x38\x16\x7f\x28\x83\x00\x00\
-\x7e\xc5\xe2\x0f\xe5\x10\x00\x40\x12\x8b\x3f\x94\x46\x00\x00\x16\
-\x7f\x28\x90\x00\x80\xc2\x59\xfc\xa1\x4c\x02\x00\x0a\x66\xf1\x87\
-\x72\x09\x00\x28\x94\xc5\x1f\xca\x26\x00\xa0\x40\x16\x7f\x40\x00\
-\x40\x61\x2c\xfe\x40\x92\x4c\x6a\xf5\x04\x1a\xb1\x62\xc5\x8a\x56\
-\x4f\x01\x3a\xd2\xf0\xf0\x70\x3e\xf2\x91\x8f\xd4\xba\xf8\xcf\x9d\
-\xdd\x9f\x2b\x3f\x71\x62\x8e\x58\xb2\x77\x6d\x63\x02\xcd\x37\xae\
-\x01\xf0\xd0\x2f\xb7\xe7\xea\x1f\x6e\xca\x55\x37\x6e\xaa\x34\xce\
-\xd9\x67\x9f\x5d\xd3\x8c\x80\x2a\x2c\xfe\xd0\xb9\x9a\x1e\x00\x3f\
-\x7b\x68\x5b\xfe\xf1\x8a\x47\xf2\x85\xeb\xd6\xe7\xc7\x77\x0f\x34\
-\x7b\x77\xc0\x38\xb1\xf8\x43\x67\x6b\x4a\x00\x0c\x6e\x1f\xc9\x65\
-\xd7\xae\xcf\x3f\x7c\x63\x6d\xae\xbe\x69\x53\x86\x47\x9a\xb1\x17\
-\xa0\x55\x2c\xfe\xd0\xf9\x6a\x0d\x80\xe1\x91\xe4\xb2\xef\xac\xcf\
-\xfb\x2e\x5a\x9d\x3b\xee\xdf\x56\xe7\xd0\x40\x9b\x98\x33\xb3\x2f\
-\x57\x5c\x70\x82\xc5\x1f\x3a\x5c\x6d\x01\xf0\x95\xef\x6e\xc8\x9f\
-\x5c\xb4\xda\x61\x7e\x98\xc0\xf6\x9e\xd5\x9f\xab\x3e\xe9\x9b\x3f\
-\x4c\x04\x95\x03\x60\xed\x86\xa1\x9c\xfd\xa9\xd5\xf9\xe4\xe5\x6b\
-\xeb\x98\x0f\xd0\xa6\xe6\xcc\xec\xcb\xbf\x7e\xdc\x37\x7f\x98\x28\
-\x2a\x05\xc0\x17\xaf\x5b\x9f\xb7\x9f\xff\x60\x56\xaf\xdd\x5e\xd7\
-\x7c\x80\x36\xe4\x9b\x3f\x4c\x3c\x5d\x49\x5c\xa2\x07\xec\x92\x87\
-\xfc\x40\x45\x5b\x56\x25\x9b\xef\x6d\xca\xd0\x5d\xcb\x7f\xdc\xf0\
-\xb6\x9e\x04\x08\xec\x92\xc5\x1f\x26\x2e\x01\x00\x3c\x21\x8b\x3f\
-\x4c\x6c\x02\x00\xf8\x35\x16\x7f\x98\xf8\x04\x00\xf0\x38\x16\x7f\
-\x28\x83\x00\x00\x7e\x65\xe1\xbc\xe9\xf9\xf6\xa7\x5e\x69\xf1\x87\
-\x02\x74\xe4\xdb\x00\x81\x7a\xf5\x4e\xee\xce\x5b\x7e\xeb\x90\x7c\
-\xf0\x1d\xc7\x64\xee\xec\xfe\x56\x4f\x07\x18\x07\x2d\x0f\x80\xae\
-\xae\x64\xd1\xd3\x66\x64\xc9\xc2\x59\x59\xb0\xef\xf4\xcc\x9e\xd1\
-\x97\xee\xee\xae\x56\x4f\x0b\x8a\xb0\xcf\x5e\x53\xb2\x70\xde\xf4\
-\xbc\xf4\x79\xfb\x65\xd6\xf4\xde\x56\x4f\x07\x18\x47\x2d\x09\x80\
-\x19\xd3\x26\xe7\x77\x5e\x7a\x40\x4e\x5c\xba\x20\x2f\x3e\xe6\x69\
-\xbe\x71\x00\xc0\x38\x1b\xd7\x00\x78\xfa\xfe\x33\x73\xd6\x69\x47\
-\xe6\x75\xaf\x78\x7a\xa6\x4d\x69\xf9\xc1\x07\x00\x28\xd6\xb8\xac\
-\xc2\x73\x67\xf7\xe7\xdc\x77\x3d\x37\x6f\x3a\xf9\xe0\xf4\x38\xbc\
-\x0f\x00\x2d\xd7\xf4\x00\x38\xf5\xe5\x8b\x73\xc1\x7b\x5f\x98\xbd\
-\x66\xf5\x35\x7b\x57\x00\xc0\x18\x35\x2d\x00\x26\x4f\xea\xce\xf9\
-\x67\xfe\x46\xde\x7e\xca\x61\xcd\xda\x05\x00\xd0\xa0\xa6\x04\xc0\
-\xd4\xfe\x49\xb9\xf4\x43\xcb\x73\xe2\xd2\x05\xcd\x18\x1e\x00\xa8\
-\xa8\xf6\x00\xe8\xeb\xed\xc9\x57\xcf\x7f\x45\x96\x3d\xf7\x69\x75\
-\x0f\x0d\x00\xd4\xa4\xd6\x27\x01\x76\x75\x25\x9f\xfd\xcb\x97\x58\
-\xfc\x01\xa0\xcd\xd5\x1a\x00\x67\xbd\xe9\xc8\xbc\x7a\xf9\x81\x75\
-\x0e\x09\x00\x34\x41\x6d\x01\xf0\x9c\xc3\x9f\x92\xbf\x38\xfd\x98\
-\xba\x86\x03\x00\x9a\xa8\x96\x00\xe8\xee\xee\xca\xc7\xce\x7e\x41\
-\x26\xf5\x78\xb7\x10\x00\x74\x82\x5a\x56\xec\xd3\x4e\x3e\x38\xcf\
-\x7d\xc6\x53\xeb\x18\x0a\x00\x18\x07\x95\x03\xa0\xa7\xbb\x2b\x67\
-\x9d\x76\x44\x1d\x73\x01\x00\xc6\x49\xe5\x00\x38\xf9\xc5\x0b\x73\
-\xd0\x82\x59\x75\xcc\x05\x00\x18\x27\x95\x03\xe0\x4d\x27\x1f\x5c\
-\xc7\x3c\x00\x80\x71\x54\x29\x00\x66\x4e\xeb\xcd\xf1\x2f\xd8\xbf\
-\xae\xb9\x00\x00\xe3\xa4\x52\x00\x1c\x7b\xcc\xbc\x4c\x9e\xe4\xca\
-\x7f\x00\xe8\x34\x95\x56\xef\xa5\xcf\xde\xb7\xae\x79\x00\x00\xe3\
-\xa8\x52\x00\x1c\x76\xe0\x9c\xba\xe6\x01\x00\x8c\xa3\x4a\x01\xe0\
-\xea\x7f\x00\xe8\x4c\x95\x02\x60\xee\xec\xfe\xba\xe6\x01\x00\x8c\
-\xa3\x4a\x01\x30\x7d\xea\xe4\xba\xe6\x01\x00\x8c\xa3\x4a\x01\xd0\
-\x3b\xd9\x1d\x00\x00\xd0\x89\xac\xe0\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\
-\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\
-\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\
-\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\
-\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\
-\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\
-\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\
-\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\
-\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\x20\x01\x00\x00\x05\x12\
-\x00\x00\x50\x20\x01\x00\x00\x05\x12\x00\x00\x50\xa0\xee\x24\xdb\
-\x1a\xdd\x78\xdb\xe0\x70\x8d\x53\x01\x80\x09\x68\x64\xa4\x29\xc3\
-\x0e\x0c\x56\x1a\x77\xa0\x3b\xc9\xc6\x46\xb7\xde\xb8\x79\xb0\xca\
-\xce\x01\x60\xe2\x1b\x19\x6a\xca\xb0\xeb\x37\x57\x1a\x77\x43\x77\
-\x92\xf5\x8d\x6e\xbd\xe6\x91\xad\x55\x76\x0e\x00\x13\x5f\x93\x02\
-\xe0\xe1\xf5\xd5\x03\x60\x43\xa3\x5b\xaf\xbc\x67\x5d\x95\x9d\x03\
-\xc0\xc4\x37\xdc\xf0\x99\xf6\x27\xb5\xf2\xde\x4a\xe3\xae\xef\x4e\
-\xb2\xaa\xd1\xad\x6f\xbd\x6b\x6d\x95\x9d\x03\xc0\xc4\x37\xb4\xa5\
-\x29\xc3\xde\xba\x6a\xa0\xca\xe6\xab\xba\x93\xdc\xde\xe8\xd6\xd7\
-\xde\xf4\x60\x95\x9d\x03\xc0\x04\x37\x9c\x8c\x34\xe7\x08\xc0\xb7\
-\x6f\xde\x54\x65\xf3\x9f\x54\x0a\x80\xef\xdc\xf0\x90\x3b\x01\x00\
-\x60\x57\x06\x37\x36\xe5\x2e\x80\x81\xc1\x91\x5c\x77\xcb\xe6\x2a\
-\x43\xac\xec\x4e\x72\x6b\xa3\x5b\xaf\xdf\xb4\x2d\xdf\xf8\x7f\x0d\
-\x9f\x41\x00\x80\x89\x6d\x7b\x73\xae\x95\xfb\xfa\xf5\x1b\xb2\x71\
-\x4b\xa5\x2f\xe0\xb7\x76\x27\xf9\x7e\x92\x86\x4f\x50\x7c\xfa\xab\
-\x2b\xab\x4c\x00\x00\x26\xae\xc1\xe6\x04\xc0\x3f\x7f\xf3\x91\x2a\
-\x9b\x6f\x4a\xf2\x83\xee\x24\x03\x49\xbe\xdb\xe8\x28\x5f\xb9\xe6\
-\x1e\x77\x03\x00\xc0\xce\x86\x07\x93\xc1\x86\xef\xb4\xdf\xa5\x9f\
-\xde\xbf\x2d\x5f\xfd\xf7\x86\x1f\xe1\x93\x24\xd7\x25\xd9\xb6\xe3\
-\x51\xc0\x57\x37\x3a\xca\xd0\xf0\x48\xce\xfd\xc7\x1f\x56\x99\x08\
-\x00\x4c\x3c\xdb\xd6\x24\xa9\xff\xfc\xff\x5f\x7c\xf6\x17\x19\x1a\
-\xae\x34\xee\xd5\xc9\x7f\xbd\x0b\xe0\x6b\x55\x46\xfa\xf4\x57\x57\
-\xe6\x07\xb7\xfe\xa2\xca\x10\x00\x30\xb1\x6c\x5d\x5d\xfb\x90\xdf\
-\xfb\xc9\x96\x7c\xf6\xca\x4a\x87\xff\x93\x47\xd7\xfc\x1d\x01\xf0\
-\xa3\x24\x37\x37\x3a\xd2\xf0\xf0\x48\xfe\xe0\x9c\x6b\x33\xb8\xdd\
-\x1d\x01\x00\x90\xc1\x47\x92\xa1\x4a\xb7\xe9\xfd\xfa\x90\xdb\x47\
-\xf2\xf6\xf3\x1f\x48\xb5\x2f\xff\xb9\x31\x8f\x5e\xfc\xdf\xf3\x98\
-\x1f\x4e\x4b\xf2\xb2\x46\x47\x7c\x70\xcd\xe6\x6c\xdd\x36\x94\xe3\
-\x9e\x3f\xbf\xd2\xcc\x00\xa0\xe3\x6d\xfa\x69\x32\x5c\xe9\x41\x3d\
-\xbf\xe6\xcc\x4f\xae\xce\x17\xae\x6b\xf8\xe1\xbd\x3b\xac\x48\x72\
-\x7d\xf2\xf8\x00\xf8\x59\x92\x77\xee\xf4\xb3\x3d\xf2\xef\x3f\x5a\
-\x9d\x43\x0f\x98\x93\xc3\x17\xcf\xa9\x36\x3d\x00\xe8\x54\x83\xeb\
-\x92\x2d\xf7\xd6\x3a\xe4\x25\xd7\xac\xcb\xbb\x3f\x51\xf9\x94\xc2\
-\x40\x92\xdf\xcf\xe8\x5d\x00\xbf\x3a\x05\x90\x24\x0f\x25\xf9\xe7\
-\x2a\x23\x8f\x8c\x24\x6f\x78\xff\xb7\x72\xf5\xf7\x1e\xa8\x32\x0c\
-\x00\x74\xa6\x91\x91\x64\xd3\x9d\xb5\x0e\x79\xd5\x4d\x9b\xf2\xc6\
-\x15\xf7\xd7\xf1\x3c\xa1\x4f\x27\xf9\x55\x45\x74\xed\xf4\x87\x8b\
-\x93\xfc\x24\xc9\xa4\x2a\x7b\x98\xda\x3f\x29\x97\x7e\x68\x79\x4e\
-\x5c\xba\xa0\xca\x30\x00\xd0\x59\xb6\xdc\x97\x6c\xbe\xa7\xb6\xe1\
-\xbe\xf6\x1f\x1b\x72\xea\x5f\xdc\x97\xcd\x03\x95\xaf\xb1\x1b\x4a\
-\x72\x48\x92\x9f\xee\xf8\xc1\xce\x87\xfb\xd7\x3e\xfa\x0b\xcf\xac\
-\xb2\x97\xc1\xed\xc3\xb9\xf4\xdf\xee\xca\xde\xb3\xfa\xf2\xdc\x67\
-\x3c\xb5\xca\x50\x00\xd0\x19\xb6\x6f\x4c\x36\xdd\x91\xba\x6e\xfd\
-\xfb\xbb\x2f\xfd\x32\x6f\xfe\xf0\x03\x19\x18\xac\x65\xbc\xcf\x26\
-\xb9\xe8\xb1\x3f\xd8\xf9\x08\x40\x92\x2c\x4a\xf2\xe3\x24\x53\xeb\
-\xd8\xe3\x29\xc7\x1d\x98\x8f\xbf\xef\x85\xd9\x7b\x56\x7f\x1d\xc3\
-\x01\x40\xfb\x19\x19\x4a\xd6\xfd\x30\x19\xda\x5a\x79\xa8\x35\xeb\
-\x86\xf2\x07\x7f\xf3\x40\x2e\xbb\xb6\xb6\x87\x08\x6d\x4a\x72\x68\
-\x92\xc7\x5d\x98\xf0\x44\x17\xfc\x3d\x92\xd1\x7c\x79\x69\x1d\x7b\
-\xbd\xf5\xae\xb5\xf9\x87\x2f\xde\x9e\x39\x33\xfb\x72\xc4\x92\xbd\
-\xd2\xdd\xfd\x44\xcd\x01\x00\x9d\x6a\x24\xd9\x78\xdb\xe8\x11\x80\
-\x0a\xb6\x0f\x8d\xe4\x93\x97\xaf\xcd\xab\xfe\xd7\xbd\xb9\xf1\x8e\
-\xea\x21\xf1\x18\xef\x4f\xf2\x8d\x9d\x7f\xb8\xab\xd5\xb8\x37\xa3\
-\xcf\x05\x38\xa4\xce\x19\x2c\x9e\x3f\x33\x67\x9d\x76\x64\x7e\xf7\
-\xf8\xa7\x67\xda\x94\x4a\x97\x19\x00\x40\x7b\xd8\x78\x47\x32\xf0\
-\xf3\xc6\x37\xdf\x32\x9c\xcf\x5d\xbd\x2e\x2b\x2e\x5e\x93\xbb\x1e\
-\xac\xfd\xd5\xc1\xb7\x26\x39\x32\xc9\xe0\xce\x7f\xf0\x64\x5f\xc7\
-\x9f\x93\xd1\xe7\x05\xf7\xd6\x3d\x9b\xe9\x53\x27\xe7\x55\x2f\x59\
-\x94\x13\x97\x2e\xc8\x4b\x9e\xf3\xb4\x3c\x75\xaf\x29\x75\xef\x02\
-\x00\x9a\x6f\xd3\x9d\xc9\xd6\x87\xf6\x78\xb3\xd5\x6b\xb7\xe7\x5b\
-\x3f\xdc\x94\xcb\xaf\xdf\x98\x2f\x5e\xb7\x3e\x9b\xb6\x36\xe5\x41\
-\x7a\x03\x49\x7e\x23\xa3\x0f\xff\xf9\x35\xbb\x3b\x1e\xff\xae\x24\
-\x7f\x53\xf7\x8c\x1e\x37\x81\xae\x64\xc1\xbe\xd3\xb3\x64\xe1\xec\
-\x2c\x9c\x37\x3d\xb3\xa6\xf7\x66\xfa\xd4\xc9\x99\xd2\xd7\xf0\xe3\
-\x08\x00\xa0\xc9\x46\x92\x81\x87\xc7\xf4\xb4\xbf\x2d\xdb\x86\xb3\
-\x71\xcb\x70\xd6\x6d\x1a\xce\x3d\xab\x07\xb3\xf2\xbe\x81\xac\xfa\
-\xf9\x60\x1d\xb7\xf5\xed\xce\xff\x48\xf2\xf7\xbb\xfa\xc3\xdd\x05\
-\x40\x57\x92\xcb\x92\xbc\xaa\xce\x19\x01\x00\x4d\xf5\xf9\x24\xaf\
-\x79\xb2\x5f\x18\xcb\x15\x79\x53\x93\x7c\x33\xa3\x87\x11\x00\x80\
-\xf6\xf6\xbd\x24\xcb\xf2\xe8\x13\xff\x76\x65\xac\x97\xe4\xef\x9d\
-\xe4\xda\x8c\xde\x46\x00\x00\xb4\xa7\x3b\x92\xbc\x20\xc9\x6e\x5f\
-\xd1\xdb\xbd\xbb\x5f\x78\xd4\xc3\x49\x5e\x91\xe4\xae\x0a\x93\x02\
-\x00\x9a\xe7\xae\x24\xcb\x33\x86\xc5\x3f\x19\x7b\x00\x24\xc9\xaa\
-\x8c\x56\xc5\x4d\x0d\x4c\x0a\x00\x68\x9e\x5b\x92\xbc\x28\xa3\x6b\
-\xf5\x98\xec\x49\x00\x24\xa3\x2f\x0c\x7a\x49\x92\x6b\xf6\x70\x3b\
-\x00\xa0\x39\xae\xce\xe8\x17\xf4\xfb\xf7\x64\xa3\x46\xee\xb5\x1b\
-\x48\xf2\x7f\x32\xfa\xb4\xc0\x17\x65\xec\xd7\x11\x00\x00\xf5\x19\
-\x49\xf2\x77\x49\xde\x98\x64\xf3\x9e\x6e\x5c\x75\xf1\x7e\x65\x92\
-\x7f\x4a\xb2\x57\xc5\x71\x00\x80\xb1\x5b\x97\xe4\x2d\x19\xbd\x55\
-\xbf\x21\x55\x9f\xb6\xb3\x32\xa3\x47\x03\xe6\x27\x39\xbc\xe2\x58\
-\x00\xc0\xee\x5d\x92\xe4\xe4\x8c\xde\xee\xd7\xb0\x3a\x0f\xdf\x1f\
-\x97\xe4\x63\x49\x96\xd4\x38\x26\x00\x30\xea\xf6\x8c\x3e\xdd\xef\
-\xca\x3a\x06\xdb\xd3\x8b\x00\x9f\xcc\x37\x93\x3c\x23\xa3\xe7\x22\
-\x7e\x52\xe3\xb8\x00\x50\xb2\xbb\x92\xbc\x2d\xc9\x33\x53\xd3\xe2\
-\x9f\x34\xef\x02\xbe\x9e\x24\xaf\x4e\xf2\x8e\x24\x4b\x9b\xb8\x1f\
-\x00\x98\x88\x46\x32\xfa\x00\xbe\x0b\x32\xfa\x58\xdf\xda\xdf\x16\
-\x34\x1e\x0b\xf3\xa2\x24\xaf\x4f\x72\x6a\x5c\x27\x00\x00\x4f\xe6\
-\x96\x8c\x9e\xe3\xff\x6c\x92\xbb\x9b\xb9\xa3\xf1\xfe\x66\x3e\x2f\
-\xa3\xcf\x27\x5e\x96\xe4\xa8\x24\x07\x27\xf1\x2e\x60\x00\x4a\xb4\
-\x25\xa3\xe7\xf5\x6f\xc8\xe8\xbd\xfc\x57\x67\xf4\x79\x3b\xe3\xa2\
-\xd5\x87\xe6\xbb\x92\x2c\xcc\xe8\x85\x83\xb3\x1f\xfd\xcc\x78\xf4\
-\xd3\xdf\xc2\x79\x01\x40\x5d\xb6\x26\xd9\xf0\xe8\xe7\x91\x47\x3f\
-\xb7\x67\xf4\xa9\x7d\xcd\x7f\x29\x30\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x4c\x38\xff\x1f\x57\x81\xb1\x3f\x25\xe2\xca\x6b\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x01\xbc\x74\
-\x00\
-\x01\x00\x00\x00\x10\x01\x00\x00\x04\x00\x00\x44\x53\x49\x47\x00\
-\x00\x00\x01\x00\x01\x6d\x80\x00\x00\x00\x08\x47\x44\x45\x46\xfb\
-\x7b\x82\x2e\x00\x01\x6d\x88\x00\x00\x01\xfe\x47\x50\x4f\x53\x33\
-\x8b\x19\x6b\x00\x01\x86\x48\x00\x00\x2b\x2e\x47\x53\x55\x42\x09\
-\x41\xfc\x5c\x00\x01\x6f\x88\x00\x00\x16\xbe\x4f\x53\x2f\x32\x79\
-\x53\x50\xf0\x00\x00\x01\x88\x00\x00\x00\x60\x63\x6d\x61\x70\xf0\
-\xae\xd5\x71\x00\x00\x0d\xb0\x00\x00\x07\xbe\x67\x6c\x79\x66\xbc\
-\x79\x22\xae\x00\x00\x1b\x58\x00\x01\x25\x0c\x68\x65\x61\x64\x43\
-\x15\xa6\xb1\x00\x00\x01\x0c\x00\x00\x00\x36\x68\x68\x65\x61\x28\
-\xf7\x25\x20\x00\x00\x01\x44\x00\x00\x00\x24\x68\x6d\x74\x78\x27\
-\x20\x3b\x3b\x00\x00\x01\xe8\x00\x00\x0b\xc8\x6c\x6f\x63\x61\x52\
-\xdb\x0b\xd6\x00\x00\x15\x70\x00\x00\x05\xe6\x6d\x61\x78\x70\x03\
-\x8e\x03\x3b\x00\x00\x01\x68\x00\x00\x00\x20\x6e\x61\x6d\x65\xb5\
-\x75\xc3\xb4\x00\x01\x40\x64\x00\x00\x0b\xc8\x70\x6f\x73\x74\xa4\
-\x87\x51\x6e\x00\x01\x4c\x2c\x00\x00\x21\x52\x76\x68\x65\x61\x00\
-\xfb\x16\x20\x00\x01\xb1\x78\x00\x00\x00\x24\x76\x6d\x74\x78\xd0\
-\x6b\x0f\xd8\x00\x01\xb1\x9c\x00\x00\x0a\xd6\x00\x01\x00\x00\x00\
-\x01\x00\x00\xb6\xf8\x79\xe4\x5f\x0f\x3c\xf5\x00\x03\x03\xe8\x00\
-\x00\x00\x00\xdf\x9b\xb1\x5e\x00\x00\x00\x00\xdf\x9b\xb1\x5e\xff\
-\xc7\xfe\xf1\x25\x00\x04\x20\x00\x00\x00\x07\x00\x02\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x04\x2d\xfe\xdb\x00\x00\x25\x20\xff\
-\xc7\xfe\x32\x25\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\xf2\x00\x01\x00\x00\x02\xf2\x02\xa3\x00\
-\x25\x00\x76\x00\x07\x00\x01\x00\x02\x00\x1e\x00\x06\x00\x00\x00\
-\x64\x00\x00\x00\x03\x00\x03\x00\x04\x03\x08\x02\x58\x00\x05\x00\
-\x08\x02\x8a\x02\x58\x00\x00\x00\x4b\x02\x8a\x02\x58\x00\x00\x01\
-\x5e\x00\x32\x01\x04\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\
-\x00\x80\x00\x20\x43\x80\x01\x00\x48\x00\x00\x00\x08\x00\x00\x00\
-\x00\x42\x44\x46\x5a\x00\x40\x00\x20\xfe\xfc\x04\x2d\xfe\xdb\x00\
-\x00\x04\x2d\x01\x25\x00\x00\x00\x43\x00\x08\x00\x00\x02\x06\x02\
-\xcd\x00\x00\x00\x20\x00\x06\x02\x58\x00\x00\x00\xc8\x00\x00\x01\
-\xdd\x00\x3e\x00\xbd\x00\x00\x01\xdd\x00\x3e\x01\x16\x00\x56\x01\
-\x16\x00\x56\x01\x1f\x00\x56\x01\x16\x00\x56\x01\x2e\x00\x56\x01\
-\x16\x00\x28\x01\x16\x00\x28\x01\x2e\x00\x2b\x01\x16\x00\x33\x01\
-\x16\x00\x33\x01\x1f\x00\x49\x01\x16\x00\x02\x01\x16\x00\x02\x01\
-\x16\x00\x02\x01\x16\x00\x02\x01\x2e\x00\x05\x01\x2e\x00\x05\x01\
-\x16\xff\xfe\x01\x2e\x00\x01\x01\xc7\x00\x56\x01\xeb\x00\x56\x03\
-\x44\x00\x1e\x03\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x03\
-\x44\x00\x1e\x03\x44\x00\x1e\x03\x82\x00\x1e\x01\x70\xff\xec\x01\
-\x01\xff\xec\x03\x44\x00\x1e\x03\x44\x00\x1e\x03\x82\x00\x1e\x01\
-\x70\xff\xec\x01\x01\xff\xdc\x03\x44\x00\x1e\x03\x44\x00\x1e\x03\
-\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x03\x44\x00\x1e\x03\
-\x44\x00\x1e\x03\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x01\
-\x70\xff\xec\x01\x01\xff\xec\x03\x44\x00\x1e\x03\x44\x00\x1e\x03\
-\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xc7\x03\x44\x00\x1e\x03\
-\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xc7\x03\x44\x00\x1e\x03\
-\x44\x00\x1e\x03\x44\x00\x1e\x03\x82\x00\x1e\x01\x70\xff\xec\x01\
-\x01\xff\xcf\x03\x44\x00\x1e\x03\x44\x00\x1e\x03\x82\x00\x1e\x01\
-\x70\xff\xec\x01\x01\xff\xdc\x03\x44\x00\x1e\x03\x44\x00\x1e\x03\
-\x82\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x02\xaa\x00\x24\x02\
-\xaa\x00\x24\x02\xf2\x00\x47\x02\xc6\xff\xec\x02\x9b\xff\xec\x02\
-\xaa\x00\x24\x02\xaa\x00\x24\x02\xf2\x00\x47\x02\xc6\xff\xec\x02\
-\x9b\xff\xec\x02\xaa\x00\x24\x02\xaa\x00\x24\x02\xf2\x00\x47\x02\
-\xc6\xff\xec\x02\x9b\xff\xec\x02\xaa\x00\x24\x02\xaa\x00\x24\x02\
-\xaa\x00\x24\x02\xf2\x00\x47\x02\xc6\xff\xec\x02\x9b\xff\xec\x02\
-\xaa\x00\x24\x02\xaa\x00\x24\x02\xaa\x00\x24\x02\xaa\x00\x24\x02\
-\xf2\x00\x47\x02\xc6\xff\xec\x02\x9b\xff\xec\x01\xde\x00\x1e\x01\
-\xde\x00\x1e\x02\x43\x00\x30\x01\xde\x00\x1e\x01\xde\x00\x1e\x02\
-\x43\x00\x30\x01\xde\x00\x1e\x01\xde\x00\x1e\x02\x43\x00\x30\x01\
-\xde\x00\x1e\x01\x90\x00\x17\x01\x62\x00\x14\x01\x90\x00\x17\x01\
-\xeb\x00\x17\x01\xc0\x00\x18\x01\x90\x00\x17\x01\x90\x00\x17\x01\
-\xeb\x00\x17\x01\xc0\x00\x18\x01\x62\x00\x14\x01\x90\x00\x17\x01\
-\x62\x00\x0a\x01\x90\x00\x17\x01\x62\x00\x0a\x01\xeb\x00\x17\x01\
-\xc0\x00\x10\x01\x90\x00\x17\x01\x62\x00\x14\x01\x90\x00\x17\x01\
-\x62\x00\x14\x01\x90\x00\x17\x01\x62\xff\xfd\x01\x90\x00\x17\x01\
-\xeb\x00\x17\x01\xc0\x00\x03\x04\x4b\x00\x1e\x04\x4b\x00\x1e\x04\
-\x80\x00\x1e\x03\x46\xff\xec\x03\x00\xff\xec\x04\x4b\x00\x1e\x04\
-\x4b\x00\x1e\x04\x4b\x00\x1e\x04\x80\x00\x1e\x03\x46\xff\xec\x03\
-\x00\xff\xec\x04\x4b\x00\x1e\x04\x8d\x00\x1e\x04\x8d\x00\x1e\x04\
-\x9c\x00\x1e\x03\x32\xff\xec\x03\x30\xff\xec\x04\x8d\x00\x1e\x04\
-\x8d\x00\x1e\x04\x9c\x00\x1e\x03\x32\xff\xec\x03\x30\xff\xec\x03\
-\x0c\x00\x36\x03\x0c\x00\x36\x03\x4e\x00\x1e\x02\xba\xff\xec\x02\
-\x7c\xff\xec\x03\x0c\x00\x36\x03\x0c\x00\x36\x03\x4e\x00\x1e\x02\
-\xba\xff\xec\x02\x7c\xff\xec\x02\x53\x00\x1e\x02\x53\x00\x1e\x02\
-\x28\x00\x1e\x02\x09\xff\xec\x01\xe9\xff\xec\x02\x53\x00\x1e\x02\
-\x53\x00\x1e\x02\x28\x00\x1e\x02\x09\xff\xec\x01\xe9\xff\xec\x03\
-\x76\x00\x1e\x03\x76\x00\x1e\x03\x91\x00\x1e\x01\xde\xff\xec\x01\
-\xbb\xff\xec\x03\x76\x00\x1e\x03\x76\x00\x1e\x03\x91\x00\x1e\x01\
-\xde\xff\xec\x01\xbb\xff\xec\x03\x76\x00\x1e\x03\x91\x00\x1e\x01\
-\xde\xff\xec\x01\xbb\xff\xec\x03\x76\x00\x1e\x03\x76\x00\x1e\x02\
-\x9e\x00\x1e\x02\x9a\x00\x1e\x02\x9e\x00\x1e\x02\x9e\x00\x1e\x02\
-\x9a\x00\x1e\x01\xde\xff\xec\x01\xbb\xff\xec\x02\x9e\x00\x1e\x02\
-\x9e\x00\x1e\x03\x27\x00\x32\x04\xee\x00\x1e\x03\x27\x00\x32\x03\
-\x53\x00\x32\x05\x75\x00\x1e\x02\x19\xff\xec\x04\xb2\xff\xec\x01\
-\xd7\xff\xec\x04\x30\xff\xec\x03\x79\x00\x1e\x03\x79\x00\x1e\x03\
-\xaa\x00\x1e\x02\x19\xff\xec\x01\xd7\xff\xec\x03\x79\x00\x1e\x03\
-\x79\x00\x1e\x04\xee\x00\x1e\x03\x79\x00\x1e\x03\xaa\x00\x1e\x05\
-\x75\x00\x1e\x02\x19\xff\xec\x04\xb2\xff\xec\x01\xd7\xff\xec\x04\
-\x30\xff\xec\x03\x79\x00\x1e\x03\x27\x00\x32\x03\x27\x00\x32\x03\
-\x53\x00\x32\x02\x19\xff\xec\x01\xd7\xff\xec\x02\x91\x00\x1e\x02\
-\x91\x00\x1e\x02\xc9\x00\x1e\x01\x52\xff\xec\x01\x13\xff\xec\x02\
-\x1e\x00\x28\x02\x1e\x00\x28\x02\x4e\x00\x1e\x02\x65\xff\xec\x02\
-\x1b\xff\xec\x02\x7f\x00\x1e\x02\x7f\x00\x1e\x02\xed\x00\x23\x01\
-\x70\xff\xec\x01\x01\xff\xec\x02\x7f\x00\x1e\x02\x7f\x00\x1e\x02\
-\xed\x00\x23\x02\x7f\x00\x1e\x02\x01\x00\x3a\x02\x01\x00\x3a\x01\
-\xf7\x00\x2b\x01\xe2\xff\xec\x01\xe7\x00\x4b\x02\x87\xff\xec\x02\
-\x01\x00\x3a\x02\x01\x00\x3a\x01\xf7\x00\x2b\x02\x01\x00\x3a\x02\
-\x01\x00\x3a\x02\xb8\x00\x2e\x02\x34\xff\xec\x01\x01\xff\xec\x02\
-\x01\x00\x3a\x02\xb8\x00\x2e\x02\x34\xff\xec\x01\x01\xff\xec\x03\
-\x69\x00\x1e\x03\x69\x00\x1e\x02\x81\x00\x4f\x01\xe2\xff\xec\x02\
-\x87\xff\xec\x02\x01\x00\x3a\x02\x01\x00\x3a\x01\xf7\x00\x2b\x02\
-\x01\x00\x3a\x01\xf7\x00\x2b\x01\xe2\x00\x1f\x01\xe2\x00\x1f\x01\
-\xec\x00\x1e\x01\xe2\x00\x1f\x01\xe2\x00\x1f\x01\xec\x00\x1e\x01\
-\xe2\x00\x1f\x01\xe2\x00\x1f\x01\xec\x00\x1e\x01\xe2\x00\x1f\x01\
-\xe2\x00\x1f\x01\xec\x00\x1e\x01\xe2\x00\x1f\x01\xe2\x00\x1f\x01\
-\xec\x00\x1e\x01\xe2\x00\x1f\x01\xe2\x00\x1f\x01\xec\x00\x1e\x01\
-\xe2\x00\x1f\x01\xe2\x00\x1f\x01\xec\x00\x1e\x02\xcf\x00\x29\x02\
-\xcf\x00\x29\x03\x05\x00\x1e\x02\xcf\x00\x29\x02\xcf\x00\x29\x03\
-\x05\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xd9\x02\xcf\x00\x29\x02\
-\xcf\x00\x29\x03\x05\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x02\
-\xcf\x00\x29\x02\xcf\x00\x29\x03\x05\x00\x1e\x01\x70\xff\xec\x01\
-\x01\xff\xd9\x03\x3d\x00\x1f\x02\xcf\x00\x29\x02\xcf\x00\x29\x03\
-\x05\x00\x1e\x01\x70\xff\xec\x01\x01\xff\xec\x03\xa7\x00\x1c\x03\
-\xa7\x00\x1c\x02\x7a\x00\x1e\x03\xa7\x00\x1c\x03\xa7\x00\x1c\x02\
-\x7a\x00\x1e\x02\x01\x00\x3a\x01\xfe\x00\x32\x00\xda\xff\xec\x02\
-\x15\x00\x1e\x00\xda\xff\xec\x00\xda\xff\xec\x00\xda\xff\xec\x00\
-\xda\xff\xec\x00\xda\xff\xec\x00\xda\xff\xec\x00\xda\xff\xec\x00\
-\xda\xff\xec\x02\x2f\x00\x14\x02\x8e\x00\x1f\x02\x2f\x00\x08\x02\
-\x8e\x00\x12\x02\x2f\x00\x14\x02\x8e\x00\x1f\x02\x2f\xff\xdc\x02\
-\x8e\xff\xc9\x02\x2f\xff\xd4\x03\x43\x00\x1e\x03\x5b\x00\x17\x03\
-\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\xd5\xff\xec\x03\
-\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\xe3\xff\xec\x04\
-\x06\x00\x1e\x03\x43\x00\x1e\x04\x06\x00\x1e\x03\x4d\x00\x29\x04\
-\x06\x00\x1e\x03\x51\x00\x2c\x04\x18\x00\x1e\x04\x57\x00\x1e\x02\
-\x8e\xff\xd5\x03\x5b\x00\x17\x03\x5b\x00\x17\x03\x4f\x00\x1e\x03\
-\xbe\x00\x1e\x03\xd5\xff\xec\x03\x66\xff\xec\x04\x5d\x00\x23\x03\
-\x52\xff\xec\x02\xe3\xff\xec\x04\x06\x00\x1e\x03\x4d\x00\x29\x04\
-\x06\x00\x1e\x03\x4d\x00\x29\x04\x06\x00\x1e\x03\x56\x00\x2c\x03\
-\x5b\x00\x17\x03\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\
-\xd5\xff\xec\x03\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\
-\xe3\xff\xec\x04\x06\x00\x1e\x03\x4d\x00\x29\x04\x06\x00\x1e\x03\
-\x4d\x00\x29\x04\x06\x00\x1e\x03\x4f\x00\x28\x03\x5b\x00\x17\x03\
-\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\xd5\xff\xec\x03\
-\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\xe3\xff\xec\x04\
-\x06\x00\x1e\x03\x4d\x00\x29\x04\x06\x00\x1e\x03\x4d\x00\x29\x04\
-\x06\x00\x1e\x03\x4d\x00\x29\x05\xa0\x00\x1e\x05\xcb\x00\x1e\x05\
-\xcb\x00\x1e\x05\xa0\x00\x1e\x05\xcb\x00\x1e\x04\xec\x00\x17\x05\
-\x31\x00\x17\x05\x4e\x00\x1e\x05\xab\xff\xec\x05\x65\xff\xec\x05\
-\x28\xff\xec\x04\xe2\xff\xec\x05\x19\x00\x29\x05\x44\x00\x29\x05\
-\x19\x00\x29\x05\x44\x00\x29\x04\xeb\x00\x17\x05\x31\x00\x17\x05\
-\x94\x00\x1e\x05\x19\x00\x29\x05\x44\x00\x29\x04\xeb\x00\x17\x05\
-\x31\x00\x17\x04\xeb\x00\x17\x05\x31\x00\x17\x05\x4e\x00\x1e\x05\
-\x94\x00\x1e\x05\xab\xff\xec\x05\x65\xff\xec\x05\x28\xff\xec\x04\
-\xe2\xff\xec\x05\x19\x00\x29\x05\x44\x00\x29\x05\x19\x00\x29\x05\
-\x44\x00\x29\x05\x19\x00\x29\x05\x44\x00\x29\x05\x1b\x00\x17\x05\
-\x1d\x00\x17\x05\x1b\x00\x17\x05\x1d\x00\x17\x05\x7e\x00\x1e\x05\
-\x97\xff\xec\x05\x94\xff\xec\x05\x14\xff\xec\x05\x12\xff\xec\x05\
-\x93\x00\x29\x05\x96\x00\x29\x05\x93\x00\x29\x05\x96\x00\x29\x05\
-\x93\x00\x29\x05\x96\x00\x29\x05\x1b\x00\x17\x05\x1d\x00\x17\x05\
-\x1b\x00\x17\x05\x1d\x00\x17\x05\x7e\x00\x1e\x05\x97\xff\xec\x05\
-\x95\xff\xec\x05\x14\xff\xec\x05\x12\xff\xec\x05\x93\x00\x29\x05\
-\x96\x00\x29\x05\x93\x00\x29\x05\x96\x00\x29\x05\x93\x00\x29\x05\
-\x96\x00\x29\x04\xc0\x00\x1e\x04\xc0\x00\x1e\x04\xc0\x00\x1e\x04\
-\xc0\x00\x1e\x04\xc0\x00\x1e\x04\xc0\x00\x1e\x04\xdc\x00\x1e\x05\
-\x1d\x00\x1e\x04\xdc\x00\x1e\x05\x1e\x00\x1e\x04\xdc\x00\x1e\x05\
-\x1e\x00\x1e\x04\xdc\x00\x1e\x04\xdc\x00\x1e\x05\x1e\x00\x1e\x04\
-\xdc\x00\x1e\x05\x1e\x00\x1e\x04\xdc\x00\x1e\x05\x1e\x00\x1e\x04\
-\xd1\x00\x1e\x04\xd1\x00\x1e\x04\xd1\x00\x1e\x04\xd1\x00\x1e\x03\
-\x61\x00\x1e\x03\x78\xff\xec\x04\xd1\x00\x1e\x04\xd1\x00\x1e\x04\
-\x18\x00\x1e\x04\x57\x00\x1e\x04\xd1\x00\x1e\x04\x18\x00\x1e\x04\
-\x57\x00\x1e\x04\xd1\x00\x1e\x04\x50\x00\x17\x04\x50\x00\x17\x03\
-\x5b\x00\x17\x03\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\
-\xd5\xff\xec\x03\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\
-\xe3\xff\xec\x04\x06\x00\x1e\x03\x43\x00\x1e\x04\x06\x00\x1e\x03\
-\x43\x00\x1e\x04\x06\x00\x1e\x03\x43\x00\x1e\x03\x5b\x00\x17\x03\
-\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\xd4\xff\xec\x03\
-\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\xe3\xff\xec\x03\
-\x5b\x00\x17\x03\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\
-\xd5\xff\xec\x03\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\
-\xe3\xff\xec\x02\x20\x00\x56\x02\x8f\x00\x56\x03\x5b\x00\x17\x03\
-\x5b\x00\x17\x03\x4f\x00\x1e\x03\xbe\x00\x1e\x03\xd5\xff\xec\x03\
-\x66\xff\xec\x04\x5d\x00\x23\x03\x52\xff\xec\x02\xe3\xff\xec\x02\
-\xed\x00\x1e\x03\x5c\x00\x1e\x02\xed\x00\x1e\x03\x5c\x00\x1e\x02\
-\xed\x00\x1e\x03\x5c\x00\x1e\x02\xed\x00\x1e\x03\x5c\x00\x1e\x04\
-\x06\x00\x1e\x03\x43\x00\x1e\x04\x06\x00\x1e\x04\x75\x00\x1e\x04\
-\x06\x00\x1e\x03\x43\x00\x1e\x04\x06\x00\x1e\x03\x43\x00\x1e\x02\
-\x71\xff\xec\x04\x06\x00\x1e\x03\x43\x00\x1e\x02\x71\xff\xec\x05\
-\x5e\x00\x2b\x04\x66\x00\x28\x06\xf2\x00\x3a\x01\x27\x00\x4d\x01\
-\x27\x00\x3c\x01\x77\x00\x5a\x01\x1c\x00\x4a\x02\x10\x00\x48\x02\
-\xd5\x00\x46\x01\xe9\x00\x3f\x02\x20\x00\x38\x02\x5a\x00\x2c\x02\
-\x49\x00\x1e\x02\x49\x00\x1a\x02\x2f\x00\x3a\x01\x93\x00\x37\x01\
-\x1c\x00\x4a\x02\x10\x00\x48\x02\xd5\x00\x46\x02\x5e\x00\x4a\x02\
-\x3b\x00\x28\x02\x37\x00\x1e\x02\x49\x00\x1e\x02\x49\x00\x1a\x02\
-\x2f\x00\x3a\x02\x5e\x00\x4a\x02\x49\x00\x1e\x02\x4f\x00\x36\x01\
-\xbb\x00\x2e\x02\x3c\x00\x35\x02\x4a\x00\x2e\x02\x2f\x00\x20\x02\
-\x53\x00\x2d\x02\x56\x00\x31\x02\x2e\x00\x32\x02\x64\x00\x34\x02\
-\x56\x00\x31\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x01\x0e\x00\x00\x01\xf4\x00\x00\x03\xe8\x00\x00\x02\
-\x3a\x00\x00\x00\x50\x00\x00\x00\xc8\x00\x00\x00\xea\x00\x00\x00\
-\xfc\x00\x00\x02\x66\x00\x46\x01\x27\x00\x3c\x01\x25\x00\x46\x01\
-\xf0\x00\x2b\x05\x7a\x00\x1e\x01\xed\x00\x21\x06\xf2\x00\x24\x05\
-\x08\x00\x1e\x06\x2a\x00\x1e\x01\xcb\x00\x15\x03\xe9\x00\x14\x02\
-\x58\xff\xd2\x05\x43\x00\x1e\x01\xab\x00\x44\x01\xab\x00\x1e\x01\
-\x24\x00\x43\x01\x12\x00\x3d\x01\x45\x00\x55\x01\x45\x00\x55\x01\
-\xf3\x00\xaa\x01\xaf\x00\x1c\x01\xb5\x00\x16\x01\xb5\x00\x16\x02\
-\x9a\x00\x57\x02\x1e\x00\x71\x03\x20\x00\x3f\x01\xfc\x00\x42\x02\
-\x1f\x00\x02\x01\x4d\x00\x72\x01\x4d\x00\x06\x00\xd6\x00\x03\x01\
-\x9e\x00\x1d\x01\x9e\x00\x03\x02\x58\x00\x00\x08\x00\x00\x24\x25\
-\x20\x00\x1e\x02\x8e\x00\x2b\x03\x80\x00\x2b\x03\x27\x00\x14\x01\
-\xe6\x00\x21\x03\x68\x00\x0b\x01\x67\x00\x20\x00\xd6\x00\x1d\x01\
-\x9e\x00\x1d\x04\x5e\x00\x51\x02\x7e\x00\x33\x02\x6e\x00\x25\x02\
-\x8e\x00\x04\x01\x48\x00\x55\x00\x00\x00\x00\x00\x00\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x0c\x00\x00\xff\xff\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xfb\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xfd\x00\x00\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x04\x00\x00\x00\x03\x00\x00\x00\x03\x00\x00\x00\x06\x00\
-\x00\x00\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf9\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xfc\x00\x00\xff\xfd\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf3\x00\
-\x00\xff\xfb\x00\x00\xff\xfb\x00\x00\x00\x00\x00\x00\x00\x08\x00\
-\x00\x00\x0f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x02\x00\
-\x00\xff\xfe\x00\x00\xff\xf6\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xfc\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xb6\x00\x00\x00\
-\xd7\x00\x00\x00\xfd\x00\x00\x00\xd7\x00\x00\x00\xd6\x00\x00\x00\
-\xc0\x00\x02\x00\xcf\x00\x02\x00\x9c\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x14\x00\x03\x00\x01\x00\
-\x00\x00\x14\x00\x04\x07\xaa\x00\x00\x00\xfc\x00\x80\x00\x06\x00\
-\x7c\x00\x21\x00\x2c\x00\x2f\x00\x39\x00\x3a\x00\x5f\x00\xa0\x00\
-\xa4\x00\xa9\x00\xae\x00\xb0\x00\xb7\x03\x4f\x06\x04\x06\x09\x06\
-\x15\x06\x1c\x06\x1f\x06\x3a\x06\x4a\x06\x51\x06\x58\x06\x5b\x06\
-\x69\x06\x71\x06\x74\x06\x7e\x06\x81\x06\x89\x06\x91\x06\x93\x06\
-\x96\x06\x98\x06\x9a\x06\x9c\x06\xa2\x06\xa5\x06\xa9\x06\xab\x06\
-\xad\x06\xaf\x06\xba\x06\xbc\x06\xc3\x06\xc9\x06\xcd\x06\xd0\x06\
-\xd5\x06\xdd\x06\xe0\x06\xe4\x06\xf9\x07\x63\x20\x03\x20\x07\x20\
-\x0a\x20\x10\x20\x16\x20\x25\x20\x33\x20\x35\x21\x16\x21\x22\x22\
-\x1a\x22\x36\x30\x03\x30\x1e\xfb\x59\xfb\x61\xfb\x6d\xfb\x7d\xfb\
-\x95\xfb\x9f\xfb\xb1\xfb\xbb\xfb\xdc\xfb\xdf\xfb\xeb\xfb\xf5\xfb\
-\xfb\xfb\xff\xfc\x04\xfc\x0a\xfc\x10\xfc\x14\xfc\x1f\xfc\x21\xfc\
-\x25\xfc\x32\xfc\x36\xfc\x3e\xfc\x44\xfc\x50\xfc\x58\xfc\x63\xfc\
-\x7b\xfc\x84\xfc\x87\xfc\x8f\xfc\x94\xfc\x9b\xfc\xa0\xfc\xa6\xfc\
-\xb0\xfc\xb3\xfc\xb7\xfc\xcc\xfc\xd6\xfc\xea\xfc\xf1\xfc\xf4\xfc\
-\xfe\xfd\x03\xfd\x08\xfd\x10\xfd\x1a\xfd\x24\xfd\x2c\xfd\x32\xfd\
-\x3f\xfd\xf2\xfd\xfb\xfd\xfd\xfe\x74\xfe\xfc\xff\xff\x00\x00\x00\
-\x20\x00\x2c\x00\x2e\x00\x30\x00\x3a\x00\x5b\x00\xa0\x00\xa4\x00\
-\xa9\x00\xae\x00\xb0\x00\xb7\x03\x4f\x06\x00\x06\x09\x06\x0c\x06\
-\x1b\x06\x1f\x06\x21\x06\x40\x06\x4b\x06\x52\x06\x5a\x06\x60\x06\
-\x6a\x06\x74\x06\x79\x06\x80\x06\x85\x06\x91\x06\x93\x06\x96\x06\
-\x98\x06\x9a\x06\x9c\x06\xa1\x06\xa4\x06\xa7\x06\xab\x06\xad\x06\
-\xaf\x06\xba\x06\xbc\x06\xbe\x06\xc6\x06\xcb\x06\xd0\x06\xd2\x06\
-\xdd\x06\xe0\x06\xe4\x06\xf0\x07\x63\x20\x02\x20\x07\x20\x0a\x20\
-\x0c\x20\x15\x20\x25\x20\x32\x20\x35\x21\x16\x21\x22\x22\x1a\x22\
-\x36\x30\x03\x30\x1d\xfb\x51\xfb\x5e\xfb\x66\xfb\x7a\xfb\x88\xfb\
-\x9e\xfb\xa4\xfb\xba\xfb\xd3\xfb\xde\xfb\xe2\xfb\xee\xfb\xf6\xfb\
-\xfc\xfc\x02\xfc\x08\xfc\x0e\xfc\x12\xfc\x1f\xfc\x21\xfc\x25\xfc\
-\x31\xfc\x35\xfc\x3d\xfc\x42\xfc\x4e\xfc\x58\xfc\x5e\xfc\x64\xfc\
-\x83\xfc\x86\xfc\x8a\xfc\x91\xfc\x9a\xfc\x9f\xfc\xa4\xfc\xb0\xfc\
-\xb3\xfc\xb7\xfc\xcc\xfc\xd5\xfc\xdd\xfc\xee\xfc\xf3\xfc\xfb\xfd\
-\x03\xfd\x05\xfd\x0c\xfd\x17\xfd\x1f\xfd\x28\xfd\x30\xfd\x3c\xfd\
-\xf2\xfd\xfa\xfd\xfd\xfe\x70\xfe\x76\xff\xff\x00\x00\x02\x5f\x00\
-\x00\x02\x35\x02\x52\x00\x00\x01\xd3\x02\x04\x01\xf8\x01\xf4\x01\
-\xf4\x01\xd7\xff\xa2\x00\x00\xfc\x97\x00\x00\x00\x00\xfc\x5f\x00\
-\x00\x00\x00\xfc\x88\x00\x00\xfc\x8b\xfb\xef\x00\x00\xf9\x8f\x00\
-\x00\x00\x00\x00\x00\xf9\xec\xf9\xf0\xf9\xef\xf9\xef\xf9\xf7\xf9\
-\xfb\x00\x00\x00\x00\x00\x00\xfa\x3c\xfa\x3b\xfa\x2f\xfa\x42\xfa\
-\x43\x00\x00\x00\x00\x00\x00\xfa\x74\x00\x00\xfb\xaa\xfc\x07\xfc\
-\x04\xfb\x69\xf9\x7a\xe2\x72\xe2\x6f\xe2\x6d\x00\x00\x00\x00\xe2\
-\x6d\xe2\x73\xe2\x64\xe1\x91\xe1\x81\xe0\x90\xe0\x75\xd2\x8c\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x5f\x00\x00\x06\
-\xbf\x00\x00\x05\x51\x00\x00\x00\x00\x06\x4e\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x05\x8c\x05\xac\x05\xb7\x05\xb6\x05\xb5\x00\
-\x00\x00\x00\x00\x00\x05\xcc\x06\x7d\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\xfd\x05\x1c\x05\x27\x05\
-\x33\x00\x00\x00\x00\x00\x00\x04\x65\x00\x00\x04\xa1\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x58\x04\x51\x04\
-\xa1\x00\x00\x00\x00\x00\x01\x00\xfc\x00\x00\x00\xfc\x00\x00\x00\
-\x00\x00\xfa\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\xf4\x00\x00\x00\xfa\x01\x0c\x00\x00\x01\x0c\x01\x3e\x00\
-\x00\x01\x50\x00\x00\x00\x00\x01\x58\x00\x00\x01\x64\x01\x6e\x01\
-\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x6c\x01\
-\x6e\x01\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x6a\x01\
-\x74\x01\x7a\x00\x00\x01\x7c\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x01\x72\x01\x7a\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x6c\x01\x6e\x01\
-\x7e\x01\x84\x01\x92\x01\x98\x00\x00\x01\xb0\x00\x00\x01\xc8\x00\
-\x00\x01\xd8\x01\xea\x00\x00\x01\xf6\x01\xfc\x02\x00\x02\x04\x02\
-\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x02\x02\x04\x02\
-\x08\x00\x00\x00\x00\x02\x08\x02\x36\x02\x38\x02\x3a\x02\x44\x02\
-\x4a\x02\x4c\x02\x4e\x00\x00\x00\x00\x00\x00\x00\x00\x02\x4a\x02\
-\x4c\x02\x66\x00\x00\x02\x6a\x00\x00\x02\x6e\x02\x74\x02\x7c\x02\
-\x82\x02\x8c\x02\x94\x02\x98\x00\x00\x00\x00\x00\x00\x02\x98\x02\
-\xa0\x00\x00\x00\x01\x02\x8d\x02\x8a\x02\x90\x02\x97\x02\x91\x02\
-\x98\x02\xa9\x02\x96\x02\x7f\x02\x81\x02\x82\x02\x83\x02\x9d\x02\
-\x7c\x02\x84\x02\x85\x02\x86\x02\xaf\x02\xb0\x02\xad\x02\xae\x02\
-\xb1\x02\xb2\x02\x7d\x02\x9c\x00\x02\x00\x10\x00\x0a\x01\x1f\x00\
-\x0d\x01\x39\x00\x05\x00\x1e\x01\x17\x00\x34\x00\x3e\x00\x4d\x00\
-\x5d\x00\x64\x00\x69\x00\x6c\x00\x73\x00\x78\x00\x8c\x00\x92\x00\
-\x98\x00\x9d\x00\xa2\x00\xa7\x00\xac\x00\xb1\x01\x54\x00\xb6\x00\
-\xc8\x00\xcf\x00\xed\x00\xf2\x00\xf7\x01\x00\x01\x1c\x01\x31\x01\
-\x34\x02\xe1\x02\xe2\x02\xca\x02\xcb\x02\xc9\x02\xe4\x02\xe3\x02\
-\x9f\x02\x4d\x02\x4e\x02\x80\x00\x1a\x00\xc6\x02\xc8\x00\x16\x00\
-\x43\x00\x48\x00\x28\x00\x39\x00\x3d\x00\x23\x00\x2d\x00\x62\x00\
-\x63\x00\x52\x00\x57\x00\x6f\x00\x72\x00\xc0\x00\xc4\x00\xbb\x00\
-\xc5\x00\xcd\x00\xce\x00\xd8\x01\x12\x00\x5c\x01\x06\x01\x09\x01\
-\x0e\x01\x1a\x01\x22\x01\x25\x01\x28\x01\x2b\x01\x2e\x01\x3e\x01\
-\x43\x01\x49\x01\x4c\x02\x7b\x01\x4f\x02\x6f\x02\x70\x02\x71\x02\
-\x72\x02\x95\x02\x94\x02\x93\x02\x9b\x02\x9a\x00\x17\x00\x29\x00\
-\x2a\x00\x2c\x00\x2b\x00\x24\x00\x25\x00\x27\x00\x26\x00\x49\x00\
-\x4a\x00\x4c\x00\x4b\x00\x44\x00\x45\x00\x47\x00\x46\x00\xbc\x00\
-\xbd\x00\xbf\x00\xbe\x00\x53\x00\x54\x00\x56\x00\x55\x00\x70\x00\
-\x71\x00\x89\x00\x8a\x00\x7f\x00\x82\x00\xd9\x00\xda\x00\xdc\x00\
-\xdb\x00\xe0\x00\xe1\x00\xe5\x00\xe3\x01\x07\x01\x08\x01\x0a\x01\
-\x0b\x01\x0d\x01\x0c\x01\x13\x01\x14\x01\x16\x01\x15\x01\x4a\x01\
-\x4b\x01\x4d\x01\x4e\x00\xe9\x00\xea\x00\xec\x00\xeb\x01\x26\x01\
-\x27\x01\x23\x01\x24\x01\x29\x01\x2a\x01\x2c\x01\x2d\x01\x45\x01\
-\x46\x01\x48\x01\x47\x00\x33\x00\x32\x02\x2b\x02\x2c\x02\x36\x02\
-\x37\x02\x3a\x02\x3b\x02\x38\x02\x39\x02\x3c\x02\x3d\x01\x3f\x01\
-\x40\x01\x42\x01\x41\x02\x2f\x02\x3e\x02\x40\x01\x67\x01\x6e\x01\
-\x70\x01\x88\x01\x8f\x01\x91\x01\x97\x01\x9e\x01\xa0\x01\xed\x01\
-\xef\x01\xfe\x01\x74\x02\x02\x02\x0c\x02\x13\x02\x15\x02\x2d\x02\
-\x2e\x02\x30\x02\x33\x02\x3f\x02\x41\x01\x65\x01\x66\x01\x68\x01\
-\x6b\x01\x6f\x01\x71\x01\x86\x01\x87\x01\x89\x01\x8c\x01\x90\x01\
-\x92\x01\x95\x01\x96\x01\x98\x01\x9b\x01\x9f\x01\xa1\x01\xee\x01\
-\xf0\x01\x75\x02\x03\x02\x0a\x02\x0b\x02\x0d\x02\x10\x02\x14\x02\
-\x16\x02\x22\x02\x23\x02\x25\x02\x28\x02\x32\x02\x35\x01\x6a\x01\
-\x6d\x01\x8b\x01\x8e\x01\x9a\x02\x0f\x02\x12\x02\x27\x02\x2a\x02\
-\x31\x02\x34\x01\x69\x01\x6c\x01\x8a\x01\x8d\x01\x99\x01\x9c\x01\
-\xac\x01\xae\x01\xbf\x01\xc1\x02\x0e\x02\x11\x02\x26\x02\x29\x01\
-\xb0\x01\xb2\x01\xc3\x01\xc5\x01\xd2\x01\xd4\x01\xe1\x01\xe3\x01\
-\xbd\x01\xb9\x01\xa9\x01\xc9\x01\xd8\x01\xb1\x01\xb3\x01\xc4\x01\
-\xc6\x01\xa5\x01\xa6\x01\xd3\x01\xd5\x01\xe2\x01\xe4\x01\xbe\x01\
-\xba\x01\xaa\x01\xca\x01\xd9\x01\xc0\x01\xaf\x01\xc2\x00\x19\x00\
-\x18\x02\x88\x02\x89\x02\xea\x01\x51\x02\xeb\x01\x52\x02\xec\x02\
-\xed\x01\x55\x02\xee\x01\x56\x02\xe9\x01\x53\x02\xef\x01\x57\x02\
-\xf0\x01\x5a\x00\x04\x00\x13\x00\x15\x00\x0b\x00\x0c\x01\x20\x01\
-\x21\x00\x0e\x00\x0f\x01\x3a\x01\x3b\x01\x3d\x01\x3c\x00\x06\x00\
-\x07\x00\x1f\x00\x20\x00\x22\x00\x21\x01\x18\x01\x19\x00\x35\x00\
-\x36\x00\x38\x00\x37\x00\x3f\x00\x40\x00\x42\x00\x41\x00\x4e\x00\
-\x4f\x00\x51\x00\x50\x00\x5e\x00\x5f\x00\x61\x00\x60\x00\x65\x00\
-\x66\x00\x68\x00\x67\x00\x6a\x00\x6b\x00\x6d\x00\x6e\x00\x75\x00\
-\x76\x00\x79\x00\x7a\x00\x8d\x00\x8e\x00\x90\x00\x8f\x00\x93\x00\
-\x94\x00\x96\x00\x95\x00\x99\x00\x9a\x00\x9c\x00\x9b\x00\x9e\x00\
-\x9f\x00\xa1\x00\xa0\x00\xa3\x00\xa4\x00\xa6\x00\xa5\x00\xa8\x00\
-\xa9\x00\xab\x00\xaa\x00\xad\x00\xae\x00\xb0\x00\xaf\x00\xb2\x00\
-\xb3\x00\xb5\x00\xb4\x00\xb7\x00\xb8\x00\xba\x00\xb9\x00\xc9\x00\
-\xca\x00\xcc\x00\xcb\x00\xd1\x00\xd2\x00\xd6\x00\xd4\x00\xee\x00\
-\xef\x00\xf1\x00\xf0\x00\xf3\x00\xf4\x00\xf6\x00\xf5\x00\xf8\x00\
-\xf9\x00\xfb\x00\xfa\x01\x01\x01\x02\x01\x05\x01\x03\x01\x1d\x01\
-\x1e\x01\x32\x01\x33\x01\x35\x01\x36\x01\x38\x01\x37\x01\x61\x01\
-\x62\x01\x5d\x01\x5e\x01\x5f\x01\x60\x01\x5b\x01\x5c\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x2c\x00\x52\x00\x5a\x00\x68\x00\x76\x00\
-\x96\x00\xa4\x00\xc2\x00\xce\x00\xda\x00\xe6\x00\xf2\x00\xfe\x01\
-\x0a\x01\x16\x01\x22\x01\x2a\x01\x32\x01\x3e\x01\x4a\x01\x56\x01\
-\x62\x01\x7e\x01\xac\x01\xd6\x02\x12\x02\x46\x02\x68\x02\x74\x02\
-\x80\x02\x8c\x02\x98\x02\xa4\x02\xb0\x02\xbc\x02\xc8\x02\xd4\x02\
-\xe0\x02\xec\x02\xf4\x03\x00\x03\x0c\x03\x18\x03\x24\x03\x2c\x03\
-\x38\x03\x44\x03\x50\x03\x58\x03\x60\x03\x6c\x03\x78\x03\x84\x03\
-\x90\x03\x9c\x03\xf4\x04\x5c\x04\xbe\x05\x10\x05\x1c\x05\x28\x05\
-\x34\x05\x40\x05\x4c\x05\x58\x05\x64\x05\x6c\x05\x78\x05\x84\x05\
-\x90\x05\x9c\x05\xa4\x05\xb0\x05\xbc\x05\xc8\x05\xd4\x05\xe0\x05\
-\xec\x05\xf8\x06\x04\x06\x10\x06\x18\x06\x24\x06\x30\x06\x3c\x06\
-\x48\x06\x50\x06\x5c\x06\x68\x06\x74\x06\x84\x06\xc2\x07\x00\x07\
-\x4c\x07\x90\x07\xc6\x07\xd2\x07\xde\x07\xea\x07\xf6\x08\x02\x08\
-\x0e\x08\x1a\x08\x3a\x08\x42\x08\x74\x08\x80\x08\x8c\x08\x98\x08\
-\xa4\x08\xb0\x08\xbc\x08\xf8\x09\x18\x09\x3a\x09\x42\x09\x74\x09\
-\xa2\x09\xae\x09\xba\x09\xc6\x09\xd2\x09\xde\x09\xea\x09\xf6\x0a\
-\x02\x0a\x0e\x0a\x1a\x0a\x26\x0a\x64\x0a\xa4\x0a\xb4\x0a\xc4\x0a\
-\xd0\x0a\xdc\x0a\xe4\x0a\xf0\x0a\xfc\x0b\x50\x0b\x58\x0b\xba\x0c\
-\x16\x0c\x64\x0c\x74\x0c\x80\x0c\x8c\x0c\x98\x0c\xa4\x0c\xb0\x0c\
-\xbc\x0d\x02\x0d\x0a\x0d\x60\x0d\xb2\x0d\xf6\x0e\x02\x0e\x0e\x0e\
-\x1a\x0e\x26\x0e\x32\x0e\x62\x0e\x92\x0e\xd0\x0f\x14\x0f\x4a\x0f\
-\x56\x0f\x62\x0f\x6e\x0f\x7a\x0f\x86\x0f\xc6\x10\x06\x10\x58\x10\
-\x9e\x10\xd0\x10\xdc\x10\xe8\x10\xf4\x11\x00\x11\x0c\x11\x18\x11\
-\x24\x11\x30\x11\x3c\x11\x48\x11\x54\x11\x5c\x11\x68\x11\x74\x11\
-\x80\x11\xc8\x12\x1a\x12\x60\x12\xa0\x12\xac\x12\xb8\x13\x00\x13\
-\x48\x13\x54\x13\x60\x13\x6c\x13\x78\x13\x84\x13\x90\x13\x9c\x13\
-\xe4\x14\x24\x14\x6c\x14\xc6\x15\x14\x15\x4c\x15\x9e\x15\xc8\x16\
-\x0e\x16\x44\x16\x4c\x16\x92\x16\x9a\x16\xa2\x16\xae\x16\xba\x16\
-\xc6\x16\xce\x16\xda\x16\xe6\x16\xf2\x16\xfe\x17\x0a\x17\x16\x17\
-\x68\x17\x74\x17\x7c\x17\x88\x17\x94\x17\xa0\x17\xc4\x17\xe8\x18\
-\x1c\x18\x46\x18\x62\x18\x98\x18\xce\x19\x0e\x19\x58\x19\x92\x19\
-\x9e\x19\xaa\x19\xb6\x19\xc2\x19\xce\x19\xfa\x1a\x02\x1a\x3c\x1a\
-\x8c\x1a\xbc\x1a\xc4\x1a\xf8\x1b\x48\x1b\x92\x1b\xe4\x1b\xf0\x1b\
-\xf8\x1c\x04\x1c\x0c\x1c\x14\x1c\x3e\x1c\x78\x1c\x84\x1c\xd4\x1c\
-\xe0\x1c\xec\x1c\xf8\x1d\x44\x1d\x4c\x1d\x9c\x1d\xa4\x1d\xac\x1d\
-\xb8\x1d\xc4\x1d\xd0\x1d\xd8\x1d\xe0\x1e\x1a\x1e\x54\x1e\x90\x1e\
-\x9c\x1e\xa8\x1e\xb4\x1e\xc0\x1e\xc8\x1e\xd4\x1e\xe0\x1e\xe8\x1e\
-\xf4\x1f\x00\x1f\x08\x1f\x14\x1f\x20\x1f\x28\x1f\x34\x1f\x40\x1f\
-\x48\x1f\x54\x1f\xa2\x1f\xaa\x1f\xe8\x1f\xf4\x20\x00\x20\x0c\x20\
-\x18\x20\x24\x20\x30\x20\x3c\x20\x48\x20\x54\x20\x60\x20\x68\x20\
-\x70\x20\x78\x20\x80\x20\x88\x20\xd8\x20\xe4\x20\xf0\x20\xfc\x21\
-\x04\x21\x0c\x21\x42\x21\x4a\x21\x7c\x21\x88\x21\x90\x21\x9c\x21\
-\xa4\x21\xd8\x21\xe4\x22\x0a\x22\x16\x22\x2e\x22\x3a\x22\x46\x22\
-\x52\x22\x5e\x22\x6a\x22\x76\x22\xa8\x22\xe2\x22\xee\x22\xfa\x23\
-\x06\x23\x12\x23\x1e\x23\x2a\x23\x36\x23\x8c\x23\xe0\x24\x3e\x24\
-\x90\x24\xf2\x25\x5e\x25\xba\x26\x20\x26\x94\x26\xf6\x27\x46\x27\
-\x52\x27\xb0\x27\xbc\x28\x2c\x28\x38\x28\x7a\x28\xca\x28\xd6\x29\
-\x38\x29\xa4\x2a\x04\x2a\x74\x2a\xee\x2b\x58\x2b\xcc\x2c\x4e\x2c\
-\xbe\x2d\x1c\x2d\x28\x2d\x94\x2d\xa0\x2e\x1e\x2e\x2a\x2e\x86\x2e\
-\xea\x2f\x44\x2f\xae\x30\x22\x30\x84\x30\xf0\x31\x6a\x31\xd4\x32\
-\x2a\x32\x36\x32\x9c\x32\xa8\x33\x20\x33\x2c\x33\x90\x33\xfc\x34\
-\x5c\x34\xcc\x35\x46\x35\xb0\x36\x22\x36\xa4\x37\x16\x37\x74\x37\
-\x80\x37\xec\x37\xf8\x38\x76\x38\x82\x38\xe4\x39\x56\x39\xd6\x3a\
-\x5a\x3a\xec\x3b\x54\x3b\xca\x3c\x40\x3c\xcc\x3d\x4a\x3d\xde\x3e\
-\x64\x3e\xd8\x3f\x5a\x3f\x66\x3f\x72\x3f\xe2\x40\x60\x40\xe4\x40\
-\xf0\x40\xfc\x41\x7a\x42\x06\x42\x8c\x43\x20\x43\xac\x44\x46\x44\
-\xe8\x45\x7c\x46\x26\x46\xc2\x46\xce\x46\xda\x46\xea\x46\xfa\x47\
-\x0a\x47\xc2\x48\x20\x48\x8c\x48\xf2\x49\x66\x49\xd2\x4a\x54\x4a\
-\xc8\x4b\x52\x4b\xcc\x4c\x36\x4c\xb0\x4c\xbc\x4c\xc8\x4c\xd4\x4c\
-\xe0\x4d\x46\x4d\xba\x4e\x28\x4e\xa4\x4f\x18\x4f\xa2\x50\x1e\x50\
-\xb0\x51\x32\x51\x3e\x51\x4a\x51\x5a\x51\x6a\x51\x7a\x51\x8a\x51\
-\xf8\x52\x74\x53\x02\x53\x78\x53\xfc\x54\x92\x54\xe0\x55\x3e\x55\
-\x9a\x56\x06\x56\x74\x56\xf2\x57\x4e\x57\xa4\x58\x0a\x58\x6e\x58\
-\xe2\x59\x58\x59\xde\x5a\x44\x5a\xb8\x5b\x26\x5b\x9c\x5b\xe0\x5c\
-\x2e\x5c\x96\x5c\xf6\x5d\x46\x5d\xa4\x5e\x10\x5e\x72\x5e\xe2\x5f\
-\x62\x5f\xc6\x60\x32\x60\x88\x60\xe6\x61\x38\x61\x9a\x62\x06\x62\
-\x62\x62\xc6\x63\x3a\x63\x9e\x63\xee\x63\xfa\x64\x58\x64\x64\x64\
-\xd4\x64\xe0\x65\x2e\x65\x84\x65\xce\x66\x28\x66\x8c\x66\xe0\x67\
-\x3e\x67\xaa\x68\x06\x68\x60\x68\xc4\x69\x1c\x69\x84\x69\xf6\x6a\
-\x58\x6a\xc4\x6b\x3e\x6b\xa6\x6b\xf0\x6c\x4a\x6c\xb8\x6d\x2e\x6d\
-\x98\x6e\x12\x6e\x96\x6f\x0a\x6f\x86\x70\x12\x70\x8e\x70\xf6\x71\
-\x6e\x71\xe2\x72\x66\x72\xf0\x73\x8c\x73\xfa\x74\x78\x74\xe0\x74\
-\xe8\x75\x5e\x75\xe4\x76\x6c\x76\x78\x76\xee\x76\xfa\x77\x66\x77\
-\xce\x77\xda\x78\x38\x78\xbe\x7a\xe0\x7c\x2a\x7c\x46\x7c\x4e\x7c\
-\x5c\x7c\x70\x7c\x9c\x7c\xd8\x7d\x12\x7d\x40\x7d\x60\x7d\x80\x7d\
-\xa0\x7d\xd8\x7e\x04\x7e\x0c\x7e\x14\x7e\x1c\x7e\x56\x7e\x94\x7e\
-\xc2\x7e\xca\x7e\xea\x7e\xf2\x7e\xfa\x7f\x02\x7f\x34\x7f\x48\x7f\
-\x7c\x7f\xc0\x7f\xde\x80\x14\x80\x54\x80\x68\x80\xbc\x80\xfc\x80\
-\xfc\x80\xfc\x80\xfc\x80\xfc\x80\xfc\x80\xfc\x80\xfc\x80\xfc\x80\
-\xfc\x80\xfc\x81\x1c\x81\x24\x81\x38\x81\x54\x81\x80\x81\xba\x81\
-\xe8\x82\x06\x82\x42\x82\x72\x82\xb2\x82\xc4\x82\xfa\x83\x50\x84\
-\x16\x84\x5a\x84\x9e\x84\xb4\x84\xd0\x84\xf6\x85\x12\x85\x2a\x85\
-\x40\x85\x50\x85\x5e\x85\x84\x85\x98\x85\xa6\x85\xb4\x85\xc2\x85\
-\xd4\x85\xe6\x85\xf4\x86\x08\x86\x1e\x86\x1e\x86\x80\x8a\x36\x8a\
-\x5c\x8a\x68\x8a\xc0\x8b\x0e\x8b\x32\x8b\x5e\x8b\x6c\x8b\x80\x8b\
-\xc0\x8b\xfe\x8c\x12\x8c\x26\x8c\x4c\x8c\x4c\x8c\x8a\x8c\xdc\x8d\
-\x10\x8d\x48\x8d\x78\x8d\xa8\x8d\xb6\x8d\xc4\x8d\xd2\x8d\xe8\x8d\
-\xfc\x8e\x10\x8e\x24\x8e\x40\x8e\x5c\x8e\x78\x8e\x94\x8e\xb0\x8e\
-\xd0\x8e\xf0\x8f\x10\x8f\x40\x8f\x40\x8f\x50\x8f\x64\x8f\x64\x8f\
-\x64\x8f\x72\x8f\x80\x8f\xa6\x8f\xb0\x8f\xbc\x8f\xc8\x8f\xd4\x8f\
-\xe0\x8f\xec\x8f\xf8\x90\x04\x90\x1a\x90\x5e\x90\x68\x90\x76\x90\
-\xa2\x90\xb0\x90\xde\x90\xea\x90\xf6\x91\x02\x91\x0e\x91\x1a\x91\
-\x26\x91\x32\x91\x58\x91\x80\x91\xa4\x91\xce\x91\xe0\x91\xf2\x92\
-\x14\x92\x40\x92\x4e\x92\x56\x92\x5e\x92\x66\x92\x6e\x92\x76\x92\
-\x7e\x92\x86\x92\x86\x00\x00\x00\x01\x00\x3e\x00\x72\x01\xc1\x02\
-\x17\x00\x1b\x00\x00\x37\x26\x26\x35\x34\x36\x33\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x16\x17\x16\x33\x32\x37\x17\x06\x07\x06\x07\
-\x27\x94\x20\x22\x5e\x4f\x42\x37\x1b\x2c\x29\x2a\x32\x24\x1e\x1a\
-\x0d\x35\x64\x13\x10\x20\xd4\x5c\x23\xf7\x17\x40\x25\x47\x5d\x27\
-\x5a\x16\x27\x21\x17\x21\x07\x04\x21\x6a\x05\x08\x3c\x1d\x69\x00\
-\x01\x00\x00\x03\x82\x00\xbd\x04\x48\x00\x16\x00\x00\x13\x26\x35\
-\x34\x36\x33\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x2a\x1d\x31\x2a\x1e\x1d\x0f\x11\x17\x17\x19\x1f\
-\x11\x1a\x19\x19\x05\xb6\x07\x03\xb8\x18\x24\x23\x31\x10\x30\x0a\
-\x13\x0f\x19\x0b\x06\x04\x32\x16\x30\x00\x00\xff\xff\x00\x3e\x00\
-\x72\x01\xc1\x02\x17\x04\x02\x00\x02\x00\x00\x00\x01\x00\x56\x00\
-\x6c\x00\xc0\x03\x64\x00\x03\x00\x00\x37\x07\x11\x37\xc0\x6a\x6a\
-\x78\x0c\x02\xec\x0c\x00\x00\x00\x01\x00\x56\x00\x6c\x00\xc0\x03\
-\x64\x00\x03\x00\x00\x37\x07\x11\x37\xc0\x6a\x6a\x78\x0c\x02\xec\
-\x0c\x00\x00\x00\x01\x00\x56\x00\x73\x01\x33\x03\x64\x00\x12\x00\
-\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x26\x35\x11\x37\x11\x14\
-\x16\x16\x33\x33\x01\x2c\x07\x07\x0a\x11\x44\x51\x26\x6a\x0d\x22\
-\x22\x11\xee\x1b\x1d\x24\x1f\x2b\x62\x55\x02\x03\x0c\xfd\xe1\x24\
-\x25\x0e\x00\x00\x01\x00\x56\x00\x6c\x00\xc0\x02\xc6\x00\x03\x00\
-\x00\x37\x07\x11\x37\xc0\x6a\x6a\x7d\x11\x02\x4e\x0c\x00\x00\x00\
-\x01\x00\x56\x00\x73\x01\x42\x02\xc6\x00\x11\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x26\x35\x11\x37\x11\x14\x16\x16\x33\x33\x01\
-\x3b\x07\x07\x0a\x11\x67\x63\x6a\x0f\x2a\x2b\x0d\xee\x1b\x1d\x24\
-\x1f\x5b\x70\x01\x7c\x0c\xfe\x7f\x25\x24\x0e\xff\xff\x00\x28\x00\
-\x6c\x00\xe8\x03\xc5\x04\x22\x00\x08\x00\x00\x04\x07\x02\xca\x00\
-\x28\xff\x74\xff\xff\x00\x28\x00\x6c\x00\xe8\x03\xc5\x04\x22\x00\
-\x08\x00\x00\x04\x07\x02\xca\x00\x28\xff\x74\xff\xff\x00\x2b\x00\
-\x73\x01\x42\x03\xc5\x04\x22\x00\x09\x00\x00\x04\x07\x02\xca\x00\
-\x2b\xff\x74\xff\xff\x00\x33\xff\x74\x00\xf3\x03\x64\x04\x22\x00\
-\x05\x00\x00\x04\x06\x02\xcb\x33\xa0\x00\x00\xff\xff\x00\x33\xff\
-\x74\x00\xf3\x03\x64\x04\x22\x00\x05\x00\x00\x04\x06\x02\xcb\x33\
-\xa0\x00\x00\xff\xff\x00\x49\xff\x8c\x01\x33\x03\x64\x04\x22\x00\
-\x07\x00\x00\x04\x06\x02\xcb\x49\xb8\x00\x00\xff\xff\x00\x02\x00\
-\x6c\x01\x16\x03\x7f\x04\x22\x00\x08\x00\x00\x04\x06\x02\xe2\x02\
-\xd8\x00\x00\xff\xff\x00\x02\x00\x6c\x01\x16\x03\x7f\x04\x22\x00\
-\x08\x00\x00\x04\x06\x02\xe2\x02\xd8\x00\x00\xff\xff\x00\x02\x00\
-\x6c\x01\x16\x03\x7f\x04\x02\x00\x10\x00\x00\xff\xff\x00\x02\x00\
-\x6c\x01\x16\x03\x7f\x04\x02\x00\x10\x00\x00\xff\xff\x00\x05\x00\
-\x73\x01\x42\x03\x7f\x04\x22\x00\x09\x00\x00\x04\x06\x02\xe2\x05\
-\xd8\x00\x00\xff\xff\x00\x05\x00\x73\x01\x42\x03\x7f\x04\x22\x00\
-\x09\x00\x00\x04\x06\x02\xe2\x05\xd8\x00\x00\xff\xff\xff\xfe\x00\
-\x6c\x01\x16\x03\x90\x04\x22\x00\x08\x00\x00\x04\x06\x02\xc2\xfe\
-\x2b\x00\x00\xff\xff\x00\x01\x00\x73\x01\x42\x03\x90\x04\x22\x00\
-\x09\x00\x00\x04\x06\x02\xc2\x01\x2b\x00\x00\x00\x03\x00\x56\x00\
-\x6c\x01\xc1\x03\x85\x00\x03\x00\x07\x00\x0b\x00\x00\x37\x07\x11\
-\x37\x17\x17\x07\x27\x37\x17\x07\x27\xc0\x6a\x6a\xfa\x06\xd1\x05\
-\xd2\x05\xd0\x06\x78\x0c\x02\xec\x0c\x33\x27\x1a\x28\x6d\x27\x1a\
-\x27\x00\x00\x00\x03\x00\x56\x00\x73\x01\xff\x03\x89\x00\x12\x00\
-\x16\x00\x1a\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x26\x35\
-\x11\x37\x11\x14\x16\x16\x33\x33\x03\x17\x07\x27\x37\x17\x07\x27\
-\x01\xf8\x07\x07\x0a\x6c\x79\x80\x33\x6a\x19\x50\x58\x6d\x3d\x06\
-\xd1\x05\xd1\x06\xd1\x05\xee\x1b\x1d\x24\x1f\x2a\x60\x58\x02\x03\
-\x0c\xfd\xe1\x26\x23\x0e\x02\x48\x2d\x1a\x2d\x6d\x2d\x19\x2d\x00\
-\x01\x00\x1e\x00\x73\x03\x26\x02\x23\x00\x19\x00\x00\x36\x26\x35\
-\x34\x36\x37\x17\x06\x06\x17\x1e\x02\x33\x32\x36\x37\x26\x26\x27\
-\x37\x16\x15\x14\x06\x23\xdd\xbf\x0f\x15\x53\x0e\x09\x01\x01\x38\
-\x84\x75\x7f\x8b\x0d\x01\x19\x1d\x5f\x36\xb4\xc7\x73\x67\x6b\x29\
-\x4e\x40\x16\x30\x3a\x19\x2b\x32\x18\x1c\x14\x2b\x66\x47\x2d\x8a\
-\x69\x5c\x61\x00\x01\x00\x1e\x00\x73\x03\x96\x01\xfc\x00\x26\x00\
-\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x26\
-\x35\x34\x36\x37\x17\x06\x15\x14\x16\x16\x33\x32\x36\x37\x36\x36\
-\x37\x17\x06\x07\x16\x16\x33\x33\x03\x8f\x07\x07\x0a\x07\x38\x57\
-\x16\x5e\xeb\x89\xa2\x47\x0f\x15\x53\x16\x32\x7b\x70\x6f\x87\x1a\
-\x10\x17\x12\x5e\x11\x22\x12\x38\x20\x0b\xee\x1b\x1d\x24\x1f\x2b\
-\x26\x51\x2e\x5b\x49\x29\x4e\x40\x16\x4f\x2b\x2f\x36\x19\x1f\x22\
-\x14\x38\x37\x16\x40\x45\x15\x14\x00\x00\x00\x00\x01\xff\xec\x00\
-\x73\x01\x84\x01\xc5\x00\x21\x00\x00\x37\x32\x36\x37\x36\x36\x37\
-\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x0e\x30\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\
-\x17\x1c\x65\x35\x11\x0a\x07\x07\x0a\xee\x20\x24\x17\x3d\x3f\x0b\
-\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x1f\x24\x1d\x1b\
-\x00\x00\x00\x00\x01\xff\xec\x00\x73\x00\xe3\x02\x25\x00\x14\x00\
-\x00\x37\x32\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\
-\x22\x26\x35\x34\x36\x33\x09\x27\x44\x0d\x01\x1f\x23\x64\x23\x1e\
-\x7d\x60\x09\x0a\x07\x07\x0a\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\
-\x3b\x53\x61\x1f\x24\x1d\x1b\xff\xff\x00\x1e\xff\x84\x03\x26\x02\
-\x23\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xb4\x01\x5a\xff\x2f\xff\
-\xff\x00\x1e\xff\x84\x03\x26\x02\x23\x04\x22\x00\x1a\x00\x00\x04\
-\x07\x02\xb4\x01\x5a\xff\x2f\xff\xff\x00\x1e\xff\x84\x03\x96\x01\
-\xfc\x04\x22\x00\x1b\x00\x00\x04\x07\x02\xb4\x01\x57\xff\x2f\xff\
-\xff\xff\xec\xff\x84\x01\x84\x01\xc5\x04\x22\x00\x1c\x00\x00\x04\
-\x07\x02\xb4\x00\x5c\xff\x2f\xff\xff\xff\xec\xff\x84\x00\xe3\x02\
-\x25\x04\x22\x00\x1d\x00\x00\x04\x07\x02\xb4\x00\x1d\xff\x2f\xff\
-\xff\x00\x1e\xff\x21\x03\x26\x02\x23\x04\x22\x00\x1a\x00\x00\x04\
-\x07\x02\xbb\x01\x16\xfe\x3c\xff\xff\x00\x1e\xff\x21\x03\x26\x02\
-\x23\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xbb\x01\x16\xfe\x3c\xff\
-\xff\x00\x1e\xff\x21\x03\x96\x01\xfc\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xbb\x01\x13\xfe\x3c\xff\xff\xff\xec\xff\x21\x01\x84\x01\
-\xc5\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xbb\x00\x17\xfe\x3c\xff\
-\xff\xff\xdc\xff\x21\x00\xfb\x02\x25\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xbb\xff\xd9\xfe\x3c\xff\xff\x00\x1e\xff\x36\x03\x26\x02\
-\x23\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xb7\x01\x62\xfe\xdf\xff\
-\xff\x00\x1e\xff\x36\x03\x26\x02\x23\x04\x02\x00\x28\x00\x00\xff\
-\xff\x00\x1e\xff\x36\x03\x96\x01\xfc\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xb7\x01\x5f\xfe\xdf\xff\xff\xff\xec\xff\x36\x01\x84\x01\
-\xc5\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xb7\x00\x64\xfe\xdf\xff\
-\xff\xff\xec\xff\x36\x00\xe3\x02\x25\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xb7\x00\x25\xfe\xdf\xff\xff\x00\x1e\xff\x2f\x03\x26\x02\
-\x23\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xc0\x01\x31\xfe\x68\xff\
-\xff\x00\x1e\xff\x2f\x03\x26\x02\x23\x04\x02\x00\x2d\x00\x00\xff\
-\xff\x00\x1e\xff\x2f\x03\x96\x01\xfc\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xc0\x01\x2d\xfe\x68\xff\xff\xff\xec\xff\x2f\x01\x84\x01\
-\xc5\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xc0\x00\x32\xfe\x68\xff\
-\xff\xff\xec\xff\x2f\x00\xe3\x02\x25\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xc0\xff\xf4\xfe\x68\xff\xff\xff\xec\x00\x73\x01\x84\x01\
-\xc5\x04\x02\x00\x1c\x00\x00\xff\xff\xff\xec\x00\x73\x00\xe3\x02\
-\x25\x04\x02\x00\x1d\x00\x00\xff\xff\x00\x1e\x00\x73\x03\x26\x02\
-\xbc\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xb8\x01\x15\xff\x54\xff\
-\xff\x00\x1e\x00\x73\x03\x26\x02\xbc\x04\x22\x00\x1a\x00\x00\x04\
-\x07\x02\xb8\x01\x15\xff\x54\xff\xff\x00\x1e\x00\x73\x03\x96\x02\
-\xbc\x04\x22\x00\x1b\x00\x00\x04\x07\x02\xb8\x01\x25\xff\x54\xff\
-\xff\xff\xec\x00\x73\x01\x84\x02\xa7\x04\x22\x00\x1c\x00\x00\x04\
-\x07\x02\xb8\x00\x0f\xff\x3f\xff\xff\xff\xc7\x00\x73\x00\xeb\x03\
-\x04\x04\x22\x00\x1d\x00\x00\x04\x06\x02\xb8\xc7\x9c\x00\x00\x00\
-\x04\x00\x1e\xff\xfd\x03\x26\x02\xbc\x00\x03\x00\x27\x00\x33\x00\
-\x37\x00\x00\x01\x37\x17\x07\x04\x36\x37\x17\x06\x06\x17\x1e\x02\
-\x33\x32\x36\x37\x26\x26\x27\x37\x16\x15\x14\x06\x07\x16\x15\x14\
-\x06\x23\x22\x26\x35\x34\x37\x26\x26\x35\x00\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x06\x15\x13\x17\x07\x27\x01\x15\x4a\x4a\x4a\xfe\
-\xbf\x0f\x15\x53\x0e\x09\x01\x01\x38\x84\x75\x7f\x8b\x0d\x01\x19\
-\x1d\x5f\x36\x93\xa2\x09\x2e\x20\x23\x2b\x09\xaa\x9f\x01\x69\x13\
-\x14\x11\x13\x14\x12\x11\x14\x68\x4a\x4a\x4a\x02\x6e\x49\x49\x4a\
-\xb6\x4e\x40\x16\x30\x3a\x19\x2b\x32\x18\x1c\x14\x2b\x66\x47\x2d\
-\x8a\x69\x54\x5f\x08\x12\x16\x26\x2a\x2a\x25\x17\x12\x07\x67\x62\
-\xfe\xf8\x13\x12\x0f\x11\x17\x16\x11\x02\x70\x4a\x4a\x4a\x00\x00\
-\x04\x00\x1e\xff\xfd\x03\x96\x02\xbc\x00\x30\x00\x34\x00\x40\x00\
-\x44\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x07\x16\
-\x15\x14\x06\x23\x22\x26\x35\x34\x37\x2e\x02\x35\x34\x36\x37\x17\
-\x06\x15\x14\x16\x16\x33\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\
-\x16\x33\x33\x01\x17\x07\x27\x12\x16\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\x13\x17\x07\x27\x03\x8f\x07\x07\x0a\x07\x38\x57\x16\
-\x50\xa9\x0a\x2e\x20\x23\x2b\x09\x73\x8a\x3c\x0f\x15\x53\x16\x32\
-\x7b\x70\x6f\x87\x1a\x10\x17\x12\x5e\x11\x22\x12\x38\x20\x0b\xfd\
-\xea\x4a\x4a\x4a\x52\x13\x14\x11\x13\x14\x12\x11\x14\x88\x4a\x4a\
-\x4a\xee\x1b\x1d\x24\x1f\x2b\x26\x44\x0a\x13\x16\x26\x2a\x2a\x25\
-\x18\x10\x04\x31\x59\x43\x29\x4e\x40\x16\x4f\x2b\x2f\x36\x19\x1f\
-\x22\x14\x38\x37\x16\x40\x45\x15\x14\x01\xc9\x49\x4a\x4a\xfd\xcf\
-\x13\x12\x0f\x11\x17\x16\x11\x02\x70\x4a\x4a\x4a\x00\x00\x00\x00\
-\x04\xff\xec\x00\x0c\x01\x84\x02\xa7\x00\x2d\x00\x31\x00\x3d\x00\
-\x41\x00\x00\x37\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\
-\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x07\x16\x16\x15\
-\x14\x06\x23\x22\x26\x35\x34\x37\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x13\x17\x07\x27\x12\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\
-\x15\x13\x17\x07\x27\x0e\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x0b\x0d\x19\x1d\x2e\
-\x20\x23\x2b\x05\x20\x1d\x11\x0a\x07\x07\x0a\x5c\x4a\x4a\x4a\x60\
-\x13\x14\x11\x13\x14\x12\x11\x14\x7a\x4a\x4a\x4a\xee\x20\x24\x17\
-\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x10\x0a\x08\
-\x2c\x1b\x26\x2a\x2a\x25\x0f\x11\x08\x1f\x24\x1d\x1b\x01\xb4\x49\
-\x4a\x4a\xfd\xf3\x13\x12\x0f\x11\x17\x16\x11\x02\x4c\x4a\x4a\x4a\
-\x00\x00\x00\x00\x04\xff\xc7\x00\x01\x00\xeb\x03\x04\x00\x21\x00\
-\x25\x00\x31\x00\x35\x00\x00\x37\x32\x36\x37\x26\x26\x27\x37\x16\
-\x16\x15\x14\x06\x07\x16\x16\x15\x14\x06\x23\x22\x26\x35\x34\x37\
-\x06\x23\x23\x22\x26\x35\x34\x36\x33\x13\x17\x07\x27\x12\x16\x33\
-\x32\x36\x35\x34\x26\x23\x22\x06\x15\x13\x17\x07\x27\x09\x27\x44\
-\x0d\x01\x1f\x23\x64\x23\x1e\x26\x23\x15\x17\x2e\x20\x23\x2b\x08\
-\x15\x17\x09\x0a\x07\x07\x0a\x14\x4a\x4a\x4a\x8c\x13\x14\x11\x13\
-\x14\x12\x11\x14\x4e\x4a\x4a\x4a\xee\x17\x13\x2e\x63\x49\x33\x4c\
-\x77\x3b\x2d\x47\x18\x0a\x28\x18\x26\x2a\x2a\x25\x14\x12\x03\x1f\
-\x24\x1d\x1b\x02\x11\x49\x4a\x4a\xfd\x8b\x13\x12\x0f\x11\x17\x16\
-\x11\x02\xb4\x4a\x4a\x4a\x00\xff\xff\x00\x1e\x00\x73\x03\x26\x03\
-\x27\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xba\x01\x10\xff\x91\xff\
-\xff\x00\x1e\x00\x73\x03\x26\x03\x16\x04\x22\x00\x1a\x00\x00\x04\
-\x07\x02\xbd\x01\x17\x00\xf0\xff\xff\x00\x1e\x00\x73\x03\x26\x03\
-\x16\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xbd\x01\x17\x00\xf0\xff\
-\xff\x00\x1e\x00\x73\x03\x96\x03\x16\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xbd\x01\x27\x00\xf0\xff\xff\xff\xec\x00\x73\x01\x84\x03\
-\x01\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xbd\x00\x11\x00\xdb\xff\
-\xff\xff\xcf\x00\x73\x00\xe9\x03\x5e\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xbd\xff\xc9\x01\x38\xff\xff\x00\x1e\x00\x73\x03\x26\x03\
-\x17\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xb2\x01\x2a\xfe\x78\xff\
-\xff\x00\x1e\x00\x73\x03\x26\x03\x17\x04\x02\x00\x43\x00\x00\xff\
-\xff\x00\x1e\x00\x73\x03\x96\x03\x17\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xb2\x01\x3a\xfe\x78\xff\xff\xff\xec\x00\x73\x01\x84\x03\
-\x02\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xb2\x00\x24\xfe\x63\xff\
-\xff\xff\xdc\x00\x73\x00\xe3\x03\x5f\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xb2\xff\xdc\xfe\xc0\xff\xff\x00\x1e\x00\x73\x03\x26\x03\
-\x39\x04\x22\x00\x1a\x00\x00\x04\x07\x02\xb6\x01\x57\xff\x93\xff\
-\xff\x00\x1e\x00\x73\x03\x26\x03\x39\x04\x02\x00\x48\x00\x00\xff\
-\xff\x00\x1e\x00\x73\x03\x96\x03\x39\x04\x22\x00\x1b\x00\x00\x04\
-\x07\x02\xb6\x01\x66\xff\x93\xff\xff\xff\xec\x00\x73\x01\x84\x03\
-\x24\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xb6\x00\x51\xff\x7e\xff\
-\xff\xff\xec\x00\x73\x00\xe3\x03\x81\x04\x22\x00\x1d\x00\x00\x04\
-\x06\x02\xb6\x09\xdb\x00\x00\xff\xff\x00\x24\xff\x73\x02\x98\x02\
-\xc3\x04\x22\x00\x5d\x00\x00\x04\x07\x02\xb5\x01\x49\xff\x49\xff\
-\xff\x00\x24\xff\x73\x02\x98\x02\xc3\x04\x22\x00\x5d\x00\x00\x04\
-\x07\x02\xb5\x01\x49\xff\x49\xff\xff\x00\x47\xff\x0c\x03\x06\x02\
-\x55\x04\x22\x00\x5f\x00\x00\x04\x07\x02\xb5\x01\x53\xfe\xbc\xff\
-\xff\xff\xec\xff\xa7\x02\xda\x02\x1f\x04\x22\x00\x60\x00\x00\x04\
-\x07\x02\xb4\x01\x07\xff\x52\xff\xff\xff\xec\xff\xa7\x02\x81\x02\
-\x1f\x04\x22\x00\x61\x00\x00\x04\x07\x02\xb4\x00\xcd\xff\x52\xff\
-\xff\x00\x24\xff\x73\x02\x98\x02\xc3\x04\x22\x00\x5d\x00\x00\x04\
-\x07\x02\xbc\x00\xff\xff\x1e\xff\xff\x00\x24\xff\x73\x02\x98\x02\
-\xc3\x04\x02\x00\x52\x00\x00\xff\xff\x00\x47\xff\x0c\x03\x06\x02\
-\x55\x04\x22\x00\x5f\x00\x00\x04\x07\x02\xbc\x01\x0a\xfe\x91\xff\
-\xff\xff\xec\xff\x44\x02\xda\x02\x1f\x04\x22\x00\x60\x00\x00\x04\
-\x07\x02\xbb\x00\xc2\xfe\x5f\xff\xff\xff\xec\xff\x44\x02\x81\x02\
-\x1f\x04\x22\x00\x61\x00\x00\x04\x07\x02\xbb\x00\x89\xfe\x5f\xff\
-\xff\x00\x24\xff\x73\x02\x98\x02\xc3\x04\x22\x00\x5d\x00\x00\x04\
-\x07\x02\xc1\x01\x11\xff\x96\xff\xff\x00\x24\xff\x73\x02\x98\x02\
-\xc3\x04\x02\x00\x57\x00\x00\xff\xff\x00\x47\xff\x0c\x03\x06\x02\
-\x55\x04\x22\x00\x5f\x00\x00\x04\x07\x02\xc1\x01\x1b\xff\x0a\xff\
-\xff\xff\xec\xff\x53\x02\xda\x02\x1f\x04\x22\x00\x60\x00\x00\x04\
-\x07\x02\xc0\x00\xdd\xfe\x8c\xff\xff\xff\xec\xff\x53\x02\x81\x02\
-\x1f\x04\x22\x00\x61\x00\x00\x04\x07\x02\xc0\x00\xa3\xfe\x8c\xff\
-\xff\x00\x24\xff\x73\x02\x98\x03\x79\x04\x22\x00\x5d\x00\x00\x04\
-\x27\x02\xbc\x00\xff\xff\x1e\x04\x07\x02\xb3\x00\xd1\xff\xf0\x00\
-\x01\x00\x24\xff\x73\x02\x98\x02\xc3\x00\x26\x00\x00\x12\x16\x17\
-\x16\x16\x17\x07\x26\x27\x0e\x02\x15\x14\x16\x33\x16\x37\x17\x06\
-\x06\x23\x22\x26\x26\x35\x34\x36\x36\x37\x26\x26\x23\x22\x06\x07\
-\x27\x36\x33\xf7\x47\x3b\x58\x7e\x49\x20\x3c\x44\x6f\x9f\x53\x89\
-\x70\x6f\x6f\x17\x3a\x85\x42\x6e\x9d\x51\x51\x96\x66\x44\x45\x20\
-\x1d\x38\x26\x2d\x58\x5d\x02\xc3\x16\x18\x23\x25\x01\x6e\x03\x11\
-\x28\x70\x7f\x41\x50\x5c\x01\x28\x63\x1f\x20\x45\x7a\x4e\x4e\x9a\
-\x86\x32\x1b\x17\x16\x1f\x53\x53\x00\x00\x00\x00\x01\x00\x24\xff\
-\x73\x02\x98\x02\xc3\x00\x26\x00\x00\x12\x16\x17\x16\x16\x17\x07\
-\x26\x27\x0e\x02\x15\x14\x16\x33\x16\x37\x17\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x36\x37\x26\x26\x23\x22\x06\x07\x27\x36\x33\xf7\
-\x47\x3b\x58\x7e\x49\x20\x3c\x44\x6f\x9f\x53\x89\x70\x6f\x6f\x17\
-\x3a\x85\x42\x6e\x9d\x51\x51\x96\x66\x44\x45\x20\x1d\x38\x26\x2d\
-\x58\x5d\x02\xc3\x16\x18\x23\x25\x01\x6e\x03\x11\x28\x70\x7f\x41\
-\x50\x5c\x01\x28\x63\x1f\x20\x45\x7a\x4e\x4e\x9a\x86\x32\x1b\x17\
-\x16\x1f\x53\x53\x00\x00\x00\x00\x01\x00\x47\xff\x0c\x03\x06\x02\
-\x55\x00\x33\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\
-\x06\x15\x14\x16\x16\x33\x16\x37\x17\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x26\x26\x23\x22\x06\x07\x27\x36\x33\x32\x16\x17\x16\x16\
-\x17\x07\x26\x27\x1e\x02\x33\x33\x02\xff\x07\x07\x0a\x1b\x6e\x74\
-\x04\x99\x9b\x3e\x6a\x42\x65\x65\x1a\x6c\x89\x67\x96\x4f\xb0\xa2\
-\x46\x48\x21\x1e\x37\x27\x2d\x58\x5c\x1f\x45\x3d\x56\x7f\x49\x1f\
-\x2a\x29\x03\x25\x41\x35\x0f\xee\x1b\x1d\x24\x1f\x75\x82\x42\x9f\
-\x56\x35\x4e\x29\x01\x28\x6a\x38\x45\x7a\x4e\x77\xd5\x4c\x1c\x17\
-\x15\x20\x52\x54\x15\x18\x21\x24\x01\x6e\x01\x08\x3a\x3e\x17\x00\
-\x01\xff\xec\x00\x73\x02\xda\x02\x1f\x00\x2e\x00\x00\x37\x32\x36\
-\x37\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\x33\x32\x16\x17\x16\
-\x16\x17\x07\x26\x27\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x13\x6f\xc6\x5b\
-\x19\x3b\x36\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\
-\x49\x1e\x2a\x1f\x09\x4d\x4a\x0f\x0a\x07\x07\x0a\x1b\xba\x20\x67\
-\xec\x73\x11\x0a\x07\x07\x0a\xee\x3b\x3d\x09\x16\x15\x14\x16\x21\
-\x52\x56\x15\x16\x20\x23\x01\x6e\x02\x05\x34\x27\x1b\x1d\x24\x1f\
-\xa5\x53\x52\x1f\x24\x1d\x1b\x00\x01\xff\xec\x00\x73\x02\x81\x02\
-\x1f\x00\x21\x00\x00\x12\x16\x17\x16\x16\x17\x07\x26\x27\x06\x04\
-\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x26\x27\x26\x26\
-\x23\x22\x06\x07\x27\x36\x33\xe1\x46\x39\x54\x84\x49\x1e\x2e\x28\
-\x6e\xfe\xf4\x85\x11\x0a\x07\x07\x0a\x16\x6f\xc6\x5b\x19\x3b\x36\
-\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x02\x1f\x15\x16\x20\x23\x01\x6e\
-\x02\x07\x6d\x6b\x1f\x24\x1d\x1b\x3b\x3d\x09\x16\x15\x14\x16\x21\
-\x52\x56\x00\xff\xff\x00\x24\xff\x73\x02\x98\x03\xb4\x04\x22\x00\
-\x5d\x00\x00\x04\x07\x02\xca\x00\xb9\xff\x63\xff\xff\x00\x24\xff\
-\x73\x02\x98\x03\xd7\x04\x22\x00\x5d\x00\x00\x04\x07\x02\xbd\x00\
-\x8f\x01\xb1\xff\xff\x00\x24\xff\x73\x02\x98\x03\x79\x04\x22\x00\
-\x5d\x00\x00\x04\x07\x02\xb3\x00\xd1\xff\xf0\xff\xff\x00\x24\xff\
-\x73\x02\x98\x03\x79\x04\x22\x00\x5d\x00\x00\x04\x07\x02\xb3\x00\
-\xd1\xff\xf0\xff\xff\x00\x47\xff\x0c\x03\x06\x03\x22\x04\x22\x00\
-\x5f\x00\x00\x04\x07\x02\xb3\x00\xe5\xff\x99\xff\xff\xff\xec\x00\
-\x73\x02\xda\x02\xf8\x04\x22\x00\x60\x00\x00\x04\x07\x02\xb3\x00\
-\x8c\xff\x6f\xff\xff\xff\xec\x00\x73\x02\x81\x02\xf8\x04\x22\x00\
-\x61\x00\x00\x04\x07\x02\xb3\x00\x8c\xff\x6f\x00\x01\x00\x1e\x00\
-\x73\x01\xb2\x02\x79\x00\x11\x00\x00\x24\x06\x23\x22\x27\x27\x16\
-\x33\x32\x36\x35\x34\x26\x27\x37\x16\x16\x15\x01\xb2\x73\x6d\x5e\
-\x4d\x09\x59\x58\x3c\x3e\x3c\x4c\x65\x4d\x3f\xcd\x5a\x0c\x7f\x10\
-\x19\x17\x2a\x80\x6c\x45\x76\xa0\x46\x00\x00\xff\xff\x00\x1e\x00\
-\x73\x01\xb2\x02\x79\x04\x02\x00\x69\x00\x00\x00\x01\x00\x30\x00\
-\x73\x02\x57\x02\x75\x00\x1e\x00\x00\x24\x26\x27\x06\x23\x22\x27\
-\x27\x16\x16\x33\x32\x37\x26\x26\x27\x37\x16\x16\x17\x16\x16\x33\
-\x33\x32\x16\x15\x14\x06\x23\x23\x02\x00\x44\x13\x34\x94\x56\x54\
-\x07\x3a\x54\x35\x4b\x2e\x20\x1e\x17\x6d\x21\x1b\x12\x0b\x30\x2c\
-\x0d\x0a\x07\x07\x0a\x0f\x73\x1f\x1f\x3e\x13\x7f\x0d\x0a\x18\x64\
-\x75\x75\x21\xa5\x74\x34\x20\x1a\x1b\x1d\x24\x1f\x00\x00\x00\xff\
-\xff\x00\x1e\x00\x73\x01\xb2\x03\x51\x04\x22\x00\x69\x00\x00\x04\
-\x07\x02\xb3\x00\x8d\xff\xc8\xff\xff\x00\x1e\x00\x73\x01\xb2\x03\
-\x51\x04\x22\x00\x69\x00\x00\x04\x07\x02\xb3\x00\x8d\xff\xc8\xff\
-\xff\x00\x30\x00\x73\x02\x57\x03\x5b\x04\x22\x00\x6b\x00\x00\x04\
-\x07\x02\xb3\x00\xfb\xff\xd2\xff\xff\x00\x1e\x00\x73\x01\xb2\x03\
-\xb0\x04\x22\x00\x69\x00\x00\x04\x07\x02\xb2\x00\x5e\xff\x11\xff\
-\xff\x00\x1e\x00\x73\x01\xb2\x03\xb0\x04\x22\x00\x69\x00\x00\x04\
-\x07\x02\xb2\x00\x5e\xff\x11\xff\xff\x00\x30\x00\x73\x02\x57\x03\
-\xba\x04\x22\x00\x6b\x00\x00\x04\x07\x02\xb2\x00\xcc\xff\x1b\x00\
-\x02\x00\x1e\xff\xfd\x01\xb2\x02\x79\x00\x1b\x00\x27\x00\x00\x24\
-\x06\x07\x16\x15\x14\x06\x23\x22\x26\x35\x34\x37\x26\x27\x27\x16\
-\x33\x32\x36\x35\x34\x26\x27\x37\x16\x16\x15\x04\x16\x33\x32\x36\
-\x35\x34\x26\x23\x22\x06\x15\x01\xb2\x50\x4d\x0b\x2e\x20\x23\x2b\
-\x09\x28\x3e\x09\x59\x58\x3c\x3e\x3c\x4c\x65\x4d\x3f\xfe\xfb\x13\
-\x14\x11\x13\x14\x12\x11\x14\xdb\x56\x0d\x14\x17\x26\x2a\x2a\x25\
-\x17\x12\x01\x09\x7f\x10\x19\x17\x2a\x80\x6c\x45\x75\xa0\x46\xe1\
-\x13\x12\x0f\x11\x17\x16\x11\x00\x01\x00\x17\xff\x90\x01\x72\x01\
-\xd9\x00\x11\x00\x00\x3e\x02\x35\x26\x27\x37\x16\x15\x14\x06\x06\
-\x23\x22\x27\x37\x16\x33\x9e\x4a\x24\x01\x59\x68\x58\x3b\x79\x58\
-\x27\x28\x12\x19\x25\x07\x21\x30\x16\x85\xab\x3b\xb8\x89\x48\x78\
-\x48\x08\x72\x04\x00\x00\x00\x00\x01\x00\x14\xff\x8d\x01\x44\x01\
-\xbf\x00\x12\x00\x00\x24\x06\x06\x23\x22\x27\x37\x33\x32\x36\x36\
-\x35\x34\x26\x27\x37\x16\x16\x15\x01\x44\x3e\x76\x52\x1d\x0d\x02\
-\x1c\x35\x4f\x2a\x2b\x2b\x6b\x29\x26\x42\x73\x42\x01\x78\x1c\x2d\
-\x19\x3d\x8b\x5a\x35\x60\x96\x41\x00\x00\x00\xff\xff\x00\x17\xff\
-\x90\x01\x72\x01\xd9\x04\x02\x00\x73\x00\x00\x00\x01\x00\x17\xff\
-\x90\x01\xff\x01\xc6\x00\x20\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\
-\x27\x37\x16\x17\x16\x16\x33\x33\x01\xf8\x07\x07\x0a\x0a\x29\x35\
-\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\
-\x35\x19\x1e\x3f\x2f\x09\xee\x1b\x1d\x24\x1f\x09\x0a\x45\x6f\x42\
-\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x00\
-\x01\x00\x18\xff\x84\x01\xd4\x01\xc1\x00\x1c\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x26\x27\x06\x06\x07\x23\x37\x33\x32\x36\x36\
-\x35\x34\x27\x37\x16\x17\x16\x16\x33\x33\x01\xcd\x07\x07\x0a\x0a\
-\x28\x37\x17\x02\x8b\x79\x25\x01\x1d\x34\x4d\x28\x68\x67\x2e\x1b\
-\x1f\x42\x33\x08\xee\x1b\x1d\x24\x1f\x0a\x0e\x78\x8e\x01\x79\x1d\
-\x2c\x18\x76\xb3\x3a\x5a\x53\x17\x0f\x00\x00\xff\xff\x00\x17\xff\
-\x90\x01\x72\x02\xb8\x04\x22\x00\x73\x00\x00\x04\x07\x02\xb3\x00\
-\x75\xff\x2f\xff\xff\x00\x17\xff\x90\x01\x72\x02\xb8\x04\x22\x00\
-\x73\x00\x00\x04\x07\x02\xb3\x00\x75\xff\x2f\xff\xff\x00\x17\xff\
-\x90\x01\xff\x02\xa1\x04\x22\x00\x76\x00\x00\x04\x07\x02\xb3\x00\
-\x7a\xff\x18\xff\xff\x00\x18\xff\x84\x01\xd4\x02\xa9\x04\x22\x00\
-\x77\x00\x00\x04\x07\x02\xb3\x00\x40\xff\x20\xff\xff\x00\x14\xff\
-\x8d\x01\x44\x02\xa8\x04\x22\x00\x74\x00\x00\x04\x07\x02\xb3\x00\
-\x39\xff\x1f\xff\xff\x00\x17\xff\x90\x01\x72\x03\x16\x04\x22\x00\
-\x73\x00\x00\x04\x07\x02\xb2\x00\x45\xfe\x77\xff\xff\x00\x0a\xff\
-\x8d\x01\x44\x03\x07\x04\x22\x00\x74\x00\x00\x04\x07\x02\xb2\x00\
-\x0a\xfe\x68\xff\xff\x00\x17\xff\x90\x01\x72\x03\x16\x04\x22\x00\
-\x73\x00\x00\x04\x07\x02\xb2\x00\x45\xfe\x77\xff\xff\x00\x0a\xff\
-\x8d\x01\x44\x03\x07\x04\x22\x00\x74\x00\x00\x04\x07\x02\xb2\x00\
-\x0a\xfe\x68\xff\xff\x00\x17\xff\x90\x01\xff\x03\x00\x04\x22\x00\
-\x76\x00\x00\x04\x07\x02\xb2\x00\x4a\xfe\x61\xff\xff\x00\x10\xff\
-\x84\x01\xd4\x03\x08\x04\x22\x00\x77\x00\x00\x04\x07\x02\xb2\x00\
-\x10\xfe\x69\x00\x02\x00\x17\xff\x44\x01\x7c\x01\xd9\x00\x1d\x00\
-\x29\x00\x00\x3e\x02\x35\x26\x27\x37\x16\x17\x14\x06\x07\x16\x16\
-\x15\x14\x06\x23\x22\x26\x35\x34\x37\x06\x23\x22\x27\x37\x16\x33\
-\x16\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x15\x9e\x4a\x24\x01\
-\x59\x68\x56\x02\x1e\x1e\x1f\x27\x2e\x20\x23\x2b\x02\x38\x44\x27\
-\x28\x12\x19\x25\xa2\x13\x14\x11\x13\x14\x12\x11\x14\x07\x21\x30\
-\x16\x85\xab\x3b\xb4\x8b\x34\x5d\x23\x03\x2f\x20\x26\x2a\x2a\x25\
-\x07\x0e\x18\x08\x72\x04\x82\x13\x12\x0f\x11\x17\x16\x11\x00\x00\
-\x02\x00\x14\xff\x41\x01\x47\x01\xbf\x00\x1e\x00\x2a\x00\x00\x24\
-\x06\x07\x16\x16\x15\x14\x06\x23\x22\x26\x35\x34\x37\x06\x23\x22\
-\x27\x37\x33\x32\x36\x36\x35\x34\x26\x27\x37\x16\x16\x15\x02\x16\
-\x33\x32\x36\x35\x34\x26\x23\x22\x06\x15\x01\x44\x1d\x1c\x1b\x21\
-\x2e\x20\x23\x2b\x01\x31\x3a\x1f\x0e\x02\x1c\x35\x4f\x2a\x2b\x2b\
-\x6b\x29\x26\x70\x13\x14\x11\x13\x14\x12\x11\x14\x57\x55\x21\x06\
-\x2d\x1d\x26\x2a\x2a\x25\x0b\x05\x13\x01\x78\x1c\x2d\x19\x3d\x8b\
-\x5a\x35\x60\x96\x41\xfe\xf9\x13\x12\x0f\x11\x17\x16\x11\x00\xff\
-\xff\x00\x17\xfe\xc7\x01\x72\x02\xb8\x04\x22\x00\x73\x00\x00\x04\
-\x27\x02\xb4\x00\x5c\xfe\x72\x04\x07\x02\xb3\x00\x75\xff\x2f\xff\
-\xff\x00\x14\xfe\xca\x01\x44\x02\xa8\x04\x22\x00\x74\x00\x00\x04\
-\x27\x02\xb4\x00\x3d\xfe\x75\x04\x07\x02\xb3\x00\x39\xff\x1f\xff\
-\xff\x00\x17\xff\x90\x01\x72\x03\x15\x04\x22\x00\x73\x00\x00\x04\
-\x07\x02\xbd\x00\x32\x00\xef\xff\xff\xff\xfd\xff\x8d\x01\x44\x03\
-\x06\x04\x22\x00\x74\x00\x00\x04\x07\x02\xbd\xff\xf7\x00\xe0\xff\
-\xff\x00\x17\xff\x90\x01\x72\x03\x15\x04\x02\x00\x87\x00\x00\xff\
-\xff\x00\x17\xff\x90\x01\xff\x02\xff\x04\x22\x00\x76\x00\x00\x04\
-\x07\x02\xbd\x00\x37\x00\xd9\xff\xff\x00\x03\xff\x84\x01\xd4\x03\
-\x07\x04\x22\x00\x77\x00\x00\x04\x07\x02\xbd\xff\xfd\x00\xe1\x00\
-\x01\x00\x1e\xff\xa9\x04\x2d\x01\xf5\x00\x38\x00\x00\x16\x26\x35\
-\x34\x37\x17\x06\x06\x15\x14\x16\x33\x32\x36\x35\x34\x26\x27\x37\
-\x16\x17\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\
-\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x22\x26\x27\x06\x06\x23\
-\x22\x27\x0e\x02\x23\xad\x8f\x38\x57\x15\x12\x56\x58\x4b\x58\x15\
-\x24\x65\x22\x0d\x1b\x31\x24\x26\x0a\x08\x09\x5a\x05\x0c\x12\x39\
-\x1b\x35\x03\x03\x2b\x5e\x1b\x18\x59\x3f\x27\x4c\x19\x13\x45\x2c\
-\x2a\x24\x07\x42\x73\x4d\x57\x8b\x7a\x66\x77\x1f\x32\x4d\x25\x4a\
-\x59\x43\x36\x33\x61\x6c\x26\x6d\x4e\x1b\x1e\x25\x1f\x51\x0a\x47\
-\x38\x16\x14\x18\x56\x66\x33\x42\x6f\x3b\x4b\x4b\x20\x21\x20\x21\
-\x11\x3e\x64\x39\x00\x00\x00\xff\xff\x00\x1e\xff\xa9\x04\x2d\x01\
-\xf5\x04\x02\x00\x8c\x00\x00\x00\x01\x00\x1e\xff\xa9\x04\x94\x01\
-\xc5\x00\x45\x00\x00\x16\x26\x35\x34\x37\x17\x06\x06\x15\x14\x16\
-\x33\x32\x36\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\x15\
-\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\
-\x22\x26\x27\x06\x23\x22\x27\x0e\x02\x23\xad\x8f\x38\x57\x15\x12\
-\x56\x58\x4b\x58\x15\x24\x65\x22\x0b\x11\x2b\x1f\x20\x22\x0a\x09\
-\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x0e\x02\x24\x37\
-\x0c\x0a\x07\x07\x0a\x0d\x4f\x2e\x25\x4a\x26\x41\x17\x28\x55\x31\
-\x26\x07\x41\x74\x4e\x57\x8b\x7a\x66\x77\x1f\x32\x4d\x25\x4a\x59\
-\x43\x36\x33\x61\x6c\x26\x6c\x45\x14\x11\x1e\x25\x22\x4d\x0a\x52\
-\x31\x25\x15\x12\x18\x2f\x5c\x0d\x5c\x3c\x11\x1a\x14\x1b\x1d\x24\
-\x1f\x27\x27\x1f\x1e\x3d\x15\x3f\x65\x3b\x00\x00\x01\xff\xec\x00\
-\x73\x03\x5a\x01\xc5\x00\x3f\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\
-\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x37\x37\x17\x06\x07\x16\
-\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\
-\x34\x27\x37\x16\x07\x16\x16\x33\x33\x03\x53\x07\x07\x0a\x0d\x60\
-\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\x15\x0a\x07\
-\x07\x0a\x13\x34\x31\x0d\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\
-\x22\x0a\x09\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\
-\x02\x18\x3d\x27\x0c\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\x3d\x1e\
-\x1e\x3c\x1f\x24\x1d\x1b\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\x0f\
-\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\x4a\
-\x19\x13\x00\x00\x01\xff\xec\x00\x73\x02\xdf\x01\xf5\x00\x33\x00\
-\x00\x24\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\
-\x34\x36\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\
-\x16\x15\x14\x06\x23\x02\x21\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\
-\x38\x1a\x0a\x07\x07\x0a\x10\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\
-\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\
-\x2b\x5e\x1b\x17\x58\x3f\x73\x1f\x21\x40\x25\x25\x28\x22\x1f\x24\
-\x1d\x1b\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\
-\x4a\x33\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x00\x00\xff\
-\xff\x00\x1e\xff\x9e\x04\x2d\x02\x88\x04\x22\x00\x8c\x00\x00\x04\
-\x27\x02\xb4\x02\xab\xff\x49\x04\x07\x02\xb3\x02\xa0\xfe\xff\xff\
-\xff\x00\x1e\xff\xa9\x04\x2d\x02\xe6\x04\x22\x00\x8c\x00\x00\x04\
-\x07\x02\xbd\x02\x5e\x00\xc0\xff\xff\x00\x1e\xff\xa9\x04\x2d\x02\
-\xe6\x04\x22\x00\x8c\x00\x00\x04\x07\x02\xbd\x02\x5e\x00\xc0\xff\
-\xff\x00\x1e\xff\xa9\x04\x94\x02\xe6\x04\x22\x00\x8e\x00\x00\x04\
-\x07\x02\xbd\x02\x70\x00\xc0\xff\xff\xff\xec\x00\x73\x03\x5a\x02\
-\xe6\x04\x22\x00\x8f\x00\x00\x04\x07\x02\xbd\x01\x15\x00\xc0\xff\
-\xff\xff\xec\x00\x73\x02\xdf\x02\xe6\x04\x22\x00\x90\x00\x00\x04\
-\x07\x02\xbd\x01\x14\x00\xc0\xff\xff\x00\x1e\xff\x3b\x04\x2d\x02\
-\xe6\x04\x22\x00\x92\x00\x00\x04\x07\x02\xbb\x02\x67\xfe\x56\x00\
-\x02\x00\x1e\xff\xa9\x04\x65\x02\x20\x00\x25\x00\x2e\x00\x00\x16\
-\x26\x35\x34\x37\x17\x06\x06\x15\x14\x16\x33\x32\x36\x35\x34\x26\
-\x27\x37\x16\x17\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\
-\x23\x06\x06\x23\x00\x36\x35\x34\x26\x23\x22\x06\x07\xad\x8f\x38\
-\x57\x15\x12\x56\x58\x4b\x58\x15\x24\x65\x28\x0a\x09\x26\x75\x89\
-\x42\x3b\x58\x2e\x5d\xe1\xc7\x2b\x10\x89\x6e\x02\x31\xa2\x35\x31\
-\x3a\x80\x38\x57\x8b\x7a\x66\x77\x1f\x32\x4d\x25\x4a\x59\x43\x36\
-\x33\x61\x6c\x26\x81\x55\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x59\
-\x71\x01\x47\x2c\x2d\x29\x2f\x5a\x59\x00\x00\xff\xff\x00\x1e\xff\
-\xa9\x04\x65\x02\x20\x04\x02\x00\x98\x00\x00\x00\x02\x00\x1e\xff\
-\xa9\x04\xb0\x02\x20\x00\x33\x00\x3c\x00\x00\x24\x16\x15\x14\x06\
-\x23\x23\x22\x26\x27\x06\x06\x23\x23\x06\x06\x23\x22\x26\x35\x34\
-\x37\x17\x06\x06\x15\x14\x16\x33\x32\x36\x35\x34\x26\x27\x37\x16\
-\x17\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x16\x33\x33\x24\x36\
-\x35\x34\x26\x23\x22\x06\x07\x04\xa9\x07\x07\x0a\x0f\x30\x53\x1d\
-\x3c\xc3\x91\x2b\x10\x89\x6e\x81\x8f\x38\x57\x15\x12\x56\x58\x4b\
-\x58\x15\x24\x65\x28\x0a\x09\x26\x75\x89\x42\x3b\x58\x2e\x16\x1c\
-\x28\x0c\xfe\xc0\xa2\x35\x31\x3a\x80\x38\xee\x1b\x1d\x24\x1f\x1a\
-\x1a\x1a\x1a\x59\x71\x8b\x7a\x66\x77\x1f\x32\x4d\x25\x4a\x59\x43\
-\x36\x33\x61\x6c\x26\x81\x55\x54\x8c\x52\x35\x5c\x39\x38\x29\x07\
-\x02\x2c\x2d\x29\x2f\x5a\x59\x00\x02\xff\xec\x00\x73\x03\x46\x02\
-\x20\x00\x2f\x00\x38\x00\x00\x26\x26\x35\x34\x36\x33\x33\x32\x36\
-\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\
-\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\
-\x22\x26\x27\x06\x23\x23\x24\x36\x35\x34\x26\x23\x22\x06\x07\x0d\
-\x07\x07\x0a\x0f\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\
-\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\x0a\x0d\x62\x33\
-\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0b\x02\x0f\xa2\x35\x31\x3a\
-\x80\x38\x73\x1f\x24\x1d\x1b\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\
-\x54\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\x24\x1f\x30\x30\x12\
-\x13\x25\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x00\x02\xff\xec\x00\
-\x73\x03\x12\x02\x20\x00\x23\x00\x2c\x00\x00\x26\x26\x35\x34\x36\
-\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x23\x23\x24\x36\
-\x35\x34\x26\x23\x22\x06\x07\x0d\x07\x07\x0a\x0f\x1b\x26\x0c\x12\
-\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\
-\x22\x20\x3a\x12\x2b\x4c\x0b\x02\x0f\xa2\x35\x31\x3a\x80\x38\x73\
-\x1f\x24\x1d\x1b\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\
-\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x7d\x2c\x2d\x29\x2f\x5a\x59\
-\x00\x00\x00\xff\xff\x00\x1e\xff\xa9\x04\x65\x02\xcb\x04\x22\x00\
-\x98\x00\x00\x04\x07\x02\xb3\x02\x7a\xff\x42\xff\xff\x00\x1e\xff\
-\xa9\x04\x65\x02\xcb\x04\x22\x00\x98\x00\x00\x04\x07\x02\xb3\x02\
-\x7a\xff\x42\xff\xff\x00\x1e\xff\xa9\x04\xb0\x02\xbe\x04\x22\x00\
-\x9a\x00\x00\x04\x07\x02\xb3\x02\xc5\xff\x35\xff\xff\xff\xec\x00\
-\x73\x03\x46\x02\xbe\x04\x22\x00\x9b\x00\x00\x04\x07\x02\xb3\x01\
-\x28\xff\x35\xff\xff\xff\xec\x00\x73\x03\x12\x02\xbe\x04\x22\x00\
-\x9c\x00\x00\x04\x07\x02\xb3\x01\x33\xff\x35\x00\x02\x00\x36\x00\
-\x73\x02\xee\x03\x6e\x00\x14\x00\x1d\x00\x00\x37\x33\x36\x37\x11\
-\x37\x11\x14\x07\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\
-\x24\x36\x35\x34\x26\x23\x22\x06\x07\x36\x91\x18\x20\x6a\x03\x31\
-\x66\x30\x3b\x58\x2e\x5d\xe1\xc7\x95\x01\x94\xa2\x35\x31\x3a\x80\
-\x38\xee\x35\x2f\x02\x10\x0c\xfe\xae\x2e\x26\x2a\x2e\x35\x5c\x39\
-\x4f\x63\x31\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x02\x00\x36\x00\
-\x73\x02\xee\x03\x6e\x00\x14\x00\x1d\x00\x00\x37\x33\x36\x37\x11\
-\x37\x11\x14\x07\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\
-\x24\x36\x35\x34\x26\x23\x22\x06\x07\x36\x91\x18\x20\x6a\x03\x31\
-\x66\x30\x3b\x58\x2e\x5d\xe1\xc7\x95\x01\x94\xa2\x35\x31\x3a\x80\
-\x38\xee\x35\x2f\x02\x10\x0c\xfe\xae\x2e\x26\x2a\x2e\x35\x5c\x39\
-\x4f\x63\x31\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x02\x00\x1e\x00\
-\x73\x03\x62\x03\x6e\x00\x20\x00\x29\x00\x00\x37\x33\x36\x37\x11\
-\x37\x11\x14\x07\x36\x36\x33\x32\x16\x16\x15\x14\x07\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\x24\x36\x35\x34\
-\x26\x23\x22\x06\x07\x1e\xad\x18\x20\x6a\x0a\x32\x69\x33\x3b\x58\
-\x2e\x12\x30\x37\x0a\x0a\x07\x07\x0a\x0d\x6d\x50\x75\xfe\xdb\xb1\
-\x01\xb0\xa2\x35\x31\x3a\x80\x38\xee\x35\x2f\x02\x10\x0c\xfe\xd2\
-\x48\x36\x2d\x31\x35\x5c\x39\x34\x24\x10\x1b\x1d\x24\x1f\x39\x39\
-\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x02\xff\xec\x00\x73\x02\xce\x03\
-\x6e\x00\x25\x00\x2e\x00\x00\x26\x26\x35\x34\x36\x33\x33\x36\x37\
-\x11\x37\x11\x14\x07\x36\x36\x33\x32\x16\x16\x15\x14\x07\x16\x33\
-\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\x24\x36\x35\
-\x34\x26\x23\x22\x06\x07\x0d\x07\x07\x0a\x3a\x18\x20\x6a\x0a\x32\
-\x69\x33\x3b\x58\x2e\x12\x30\x37\x0a\x0a\x07\x07\x0a\x0d\x6d\x50\
-\x75\xfe\xdb\x5c\x01\x5b\xa2\x35\x31\x3a\x80\x38\x73\x1f\x24\x1d\
-\x1b\x35\x2f\x02\x10\x0c\xfe\xd2\x48\x36\x2d\x31\x35\x5c\x39\x34\
-\x24\x10\x1b\x1d\x24\x1f\x39\x39\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\
-\x02\xff\xec\x00\x73\x02\x5e\x03\x6e\x00\x19\x00\x22\x00\x00\x26\
-\x26\x35\x34\x36\x33\x33\x36\x37\x11\x37\x11\x14\x07\x36\x36\x33\
-\x32\x16\x16\x15\x14\x06\x06\x23\x23\x24\x36\x35\x34\x26\x23\x22\
-\x06\x07\x0d\x07\x07\x0a\x3a\x18\x20\x6a\x0a\x32\x69\x33\x3b\x58\
-\x2e\x5d\xe1\xc7\x5c\x01\x5b\xa2\x35\x31\x3a\x80\x38\x73\x1f\x24\
-\x1d\x1b\x35\x2f\x02\x10\x0c\xfe\xd2\x48\x36\x2d\x31\x35\x5c\x39\
-\x4f\x63\x31\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\xff\xff\x00\x36\x00\
-\x73\x02\xee\x03\x6e\x04\x22\x00\xa2\x00\x00\x04\x07\x02\xb3\x01\
-\xce\xff\x76\xff\xff\x00\x36\x00\x73\x02\xee\x03\x6e\x04\x22\x00\
-\xa2\x00\x00\x04\x07\x02\xb3\x01\xce\xff\x76\xff\xff\x00\x1e\x00\
-\x73\x03\x62\x03\x6e\x04\x22\x00\xa4\x00\x00\x04\x07\x02\xb3\x01\
-\xce\xff\x76\xff\xff\xff\xec\x00\x73\x02\xce\x03\x6e\x04\x22\x00\
-\xa5\x00\x00\x04\x07\x02\xb3\x01\x3c\xff\x76\xff\xff\xff\xec\x00\
-\x73\x02\x5e\x03\x6e\x04\x22\x00\xa6\x00\x00\x04\x07\x02\xb3\x01\
-\x3c\xff\x76\x00\x01\x00\x1e\xff\x35\x02\x36\x02\x92\x00\x29\x00\
-\x00\x36\x06\x15\x14\x16\x33\x16\x36\x37\x17\x06\x23\x22\x26\x26\
-\x35\x34\x37\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x23\x22\
-\x06\x15\x14\x16\x17\x37\x36\x37\x17\x06\x07\xf2\x6a\x6b\x63\x35\
-\x5a\x34\x1d\x61\x6d\x64\x95\x51\xa2\x57\x38\x5a\x32\x2d\x4a\x22\
-\x2a\x2f\x32\x31\x3e\x2d\x23\x0c\x6e\x52\x0f\x51\x3d\xd6\x5b\x3f\
-\x3e\x4e\x01\x0e\x11\x6a\x2f\x3d\x71\x4e\xa1\x5b\x39\x6d\x39\x57\
-\x2f\x1f\x1f\x59\x1f\x36\x27\x1f\x39\x10\x04\x24\x12\x70\x12\x12\
-\x00\x00\x00\x00\x01\x00\x1e\xff\x35\x02\x36\x02\x92\x00\x29\x00\
-\x00\x36\x06\x15\x14\x16\x33\x16\x36\x37\x17\x06\x23\x22\x26\x26\
-\x35\x34\x37\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x23\x22\
-\x06\x15\x14\x16\x17\x37\x36\x37\x17\x06\x07\xf2\x6a\x6b\x63\x35\
-\x5a\x34\x1d\x65\x83\x5a\x89\x4d\xa2\x57\x38\x5a\x32\x2d\x4a\x22\
-\x2a\x2f\x32\x31\x3e\x2d\x23\x0c\x6e\x52\x0f\x51\x3d\xd6\x5b\x3f\
-\x3e\x4e\x01\x0e\x11\x6a\x2f\x3e\x72\x4c\xa1\x5b\x39\x6d\x39\x57\
-\x2f\x1f\x1f\x59\x1f\x36\x27\x1f\x39\x10\x04\x24\x12\x70\x12\x12\
-\x00\x00\x00\x00\x02\x00\x1e\xff\x3d\x02\x42\x02\x1b\x00\x2b\x00\
-\x37\x00\x00\x16\x26\x35\x34\x36\x37\x26\x27\x35\x36\x36\x17\x16\
-\x16\x15\x14\x06\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x15\x14\x16\x33\x32\x36\x37\x17\x06\x06\x23\x02\
-\x16\x17\x36\x36\x35\x34\x26\x23\x22\x06\x07\xc5\xa7\x65\x57\x38\
-\x40\x40\x6e\x40\x4d\x64\x35\x31\x30\x52\x14\x0a\x07\x07\x0a\x14\
-\x4c\x73\x34\x54\x4e\x76\x6f\x2c\x49\x2a\x13\x2f\x5d\x40\x63\x37\
-\x1a\x2b\x33\x33\x28\x24\x37\x21\xc3\x61\x60\x4a\x7d\x2f\x39\x55\
-\x6c\x18\x15\x01\x01\x35\x2c\x2f\x63\x2d\x0b\x1b\x1d\x24\x1f\x1d\
-\x23\x25\x55\x28\x31\x31\x07\x0a\x6a\x0e\x0b\x02\x2f\x38\x12\x17\
-\x3c\x1b\x0d\x11\x08\x0b\x00\x00\x02\xff\xec\x00\x73\x02\x1d\x02\
-\x1b\x00\x24\x00\x2f\x00\x00\x37\x32\x37\x26\x27\x35\x36\x36\x17\
-\x16\x16\x15\x14\x06\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x26\x27\x06\x23\x23\x22\x26\x35\x34\x36\x33\x36\x17\x36\x36\
-\x35\x34\x26\x23\x22\x06\x07\x12\x5d\x3d\x2d\x43\x3f\x70\x40\x4d\
-\x63\x34\x31\x30\x52\x14\x0a\x07\x07\x0a\x14\x49\x70\x33\x69\x90\
-\x16\x0a\x07\x07\x0a\xef\x2f\x2b\x33\x33\x28\x24\x36\x20\xee\x0f\
-\x2e\x57\x6b\x19\x15\x01\x01\x35\x2c\x2f\x63\x2d\x0b\x1b\x1d\x24\
-\x1f\x1b\x20\x3b\x1f\x24\x1d\x1b\x57\x23\x18\x3c\x1a\x0d\x11\x08\
-\x0b\x00\x00\x00\x01\xff\xec\x00\x73\x01\xcb\x02\x43\x00\x20\x00\
-\x00\x36\x37\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x23\x22\
-\x06\x15\x14\x16\x17\x36\x37\x17\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x48\x1e\x36\x33\x5a\x38\x27\x4c\x1f\x27\x2a\x32\x31\x3b\
-\x29\x26\x59\x77\x14\xcd\xf1\x10\x0a\x07\x07\x0a\x0e\xee\x01\x36\
-\x58\x3b\x5a\x31\x19\x17\x62\x1a\x38\x2c\x24\x3c\x10\x07\x16\x6e\
-\x33\x1f\x24\x1d\x1b\x00\x00\xff\xff\x00\x1e\xff\x35\x02\x36\x03\
-\x65\x04\x22\x00\xac\x00\x00\x04\x07\x02\xb3\x00\xbf\xff\xdc\xff\
-\xff\x00\x1e\xff\x35\x02\x36\x03\x65\x04\x22\x00\xac\x00\x00\x04\
-\x07\x02\xb3\x00\xbf\xff\xdc\xff\xff\x00\x1e\xff\x3d\x02\x42\x02\
-\xfe\x04\x22\x00\xae\x00\x00\x04\x07\x02\xb3\x00\xe7\xff\x75\xff\
-\xff\xff\xec\x00\x73\x02\x1d\x02\xfe\x04\x22\x00\xaf\x00\x00\x04\
-\x07\x02\xb3\x00\xb6\xff\x75\xff\xff\xff\xec\x00\x73\x01\xcb\x03\
-\x27\x04\x22\x00\xb0\x00\x00\x04\x07\x02\xb3\x00\x87\xff\x9e\xff\
-\xff\x00\x1e\x00\x73\x03\x54\x03\x93\x04\x22\x00\xc0\x00\x00\x04\
-\x07\x02\xb3\x02\x29\x00\x0a\xff\xff\x00\x1e\x00\x73\x03\x54\x03\
-\x93\x04\x22\x00\xc0\x00\x00\x04\x07\x02\xb3\x02\x29\x00\x0a\xff\
-\xff\x00\x1e\x00\x73\x03\xb7\x03\x1e\x04\x22\x00\xc1\x00\x00\x04\
-\x07\x02\xb3\x02\x6f\xff\x95\xff\xff\xff\xec\x00\x73\x01\xf2\x03\
-\x19\x04\x22\x00\xc2\x00\x00\x04\x07\x02\xb3\x00\xa9\xff\x90\xff\
-\xff\xff\xec\x00\x73\x01\x9d\x03\x80\x04\x22\x00\xc3\x00\x00\x04\
-\x06\x02\xb3\x73\xf7\x00\x00\xff\xff\x00\x1e\x00\x73\x03\x54\x03\
-\xf1\x04\x22\x00\xc0\x00\x00\x04\x07\x02\xbd\x01\xe7\x01\xcb\xff\
-\xff\x00\x1e\x00\x73\x03\x54\x03\xf1\x04\x02\x00\xbb\x00\x00\xff\
-\xff\x00\x1e\x00\x73\x03\xb7\x03\x7c\x04\x22\x00\xc1\x00\x00\x04\
-\x07\x02\xbd\x02\x2d\x01\x56\xff\xff\xff\xec\x00\x73\x01\xf2\x03\
-\x77\x04\x22\x00\xc2\x00\x00\x04\x07\x02\xbd\x00\x67\x01\x51\xff\
-\xff\xff\xec\x00\x73\x01\x9d\x03\xdd\x04\x22\x00\xc3\x00\x00\x04\
-\x07\x02\xbd\x00\x30\x01\xb7\x00\x02\x00\x1e\x00\x73\x03\x54\x02\
-\xb1\x00\x23\x00\x2f\x00\x00\x36\x35\x34\x36\x37\x17\x06\x06\x17\
-\x1e\x02\x33\x32\x36\x37\x36\x27\x06\x23\x22\x26\x35\x34\x36\x36\
-\x33\x32\x16\x16\x15\x14\x06\x07\x06\x21\x12\x16\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x15\x1e\x0f\x15\x53\x0e\x09\x01\x01\x3f\x8d\
-\x77\xa5\x8e\x04\x03\x02\x35\x48\x4f\x5f\x2e\x50\x32\x3c\x61\x37\
-\x10\x12\x30\xfe\xbb\x6a\x34\x2e\x20\x30\x19\x0d\x3d\x29\x25\x33\
-\x73\xd2\x29\x4e\x40\x16\x30\x3a\x19\x2a\x33\x18\x24\x1b\x14\x1e\
-\x20\x58\x4c\x39\x5e\x37\x53\x94\x5e\x25\x37\x18\x85\x01\x5a\x26\
-\x0a\x0d\x3f\x40\x2e\x21\x00\x00\x02\x00\x1e\x00\x73\x03\xb7\x02\
-\x37\x00\x2d\x00\x39\x00\x00\x25\x26\x26\x35\x34\x36\x37\x17\x06\
-\x06\x17\x1e\x02\x33\x33\x32\x37\x26\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\
-\x27\x06\x23\x23\x36\x16\x17\x36\x36\x35\x34\x26\x23\x22\x06\x15\
-\x01\xc1\xd5\xce\x0f\x15\x53\x0e\x09\x01\x01\x41\x8e\x7a\x0e\x4b\
-\x2c\x3b\x2f\x50\x2f\x30\x50\x2e\x3e\x26\x3d\x12\x0a\x07\x07\x0a\
-\x0f\x45\x5f\x2f\x5d\x90\x15\xac\x2a\x29\x28\x2b\x2f\x24\x24\x2f\
-\x73\x01\x69\x68\x29\x4e\x40\x16\x30\x3a\x19\x2c\x33\x16\x06\x33\
-\x52\x31\x58\x35\x35\x58\x31\x50\x36\x05\x1b\x1d\x24\x1f\x15\x18\
-\x2d\xd9\x30\x0d\x0c\x31\x1d\x24\x34\x34\x22\x00\x02\xff\xec\x00\
-\x73\x01\xf2\x02\x37\x00\x24\x00\x30\x00\x00\x00\x16\x16\x15\x14\
-\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x23\
-\x23\x22\x26\x35\x34\x36\x33\x33\x32\x37\x26\x35\x34\x36\x36\x33\
-\x06\x16\x17\x36\x36\x35\x34\x26\x23\x22\x06\x15\x01\x2c\x50\x2e\
-\x3e\x26\x3d\x12\x0a\x07\x07\x0a\x0f\x45\x5f\x2f\x5d\x90\x15\x0a\
-\x07\x07\x0a\x15\x4b\x2c\x3b\x2f\x50\x2f\x53\x2a\x29\x28\x2b\x2f\
-\x24\x24\x2f\x02\x37\x35\x58\x31\x50\x36\x05\x1b\x1d\x24\x1f\x15\
-\x18\x2d\x1f\x24\x1d\x1b\x06\x33\x52\x31\x58\x35\xeb\x30\x0d\x0c\
-\x31\x1d\x24\x34\x34\x22\x00\x00\x02\xff\xec\x00\x73\x01\x9d\x02\
-\xa3\x00\x1f\x00\x2b\x00\x00\x37\x32\x36\x37\x36\x35\x06\x23\x22\
-\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x07\x06\x06\x23\
-\x23\x22\x26\x35\x34\x36\x33\x36\x16\x33\x32\x36\x37\x26\x26\x23\
-\x22\x06\x15\x11\xad\x7d\x04\x03\x35\x46\x4e\x61\x2d\x50\x30\x3e\
-\x62\x38\x13\x16\x24\xa8\x94\x17\x0a\x07\x07\x0a\x72\x33\x2e\x21\
-\x2f\x19\x0c\x3e\x29\x25\x32\xee\x1d\x18\x14\x1a\x20\x5c\x4c\x37\
-\x5d\x36\x52\x94\x5f\x30\x4a\x1b\x2b\x2b\x1f\x24\x1d\x1b\xd2\x26\
-\x0a\x0d\x3f\x40\x2e\x21\x00\xff\xff\x00\x1e\xff\x9e\x03\x54\x02\
-\xb1\x04\x22\x00\xc0\x00\x00\x04\x07\x02\xb4\x02\x1c\xff\x49\xff\
-\xff\x00\x1e\xff\x3b\x03\x54\x02\xb1\x04\x22\x00\xc0\x00\x00\x04\
-\x07\x02\xbb\x01\xd7\xfe\x56\x00\x02\x00\x1e\xff\x54\x02\x80\x01\
-\xfe\x00\x23\x00\x2f\x00\x00\x00\x16\x16\x15\x23\x15\x06\x06\x23\
-\x22\x26\x26\x35\x34\x37\x17\x06\x17\x16\x16\x33\x32\x36\x36\x35\
-\x34\x27\x06\x23\x22\x26\x35\x34\x36\x36\x33\x06\x16\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x15\x01\xe8\x61\x37\x01\x05\xa0\x93\x5a\
-\x86\x49\x2f\x4f\x1c\x01\x01\x6b\x6a\x40\x5c\x30\x02\x36\x40\x4f\
-\x61\x2e\x50\x31\x57\x34\x2e\x20\x2d\x18\x0c\x3e\x29\x23\x31\x01\
-\xfe\x53\x95\x60\x1d\x97\xae\x42\x7a\x51\x61\x61\x1a\x4a\x48\x4b\
-\x5e\x29\x44\x29\x16\x1e\x1b\x61\x54\x39\x5d\x36\xea\x26\x08\x0c\
-\x40\x41\x2f\x20\x00\x00\x00\x00\x02\x00\x1e\xff\x54\x02\xae\x01\
-\xfe\x00\x27\x00\x31\x00\x00\x24\x16\x15\x14\x06\x23\x23\x06\x06\
-\x23\x22\x26\x26\x35\x34\x37\x17\x06\x17\x16\x16\x33\x32\x36\x36\
-\x35\x35\x23\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\x17\x33\x24\
-\x16\x33\x33\x26\x26\x23\x22\x06\x15\x02\xa7\x07\x07\x0a\x21\x0e\
-\x9e\x89\x5a\x86\x49\x2f\x4f\x1c\x01\x01\x6b\x6a\x40\x5c\x30\x63\
-\x5a\x6e\x2f\x51\x31\x37\x5a\x3a\x08\x21\xfe\xb5\x36\x36\x5d\x0b\
-\x41\x2c\x25\x2c\xee\x1b\x1d\x24\x1f\x86\x99\x42\x7a\x51\x61\x61\
-\x1a\x4a\x48\x4b\x5e\x29\x44\x29\x12\x62\x57\x39\x5f\x37\x43\x7b\
-\x52\x26\x27\x4a\x4c\x2c\x20\xff\xff\x00\x1e\xff\x54\x02\x80\x02\
-\xe2\x04\x22\x00\xc6\x00\x00\x04\x07\x02\xb8\x01\x1b\xff\x7a\xff\
-\xff\x00\x1e\xff\x54\x02\x80\x02\xe2\x04\x22\x00\xc6\x00\x00\x04\
-\x07\x02\xb8\x01\x1b\xff\x7a\xff\xff\x00\x1e\xff\x54\x02\xae\x02\
-\xe2\x04\x22\x00\xc7\x00\x00\x04\x07\x02\xb8\x01\x18\xff\x7a\xff\
-\xff\xff\xec\x00\x73\x01\xf2\x03\x1d\x04\x22\x00\xc2\x00\x00\x04\
-\x06\x02\xb8\x65\xb5\x00\x00\xff\xff\xff\xec\x00\x73\x01\x9d\x03\
-\x84\x04\x22\x00\xc3\x00\x00\x04\x06\x02\xb8\x2e\x1c\x00\x00\xff\
-\xff\x00\x1e\xff\x54\x02\x80\x02\xde\x04\x22\x00\xc6\x00\x00\x04\
-\x07\x02\xb3\x01\x60\xff\x55\xff\xff\x00\x1e\xff\x54\x02\x80\x03\
-\x3c\x04\x22\x00\xc6\x00\x00\x04\x07\x02\xbd\x01\x1d\x01\x16\x00\
-\x02\x00\x32\x00\x73\x02\xee\x03\x6f\x00\x14\x00\x2d\x00\x00\x24\
-\x21\x22\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\
-\x37\x11\x37\x11\x25\x16\x33\x32\x37\x26\x26\x27\x26\x26\x35\x34\
-\x36\x37\x17\x06\x07\x16\x16\x15\x14\x06\x23\x22\x27\x02\xee\xfe\
-\x98\xa7\xad\x0f\x15\x53\x0e\x09\x01\x02\x74\x84\x62\x7c\x19\x6a\
-\xfe\x41\x27\x26\x2d\x1c\x2b\x24\x09\x0b\x09\x59\x3f\x0a\x3c\x24\
-\x3a\x2e\x45\x3a\x2f\x31\x73\x69\x69\x29\x4e\x40\x16\x31\x39\x19\
-\x3e\x37\x15\x10\x02\x4c\x10\xfd\xc1\xb6\x10\x13\x13\x13\x0a\x09\
-\x11\x0c\x28\x4b\x17\x4e\x12\x1a\x1a\x26\x18\x2d\x3c\x18\x00\x00\
-\x01\x00\x1e\x00\x73\x04\xd0\x02\xdb\x00\x2a\x00\x00\x37\x21\x32\
-\x36\x37\x2e\x02\x23\x22\x07\x23\x06\x23\x22\x26\x26\x35\x34\x36\
-\x36\x37\x17\x0e\x02\x15\x14\x16\x16\x33\x32\x37\x37\x32\x16\x16\
-\x15\x14\x06\x06\x23\x21\x1e\x03\x1f\x9f\x80\x22\x07\x3d\x86\x76\
-\x21\x60\x14\x18\x2d\x80\x85\x2f\x6e\xb4\x64\x16\x62\x8c\x46\x19\
-\x51\x51\x49\x75\x39\x88\xaa\x54\x42\xbd\xb8\xfd\x17\xee\x05\x07\
-\x1a\x1e\x0e\x02\x01\x19\x30\x27\x41\x7a\x5d\x16\x77\x15\x39\x37\
-\x12\x09\x0a\x06\x03\x01\x25\x56\x49\x31\x36\x1a\x00\x00\x00\x00\
-\x02\x00\x32\x00\x73\x02\xee\x03\x6e\x00\x14\x00\x2d\x00\x00\x24\
-\x21\x22\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\
-\x37\x11\x37\x11\x25\x16\x33\x32\x37\x26\x26\x27\x26\x26\x35\x34\
-\x36\x37\x17\x06\x07\x16\x16\x15\x14\x06\x23\x22\x27\x02\xee\xfe\
-\x98\xa7\xad\x0f\x15\x53\x0e\x09\x01\x02\x74\x84\x62\x7c\x19\x6a\
-\xfe\x41\x27\x26\x2d\x1c\x2b\x24\x09\x0b\x09\x59\x3f\x0a\x3c\x24\
-\x3a\x2e\x45\x3a\x2f\x31\x73\x69\x69\x29\x4e\x40\x16\x31\x39\x19\
-\x3e\x37\x15\x10\x02\x4b\x10\xfd\xc2\xa4\x10\x13\x13\x13\x0a\x09\
-\x11\x0c\x28\x4b\x17\x4e\x12\x1a\x1a\x26\x18\x2d\x3c\x18\x00\x00\
-\x02\x00\x32\x00\x73\x03\x67\x03\x6f\x00\x18\x00\x3b\x00\x00\x00\
-\x07\x16\x16\x15\x14\x06\x23\x22\x27\x37\x16\x33\x32\x37\x26\x26\
-\x27\x26\x26\x35\x34\x36\x37\x17\x00\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x37\x11\x37\x11\x14\x16\x16\x33\x33\x32\x16\x15\
-\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x35\x01\xbf\x24\x3a\x2e\
-\x45\x3a\x2f\x31\x0b\x27\x26\x2d\x1c\x2b\x24\x09\x0b\x09\x59\x3f\
-\x0a\xfe\x37\x0f\x15\x53\x0e\x09\x01\x02\x74\x84\x62\x7c\x19\x6a\
-\x0e\x27\x27\x0c\x0a\x07\x07\x0a\x10\x66\x30\x57\xd3\xa7\xad\x02\
-\x69\x1a\x1a\x26\x18\x2d\x3c\x18\x40\x10\x13\x13\x13\x0a\x09\x11\
-\x0c\x28\x4b\x17\x4e\xfe\xf3\x4e\x40\x16\x31\x39\x19\x3e\x37\x15\
-\x10\x02\x4c\x10\xfd\xd6\x25\x24\x0e\x1b\x1d\x24\x1f\x40\x40\x69\
-\x69\x00\x00\x00\x01\x00\x1e\x00\x73\x05\x89\x02\xdb\x00\x36\x00\
-\x00\x37\x21\x32\x36\x37\x2e\x02\x23\x22\x07\x23\x06\x23\x22\x26\
-\x26\x35\x34\x36\x36\x37\x17\x0e\x02\x15\x14\x16\x16\x33\x32\x37\
-\x37\x32\x16\x16\x17\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x06\x23\x21\x1e\x03\x1f\x9f\x80\x22\x07\x3d\x86\x76\
-\x21\x60\x14\x18\x2d\x80\x85\x2f\x6e\xb4\x64\x16\x62\x8c\x46\x19\
-\x51\x51\x49\x75\x3a\x83\xa6\x57\x04\x26\x48\x2e\x0d\x0a\x07\x07\
-\x0a\x11\x72\x53\x29\xb8\xa8\xfd\x17\xee\x05\x07\x1a\x1e\x0e\x02\
-\x01\x19\x30\x27\x41\x7a\x5d\x16\x77\x15\x39\x37\x12\x09\x0a\x06\
-\x03\x01\x23\x4f\x42\x0c\x0a\x1b\x1d\x24\x1f\x2d\x18\x15\x00\x00\
-\x01\xff\xec\x00\x73\x02\x2d\x03\x31\x00\x24\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x32\x36\x37\x26\x26\x27\x35\x25\x17\x05\x13\x1e\x02\x33\
-\x33\x02\x26\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x1a\x0a\x07\
-\x07\x0a\x19\x4e\x6a\x13\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\
-\x2c\x2e\x22\x0f\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\x1f\x24\x1d\
-\x1b\x1c\x19\x2f\x79\x6a\x74\x88\x73\x6b\xfe\xfb\x28\x28\x10\x00\
-\x01\xff\xec\x00\x73\x04\xc6\x02\xdb\x00\x3a\x00\x00\x26\x26\x35\
-\x34\x36\x33\x21\x32\x36\x37\x2e\x02\x23\x22\x07\x23\x06\x23\x22\
-\x26\x26\x35\x34\x36\x36\x37\x17\x0e\x02\x15\x14\x16\x16\x33\x32\
-\x37\x37\x32\x16\x17\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x06\x23\x21\x0d\x07\x07\x0a\x02\x82\x9f\x80\x22\x07\
-\x3d\x86\x76\x21\x60\x14\x18\x2d\x80\x85\x2f\x6e\xb4\x64\x16\x62\
-\x8c\x46\x19\x51\x51\x49\x75\x3b\xc0\xb9\x0a\x22\x46\x2f\x0d\x0a\
-\x07\x07\x0a\x11\x6f\x51\x2a\xb8\xa7\xfd\xa2\x73\x1f\x24\x1d\x1b\
-\x05\x07\x1a\x1e\x0e\x02\x01\x19\x30\x27\x41\x7a\x5d\x16\x77\x15\
-\x39\x37\x12\x09\x0a\x06\x03\x01\x4f\x5e\x10\x0d\x1b\x1d\x24\x1f\
-\x2d\x18\x15\x00\x01\xff\xec\x00\x73\x01\xbf\x03\x31\x00\x18\x00\
-\x00\x01\x17\x05\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x35\x34\
-\x36\x33\x33\x32\x36\x37\x26\x26\x27\x35\x01\xa8\x17\xfe\xde\x5a\
-\x48\x45\x86\x5d\x1a\x0a\x07\x07\x0a\x19\x4e\x6a\x13\x09\x4b\x5e\
-\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x1f\x24\x1d\x1b\x1c\x19\
-\x2f\x79\x6a\x74\x00\x00\x00\x00\x01\xff\xec\x00\x73\x04\x12\x02\
-\xdb\x00\x2f\x00\x00\x26\x26\x35\x34\x36\x33\x21\x32\x36\x37\x2e\
-\x02\x23\x22\x07\x23\x06\x23\x22\x26\x26\x35\x34\x36\x36\x37\x17\
-\x0e\x02\x15\x14\x16\x16\x33\x32\x37\x37\x32\x16\x16\x15\x14\x06\
-\x06\x23\x21\x0d\x07\x07\x0a\x02\x82\x9f\x80\x22\x07\x3d\x86\x76\
-\x21\x60\x14\x18\x2d\x80\x85\x2f\x6e\xb4\x64\x16\x62\x8c\x46\x19\
-\x51\x51\x49\x75\x39\x88\xaa\x54\x42\xbd\xb8\xfd\xa2\x73\x1f\x24\
-\x1d\x1b\x05\x07\x1a\x1e\x0e\x02\x01\x19\x30\x27\x41\x7a\x5d\x16\
-\x77\x15\x39\x37\x12\x09\x0a\x06\x03\x01\x25\x56\x49\x31\x36\x1a\
-\x00\x00\x00\x00\x01\x00\x1e\x00\x73\x03\x6d\x03\x31\x00\x21\x00\
-\x00\x01\x17\x05\x16\x16\x15\x14\x06\x06\x23\x23\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x1e\x02\x3b\x02\x32\x36\x37\x26\x26\x27\
-\x35\x03\x56\x17\xfe\xde\x5a\x48\x45\x86\x5d\x1a\xd0\xbd\x0f\x15\
-\x53\x0e\x09\x01\x01\x39\x83\x72\x02\x14\x4e\x6a\x13\x09\x4b\x5e\
-\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x01\x65\x6c\x29\x4e\x40\
-\x16\x30\x3a\x19\x2b\x32\x18\x1c\x19\x2f\x79\x6a\x74\x00\x00\xff\
-\xff\x00\x1e\x00\x73\x03\x6d\x03\x31\x04\x02\x00\xd8\x00\x00\x00\
-\x01\x00\x1e\x00\x73\x03\xbe\x03\x31\x00\x2e\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x26\x27\x06\x06\x2b\x03\x26\x26\x35\x34\x36\
-\x37\x17\x06\x06\x17\x1e\x02\x33\x33\x32\x36\x37\x26\x26\x27\x35\
-\x25\x17\x05\x13\x1e\x02\x33\x33\x03\xb7\x07\x07\x0a\x12\x44\x59\
-\x37\x18\x94\x73\x10\x0a\x01\xbc\xb3\x0f\x15\x53\x0e\x09\x01\x01\
-\x37\x79\x68\x0f\x4e\x6a\x13\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\
-\x20\x2c\x2e\x22\x0f\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\x02\x65\
-\x6b\x29\x4e\x40\x16\x30\x3a\x19\x2a\x33\x18\x1c\x19\x2f\x79\x6a\
-\x74\x88\x73\x6b\xfe\xfb\x28\x28\x10\x00\x00\xff\xff\xff\xec\x00\
-\x73\x02\x2d\x03\x31\x04\x02\x00\xd4\x00\x00\xff\xff\xff\xec\x00\
-\x73\x01\xbf\x03\x31\x04\x02\x00\xd6\x00\x00\xff\xff\x00\x1e\x00\
-\x73\x03\x6d\x04\x0f\x04\x22\x00\xd8\x00\x00\x04\x07\x02\xbd\x01\
-\xba\x01\xe9\xff\xff\x00\x1e\x00\x73\x03\x6d\x03\x9e\x04\x22\x00\
-\xd8\x00\x00\x04\x07\x02\xc4\x01\xdd\x00\x1d\xff\xff\x00\x1e\x00\
-\x73\x04\xd0\x03\x4c\x04\x22\x00\xd0\x00\x00\x04\x07\x02\xc5\x01\
-\x33\xff\xb4\xff\xff\x00\x1e\x00\x73\x03\x6d\x03\x9e\x04\x02\x00\
-\xde\x00\x00\xff\xff\x00\x1e\x00\x73\x03\xbe\x03\x9e\x04\x22\x00\
-\xda\x00\x00\x04\x07\x02\xc4\x01\xc0\x00\x1d\xff\xff\x00\x1e\x00\
-\x73\x05\x89\x03\x4c\x04\x22\x00\xd3\x00\x00\x04\x07\x02\xc5\x01\
-\x33\xff\xb4\xff\xff\xff\xec\x00\x73\x02\x2d\x03\x9e\x04\x22\x00\
-\xd4\x00\x00\x04\x06\x02\xc4\x2f\x1d\x00\x00\xff\xff\xff\xec\x00\
-\x73\x04\xc6\x03\x4c\x04\x22\x00\xd5\x00\x00\x04\x06\x02\xc5\x75\
-\xb4\x00\x00\xff\xff\xff\xec\x00\x73\x01\xbf\x03\x9e\x04\x22\x00\
-\xd6\x00\x00\x04\x06\x02\xc4\x2f\x1d\x00\x00\xff\xff\xff\xec\x00\
-\x73\x04\x12\x03\x4c\x04\x22\x00\xd7\x00\x00\x04\x06\x02\xc5\x75\
-\xb4\x00\x00\x00\x02\x00\x1e\x00\x73\x03\x6d\x03\x31\x00\x2c\x00\
-\x38\x00\x00\x01\x17\x07\x16\x15\x14\x06\x23\x22\x26\x35\x34\x37\
-\x07\x16\x16\x15\x14\x06\x06\x23\x23\x26\x26\x35\x34\x36\x37\x17\
-\x06\x06\x17\x1e\x02\x3b\x02\x32\x36\x37\x26\x26\x27\x35\x16\x16\
-\x33\x32\x36\x35\x34\x26\x23\x22\x06\x15\x03\x56\x17\x56\x1b\x2e\
-\x20\x23\x2b\x01\x4c\x5a\x48\x45\x86\x5d\x1a\xd0\xbd\x0f\x15\x53\
-\x0e\x09\x01\x01\x39\x83\x72\x02\x14\x4e\x6a\x13\x09\x4b\x5e\xe2\
-\x13\x14\x11\x13\x14\x12\x11\x14\x03\x31\x73\x20\x19\x27\x26\x2a\
-\x2a\x25\x0b\x06\x1d\x68\x90\x39\x2f\x4f\x2f\x01\x65\x6c\x29\x4e\
-\x40\x16\x30\x3a\x19\x2b\x32\x18\x1c\x19\x2f\x79\x6a\x74\x5b\x13\
-\x12\x0f\x11\x17\x16\x11\x00\xff\xff\x00\x32\x00\x73\x02\xee\x04\
-\x15\x04\x22\x00\xcf\x00\x00\x04\x07\x02\xbd\x00\xf9\x01\xef\xff\
-\xff\x00\x32\x00\x73\x02\xee\x04\x15\x04\x02\x00\xe8\x00\x00\xff\
-\xff\x00\x32\x00\x73\x03\x67\x04\x15\x04\x22\x00\xd2\x00\x00\x04\
-\x07\x02\xbd\x00\xf9\x01\xef\xff\xff\xff\xec\x00\x73\x02\x2d\x04\
-\x0f\x04\x22\x00\xd4\x00\x00\x04\x07\x02\xbd\x00\x0c\x01\xe9\xff\
-\xff\xff\xec\x00\x73\x01\xbf\x04\x0f\x04\x22\x00\xd6\x00\x00\x04\
-\x07\x02\xbd\x00\x0c\x01\xe9\x00\x01\x00\x1e\xff\xb4\x02\x5b\x03\
-\x6e\x00\x14\x00\x00\x01\x11\x14\x06\x23\x22\x26\x26\x35\x34\x37\
-\x17\x06\x15\x14\x16\x33\x32\x36\x35\x11\x02\x5b\x9b\x8a\x51\x7f\
-\x48\x20\x55\x10\x5e\x59\x5e\x59\x03\x6e\xfd\x88\x9c\xa6\x3e\x75\
-\x51\x4d\x55\x1b\x38\x2a\x55\x59\x65\x69\x02\x65\x00\x00\x00\x00\
-\x01\x00\x1e\xff\xb4\x02\x5b\x03\x6e\x00\x14\x00\x00\x01\x11\x14\
-\x06\x23\x22\x26\x26\x35\x34\x37\x17\x06\x15\x14\x16\x33\x32\x36\
-\x35\x11\x02\x5b\x9b\x8a\x51\x7f\x48\x20\x55\x10\x5e\x59\x5e\x59\
-\x03\x6e\xfd\x88\x9c\xa6\x3e\x75\x51\x4d\x55\x1b\x38\x2a\x55\x59\
-\x65\x69\x02\x65\x00\x00\x00\x00\x01\x00\x1e\xff\xb4\x02\xdd\x03\
-\x6e\x00\x22\x00\x00\x01\x11\x14\x16\x16\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x27\x06\x06\x23\x22\x26\x26\x35\x34\x37\x17\x06\
-\x15\x14\x16\x33\x32\x36\x35\x11\x02\x5b\x0f\x27\x2a\x11\x0a\x07\
-\x07\x0a\x11\x40\x29\x16\x94\x71\x52\x7f\x48\x20\x55\x10\x5e\x59\
-\x5e\x59\x03\x6e\xfe\x03\x3b\x36\x12\x1b\x1d\x24\x1f\x23\x6e\x74\
-\x3e\x75\x51\x4d\x55\x1b\x38\x2a\x55\x59\x65\x69\x02\x65\x00\x00\
-\x01\xff\xec\x00\x73\x01\x66\x03\x6e\x00\x1c\x00\x00\x13\x37\x11\
-\x14\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x23\
-\x22\x26\x35\x34\x36\x33\x33\x32\x36\x35\x7c\x6a\x2f\x30\x10\x0a\
-\x07\x07\x0a\x0d\x78\x1e\x29\x7b\x11\x0a\x07\x07\x0a\x11\x33\x3a\
-\x03\x62\x0c\xfd\xda\x34\x26\x1b\x1d\x24\x1f\x4c\x4c\x1f\x24\x1d\
-\x1b\x27\x33\x00\x01\xff\xec\x00\x73\x00\xbd\x03\x6e\x00\x10\x00\
-\x00\x36\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x35\x1e\x6a\x5c\x52\x12\x0a\x07\x07\x0a\x0e\xee\x1c\x2c\
-\x02\x2c\x0c\xfd\xd0\x5e\x6d\x1f\x24\x1d\x1b\x00\x01\x00\x28\xff\
-\x2c\x02\x0e\x02\x66\x00\x21\x00\x00\x12\x36\x33\x32\x16\x16\x15\
-\x14\x23\x22\x27\x27\x26\x06\x15\x03\x07\x11\x34\x36\x17\x17\x16\
-\x33\x32\x35\x34\x26\x26\x27\x22\x06\x07\x27\x97\x55\x3e\x39\x6a\
-\x41\xa5\x0a\x1a\x82\x1a\x16\x01\x6a\x3e\x3b\x8c\x25\x1f\x3d\x25\
-\x3b\x1e\x1e\x32\x17\x4d\x02\x10\x56\x53\x89\x4b\x8c\x02\x0b\x02\
-\x15\x1b\xfe\xa0\x06\x01\x99\x3f\x3f\x06\x0d\x04\x15\x2e\x4e\x2e\
-\x01\x29\x2e\x22\x00\x00\x00\x00\x01\x00\x28\xff\x2c\x02\x0e\x02\
-\x66\x00\x21\x00\x00\x12\x36\x33\x32\x16\x16\x15\x14\x23\x22\x27\
-\x27\x26\x06\x15\x03\x07\x11\x34\x36\x17\x17\x16\x33\x32\x35\x34\
-\x26\x26\x27\x22\x06\x07\x27\x97\x55\x3e\x39\x6a\x41\xa5\x0a\x1a\
-\x82\x1a\x16\x01\x6a\x3e\x3b\x8c\x25\x1f\x3d\x25\x3b\x1e\x1e\x32\
-\x17\x4d\x02\x10\x56\x53\x89\x4b\x8c\x02\x0b\x02\x15\x1b\xfe\xa0\
-\x06\x01\x99\x3f\x3f\x06\x0d\x04\x15\x2e\x4e\x2e\x01\x29\x2e\x22\
-\x00\x00\x00\x00\x02\x00\x1e\xff\x29\x02\x62\x02\x0a\x00\x1e\x00\
-\x29\x00\x00\x00\x16\x17\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\
-\x36\x33\x02\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x01\x52\x58\
-\x2a\x20\x30\x24\x09\x0a\x07\x07\x0a\x0b\x2b\x49\x17\x3e\x60\x55\
-\x3a\x06\x6a\x1a\x1b\x58\x70\x3c\x3f\x1f\x36\x19\x1d\x33\x22\x21\
-\x32\x1b\x02\x0a\x4d\x5a\x45\x30\x1b\x1d\x24\x1f\x22\x22\x44\x33\
-\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\xfe\xe4\x11\x14\x48\
-\x39\x38\x45\x00\x02\xff\xec\x00\x73\x02\x79\x02\x0a\x00\x26\x00\
-\x31\x00\x00\x00\x16\x17\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\
-\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x02\x16\x33\x32\x37\x26\
-\x26\x23\x22\x06\x07\x01\x69\x56\x29\x22\x30\x25\x09\x0a\x07\x07\
-\x0a\x0a\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\
-\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x55\x37\x20\x41\x2e\x1b\x33\
-\x23\x23\x33\x1b\x02\x0a\x4b\x58\x46\x33\x1b\x1d\x24\x1f\x22\x21\
-\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\xfe\xf6\x12\
-\x26\x48\x38\x38\x45\x00\x00\x00\x02\xff\xec\x00\x73\x01\xfb\x02\
-\x08\x00\x1a\x00\x25\x00\x00\x37\x32\x36\x36\x37\x36\x36\x33\x32\
-\x16\x16\x17\x14\x06\x23\x22\x27\x06\x06\x23\x23\x22\x26\x35\x34\
-\x36\x33\x20\x33\x32\x36\x27\x26\x26\x23\x22\x06\x07\x06\x19\x24\
-\x25\x19\x2f\x5b\x3b\x33\x52\x2f\x01\x66\x5b\x67\x48\x18\x44\x27\
-\x0b\x0a\x07\x07\x0a\x01\x09\x40\x2a\x2c\x01\x02\x30\x27\x22\x39\
-\x1e\xee\x11\x30\x30\x5c\x4d\x41\x69\x39\x4f\x63\x3c\x1e\x1e\x1f\
-\x24\x1d\x1b\x1e\x1c\x2c\x40\x3f\x49\x00\x00\xff\xff\x00\x1e\xff\
-\xb0\x02\x65\x02\x9f\x04\x22\x00\xfc\x00\x00\x04\x07\x02\xb3\x00\
-\xfe\xff\x16\xff\xff\x00\x1e\xff\xb0\x02\x65\x02\x9f\x04\x22\x00\
-\xfc\x00\x00\x04\x07\x02\xb3\x00\xfe\xff\x16\xff\xff\x00\x23\xff\
-\xb0\x03\x01\x02\x9f\x04\x22\x00\xfe\x00\x00\x04\x07\x02\xb3\x00\
-\xf2\xff\x16\xff\xff\xff\xec\x00\x73\x01\x84\x02\xa3\x04\x22\x00\
-\x1c\x00\x00\x04\x07\x02\xb3\x00\x54\xff\x1a\xff\xff\xff\xec\x00\
-\x73\x00\xe3\x03\x00\x04\x22\x00\x1d\x00\x00\x04\x07\x02\xb3\x00\
-\x0c\xff\x77\x00\x01\x00\x1e\xff\xb0\x02\x65\x01\xe2\x00\x1a\x00\
-\x00\x16\x26\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\
-\x35\x34\x26\x27\x37\x16\x16\x07\x0e\x02\x23\xe2\x7f\x45\x2a\x55\
-\x1a\x60\x5e\x40\x57\x2a\x1b\x29\x66\x26\x1b\x01\x01\x3f\x88\x66\
-\x50\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\x28\x3c\x1d\x36\
-\x6b\x6e\x2b\x67\x81\x3f\x3f\x7b\x51\x00\x00\xff\xff\x00\x1e\xff\
-\xb0\x02\x65\x01\xe2\x04\x02\x00\xfc\x00\x00\x00\x01\x00\x23\xff\
-\xb0\x03\x01\x01\xe2\x00\x26\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x26\x27\x0e\x02\x23\x22\x26\x26\x35\x34\x37\x17\x06\x15\x14\
-\x16\x17\x32\x36\x36\x35\x34\x26\x27\x37\x16\x17\x16\x33\x33\x02\
-\xfa\x07\x07\x0a\x0d\x1d\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x2a\
-\x55\x1a\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x0a\xee\
-\x1b\x1d\x24\x1f\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\
-\x38\x58\x60\x01\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x00\x00\
-\x03\x00\x1e\xff\x35\x02\x65\x02\x9f\x00\x03\x00\x27\x00\x33\x00\
-\x00\x13\x37\x17\x07\x04\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\
-\x35\x34\x26\x27\x37\x16\x16\x07\x0e\x02\x07\x16\x15\x14\x06\x23\
-\x22\x26\x35\x34\x37\x26\x26\x35\x12\x16\x33\x32\x36\x35\x34\x26\
-\x23\x22\x06\x15\xf9\x4e\x4d\x4d\xfe\xd7\x2a\x55\x1a\x60\x5e\x40\
-\x57\x2a\x1b\x29\x66\x26\x1b\x01\x01\x30\x67\x4d\x0f\x2e\x20\x23\
-\x2b\x0d\x68\x79\xfd\x13\x14\x11\x13\x14\x12\x11\x14\x02\x51\x4e\
-\x4e\x4d\xe8\x62\x1e\x48\x38\x58\x60\x01\x28\x3c\x1d\x36\x6b\x6e\
-\x2b\x67\x81\x3f\x37\x6d\x53\x0e\x15\x1c\x26\x2a\x2a\x25\x1b\x15\
-\x10\x91\x6d\xfe\xb3\x13\x12\x0f\x11\x17\x16\x11\x00\x00\x00\x00\
-\x02\x00\x3a\x00\x73\x01\xc7\x02\x7d\x00\x10\x00\x1c\x00\x00\x36\
-\x26\x26\x35\x34\x36\x37\x26\x27\x37\x16\x16\x15\x14\x06\x06\x23\
-\x26\x16\x33\x32\x36\x35\x34\x26\x27\x06\x06\x15\xc9\x5b\x34\x48\
-\x3b\x18\x18\x43\x75\x82\x34\x5a\x38\x64\x39\x33\x29\x33\x37\x26\
-\x32\x39\x73\x2d\x51\x34\x42\x7b\x2c\x11\x0e\x50\x47\xa1\x5f\x39\
-\x59\x31\xa6\x2b\x29\x28\x2c\x50\x1a\x1b\x54\x28\x00\x00\x00\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x02\x7d\x04\x02\x01\x00\x00\x00\x00\
-\x02\x00\x2b\x00\x73\x02\x0b\x02\x54\x00\x17\x00\x21\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x35\x34\x36\x37\
-\x35\x37\x11\x14\x16\x33\x33\x24\x16\x17\x32\x36\x37\x35\x06\x06\
-\x15\x02\x04\x07\x07\x0a\x11\x75\x23\x34\x49\x4a\x5f\x97\x7f\x6a\
-\x21\x27\x07\xfe\x8f\x2b\x25\x21\x36\x11\x4d\x6b\xee\x1b\x1d\x24\
-\x1f\x4d\x25\x4a\x48\x50\x76\x19\x3c\x0c\xfe\xe9\x2f\x20\x35\x18\
-\x01\x0d\x0b\x7f\x0b\x39\x22\x00\x03\xff\xec\xff\x8a\x01\xf6\x02\
-\x1c\x00\x21\x00\x2c\x00\x37\x00\x00\x37\x3e\x02\x33\x32\x16\x16\
-\x15\x14\x07\x33\x32\x16\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\
-\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x16\x16\x33\x32\x36\x35\
-\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\
-\x4c\x0d\x4b\x5b\x23\x18\x32\x20\x16\x6f\x0a\x07\x07\x0a\x56\x17\
-\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\xb2\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\xee\x54\x8b\x4f\
-\x3f\x61\x30\x34\x2a\x1b\x1d\x24\x1f\x29\x35\x3b\x50\x7f\x6a\x1f\
-\x24\x1d\x1b\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\
-\x23\x13\x2c\x4e\x31\x00\x00\x00\x03\x00\x4b\xff\x8a\x01\xfb\x02\
-\x1c\x00\x0a\x00\x25\x00\x30\x00\x00\x00\x26\x26\x23\x22\x06\x06\
-\x07\x36\x36\x35\x06\x36\x36\x33\x32\x16\x16\x15\x14\x07\x33\x32\
-\x16\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x26\x27\x16\
-\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x01\x3e\x0f\x14\x08\x0f\
-\x2d\x27\x06\x48\x4c\xf3\x4a\x69\x29\x18\x32\x20\x16\x6f\x0a\x07\
-\x07\x0a\x56\x17\x49\x3c\x3d\x61\x39\x03\x68\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x01\x63\x23\x13\x2c\x4e\x31\x02\x31\x2c\x47\xaf\x67\
-\x3f\x61\x30\x34\x2a\x1b\x1d\x24\x1f\x29\x35\x3b\x50\x45\x7e\x52\
-\x63\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x00\x00\x00\x03\xff\xec\x00\
-\x70\x02\x5a\x02\x8b\x00\x1f\x00\x2b\x00\x37\x00\x00\x37\x32\x37\
-\x26\x35\x34\x36\x37\x27\x37\x1e\x02\x15\x14\x07\x06\x06\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x36\x16\x17\x36\
-\x36\x35\x34\x26\x23\x22\x06\x15\x16\x33\x32\x36\x35\x34\x26\x27\
-\x16\x15\x14\x07\x10\x3e\x28\x37\x2a\x25\x3b\x25\xba\xd3\x55\x03\
-\x09\x70\x54\x32\x4d\x24\x2c\x65\x44\x15\x0a\x07\x07\x0a\x93\x2f\
-\x2f\x2d\x2e\x34\x26\x29\x36\xf0\x19\x2e\x38\x2e\x36\x06\x3c\xee\
-\x05\x39\x47\x34\x53\x18\x11\x68\x36\x6b\x70\x44\x11\x14\x4e\x53\
-\x10\x13\x11\x0f\x1f\x24\x1d\x1b\x66\x39\x12\x11\x39\x24\x29\x3d\
-\x3b\x2b\x8f\x26\x24\x1e\x3b\x1e\x18\x1c\x52\x37\x00\x00\x00\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x03\x71\x04\x22\x01\x00\x00\x00\x04\
-\x07\x02\xca\x00\x84\xff\x20\xff\xff\x00\x3a\x00\x73\x01\xc7\x03\
-\x71\x04\x02\x01\x06\x00\x00\xff\xff\x00\x2b\x00\x73\x02\x0b\x03\
-\x45\x04\x22\x01\x02\x00\x00\x04\x07\x02\xca\x00\xa3\xfe\xf4\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x02\x7d\x04\x02\x01\x00\x00\x00\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x02\x7d\x04\x02\x01\x09\x00\x00\x00\
-\x01\x00\x2e\x00\x64\x02\xcc\x01\xc4\x00\x19\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x26\x27\x26\x26\x23\x22\x06\x07\x27\x12\x33\
-\x32\x16\x17\x16\x16\x33\x33\x02\xc5\x07\x07\x0a\x11\x40\x65\x38\
-\x2c\x39\x26\x31\x63\x36\x4a\x77\xa7\x31\x57\x2d\x35\x47\x2f\x0f\
-\xee\x1b\x1d\x24\x1f\x34\x46\x37\x25\x6a\x7b\x32\x01\x2e\x32\x36\
-\x40\x2e\x00\x00\x01\xff\xec\xff\x80\x02\x48\x01\xa6\x00\x27\x00\
-\x00\x04\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\
-\x36\x36\x37\x17\x06\x15\x14\x17\x36\x36\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x06\x15\x14\x17\x07\x01\x0a\x5f\x05\x1a\x51\x3b\
-\x03\x0a\x07\x07\x0a\x03\x3b\x49\x33\x15\x67\x16\x33\x04\x72\x6e\
-\x03\x0a\x07\x07\x0a\x03\x51\x43\x0d\x50\x47\xac\x60\x2a\x28\x1f\
-\x24\x1d\x1b\x1e\x4f\x4b\x16\x55\x48\x6e\x4d\x60\x56\x1b\x1d\x24\
-\x1f\x24\x2e\x21\x2e\x52\x00\xff\xff\xff\xec\xff\x1d\x00\xe3\x02\
-\x25\x04\x22\x00\x1d\x00\x00\x04\x07\x02\x7c\xff\xdc\xfe\xbc\x00\
-\x03\x00\x3a\x00\x73\x01\xc7\x03\x72\x00\x10\x00\x27\x00\x33\x00\
-\x00\x36\x26\x26\x35\x34\x36\x37\x26\x27\x37\x16\x16\x15\x14\x06\
-\x06\x23\x03\x26\x35\x34\x36\x33\x36\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x12\x16\x33\x32\x36\x35\x34\
-\x26\x27\x06\x06\x15\xc9\x5b\x34\x48\x3b\x18\x18\x43\x75\x82\x34\
-\x5a\x38\x53\x1d\x31\x29\x22\x1d\x0f\x13\x19\x14\x19\x1f\x0f\x1b\
-\x1b\x19\x05\xb8\x08\x19\x39\x33\x29\x33\x37\x26\x32\x39\x73\x2d\
-\x51\x34\x42\x7b\x2c\x11\x0e\x50\x47\xa1\x5f\x39\x59\x31\x02\x68\
-\x1b\x24\x24\x32\x02\x12\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\
-\x33\xfe\x44\x2b\x29\x28\x2c\x50\x1a\x1b\x54\x28\x00\x00\x00\xff\
-\xff\x00\x2e\x00\x64\x02\xcc\x02\xe0\x04\x22\x01\x0b\x00\x00\x04\
-\x07\x02\xca\x00\xe4\xfe\x8f\xff\xff\xff\xec\xff\x80\x02\x48\x02\
-\xc4\x04\x22\x01\x0c\x00\x00\x04\x07\x02\xca\x00\xc4\xfe\x73\xff\
-\xff\xff\xec\xff\x1d\x00\xe3\x03\x3b\x04\x22\x01\x0d\x00\x00\x04\
-\x07\x02\xca\xff\xf4\xfe\xea\x00\x03\x00\x1e\x00\x70\x03\x3b\x02\
-\x8b\x00\x1a\x00\x26\x00\x32\x00\x00\x24\x37\x26\x35\x34\x36\x37\
-\x27\x37\x1e\x02\x15\x14\x07\x06\x06\x23\x22\x26\x27\x06\x06\x23\
-\x23\x27\x33\x36\x16\x17\x36\x36\x35\x34\x26\x23\x22\x06\x15\x16\
-\x33\x32\x36\x35\x34\x26\x27\x16\x15\x14\x07\x01\x2f\x28\x37\x2a\
-\x25\x3b\x25\xba\xd3\x55\x03\x09\x70\x54\x32\x4d\x24\x2c\x65\x44\
-\xab\x2a\xd3\x80\x2f\x2f\x2d\x2e\x34\x26\x29\x36\xf0\x19\x2e\x38\
-\x2e\x36\x06\x3c\xee\x05\x39\x47\x34\x53\x18\x11\x68\x36\x6b\x70\
-\x44\x11\x14\x4e\x53\x10\x13\x11\x0f\x7b\x66\x39\x12\x11\x39\x24\
-\x29\x3d\x3b\x2b\x8f\x26\x24\x1e\x3b\x1e\x18\x1c\x52\x37\x00\xff\
-\xff\x00\x1e\x00\x70\x03\x3b\x02\x8b\x04\x02\x01\x12\x00\x00\x00\
-\x03\x00\x4f\xff\x8a\x02\x95\x02\x1c\x00\x0a\x00\x29\x00\x34\x00\
-\x00\x00\x26\x26\x23\x22\x06\x06\x07\x36\x36\x35\x05\x16\x33\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x07\x33\x32\x16\x15\x14\x06\x23\x23\
-\x16\x15\x14\x06\x23\x22\x26\x27\x26\x27\x04\x16\x33\x32\x36\x35\
-\x34\x26\x27\x06\x07\x01\xd8\x0f\x14\x08\x0f\x2d\x27\x06\x48\x4c\
-\xfe\x8d\x43\x43\x0d\x4b\x5b\x23\x18\x32\x20\x16\x6f\x0a\x07\x07\
-\x0a\x56\x17\x49\x3c\x54\x74\x0e\x4c\x4f\x00\xff\x41\x29\x1d\x1b\
-\x18\x1a\x37\x43\x01\x63\x23\x13\x2c\x4e\x31\x02\x31\x2c\x41\x1e\
-\x54\x8b\x4f\x3f\x61\x30\x34\x2a\x1b\x1d\x24\x1f\x29\x35\x3b\x50\
-\x7f\x6a\x02\x27\x60\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x00\x00\xff\
-\xff\xff\xec\xff\x8a\x01\xf6\x02\x1c\x04\x02\x01\x03\x00\x00\xff\
-\xff\xff\xec\x00\x70\x02\x5a\x02\x8b\x04\x02\x01\x05\x00\x00\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x03\x3a\x04\x22\x01\x00\x00\x00\x04\
-\x06\x02\xb8\x58\xd2\x00\x00\xff\xff\x00\x3a\x00\x73\x01\xc7\x03\
-\x3a\x04\x22\x01\x00\x00\x00\x04\x06\x02\xb8\x58\xd2\x00\x00\xff\
-\xff\x00\x2b\x00\x73\x02\x0b\x03\x0e\x04\x22\x01\x02\x00\x00\x04\
-\x06\x02\xb8\x77\xa6\x00\x00\xff\xff\x00\x3a\x00\x73\x01\xc7\x03\
-\x3a\x04\x02\x01\x17\x00\x00\xff\xff\x00\x2b\x00\x73\x02\x0b\x03\
-\x0e\x04\x02\x01\x19\x00\x00\x00\x02\x00\x1f\xff\x86\x01\xc4\x01\
-\xfe\x00\x19\x00\x25\x00\x00\x00\x16\x16\x15\x14\x06\x23\x22\x27\
-\x37\x16\x33\x32\x36\x37\x06\x06\x23\x22\x26\x26\x35\x34\x36\x36\
-\x33\x06\x16\x33\x32\x36\x37\x26\x26\x23\x22\x06\x15\x01\x30\x5e\
-\x36\x84\x7a\x51\x56\x11\x49\x42\x50\x57\x08\x17\x3c\x28\x32\x50\
-\x2e\x33\x54\x2f\x56\x31\x33\x1d\x2d\x15\x09\x3e\x2b\x24\x2d\x01\
-\xfe\x49\x91\x66\x93\xa5\x21\x6b\x15\x44\x54\x12\x11\x2d\x54\x39\
-\x3b\x60\x37\xea\x26\x0a\x0c\x3c\x43\x2d\x22\x00\x02\x00\x1f\xff\
-\x86\x01\xc4\x01\xfe\x00\x19\x00\x25\x00\x00\x00\x16\x16\x15\x14\
-\x06\x23\x22\x27\x37\x16\x33\x32\x36\x37\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x36\x33\x06\x16\x33\x32\x36\x37\x26\x26\x23\x22\x06\
-\x15\x01\x30\x5e\x36\x84\x7a\x51\x56\x11\x49\x42\x50\x57\x08\x17\
-\x3c\x28\x32\x50\x2e\x33\x54\x2f\x56\x31\x33\x1d\x2d\x15\x09\x3e\
-\x2b\x24\x2d\x01\xfe\x49\x91\x66\x93\xa5\x21\x6b\x15\x44\x54\x12\
-\x11\x2d\x54\x39\x3b\x60\x37\xea\x26\x0a\x0c\x3c\x43\x2d\x22\x00\
-\x02\x00\x1e\xff\x8b\x02\x00\x01\xfe\x00\x1d\x00\x27\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x06\x06\x23\x22\x27\x37\x16\x33\x32\x36\
-\x37\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\x33\x24\x16\x17\
-\x33\x26\x26\x23\x22\x06\x15\x01\xf9\x07\x07\x0a\x2d\x10\x86\x6c\
-\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\x85\x7f\x33\x54\x30\x52\x70\
-\x0b\x29\xfe\xb3\x47\x5b\x24\x06\x40\x2f\x24\x2d\xee\x1b\x1d\x24\
-\x1f\x70\x78\x1f\x6e\x15\x2f\x40\x01\x66\x5c\x3b\x5c\x34\x8b\x85\
-\x28\x24\x04\x46\x4f\x2a\x20\xff\xff\x00\x1f\xff\x86\x01\xc4\x03\
-\x13\x04\x22\x01\x1c\x00\x00\x04\x07\x02\xca\x00\x96\xfe\xc2\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x03\x13\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xca\x00\x96\xfe\xc2\xff\xff\x00\x1e\xff\x8b\x02\x00\x03\
-\x09\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xca\x00\x9d\xfe\xb8\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x03\x2e\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xe5\x00\x8d\xff\x5a\xff\xff\x00\x1f\xff\x86\x01\xc4\x03\
-\x2e\x04\x02\x01\x22\x00\x00\xff\xff\x00\x1e\xff\x8b\x02\x00\x03\
-\x23\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xe5\x00\x94\xff\x4f\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x03\x05\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xd7\x00\x99\x00\x22\xff\xff\x00\x1f\xff\x86\x01\xc4\x03\
-\x05\x04\x02\x01\x25\x00\x00\xff\xff\x00\x1e\xff\x8b\x02\x00\x02\
-\xfb\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xd7\x00\xa0\x00\x18\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x02\xe2\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xc8\x00\xe2\xff\x02\xff\xff\x00\x1f\xff\x86\x01\xc4\x02\
-\xe2\x04\x02\x01\x28\x00\x00\xff\xff\x00\x1e\xff\x8b\x02\x00\x02\
-\xd7\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xc8\x00\xe9\xfe\xf7\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x03\x1f\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xe6\x00\x90\xff\x52\xff\xff\x00\x1f\xff\x86\x01\xc4\x03\
-\x1f\x04\x02\x01\x2b\x00\x00\xff\xff\x00\x1e\xff\x8b\x02\x00\x03\
-\x14\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xe6\x00\x97\xff\x47\xff\
-\xff\x00\x1f\xff\x86\x01\xc4\x03\x36\x04\x22\x01\x1c\x00\x00\x04\
-\x07\x02\xbd\x00\x6c\x01\x10\xff\xff\x00\x1f\xff\x86\x01\xc4\x03\
-\x36\x04\x02\x01\x2e\x00\x00\xff\xff\x00\x1e\xff\x8b\x02\x00\x03\
-\x2b\x04\x22\x01\x1e\x00\x00\x04\x07\x02\xbd\x00\x73\x01\x05\x00\
-\x01\x00\x29\xff\xc2\x02\xb8\x02\x92\x00\x32\x00\x00\x16\x26\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x17\x32\x36\x36\x35\x34\
-\x26\x27\x27\x26\x26\x35\x34\x36\x36\x33\x32\x17\x07\x26\x23\x22\
-\x06\x06\x17\x16\x16\x17\x16\x16\x17\x16\x16\x15\x14\x06\x06\x23\
-\xf1\x83\x45\x14\x19\x52\x13\x0d\x02\x02\x6d\x5f\x4a\x68\x33\x3a\
-\x36\x3c\x30\x25\x42\x69\x37\x77\x23\x42\x24\x46\x1c\x35\x1f\x02\
-\x01\x27\x32\x08\x18\x0f\x3a\x32\x48\x94\x6c\x3e\x41\x74\x4d\x34\
-\x59\x41\x16\x3c\x44\x24\x44\x58\x01\x29\x3b\x1a\x0f\x23\x18\x1d\
-\x19\x38\x2b\x41\x71\x44\x68\x49\x3b\x1a\x30\x1f\x15\x1c\x18\x04\
-\x0b\x08\x1c\x43\x2a\x42\x79\x4d\x00\x00\x00\xff\xff\x00\x29\xff\
-\xc2\x02\xb8\x02\x92\x04\x02\x01\x31\x00\x00\x00\x01\x00\x1e\xff\
-\xfe\x03\x19\x01\x8a\x00\x27\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\
-\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\
-\x33\x03\x12\x07\x07\x0a\x0f\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\
-\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\
-\x4a\x26\x57\x7e\x33\x0d\xee\x1b\x1d\x24\x1f\x0a\x0d\x3f\x4d\x3a\
-\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\
-\x12\x29\x55\x35\x2b\x00\x00\xff\xff\x00\x29\xff\x1d\x02\xb8\x02\
-\x92\x04\x22\x01\x31\x00\x00\x04\x07\x02\xb9\x00\xc5\xff\x7f\xff\
-\xff\x00\x29\xff\x1d\x02\xb8\x02\x92\x04\x22\x01\x31\x00\x00\x04\
-\x07\x02\xb9\x00\xc5\xff\x7f\xff\xff\x00\x1e\xff\x52\x03\x19\x01\
-\x8a\x04\x22\x01\x33\x00\x00\x04\x07\x02\xb9\x00\xd8\xff\xb4\xff\
-\xff\xff\xec\xff\x8f\x01\x84\x01\xc5\x04\x22\x00\x1c\x00\x00\x04\
-\x06\x02\xb9\x18\xf1\x00\x00\xff\xff\xff\xd9\xff\x8f\x00\xfd\x02\
-\x25\x04\x22\x00\x1d\x00\x00\x04\x06\x02\xb9\xd9\xf1\x00\x00\xff\
-\xff\x00\x29\xff\xc2\x02\xb8\x02\xd6\x04\x22\x01\x31\x00\x00\x04\
-\x07\x02\xca\x00\x46\xfe\x85\xff\xff\x00\x29\xff\xc2\x02\xb8\x02\
-\xd6\x04\x22\x01\x31\x00\x00\x04\x07\x02\xca\x00\x46\xfe\x85\xff\
-\xff\x00\x1e\xff\xfe\x03\x19\x02\x8b\x04\x22\x01\x33\x00\x00\x04\
-\x07\x02\xca\x00\x3c\xfe\x3a\xff\xff\xff\xec\x00\x73\x01\x84\x02\
-\xde\x04\x22\x00\x1c\x00\x00\x04\x07\x02\xca\x00\x3c\xfe\x8d\xff\
-\xff\xff\xec\x00\x73\x00\xe3\x03\x3b\x04\x22\x00\x1d\x00\x00\x04\
-\x07\x02\xca\xff\xf4\xfe\xea\xff\xff\x00\x29\xff\xc2\x02\xb8\x02\
-\x92\x04\x02\x01\x31\x00\x00\xff\xff\x00\x29\xff\xc2\x02\xb8\x02\
-\x92\x04\x02\x01\x3e\x00\x00\xff\xff\x00\x1e\xff\xfe\x03\x19\x01\
-\x8a\x04\x02\x01\x33\x00\x00\xff\xff\xff\xec\xff\x8f\x01\x84\x01\
-\xc5\x04\x02\x01\x37\x00\x00\xff\xff\xff\xd9\xff\x8f\x00\xfd\x02\
-\x25\x04\x02\x01\x38\x00\x00\x00\x01\x00\x1f\xff\xc2\x03\x26\x02\
-\x92\x00\x34\x00\x00\x13\x37\x15\x06\x06\x17\x16\x16\x17\x32\x36\
-\x36\x35\x34\x26\x27\x27\x26\x26\x35\x34\x36\x36\x33\x32\x17\x07\
-\x26\x23\x22\x06\x06\x17\x16\x16\x17\x16\x16\x17\x16\x16\x15\x14\
-\x06\x06\x23\x22\x26\x26\x35\x34\x37\x07\x21\xf5\x13\x0d\x02\x02\
-\x6d\x5f\x4a\x68\x33\x3a\x36\x3c\x30\x25\x42\x69\x37\x77\x23\x42\
-\x24\x46\x1c\x35\x1f\x02\x01\x27\x32\x08\x18\x0f\x3a\x32\x48\x94\
-\x6c\x5a\x83\x45\x13\x8b\x01\x85\x25\x2e\x3c\x44\x24\x44\x58\x01\
-\x29\x3b\x1a\x0f\x23\x18\x1d\x19\x38\x2b\x41\x71\x44\x68\x49\x3b\
-\x1a\x30\x1f\x15\x1c\x18\x04\x0b\x08\x1c\x43\x2a\x42\x79\x4d\x41\
-\x74\x4d\x46\x3e\x22\x00\x00\xff\xff\x00\x29\xfe\xc4\x02\xb8\x02\
-\x92\x04\x22\x01\x31\x00\x00\x04\x07\x02\xb7\x01\x11\xfe\x6d\xff\
-\xff\x00\x29\xfe\xc4\x02\xb8\x02\x92\x04\x22\x01\x31\x00\x00\x04\
-\x07\x02\xb7\x01\x11\xfe\x6d\xff\xff\x00\x1e\xfe\xf9\x03\x19\x01\
-\x8a\x04\x22\x01\x33\x00\x00\x04\x07\x02\xb7\x01\x24\xfe\xa2\xff\
-\xff\xff\xec\xff\x36\x01\x84\x01\xc5\x04\x02\x00\x2b\x00\x00\xff\
-\xff\xff\xec\xff\x36\x00\xe3\x02\x25\x04\x02\x00\x2c\x00\x00\x00\
-\x01\x00\x1c\x00\x73\x03\x8f\x02\x6a\x00\x20\x00\x00\x12\x36\x37\
-\x36\x37\x36\x36\x33\x32\x17\x07\x26\x27\x06\x07\x06\x06\x07\x16\
-\x16\x17\x16\x33\x32\x36\x37\x07\x06\x06\x23\x23\x24\x35\x1c\x39\
-\x37\x22\x22\x20\x2b\x1e\x5b\x4d\x5d\x27\x31\x1f\x35\x23\x21\x0a\
-\x33\x80\x82\x3b\x31\x56\x9f\x6f\x12\x5e\xba\x7b\x21\xfe\x53\x01\
-\x32\x5b\x39\x22\x31\x2b\x26\xb8\x40\x5e\x2e\x3a\x3e\x27\x2d\x17\
-\x14\x13\x06\x03\x0f\x10\x72\x15\x10\x05\x89\xff\xff\x00\x1c\x00\
-\x73\x03\x8f\x02\x6a\x04\x02\x01\x49\x00\x00\x00\x01\x00\x1e\xff\
-\x98\x02\x91\x00\xee\x00\x1f\x00\x00\x24\x33\x32\x37\x07\x06\x06\
-\x23\x22\x26\x27\x26\x26\x35\x34\x37\x36\x36\x33\x33\x32\x16\x15\
-\x14\x06\x23\x23\x22\x06\x07\x16\x17\x01\x34\x31\x3d\xb2\x1a\x6b\
-\x6e\x52\x5e\x61\x14\x0e\x10\x0e\x27\xad\x8f\xf1\x0a\x07\x07\x0a\
-\xef\x70\x86\x22\x35\x66\x12\x07\x76\x07\x04\x08\x09\x06\x2e\x1e\
-\x2a\x1f\x54\x56\x1b\x1d\x24\x1f\x2b\x2f\x05\x01\x00\x00\x00\xff\
-\xff\x00\x1c\x00\x73\x03\x8f\x03\x62\x04\x22\x01\x49\x00\x00\x04\
-\x07\x02\xca\x00\xa1\xff\x11\xff\xff\x00\x1c\x00\x73\x03\x8f\x03\
-\x62\x04\x02\x01\x4c\x00\x00\xff\xff\x00\x1e\xff\x98\x02\x91\x02\
-\x05\x04\x22\x01\x4b\x00\x00\x04\x07\x02\xca\x00\x94\xfd\xb4\xff\
-\xff\x00\x3a\x00\x73\x01\xc7\x02\x7d\x04\x02\x01\x00\x00\x00\x00\
-\x02\x00\x32\x00\x73\x02\x12\x02\x54\x00\x17\x00\x21\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x35\x34\x36\x37\
-\x35\x37\x11\x14\x16\x33\x33\x24\x16\x17\x32\x36\x37\x35\x06\x06\
-\x15\x02\x0b\x07\x07\x0a\x0d\x77\x24\x36\x48\x4a\x5f\x97\x7f\x6a\
-\x1d\x1f\x13\xfe\x8f\x2b\x25\x21\x36\x11\x4d\x6b\xee\x1b\x1d\x24\
-\x1f\x4e\x26\x4a\x48\x50\x76\x19\x3c\x0c\xfe\xe3\x27\x22\x35\x18\
-\x01\x0d\x0b\x7f\x0b\x39\x22\xff\xff\xff\xec\x00\x73\x00\xee\x02\
-\xdc\x04\x22\x01\x54\x00\x00\x04\x07\x02\xd3\x00\x03\xff\x2a\x00\
-\x01\x00\x1e\x00\x73\x02\x29\x01\xfc\x00\x16\x00\x00\x12\x36\x37\
-\x17\x06\x06\x17\x1e\x02\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x26\x26\x35\x1e\x0f\x15\x53\x0e\x09\x01\x01\x39\x84\x73\x68\x0a\
-\x07\x07\x0a\x68\x92\xb0\x50\x01\x6e\x4e\x40\x16\x31\x39\x19\x2b\
-\x32\x18\x1b\x1d\x24\x1f\x2c\x5c\x4a\x00\x00\xff\xff\xff\xec\xff\
-\xe9\x00\xee\x00\xee\x04\x22\x01\x54\x00\x00\x04\x06\x02\xd8\x12\
-\x61\x00\x00\x00\x01\xff\xec\x00\x73\x00\xee\x00\xee\x00\x0d\x00\
-\x00\x36\x16\x15\x14\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\xe7\
-\x07\x07\x0a\xe0\x0a\x07\x07\x0a\xe0\xee\x1b\x1d\x24\x1f\x1f\x24\
-\x1d\x1b\x00\xff\xff\xff\xec\x00\x73\x00\xee\x02\x84\x04\x22\x01\
-\x54\x00\x00\x04\x07\x02\xd6\x00\x07\xff\x1d\xff\xff\xff\xec\x00\
-\x73\x00\xee\x03\x05\x04\x22\x01\x54\x00\x00\x04\x06\x02\xd7\x0e\
-\x22\x00\x00\xff\xff\xff\xec\x00\x73\x00\xee\x02\xe1\x04\x22\x01\
-\x54\x00\x00\x04\x07\x02\xd9\x00\x04\xff\x24\xff\xff\xff\xec\x00\
-\x73\x00\xee\x03\xb7\x04\x22\x01\x54\x00\x00\x04\x07\x02\xde\x00\
-\x06\xff\x13\xff\xff\xff\xec\x00\x73\x00\xee\x03\x3f\x04\x22\x01\
-\x54\x00\x00\x04\x07\x02\xdf\x00\x06\xff\x0c\xff\xff\xff\xec\x00\
-\x73\x00\xee\x02\xe7\x04\x22\x01\x54\x00\x00\x04\x07\x02\xe1\x00\
-\x1d\xff\x48\x00\x02\x00\x14\x00\x73\x02\x0e\x03\x2f\x00\x13\x00\
-\x1c\x00\x00\x12\x37\x26\x27\x37\x16\x17\x36\x37\x37\x06\x07\x16\
-\x17\x14\x06\x23\x22\x27\x37\x17\x17\x32\x36\x35\x34\x27\x06\x07\
-\xe9\x4a\x6b\xb4\x3e\xa8\x6a\x30\x03\x75\x0c\x54\x60\x02\x68\x65\
-\x61\x87\x02\x9f\x40\x42\x34\x3a\x41\x5a\x01\x62\x70\x60\x63\x62\
-\x66\x66\x6c\x85\x13\xb7\x98\x74\x62\x4e\x49\x09\x7e\x0b\x02\x13\
-\x1b\x2f\x44\x58\x45\x00\x00\x00\x01\x00\x1f\x00\x73\x02\xa2\x03\
-\x6a\x00\x24\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\x06\x06\
-\x23\x22\x26\x27\x37\x16\x16\x37\x26\x26\x27\x37\x16\x12\x17\x36\
-\x36\x35\x11\x37\x11\x14\x16\x16\x33\x33\x02\x9b\x07\x07\x0a\x11\
-\x76\x2f\x1c\x6c\x4e\x2d\x64\x4d\x08\x56\x6e\x2c\x47\x6a\x4f\x62\
-\x53\x74\x34\x23\x1f\x6a\x0e\x27\x27\x0d\xee\x1b\x1d\x24\x1f\x57\
-\x2f\x28\x0d\x11\x71\x0d\x09\x02\xac\xdb\x7d\x40\x96\xfe\xfc\xa0\
-\x0b\x33\x30\x01\xf8\x0c\xfd\xdb\x25\x24\x0e\xff\xff\x00\x08\x00\
-\x73\x02\x0e\x03\xe3\x04\x22\x01\x5b\x00\x00\x04\x06\x02\xca\x08\
-\x92\x00\x00\xff\xff\x00\x12\x00\x73\x02\xa2\x04\x13\x04\x22\x01\
-\x5c\x00\x00\x04\x06\x02\xca\x12\xc2\x00\x00\xff\xff\x00\x14\xff\
-\x87\x02\x0e\x03\x2f\x04\x22\x01\x5b\x00\x00\x04\x06\x02\xcb\x75\
-\xb3\x00\x00\xff\xff\x00\x1f\xff\x85\x02\xa2\x03\x6a\x04\x22\x01\
-\x5c\x00\x00\x04\x06\x02\xcb\x4e\xb1\x00\x00\xff\xff\xff\xdc\x00\
-\x73\x02\x0e\x03\x9f\x04\x22\x01\x5b\x00\x00\x04\x06\x02\xe2\xdc\
-\xf8\x00\x00\xff\xff\xff\xc9\x00\x73\x02\xa2\x03\xbf\x04\x22\x01\
-\x5c\x00\x00\x04\x06\x02\xe2\xc9\x18\x00\x00\xff\xff\xff\xd4\x00\
-\x73\x02\x0e\x03\xbe\x04\x22\x01\x5b\x00\x00\x04\x06\x02\xc2\xd4\
-\x59\x00\x00\x00\x01\x00\x1e\xff\x93\x03\x57\x02\x16\x00\x3b\x00\
-\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x26\x27\x26\x26\x23\x22\
-\x06\x15\x14\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x35\x34\x27\x26\
-\x35\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x33\x03\x50\x07\x07\
-\x0a\x12\x3a\x4b\x3f\x26\x18\x44\x2f\x26\x36\x31\x39\x45\x52\x4b\
-\x85\x54\x8f\x93\x12\x18\x56\x10\x0a\x01\x02\x5d\x69\x36\x50\x2a\
-\x78\x8b\x37\x60\x3a\x42\x6e\x20\x1d\x2a\x2c\x23\x15\xee\x1b\x1d\
-\x24\x1f\x23\x55\x52\x34\x32\x2a\x1e\x15\x27\x14\x1a\x4e\x31\x36\
-\x68\x41\x8c\x72\x2b\x53\x3e\x18\x36\x40\x1e\x3d\x58\x1f\x2c\x13\
-\x1e\x2c\x35\x6e\x36\x57\x32\x45\x49\x43\x40\x17\x00\x00\x00\x00\
-\x02\x00\x17\xff\x84\x03\x6f\x01\xc6\x00\x34\x00\x38\x00\x00\x24\
-\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\
-\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\
-\x33\x33\x17\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\
-\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\
-\x33\x67\x35\x19\x1e\x3f\x2f\x14\x9b\x4d\x4d\x4d\xee\x20\x24\x17\
-\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\
-\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\
-\x57\x13\x0e\xd0\x4d\x4d\x4d\x00\x03\x00\x17\xff\x84\x03\x6f\x02\
-\xa1\x00\x34\x00\x38\x00\x3c\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\
-\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\
-\x01\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\
-\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\
-\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\
-\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\x4e\x02\x1f\x4d\x4d\x4d\
-\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\
-\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\
-\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\xfd\xcb\x4d\x4d\
-\x4d\x00\x00\x00\x03\x00\x1e\xff\x29\x03\x31\x02\x25\x00\x25\x00\
-\x30\x00\x34\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x02\x7e\x44\x0d\x01\x1f\
-\x23\x64\x23\x1e\x7d\x60\x0e\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\
-\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x0f\xfe\x88\x3f\x1f\x36\
-\x19\x1d\x33\x22\x21\x32\x1b\x02\x0c\x4d\x4d\x4d\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\x38\
-\x45\xf9\x4d\x4d\x4d\x00\x00\x00\x03\x00\x1e\xff\x29\x03\xd2\x02\
-\x0a\x00\x32\x00\x3d\x00\x41\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\
-\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x02\x8c\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\
-\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\
-\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\x4b\x4d\x4d\x4d\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\x44\
-\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\
-\x11\x14\x48\x39\x38\x45\xf9\x4d\x4d\x4d\x00\x00\x03\xff\xec\xff\
-\x84\x03\xe9\x02\x0a\x00\x3a\x00\x45\x00\x49\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\
-\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\
-\x22\x06\x07\x05\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\
-\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x14\xfe\
-\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x02\x4c\x4d\x4d\x4d\
-\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\
-\x27\x26\x2c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\
-\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\xf9\x4d\x4d\
-\x4d\x00\x00\x00\x03\xff\xec\xff\x84\x03\x48\x02\x25\x00\x2d\x00\
-\x38\x00\x3c\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\
-\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x05\x17\
-\x07\x27\x02\x95\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0d\x2a\
-\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\
-\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x0f\xfe\x70\x37\
-\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x02\x0d\x4d\x4d\x4d\xee\x17\
-\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\x43\x21\x23\x21\
-\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\
-\x48\x38\x38\x45\xf9\x4d\x4d\x4d\x00\x00\x00\x00\x03\x00\x23\xff\
-\x84\x04\x71\x02\x9f\x00\x3a\x00\x3e\x00\x42\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\
-\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\x27\x01\x17\x07\x27\x03\
-\x2b\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x18\x1d\x44\x1b\x08\x45\x81\x5e\
-\x54\x7f\x45\x2a\x55\x1a\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\
-\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\x02\xa9\x4d\x4d\x4d\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\
-\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\xfd\
-\xcd\x4d\x4d\x4d\x00\x00\x00\x00\x04\xff\xec\xff\x84\x03\x66\x02\
-\x1c\x00\x35\x00\x40\x00\x4b\x00\x4f\x00\x00\x24\x36\x37\x36\x36\
-\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\
-\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\
-\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\
-\x26\x23\x22\x06\x06\x07\x05\x17\x07\x27\x02\x20\x37\x11\x0a\x0f\
-\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\
-\x1c\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\
-\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\xbf\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\xe6\x4d\x4d\
-\x4d\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\
-\x2b\x27\x26\x2c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\
-\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\
-\x31\x2c\x16\x23\x13\x2c\x4e\x31\xd0\x4d\x4d\x4d\x00\x00\x00\x00\
-\x04\xff\xec\xff\x84\x02\xc5\x02\x25\x00\x28\x00\x33\x00\x3e\x00\
-\x42\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\
-\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\
-\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\
-\x07\x05\x17\x07\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\
-\x60\x59\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\
-\x5b\x23\x18\x32\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\x1a\x37\
-\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\xa7\x4d\x4d\x4d\xee\
-\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x29\x35\x3b\x50\x7f\
-\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\
-\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\xd0\
-\x4d\x4d\x4d\x00\x02\x00\x1e\xff\x84\x03\xe8\x02\x25\x00\x2e\x00\
-\x32\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\
-\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\
-\x33\x33\x17\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\
-\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\
-\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\
-\x33\x13\x61\x4d\x4d\x4d\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\
-\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\
-\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\xd0\x4d\x4d\x4d\
-\x00\x00\x00\xff\xff\x00\x1e\xff\x33\x03\x57\x02\x16\x04\x27\x02\
-\xb4\x02\x5d\xfe\xde\x04\x02\x01\x64\x00\x00\x00\x03\x00\x1e\xff\
-\x52\x03\xe8\x02\x25\x00\x2e\x00\x36\x00\x3a\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\
-\x07\x27\x07\x27\x25\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\
-\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\
-\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\
-\x57\x7e\x33\x13\xfe\x14\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\x97\x4d\
-\x4d\x4d\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x82\x4d\x4d\x4d\x00\x00\xff\xff\x00\x29\xfe\xd9\x03\x62\x02\
-\x16\x04\x27\x02\xb9\x00\xb7\xff\x3b\x04\x02\x01\x6f\x0b\x00\x00\
-\x03\x00\x1e\xff\x84\x03\xe8\x02\x8b\x00\x2e\x00\x45\x00\x49\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\
-\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\
-\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x01\x17\x07\x27\x03\x35\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\
-\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\
-\x21\x4a\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\x23\x1c\x0f\x12\
-\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x33\x4d\x4d\x4d\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\xfe\x2e\x4d\x4d\x4d\x00\xff\
-\xff\x00\x2c\xff\x33\x03\x65\x02\xa3\x04\x27\x02\xca\x00\x35\xfe\
-\x52\x04\x02\x01\x6f\x0e\x00\x00\x01\x00\x1e\xff\xfe\x03\xc2\x03\
-\x6e\x00\x2a\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\
-\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\
-\x03\x3a\x1e\x6a\x5c\x52\x1b\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\
-\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\
-\x4a\x26\x57\x7e\x33\x15\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\
-\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\
-\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x00\x00\x01\x00\x1e\xff\
-\xfe\x04\x6b\x03\x6e\x00\x36\x00\x00\x01\x37\x11\x14\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x23\x22\x26\x27\x06\
-\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\
-\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x35\
-\x03\x81\x6a\x2f\x30\x10\x0a\x07\x07\x0a\x0d\x78\x1e\x29\x7b\x1a\
-\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\
-\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x18\x33\
-\x3a\x03\x62\x0c\xfd\xda\x34\x26\x1b\x1d\x24\x1f\x4c\x4c\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\x27\x33\x00\xff\xff\xff\xd5\x00\
-\x73\x02\xa2\x03\xeb\x04\x22\x01\x5c\x00\x00\x04\x07\x02\xc2\xff\
-\xd5\x00\x86\x00\x04\x00\x17\xff\x21\x03\x6f\x01\xc6\x00\x34\x00\
-\x38\x00\x3c\x00\x40\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\
-\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x17\x17\x07\x27\x17\x17\
-\x07\x27\x37\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\
-\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\
-\x33\x67\x35\x19\x1e\x3f\x2f\x14\x4f\x42\x42\x43\x8d\x43\x43\x43\
-\x92\x43\x43\x42\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\
-\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\
-\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\xc8\x43\x42\x42\x3d\
-\x43\x42\x42\xc1\x43\x43\x43\x00\x05\x00\x17\xff\x21\x03\x6f\x02\
-\xa1\x00\x34\x00\x38\x00\x3c\x00\x40\x00\x44\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\
-\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\
-\x01\x17\x07\x27\x01\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\
-\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\
-\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\x15\x04\x3e\x75\
-\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\
-\x2f\x14\xfe\xca\x4d\x4d\x4e\x01\xd3\x42\x42\x43\x8d\x43\x43\x43\
-\x92\x43\x43\x42\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\
-\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\
-\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\
-\xfd\xd3\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\x00\
-\x05\x00\x1e\xff\x21\x03\x49\x02\x25\x00\x25\x00\x30\x00\x34\x00\
-\x38\x00\x3c\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x17\x17\x07\x27\x37\x17\
-\x07\x27\x02\x7e\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0e\x2b\
-\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\
-\x30\x24\x0f\xfe\x88\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\
-\xc1\x42\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\x38\
-\x45\xf1\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\x00\
-\x05\x00\x1e\xff\x21\x03\xd2\x02\x0a\x00\x32\x00\x3d\x00\x41\x00\
-\x45\x00\x49\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\
-\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\
-\x22\x06\x07\x05\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\x02\
-\x8c\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\
-\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\
-\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\xff\x42\x42\x43\x8d\x43\
-\x43\x43\x92\x43\x43\x42\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\
-\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\
-\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\
-\x38\x45\xf1\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\
-\x05\xff\xec\xff\x21\x03\xe9\x02\x0a\x00\x3a\x00\x45\x00\x49\x00\
-\x4d\x00\x51\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\
-\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\
-\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x17\
-\x17\x07\x27\x37\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\
-\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x14\xfe\
-\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x02\x00\x42\x42\x43\
-\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x21\x43\x21\x23\
-\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\
-\x26\x48\x38\x38\x45\xf1\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\
-\x43\x00\x00\x00\x05\xff\xec\xff\x21\x03\x60\x02\x25\x00\x2d\x00\
-\x38\x00\x3c\x00\x40\x00\x44\x00\x00\x24\x36\x37\x26\x26\x27\x37\
-\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\
-\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\
-\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\
-\x06\x07\x05\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\x02\x95\
-\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0d\x2a\x4a\x18\x3d\x62\
-\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\
-\x57\x36\x36\x56\x29\x22\x30\x25\x0f\xfe\x70\x37\x20\x41\x2e\x1b\
-\x33\x23\x23\x33\x1b\x01\xc2\x42\x42\x43\x8d\x43\x43\x43\x92\x43\
-\x43\x42\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\
-\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\
-\x33\x12\x12\x26\x48\x38\x38\x45\xf1\x43\x42\x42\x3d\x43\x42\x42\
-\xc1\x43\x43\x43\x00\x00\x00\x00\x05\x00\x23\xff\x21\x04\x71\x02\
-\x9f\x00\x3a\x00\x3e\x00\x42\x00\x46\x00\x4a\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\
-\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\x27\x01\x17\x07\x27\x17\
-\x17\x07\x27\x37\x17\x07\x27\x03\x2b\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x18\x1d\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x2a\x55\x1a\x60\x5e\
-\x40\x57\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\
-\x02\x5d\x42\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\
-\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\xfd\
-\xd5\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\x00\x00\
-\x06\xff\xec\xff\x21\x03\x66\x02\x1c\x00\x35\x00\x40\x00\x4b\x00\
-\x4f\x00\x53\x00\x57\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\
-\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\
-\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x07\x05\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\x02\x20\
-\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\
-\x08\x38\x58\x17\x1c\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\x4e\x0a\
-\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\xbf\x41\
-\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\
-\x01\x9a\x42\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\
-\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\
-\x13\x2c\x4e\x31\xc8\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\
-\x00\x00\x00\x00\x06\xff\xec\xff\x21\x02\xdd\x02\x25\x00\x28\x00\
-\x33\x00\x3e\x00\x42\x00\x46\x00\x4a\x00\x00\x24\x36\x37\x26\x26\
-\x27\x37\x16\x16\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\
-\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\
-\x35\x34\x26\x26\x23\x22\x06\x06\x07\x05\x17\x07\x27\x17\x17\x07\
-\x27\x37\x17\x07\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\
-\x60\x59\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\
-\x5b\x23\x18\x32\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\x1a\x37\
-\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\x5c\x42\x42\x43\x8d\
-\x43\x43\x43\x92\x43\x43\x42\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\
-\x3b\x53\x61\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\
-\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\
-\x2c\x16\x23\x13\x2c\x4e\x31\xc8\x43\x42\x42\x3d\x43\x42\x42\xc1\
-\x43\x43\x43\x00\x04\x00\x1e\xff\x21\x04\x00\x02\x25\x00\x2e\x00\
-\x32\x00\x36\x00\x3a\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\
-\x27\x37\x16\x16\x33\x33\x17\x17\x07\x27\x17\x17\x07\x27\x37\x17\
-\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\
-\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\
-\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\x16\x42\
-\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x17\x13\x2e\x63\x49\
-\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\
-\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\
-\xc8\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\x00\xff\
-\xff\x00\x29\xfe\xc2\x03\x62\x02\x16\x04\x27\x02\xbb\x02\x0e\xfd\
-\xdd\x04\x02\x01\x64\x0b\x00\x00\x05\x00\x1e\xff\x21\x04\x00\x02\
-\x25\x00\x2e\x00\x36\x00\x3a\x00\x3e\x00\x42\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\
-\x07\x27\x07\x27\x25\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\
-\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\
-\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\
-\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\xfe\x14\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\x02\x4c\x42\x42\x43\x8d\x43\x43\x43\x92\x43\
-\x43\x42\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x8a\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\x43\x43\x00\x00\xff\
-\xff\x00\x29\xfe\xc2\x03\x62\x02\x16\x04\x27\x02\xb9\x00\xb8\xff\
-\x35\x04\x02\x01\x81\x00\x00\x00\x05\x00\x1e\xff\x21\x04\x00\x02\
-\x8b\x00\x2e\x00\x45\x00\x49\x00\x4d\x00\x51\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x26\x35\x34\
-\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\
-\x17\x07\x27\x01\x17\x07\x27\x17\x17\x07\x27\x37\x17\x07\x27\x03\
-\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\
-\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\
-\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x02\
-\xe8\x42\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\
-\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\
-\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\
-\x06\x05\x36\x16\x34\xfe\x36\x43\x42\x42\x3d\x43\x42\x42\xc1\x43\
-\x43\x43\x00\xff\xff\x00\x2c\xfe\xc2\x03\x6b\x02\xa4\x04\x27\x02\
-\xca\x00\x2c\xfe\x53\x04\x02\x01\x81\x09\x00\x00\x03\x00\x17\xff\
-\x90\x03\x6f\x02\xa7\x00\x34\x00\x38\x00\x3c\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\
-\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\
-\x13\x17\x07\x27\x37\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\
-\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\
-\x35\x15\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\
-\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\x4b\x4a\x4a\x4a\xda\x4a\
-\x4a\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\
-\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb4\x49\x4a\x4a\x4e\x4a\
-\x4a\x4a\x00\x00\x04\x00\x17\xff\x90\x03\x6f\x02\xa7\x00\x34\x00\
-\x38\x00\x3c\x00\x40\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\
-\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\x25\x17\
-\x07\x27\x37\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\
-\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\
-\x33\x67\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\x4e\x01\xcf\x4a\
-\x4a\x4a\xda\x4a\x4a\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\
-\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\
-\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\
-\x4d\x4d\x4f\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x00\x04\x00\x1e\xff\
-\x29\x03\x39\x03\x04\x00\x25\x00\x30\x00\x34\x00\x38\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\
-\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\
-\x01\x17\x07\x27\x37\x17\x07\x27\x02\x7e\x44\x0d\x01\x1f\x23\x64\
-\x23\x1e\x7d\x60\x0e\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\
-\x58\x70\x37\x58\x2a\x20\x30\x24\x0f\xfe\x88\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x01\xb3\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x17\
-\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\
-\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\
-\x39\x38\x45\x01\xe8\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x00\x00\x00\
-\x04\x00\x1e\xff\x29\x03\xd2\x02\xa7\x00\x32\x00\x3d\x00\x41\x00\
-\x45\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\
-\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\
-\x07\x01\x17\x07\x27\x37\x17\x07\x27\x02\x8c\x37\x11\x0a\x0f\x0b\
-\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\
-\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\
-\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\x1f\x36\x19\x1d\x33\x22\
-\x21\x32\x1b\x01\xfb\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x20\x24\x17\
-\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\
-\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\
-\x45\x30\x11\x14\x48\x39\x38\x45\x01\x8b\x49\x4a\x4a\x4e\x4a\x4a\
-\x4a\x00\x00\x00\x04\xff\xec\x00\x73\x03\xe9\x02\xa7\x00\x3a\x00\
-\x45\x00\x49\x00\x4d\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\
-\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\
-\x27\x37\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x2a\
-\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\
-\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x14\xfe\x6b\x37\
-\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x01\xfc\x4a\x4a\x4a\xda\x4a\
-\x4a\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\
-\x1f\x2b\x27\x26\x2c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\
-\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\x01\
-\x8b\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x00\x00\x00\x04\xff\xec\x00\
-\x73\x03\x50\x03\x04\x00\x2d\x00\x38\x00\x3c\x00\x40\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\
-\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\
-\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\
-\x02\x95\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0d\x2a\x4a\x18\
-\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\
-\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x0f\xfe\x70\x37\x20\x41\
-\x2e\x1b\x33\x23\x23\x33\x1b\x01\xb4\x4a\x4a\x4a\xda\x4a\x4a\x4a\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\x43\x21\
-\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\
-\x12\x26\x48\x38\x38\x45\x01\xe8\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\
-\x04\x00\x23\xff\xb0\x04\x71\x02\xa7\x00\x3a\x00\x3e\x00\x42\x00\
-\x46\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x0e\x02\x23\x22\x26\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\
-\x32\x36\x36\x35\x34\x26\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\
-\x27\x25\x17\x07\x27\x37\x17\x07\x27\x03\x2b\x37\x11\x0a\x0f\x0b\
-\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\
-\x65\x35\x18\x1d\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x2a\x55\x1a\
-\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x15\xfe\x40\x4d\
-\x4d\x4e\x02\x59\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x20\x24\x17\x3d\
-\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x16\x13\
-\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\x28\x3c\
-\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\x51\x49\x4a\
-\x4a\x4e\x4a\x4a\x4a\x00\x00\x00\x05\xff\xec\xff\x8a\x03\x66\x02\
-\xa7\x00\x35\x00\x40\x00\x4b\x00\x4f\x00\x53\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\
-\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\
-\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\
-\x34\x26\x26\x23\x22\x06\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\
-\x02\x20\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\
-\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\
-\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\
-\xbf\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\
-\x27\x06\x01\x96\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x20\x24\x17\x3d\
-\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x29\x35\
-\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\
-\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\
-\x4e\x31\x01\xb4\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x05\xff\xec\xff\
-\x8a\x02\xcd\x03\x04\x00\x28\x00\x33\x00\x3e\x00\x42\x00\x46\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x16\
-\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\
-\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x01\
-\x17\x07\x27\x37\x17\x07\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\
-\x1e\x7d\x60\x59\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\
-\x0d\x4b\x5b\x23\x18\x32\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\x4e\x4a\x4a\
-\x4a\xda\x4a\x4a\x4a\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\
-\x61\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\
-\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\
-\x23\x13\x2c\x4e\x31\x02\x11\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x00\
-\x03\x00\x1e\xff\xfe\x03\xf0\x03\x04\x00\x2e\x00\x32\x00\x36\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\
-\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\
-\x13\x17\x07\x27\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\
-\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\
-\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\
-\x57\x7e\x33\x13\x08\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\
-\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\
-\x35\x2b\x02\x11\x49\x4a\x4a\x4e\x4a\x4a\x4a\xff\xff\x00\x29\xff\
-\x93\x03\x62\x02\xd2\x04\x27\x02\xb8\x01\x3b\xff\x6a\x04\x02\x01\
-\x64\x0b\x00\x00\x04\x00\x1e\xff\x52\x03\xf0\x03\x04\x00\x2e\x00\
-\x36\x00\x3a\x00\x3e\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\
-\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\x07\x27\x07\x27\x01\x17\
-\x07\x27\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\
-\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\
-\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\
-\x33\x13\xfe\x14\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\x3e\x4a\x4a\x4a\
-\xda\x4a\x4a\x4a\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\
-\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\
-\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\
-\x46\x4a\x4a\x03\x63\x49\x4a\x4a\x4e\x4a\x4a\x4a\x00\x00\x00\xff\
-\xff\x00\x29\xfe\xda\x03\x62\x02\xd2\x04\x27\x02\xb9\x00\xb7\xff\
-\x3c\x04\x02\x01\x90\x00\x00\x00\x04\x00\x1e\xff\xfe\x03\xf0\x03\
-\x04\x00\x2e\x00\x45\x00\x49\x00\x4d\x00\x00\x24\x36\x37\x26\x26\
-\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\
-\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\
-\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x26\x35\x34\x36\x37\
-\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\
-\x27\x01\x17\x07\x27\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\
-\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\
-\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\
-\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\
-\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x02\xda\x4a\x4a\x4a\xda\x4a\
-\x4a\x4a\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\
-\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x01\x0f\x49\x4a\x4a\
-\x4e\x4a\x4a\x4a\x00\x00\x00\xff\xff\x00\x28\xff\x92\x03\x64\x02\
-\xd1\x04\x27\x02\xca\x00\x28\xfe\x4f\x04\x06\x01\x90\x02\xff\x00\
-\x04\x00\x17\xff\x90\x03\x6f\x03\x01\x00\x34\x00\x38\x00\x3c\x00\
-\x40\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\
-\x16\x17\x16\x16\x33\x33\x13\x17\x07\x27\x37\x17\x07\x27\x17\x17\
-\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\
-\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\x15\x04\
-\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\
-\x1e\x3f\x2f\x14\x4b\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\
-\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\
-\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\
-\x8f\x57\x3a\x60\x57\x13\x0e\x01\x97\x43\x43\x43\xbf\x43\x42\x42\
-\x37\x43\x43\x43\x00\x00\x00\x00\x05\x00\x17\xff\x90\x03\x6f\x03\
-\x01\x00\x34\x00\x38\x00\x3c\x00\x40\x00\x44\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\
-\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\
-\x01\x17\x07\x27\x25\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\
-\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\
-\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\x15\x04\x3e\x75\
-\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\
-\x2f\x14\xfe\xca\x4d\x4d\x4e\x01\xcf\x43\x43\x42\x89\x43\x43\x43\
-\x91\x43\x43\x43\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\
-\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\
-\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\
-\x32\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\x00\
-\x05\x00\x1e\xff\x29\x03\x37\x03\x5e\x00\x25\x00\x30\x00\x34\x00\
-\x38\x00\x3c\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\
-\x07\x27\x02\x7e\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0e\x2b\
-\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\
-\x30\x24\x0f\xfe\x88\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\
-\xb3\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\x38\
-\x45\x01\xcb\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\
-\x05\x00\x1e\xff\x29\x03\xd2\x03\x01\x00\x32\x00\x3d\x00\x41\x00\
-\x45\x00\x49\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\
-\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\
-\x22\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x02\
-\x8c\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\
-\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\
-\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\xfb\x43\x43\x42\x89\x43\
-\x43\x43\x91\x43\x43\x43\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\
-\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\
-\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\
-\x38\x45\x01\x6e\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\
-\x05\xff\xec\x00\x73\x03\xe9\x03\x01\x00\x3a\x00\x45\x00\x49\x00\
-\x4d\x00\x51\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\
-\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\
-\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x37\
-\x17\x07\x27\x17\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\
-\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x14\xfe\
-\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x01\xfc\x43\x43\x42\
-\x89\x43\x43\x43\x91\x43\x43\x43\xee\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x21\x43\x21\x23\
-\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\
-\x26\x48\x38\x38\x45\x01\x6e\x43\x43\x43\xbf\x43\x42\x42\x37\x43\
-\x43\x43\x00\x00\x05\xff\xec\x00\x73\x03\x4e\x03\x5e\x00\x2d\x00\
-\x38\x00\x3c\x00\x40\x00\x44\x00\x00\x24\x36\x37\x26\x26\x27\x37\
-\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\
-\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\
-\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\
-\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x02\x95\
-\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0d\x2a\x4a\x18\x3d\x62\
-\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\
-\x57\x36\x36\x56\x29\x22\x30\x25\x0f\xfe\x70\x37\x20\x41\x2e\x1b\
-\x33\x23\x23\x33\x1b\x01\xb4\x43\x43\x42\x89\x43\x43\x43\x91\x43\
-\x43\x43\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\
-\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\
-\x33\x12\x12\x26\x48\x38\x38\x45\x01\xcb\x43\x43\x43\xbf\x43\x42\
-\x42\x37\x43\x43\x43\x00\x00\x00\x05\x00\x23\xff\xb0\x04\x71\x03\
-\x01\x00\x3a\x00\x3e\x00\x42\x00\x46\x00\x4a\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\
-\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\x27\x25\x17\x07\x27\x37\
-\x17\x07\x27\x17\x17\x07\x27\x03\x2b\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x18\x1d\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x2a\x55\x1a\x60\x5e\
-\x40\x57\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\
-\x02\x59\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\
-\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\x34\
-\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x06\xff\xec\xff\
-\x8a\x03\x66\x03\x01\x00\x35\x00\x40\x00\x4b\x00\x4f\x00\x53\x00\
-\x57\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x16\x15\
-\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\
-\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\
-\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x01\x17\
-\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x02\x20\x37\x11\x0a\x0f\
-\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\
-\x1c\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\
-\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\xbf\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\x96\x43\x43\
-\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x20\x24\x17\x3d\x3f\x0b\
-\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x29\x35\x3b\x50\
-\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\
-\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\
-\x01\x97\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\
-\x06\xff\xec\xff\x8a\x02\xcb\x03\x5e\x00\x28\x00\x33\x00\x3e\x00\
-\x42\x00\x46\x00\x4a\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\
-\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\
-\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\
-\x23\x22\x06\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\
-\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x59\x17\x49\
-\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\
-\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\
-\x14\x08\x0f\x2d\x27\x06\x01\x4e\x43\x43\x42\x89\x43\x43\x43\x91\
-\x43\x43\x43\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x29\
-\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\
-\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\
-\x2c\x4e\x31\x01\xf4\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\
-\x00\x00\x00\x00\x04\x00\x1e\xff\xfe\x03\xee\x03\x5e\x00\x2e\x00\
-\x32\x00\x36\x00\x3a\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\
-\x27\x37\x16\x16\x33\x33\x13\x17\x07\x27\x37\x17\x07\x27\x17\x17\
-\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\
-\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\
-\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\x08\x43\
-\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x17\x13\x2e\x63\x49\
-\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\
-\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\
-\x01\xf4\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\xff\
-\xff\x00\x29\xff\x93\x03\x62\x03\x45\x04\x27\x02\xbd\x01\x43\x01\
-\x1f\x04\x02\x01\x64\x0b\x00\x00\x05\x00\x1e\xff\x52\x03\xee\x03\
-\x5e\x00\x2e\x00\x36\x00\x3a\x00\x3e\x00\x42\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\
-\x07\x27\x07\x27\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\
-\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\
-\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\
-\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\xfe\x14\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\x02\x3e\x43\x43\x42\x89\x43\x43\x43\x91\x43\
-\x43\x43\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x03\x46\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\xff\
-\xff\x00\x29\xfe\xc6\x03\x62\x03\x45\x04\x27\x02\xb9\x00\xa8\xff\
-\x28\x04\x02\x01\x9f\x00\x00\x00\x05\x00\x1e\xff\xfe\x03\xee\x03\
-\x5e\x00\x2e\x00\x45\x00\x49\x00\x4d\x00\x51\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x26\x35\x34\
-\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\
-\x17\x07\x27\x25\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x03\
-\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\
-\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\
-\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x02\
-\xda\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\
-\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\
-\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\
-\x06\x05\x36\x16\x34\xf2\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\
-\x43\x00\x00\xff\xff\x00\x29\xff\x91\x03\x62\x03\x43\x04\x27\x02\
-\xca\x00\x31\xfe\x4f\x04\x06\x01\x9f\x00\xfe\x00\x02\x00\x1e\xff\
-\xfe\x05\x86\x02\xf8\x00\x3b\x00\x3f\x00\x00\x00\x16\x17\x16\x16\
-\x17\x07\x26\x27\x06\x04\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\
-\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x27\x26\x26\
-\x23\x22\x06\x07\x27\x36\x33\x37\x17\x07\x27\x03\xe6\x46\x39\x54\
-\x84\x49\x1e\x2e\x28\x6e\xfe\xf4\x85\x1a\x1f\x2a\x15\x21\xa2\x6e\
-\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\
-\x02\x11\x21\x4a\x26\x57\x7e\x33\x1d\x6f\xc6\x5b\x19\x3b\x36\x43\
-\x1e\x1e\x38\x27\x2e\x59\x5d\x12\x4d\x4d\x4e\x02\x1f\x15\x16\x20\
-\x23\x01\x6e\x02\x07\x6d\x6b\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\
-\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\
-\x2b\x3b\x3d\x09\x16\x15\x14\x16\x21\x52\x56\xd9\x4e\x4d\x4d\x00\
-\x02\x00\x1e\xff\xfe\x05\xdf\x02\xf8\x00\x48\x00\x4c\x00\x00\x24\
-\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\x33\x32\x16\x17\
-\x16\x16\x17\x07\x26\x27\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x27\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\
-\x26\x27\x27\x37\x16\x16\x33\x33\x13\x17\x07\x27\x03\x87\xc6\x5b\
-\x19\x3b\x36\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\
-\x49\x1e\x2a\x1f\x09\x4d\x4a\x0f\x0a\x07\x07\x0a\x1b\xba\x20\x67\
-\xec\x73\x1a\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\
-\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\
-\x33\x1d\xc2\x4d\x4d\x4e\xee\x3b\x3d\x09\x16\x15\x14\x16\x21\x52\
-\x56\x15\x16\x20\x23\x01\x6e\x02\x05\x34\x27\x1b\x1d\x24\x1f\xa5\
-\x53\x52\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\
-\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x02\x0a\x4e\x4d\
-\x4d\x00\x00\x00\x03\x00\x1e\xff\x52\x05\xdf\x02\xf8\x00\x48\x00\
-\x50\x00\x54\x00\x00\x24\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\
-\x27\x36\x33\x32\x16\x17\x16\x16\x17\x07\x26\x27\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\
-\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\
-\x37\x17\x07\x27\x07\x27\x01\x17\x07\x27\x03\x87\xc6\x5b\x19\x3b\
-\x36\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\x49\x1e\
-\x2a\x1f\x09\x4d\x4a\x0f\x0a\x07\x07\x0a\x1b\xba\x20\x67\xec\x73\
-\x1a\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\
-\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x1d\
-\xfe\x0a\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\x02\x4d\x4d\x4e\xee\x3b\
-\x3d\x09\x16\x15\x14\x16\x21\x52\x56\x15\x16\x20\x23\x01\x6e\x02\
-\x05\x34\x27\x1b\x1d\x24\x1f\xa5\x53\x52\x0a\x0d\x3f\x4d\x3a\x61\
-\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\
-\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\x5c\x4e\
-\x4d\x4d\x00\x00\x03\x00\x1e\xff\xfe\x05\x86\x02\xf8\x00\x3b\x00\
-\x52\x00\x56\x00\x00\x00\x16\x17\x16\x16\x17\x07\x26\x27\x06\x04\
-\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\
-\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\
-\x16\x33\x33\x32\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\
-\x33\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\
-\x17\x16\x33\x32\x37\x17\x07\x27\x01\x17\x07\x27\x03\xe6\x46\x39\
-\x54\x84\x49\x1e\x2e\x28\x6e\xfe\xf4\x85\x1a\x1f\x2a\x15\x21\xa2\
-\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\
-\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x1d\x6f\xc6\x5b\x19\x3b\x36\
-\x43\x1e\x1e\x38\x27\x2e\x59\x5d\xfc\x9e\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x9e\x4d\x4d\
-\x4e\x02\x1f\x15\x16\x20\x23\x01\x6e\x02\x07\x6d\x6b\x0a\x0d\x3f\
-\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\
-\x05\x0e\x12\x29\x55\x35\x2b\x3b\x3d\x09\x16\x15\x14\x16\x21\x52\
-\x56\x2a\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\
-\x36\x16\x34\x01\x08\x4e\x4d\x4d\x00\x00\x00\x00\x03\x00\x1e\xff\
-\xfe\x05\xdf\x02\xf8\x00\x48\x00\x5f\x00\x63\x00\x00\x24\x36\x37\
-\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\x33\x32\x16\x17\x16\x16\
-\x17\x07\x26\x27\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x27\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\
-\x27\x37\x16\x16\x33\x33\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x01\x17\x07\
-\x27\x03\x87\xc6\x5b\x19\x3b\x36\x43\x1e\x1e\x38\x27\x2e\x59\x5d\
-\x1e\x46\x39\x54\x84\x49\x1e\x2a\x1f\x09\x4d\x4a\x0f\x0a\x07\x07\
-\x0a\x1b\xba\x20\x67\xec\x73\x1a\x1f\x2a\x15\x21\xa2\x6e\x69\x96\
-\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\
-\x21\x4a\x26\x57\x7e\x33\x1d\xfd\x4e\x1d\x31\x29\x23\x1c\x0f\x12\
-\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x9e\x4d\x4d\x4e\
-\xee\x3b\x3d\x09\x16\x15\x14\x16\x21\x52\x56\x15\x16\x20\x23\x01\
-\x6e\x02\x05\x34\x27\x1b\x1d\x24\x1f\xa5\x53\x52\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x01\x08\x4e\x4d\x4d\x00\x00\
-\x01\x00\x17\xff\x90\x04\xca\x01\xf5\x00\x46\x00\x00\x24\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\
-\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\
-\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x04\x0c\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\x1e\x29\
-\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\
-\x67\x35\x19\x1e\x3f\x2f\x13\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\
-\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\
-\x2b\x5e\x1b\x17\x58\x3f\x73\x1f\x21\x40\x25\x25\x28\x22\x09\x0a\
-\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\
-\x13\x0e\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\
-\x4a\x33\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x00\x00\x00\
-\x01\x00\x17\xff\x90\x05\x45\x01\xc6\x00\x52\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\
-\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\
-\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\
-\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\
-\x33\x32\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\x05\x3e\
-\x07\x07\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\
-\x2e\x71\x19\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\
-\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x16\x34\x31\x0d\x07\x05\
-\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\x20\
-\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xee\x1b\x1d\
-\x24\x1f\x37\x37\x1f\x1e\x3d\x1e\x1e\x3c\x09\x0a\x45\x6f\x42\x09\
-\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x24\x30\
-\x19\x1c\x14\x0b\x4a\x28\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\
-\x15\x12\x18\x2f\x5c\x0d\x61\x4a\x19\x13\x00\x00\x02\x00\x1e\xff\
-\x29\x05\x2d\x02\x0a\x00\x44\x00\x4f\x00\x00\x24\x26\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\
-\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\
-\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x24\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x04\x6f\x4c\x18\x28\
-\x57\x2e\x48\x13\x18\x4e\x38\x1f\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x13\x33\x2f\x0f\x0b\
-\x0b\x5f\x08\x10\x11\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\
-\x39\x1b\x35\x03\x03\x2b\x5e\x1b\x17\x58\x3f\xfc\x49\x3f\x1f\x36\
-\x19\x1d\x33\x22\x21\x32\x1b\x73\x1f\x21\x40\x25\x25\x28\x22\x22\
-\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\
-\x45\x30\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\
-\x4a\x33\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x7b\x11\x14\
-\x48\x39\x38\x45\x00\x00\x00\x00\x02\xff\xec\x00\x73\x05\xbf\x02\
-\x0a\x00\x58\x00\x63\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\
-\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\
-\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\
-\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x05\xb8\x07\x07\x0a\
-\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\x19\
-\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\
-\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x16\x34\x31\
-\x0d\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\
-\x09\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\
-\xfb\x30\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\xee\x1b\x1d\x24\
-\x1f\x37\x37\x1f\x1e\x3d\x1e\x1e\x3c\x22\x21\x43\x21\x23\x21\x23\
-\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x24\x30\x19\x1c\
-\x14\x0b\x4a\x28\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\
-\x18\x2f\x5c\x0d\x61\x4a\x19\x13\x12\x12\x26\x48\x38\x38\x45\x00\
-\x02\xff\xec\x00\x73\x05\x44\x02\x0a\x00\x4c\x00\x57\x00\x00\x24\
-\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\
-\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\
-\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x24\x16\x33\x32\
-\x37\x26\x26\x23\x22\x06\x07\x04\x86\x4c\x18\x28\x57\x2e\x48\x13\
-\x18\x4e\x38\x1e\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\
-\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\
-\x25\x13\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\x2d\x21\x20\x22\x0a\
-\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\x2b\x5e\x1b\x17\x58\
-\x3f\xfc\x31\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x73\x1f\x21\
-\x40\x25\x25\x28\x22\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\
-\x34\x45\x58\x4b\x4b\x58\x46\x33\x1c\x2d\x1e\x39\x0b\x38\x32\x18\
-\x13\x1e\x25\x22\x4d\x0a\x4a\x33\x17\x14\x18\x56\x66\x33\x41\x6f\
-\x3c\x4b\x4b\x8d\x12\x26\x48\x38\x38\x45\x00\x00\x03\xff\xec\xff\
-\x8a\x05\x3c\x02\x1c\x00\x53\x00\x5e\x00\x69\x00\x00\x24\x16\x15\
-\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\
-\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\
-\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x32\x36\x37\
-\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\
-\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\
-\x26\x23\x22\x06\x06\x07\x05\x35\x07\x07\x0a\x0d\x60\x33\x24\x58\
-\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\x65\x17\x49\x3c\x54\x74\
-\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7c\
-\x34\x31\x0d\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\
-\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\
-\x27\x0c\xfb\x84\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\
-\x08\x0f\x2d\x27\x06\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\x3d\x1e\
-\x1e\x3c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\
-\x61\x30\x34\x2a\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\x0f\x1e\x25\
-\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\x4a\x19\x13\
-\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\
-\x4e\x31\x00\x00\x03\xff\xec\xff\x8a\x04\xc1\x02\x1c\x00\x47\x00\
-\x52\x00\x5d\x00\x00\x24\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\
-\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\
-\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\
-\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x04\x16\x33\x32\
-\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x07\x04\x03\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\x6a\x17\
-\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\
-\x32\x20\x16\x79\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\x2d\x21\x20\
-\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\x2b\x5e\x1b\
-\x17\x58\x3f\xfc\x85\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\
-\x14\x08\x0f\x2d\x27\x06\x73\x1f\x21\x40\x25\x25\x28\x22\x29\x35\
-\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\
-\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\
-\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x37\x3e\x1b\x1b\x1a\
-\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x00\x00\x00\
-\x01\x00\x29\xff\x93\x04\xf8\x02\x16\x00\x51\x00\x00\x24\x36\x37\
-\x36\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\
-\x14\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x26\x27\x26\x26\
-\x23\x22\x06\x15\x14\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x35\x34\
-\x27\x26\x35\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x33\x03\x71\
-\x23\x0a\x0d\x08\x60\x08\x11\x12\x38\x1a\x35\x03\x03\x2b\x5e\x1b\
-\x17\x58\x3f\x27\x4d\x18\x15\x45\x2b\x11\x3a\x4b\x3f\x26\x18\x44\
-\x2f\x26\x36\x31\x39\x45\x52\x4b\x85\x54\x8f\x93\x12\x18\x56\x10\
-\x0a\x01\x02\x5d\x69\x36\x50\x2a\x78\x8b\x37\x60\x3a\x42\x6e\x20\
-\x1d\x2a\x2c\x23\x13\xee\x1c\x24\x2c\x3c\x0b\x35\x40\x15\x13\x18\
-\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x20\x21\x20\x21\x23\x55\x52\x34\
-\x32\x2a\x1e\x15\x27\x14\x1a\x4e\x31\x36\x68\x41\x8c\x72\x2b\x53\
-\x3e\x18\x36\x40\x1e\x3d\x58\x1f\x2c\x13\x1e\x2c\x35\x6e\x36\x57\
-\x32\x45\x49\x43\x40\x17\x00\x00\x01\x00\x29\xff\x93\x05\x58\x02\
-\x16\x00\x5e\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x26\x27\x26\x26\x23\x22\x06\
-\x15\x14\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x26\x35\x34\x36\
-\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x35\x34\x27\x26\x35\
-\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x3b\x02\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x33\x32\x36\x37\x36\x27\x37\x16\x15\x14\x07\x16\
-\x33\x33\x05\x51\x07\x07\x0a\x0d\x4f\x35\x26\x47\x25\x41\x17\x12\
-\x3f\x2b\x11\x3a\x4b\x3f\x26\x18\x44\x2f\x26\x36\x31\x39\x45\x52\
-\x4b\x85\x54\x8f\x93\x12\x18\x56\x10\x0a\x01\x02\x5d\x69\x36\x50\
-\x2a\x78\x8b\x37\x60\x3a\x42\x6e\x20\x1d\x2a\x2c\x23\x14\x01\x1f\
-\x1c\x09\x07\x09\x5c\x07\x0c\x1f\x36\x1a\x1d\x02\x03\x10\x5f\x0e\
-\x01\x2d\x33\x0c\xee\x1b\x1d\x24\x1f\x26\x26\x1e\x1e\x1c\x20\x23\
-\x55\x52\x34\x32\x2a\x1e\x15\x27\x14\x1a\x4e\x31\x36\x68\x41\x8c\
-\x72\x2b\x53\x3e\x18\x36\x40\x1e\x3d\x58\x1f\x2c\x13\x1e\x2c\x35\
-\x6e\x36\x57\x32\x45\x49\x43\x40\x17\x1c\x27\x1e\x4c\x0a\x48\x38\
-\x23\x15\x12\x36\x6d\x0d\x58\x48\x1c\x0c\x0f\xff\xff\x00\x29\xfe\
-\xc6\x04\xf8\x02\x16\x04\x27\x02\xb9\x00\xb2\xff\x28\x04\x02\x01\
-\xb0\x00\x00\xff\xff\x00\x29\xfe\xdc\x05\x58\x02\x16\x04\x27\x02\
-\xb9\x00\xb7\xff\x3e\x04\x02\x01\xb1\x00\x00\x00\x02\x00\x17\xff\
-\x90\x04\xca\x02\xa1\x00\x46\x00\x4a\x00\x00\x24\x26\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\
-\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\
-\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x01\x17\x07\x27\x04\x0c\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\
-\x1e\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\
-\x34\x33\x67\x35\x19\x1e\x3f\x2f\x13\x33\x2f\x0f\x0b\x0b\x5f\x08\
-\x10\x11\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\
-\x03\x03\x2b\x5e\x1b\x17\x58\x3f\xfc\x90\x4d\x4d\x4e\x73\x1f\x21\
-\x40\x25\x25\x28\x22\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x1c\x2d\x1e\x39\x0b\x38\x32\
-\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\x17\x14\x18\x56\x66\x33\x41\
-\x6f\x3c\x4b\x4b\x02\x2e\x4e\x4d\x4d\x00\x00\x00\x02\x00\x17\xff\
-\x90\x05\x45\x02\xa1\x00\x52\x00\x56\x00\x00\x24\x16\x15\x14\x06\
-\x23\x23\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\
-\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\
-\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x37\x17\
-\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\
-\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\x01\x17\x07\x27\
-\x05\x3e\x07\x07\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\
-\x43\x14\x2e\x71\x19\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\
-\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x16\x34\x31\x0d\
-\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\
-\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfb\
-\x8f\x4d\x4d\x4e\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\x3d\x1e\x1e\
-\x3c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\
-\x3a\x60\x57\x13\x0e\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\x0f\x1e\
-\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\x4a\x19\
-\x13\x01\xb3\x4e\x4d\x4d\x00\x00\x02\x00\x1e\xff\x29\x05\xa8\x02\
-\x0a\x00\x50\x00\x5b\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\
-\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\
-\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x37\x17\x06\x07\x16\x16\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\
-\x27\x37\x16\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\
-\x22\x06\x07\x05\xa1\x07\x07\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\
-\x28\x55\x2a\x43\x14\x2e\x71\x1a\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x16\x34\x31\x0d\x07\
-\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\
-\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfb\x48\
-\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\xee\x1b\x1d\x24\x1f\x37\
-\x37\x1f\x1e\x3d\x1e\x1e\x3c\x22\x22\x44\x33\x1d\x34\xfe\xd7\x03\
-\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x24\x30\x19\x1c\x14\x0b\
-\x4a\x28\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\
-\x5c\x0d\x61\x4a\x19\x13\x11\x14\x48\x39\x38\x45\x00\x00\x00\xff\
-\xff\x00\x29\xff\x93\x04\xf8\x02\x9a\x04\x27\x02\xca\x00\x2d\xfe\
-\x49\x04\x02\x01\xb0\x00\x00\xff\xff\x00\x29\xff\x93\x05\x58\x02\
-\x9a\x04\x27\x02\xca\x00\x2d\xfe\x49\x04\x02\x01\xb1\x00\x00\x00\
-\x04\x00\x17\xff\x90\x04\xca\x02\xe6\x00\x46\x00\x4a\x00\x4e\x00\
-\x52\x00\x00\x24\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\
-\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\
-\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\
-\x27\x37\x16\x16\x15\x14\x06\x23\x03\x17\x07\x27\x37\x17\x07\x27\
-\x17\x17\x07\x27\x04\x0c\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\
-\x1e\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\
-\x34\x33\x67\x35\x19\x1e\x3f\x2f\x13\x33\x2f\x0f\x0b\x0b\x5f\x08\
-\x10\x11\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\
-\x03\x03\x2b\x5e\x1b\x17\x58\x3f\xec\x43\x43\x42\x89\x43\x43\x43\
-\x91\x43\x43\x43\x73\x1f\x21\x40\x25\x25\x28\x22\x09\x0a\x45\x6f\
-\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\
-\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\
-\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x01\xf7\x43\x43\x43\
-\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\x00\x04\x00\x17\xff\
-\x90\x05\x45\x02\xe6\x00\x52\x00\x56\x00\x5a\x00\x5e\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\
-\x26\x27\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\
-\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\
-\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x05\x3e\x07\x07\
-\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\
-\x19\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\
-\x34\x33\x67\x35\x19\x1e\x3f\x2f\x16\x34\x31\x0d\x07\x05\x04\x5d\
-\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\x20\x37\x1a\
-\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfe\x14\x43\x43\x42\
-\x89\x43\x43\x43\x91\x43\x43\x43\xee\x1b\x1d\x24\x1f\x37\x37\x1f\
-\x1e\x3d\x1e\x1e\x3c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x24\x30\x19\x1c\x14\x0b\x4a\
-\x28\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\
-\x0d\x61\x4a\x19\x13\x01\x7c\x43\x43\x43\xbf\x43\x42\x42\x37\x43\
-\x43\x43\x00\x00\x05\x00\x17\xff\x90\x04\xca\x02\xe6\x00\x46\x00\
-\x4a\x00\x4e\x00\x52\x00\x56\x00\x00\x24\x26\x27\x06\x23\x22\x26\
-\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\
-\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\
-\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x01\x17\
-\x07\x27\x25\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x04\x0c\
-\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\x1e\x29\x35\x15\x04\x3e\
-\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\
-\x3f\x2f\x13\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\x2d\x21\x20\x22\
-\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\x2b\x5e\x1b\x17\
-\x58\x3f\xfc\x90\x4d\x4d\x4e\x02\xd2\x43\x43\x42\x89\x43\x43\x43\
-\x91\x43\x43\x43\x73\x1f\x21\x40\x25\x25\x28\x22\x09\x0a\x45\x6f\
-\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\
-\x1c\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\
-\x17\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x02\x2e\x4e\x4d\x4d\
-\x17\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\x00\
-\x05\x00\x17\xff\x90\x05\x45\x02\xe6\x00\x52\x00\x56\x00\x5a\x00\
-\x5e\x00\x62\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\
-\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\x26\x27\x0e\x02\
-\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\
-\x16\x33\x33\x32\x36\x37\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\
-\x16\x07\x16\x16\x33\x33\x01\x17\x07\x27\x25\x17\x07\x27\x37\x17\
-\x07\x27\x17\x17\x07\x27\x05\x3e\x07\x07\x0a\x0d\x60\x33\x24\x58\
-\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\x19\x29\x35\x15\x04\x3e\
-\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\
-\x3f\x2f\x16\x34\x31\x0d\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\
-\x22\x0a\x09\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\
-\x02\x18\x3d\x27\x0c\xfb\x8f\x4d\x4d\x4e\x02\xd3\x43\x43\x42\x89\
-\x43\x43\x43\x91\x43\x43\x43\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\
-\x3d\x1e\x1e\x3c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\
-\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x24\x30\x19\x1c\x14\x0b\x4a\x28\
-\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\
-\x61\x4a\x19\x13\x01\xb3\x4e\x4d\x4d\x17\x43\x43\x43\xbf\x43\x42\
-\x42\x37\x43\x43\x43\x00\x00\x00\x05\x00\x1e\xff\x29\x05\x2d\x02\
-\xe6\x00\x44\x00\x4f\x00\x53\x00\x57\x00\x5b\x00\x00\x24\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\
-\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\
-\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x24\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\
-\x27\x37\x17\x07\x27\x17\x17\x07\x27\x04\x6f\x4c\x18\x28\x57\x2e\
-\x48\x13\x18\x4e\x38\x1f\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\
-\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x13\x33\x2f\x0f\x0b\x0b\x5f\
-\x08\x10\x11\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\
-\x35\x03\x03\x2b\x5e\x1b\x17\x58\x3f\xfc\x49\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\xfe\x43\x43\x42\x89\x43\x43\x43\x91\x43\
-\x43\x43\x73\x1f\x21\x40\x25\x25\x28\x22\x22\x22\x44\x33\x1d\x34\
-\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x1c\x2d\x1e\
-\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\x17\x14\x18\
-\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x7b\x11\x14\x48\x39\x38\x45\x01\
-\x53\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\x00\
-\x05\x00\x1e\xff\x29\x05\xa8\x02\xe6\x00\x50\x00\x5b\x00\x5f\x00\
-\x63\x00\x67\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\
-\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\x26\x27\x06\x23\
-\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\
-\x16\x33\x33\x32\x36\x37\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\
-\x16\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\
-\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x05\xa1\x07\
-\x07\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\
-\x71\x1a\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\
-\x58\x2a\x20\x30\x24\x16\x34\x31\x0d\x07\x05\x04\x5d\x0e\x0a\x10\
-\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\
-\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfb\x48\x3f\x1f\x36\x19\x1d\x33\
-\x22\x21\x32\x1b\x02\xff\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\
-\x43\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\x3d\x1e\x1e\x3c\x22\x22\
-\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\
-\x30\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\x0f\x1e\x25\x22\x4d\x0a\
-\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\x4a\x19\x13\x11\x14\x48\
-\x39\x38\x45\x01\x53\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\
-\x00\x00\x00\x00\x05\xff\xec\x00\x73\x05\xbf\x02\xe6\x00\x58\x00\
-\x63\x00\x67\x00\x6b\x00\x6f\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\
-\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\x07\x16\x16\
-\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\
-\x27\x37\x17\x07\x27\x17\x17\x07\x27\x05\xb8\x07\x07\x0a\x0d\x60\
-\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\x19\x2a\x4a\
-\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\
-\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x16\x34\x31\x0d\x07\
-\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\
-\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfb\x30\
-\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x03\x00\x43\x43\x42\x89\
-\x43\x43\x43\x91\x43\x43\x43\xee\x1b\x1d\x24\x1f\x37\x37\x1f\x1e\
-\x3d\x1e\x1e\x3c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\
-\x45\x58\x4b\x4b\x58\x46\x33\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\
-\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\
-\x4a\x19\x13\x12\x12\x26\x48\x38\x38\x45\x01\x53\x43\x43\x43\xbf\
-\x43\x42\x42\x37\x43\x43\x43\x00\x05\xff\xec\x00\x73\x05\x44\x02\
-\xe6\x00\x4c\x00\x57\x00\x5b\x00\x5f\x00\x63\x00\x00\x24\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\
-\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\
-\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\
-\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x24\x16\x33\x32\x37\x26\
-\x26\x23\x22\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\
-\x27\x04\x86\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\x1e\x2a\x4a\
-\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\
-\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x13\x33\x2f\x0f\x0b\
-\x0b\x5f\x08\x10\x11\x2d\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\
-\x39\x1b\x35\x03\x03\x2b\x5e\x1b\x17\x58\x3f\xfc\x31\x37\x20\x41\
-\x2e\x1b\x33\x23\x23\x33\x1b\x02\xff\x43\x43\x42\x89\x43\x43\x43\
-\x91\x43\x43\x43\x73\x1f\x21\x40\x25\x25\x28\x22\x22\x21\x43\x21\
-\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x1c\
-\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\x17\
-\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x8d\x12\x26\x48\x38\x38\
-\x45\x01\x53\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\
-\x06\xff\xec\xff\x8a\x05\x3c\x02\xe6\x00\x53\x00\x5e\x00\x69\x00\
-\x6d\x00\x71\x00\x75\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x27\
-\x06\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x23\x23\x16\x15\x14\
-\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x33\x32\x36\x37\x36\x37\x37\x17\x06\x07\
-\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\
-\x37\x34\x27\x37\x16\x07\x16\x16\x33\x33\x04\x16\x33\x32\x36\x35\
-\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\
-\x01\x17\x07\x27\x37\x17\x07\x27\x17\x17\x07\x27\x05\x35\x07\x07\
-\x0a\x0d\x60\x33\x24\x58\x26\x41\x17\x28\x55\x2a\x43\x14\x2e\x71\
-\x65\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\
-\x23\x18\x32\x20\x16\x7c\x34\x31\x0d\x07\x05\x04\x5d\x0e\x0a\x10\
-\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\x0c\x20\x37\x1a\x1d\x01\x01\
-\x0d\x5f\x10\x02\x18\x3d\x27\x0c\xfb\x84\x41\x29\x1d\x1b\x18\x1a\
-\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x02\x9a\x43\x43\x42\
-\x89\x43\x43\x43\x91\x43\x43\x43\xee\x1b\x1d\x24\x1f\x37\x37\x1f\
-\x1e\x3d\x1e\x1e\x3c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\
-\x8b\x4f\x3f\x61\x30\x34\x2a\x24\x30\x19\x1c\x14\x0b\x4a\x28\x11\
-\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\x15\x12\x18\x2f\x5c\x0d\x61\
-\x4a\x19\x13\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\
-\x23\x13\x2c\x4e\x31\x01\x7c\x43\x43\x43\xbf\x43\x42\x42\x37\x43\
-\x43\x43\x00\x00\x06\xff\xec\xff\x8a\x04\xc1\x02\xe6\x00\x47\x00\
-\x52\x00\x5d\x00\x61\x00\x65\x00\x69\x00\x00\x24\x26\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\
-\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\
-\x37\x17\x06\x07\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\
-\x34\x26\x26\x23\x22\x06\x06\x07\x01\x17\x07\x27\x37\x17\x07\x27\
-\x17\x17\x07\x27\x04\x03\x4c\x18\x28\x57\x2e\x48\x13\x18\x4e\x38\
-\x6a\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\
-\x23\x18\x32\x20\x16\x79\x33\x2f\x0f\x0b\x0b\x5f\x08\x10\x11\x2d\
-\x21\x20\x22\x0a\x09\x0a\x59\x09\x0b\x13\x39\x1b\x35\x03\x03\x2b\
-\x5e\x1b\x17\x58\x3f\xfc\x85\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\
-\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x02\x99\x43\x43\x42\x89\x43\x43\
-\x43\x91\x43\x43\x43\x73\x1f\x21\x40\x25\x25\x28\x22\x29\x35\x3b\
-\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\x1c\
-\x2d\x1e\x39\x0b\x38\x32\x18\x13\x1e\x25\x22\x4d\x0a\x4a\x33\x17\
-\x14\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x37\x3e\x1b\x1b\x1a\x35\
-\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x01\x7c\x43\x43\
-\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\xff\xff\x00\x29\xff\
-\x93\x04\xf8\x03\x10\x04\x27\x02\xbd\x03\x11\x00\xea\x04\x02\x01\
-\xb0\x00\x00\xff\xff\x00\x29\xff\x93\x05\x58\x03\x10\x04\x27\x02\
-\xbd\x03\x2d\x00\xea\x04\x02\x01\xb1\x00\x00\xff\xff\x00\x29\xfe\
-\xc9\x04\xf8\x03\x10\x04\x27\x02\xbd\x03\x1b\x00\xea\x04\x27\x02\
-\xb9\x00\xaf\xff\x2b\x04\x02\x01\xb0\x00\x00\xff\xff\x00\x29\xfe\
-\xd9\x05\x58\x03\x10\x04\x27\x02\xbd\x03\x2d\x00\xea\x04\x27\x02\
-\xb9\x00\xb7\xff\x3b\x04\x02\x01\xb1\x00\x00\xff\xff\x00\x29\xff\
-\x93\x04\xf8\x03\x10\x04\x27\x02\xbd\x03\x15\x00\xea\x04\x22\x01\
-\xb0\x00\x00\x04\x07\x02\xca\x00\x2d\xfe\x49\x00\x05\x00\x29\xff\
-\x93\x05\x58\x03\x10\x00\x03\x00\x62\x00\x79\x00\x7d\x00\x81\x00\
-\x00\x01\x37\x17\x07\x00\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x35\x34\x27\x26\x35\x34\x36\x36\x33\x32\x16\x17\x1e\x02\
-\x3b\x02\x32\x36\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x36\
-\x27\x37\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x26\x27\x26\
-\x26\x23\x22\x06\x15\x14\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\
-\x26\x35\x13\x26\x35\x34\x36\x33\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x25\x17\x07\x27\x37\x17\x07\
-\x27\x03\x79\x43\x43\x43\xfc\x6d\x12\x18\x56\x10\x0a\x01\x02\x5d\
-\x69\x36\x50\x2a\x78\x8b\x37\x60\x3a\x42\x6e\x20\x1d\x2a\x2c\x23\
-\x14\x01\x1f\x1c\x09\x07\x09\x5c\x07\x0c\x1f\x36\x1a\x1d\x02\x03\
-\x10\x5f\x0e\x01\x2d\x33\x0c\x0a\x07\x07\x0a\x0d\x4f\x35\x26\x47\
-\x25\x41\x17\x12\x3f\x2b\x11\x3a\x4b\x3f\x26\x18\x44\x2f\x26\x36\
-\x31\x39\x45\x52\x4b\x85\x54\x8f\x93\x27\x1a\x33\x2b\x22\x1a\x0f\
-\x15\x16\x15\x1b\x20\x0f\x15\x11\x2a\x04\xb2\x0b\x03\x49\x43\x43\
-\x42\xd7\x43\x43\x43\x02\xcd\x43\x43\x42\xfe\x31\x53\x3e\x18\x36\
-\x40\x1e\x3d\x58\x1f\x2c\x13\x1e\x2c\x35\x6e\x36\x57\x32\x45\x49\
-\x43\x40\x17\x1c\x27\x1e\x4c\x0a\x48\x38\x23\x15\x12\x36\x6d\x0d\
-\x58\x48\x1c\x0c\x0f\x1b\x1d\x24\x1f\x26\x26\x1e\x1e\x1c\x20\x23\
-\x55\x52\x34\x32\x2a\x1e\x15\x27\x14\x1a\x4e\x31\x36\x68\x41\x8c\
-\x72\x01\x62\x1a\x20\x26\x32\x14\x33\x09\x12\x0e\x16\x09\x04\x05\
-\x35\x1e\x36\xa8\x43\x43\x43\x45\x43\x43\x43\x00\x02\x00\x17\xff\
-\x90\x04\xfd\x02\x20\x00\x36\x00\x3f\x00\x00\x24\x26\x27\x0e\x02\
-\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\
-\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x23\x23\x24\
-\x36\x35\x34\x26\x23\x22\x06\x07\x01\xbb\x35\x15\x04\x3e\x75\x54\
-\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\
-\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\
-\x58\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x0f\x02\x13\xa2\x35\
-\x31\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\x1b\x27\x37\x0a\x44\x36\
-\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x7d\x2c\
-\x2d\x29\x2f\x5a\x59\x00\x00\x00\x02\x00\x17\xff\x90\x05\x31\x02\
-\x20\x00\x42\x00\x4b\x00\x00\x24\x26\x27\x0e\x02\x23\x22\x27\x37\
-\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\
-\x23\x22\x26\x27\x06\x23\x23\x24\x36\x35\x34\x26\x23\x22\x06\x07\
-\x01\xbb\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\
-\x34\x33\x67\x35\x19\x1e\x3f\x2f\x12\x1b\x26\x0c\x12\x06\x54\x08\
-\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\
-\x07\x0a\x0d\x62\x33\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0f\x02\
-\x13\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\x09\x71\x04\
-\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\x1b\x27\x37\
-\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\
-\x24\x1f\x30\x30\x12\x13\x25\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\
-\x03\x00\x17\xff\x90\x04\xfd\x02\xa1\x00\x36\x00\x3a\x00\x43\x00\
-\x00\x24\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\
-\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\
-\x26\x27\x06\x23\x23\x01\x17\x07\x27\x00\x36\x35\x34\x26\x23\x22\
-\x06\x07\x01\xbb\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\
-\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x12\x1b\x26\x0c\x12\x06\
-\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\x22\
-\x20\x3a\x12\x2b\x4c\x0f\xfe\xdf\x4d\x4d\x4e\x03\x82\xa2\x35\x31\
-\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\
-\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\x1b\x27\x37\x0a\x44\x36\x0b\
-\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x02\x2e\x4e\
-\x4d\x4d\xfe\x9d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x03\x00\x17\xff\
-\x90\x05\x31\x02\xa1\x00\x42\x00\x46\x00\x4f\x00\x00\x24\x26\x27\
-\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\
-\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\
-\x23\x23\x22\x27\x06\x21\x23\x22\x26\x27\x06\x23\x23\x01\x17\x07\
-\x27\x00\x36\x35\x34\x26\x23\x22\x06\x07\x01\xbb\x35\x15\x04\x3e\
-\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\
-\x3f\x2f\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\
-\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\x0a\x0d\x62\x33\x78\
-\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\xdf\x4d\x4d\x4e\x03\x82\
-\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\
-\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\x1b\x27\x37\x0a\
-\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\x24\
-\x1f\x30\x30\x12\x13\x25\x02\x2e\x4e\x4d\x4d\xfe\x9d\x2c\x2d\x29\
-\x2f\x5a\x59\x00\x03\x00\x1e\xff\x29\x05\x60\x02\x20\x00\x34\x00\
-\x3f\x00\x48\x00\x00\x24\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\
-\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x22\x26\x27\x06\x23\x23\x24\x33\x32\x36\x37\x26\x26\
-\x23\x22\x06\x07\x04\x36\x35\x34\x26\x23\x22\x06\x07\x02\x1b\x49\
-\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\
-\x24\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\
-\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x10\xfe\x99\x3f\
-\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x03\xae\xa2\x35\x31\x3a\x80\
-\x38\x73\x22\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\
-\xbc\x4d\x5a\x45\x30\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\
-\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x7b\x11\x14\x48\x39\x38\
-\x45\x27\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x00\x00\x03\xff\xec\x00\
-\x73\x05\xab\x02\x20\x00\x48\x00\x53\x00\x5c\x00\x00\x24\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\
-\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x07\
-\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\x22\
-\x26\x27\x06\x23\x23\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\
-\x04\x36\x35\x34\x26\x23\x22\x06\x07\x02\x34\x4a\x18\x3d\x62\x32\
-\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\
-\x36\x36\x56\x29\x22\x30\x25\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\
-\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\
-\x0a\x0d\x62\x33\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\x80\
-\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x03\xaf\xa2\x35\x31\x3a\
-\x80\x38\x73\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\
-\x58\x4b\x4b\x58\x46\x33\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\
-\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\x24\x1f\x30\x30\x12\x13\
-\x25\x8d\x12\x26\x48\x38\x38\x45\x27\x2c\x2d\x29\x2f\x5a\x59\x00\
-\x03\xff\xec\x00\x73\x05\x77\x02\x20\x00\x3c\x00\x47\x00\x50\x00\
-\x00\x24\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\
-\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x23\x23\x24\x16\x33\
-\x32\x37\x26\x26\x23\x22\x06\x07\x04\x36\x35\x34\x26\x23\x22\x06\
-\x07\x02\x34\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\
-\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x12\
-\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\
-\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\x80\x37\x20\x41\
-\x2e\x1b\x33\x23\x23\x33\x1b\x03\xaf\xa2\x35\x31\x3a\x80\x38\x73\
-\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\
-\x58\x46\x33\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\
-\x5c\x39\x4f\x63\x31\x12\x13\x25\x8d\x12\x26\x48\x38\x38\x45\x27\
-\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x04\xff\xec\xff\x8a\x05\x28\x02\
-\x20\x00\x43\x00\x4e\x00\x59\x00\x62\x00\x00\x24\x15\x14\x06\x23\
-\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x07\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\
-\x23\x23\x22\x27\x06\x21\x23\x22\x26\x27\x06\x23\x23\x06\x16\x33\
-\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\
-\x06\x06\x07\x24\x36\x35\x34\x26\x23\x22\x06\x07\x01\xa6\x49\x3c\
-\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\
-\x16\x78\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\
-\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\x0a\x0d\x62\x33\x78\xfe\
-\xf2\x22\x20\x3a\x12\x2b\x4c\x5b\xe0\x41\x29\x1d\x1b\x18\x1a\x37\
-\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x03\x49\xa2\x35\x31\x3a\
-\x80\x38\x4a\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\
-\x61\x30\x34\x2a\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\
-\x35\x5c\x39\x3e\x28\x02\x1b\x1d\x24\x1f\x30\x30\x12\x13\x25\x37\
-\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\
-\x31\x02\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x00\x00\x04\xff\xec\xff\
-\x8a\x04\xf4\x02\x20\x00\x37\x00\x42\x00\x4d\x00\x56\x00\x00\x24\
-\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x07\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\
-\x26\x27\x06\x23\x23\x06\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\
-\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x24\x36\x35\x34\x26\
-\x23\x22\x06\x07\x01\xa6\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\
-\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x78\x1b\x26\x0c\x12\x06\x54\
-\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\
-\x3a\x12\x2b\x4c\x5b\xe0\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\
-\x0f\x14\x08\x0f\x2d\x27\x06\x03\x49\xa2\x35\x31\x3a\x80\x38\x4a\
-\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\
-\x2a\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\
-\x4f\x63\x31\x12\x13\x25\x37\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\
-\x31\x2c\x16\x23\x13\x2c\x4e\x31\x02\x2c\x2d\x29\x2f\x5a\x59\x00\
-\x02\x00\x29\xff\x93\x05\x75\x02\x20\x00\x41\x00\x4a\x00\x00\x16\
-\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x35\
-\x34\x27\x26\x35\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x33\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x26\x27\x26\
-\x26\x23\x22\x06\x15\x14\x16\x17\x16\x16\x15\x14\x06\x06\x23\x00\
-\x36\x35\x34\x26\x23\x22\x06\x07\xbc\x93\x12\x18\x56\x10\x0a\x01\
-\x02\x5d\x69\x36\x50\x2a\x78\x8b\x37\x60\x3a\x42\x6e\x20\x1d\x2a\
-\x2c\x23\x12\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\x31\x3a\x4b\
-\x3f\x26\x18\x44\x2f\x26\x36\x31\x39\x45\x52\x4b\x85\x54\x03\x24\
-\xa2\x35\x31\x3a\x80\x38\x6d\x8c\x72\x2b\x53\x3e\x18\x36\x40\x1e\
-\x3d\x58\x1f\x2c\x13\x1e\x2c\x35\x6e\x36\x57\x32\x45\x49\x43\x40\
-\x17\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x23\x55\x52\x34\x32\x2a\
-\x1e\x15\x27\x14\x1a\x4e\x31\x36\x68\x41\x01\x5d\x2c\x2d\x29\x2f\
-\x5a\x59\x00\x00\x02\x00\x29\xff\x93\x05\xaa\x02\x20\x00\x4e\x00\
-\x57\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x21\x23\
-\x22\x26\x26\x27\x26\x26\x23\x22\x06\x15\x14\x16\x17\x16\x16\x15\
-\x14\x06\x06\x23\x22\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\
-\x33\x32\x36\x36\x35\x34\x27\x26\x35\x34\x36\x36\x33\x32\x16\x17\
-\x1e\x02\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x16\x33\x33\
-\x24\x36\x35\x34\x26\x23\x22\x06\x07\x05\xa3\x07\x07\x0a\x0d\x2d\
-\x51\x1f\x78\xfe\xf9\x31\x3a\x4b\x3f\x26\x18\x44\x2f\x26\x36\x31\
-\x39\x45\x52\x4b\x85\x54\x8f\x93\x12\x18\x56\x10\x0a\x01\x02\x5d\
-\x69\x36\x50\x2a\x78\x8b\x37\x60\x3a\x42\x6e\x20\x1d\x2a\x2c\x23\
-\x12\x26\x75\x89\x42\x3b\x58\x2e\x19\x17\x1c\x0a\xfe\xd6\xa2\x35\
-\x31\x3a\x80\x38\xee\x1b\x1d\x24\x1f\x16\x17\x2d\x23\x55\x52\x34\
-\x32\x2a\x1e\x15\x27\x14\x1a\x4e\x31\x36\x68\x41\x8c\x72\x2b\x53\
-\x3e\x18\x36\x40\x1e\x3d\x58\x1f\x2c\x13\x1e\x2c\x35\x6e\x36\x57\
-\x32\x45\x49\x43\x40\x17\x54\x8c\x52\x35\x5c\x39\x3e\x27\x03\x02\
-\x2c\x2d\x29\x2f\x5a\x59\x00\xff\xff\x00\x29\xfe\xa8\x05\x75\x02\
-\x20\x04\x27\x02\xb9\x00\xab\xff\x0a\x04\x02\x01\xd2\x00\x00\xff\
-\xff\x00\x29\xfe\xb9\x05\xaa\x02\x20\x04\x27\x02\xb9\x00\xa9\xff\
-\x1b\x04\x02\x01\xd3\x00\x00\xff\xff\x00\x29\xff\x93\x05\x75\x02\
-\x9a\x04\x27\x02\xca\x00\x2d\xfe\x49\x04\x02\x01\xd2\x00\x00\xff\
-\xff\x00\x29\xff\x93\x05\xaa\x02\x9a\x04\x27\x02\xca\x00\x2d\xfe\
-\x49\x04\x02\x01\xd3\x00\x00\x00\x03\x00\x17\xff\x90\x04\xfd\x02\
-\xbe\x00\x36\x00\x3a\x00\x43\x00\x00\x24\x26\x27\x0e\x02\x23\x22\
-\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\
-\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x23\x23\x01\x17\x07\
-\x27\x12\x36\x35\x34\x26\x23\x22\x06\x07\x01\xbb\x35\x15\x04\x3e\
-\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\
-\x3f\x2f\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\
-\x42\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x0f\x01\x83\
-\x4d\x4d\x4e\xde\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\
-\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\
-\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\
-\x31\x12\x13\x25\x02\x4b\x4e\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\x5a\
-\x59\x00\x00\x00\x03\x00\x17\xff\x90\x05\x31\x02\xbe\x00\x42\x00\
-\x46\x00\x4f\x00\x00\x24\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\
-\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x07\
-\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\x22\
-\x26\x27\x06\x23\x23\x01\x17\x07\x27\x12\x36\x35\x34\x26\x23\x22\
-\x06\x07\x01\xbb\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\
-\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x12\x1b\x26\x0c\x12\x06\
-\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\
-\x0a\x07\x07\x0a\x0d\x62\x33\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\
-\x0f\x01\x78\x4d\x4d\x4e\xe9\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\
-\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\
-\x13\x0e\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\
-\x39\x3e\x28\x02\x1b\x1d\x24\x1f\x30\x30\x12\x13\x25\x02\x4b\x4e\
-\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x04\x00\x17\xff\
-\x90\x04\xfd\x02\xbe\x00\x36\x00\x3a\x00\x3e\x00\x47\x00\x00\x24\
-\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\
-\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\
-\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\
-\x06\x23\x23\x01\x17\x07\x27\x25\x17\x07\x27\x12\x36\x35\x34\x26\
-\x23\x22\x06\x07\x01\xbb\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\
-\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x12\x1b\x26\x0c\
-\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\
-\xc7\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\xdf\x4d\x4d\x4e\x02\xf2\x4d\
-\x4d\x4e\xde\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\x45\x6f\x42\x09\
-\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x18\x1b\
-\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\
-\x12\x13\x25\x02\x2e\x4e\x4d\x4d\x6b\x4e\x4d\x4d\xfe\x80\x2c\x2d\
-\x29\x2f\x5a\x59\x00\x00\x00\x00\x04\x00\x17\xff\x90\x05\x31\x02\
-\xbe\x00\x42\x00\x46\x00\x4a\x00\x53\x00\x00\x24\x26\x27\x0e\x02\
-\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\
-\x16\x33\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x21\x23\x22\x26\x27\x06\x23\x23\x01\x17\x07\x27\x25\
-\x17\x07\x27\x12\x36\x35\x34\x26\x23\x22\x06\x07\x01\xbb\x35\x15\
-\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\
-\x19\x1e\x3f\x2f\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\
-\x75\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\x0a\x0d\x62\
-\x33\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\xdf\x4d\x4d\x4e\
-\x02\xe7\x4d\x4d\x4e\xe9\xa2\x35\x31\x3a\x80\x38\x73\x09\x0a\x45\
-\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\
-\x0e\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\
-\x3e\x28\x02\x1b\x1d\x24\x1f\x30\x30\x12\x13\x25\x02\x2e\x4e\x4d\
-\x4d\x6b\x4e\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x00\
-\x04\x00\x1e\xff\x29\x05\x60\x02\xbe\x00\x34\x00\x3f\x00\x43\x00\
-\x4c\x00\x00\x24\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\
-\x23\x22\x26\x27\x06\x23\x23\x24\x33\x32\x36\x37\x26\x26\x23\x22\
-\x06\x07\x01\x17\x07\x27\x12\x36\x35\x34\x26\x23\x22\x06\x07\x02\
-\x1b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\
-\x20\x30\x24\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\
-\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x10\xfe\
-\x99\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x03\x1e\x4d\x4d\x4e\
-\xde\xa2\x35\x31\x3a\x80\x38\x73\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x18\x1b\x27\x37\x0a\
-\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\
-\x7b\x11\x14\x48\x39\x38\x45\x01\xa7\x4e\x4d\x4d\xfe\x80\x2c\x2d\
-\x29\x2f\x5a\x59\x00\x00\x00\x00\x04\xff\xec\x00\x73\x05\xab\x02\
-\xbe\x00\x48\x00\x53\x00\x57\x00\x60\x00\x00\x24\x26\x27\x06\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\
-\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x37\
-\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x16\x33\
-\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x21\x23\x22\x26\x27\
-\x06\x23\x23\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\
-\x07\x27\x12\x36\x35\x34\x26\x23\x22\x06\x07\x02\x34\x4a\x18\x3d\
-\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\
-\x29\x57\x36\x36\x56\x29\x22\x30\x25\x12\x1b\x26\x0c\x12\x06\x54\
-\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\
-\x07\x07\x0a\x0d\x62\x33\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x0f\
-\xfe\x80\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x03\x14\x4d\x4d\
-\x4e\xe9\xa2\x35\x31\x3a\x80\x38\x73\x22\x21\x43\x21\x23\x21\x23\
-\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x18\x1b\x27\x37\
-\x0a\x44\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\
-\x24\x1f\x30\x30\x12\x13\x25\x8d\x12\x26\x48\x38\x38\x45\x01\xa7\
-\x4e\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\x5a\x59\x00\x04\xff\xec\x00\
-\x73\x05\x77\x02\xbe\x00\x3c\x00\x47\x00\x4b\x00\x54\x00\x00\x24\
-\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\x23\x22\x26\x27\x06\x23\x23\x24\x16\x33\x32\x37\
-\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x12\x36\x35\x34\x26\x23\
-\x22\x06\x07\x02\x34\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\
-\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\
-\x25\x12\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\
-\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\x3a\x12\x2b\x4c\x0f\xfe\x80\x37\
-\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x03\x1f\x4d\x4d\x4e\xde\xa2\
-\x35\x31\x3a\x80\x38\x73\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\
-\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x18\x1b\x27\x37\x0a\x44\x36\
-\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x8d\x12\
-\x26\x48\x38\x38\x45\x01\xa7\x4e\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\
-\x5a\x59\x00\x00\x05\xff\xec\xff\x8a\x05\x28\x02\xbe\x00\x43\x00\
-\x4e\x00\x59\x00\x5d\x00\x66\x00\x00\x24\x15\x14\x06\x23\x22\x26\
-\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x07\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\
-\x22\x27\x06\x21\x23\x22\x26\x27\x06\x23\x23\x06\x16\x33\x32\x36\
-\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\
-\x07\x01\x17\x07\x27\x12\x36\x35\x34\x26\x23\x22\x06\x07\x01\xa6\
-\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\
-\x32\x20\x16\x78\x1b\x26\x0c\x12\x06\x54\x08\x11\x1b\x24\x26\x75\
-\x89\x42\x3b\x58\x2e\x19\x1c\x16\x0a\x0a\x07\x07\x0a\x0d\x62\x33\
-\x78\xfe\xf2\x22\x20\x3a\x12\x2b\x4c\x5b\xe0\x41\x29\x1d\x1b\x18\
-\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x02\xae\x4d\x4d\
-\x4e\xe9\xa2\x35\x31\x3a\x80\x38\x4a\x35\x3b\x50\x7f\x6a\x1f\x24\
-\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\x18\x1b\x27\x37\x0a\x44\
-\x36\x0b\x02\x54\x8c\x52\x35\x5c\x39\x3e\x28\x02\x1b\x1d\x24\x1f\
-\x30\x30\x12\x13\x25\x37\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\
-\x2c\x16\x23\x13\x2c\x4e\x31\x01\xd0\x4e\x4d\x4d\xfe\x80\x2c\x2d\
-\x29\x2f\x5a\x59\x00\x00\x00\x00\x05\xff\xec\xff\x8a\x04\xf4\x02\
-\xbe\x00\x37\x00\x42\x00\x4d\x00\x51\x00\x5a\x00\x00\x24\x15\x14\
-\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x33\x32\x36\x37\x36\x37\x17\x06\x07\x16\
-\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\
-\x06\x23\x23\x06\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\
-\x35\x34\x26\x26\x23\x22\x06\x06\x07\x01\x17\x07\x27\x12\x36\x35\
-\x34\x26\x23\x22\x06\x07\x01\xa6\x49\x3c\x54\x74\x0e\x4e\x0a\x07\
-\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x78\x1b\x26\x0c\x12\
-\x06\x54\x08\x11\x1b\x24\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\
-\x22\x20\x3a\x12\x2b\x4c\x5b\xe0\x41\x29\x1d\x1b\x18\x1a\x37\x43\
-\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x02\xb9\x4d\x4d\x4e\xde\xa2\
-\x35\x31\x3a\x80\x38\x4a\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\
-\x8b\x4f\x3f\x61\x30\x34\x2a\x18\x1b\x27\x37\x0a\x44\x36\x0b\x02\
-\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x13\x25\x37\x3e\x1b\x1b\
-\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x01\xd0\
-\x4e\x4d\x4d\xfe\x80\x2c\x2d\x29\x2f\x5a\x59\xff\xff\x00\x29\xff\
-\x93\x05\x75\x02\xb7\x04\x27\x02\xb3\x03\xa9\xff\x2e\x04\x02\x01\
-\xd2\x00\x00\xff\xff\x00\x29\xff\x93\x05\xaa\x02\xa9\x04\x27\x02\
-\xb3\x03\xa9\xff\x20\x04\x02\x01\xd3\x00\x00\xff\xff\x00\x29\xfe\
-\xbb\x05\x75\x02\xb1\x04\x27\x02\xb3\x03\xbb\xff\x28\x04\x27\x02\
-\xb9\x00\xac\xff\x1d\x04\x02\x01\xd2\x00\x00\xff\xff\x00\x29\xfe\
-\xbb\x05\xaa\x02\xa4\x04\x27\x02\xb3\x03\xc0\xff\x1b\x04\x27\x02\
-\xb9\x00\xa9\xff\x1d\x04\x02\x01\xd3\x00\x00\xff\xff\x00\x29\xff\
-\x93\x05\x75\x02\xb3\x04\x27\x02\xb3\x03\xab\xff\x2a\x04\x22\x01\
-\xd2\x00\x00\x04\x07\x02\xca\x00\x33\xfe\x49\xff\xff\x00\x29\xff\
-\x93\x05\xaa\x02\xad\x04\x27\x02\xb3\x03\x90\xff\x24\x04\x22\x01\
-\xd3\x00\x00\x04\x07\x02\xca\x00\x3d\xfe\x49\x00\x03\x00\x1e\xff\
-\xfe\x04\xa2\x03\x80\x00\x39\x00\x3d\x00\x49\x00\x00\x24\x36\x37\
-\x36\x35\x06\x23\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\
-\x06\x07\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\
-\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\
-\x27\x27\x37\x16\x16\x33\x33\x13\x17\x07\x27\x12\x16\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x15\x03\xc3\x7d\x04\x03\x35\x46\x4e\x61\
-\x2d\x50\x30\x3e\x62\x38\x13\x16\x24\xa8\x94\x20\x1f\x2a\x15\x21\
-\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\
-\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x1b\xab\x4d\x4d\x4e\x01\
-\x33\x2e\x21\x2f\x19\x0c\x3e\x29\x25\x32\xee\x1d\x18\x14\x1a\x20\
-\x5c\x4c\x37\x5d\x36\x52\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\x0d\x3f\
-\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\
-\x05\x0e\x12\x29\x55\x35\x2b\x02\x92\x4e\x4d\x4d\xfe\x8e\x26\x0a\
-\x0d\x3f\x40\x2e\x21\x00\x00\x00\x04\x00\x1e\xff\x52\x04\xa2\x03\
-\x80\x00\x39\x00\x41\x00\x45\x00\x51\x00\x00\x24\x36\x37\x36\x35\
-\x06\x23\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x07\
-\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\
-\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\
-\x37\x16\x16\x33\x33\x01\x17\x37\x17\x07\x27\x07\x27\x01\x17\x07\
-\x27\x12\x16\x33\x32\x36\x37\x26\x26\x23\x22\x06\x15\x03\xc3\x7d\
-\x04\x03\x35\x46\x4e\x61\x2d\x50\x30\x3e\x62\x38\x13\x16\x24\xa8\
-\x94\x20\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\
-\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\
-\x1b\xfe\x0c\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\xe9\x4d\x4d\x4e\x01\
-\x33\x2e\x21\x2f\x19\x0c\x3e\x29\x25\x32\xee\x1d\x18\x14\x1a\x20\
-\x5c\x4c\x37\x5d\x36\x52\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\x0d\x3f\
-\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\
-\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\x4a\
-\x03\xe4\x4e\x4d\x4d\xfe\x8e\x26\x0a\x0d\x3f\x40\x2e\x21\x00\x00\
-\x04\x00\x1e\xff\xfe\x04\xa2\x03\x80\x00\x39\x00\x50\x00\x54\x00\
-\x60\x00\x00\x24\x36\x37\x36\x35\x06\x23\x22\x26\x35\x34\x36\x36\
-\x33\x32\x16\x16\x15\x14\x06\x07\x06\x06\x23\x23\x22\x26\x27\x06\
-\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\
-\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x26\x35\
-\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x01\x17\x07\x27\x12\x16\x33\x32\x36\x37\x26\x26\
-\x23\x22\x06\x15\x03\xc3\x7d\x04\x03\x35\x46\x4e\x61\x2d\x50\x30\
-\x3e\x62\x38\x13\x16\x24\xa8\x94\x20\x1f\x2a\x15\x21\xa2\x6e\x69\
-\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\
-\x11\x21\x4a\x26\x57\x7e\x33\x1b\xfd\x50\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x85\x4d\x4d\
-\x4e\x01\x33\x2e\x21\x2f\x19\x0c\x3e\x29\x25\x32\xee\x1d\x18\x14\
-\x1a\x20\x5c\x4c\x37\x5d\x36\x52\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\
-\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\
-\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\
-\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x01\x90\x4e\x4d\
-\x4d\xfe\x8e\x26\x0a\x0d\x3f\x40\x2e\x21\x00\x00\x04\x00\x1e\xff\
-\xfe\x04\xa2\x03\x84\x00\x39\x00\x3d\x00\x49\x00\x4d\x00\x00\x24\
-\x36\x37\x36\x35\x06\x23\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x14\x06\x07\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\
-\x36\x26\x27\x27\x37\x16\x16\x33\x33\x13\x17\x07\x27\x12\x16\x33\
-\x32\x36\x37\x26\x26\x23\x22\x06\x15\x13\x17\x07\x27\x03\xc3\x7d\
-\x04\x03\x35\x46\x4e\x61\x2d\x50\x30\x3e\x62\x38\x13\x16\x24\xa8\
-\x94\x20\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\
-\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\
-\x1b\x67\x4a\x4a\x4a\x41\x33\x2e\x21\x2f\x19\x0c\x3e\x29\x25\x32\
-\x99\x4a\x4a\x4a\xee\x1d\x18\x14\x1a\x20\x5c\x4c\x37\x5d\x36\x52\
-\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\
-\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\
-\x2b\x02\x91\x49\x4a\x4a\xfe\x8a\x26\x0a\x0d\x3f\x40\x2e\x21\x01\
-\xa3\x4a\x4a\x4a\x00\x00\x00\x00\x05\x00\x1e\xff\x52\x04\xa2\x03\
-\x84\x00\x39\x00\x41\x00\x45\x00\x51\x00\x55\x00\x00\x24\x36\x37\
-\x36\x35\x06\x23\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\
-\x06\x07\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\
-\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\
-\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\x07\x27\x07\x27\x01\
-\x17\x07\x27\x12\x16\x33\x32\x36\x37\x26\x26\x23\x22\x06\x15\x13\
-\x17\x07\x27\x03\xc3\x7d\x04\x03\x35\x46\x4e\x61\x2d\x50\x30\x3e\
-\x62\x38\x13\x16\x24\xa8\x94\x20\x1f\x2a\x15\x21\xa2\x6e\x69\x96\
-\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\
-\x21\x4a\x26\x57\x7e\x33\x1b\xfe\x0c\x46\x4a\x4a\x4a\x46\x4a\x4a\
-\x02\xa5\x4a\x4a\x4a\x41\x33\x2e\x21\x2f\x19\x0c\x3e\x29\x25\x32\
-\x99\x4a\x4a\x4a\xee\x1d\x18\x14\x1a\x20\x5c\x4c\x37\x5d\x36\x52\
-\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\
-\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\
-\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\xe3\x49\x4a\x4a\xfe\
-\x8a\x26\x0a\x0d\x3f\x40\x2e\x21\x01\xa3\x4a\x4a\x4a\x00\x00\x00\
-\x05\x00\x1e\xff\xfe\x04\xa2\x03\x84\x00\x39\x00\x50\x00\x54\x00\
-\x60\x00\x64\x00\x00\x24\x36\x37\x36\x35\x06\x23\x22\x26\x35\x34\
-\x36\x36\x33\x32\x16\x16\x15\x14\x06\x07\x06\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\
-\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\
-\x33\x32\x37\x17\x07\x27\x01\x17\x07\x27\x12\x16\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x15\x13\x17\x07\x27\x03\xc3\x7d\x04\x03\x35\
-\x46\x4e\x61\x2d\x50\x30\x3e\x62\x38\x13\x16\x24\xa8\x94\x20\x1f\
-\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\
-\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x1b\xfd\x50\
-\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\
-\xb8\x08\x03\x41\x4a\x4a\x4a\x41\x33\x2e\x21\x2f\x19\x0c\x3e\x29\
-\x25\x32\x99\x4a\x4a\x4a\xee\x1d\x18\x14\x1a\x20\x5c\x4c\x37\x5d\
-\x36\x52\x94\x5f\x30\x4a\x1b\x2b\x2b\x0a\x0d\x3f\x4d\x3a\x61\x39\
-\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\
-\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\
-\x0b\x06\x05\x36\x16\x34\x01\x8f\x49\x4a\x4a\xfe\x8a\x26\x0a\x0d\
-\x3f\x40\x2e\x21\x01\xa3\x4a\x4a\x4a\x00\x00\x00\x01\x00\x1e\xff\
-\xfe\x04\xc4\x03\x31\x00\x32\x00\x00\x01\x17\x05\x16\x16\x15\x14\
-\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\
-\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\
-\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\x04\xad\x17\xfe\
-\xde\x5a\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\
-\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\
-\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\x03\x31\x73\x6d\
-\x68\x90\x39\x2f\x4f\x2f\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\
-\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\
-\x1c\x19\x2f\x79\x6a\x74\x00\x00\x01\x00\x1e\xff\xfe\x05\x32\x03\
-\x31\x00\x3e\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\
-\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\
-\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\x25\x17\x05\x13\x1e\
-\x02\x33\x33\x05\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x23\
-\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\
-\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\
-\x6a\x13\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\x0f\
-\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\x0a\x0d\x3f\x4d\x3a\x61\x39\
-\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\
-\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\x88\x73\x6b\xfe\xfb\x28\x28\
-\x10\x00\x00\x00\x02\x00\x1e\xff\x52\x04\xc4\x03\x31\x00\x32\x00\
-\x3a\x00\x00\x01\x17\x05\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\
-\x36\x37\x26\x26\x27\x35\x01\x17\x37\x17\x07\x27\x07\x27\x04\xad\
-\x17\xfe\xde\x5a\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\
-\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\
-\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\xfd\xee\
-\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\
-\x2f\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\
-\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\
-\x74\xfd\x3d\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\x02\x00\x1e\xff\
-\x52\x05\x32\x03\x31\x00\x3e\x00\x46\x00\x00\x24\x16\x15\x14\x06\
-\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\
-\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\
-\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\
-\x35\x25\x17\x05\x13\x1e\x02\x33\x33\x01\x17\x37\x17\x07\x27\x07\
-\x27\x05\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x23\x1f\x2a\
-\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\
-\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\
-\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\x0f\xfc\x01\
-\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\
-\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\
-\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\
-\x88\x73\x6b\xfe\xfb\x28\x28\x10\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x00\x00\x00\x02\x00\x1e\xff\xfe\x04\xc4\x03\x31\x00\x32\x00\
-\x49\x00\x00\x01\x17\x05\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\
-\x36\x37\x26\x26\x27\x35\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x04\xad\x17\
-\xfe\xde\x5a\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\
-\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\
-\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\xfd\x32\x1d\
-\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\
-\x08\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x0a\x0d\x3f\x4d\x3a\
-\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\
-\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\xb4\x1b\x24\x24\x32\
-\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\
-\x02\x00\x1e\xff\xfe\x05\x32\x03\x31\x00\x3e\x00\x55\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\
-\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\
-\x37\x26\x26\x27\x35\x25\x17\x05\x13\x1e\x02\x33\x33\x01\x26\x35\
-\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x05\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\
-\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\
-\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\
-\x4e\x6a\x13\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\
-\x0f\xfb\x45\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\
-\x12\x23\x05\xb8\x08\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\x88\x73\
-\x6b\xfe\xfb\x28\x28\x10\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x02\x00\x1e\xff\
-\x52\x04\xc4\x03\x31\x00\x32\x00\x3a\x00\x00\x01\x17\x05\x16\x16\
-\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\
-\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\
-\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\x01\x17\
-\x37\x17\x07\x27\x07\x27\x04\xad\x17\xfe\xde\x5a\x48\x45\x86\x5d\
-\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\
-\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\
-\x4e\x6a\x13\x09\x4b\x5e\xfd\xee\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\
-\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x0a\x0d\x3f\x4d\x3a\x61\x39\
-\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\
-\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\xfd\x3d\x46\x4a\x4a\x4a\x46\
-\x4a\x4a\x00\x00\x02\x00\x1e\xff\xfe\x04\xc4\x03\x9e\x00\x32\x00\
-\x36\x00\x00\x01\x17\x05\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\
-\x36\x37\x26\x26\x27\x35\x25\x17\x05\x27\x04\xad\x17\xfe\xde\x5a\
-\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\
-\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\
-\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\x01\x34\x11\xfe\xcc\x11\
-\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x0a\x0d\x3f\x4d\x3a\x61\
-\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\
-\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\xf5\x47\x72\x48\x00\x00\
-\x02\x00\x1e\xff\xfe\x05\x32\x03\x9e\x00\x3e\x00\x42\x00\x00\x24\
-\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\
-\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\
-\x37\x26\x26\x27\x35\x25\x17\x05\x13\x1e\x02\x33\x33\x03\x17\x05\
-\x27\x05\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x23\x1f\x2a\
-\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\
-\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\
-\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\x0f\xb9\x11\
-\xfe\xcc\x11\xee\x1b\x1d\x24\x1f\x36\x48\x38\x46\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\x88\x73\x6b\xfe\
-\xfb\x28\x28\x10\x02\xb0\x47\x72\x48\x00\x00\x00\x03\x00\x1e\xff\
-\x52\x04\xc4\x03\x9e\x00\x32\x00\x3a\x00\x3e\x00\x00\x01\x17\x05\
-\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\
-\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\
-\x01\x17\x37\x17\x07\x27\x07\x27\x01\x17\x05\x27\x04\xad\x17\xfe\
-\xde\x5a\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\
-\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\
-\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\xfd\xee\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\x03\x90\x11\xfe\xcc\x11\x03\x31\x73\x6d\x68\
-\x90\x39\x2f\x4f\x2f\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\
-\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\
-\x19\x2f\x79\x6a\x74\xfd\x3d\x46\x4a\x4a\x4a\x46\x4a\x4a\x04\x02\
-\x47\x72\x48\x00\x03\x00\x1e\xff\x52\x05\x32\x03\x9e\x00\x3e\x00\
-\x46\x00\x4a\x00\x00\x24\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\
-\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\
-\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\x25\x17\x05\x13\x1e\
-\x02\x33\x33\x01\x17\x37\x17\x07\x27\x07\x27\x01\x17\x05\x27\x05\
-\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x23\x1f\x2a\x15\x21\
-\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\
-\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\
-\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\x0f\xfc\x01\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\x03\x90\x11\xfe\xcc\x11\xee\x1b\x1d\x24\x1f\
-\x36\x48\x38\x46\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\
-\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\
-\x2f\x79\x6a\x74\x88\x73\x6b\xfe\xfb\x28\x28\x10\xfe\xf8\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\x04\x02\x47\x72\x48\x00\x00\x03\x00\x1e\xff\
-\xfe\x04\xc4\x03\x9e\x00\x32\x00\x49\x00\x4d\x00\x00\x01\x17\x05\
-\x16\x16\x15\x14\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\
-\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\
-\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x01\x17\x05\x27\x04\xad\x17\xfe\xde\
-\x5a\x48\x45\x86\x5d\x23\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\
-\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\
-\x26\x57\x7e\x33\x20\x4e\x6a\x13\x09\x4b\x5e\xfd\x32\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x04\
-\x2c\x11\xfe\xcc\x11\x03\x31\x73\x6d\x68\x90\x39\x2f\x4f\x2f\x0a\
-\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\
-\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\x6a\x74\xb4\
-\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\
-\x34\x01\xae\x47\x72\x48\x00\x00\x03\x00\x1e\xff\xfe\x05\x32\x03\
-\x9e\x00\x3e\x00\x55\x00\x59\x00\x00\x24\x16\x15\x14\x06\x23\x23\
-\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\
-\x26\x27\x27\x37\x16\x16\x33\x33\x32\x36\x37\x26\x26\x27\x35\x25\
-\x17\x05\x13\x1e\x02\x33\x33\x01\x26\x35\x34\x36\x37\x32\x17\x07\
-\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x01\x17\
-\x05\x27\x05\x2b\x07\x07\x0a\x12\x44\x59\x37\x18\x94\x73\x23\x1f\
-\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\
-\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x20\x4e\x6a\
-\x13\x09\x4b\x5e\x01\x79\x17\xfe\xe4\xce\x20\x2c\x2e\x22\x0f\xfb\
-\x45\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\
-\x05\xb8\x08\x04\x2c\x11\xfe\xcc\x11\xee\x1b\x1d\x24\x1f\x36\x48\
-\x38\x46\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\
-\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x1c\x19\x2f\x79\
-\x6a\x74\x88\x73\x6b\xfe\xfb\x28\x28\x10\x01\x07\x1b\x24\x24\x32\
-\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x01\xae\x47\
-\x72\x48\x00\x00\x03\x00\x1e\xff\x29\x04\x7b\x03\x6e\x00\x35\x00\
-\x40\x00\x44\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\
-\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\
-\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x03\xf3\x1e\x6a\x5c\x52\
-\x14\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\x4b\x4d\x4d\x4d\xee\x1c\x2c\x02\x2c\x0c\
-\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\xf9\x4d\x4d\x4d\x00\
-\x05\x00\x1e\xff\x21\x04\x7b\x03\x6e\x00\x35\x00\x40\x00\x44\x00\
-\x48\x00\x4c\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\
-\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\
-\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x05\x17\x07\x27\x17\x17\x07\x27\x37\x17\
-\x07\x27\x03\xf3\x1e\x6a\x5c\x52\x14\x38\x58\x17\x1c\x65\x35\x16\
-\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\
-\x20\x30\x24\x14\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\
-\x14\xfd\x16\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\xff\x42\
-\x42\x43\x8d\x43\x43\x43\x92\x43\x43\x42\xee\x1c\x2c\x02\x2c\x0c\
-\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\xf1\x43\x42\x42\x3d\
-\x43\x42\x42\xc1\x43\x43\x43\x00\x04\x00\x1e\xff\x29\x04\x7b\x03\
-\x6e\x00\x35\x00\x40\x00\x44\x00\x48\x00\x00\x24\x36\x35\x11\x37\
-\x11\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\
-\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\
-\x16\x16\x33\x33\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\
-\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\
-\x37\x17\x07\x27\x03\xf3\x1e\x6a\x5c\x52\x14\x38\x58\x17\x1c\x65\
-\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\
-\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\
-\xfb\x4a\x4a\x4a\xda\x4a\x4a\x4a\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\
-\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\
-\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\x01\x8b\x49\x4a\x4a\x4e\x4a\
-\x4a\x4a\x00\x00\x05\x00\x1e\xff\x29\x04\x7b\x03\x6e\x00\x35\x00\
-\x40\x00\x44\x00\x48\x00\x4c\x00\x00\x24\x36\x35\x11\x37\x11\x14\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\
-\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\
-\x33\x33\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x20\
-\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x37\x17\
-\x07\x27\x17\x17\x07\x27\x03\xf3\x1e\x6a\x5c\x52\x14\x38\x58\x17\
-\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\
-\x70\x37\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\
-\x1b\x01\xfb\x43\x43\x42\x89\x43\x43\x43\x91\x43\x43\x43\xee\x1c\
-\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\
-\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\
-\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\x01\
-\x6e\x43\x43\x43\xbf\x43\x42\x42\x37\x43\x43\x43\x00\x00\x00\x00\
-\x02\x00\x1e\xff\x29\x03\x0b\x03\x6e\x00\x21\x00\x2c\x00\x00\x24\
-\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\
-\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\
-\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x02\x83\x1e\x6a\
-\x5c\x52\x17\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\
-\x37\x58\x2a\x20\x30\x24\x11\xfe\x86\x3f\x1f\x36\x19\x1d\x33\x22\
-\x21\x32\x1b\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x22\x22\x44\
-\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\
-\x11\x14\x48\x39\x38\x45\x00\x00\x02\xff\xec\x00\x73\x03\x22\x03\
-\x6e\x00\x29\x00\x34\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\
-\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\
-\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\
-\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x02\x9a\x1e\x6a\
-\x5c\x52\x16\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\
-\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\
-\x11\xfe\x6e\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\xee\x1c\x2c\
-\x02\x2c\x0c\xfd\xd0\x5e\x6d\x22\x21\x43\x21\x23\x21\x23\x1f\x24\
-\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\
-\x45\x00\x00\x00\x03\x00\x1e\xff\x29\x04\x7b\x03\x6e\x00\x35\x00\
-\x40\x00\x44\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\
-\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\
-\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x03\xf3\x1e\x6a\x5c\x52\
-\x14\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\x3f\x4d\x4d\x4e\xee\x1c\x2c\x02\x2c\x0c\
-\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\x01\x8c\x4e\x4d\x4d\
-\x00\x00\x00\x00\x02\x00\x1e\xff\x29\x04\x7b\x03\x6e\x00\x35\x00\
-\x40\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\
-\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\
-\x36\x37\x17\x06\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\
-\x23\x22\x06\x07\x03\xf3\x1e\x6a\x5c\x52\x14\x38\x58\x17\x1c\x65\
-\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\
-\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\xee\
-\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\
-\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\
-\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\
-\x00\x00\x00\x00\x02\x00\x1e\xff\x52\x03\xc2\x03\x6e\x00\x2a\x00\
-\x32\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\
-\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\
-\x37\x17\x07\x27\x07\x27\x03\x3a\x1e\x6a\x5c\x52\x1b\x1f\x2a\x15\
-\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\
-\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x15\xfe\x12\x46\x4a\
-\x4a\x4a\x46\x4a\x4a\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x0a\
-\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\
-\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\
-\x4a\x4a\x00\x00\x02\x00\x1e\xff\x52\x04\x6b\x03\x6e\x00\x36\x00\
-\x3e\x00\x00\x01\x37\x11\x14\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x27\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\
-\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\
-\x27\x27\x37\x16\x16\x33\x33\x32\x36\x35\x01\x17\x37\x17\x07\x27\
-\x07\x27\x03\x81\x6a\x2f\x30\x10\x0a\x07\x07\x0a\x0d\x78\x1e\x29\
-\x7b\x1a\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\
-\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\
-\x18\x33\x3a\xfd\xa2\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\x62\x0c\xfd\
-\xda\x34\x26\x1b\x1d\x24\x1f\x4c\x4c\x0a\x0d\x3f\x4d\x3a\x61\x39\
-\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\
-\x55\x35\x2b\x27\x33\xfe\x9e\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\
-\x03\x00\x1e\xff\x29\x04\x7b\x03\x6e\x00\x35\x00\x40\x00\x48\x00\
-\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\
-\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x36\x37\
-\x17\x06\x07\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\
-\x06\x07\x05\x17\x37\x17\x07\x27\x07\x27\x03\xf3\x1e\x6a\x5c\x52\
-\x14\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\x04\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x1c\
-\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x2b\x27\x26\x2c\x22\x22\x44\x33\
-\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x20\
-\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x11\x14\x48\x39\x38\x45\xf4\
-\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x02\x00\x1e\xff\xfe\x03\xc2\x03\
-\x6e\x00\x2a\x00\x41\x00\x00\x24\x36\x35\x11\x37\x11\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\
-\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\
-\x33\x33\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x03\x3a\x1e\x6a\x5c\x52\x1b\
-\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\
-\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x15\xfd\
-\x56\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\
-\x05\xb8\x08\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x0a\x0d\x3f\
-\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\
-\x05\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\
-\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x02\x00\x1e\xff\
-\xfe\x04\x6b\x03\x6e\x00\x36\x00\x4d\x00\x00\x01\x37\x11\x14\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\
-\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x32\
-\x36\x35\x25\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x03\x81\x6a\x2f\x30\x10\x0a\
-\x07\x07\x0a\x0d\x78\x1e\x29\x7b\x1a\x1f\x2a\x15\x21\xa2\x6e\x69\
-\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\
-\x11\x21\x4a\x26\x57\x7e\x33\x18\x33\x3a\xfc\xe6\x1d\x31\x29\x23\
-\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x62\
-\x0c\xfd\xda\x34\x26\x1b\x1d\x24\x1f\x4c\x4c\x0a\x0d\x3f\x4d\x3a\
-\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\
-\x12\x29\x55\x35\x2b\x27\x33\xad\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x03\x00\x1e\xff\
-\x29\x04\x7b\x03\x6e\x00\x35\x00\x40\x00\x57\x00\x00\x24\x36\x35\
-\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\
-\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\
-\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x01\x26\
-\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\
-\x32\x37\x17\x07\x27\x03\xf3\x1e\x6a\x5c\x52\x14\x38\x58\x17\x1c\
-\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\
-\x37\x58\x2a\x20\x30\x24\x14\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x14\xfd\x16\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\
-\x02\x08\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\
-\x23\x05\xb8\x08\xee\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x2b\x27\
-\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\
-\xbc\x4d\x5a\x45\x30\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x11\
-\x14\x48\x39\x38\x45\x01\x31\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\
-\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x00\x02\x00\x17\xff\
-\x90\x04\x64\x02\x0a\x00\x39\x00\x44\x00\x00\x00\x16\x17\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\
-\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\
-\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\
-\x36\x36\x33\x02\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x03\x54\
-\x56\x29\x22\x30\x25\x09\x0a\x07\x07\x0a\x0a\x2a\x4a\x18\x3d\x62\
-\x32\x4f\x20\x18\x4a\x29\x0e\x29\x35\x15\x04\x3e\x75\x54\x28\x27\
-\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x0c\x23\
-\x33\x21\x29\x57\x36\x55\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\
-\x02\x0a\x4b\x58\x46\x33\x1b\x1d\x24\x1f\x22\x21\x43\x21\x23\x21\
-\x23\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\
-\x3a\x60\x57\x13\x0e\x34\x45\x58\x4b\xfe\xf6\x12\x26\x48\x38\x38\
-\x45\x00\x00\x00\x03\x00\x17\xff\x90\x04\x64\x02\xa1\x00\x39\x00\
-\x3d\x00\x48\x00\x00\x00\x16\x17\x16\x16\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\
-\x37\x16\x17\x16\x16\x33\x33\x32\x36\x37\x36\x36\x33\x25\x17\x07\
-\x27\x00\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x03\x54\x56\x29\
-\x22\x30\x25\x09\x0a\x07\x07\x0a\x0a\x2a\x4a\x18\x3d\x62\x32\x4f\
-\x20\x18\x4a\x29\x0e\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\
-\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x0c\x23\x33\x21\
-\x29\x57\x36\xfd\xa5\x4d\x4d\x4e\x02\x54\x37\x20\x41\x2e\x1b\x33\
-\x23\x23\x33\x1b\x02\x0a\x4b\x58\x46\x33\x1b\x1d\x24\x1f\x22\x21\
-\x43\x21\x23\x21\x23\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x34\x45\x58\x4b\x97\x4e\x4d\
-\x4d\xfe\xad\x12\x26\x48\x38\x38\x45\x00\x00\x00\x02\x00\x17\xff\
-\x90\x03\x6f\x02\xa3\x00\x34\x00\x38\x00\x00\x24\x36\x37\x36\x36\
-\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\
-\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x13\x17\
-\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\
-\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\x15\x04\
-\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\
-\x1e\x3f\x2f\x14\x8f\x4d\x4d\x4e\xee\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\
-\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\
-\xb5\x4e\x4d\x4d\x00\x00\x00\x00\x03\x00\x17\xff\x90\x03\x6f\x02\
-\xa3\x00\x34\x00\x38\x00\x3c\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\
-\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\
-\x25\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\
-\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\
-\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\
-\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\x4e\x02\x13\x4d\x4d\x4e\
-\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\
-\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\
-\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\x50\x4e\x4d\x4d\
-\x00\x00\x00\x00\x03\x00\x1e\xff\x29\x03\x31\x03\x00\x00\x25\x00\
-\x30\x00\x34\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x02\x7e\x44\x0d\x01\x1f\
-\x23\x64\x23\x1e\x7d\x60\x0e\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\
-\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x0f\xfe\x88\x3f\x1f\x36\
-\x19\x1d\x33\x22\x21\x32\x1b\x01\xf7\x4d\x4d\x4e\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\xfe\xd7\
-\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\x38\
-\x45\x01\xe9\x4e\x4d\x4d\x00\x00\x03\x00\x1e\xff\x29\x03\xd2\x02\
-\xa3\x00\x32\x00\x3d\x00\x41\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\
-\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x07\x01\x17\x07\x27\x02\x8c\x37\x11\x0a\
-\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\
-\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\
-\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\x1f\x36\x19\x1d\
-\x33\x22\x21\x32\x1b\x02\x3f\x4d\x4d\x4e\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\x44\
-\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\
-\x11\x14\x48\x39\x38\x45\x01\x8c\x4e\x4d\x4d\x00\x03\xff\xec\x00\
-\x73\x03\xe9\x02\xa3\x00\x3a\x00\x45\x00\x49\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\
-\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\
-\x22\x06\x07\x01\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\
-\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x14\xfe\
-\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x02\x40\x4d\x4d\x4e\
-\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\
-\x27\x26\x2c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\
-\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\x01\x8c\x4e\
-\x4d\x4d\x00\x00\x03\xff\xec\x00\x73\x03\x48\x03\x00\x00\x2d\x00\
-\x38\x00\x3c\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\
-\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x17\
-\x07\x27\x02\x95\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0d\x2a\
-\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\
-\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x0f\xfe\x70\x37\
-\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x01\xf8\x4d\x4d\x4e\xee\x17\
-\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\x43\x21\x23\x21\
-\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\
-\x48\x38\x38\x45\x01\xe9\x4e\x4d\x4d\x00\x00\x00\x03\x00\x23\xff\
-\xb0\x04\x71\x02\xa3\x00\x3a\x00\x3e\x00\x42\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\
-\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\x27\x25\x17\x07\x27\x03\
-\x2b\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x18\x1d\x44\x1b\x08\x45\x81\x5e\
-\x54\x7f\x45\x2a\x55\x1a\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\
-\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\x02\x9d\x4d\x4d\x4e\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\x01\
-\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\x52\
-\x4e\x4d\x4d\x00\x04\xff\xec\xff\x8a\x03\x66\x02\xa3\x00\x35\x00\
-\x40\x00\x4b\x00\x4f\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\
-\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\
-\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x07\x01\x17\x07\x27\x02\x20\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x61\
-\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\
-\x18\x32\x20\x16\x7a\xfe\xbf\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\
-\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\xda\x4d\x4d\x4e\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\
-\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\
-\x13\x2c\x4e\x31\x01\xb5\x4e\x4d\x4d\x00\x00\x00\x04\xff\xec\xff\
-\x8a\x02\xc5\x03\x00\x00\x28\x00\x33\x00\x3e\x00\x42\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x16\x15\x14\
-\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\x27\
-\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x01\x17\x07\
-\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x59\x17\x49\
-\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\
-\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\
-\x14\x08\x0f\x2d\x27\x06\x01\x92\x4d\x4d\x4e\xee\x17\x13\x2e\x63\
-\x49\x33\x4c\x77\x3b\x53\x61\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\
-\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\
-\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x02\x12\x4e\x4d\x4d\
-\x00\x00\x00\x00\x02\x00\x1e\xff\xfe\x03\xe8\x03\x00\x00\x2e\x00\
-\x32\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\
-\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\
-\x33\x33\x13\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\x1e\
-\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\x0e\
-\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\x7e\
-\x33\x13\x4c\x4d\x4d\x4e\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\
-\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\
-\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x02\x12\x4e\x4d\
-\x4d\x00\x00\xff\xff\x00\x1e\xff\x93\x03\x57\x02\xe5\x04\x27\x02\
-\xb3\x01\x76\xff\x5c\x04\x02\x01\x64\x00\x00\x00\x03\x00\x1e\xff\
-\x52\x03\xe8\x03\x00\x00\x2e\x00\x36\x00\x3a\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\
-\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\
-\x07\x27\x07\x27\x01\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\
-\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\
-\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\
-\x57\x7e\x33\x13\xfe\x14\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\x82\x4d\
-\x4d\x4e\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x03\x64\x4e\x4d\x4d\x00\xff\xff\x00\x1e\xfe\xdb\x03\x57\x02\
-\xe5\x04\x27\x02\xb9\x00\xb9\xff\x3d\x04\x02\x02\x14\x00\x00\x00\
-\x03\x00\x1e\xff\xfe\x03\xe8\x03\x00\x00\x2e\x00\x45\x00\x49\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\
-\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\
-\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x01\x17\x07\x27\x03\x35\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\
-\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\
-\x21\x4a\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\x23\x1c\x0f\x12\
-\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\x1e\x4d\x4d\x4e\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x01\x10\x4e\x4d\x4d\x00\xff\
-\xff\x00\x1e\xff\x93\x03\x57\x02\xe5\x04\x22\x02\x14\x00\x00\x04\
-\x07\x02\xca\x00\x3c\xfe\x18\x00\x01\x00\x17\xff\x90\x03\x6f\x01\
-\xc6\x00\x34\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\
-\x27\x37\x16\x17\x16\x16\x33\x33\x02\x29\x37\x11\x0a\x0f\x0b\x62\
-\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\
-\x35\x15\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\
-\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\
-\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\
-\x0e\x00\x00\x00\x02\x00\x17\xff\x90\x03\x6f\x02\xa1\x00\x34\x00\
-\x38\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\
-\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\
-\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\
-\x1c\x65\x35\x15\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\
-\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\
-\x4e\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\
-\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\
-\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\x00\x00\x00\
-\x02\x00\x1e\xff\x29\x03\x31\x02\x25\x00\x25\x00\x30\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\
-\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\
-\x02\x7e\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0e\x2b\x49\x17\
-\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\
-\x0f\xfe\x88\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\xee\x17\x13\
-\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\xfe\
-\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\x39\
-\x38\x45\x00\x00\x02\x00\x1e\xff\x29\x03\xd2\x02\x0a\x00\x32\x00\
-\x3d\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\
-\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\
-\x07\x02\x8c\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\
-\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\
-\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\
-\x83\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\xee\x20\x24\x17\x3d\
-\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\
-\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\
-\x30\x11\x14\x48\x39\x38\x45\x00\x02\xff\xec\x00\x73\x03\xe9\x02\
-\x0a\x00\x3a\x00\x45\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\
-\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x02\xa3\x37\
-\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\
-\x38\x58\x17\x1c\x65\x35\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\
-\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\
-\x29\x22\x30\x25\x14\xfe\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\
-\x1b\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\
-\x2b\x27\x26\x2c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\
-\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\x00\x00\
-\x02\xff\xec\x00\x73\x03\x48\x02\x25\x00\x2d\x00\x38\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\
-\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\
-\x32\x37\x26\x26\x23\x22\x06\x07\x02\x95\x44\x0d\x01\x1f\x23\x64\
-\x23\x1e\x7d\x60\x0d\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\
-\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\
-\x30\x25\x0f\xfe\x70\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\xee\
-\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\x43\x21\x23\
-\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\
-\x26\x48\x38\x38\x45\x00\x00\x00\x02\x00\x23\xff\xb0\x04\x71\x02\
-\x9f\x00\x3a\x00\x3e\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\x26\x35\x34\x37\x17\x06\
-\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\x27\x37\x16\x17\x16\x33\
-\x33\x01\x17\x07\x27\x03\x2b\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x18\x1d\
-\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x2a\x55\x1a\x60\x5e\x40\x57\
-\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\xee\x20\
-\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\
-\x2c\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\x60\
-\x01\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\x4d\
-\x00\x00\x00\x00\x03\xff\xec\xff\x8a\x03\x66\x02\x1c\x00\x35\x00\
-\x40\x00\x4b\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\
-\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\
-\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\
-\x02\x20\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\
-\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\
-\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\
-\xbf\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\
-\x27\x06\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\
-\x1f\x2b\x27\x26\x2c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\
-\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\
-\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x00\x00\x00\x03\xff\xec\xff\
-\x8a\x02\xc5\x02\x25\x00\x28\x00\x33\x00\x3e\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\
-\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\
-\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x02\x12\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x59\x17\x49\x3c\x54\x74\x0e\x4e\x0a\
-\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x75\xfe\xc4\x41\
-\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x29\x35\x3b\x50\
-\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\
-\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\
-\x00\x00\x00\x00\x02\x00\x17\xff\x8f\x03\x6f\x01\xc6\x00\x34\x00\
-\x3c\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\
-\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\x02\x35\x34\x26\x27\x37\
-\x16\x17\x16\x16\x33\x33\x17\x17\x37\x17\x07\x27\x07\x27\x02\x29\
-\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\
-\x08\x38\x58\x17\x1c\x65\x35\x15\x29\x35\x15\x04\x3e\x75\x54\x28\
-\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\
-\x54\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\
-\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\xcb\
-\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x03\x00\x17\xff\x8f\x03\x6f\x02\
-\xa1\x00\x34\x00\x38\x00\x40\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\
-\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\
-\x01\x17\x37\x17\x07\x27\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\
-\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\
-\x35\x15\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\
-\x24\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\x4e\x01\
-\xd8\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\
-\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\
-\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\
-\xb3\x4e\x4d\x4d\xfd\xd0\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\x00\
-\x03\x00\x1e\xff\x29\x03\x4b\x02\x25\x00\x25\x00\x30\x00\x38\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\
-\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\
-\x06\x07\x05\x17\x37\x17\x07\x27\x07\x27\x02\x7e\x44\x0d\x01\x1f\
-\x23\x64\x23\x1e\x7d\x60\x0e\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\
-\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x0f\xfe\x88\x3f\x1f\x36\
-\x19\x1d\x33\x22\x21\x32\x1b\x01\xc5\x46\x4a\x4a\x4a\x46\x4a\x4a\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\
-\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\
-\x14\x48\x39\x38\x45\xf4\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\x00\
-\x03\x00\x1e\xff\x29\x03\xd2\x02\x0a\x00\x32\x00\x3d\x00\x45\x00\
-\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\
-\x23\x22\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\
-\x16\x16\x33\x33\x20\x33\x32\x36\x37\x26\x26\x23\x22\x06\x07\x05\
-\x17\x37\x17\x07\x27\x07\x27\x02\x8c\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\
-\x2a\x20\x30\x24\x14\xfe\x83\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\
-\x1b\x02\x04\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\x22\x44\
-\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\
-\x11\x14\x48\x39\x38\x45\xf4\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\
-\x03\xff\xec\xff\x8f\x03\xe9\x02\x0a\x00\x3a\x00\x45\x00\x4d\x00\
-\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\
-\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\
-\x37\x26\x26\x23\x22\x06\x07\x05\x17\x37\x17\x07\x27\x07\x27\x02\
-\xa3\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x2a\x4a\x18\x3d\x62\x32\x4f\
-\x20\x18\x4a\x29\x0a\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\
-\x36\x56\x29\x22\x30\x25\x14\xfe\x6b\x37\x20\x41\x2e\x1b\x33\x23\
-\x23\x33\x1b\x02\x05\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x20\x24\x17\
-\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\
-\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\
-\x46\x33\x12\x12\x26\x48\x38\x38\x45\xf4\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\x00\x00\x00\x03\xff\xec\xff\x8f\x03\x62\x02\x25\x00\x2d\x00\
-\x38\x00\x40\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\
-\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x05\x17\
-\x37\x17\x07\x27\x07\x27\x02\x95\x44\x0d\x01\x1f\x23\x64\x23\x1e\
-\x7d\x60\x0d\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\
-\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\
-\x0f\xfe\x70\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x01\xc6\x46\
-\x4a\x4a\x4a\x46\x4a\x4a\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\
-\x53\x61\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\
-\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\xf4\x46\x4a\x4a\
-\x4a\x46\x4a\x4a\x00\x00\x00\x00\x03\x00\x23\xff\x8f\x04\x71\x02\
-\x9f\x00\x3a\x00\x3e\x00\x46\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\x26\x35\x34\x37\
-\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\x27\x37\x16\x17\
-\x16\x33\x33\x01\x17\x07\x27\x01\x17\x37\x17\x07\x27\x07\x27\x03\
-\x2b\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\
-\x0a\x08\x38\x58\x17\x1c\x65\x35\x18\x1d\x44\x1b\x08\x45\x81\x5e\
-\x54\x7f\x45\x2a\x55\x1a\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\
-\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\x02\x62\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\
-\x2b\x27\x26\x2c\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\
-\x38\x58\x60\x01\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\
-\x4e\x4d\x4d\xfd\xd2\x46\x4a\x4a\x4a\x46\x4a\x4a\x00\x00\x00\x00\
-\x04\xff\xec\xff\x8a\x03\x66\x02\x1c\x00\x35\x00\x40\x00\x4b\x00\
-\x53\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\
-\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x16\x15\
-\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\
-\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\
-\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x05\x17\
-\x37\x17\x07\x27\x07\x27\x02\x20\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x61\
-\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\
-\x18\x32\x20\x16\x7a\xfe\xbf\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\
-\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\x9f\x46\x4a\x4a\x4a\x46\x4a\
-\x4a\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\
-\x2b\x27\x26\x2c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\
-\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\
-\x31\x2c\x16\x23\x13\x2c\x4e\x31\xcb\x46\x4a\x4a\x4a\x46\x4a\x4a\
-\x00\x00\x00\x00\x04\xff\xec\xff\x8a\x02\xdf\x02\x25\x00\x28\x00\
-\x33\x00\x3e\x00\x46\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\
-\x35\x34\x36\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\
-\x16\x33\x32\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\
-\x23\x22\x06\x06\x07\x05\x17\x37\x17\x07\x27\x07\x27\x02\x12\x44\
-\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x59\x17\x49\x3c\x54\x74\x0e\
-\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\x23\x18\x32\x20\x16\x75\xfe\
-\xc4\x41\x29\x1d\x1b\x18\x1a\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\
-\x27\x06\x01\x60\x46\x4a\x4a\x4a\x46\x4a\x4a\xee\x17\x13\x2e\x63\
-\x49\x33\x4c\x77\x3b\x53\x61\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\
-\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\
-\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\xcb\x46\x4a\x4a\x4a\
-\x46\x4a\x4a\x00\x02\x00\x56\x00\x73\x02\x02\x03\x64\x00\x19\x00\
-\x30\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x22\x26\x26\x35\x11\x37\x11\x14\x16\x16\x33\x33\x13\x26\x35\
-\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x01\x4f\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\
-\x14\x44\x51\x26\x6a\x0d\x22\x22\x17\x15\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x2b\x62\x55\x02\x03\x0c\xfd\xe1\
-\x24\x25\x0e\x01\xb7\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\
-\x0b\x06\x05\x36\x16\x34\x00\x00\x02\x00\x56\x00\x73\x02\xa3\x03\
-\x64\x00\x26\x00\x3d\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x26\x35\x11\x37\x11\x14\x16\x16\x33\x33\x13\x26\
-\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\
-\x32\x37\x17\x07\x27\x01\x5d\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x1c\x44\
-\x51\x26\x6a\x0d\x22\x22\x1c\x58\x1d\x31\x29\x23\x1c\x0f\x12\x1a\
-\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x2b\x62\x55\
-\x02\x03\x0c\xfd\xe1\x24\x25\x0e\x01\x5a\x1b\x24\x24\x32\x01\x11\
-\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x02\x00\x17\xff\
-\x90\x03\x6f\x02\xde\x00\x34\x00\x4b\x00\x00\x24\x36\x37\x36\x36\
-\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\
-\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x13\x26\
-\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\
-\x32\x37\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\
-\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x15\x29\
-\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\x34\x33\
-\x67\x35\x19\x1e\x3f\x2f\x14\x58\x1d\x31\x29\x23\x1c\x0f\x12\x1a\
-\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x09\x0a\x45\
-\x6f\x42\x09\x71\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\
-\x0e\x01\x5a\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\
-\x05\x36\x16\x34\x00\x00\x00\x00\x03\x00\x17\xff\x90\x03\x6f\x02\
-\xde\x00\x34\x00\x38\x00\x4f\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x37\x16\x33\x3e\
-\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\x33\x33\x01\x17\x07\x27\
-\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x02\x29\x37\x11\x0a\x0f\x0b\x62\x10\
-\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\
-\x15\x29\x35\x15\x04\x3e\x75\x54\x28\x27\x12\x1c\x22\x36\x4a\x24\
-\x34\x33\x67\x35\x19\x1e\x3f\x2f\x14\xfe\xca\x4d\x4d\x4e\x01\xdc\
-\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\
-\xb8\x08\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\
-\x1f\x2b\x27\x26\x2c\x09\x0a\x45\x6f\x42\x09\x71\x04\x01\x20\x2e\
-\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\x01\xb3\x4e\x4d\x4d\x0b\x1b\
-\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\
-\x00\x00\x00\x00\x03\x00\x1e\xff\x29\x03\x31\x03\x3b\x00\x25\x00\
-\x30\x00\x47\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\x34\
-\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\x37\
-\x26\x26\x23\x22\x06\x07\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x7e\x44\
-\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x0e\x2b\x49\x17\x3e\x60\x55\
-\x3a\x06\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x0f\xfe\x88\
-\x3f\x1f\x36\x19\x1d\x33\x22\x21\x32\x1b\x01\xc0\x1d\x31\x29\x23\
-\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\
-\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x22\x44\x33\x1d\x34\
-\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x11\x14\x48\
-\x39\x38\x45\x01\x8e\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\
-\x0b\x06\x05\x36\x16\x34\x00\x00\x03\x00\x1e\xff\x29\x03\xd2\x02\
-\xde\x00\x32\x00\x3d\x00\x54\x00\x00\x24\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x11\
-\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\x33\x33\x20\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x07\x01\x26\x35\x34\x36\x37\x32\x17\x07\
-\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x8c\
-\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\
-\x08\x38\x58\x17\x1c\x65\x35\x16\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x14\xfe\x83\x3f\x1f\
-\x36\x19\x1d\x33\x22\x21\x32\x1b\x02\x08\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\
-\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x22\
-\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\
-\x45\x30\x11\x14\x48\x39\x38\x45\x01\x31\x1b\x24\x24\x32\x01\x11\
-\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x03\xff\xec\x00\
-\x73\x03\xe9\x02\xde\x00\x3a\x00\x45\x00\x5c\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\
-\x06\x06\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\
-\x33\x32\x16\x17\x16\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\
-\x22\x06\x07\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\
-\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\xa3\x37\x11\x0a\x0f\
-\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\
-\x1c\x65\x35\x15\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\
-\x0a\x07\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\
-\x25\x14\xfe\x6b\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x02\x09\
-\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\
-\xb8\x08\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\
-\x1f\x2b\x27\x26\x2c\x22\x21\x43\x21\x23\x21\x23\x1f\x24\x1d\x1b\
-\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\x12\x26\x48\x38\x38\x45\x01\
-\x31\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\
-\x16\x34\x00\x00\x03\xff\xec\x00\x73\x03\x48\x03\x3b\x00\x2d\x00\
-\x38\x00\x4f\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\
-\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\
-\x16\x33\x33\x24\x16\x33\x32\x37\x26\x26\x23\x22\x06\x07\x01\x26\
-\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\
-\x32\x37\x17\x07\x27\x02\x95\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\
-\x60\x0d\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\x29\x0a\x0a\x07\
-\x07\x0a\x09\x23\x33\x21\x29\x57\x36\x36\x56\x29\x22\x30\x25\x0f\
-\xfe\x70\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\x1b\x01\xc1\x1d\x31\
-\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x22\x21\x43\x21\
-\x23\x21\x23\x1f\x24\x1d\x1b\x34\x45\x58\x4b\x4b\x58\x46\x33\x12\
-\x12\x26\x48\x38\x38\x45\x01\x8e\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x03\x00\x23\xff\
-\xb0\x04\x71\x02\xde\x00\x3a\x00\x3e\x00\x55\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\x26\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\
-\x27\x37\x16\x17\x16\x33\x33\x01\x17\x07\x27\x05\x26\x35\x34\x36\
-\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\
-\x07\x27\x03\x2b\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\
-\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x18\x1d\x44\x1b\x08\
-\x45\x81\x5e\x54\x7f\x45\x2a\x55\x1a\x60\x5e\x40\x57\x2a\x1b\x29\
-\x66\x2c\x0c\x3b\x4a\x15\xfe\x40\x4d\x4d\x4e\x02\x66\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\
-\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\
-\x26\x2c\x16\x13\x3c\x6b\x45\x44\x7d\x51\x5a\x62\x1e\x48\x38\x58\
-\x60\x01\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x01\xb1\x4e\x4d\
-\x4d\x09\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\
-\x36\x16\x34\x00\x04\xff\xec\xff\x8a\x03\x66\x02\xde\x00\x35\x00\
-\x40\x00\x4b\x00\x62\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x16\x15\x14\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\
-\x33\x33\x3e\x02\x33\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\
-\x36\x35\x34\x26\x27\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x07\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x20\x37\x11\x0a\x0f\x0b\
-\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\
-\x65\x35\x61\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\
-\x4b\x5b\x23\x18\x32\x20\x16\x7a\xfe\xbf\x41\x29\x1d\x1b\x18\x1a\
-\x37\x43\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\xa3\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\
-\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\
-\x26\x2c\x29\x35\x3b\x50\x7f\x6a\x1f\x24\x1d\x1b\x54\x8b\x4f\x3f\
-\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\x35\x15\x1e\x06\x7c\x31\x2c\
-\x16\x23\x13\x2c\x4e\x31\x01\x5a\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x04\xff\xec\xff\
-\x8a\x02\xc5\x03\x3b\x00\x28\x00\x33\x00\x3e\x00\x55\x00\x00\x24\
-\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x16\x15\x14\
-\x06\x23\x22\x26\x27\x23\x22\x26\x35\x34\x36\x33\x33\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x07\x33\x04\x16\x33\x32\x36\x35\x34\x26\x27\
-\x06\x07\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x01\x26\x35\
-\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x02\x12\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\
-\x59\x17\x49\x3c\x54\x74\x0e\x4e\x0a\x07\x07\x0a\x4f\x0d\x4b\x5b\
-\x23\x18\x32\x20\x16\x75\xfe\xc4\x41\x29\x1d\x1b\x18\x1a\x37\x43\
-\x48\x4c\x0f\x14\x08\x0f\x2d\x27\x06\x01\x5b\x1d\x31\x29\x23\x1c\
-\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\
-\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x29\x35\x3b\x50\x7f\x6a\x1f\
-\x24\x1d\x1b\x54\x8b\x4f\x3f\x61\x30\x34\x2a\xb2\x3e\x1b\x1b\x1a\
-\x35\x15\x1e\x06\x7c\x31\x2c\x16\x23\x13\x2c\x4e\x31\x01\xb7\x1b\
-\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\
-\x00\x00\x00\x00\x03\x00\x1e\xff\x8b\x02\xcf\x03\x3b\x00\x24\x00\
-\x2e\x00\x45\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x23\x06\x06\x23\x22\x27\x37\x16\x33\x32\x36\x37\x23\x06\
-\x26\x35\x34\x36\x36\x33\x32\x16\x17\x33\x24\x16\x17\x33\x26\x26\
-\x23\x22\x06\x15\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\
-\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x1c\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x30\x10\x86\x6c\x55\x4d\x12\x46\x3c\
-\x4f\x58\x0f\x22\x85\x7f\x33\x54\x30\x52\x70\x0b\x2f\xfe\xad\x47\
-\x5b\x24\x06\x40\x2f\x24\x2d\x01\x68\x1d\x31\x29\x23\x1c\x0f\x12\
-\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\x63\
-\x49\x33\x4c\x77\x3b\x53\x61\x70\x78\x1f\x6e\x15\x2f\x40\x01\x66\
-\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\x4f\x2a\x20\x01\x6c\x1b\
-\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\
-\x00\x00\x00\x00\x03\x00\x1e\xff\x8b\x03\x70\x02\xde\x00\x31\x00\
-\x3b\x00\x52\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x06\x06\x23\x22\x27\x37\x16\x33\x32\x36\x37\x23\x06\x26\x35\x34\
-\x36\x36\x33\x32\x16\x17\x33\x24\x16\x17\x33\x26\x26\x23\x22\x06\
-\x15\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\
-\x17\x16\x33\x32\x37\x17\x07\x27\x02\x2a\x37\x11\x0a\x0f\x0b\x62\
-\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\
-\x35\x38\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\x85\x7f\
-\x33\x54\x30\x52\x70\x0b\x34\xfe\xa8\x47\x5b\x24\x06\x40\x2f\x24\
-\x2d\x01\xb0\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\
-\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\
-\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x70\x78\x1f\x6e\x15\x2f\x40\x01\
-\x66\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\x4f\x2a\x20\x01\x0f\
-\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\
-\x34\x00\x00\x00\x04\x00\x1e\xff\x8b\x02\xcf\x03\x3b\x00\x24\x00\
-\x2b\x00\x35\x00\x4c\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x06\x06\x23\x22\x27\x37\x16\x33\x32\x36\x37\
-\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\x33\x01\x17\x37\x17\
-\x07\x07\x27\x12\x16\x17\x33\x26\x26\x23\x22\x06\x15\x01\x26\x35\
-\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\
-\x37\x17\x07\x27\x02\x1c\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\
-\x30\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\x85\x7f\x33\
-\x54\x30\x52\x70\x0b\x2f\xfe\xcc\x42\x38\x2c\x48\x35\x56\x0e\x47\
-\x5b\x24\x06\x40\x2f\x24\x2d\x01\x68\x1d\x31\x29\x23\x1c\x0f\x12\
-\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\x63\
-\x49\x33\x4c\x77\x3b\x53\x61\x70\x78\x1f\x6e\x15\x2f\x40\x01\x66\
-\x5c\x3b\x5c\x34\x8b\x85\x02\x35\x92\x8d\x0c\xb2\x0d\xba\xfe\x09\
-\x24\x04\x46\x4f\x2a\x20\x01\x6c\x1b\x24\x24\x32\x01\x11\x34\x0b\
-\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x04\x00\x1e\xff\
-\x8b\x03\x70\x03\x23\x00\x31\x00\x38\x00\x42\x00\x59\x00\x00\x24\
-\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x06\x06\x23\x22\x27\x37\
-\x16\x33\x32\x36\x37\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\
-\x33\x01\x17\x37\x17\x07\x07\x27\x12\x16\x17\x33\x26\x26\x23\x22\
-\x06\x15\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x2a\x37\x11\x0a\x0f\x0b\
-\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\
-\x65\x35\x38\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\x85\
-\x7f\x33\x54\x30\x52\x70\x0b\x34\xfe\xc7\x42\x38\x2c\x48\x35\x56\
-\x0e\x47\x5b\x24\x06\x40\x2f\x24\x2d\x01\xb0\x1d\x31\x29\x23\x1c\
-\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\
-\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\
-\x70\x78\x1f\x6e\x15\x2f\x40\x01\x66\x5c\x3b\x5c\x34\x8b\x85\x02\
-\x35\x92\x8d\x0c\xb2\x0d\xba\xfe\x09\x24\x04\x46\x4f\x2a\x20\x01\
-\x0f\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\
-\x16\x34\x00\x00\x05\x00\x1e\xff\x8b\x02\xcf\x03\x3b\x00\x24\x00\
-\x2e\x00\x3d\x00\x48\x00\x5f\x00\x00\x24\x36\x37\x26\x26\x27\x37\
-\x16\x16\x15\x14\x06\x23\x23\x06\x06\x23\x22\x27\x37\x16\x33\x32\
-\x36\x37\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\x33\x24\x16\
-\x17\x33\x26\x26\x23\x22\x06\x15\x12\x36\x37\x26\x26\x35\x34\x36\
-\x33\x32\x16\x15\x14\x07\x27\x36\x16\x17\x36\x35\x34\x26\x23\x22\
-\x06\x15\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x1c\x44\x0d\x01\x1f\x23\
-\x64\x23\x1e\x7d\x60\x30\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\
-\x0f\x22\x85\x7f\x33\x54\x30\x52\x70\x0b\x2f\xfe\xad\x47\x5b\x24\
-\x06\x40\x2f\x24\x2d\x2b\x28\x11\x16\x1d\x2a\x1b\x21\x27\xb2\x0c\
-\x59\x19\x16\x0e\x11\x0e\x0d\x11\x01\x0f\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x70\x78\x1f\x6e\x15\x2f\x40\x01\
-\x66\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\x4f\x2a\x20\x01\x27\
-\x10\x0a\x06\x20\x17\x20\x24\x29\x1b\x55\x35\x26\x56\x13\x01\x0f\
-\x13\x0c\x12\x10\x0e\x12\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\
-\x1a\x0b\x06\x05\x36\x16\x34\x00\x05\x00\x1e\xff\x8b\x03\x70\x02\
-\xfb\x00\x31\x00\x3b\x00\x4a\x00\x55\x00\x6c\x00\x00\x24\x36\x37\
-\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x23\x06\x06\x23\x22\x27\x37\x16\x33\
-\x32\x36\x37\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\x33\x24\
-\x16\x17\x33\x26\x26\x23\x22\x06\x15\x12\x36\x37\x26\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x07\x27\x36\x16\x17\x36\x35\x34\x26\x23\
-\x22\x06\x15\x05\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\
-\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x2a\x37\x11\x0a\x0f\
-\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\
-\x1c\x65\x35\x38\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\
-\x85\x7f\x33\x54\x30\x52\x70\x0b\x34\xfe\xa8\x47\x5b\x24\x06\x40\
-\x2f\x24\x2d\x2b\x28\x11\x16\x1d\x2a\x1b\x21\x27\xb2\x0c\x59\x19\
-\x16\x0e\x11\x0e\x0d\x11\x01\x57\x1d\x31\x29\x23\x1c\x0f\x12\x1a\
-\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x70\x78\x1f\
-\x6e\x15\x2f\x40\x01\x66\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\
-\x4f\x2a\x20\x01\x27\x10\x0a\x06\x20\x17\x20\x24\x29\x1b\x55\x35\
-\x26\x56\x13\x01\x0f\x13\x0c\x12\x10\x0e\x6f\x1b\x24\x24\x32\x01\
-\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x00\x00\
-\x04\x00\x1e\xff\x8b\x02\xcf\x03\x3b\x00\x24\x00\x2e\x00\x32\x00\
-\x49\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x06\x06\x23\x22\x27\x37\x16\x33\x32\x36\x37\x23\x06\x26\x35\
-\x34\x36\x36\x33\x32\x16\x17\x33\x24\x16\x17\x33\x26\x26\x23\x22\
-\x06\x15\x13\x37\x07\x07\x25\x26\x35\x34\x36\x37\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x02\x1c\x44\
-\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x30\x10\x86\x6c\x55\x4d\x12\
-\x46\x3c\x4f\x58\x0f\x22\x85\x7f\x33\x54\x30\x52\x70\x0b\x2f\xfe\
-\xad\x47\x5b\x24\x06\x40\x2f\x24\x2d\x44\x33\x01\x33\x01\x25\x1d\
-\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\
-\x08\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x70\x78\x1f\
-\x6e\x15\x2f\x40\x01\x66\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\
-\x4f\x2a\x20\x01\x9a\x04\x93\x04\x65\x1b\x24\x24\x32\x01\x11\x34\
-\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\x04\x00\x1e\xff\
-\x8b\x03\x70\x02\xde\x00\x31\x00\x3b\x00\x3f\x00\x56\x00\x00\x24\
-\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\x16\x15\x14\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\x06\x06\x23\x22\x27\x37\
-\x16\x33\x32\x36\x37\x23\x06\x26\x35\x34\x36\x36\x33\x32\x16\x17\
-\x33\x24\x16\x17\x33\x26\x26\x23\x22\x06\x15\x13\x37\x07\x07\x25\
-\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\
-\x33\x32\x37\x17\x07\x27\x02\x2a\x37\x11\x0a\x0f\x0b\x62\x10\x10\
-\x13\x43\x25\x0c\x0a\x07\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x38\
-\x10\x86\x6c\x55\x4d\x12\x46\x3c\x4f\x58\x0f\x22\x85\x7f\x33\x54\
-\x30\x52\x70\x0b\x34\xfe\xa8\x47\x5b\x24\x06\x40\x2f\x24\x2d\x44\
-\x33\x01\x33\x01\x6d\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\
-\x0f\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\
-\x1c\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x70\x78\x1f\x6e\x15\x2f\
-\x40\x01\x66\x5c\x3b\x5c\x34\x8b\x85\x28\x24\x04\x46\x4f\x2a\x20\
-\x01\x9a\x04\x93\x04\x08\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\
-\x1a\x0b\x06\x05\x36\x16\x34\x00\x02\x00\x1e\xff\xfe\x03\xe8\x03\
-\x3b\x00\x2e\x00\x45\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\
-\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\
-\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\
-\x27\x37\x16\x16\x33\x33\x13\x26\x35\x34\x36\x37\x32\x17\x07\x26\
-\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x03\x35\x44\
-\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\
-\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\
-\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\x15\x1d\x31\x29\x23\x1c\x0f\
-\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\
-\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\
-\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\
-\x35\x2b\x01\xb7\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\
-\x06\x05\x36\x16\x34\x00\x00\xff\xff\x00\x1e\xff\x93\x03\x57\x03\
-\x0d\x04\x02\x02\x48\x00\x00\x00\x03\x00\x1e\xff\x52\x03\xe8\x03\
-\x3b\x00\x2e\x00\x36\x00\x4d\x00\x00\x24\x36\x37\x26\x26\x27\x37\
-\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\
-\x26\x27\x27\x37\x16\x16\x33\x33\x01\x17\x37\x17\x07\x27\x07\x27\
-\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\
-\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\
-\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\
-\x7e\x33\x13\xfe\x14\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\x4b\x1d\x31\
-\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\x4a\x03\
-\x09\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\
-\x16\x34\x00\x00\x03\x00\x1e\xff\x52\x04\x89\x02\xde\x00\x3b\x00\
-\x43\x00\x5a\x00\x00\x24\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\
-\x33\x33\x32\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\
-\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\
-\x33\x01\x17\x37\x17\x07\x27\x07\x27\x01\x26\x35\x34\x36\x37\x32\
-\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\
-\x03\x43\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x0c\x0a\x07\
-\x07\x0a\x08\x38\x58\x17\x1c\x65\x35\x1a\x1f\x2a\x15\x21\xa2\x6e\
-\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\
-\x02\x11\x21\x4a\x26\x57\x7e\x33\x18\xfe\x0f\x46\x4a\x4a\x4a\x46\
-\x4a\x4a\x02\x93\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\
-\x1a\x12\x23\x05\xb8\x08\xee\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\
-\x1c\x1b\x1d\x24\x1f\x2b\x27\x26\x2c\x0a\x0d\x3f\x4d\x3a\x61\x39\
-\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\
-\x55\x35\x2b\xfe\xf8\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\xac\x1b\x24\
-\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\
-\x03\x00\x1e\xff\xfe\x03\xe8\x03\x3b\x00\x2e\x00\x45\x00\x5c\x00\
-\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\
-\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\x06\x17\
-\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\x33\x33\
-\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x25\x26\x35\x34\x36\x37\x32\x17\x07\
-\x26\x23\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x03\x35\
-\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\
-\x6e\x69\x96\x4d\x0f\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\
-\x04\x02\x11\x21\x4a\x26\x57\x7e\x33\x13\xfd\x58\x1d\x31\x29\x23\
-\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x02\xe7\
-\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\
-\xb8\x08\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\
-\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\
-\x0b\x05\x0e\x12\x29\x55\x35\x2b\x01\x07\x1b\x24\x24\x32\x01\x11\
-\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\xb5\x1b\x24\x24\x32\
-\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\x34\x00\x00\xff\
-\xff\x00\x1e\xff\x93\x03\x57\x03\x0d\x04\x22\x02\x48\x00\x00\x04\
-\x07\x02\xca\x00\x39\xfe\x30\x00\x03\x00\x1e\xfe\xf9\x03\xe8\x03\
-\x3b\x00\x2e\x00\x36\x00\x4d\x00\x00\x24\x36\x37\x26\x26\x27\x37\
-\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x37\x17\x06\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\
-\x26\x27\x27\x37\x16\x16\x33\x33\x01\x27\x37\x17\x07\x17\x07\x27\
-\x01\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\
-\x16\x33\x32\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\x64\x23\
-\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\x15\x56\
-\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\x26\x57\
-\x7e\x33\x13\xfe\x57\x39\x3f\x3d\x37\x37\x3d\x3f\x01\xf7\x1d\x31\
-\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\
-\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\
-\x3a\x61\x39\x2a\x4e\x40\x18\x30\x38\x19\x33\x45\x10\x17\x0b\x05\
-\x0e\x12\x29\x55\x35\x2b\xfe\x82\x38\x3e\x3e\x38\x38\x3f\x3f\x03\
-\x6d\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\
-\x16\x34\x00\xff\xff\x00\x1e\xfe\x91\x03\x57\x03\x0d\x04\x27\x02\
-\xb7\x01\x06\xfe\x3a\x04\x02\x02\x3f\x00\x00\x00\x03\xff\xec\xff\
-\x36\x02\x53\x03\x3b\x00\x28\x00\x30\x00\x47\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\
-\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x37\x17\
-\x06\x07\x16\x16\x33\x33\x03\x27\x37\x17\x07\x17\x07\x27\x01\x26\
-\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\x14\x17\x16\x33\
-\x32\x37\x17\x07\x27\x01\xa0\x44\x0d\x01\x1f\x23\x64\x23\x1e\x7d\
-\x60\x0b\x38\x58\x17\x1c\x65\x35\x11\x0a\x07\x07\x0a\x11\x30\x37\
-\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x12\xd4\x39\x3f\x3d\x37\
-\x37\x3d\x3f\x01\x22\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\
-\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\
-\x3b\x53\x61\x2b\x27\x26\x2c\x1f\x24\x1d\x1b\x20\x24\x17\x3d\x3f\
-\x0b\x5e\x36\x1c\x1c\xfe\xbf\x38\x3e\x3e\x38\x38\x3f\x3f\x03\x30\
-\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\
-\x34\x00\x00\x00\x02\x00\x1e\xff\xfe\x03\xe8\x03\x3b\x00\x2e\x00\
-\x45\x00\x00\x24\x36\x37\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\
-\x23\x22\x26\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x17\x06\
-\x06\x17\x16\x16\x33\x32\x36\x36\x37\x36\x26\x27\x27\x37\x16\x16\
-\x33\x33\x13\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x17\x16\x33\x32\x37\x17\x07\x27\x03\x35\x44\x0d\x01\x1f\x23\
-\x64\x23\x1e\x7d\x60\x12\x1f\x2a\x15\x21\xa2\x6e\x69\x96\x4d\x0f\
-\x15\x56\x0e\x09\x02\x03\x7d\x84\x3c\x54\x2c\x04\x02\x11\x21\x4a\
-\x26\x57\x7e\x33\x13\x15\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\
-\x1f\x0f\x1a\x12\x23\x05\xb8\x08\xee\x17\x13\x2e\x63\x49\x33\x4c\
-\x77\x3b\x53\x61\x0a\x0d\x3f\x4d\x3a\x61\x39\x2a\x4e\x40\x18\x30\
-\x38\x19\x33\x45\x10\x17\x0b\x05\x0e\x12\x29\x55\x35\x2b\x01\xb7\
-\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\x16\
-\x34\x00\x00\xff\xff\x00\x1e\xff\x93\x03\x57\x03\x0d\x04\x27\x02\
-\xca\x01\x63\xfe\xbc\x04\x02\x01\x64\x00\x00\x00\x02\xff\xec\x00\
-\x73\x02\x53\x03\x3b\x00\x28\x00\x3f\x00\x00\x24\x36\x37\x26\x26\
-\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x26\x35\x34\x36\x33\x33\x32\x36\x37\x36\x36\x37\x17\x06\x07\
-\x16\x16\x33\x33\x13\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\x22\
-\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x01\xa0\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x0b\x38\x58\x17\x1c\x65\x35\x11\x0a\
-\x07\x07\x0a\x11\x30\x37\x11\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\
-\x12\x15\x1d\x31\x29\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\
-\x23\x05\xb8\x08\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\x3b\x53\x61\
-\x2b\x27\x26\x2c\x1f\x24\x1d\x1b\x20\x24\x17\x3d\x3f\x0b\x5e\x36\
-\x1c\x1c\x01\xb7\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\
-\x06\x05\x36\x16\x34\x00\x00\x00\x05\x00\x2b\x00\x6c\x05\x08\x04\
-\x81\x00\x03\x00\x2e\x00\x38\x00\x58\x00\x5c\x00\x00\x25\x07\x11\
-\x37\x00\x36\x37\x35\x37\x11\x14\x16\x33\x33\x32\x36\x37\x37\x11\
-\x37\x11\x14\x16\x33\x33\x32\x36\x35\x11\x37\x11\x14\x06\x23\x23\
-\x22\x27\x06\x23\x23\x22\x27\x06\x23\x22\x26\x35\x16\x16\x17\x32\
-\x36\x37\x35\x06\x06\x15\x00\x37\x17\x06\x15\x14\x33\x32\x36\x35\
-\x35\x37\x15\x14\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\x07\x22\
-\x27\x06\x23\x22\x26\x35\x13\x37\x07\x07\x05\x08\x6a\x6a\xfb\x23\
-\x97\x7f\x6a\x1d\x1f\x1e\x33\x39\x01\x01\x6a\x2f\x30\x14\x2a\x1e\
-\x6a\x5c\x52\x15\x78\x1e\x29\x7b\x18\x77\x24\x35\x49\x4a\x5f\x5e\
-\x2b\x25\x21\x36\x11\x4d\x6b\x01\xb6\x15\x1e\x0a\x16\x0a\x0b\x26\
-\x09\x0a\x16\x0e\x22\x14\x39\x1d\x0e\x0d\x21\x19\x20\x4b\x33\x01\
-\x33\x78\x0c\x02\xec\x0c\xfe\x19\x76\x19\x3c\x0c\xfe\xe3\x27\x22\
-\x27\x33\x6a\x01\x22\x0c\xfe\x68\x34\x26\x1c\x2c\x02\x0e\x0c\xfd\
-\xee\x5e\x6d\x4c\x4c\x4f\x27\x4a\x48\x0a\x18\x01\x0d\x0b\x7f\x0b\
-\x39\x22\x02\x5c\x24\x0e\x17\x15\x1d\x17\x1c\x1a\x01\x19\x1a\x15\
-\x1d\x19\x21\x0e\x27\x27\x45\x02\x17\x1d\x1e\x1c\x01\x0f\x04\x93\
-\x04\x00\x00\x00\x10\x00\x28\xff\xf4\x04\x3e\x03\x90\x00\xe3\x01\
-\x0d\x01\x16\x01\x1f\x01\x29\x01\x49\x01\x4d\x01\x55\x01\x59\x01\
-\x5d\x01\x61\x01\x65\x01\x69\x01\x7f\x01\x88\x01\x92\x00\x00\x00\
-\x26\x35\x34\x37\x17\x06\x15\x14\x16\x33\x32\x36\x37\x27\x37\x16\
-\x33\x32\x36\x35\x37\x37\x15\x14\x16\x17\x35\x37\x15\x36\x36\x37\
-\x36\x37\x17\x06\x07\x16\x17\x36\x36\x33\x32\x16\x15\x14\x06\x23\
-\x27\x26\x27\x06\x07\x15\x14\x16\x16\x33\x33\x26\x35\x34\x36\x33\
-\x32\x16\x17\x07\x26\x23\x22\x06\x15\x14\x16\x17\x36\x37\x17\x06\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x15\x14\x16\x16\x33\x33\x32\
-\x36\x37\x36\x37\x17\x06\x07\x16\x16\x33\x32\x36\x37\x36\x37\x17\
-\x06\x07\x16\x33\x32\x37\x26\x27\x37\x16\x15\x14\x06\x23\x22\x26\
-\x27\x06\x23\x22\x26\x27\x06\x23\x23\x22\x26\x27\x06\x06\x23\x23\
-\x22\x27\x06\x23\x22\x27\x06\x15\x15\x07\x35\x34\x36\x37\x36\x36\
-\x33\x32\x16\x17\x1e\x02\x33\x33\x32\x36\x36\x35\x35\x23\x22\x26\
-\x27\x06\x06\x23\x22\x27\x06\x06\x23\x22\x26\x35\x34\x36\x37\x35\
-\x37\x15\x14\x16\x33\x32\x36\x37\x17\x06\x07\x16\x16\x33\x33\x35\
-\x37\x15\x33\x32\x36\x36\x35\x35\x26\x26\x27\x06\x23\x22\x27\x06\
-\x06\x23\x24\x36\x37\x35\x37\x15\x14\x16\x33\x33\x32\x35\x35\x37\
-\x15\x14\x16\x33\x33\x32\x36\x35\x35\x37\x15\x14\x06\x23\x23\x22\
-\x27\x06\x23\x23\x22\x27\x06\x06\x23\x22\x26\x35\x16\x16\x33\x32\
-\x37\x35\x06\x06\x15\x36\x16\x33\x32\x37\x35\x06\x06\x15\x12\x33\
-\x32\x37\x26\x26\x23\x22\x06\x07\x12\x37\x17\x06\x15\x14\x33\x32\
-\x36\x35\x35\x37\x15\x14\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\
-\x07\x22\x27\x06\x23\x22\x26\x35\x37\x37\x15\x07\x13\x17\x37\x17\
-\x07\x27\x07\x27\x13\x37\x15\x07\x37\x37\x15\x07\x13\x37\x15\x07\
-\x37\x37\x15\x07\x13\x37\x15\x07\x13\x16\x33\x32\x36\x37\x06\x23\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x27\x12\x36\
-\x35\x34\x26\x23\x22\x06\x07\x12\x16\x33\x32\x37\x26\x27\x22\x06\
-\x15\x01\xb4\x2e\x08\x1c\x02\x18\x19\x1a\x26\x0a\x2b\x0c\x2a\x2d\
-\x1a\x12\x01\x25\x17\x1e\x25\x15\x12\x05\x07\x03\x28\x04\x08\x06\
-\x0e\x17\x4a\x23\x23\x2a\x43\x60\x21\x2a\x0e\x0e\x2c\x0d\x29\x32\
-\x2f\x12\x2b\x21\x0e\x1e\x0a\x11\x0f\x16\x10\x13\x12\x11\x21\x29\
-\x07\x25\x56\x3b\x3f\x34\x0c\x0d\x40\x51\x66\x0d\x20\x22\x2e\x17\
-\x10\x06\x04\x04\x28\x03\x0a\x04\x0c\x0d\x0f\x0d\x04\x07\x01\x29\
-\x04\x07\x0d\x1a\x12\x01\x02\x12\x25\x15\x23\x17\x0e\x1e\x0a\x13\
-\x21\x0f\x1a\x08\x12\x25\x35\x2b\x2c\x0c\x0c\x32\x2f\x51\x39\x16\
-\x19\x25\x1f\x17\x02\x26\x09\x0b\x12\x25\x15\x16\x1f\x13\x0a\x0e\
-\x14\x18\x50\x29\x25\x0d\x53\x3f\x33\x0a\x07\x20\x15\x29\x0a\x07\
-\x1a\x0d\x17\x20\x35\x2b\x26\x09\x0d\x1a\x14\x05\x28\x03\x08\x08\
-\x2a\x36\x4f\x25\x67\x3e\x3a\x13\x1a\x22\x0c\x12\x29\x0d\x0f\x0d\
-\x3b\x27\xfe\x64\x35\x2b\x26\x09\x0c\x09\x21\x27\x0e\x12\x07\x0e\
-\x0a\x26\x22\x1b\x07\x27\x0e\x11\x27\x07\x29\x0b\x07\x1a\x0d\x17\
-\x20\x14\x0c\x0b\x15\x10\x18\x24\x10\x0c\x0b\x15\x10\x18\x24\x1f\
-\x18\x1a\x0f\x09\x13\x0d\x0b\x12\x0c\x70\x0a\x10\x05\x08\x06\x05\
-\x14\x04\x05\x08\x05\x11\x09\x1b\x0f\x05\x08\x10\x0c\x0f\x27\x15\
-\x16\x2b\x22\x23\x24\x24\x22\x23\x24\xb5\x25\x26\x42\x71\x71\x21\
-\xa9\xa9\x10\x86\x86\xfd\xb9\xb9\x65\x1c\x1b\x1d\x1f\x04\x0e\x16\
-\x1f\x24\x29\x1c\x23\x26\x32\x36\x1a\x23\x57\x34\x13\x12\x14\x2d\
-\x14\x2b\x12\x14\x0f\x0f\x06\x1e\x0f\x11\x01\xc2\x22\x20\x15\x14\
-\x08\x08\x0c\x14\x12\x18\x18\x12\x21\x13\x0f\x18\xd0\x05\xd2\x15\
-\x15\x01\x8e\x05\x92\x01\x0a\x0a\x0e\x1a\x05\x1e\x12\x04\x02\x33\
-\x40\x2e\x22\x26\x2b\x01\x02\x12\x10\x05\x86\x10\x0e\x05\x15\x1d\
-\x21\x2d\x0a\x08\x27\x0c\x12\x10\x0f\x18\x06\x03\x09\x27\x0b\x0a\
-\x0c\x0e\x10\x0c\x66\x19\x17\x07\x0b\x18\x0b\x14\x05\x11\x20\x08\
-\x04\x0c\x11\x1f\x11\x04\x24\x16\x0f\x06\x2a\x27\x16\x32\x33\x1a\
-\x1c\x0b\x0b\x16\x0b\x0a\x15\x0f\x13\x14\x0e\x19\x19\x14\x10\x09\
-\x72\x02\x77\x18\x23\x18\x23\x20\x1e\x25\x13\x0e\x04\x08\x17\x1a\
-\x66\x09\x0a\x09\x0d\x1f\x07\x08\x1a\x18\x1c\x29\x08\x15\x05\x66\
-\x0d\x0a\x19\x25\x05\x1c\x12\x04\x04\x42\x05\x47\x06\x0f\x10\x85\
-\x01\x0f\x0e\x1d\x03\x28\x28\xb4\x29\x08\x15\x05\x67\x0b\x0b\x1d\
-\x86\x05\x8b\x10\x0d\x0b\x0e\xb8\x05\xc2\x1e\x22\x19\x19\x1f\x07\
-\x08\x1a\x18\xe5\x07\x09\x27\x05\x13\x0a\xdc\x07\x09\x27\x05\x13\
-\x0a\xfe\x3a\x0f\x19\x14\x13\x19\x02\x84\x12\x06\x0c\x09\x0f\x0a\
-\x0f\x0c\x01\x0d\x0d\x09\x0f\x09\x11\x07\x13\x12\x21\x02\x0c\x0e\
-\x10\x0e\x72\x02\x40\x01\xfd\xbd\x22\x23\x24\x24\x22\x23\x24\x02\
-\x4a\x05\xed\x09\x82\x21\x26\x22\xfe\x58\x38\x26\x38\xeb\x27\x26\
-\x28\x01\x77\x36\x25\x38\xfd\x67\x08\x16\x1b\x07\x23\x1e\x20\x2c\
-\x3b\x35\x32\x40\x0b\x02\x1d\x10\x12\x0f\x12\x20\x24\xfe\x65\x0b\
-\x05\x2e\x02\x10\x0e\x00\x00\x00\x0e\x00\x3a\xfe\xae\x06\xde\x04\
-\x5c\x00\x5a\x00\x74\x00\x83\x00\x8d\x00\x98\x00\x9c\x00\xa0\x00\
-\xa4\x00\xb0\x00\xb4\x00\xd4\x00\xd8\x00\xdc\x00\xe0\x00\x00\x00\
-\x26\x26\x35\x34\x37\x33\x06\x16\x33\x32\x36\x37\x26\x27\x15\x14\
-\x06\x23\x22\x26\x37\x33\x16\x16\x33\x32\x36\x35\x11\x37\x11\x14\
-\x17\x11\x37\x11\x14\x33\x32\x37\x26\x26\x23\x22\x06\x07\x27\x36\
-\x33\x32\x16\x17\x16\x17\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\
-\x27\x36\x33\x32\x16\x17\x16\x16\x17\x07\x26\x27\x06\x07\x16\x33\
-\x07\x26\x27\x06\x06\x23\x22\x27\x02\x21\x00\x36\x37\x35\x37\x11\
-\x14\x16\x33\x32\x36\x35\x11\x37\x11\x14\x06\x23\x22\x26\x27\x06\
-\x23\x22\x26\x35\x12\x36\x37\x26\x26\x35\x34\x36\x33\x32\x16\x15\
-\x14\x07\x27\x12\x16\x33\x32\x36\x37\x35\x06\x06\x15\x12\x16\x17\
-\x36\x35\x34\x26\x23\x22\x06\x15\x01\x17\x07\x27\x05\x37\x11\x07\
-\x01\x17\x07\x27\x00\x33\x32\x36\x37\x27\x06\x23\x22\x27\x15\x15\
-\x01\x17\x07\x27\x16\x37\x17\x06\x15\x14\x33\x32\x36\x35\x35\x37\
-\x15\x14\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\x07\x22\x27\x06\
-\x23\x22\x26\x35\x13\x17\x07\x27\x25\x17\x07\x27\x01\x17\x07\x27\
-\x02\x42\x9a\x4c\x02\x59\x01\x7d\x89\x7d\x81\x0f\x25\x19\x70\x6b\
-\x5f\x6d\x04\x50\x02\x37\x41\x3d\x3a\x62\x43\x62\xc0\x6f\x4e\x39\
-\x41\x1d\x1f\x37\x28\x2e\x59\x5d\x1e\x45\x3b\x0d\x31\x09\x10\x2b\
-\x45\x36\x41\x1d\x1f\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\x49\
-\x1e\x2b\x29\x08\x12\x4b\x46\x1e\x28\x1f\x3e\xda\x8b\x62\x4d\x32\
-\xfe\xbd\xfd\x88\x86\x72\x66\x13\x10\x0f\x0b\x66\x43\x42\x37\x45\
-\x07\x25\x33\x49\x58\x3a\x28\x11\x16\x1d\x2a\x1b\x21\x27\xb2\x0c\
-\x4f\x29\x22\x15\x2c\x0e\x49\x51\x0a\x19\x16\x0e\x11\x0e\x0d\x11\
-\x01\xaa\x06\xd1\x05\x01\x03\x62\x62\x01\x3a\x06\xd1\x05\x01\x92\
-\x6d\x66\xab\x2d\x20\x7b\x9b\x82\x3e\x01\x1e\x06\xd1\x05\x05\x15\
-\x1e\x0a\x16\x0a\x0b\x26\x09\x0a\x16\x0e\x22\x14\x39\x1d\x0e\x0d\
-\x21\x19\x20\x5d\x4d\x4d\x4d\x01\x27\x4d\x4d\x4d\x01\x24\x06\xd1\
-\x05\xfe\xae\x51\x90\x5f\x0d\x1e\x69\x8e\x96\xa5\x25\x32\x2a\x91\
-\xa1\x7a\x6a\x3b\x37\x55\x5d\x03\x5d\x0c\xfd\xf5\x97\x5d\x02\x49\
-\x0c\xfe\x74\xa4\x3f\x16\x13\x16\x21\x52\x56\x15\x16\x05\x12\x0d\
-\x1c\x0c\x1b\x15\x14\x15\x22\x52\x56\x15\x16\x20\x23\x01\x6e\x02\
-\x07\x11\x1e\x14\x6e\x02\x05\x8a\x8a\x21\xfe\x93\x03\x06\x67\x17\
-\xa1\x0c\xfe\x34\x24\x20\x1e\x29\x02\x7a\x0c\xfd\x73\x5c\x56\x4c\
-\x4e\x14\x44\x43\x01\x1f\x10\x0a\x06\x20\x17\x20\x24\x29\x1b\x55\
-\x35\x26\xfe\xe3\x14\x0b\x09\x6d\x0a\x30\x1d\x01\x5d\x13\x01\x0f\
-\x13\x0c\x12\x10\x0e\x01\x32\x2d\x1a\x2d\x91\x0c\xfc\xaf\x0c\x04\
-\x46\x2d\x1a\x2d\xfc\x25\x61\x58\x09\x8c\x4d\x3b\x1f\x03\x1c\x2d\
-\x1a\x2d\x75\x24\x0e\x17\x15\x1d\x17\x1c\x1a\x01\x19\x1a\x15\x1d\
-\x19\x21\x0e\x27\x27\x45\x02\x17\x1d\x1e\x1c\xfc\xd6\x4e\x4d\x4d\
-\x90\x4e\x4d\x4d\x03\x28\x2d\x1a\x2d\x00\x00\x00\x01\x00\x4d\xff\
-\x04\x00\xeb\x00\x1a\x00\x0e\x00\x00\x16\x06\x07\x27\x36\x37\x26\
-\x26\x35\x34\x36\x33\x32\x16\x15\xeb\x32\x35\x25\x23\x0d\x1d\x25\
-\x2e\x20\x21\x2f\x68\x60\x34\x14\x36\x31\x05\x2b\x1b\x21\x2f\x32\
-\x29\x00\x00\xff\xff\x00\x3c\x00\x61\x00\xda\x01\x77\x04\x02\x02\
-\x7c\x00\x00\x00\x01\x00\x5a\x01\x35\x01\x1d\x01\xf7\x00\x03\x00\
-\x00\x13\x37\x17\x07\x5a\x61\x62\x62\x01\x96\x61\x61\x61\x00\x00\
-\x01\x00\x4a\x00\x6a\x00\xd2\x02\xda\x00\x06\x00\x00\x12\x11\x15\
-\x07\x02\x03\x37\xd2\x5c\x08\x24\x6c\x01\xcf\xfe\xe0\x3a\x0b\x01\
-\x3e\x01\x22\x10\x00\x00\x00\x00\x01\x00\x48\x00\x6a\x01\xf8\x02\
-\xe0\x00\x19\x00\x00\x12\x17\x16\x33\x32\x37\x36\x36\x35\x34\x27\
-\x37\x16\x15\x14\x06\x07\x06\x27\x16\x15\x15\x07\x02\x03\x37\xbf\
-\x09\x26\x28\x15\x0a\x2e\x2d\x0b\x64\x0f\x60\x60\x34\x37\x03\x5c\
-\x08\x24\x6c\x02\x73\x8e\x06\x01\x04\x3b\x40\x31\x3b\x15\x51\x3e\
-\x6e\x6f\x07\x03\x0b\x5e\x61\x41\x0b\x01\x3e\x01\x22\x10\x00\x00\
-\x01\x00\x46\x00\x6a\x02\xa6\x02\xf1\x00\x27\x00\x00\x12\x17\x16\
-\x33\x32\x36\x35\x34\x27\x37\x16\x15\x14\x07\x16\x33\x32\x36\x35\
-\x34\x27\x37\x16\x15\x14\x06\x23\x22\x27\x06\x23\x22\x27\x16\x15\
-\x15\x07\x02\x03\x37\xc0\x06\x1e\x19\x2f\x30\x09\x64\x0e\x08\x17\
-\x13\x30\x2e\x0d\x5c\x12\x5f\x55\x2d\x2f\x2f\x59\x15\x2e\x03\x5c\
-\x08\x24\x6c\x02\x53\x76\x05\x36\x44\x28\x3a\x14\x4b\x36\x29\x25\
-\x05\x35\x3e\x31\x44\x15\x52\x3f\x6b\x6b\x16\x3b\x06\x5a\x5d\x3f\
-\x0b\x01\x3e\x01\x22\x10\x00\x00\x01\x00\x3f\x00\x45\x01\xd6\x02\
-\xec\x00\x24\x00\x00\x24\x06\x23\x22\x26\x35\x34\x36\x37\x26\x26\
-\x35\x34\x36\x36\x37\x17\x06\x06\x15\x14\x16\x17\x36\x36\x37\x17\
-\x0e\x02\x07\x14\x16\x33\x36\x37\x17\x01\xa9\x60\x3c\x5a\x74\x24\
-\x1e\x1a\x21\x39\x7f\x64\x07\x6b\x53\x17\x17\x23\x42\x38\x0d\x55\
-\x61\x27\x01\x41\x35\x52\x48\x21\x63\x1e\x60\x5b\x2d\x4d\x19\x14\
-\x3e\x27\x31\x60\x47\x08\x62\x12\x46\x29\x15\x25\x0d\x0e\x11\x07\
-\x5e\x0a\x21\x2e\x22\x26\x27\x01\x28\x69\x00\x00\x02\x00\x38\x00\
-\x7f\x01\xe8\x02\xb4\x00\x0f\x00\x1d\x00\x00\x36\x26\x26\x35\x34\
-\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x23\x26\x16\x33\x32\x36\
-\x35\x34\x26\x26\x23\x22\x06\x06\x15\xc7\x61\x2e\x3c\x64\x38\x3b\
-\x63\x3a\x2e\x62\x48\x7b\x40\x3b\x3c\x40\x20\x38\x24\x23\x38\x20\
-\x7f\x44\x70\x45\x4a\x93\x5f\x60\x97\x4e\x40\x6d\x43\xca\x4f\x4d\
-\x40\x2a\x53\x36\x35\x51\x28\x00\x01\x00\x2c\x00\x65\x02\x02\x02\
-\xcc\x00\x0f\x00\x00\x00\x03\x06\x23\x22\x26\x27\x37\x16\x33\x32\
-\x36\x37\x12\x13\x07\x01\x70\x10\x24\x2e\x3a\x6a\x3e\x1a\x63\x71\
-\x25\x47\x37\x0f\x36\x67\x01\x40\x01\x02\x04\x0c\x0f\x73\x14\x06\
-\x09\xfe\xde\xfe\xce\x0e\x00\x00\x01\x00\x1e\x00\x6d\x02\x2f\x02\
-\xd9\x00\x0e\x00\x00\x12\x16\x17\x36\x36\x37\x17\x06\x02\x07\x23\
-\x26\x02\x27\x37\xc7\x4d\x18\x1e\x48\x36\x67\x43\x63\x30\x65\x33\
-\x5f\x44\x6a\x02\x47\xd6\x6c\x74\xd2\x86\x20\x98\xfe\xf1\x9d\xa6\
-\x01\x02\x97\x2d\x00\x00\x00\x00\x01\x00\x1a\x00\x60\x02\x2b\x02\
-\xcc\x00\x0e\x00\x00\x24\x26\x27\x06\x06\x07\x27\x36\x12\x37\x33\
-\x16\x12\x17\x07\x01\x82\x4d\x18\x1e\x48\x36\x67\x43\x63\x30\x65\
-\x33\x5f\x44\x6a\xf2\xd6\x6c\x74\xd2\x86\x20\x98\x01\x0f\x9d\xa6\
-\xfe\xfe\x97\x2d\x00\x00\x00\x00\x02\x00\x3a\x00\x52\x01\xd9\x02\
-\xe3\x00\x14\x00\x21\x00\x00\x24\x37\x06\x23\x22\x26\x26\x35\x34\
-\x36\x36\x33\x32\x16\x17\x16\x16\x17\x16\x17\x07\x02\x16\x33\x32\
-\x37\x26\x27\x26\x26\x27\x26\x06\x15\x01\x63\x02\x2f\x3b\x37\x58\
-\x32\x30\x55\x34\x47\x67\x13\x07\x08\x04\x05\x0d\x62\xe2\x41\x3b\
-\x2c\x22\x01\x08\x0c\x37\x29\x26\x2f\xdf\x94\x19\x2d\x55\x3a\x3b\
-\x5d\x35\x5e\x54\x22\x63\x50\x91\x6a\x0f\x01\x9e\x31\x11\x24\x1e\
-\x2c\x37\x02\x01\x31\x2b\x00\x00\x02\x00\x37\x00\xf7\x01\x5d\x02\
-\x1e\x00\x0f\x00\x1b\x00\x00\x36\x26\x26\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x26\x16\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\xa2\x43\x28\x28\x43\x28\x28\x44\x27\x28\x44\x27\x48\
-\x27\x21\x20\x27\x27\x20\x21\x27\xf7\x26\x41\x29\x2a\x45\x28\x28\
-\x44\x2a\x28\x42\x27\x76\x23\x23\x1b\x1e\x25\x25\x1e\x00\x00\xff\
-\xff\x00\x4a\x00\x6a\x00\xd2\x02\xda\x04\x02\x02\x50\x00\x00\xff\
-\xff\x00\x48\x00\x6a\x01\xf8\x02\xe0\x04\x02\x02\x51\x00\x00\xff\
-\xff\x00\x46\x00\x6a\x02\xa6\x02\xf1\x04\x02\x02\x52\x00\x00\x00\
-\x01\x00\x4a\x00\x6a\x02\x4c\x02\xec\x00\x23\x00\x00\x12\x17\x32\
-\x37\x26\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x23\x22\x06\
-\x15\x14\x16\x17\x36\x37\x17\x06\x06\x07\x16\x15\x15\x07\x02\x03\
-\x37\xc4\x07\x42\x3d\x1c\x20\x26\x47\x2f\x20\x40\x19\x21\x1e\x28\
-\x26\x2d\x1c\x1a\x4b\x52\x10\x50\xc7\x66\x03\x5c\x08\x24\x6c\x02\
-\x56\x87\x03\x18\x3f\x23\x2b\x4a\x2b\x15\x12\x4e\x12\x2d\x24\x1f\
-\x32\x0e\x06\x0e\x5d\x11\x13\x01\x5b\x5d\x3e\x0b\x01\x3e\x01\x22\
-\x10\x00\x00\x00\x02\x00\x28\x00\x6b\x02\x1e\x02\xeb\x00\x11\x00\
-\x27\x00\x00\x00\x16\x33\x32\x36\x35\x34\x26\x27\x06\x15\x14\x16\
-\x33\x32\x36\x27\x33\x24\x36\x36\x37\x37\x1e\x02\x15\x14\x06\x06\
-\x23\x22\x26\x27\x06\x06\x23\x22\x26\x35\x01\x49\x19\x1e\x1c\x1d\
-\x57\x4d\x8c\x20\x1d\x1b\x19\x01\x4f\xfe\xe0\x3e\x5e\x30\x50\x39\
-\x65\x3c\x2a\x46\x2a\x26\x34\x0d\x0f\x33\x22\x44\x4d\x01\x12\x30\
-\x28\x30\x4c\xaa\x51\xb3\x95\x29\x2e\x31\x41\x25\xaa\x91\x2f\x08\
-\x33\x98\xa7\x48\x42\x59\x2b\x23\x1c\x1c\x23\x65\x58\x00\x00\x00\
-\x01\x00\x1e\x00\x54\x02\x24\x02\xde\x00\x1b\x00\x00\x12\x37\x26\
-\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x07\x22\x06\x15\x14\
-\x16\x17\x36\x37\x17\x06\x06\x07\x27\x87\x51\x42\x44\x34\x5b\x37\
-\x20\x40\x1a\x26\x21\x23\x31\x37\x32\x33\x56\x72\x37\x83\xcd\x6b\
-\x4b\x01\x12\x47\x1f\x62\x40\x37\x59\x34\x14\x11\x57\x0d\x01\x34\
-\x2a\x29\x3e\x10\x42\x47\x5d\x53\xac\x72\x4f\xff\xff\x00\x1e\x00\
-\x6d\x02\x2f\x02\xd9\x04\x02\x02\x56\x00\x00\x00\x01\x00\x1a\x00\
-\x64\x02\x2b\x02\xd0\x00\x0e\x00\x00\x24\x26\x27\x06\x06\x07\x27\
-\x36\x12\x37\x33\x16\x12\x17\x07\x01\x82\x4d\x18\x1e\x48\x36\x67\
-\x43\x63\x30\x65\x33\x5f\x44\x6a\xf6\xd6\x6c\x74\xd2\x86\x20\x98\
-\x01\x0f\x9d\xa6\xfe\xfe\x97\x2d\x00\x00\x00\xff\xff\x00\x3a\x00\
-\x52\x01\xd9\x02\xe3\x04\x02\x02\x58\x00\x00\xff\xff\x00\x4a\x00\
-\x6a\x02\x4c\x02\xec\x04\x02\x02\x5d\x00\x00\xff\xff\x00\x1e\x00\
-\x6d\x02\x2f\x02\xd9\x04\x02\x02\x56\x00\x00\x00\x02\x00\x36\x00\
-\x51\x02\x19\x03\x50\x00\x11\x00\x1f\x00\x00\x01\x14\x06\x06\x23\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x07\x34\x26\
-\x23\x22\x06\x15\x15\x14\x16\x33\x32\x36\x35\x02\x19\x42\x6e\x42\
-\x42\x6e\x41\x41\x6e\x42\x41\x6f\x42\x7d\x3e\x37\x36\x3f\x3e\x37\
-\x36\x3f\x01\x3d\x46\x6b\x3b\x3b\x6c\x46\x01\x25\x45\x6c\x3c\x3c\
-\x6d\x45\x16\x46\x4d\x4c\x47\xf7\x47\x4c\x4d\x46\x00\x00\x00\x00\
-\x01\x00\x2e\x00\x61\x01\x37\x03\x40\x00\x07\x00\x00\x01\x11\x23\
-\x11\x23\x07\x35\x37\x01\x37\x7c\x02\x8b\xa1\x03\x40\xfd\x21\x02\
-\x56\x72\x7e\x7d\x00\x00\x00\x00\x01\x00\x35\x00\x61\x02\x0f\x03\
-\x50\x00\x20\x00\x00\x37\x35\x13\x37\x36\x36\x35\x34\x26\x26\x23\
-\x22\x06\x07\x23\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x07\x06\
-\x07\x07\x15\x21\x15\x46\xd8\x07\x36\x2c\x19\x2c\x1e\x2e\x3c\x09\
-\x7c\x09\x44\x6a\x3f\x40\x64\x3a\x1b\x2a\x21\x0f\x0d\xa3\x01\x2b\
-\x61\x64\x01\x02\x08\x40\x48\x28\x20\x2b\x14\x33\x27\x3b\x5d\x34\
-\x31\x5b\x3e\x28\x47\x3e\x27\x11\x10\xc1\x01\x6e\x00\x00\x00\x00\
-\x01\x00\x2e\x00\x51\x02\x17\x03\x50\x00\x2f\x00\x00\x36\x26\x26\
-\x27\x33\x16\x16\x33\x32\x36\x36\x35\x34\x26\x23\x23\x35\x33\x32\
-\x36\x36\x35\x34\x26\x23\x22\x06\x07\x23\x3e\x02\x33\x32\x16\x16\
-\x15\x14\x06\x07\x15\x16\x16\x15\x14\x06\x06\x23\xde\x6d\x40\x03\
-\x7f\x04\x3e\x31\x25\x34\x1c\x4e\x45\x27\x27\x25\x38\x1f\x32\x2b\
-\x2d\x34\x0a\x7c\x05\x3d\x67\x42\x41\x64\x36\x3c\x35\x3e\x4a\x3a\
-\x70\x4d\x51\x38\x67\x44\x33\x3f\x1a\x33\x26\x41\x36\x68\x18\x30\
-\x21\x2c\x36\x34\x23\x36\x5c\x36\x32\x58\x37\x41\x58\x10\x04\x0d\
-\x60\x4a\x3e\x63\x39\x00\x00\x00\x02\x00\x20\x00\x61\x02\x10\x03\
-\x40\x00\x0a\x00\x0e\x00\x00\x01\x11\x33\x15\x23\x15\x23\x35\x21\
-\x35\x01\x13\x11\x23\x03\x01\xcb\x45\x45\x7b\xfe\xd0\x01\x2f\x01\
-\x03\xa8\x03\x40\xfe\x06\x6c\x79\x79\x63\x02\x03\xfe\x06\x01\x30\
-\xfe\xd0\x00\x00\x01\x00\x2d\x00\x51\x02\x20\x03\x40\x00\x22\x00\
-\x00\x36\x26\x26\x27\x33\x16\x16\x33\x32\x36\x36\x35\x34\x26\x23\
-\x22\x06\x07\x23\x13\x21\x15\x21\x07\x36\x36\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\xe2\x69\x43\x09\x7c\x0c\x3d\x2e\x24\x39\x21\x45\
-\x36\x26\x38\x15\x6d\x27\x01\x7d\xfe\xea\x11\x12\x42\x27\x40\x69\
-\x3c\x41\x74\x4b\x51\x34\x5e\x3c\x27\x36\x20\x3d\x2a\x40\x43\x18\
-\x13\x01\x9f\x6b\xb8\x0c\x14\x3c\x6e\x46\x4a\x73\x3f\x00\x00\x00\
-\x02\x00\x31\x00\x51\x02\x25\x03\x40\x00\x18\x00\x28\x00\x00\x01\
-\x33\x03\x17\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x26\
-\x26\x35\x34\x36\x37\x36\x36\x37\x16\x06\x06\x15\x14\x16\x16\x33\
-\x32\x36\x36\x35\x34\x26\x26\x23\x01\x10\x87\xb1\x02\x0f\x37\x1d\
-\x3a\x64\x3c\x41\x72\x47\x49\x72\x3f\x28\x2b\x01\x02\x01\x84\x3a\
-\x20\x1d\x35\x24\x24\x37\x20\x1c\x34\x23\x03\x40\xfe\xda\x02\x09\
-\x0e\x3b\x6a\x45\x46\x70\x3e\x40\x70\x44\x38\x6b\x50\x02\x05\x02\
-\x83\x1d\x39\x27\x27\x39\x1f\x1e\x38\x27\x27\x3a\x1e\x00\x00\x00\
-\x01\x00\x32\x00\x61\x02\x19\x03\x40\x00\x06\x00\x00\x01\x15\x01\
-\x23\x01\x21\x35\x02\x19\xfe\xdd\x89\x01\x27\xfe\x9e\x03\x40\x63\
-\xfd\x84\x02\x72\x6d\x00\x00\x00\x03\x00\x34\x00\x51\x02\x30\x03\
-\x50\x00\x1d\x00\x2b\x00\x39\x00\x00\x00\x16\x16\x15\x14\x06\x07\
-\x15\x16\x16\x15\x14\x06\x06\x23\x22\x26\x26\x35\x34\x36\x37\x35\
-\x26\x26\x35\x34\x36\x36\x33\x06\x16\x33\x32\x36\x35\x34\x26\x26\
-\x23\x22\x06\x06\x15\x02\x16\x33\x32\x36\x35\x34\x26\x26\x23\x22\
-\x06\x06\x15\x01\x74\x68\x3b\x41\x30\x3d\x4d\x43\x74\x48\x48\x73\
-\x42\x4e\x3b\x31\x40\x3c\x69\x41\x66\x36\x2f\x2f\x37\x1a\x2e\x1e\
-\x1d\x2f\x19\x16\x45\x36\x37\x46\x21\x38\x24\x22\x39\x20\x03\x50\
-\x31\x5a\x3a\x40\x52\x10\x03\x14\x63\x4a\x40\x61\x33\x33\x60\x40\
-\x4a\x63\x15\x03\x13\x50\x3f\x3a\x5a\x31\xfc\x37\x37\x2e\x1c\x2c\
-\x18\x19\x2c\x1c\xfe\x7c\x3d\x3f\x37\x23\x38\x1f\x1f\x38\x24\x00\
-\x02\x00\x31\x00\x61\x02\x25\x03\x50\x00\x18\x00\x28\x00\x00\x25\
-\x23\x13\x27\x06\x06\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x14\x06\x07\x06\x06\x07\x26\x36\x36\x35\x34\x26\x26\x23\
-\x22\x06\x06\x15\x14\x16\x16\x33\x01\x45\x86\xb1\x02\x0f\x38\x1c\
-\x3b\x63\x3c\x40\x72\x47\x49\x72\x40\x28\x2b\x01\x03\x01\x83\x39\
-\x20\x1d\x35\x23\x24\x37\x20\x1c\x33\x24\x61\x01\x27\x03\x09\x0f\
-\x3b\x6b\x44\x46\x6f\x3e\x40\x6f\x44\x38\x6b\x4f\x02\x05\x02\x83\
-\x1d\x38\x27\x26\x39\x1f\x1e\x38\x27\x26\x39\x1e\x00\x00\x00\x00\
-\x02\x00\x00\x00\xc7\x00\xea\x01\xbe\x00\x0b\x00\x0f\x00\x00\x11\
-\x37\x27\x37\x17\x37\x17\x07\x17\x07\x27\x07\x37\x37\x27\x07\x3c\
-\x3c\x3f\x34\x38\x3f\x3c\x3c\x3f\x34\x38\x34\x35\x32\x34\x01\x06\
-\x3b\x3b\x3e\x35\x39\x3f\x3a\x3b\x3f\x35\x39\x49\x35\x31\x35\xff\
-\xff\x00\x00\x00\xc7\x00\xea\x01\xbe\x04\x02\x02\x79\x00\x00\x00\
-\x01\x00\x46\x00\x73\x02\x0e\x00\xfd\x00\x09\x00\x00\x36\x33\x32\
-\x37\x07\x06\x23\x22\x27\x37\xa2\x69\x95\x6e\x18\x46\x68\x9a\x68\
-\x0c\xee\x0f\x7f\x0b\x1c\x68\x00\x01\x00\x3c\x00\x61\x00\xda\x01\
-\x77\x00\x0e\x00\x00\x36\x36\x37\x17\x06\x07\x16\x16\x15\x14\x06\
-\x23\x22\x26\x35\x3c\x32\x35\x25\x23\x0d\x1d\x25\x2e\x20\x21\x2f\
-\xe3\x60\x34\x14\x36\x31\x05\x2b\x1b\x21\x2f\x32\x29\x00\x00\x00\
-\x02\x00\x46\x00\x73\x00\xe5\x02\xb6\x00\x0e\x00\x1a\x00\x00\x12\
-\x36\x37\x17\x06\x07\x16\x16\x15\x14\x06\x23\x22\x26\x35\x12\x36\
-\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\x46\x32\x35\x25\x23\x0d\
-\x1d\x25\x2e\x20\x21\x2f\x03\x2f\x20\x1f\x2e\x2e\x1f\x20\x2f\x02\
-\x22\x60\x34\x14\x36\x31\x05\x2b\x1b\x21\x2f\x32\x29\xfe\xe5\x2e\
-\x2e\x1f\x20\x2e\x2e\x20\x00\x00\x02\x00\x2b\x00\x61\x01\xcd\x03\
-\x53\x00\x19\x00\x25\x00\x00\x12\x26\x27\x26\x26\x35\x34\x36\x36\
-\x33\x32\x16\x17\x07\x26\x23\x22\x06\x15\x14\x16\x17\x16\x16\x07\
-\x07\x06\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\xeb\x1e\x2d\
-\x3c\x39\x3a\x65\x3e\x37\x69\x25\x35\x3e\x56\x32\x3e\x26\x3c\x35\
-\x24\x01\x63\x1d\x2d\x1f\x1f\x2d\x2d\x1f\x1f\x2d\x01\x75\x36\x27\
-\x34\x59\x36\x3a\x56\x2e\x2c\x26\x5a\x3e\x2d\x26\x1d\x30\x33\x2d\
-\x4c\x40\x0d\x80\x2d\x2d\x1f\x1f\x2d\x2d\x1f\x00\x01\x00\x1e\xff\
-\xc4\x05\x5c\x01\x94\x00\x1c\x00\x00\x24\x37\x26\x35\x34\x36\x36\
-\x33\x32\x16\x17\x07\x26\x23\x22\x06\x15\x14\x16\x17\x36\x37\x17\
-\x06\x06\x23\x21\x35\x21\x03\x98\x60\x37\x33\x5a\x38\x27\x4c\x1f\
-\x28\x29\x33\x31\x3a\x28\x25\x68\x6a\x14\x6c\xf4\xa6\xfc\xc8\x03\
-\x36\x3f\x02\x35\x58\x3a\x5a\x32\x19\x17\x62\x1a\x38\x2c\x24\x3b\
-\x11\x09\x14\x6e\x1c\x17\x7b\x00\x01\x00\x21\x00\xd5\x01\xcc\x02\
-\x67\x00\x0e\x00\x00\x01\x07\x17\x07\x27\x07\x27\x37\x27\x37\x17\
-\x27\x33\x07\x37\x01\xcc\x92\x5e\x4b\x57\x53\x4c\x5c\x92\x20\x8b\
-\x04\x5c\x04\x8c\x01\xb1\x2a\x79\x38\x80\x81\x39\x79\x2a\x54\x31\
-\x93\x93\x31\x00\x01\x00\x24\xff\xc0\x06\xd4\x00\xf9\x00\x24\x00\
-\x00\x24\x07\x16\x16\x33\x21\x15\x21\x22\x27\x06\x06\x07\x06\x26\
-\x27\x26\x26\x23\x22\x07\x27\x36\x36\x33\x32\x16\x17\x16\x16\x33\
-\x32\x36\x37\x36\x37\x17\x03\x82\x0e\x1b\x4f\x3f\x02\xb7\xfd\x58\
-\xa2\x3a\x18\x54\x32\x41\x68\x43\x2c\x38\x22\x61\x72\x49\x48\x97\
-\x4b\x2f\x52\x30\x3a\x47\x2f\x24\x2c\x11\x10\x0d\x61\xa4\x28\x1d\
-\x1a\x7a\x58\x29\x2e\x01\x02\x2d\x41\x2a\x1d\xbe\x2b\x8b\x83\x28\
-\x2f\x38\x25\x1f\x24\x23\x4c\x0a\x00\x00\x00\x00\x02\x00\x1e\xff\
-\xce\x04\xea\x01\x88\x00\x12\x00\x1d\x00\x00\x05\x22\x26\x26\x35\
-\x34\x36\x36\x33\x32\x16\x16\x15\x14\x07\x16\x33\x21\x15\x24\x16\
-\x17\x36\x35\x34\x26\x23\x22\x06\x15\x01\xfd\xaa\xcd\x68\x42\x6d\
-\x3e\x37\x54\x2f\x13\x25\x3b\x02\xd8\xfb\x9c\x5c\x72\x0a\x38\x2e\
-\x2f\x43\x32\x22\x58\x52\x40\x6e\x40\x34\x5e\x3f\x3c\x32\x01\x7a\
-\xac\x24\x08\x26\x26\x39\x38\x41\x30\x00\x00\x00\x02\x00\x1e\xff\
-\xc0\x06\x0c\x01\x6d\x00\x1f\x00\x28\x00\x00\x37\x21\x32\x36\x37\
-\x36\x37\x17\x06\x07\x16\x17\x3e\x02\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x22\x26\x27\x06\x06\x23\x21\x24\x36\x35\x34\x26\x23\
-\x22\x06\x07\x1e\x02\xe8\x1c\x25\x0d\x10\x08\x54\x08\x12\x18\x27\
-\x26\x75\x89\x42\x3b\x58\x2e\x5d\xe1\xc7\x22\x20\x39\x12\x16\x3a\
-\x28\xfd\x1c\x04\xe8\xa2\x35\x31\x3a\x80\x38\x3b\x19\x1b\x24\x39\
-\x0a\x40\x3a\x0b\x02\x54\x8c\x52\x35\x5c\x39\x4f\x63\x31\x12\x14\
-\x14\x12\x7d\x2c\x2d\x29\x2f\x5a\x59\x00\x00\x00\x01\x00\x15\xff\
-\xab\x01\x2b\x01\x1a\x00\x06\x00\x00\x36\x36\x37\x17\x06\x07\x27\
-\x3c\x74\x32\x49\x68\x62\x4c\x2e\xb9\x33\x42\x72\xbb\x26\x00\x00\
-\x02\x00\x14\x00\x7a\x04\x12\x02\x34\x00\x15\x00\x20\x00\x00\x24\
-\x04\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x07\
-\x16\x33\x20\x37\x17\x24\x16\x17\x36\x35\x34\x26\x23\x22\x06\x07\
-\x03\xa2\xfe\xe6\x95\x9c\xd0\x73\x42\x6d\x3e\x37\x54\x2f\x12\x48\
-\x17\x01\x1e\xd2\x1a\xfc\x69\x69\x66\x0a\x38\x2e\x2f\x42\x01\xa0\
-\x26\x22\x5a\x51\x40\x6d\x40\x33\x5f\x3f\x3d\x2f\x02\x44\x6f\x62\
-\x26\x08\x23\x25\x39\x38\x3f\x30\x00\x00\x00\x00\x02\xff\xd2\xff\
-\x35\x02\x55\x02\x92\x00\x30\x00\x3a\x00\x00\x36\x06\x15\x15\x36\
-\x33\x32\x16\x15\x14\x06\x06\x23\x22\x26\x27\x06\x07\x27\x36\x37\
-\x26\x35\x34\x37\x26\x35\x34\x36\x36\x33\x32\x16\x17\x07\x26\x23\
-\x22\x06\x15\x14\x16\x17\x37\x36\x37\x17\x06\x07\x02\x33\x32\x36\
-\x35\x34\x26\x23\x22\x07\xe8\x60\x86\x88\x51\x6e\x47\x75\x46\x4f\
-\x7e\x29\x21\x24\x46\x2a\x30\x0e\xa2\x57\x38\x5a\x32\x2d\x4a\x22\
-\x2a\x2f\x32\x31\x3e\x2d\x23\x0c\x6e\x52\x0f\x5e\x45\x64\x78\x46\
-\x49\x3a\x31\x6f\x69\xd3\x58\x3f\x05\x6c\x4e\x5a\x41\x59\x2c\x2e\
-\x2a\x24\x32\x31\x40\x36\x27\x2b\xa2\x5b\x39\x6d\x39\x57\x2f\x1f\
-\x1f\x59\x1f\x37\x25\x20\x39\x10\x04\x24\x12\x6f\x11\x18\xfe\xb9\
-\x25\x20\x1c\x24\x54\x00\x00\x00\x08\x00\x1e\xff\x1b\x05\x25\x04\
-\x22\x00\x2f\x00\x54\x00\x60\x00\x6c\x00\x71\x00\x76\x00\x82\x00\
-\x8e\x00\x00\x04\x27\x06\x23\x22\x26\x26\x35\x34\x37\x26\x35\x34\
-\x37\x26\x35\x34\x36\x36\x33\x32\x17\x36\x33\x32\x17\x36\x33\x32\
-\x16\x16\x15\x14\x07\x16\x15\x14\x07\x16\x15\x14\x06\x06\x23\x22\
-\x27\x06\x23\x00\x17\x36\x33\x32\x16\x16\x15\x15\x21\x35\x34\x36\
-\x36\x33\x32\x17\x36\x35\x34\x27\x06\x23\x22\x26\x26\x35\x21\x14\
-\x06\x06\x23\x22\x27\x06\x06\x15\x12\x16\x33\x32\x36\x35\x34\x26\
-\x23\x22\x06\x15\x10\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x15\
-\x00\x33\x32\x37\x21\x01\x26\x23\x22\x07\x00\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x06\x15\x10\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x15\x01\xcf\x9b\x1e\x21\x24\x3d\x24\x11\x63\x64\x12\x24\x3d\
-\x24\x22\x21\x9b\xcf\xcb\x9c\x1e\x22\x24\x3d\x24\x10\x67\x65\x0e\
-\x24\x3d\x24\x1f\x1c\x9b\xd1\xfd\xd3\x4e\x17\x1b\x24\x3d\x24\x02\
-\x4a\x24\x3d\x24\x1d\x19\x4f\x51\x19\x1b\x24\x3d\x24\xfd\xb6\x24\
-\x3d\x24\x18\x17\x28\x29\x3d\x26\x1d\x1d\x26\x26\x1d\x1d\x26\x26\
-\x1d\x1d\x26\x26\x1d\x1d\x26\x01\x54\x9c\x9a\x77\xfd\xdb\x02\x25\
-\x77\x9a\x9c\x77\x02\x77\x26\x1d\x1d\x26\x26\x1d\x1d\x26\x26\x1d\
-\x1d\x26\x26\x1d\x1d\x26\xe5\x69\x10\x24\x3d\x24\x23\x1d\x9a\xcc\
-\xce\x9a\x21\x22\x24\x3d\x24\x12\x65\x63\x10\x24\x3d\x24\x22\x1e\
-\x99\xd2\xcf\x9b\x1c\x20\x24\x3d\x24\x0e\x67\x01\xdc\x83\x0a\x24\
-\x3d\x24\x06\x06\x24\x3d\x24\x0c\x83\xaa\xac\x85\x0b\x24\x3d\x24\
-\x24\x3d\x24\x09\x41\x94\x5a\xfe\x3d\x25\x25\x1d\x1d\x26\x26\x1d\
-\x03\x34\x26\x26\x1d\x1d\x26\x26\x1d\xfc\x28\x40\x03\xd9\x40\x40\
-\xfc\x52\x26\x25\x1d\x1d\x26\x26\x1d\x03\x34\x26\x26\x1d\x1d\x26\
-\x26\x1d\x00\x00\x03\x00\x44\xff\xd9\x01\x8d\x03\x95\x00\x07\x00\
-\x1f\x00\x27\x00\x00\x12\x36\x37\x17\x06\x06\x07\x23\x07\x17\x27\
-\x37\x17\x27\x33\x07\x37\x17\x07\x37\x15\x27\x17\x07\x27\x17\x23\
-\x37\x07\x27\x37\x07\x17\x16\x16\x17\x07\x26\x26\x27\xc1\x4b\x2d\
-\x54\x29\x3c\x0e\x6a\x6c\x6b\x5b\x39\x37\x10\x50\x22\x48\x39\x6c\
-\x7b\x7b\x6c\x39\x48\x22\x50\x10\x37\x39\x5b\x6b\xd3\x0e\x3c\x29\
-\x54\x2d\x4b\x11\x02\xbb\x9e\x3c\x39\x34\x7f\x42\x86\x16\x3d\x39\
-\x5e\x6e\x6e\x5d\x39\x3c\x16\x4e\x16\x3c\x39\x5d\x6e\x6e\x5e\x39\
-\x3d\x16\x8c\x42\x7f\x34\x39\x3c\x9e\x54\x00\x00\x03\x00\x1e\xff\
-\xd9\x01\x67\x03\x95\x00\x07\x00\x0f\x00\x27\x00\x00\x12\x26\x27\
-\x37\x16\x16\x17\x23\x02\x36\x37\x33\x06\x06\x07\x27\x13\x17\x27\
-\x37\x17\x27\x33\x07\x37\x17\x07\x37\x15\x27\x17\x07\x27\x17\x23\
-\x37\x07\x27\x37\x07\x83\x3c\x29\x54\x2d\x4b\x11\x6a\x47\x3c\x0e\
-\x6a\x11\x4b\x2d\x54\x18\x7b\x6c\x39\x48\x22\x50\x10\x37\x39\x5b\
-\x6b\x6b\x5b\x39\x37\x10\x50\x22\x48\x39\x6c\x7b\x02\xa9\x7f\x34\
-\x39\x3c\x9e\x54\xfd\xdf\x7f\x42\x54\x9e\x3c\x39\x01\xcf\x16\x3c\
-\x39\x5d\x6e\x6e\x5e\x39\x3d\x16\x4e\x16\x3d\x39\x5e\x6e\x6e\x5d\
-\x39\x3c\x16\x00\x01\x00\x43\x00\x7a\x00\xe1\x01\x18\x00\x0b\x00\
-\x00\x12\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x33\xb3\x2e\x2f\
-\x21\x20\x2e\x2d\x21\x01\x18\x2e\x22\x20\x2e\x2e\x20\x22\x2e\x00\
-\x01\x00\x3d\xff\xf1\x00\xd7\x01\x13\x00\x0f\x00\x00\x36\x37\x23\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x06\x06\x07\x27\x81\x0b\x04\
-\x20\x2b\x2a\x21\x24\x2b\x01\x37\x36\x29\x40\x3b\x2c\x1f\x21\x2c\
-\x33\x2f\x3d\x65\x1e\x2a\x00\x00\x02\x00\x55\x00\x7a\x00\xf1\x02\
-\x8d\x00\x0b\x00\x17\x00\x00\x12\x16\x15\x14\x06\x23\x22\x26\x35\
-\x34\x36\x33\x02\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\xc5\
-\x2c\x2d\x22\x21\x2c\x2b\x22\x4d\x2b\x22\x23\x2c\x2d\x22\x21\x2c\
-\x01\x15\x2d\x21\x20\x2d\x2d\x20\x21\x2d\x01\x4b\x2d\x2d\x21\x21\
-\x2c\x2d\x20\x00\x02\x00\x55\x00\x7a\x00\xf1\x03\x5e\x00\x03\x00\
-\x0f\x00\x00\x13\x33\x11\x23\x06\x36\x33\x32\x16\x15\x14\x06\x23\
-\x22\x26\x35\x6b\x71\x71\x16\x2b\x22\x23\x2c\x2d\x22\x21\x2c\x03\
-\x5e\xfe\x05\x7b\x2d\x2d\x21\x20\x2d\x2d\x20\x00\x01\x00\xaa\x01\
-\xa7\x01\x49\x02\x45\x00\x0b\x00\x00\x00\x16\x15\x14\x06\x23\x22\
-\x26\x35\x34\x36\x33\x01\x1b\x2e\x30\x20\x20\x2f\x2e\x21\x02\x45\
-\x2e\x21\x20\x2f\x2f\x20\x21\x2e\x00\x00\x00\x00\x02\x00\x1c\x01\
-\x6e\x01\xb1\x02\x7b\x00\x03\x00\x07\x00\x00\x01\x33\x03\x23\x03\
-\x33\x03\x23\x01\x36\x7b\x6f\x5e\x76\x7b\x6f\x5e\x02\x7b\xfe\xf3\
-\x01\x0d\xfe\xf3\x00\x00\x00\x00\x01\x00\x16\x00\x7f\x01\x9f\x03\
-\x5e\x00\x03\x00\x00\x01\x01\x23\x01\x01\x9f\xfe\xeb\x74\x01\x13\
-\x03\x5e\xfd\x21\x02\xdf\x00\x00\x01\x00\x16\x00\x7f\x01\x9f\x03\
-\x5e\x00\x03\x00\x00\x25\x23\x01\x33\x01\x9f\x75\xfe\xec\x75\x7f\
-\x02\xdf\x00\x00\x02\x00\x57\x00\x7a\x02\x43\x01\x18\x00\x0b\x00\
-\x17\x00\x00\x12\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x33\x16\
-\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\xc8\x2e\x30\x20\x20\
-\x2f\x2e\x21\xfe\x2e\x21\x22\x2e\x30\x20\x20\x2f\x01\x18\x2e\x22\
-\x20\x2e\x2e\x20\x22\x2e\x2e\x2e\x2e\x22\x20\x2e\x2e\x20\x00\x00\
-\x02\x00\x71\x00\x20\x01\xad\x03\xbe\x00\x03\x00\x07\x00\x00\x01\
-\x33\x11\x23\x03\x33\x11\x23\x01\x42\x6b\x6b\xd1\x6b\x6b\x03\xbe\
-\xfc\x62\x03\x9e\xfc\x62\x00\x00\x01\x00\x3f\x01\x8f\x02\xed\x01\
-\xf4\x00\x03\x00\x00\x13\x21\x15\x21\x3f\x02\xae\xfd\x52\x01\xf4\
-\x65\x00\x00\x00\x01\x00\x42\x01\x8f\x01\xba\x01\xf4\x00\x03\x00\
-\x00\x01\x15\x21\x35\x01\xba\xfe\x88\x01\xf4\x65\x65\x00\x00\x00\
-\x01\x00\x02\x00\x17\x02\x1d\x00\x76\x00\x03\x00\x00\x25\x21\x35\
-\x21\x02\x1d\xfd\xe5\x02\x1b\x17\x5f\x00\x00\x00\x01\x00\x72\x00\
-\x1a\x01\x48\x03\xb4\x00\x07\x00\x00\x01\x23\x11\x33\x15\x23\x11\
-\x33\x01\x48\x60\x60\xd6\xd6\x03\x4f\xfd\x30\x65\x03\x9a\x00\x00\
-\x01\x00\x06\x00\x1a\x00\xdb\x03\xb4\x00\x07\x00\x00\x13\x11\x23\
-\x35\x33\x11\x23\x35\xdb\xd5\x60\x60\x03\xb4\xfc\x66\x65\x02\xd0\
-\x65\x00\x00\x00\x01\x00\x03\x02\x51\x00\xb9\x03\x5e\x00\x03\x00\
-\x00\x13\x13\x23\x03\x6e\x4b\x5a\x5c\x03\x5e\xfe\xf3\x01\x0d\x00\
-\x02\x00\x1d\x02\x51\x01\x9c\x03\x5e\x00\x03\x00\x07\x00\x00\x13\
-\x23\x13\x3b\x02\x03\x23\x77\x5a\x4b\x6b\x5e\x6b\x5c\x5a\x02\x51\
-\x01\x0d\xfe\xf3\x00\x00\x00\x00\x02\x00\x03\x02\x51\x01\x82\x03\
-\x5e\x00\x03\x00\x07\x00\x00\x01\x13\x23\x03\x23\x13\x23\x03\x01\
-\x36\x4c\x5b\x5b\x5e\x4b\x5a\x5c\x03\x5e\xfe\xf3\x01\x0d\xfe\xf3\
-\x01\x0d\x00\x00\x01\x00\x24\xff\x95\x07\xdf\x01\xf5\x00\x40\x00\
-\x00\x00\x16\x16\x17\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\x07\
-\x16\x16\x33\x32\x37\x26\x27\x37\x16\x16\x15\x14\x06\x23\x22\x26\
-\x27\x06\x06\x23\x22\x26\x26\x27\x26\x26\x23\x22\x06\x15\x14\x17\
-\x07\x26\x26\x23\x22\x04\x07\x27\x24\x21\x32\x17\x26\x35\x34\x36\
-\x36\x33\x05\x17\x44\x2f\x1f\x26\x3d\x2c\x20\x22\x0b\x0b\x0a\x60\
-\x09\x10\x12\x38\x1a\x35\x03\x03\x2b\x5e\x1b\x17\x58\x3f\x27\x4c\
-\x19\x14\x40\x2a\x2b\x45\x31\x21\x2b\x3f\x2c\x29\x33\xa9\x21\x54\
-\xe0\xe9\xba\xfe\x9b\x9b\x17\x01\x52\x01\x82\xf2\x87\x52\x36\x5c\
-\x38\x01\xb3\x1e\x2b\x24\x2d\x2c\x1c\x25\x23\x45\x0a\x39\x3d\x15\
-\x13\x18\x56\x66\x33\x41\x6f\x3c\x4b\x4b\x20\x21\x20\x21\x1e\x2b\
-\x24\x2f\x2d\x31\x31\x71\x62\x5e\x1d\x19\x27\x23\x73\x52\x18\x4a\
-\x5e\x3b\x5c\x32\x00\x00\x00\x00\x25\x00\x1e\xff\x05\x25\x00\x04\
-\x81\x00\x57\x00\x9e\x00\xa9\x00\xad\x00\xb5\x00\xb9\x00\xdd\x00\
-\xe1\x01\x01\x01\x15\x01\x19\x01\x24\x01\x78\x01\x7c\x01\x80\x01\
-\x8b\x01\x8f\x01\x9b\x01\xa7\x01\xcb\x01\xcf\x01\xef\x02\x03\x02\
-\x07\x02\x12\x02\x3d\x02\x41\x02\x4b\x02\x6b\x02\x6f\x02\x73\x02\
-\x7e\x02\x82\x02\x8e\x02\x9a\x02\x9e\x02\xa2\x00\x00\x24\x36\x37\
-\x26\x26\x27\x37\x16\x16\x15\x14\x06\x23\x23\x22\x27\x06\x23\x22\
-\x26\x27\x06\x23\x22\x26\x27\x06\x23\x21\x22\x26\x27\x06\x23\x22\
-\x27\x06\x15\x11\x07\x11\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\
-\x33\x21\x32\x36\x37\x36\x37\x37\x17\x06\x07\x16\x16\x33\x32\x36\
-\x37\x36\x37\x17\x06\x07\x16\x33\x32\x36\x37\x37\x34\x27\x37\x16\
-\x07\x16\x16\x33\x33\x05\x34\x36\x37\x36\x33\x32\x16\x17\x16\x16\
-\x33\x21\x32\x36\x37\x36\x36\x37\x17\x06\x07\x16\x16\x33\x33\x32\
-\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\x33\x32\x16\x17\
-\x16\x16\x17\x07\x26\x27\x06\x04\x23\x23\x22\x26\x27\x06\x06\x23\
-\x21\x22\x26\x27\x06\x23\x22\x27\x06\x15\x11\x07\x12\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x07\x13\x17\x07\x27\x25\x17\x37\x17\x07\
-\x27\x07\x27\x25\x17\x07\x27\x25\x16\x33\x3e\x02\x35\x34\x26\x27\
-\x37\x16\x17\x16\x16\x33\x33\x32\x36\x35\x11\x37\x11\x14\x06\x23\
-\x23\x22\x26\x27\x0e\x02\x23\x22\x27\x01\x17\x07\x27\x16\x37\x17\
-\x06\x15\x14\x33\x32\x36\x35\x35\x37\x15\x14\x16\x33\x32\x35\x34\
-\x27\x37\x16\x15\x14\x07\x22\x27\x06\x23\x22\x26\x35\x24\x33\x32\
-\x17\x36\x36\x33\x32\x16\x15\x14\x06\x23\x22\x27\x26\x23\x22\x07\
-\x27\x17\x37\x11\x07\x12\x16\x33\x36\x36\x35\x34\x26\x23\x22\x07\
-\x12\x37\x17\x06\x15\x14\x16\x17\x32\x36\x36\x35\x34\x26\x27\x37\
-\x16\x17\x16\x33\x33\x32\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\
-\x33\x33\x32\x36\x37\x26\x27\x26\x26\x23\x22\x06\x07\x27\x36\x33\
-\x32\x16\x17\x16\x16\x17\x07\x26\x27\x06\x04\x23\x23\x22\x26\x27\
-\x06\x23\x22\x26\x27\x06\x06\x23\x23\x22\x26\x27\x0e\x02\x23\x22\
-\x26\x26\x35\x01\x17\x07\x27\x13\x17\x07\x27\x00\x16\x33\x32\x37\
-\x26\x26\x23\x22\x06\x07\x13\x37\x07\x07\x24\x36\x33\x32\x16\x15\
-\x14\x06\x23\x22\x26\x35\x16\x16\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x15\x01\x16\x33\x3e\x02\x35\x34\x26\x27\x37\x16\x17\x16\x16\
-\x33\x33\x32\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x26\x27\x0e\
-\x02\x23\x22\x27\x01\x17\x07\x27\x16\x37\x17\x06\x15\x14\x33\x32\
-\x36\x35\x35\x37\x15\x14\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\
-\x07\x22\x27\x06\x23\x22\x26\x35\x24\x33\x32\x17\x36\x36\x33\x32\
-\x16\x15\x14\x06\x23\x22\x27\x26\x23\x22\x07\x27\x17\x37\x11\x07\
-\x12\x16\x33\x36\x36\x35\x34\x26\x23\x22\x07\x12\x36\x37\x35\x37\
-\x11\x14\x16\x33\x33\x32\x36\x37\x37\x11\x37\x11\x14\x16\x33\x33\
-\x32\x36\x35\x11\x37\x11\x14\x06\x23\x23\x22\x27\x06\x23\x23\x22\
-\x27\x06\x23\x22\x26\x35\x01\x17\x07\x27\x12\x16\x17\x32\x36\x37\
-\x35\x06\x06\x15\x00\x37\x17\x06\x15\x14\x33\x32\x36\x35\x35\x37\
-\x15\x14\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\x07\x22\x27\x06\
-\x23\x22\x26\x35\x13\x37\x07\x07\x05\x37\x11\x07\x24\x33\x32\x36\
-\x37\x26\x26\x23\x22\x06\x07\x13\x17\x07\x27\x00\x36\x33\x32\x16\
-\x15\x14\x06\x23\x22\x26\x35\x16\x16\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\x01\x17\x07\x27\x37\x17\x07\x27\x24\x4d\x44\x0d\x01\
-\x1f\x23\x64\x23\x1e\x7d\x60\x10\x60\x33\x24\x58\x26\x41\x17\x28\
-\x55\x2a\x43\x14\x2e\x71\xfe\x36\x2b\x49\x17\x3e\x60\x55\x3a\x06\
-\x6a\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x01\xc6\x34\x31\x0d\
-\x07\x05\x04\x5d\x0e\x0a\x10\x2a\x1d\x20\x22\x0a\x09\x0a\x59\x09\
-\x0c\x20\x37\x1a\x1d\x01\x01\x0d\x5f\x10\x02\x18\x3d\x27\x12\xdb\
-\xf8\x1a\x1b\x58\x70\x37\x58\x2a\x20\x30\x24\x01\xcf\x30\x37\x11\
-\x0a\x0f\x0b\x62\x10\x10\x13\x43\x25\x1b\x6f\xc6\x5c\x19\x3b\x36\
-\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\x49\x1e\x2d\
-\x2a\x6e\xfe\xf4\x85\x12\x38\x58\x17\x1c\x65\x35\xfe\x2f\x2b\x49\
-\x17\x3e\x60\x55\x3a\x06\x6a\xc1\x3f\x1f\x36\x19\x1d\x33\x22\x21\
-\x32\x1b\xe0\x05\xca\x05\x03\xa9\x46\x4a\x4a\x4a\x46\x4a\x4a\x02\
-\x93\x05\xca\x05\x01\xe3\x1c\x22\x36\x4a\x24\x34\x33\x67\x35\x19\
-\x1e\x3f\x2f\x10\x2a\x1e\x6a\x5c\x52\x15\x29\x35\x15\x04\x3e\x75\
-\x54\x28\x27\x01\x10\x06\xd1\x05\x02\x15\x1e\x0a\x16\x0a\x0b\x26\
-\x09\x0a\x16\x0e\x22\x14\x39\x1d\x0e\x0d\x21\x19\x20\x02\xa9\x17\
-\x12\x15\x15\x3f\x21\x23\x2d\x35\x36\x18\x28\x2f\x0f\x13\x15\x07\
-\x58\x6a\x6a\x2e\x1c\x12\x1d\x1c\x14\x0f\x2f\x1e\xdf\x2a\x55\x1a\
-\x60\x5e\x40\x57\x2a\x1b\x29\x66\x2c\x0c\x3b\x4a\x0c\x23\x33\x21\
-\x29\x57\x36\x36\x56\x29\x22\x30\x25\x16\x6f\xc6\x5c\x19\x3b\x36\
-\x43\x1e\x1e\x38\x27\x2e\x59\x5d\x1e\x46\x39\x54\x84\x49\x1e\x2d\
-\x2a\x6e\xfe\xf4\x85\x12\x2a\x4a\x18\x3d\x62\x32\x4f\x20\x18\x4a\
-\x29\x10\x1d\x44\x1b\x08\x45\x81\x5e\x54\x7f\x45\x01\x8e\x05\xca\
-\x05\x54\x4d\x4d\x4e\x02\xdd\x37\x20\x41\x2e\x1b\x33\x23\x23\x33\
-\x1b\x66\x33\x01\x33\x01\xf7\x2e\x20\x23\x2b\x2e\x20\x23\x2b\x29\
-\x13\x14\x11\x13\x14\x12\x11\x14\x01\x5d\x1c\x22\x36\x4a\x24\x34\
-\x33\x67\x35\x19\x1e\x3f\x2f\x11\x2a\x1e\x6a\x5c\x52\x16\x29\x35\
-\x15\x04\x3e\x75\x54\x28\x27\x01\x0c\x06\xd1\x05\x02\x15\x1e\x0a\
-\x16\x0a\x0b\x26\x09\x0a\x16\x0e\x22\x14\x39\x1d\x0e\x0d\x21\x19\
-\x20\x02\xae\x17\x12\x15\x15\x3f\x21\x23\x2d\x35\x36\x18\x28\x2f\
-\x0f\x13\x15\x07\x58\x6a\x6a\x2e\x1c\x12\x1d\x1c\x14\x0f\x2f\x1e\
-\xdc\x97\x7f\x6a\x1d\x1f\x1e\x33\x39\x01\x01\x6a\x2f\x30\x14\x2a\
-\x1e\x6a\x5c\x52\x15\x78\x1e\x29\x7b\x18\x77\x24\x35\x49\x4a\x5f\
-\x01\x0d\x05\xca\x05\x1b\x2b\x25\x21\x36\x11\x4d\x6b\x01\xb6\x15\
-\x1e\x0a\x16\x0a\x0b\x26\x09\x0a\x16\x0e\x22\x14\x39\x1d\x0e\x0d\
-\x21\x19\x20\x4b\x33\x01\x33\x02\x15\x6a\x6a\x01\xcd\x3f\x1f\x36\
-\x19\x1d\x33\x22\x21\x32\x1b\xec\x05\xca\x05\x04\x61\x2e\x20\x23\
-\x2b\x2e\x20\x23\x2b\x29\x13\x14\x11\x13\x14\x12\x11\x14\x02\xbc\
-\x05\xca\x05\x64\x4d\x4d\x4d\xee\x17\x13\x2e\x63\x49\x33\x4c\x77\
-\x3b\x53\x61\x37\x37\x1f\x1e\x3d\x1e\x1e\x3c\x22\x22\x44\x33\x1d\
-\x34\xfe\xd7\x03\x01\x48\x3c\x67\x3a\xbc\x4d\x5a\x45\x30\x24\x30\
-\x19\x1c\x14\x0b\x4a\x28\x11\x0f\x1e\x25\x22\x4d\x0a\x52\x31\x25\
-\x15\x12\x18\x2f\x5c\x0d\x61\x4a\x19\x13\x7d\x3c\x67\x3a\xbc\x4d\
-\x5a\x45\x30\x20\x24\x17\x3d\x3f\x0b\x5e\x36\x1c\x1c\x3a\x3e\x09\
-\x16\x15\x14\x16\x21\x52\x56\x15\x16\x20\x23\x01\x6e\x02\x07\x6d\
-\x6b\x2b\x27\x26\x2c\x22\x22\x44\x33\x1d\x34\xfe\xd7\x03\x01\xc5\
-\x11\x14\x48\x39\x38\x45\xfe\xbf\x27\x16\x27\x63\x46\x4a\x4a\x4a\
-\x46\x4a\x4a\x1e\x27\x16\x27\x29\x04\x01\x20\x2e\x14\x3d\x8f\x57\
-\x3a\x60\x57\x13\x0e\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x09\x0a\
-\x45\x6f\x42\x09\x03\x7b\x2d\x1a\x2d\x72\x24\x0e\x17\x15\x1d\x17\
-\x1c\x1a\x01\x19\x1a\x15\x1d\x19\x21\x0e\x27\x27\x45\x02\x17\x1d\
-\x1e\x1c\xd2\x03\x30\x32\x29\x22\x25\x2b\x06\x05\x04\x30\x72\x0c\
-\xfd\xb7\x11\x02\xba\x02\x01\x0e\x0f\x0e\x11\x3a\xfd\xf5\x62\x1e\
-\x48\x38\x58\x60\x01\x28\x3c\x1d\x36\x6b\x6e\x2b\x75\x4b\x34\x34\
-\x45\x58\x4b\x4b\x58\x46\x33\x3a\x3e\x09\x16\x15\x14\x16\x21\x52\
-\x56\x15\x16\x20\x23\x01\x6e\x02\x07\x6d\x6b\x22\x21\x43\x21\x23\
-\x21\x23\x16\x13\x3c\x6b\x45\x44\x7d\x51\xfe\x97\x27\x16\x27\x03\
-\x5c\x4e\x4d\x4d\xfe\xaf\x12\x26\x48\x38\x38\x45\x02\x61\x04\x93\
-\x04\x1d\x2e\x30\x22\x26\x2a\x2a\x25\x0f\x13\x12\x0f\x11\x17\x16\
-\x11\xfd\x2d\x04\x01\x20\x2e\x14\x3d\x8f\x57\x3a\x60\x57\x13\x0e\
-\x1c\x2c\x02\x2c\x0c\xfd\xd0\x5e\x6d\x09\x0a\x45\x6f\x42\x09\x03\
-\x7b\x2d\x1a\x2d\x72\x24\x0e\x17\x15\x1d\x17\x1c\x1a\x01\x19\x1a\
-\x15\x1d\x19\x21\x0e\x27\x27\x45\x02\x17\x1d\x1e\x1c\xd2\x03\x30\
-\x32\x29\x22\x25\x2b\x06\x05\x04\x30\x72\x0c\xfd\xb7\x11\x02\xba\
-\x02\x01\x0e\x0f\x0e\x11\x3a\xfe\x56\x76\x19\x3c\x0c\xfe\xe3\x27\
-\x22\x27\x33\x6a\x01\x22\x0c\xfe\x68\x34\x26\x1c\x2c\x02\x0e\x0c\
-\xfd\xee\x5e\x6d\x4c\x4c\x4f\x27\x4a\x48\xfe\xe0\x27\x16\x27\x01\
-\x2c\x18\x01\x0d\x0b\x7f\x0b\x39\x22\x02\x5c\x24\x0e\x17\x15\x1d\
-\x17\x1c\x1a\x01\x19\x1a\x15\x1d\x19\x21\x0e\x27\x27\x45\x02\x17\
-\x1d\x1e\x1c\x01\x0f\x04\x93\x04\x92\x0c\xfd\x14\x0c\x82\x11\x14\
-\x48\x39\x38\x45\xfe\xc0\x27\x16\x27\x03\x2e\x2e\x30\x22\x26\x2a\
-\x2a\x25\x0f\x13\x12\x0f\x11\x17\x16\x11\xfc\x78\x27\x16\x27\xf2\
-\x4d\x4d\x4d\x00\x03\x00\x2b\x00\x54\x02\x39\x02\xed\x00\x07\x00\
-\x0b\x00\x0f\x00\x00\x00\x02\x07\x27\x36\x12\x37\x17\x25\x17\x07\
-\x27\x01\x17\x07\x27\x01\x97\x6e\x37\x57\x32\x6c\x44\x62\xfe\xad\
-\x62\x62\x61\x01\xac\x62\x62\x61\x02\x20\xfe\xe8\xa1\x24\xa5\x01\
-\x22\x9b\x2f\x13\x61\x61\x61\xfe\xa6\x61\x61\x61\x00\x00\x00\xff\
-\xff\x00\x2b\x00\x54\x03\x2c\x02\xed\x04\x22\x02\x9f\x00\x00\x04\
-\x07\x02\x4f\x02\x0f\xff\x1f\x00\x03\x00\x14\x00\x2a\x03\x13\x03\
-\x29\x00\x0f\x00\x1f\x00\x3a\x00\x00\x00\x16\x16\x15\x14\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x36\x33\x00\x16\x16\x33\x32\x36\x36\
-\x35\x34\x26\x26\x23\x22\x06\x06\x15\x3e\x02\x33\x32\x16\x17\x07\
-\x26\x26\x23\x22\x06\x15\x14\x16\x33\x32\x37\x17\x06\x06\x23\x22\
-\x26\x26\x35\x01\xfd\xb1\x65\x64\xb0\x6d\x6a\xaf\x65\x63\xaf\x6c\
-\xfe\xdc\x4c\x85\x53\x52\x86\x4e\x4c\x86\x54\x52\x86\x4c\x5e\x34\
-\x5f\x3f\x2f\x55\x1d\x3c\x11\x32\x1f\x36\x3d\x3b\x36\x42\x2e\x39\
-\x18\x5c\x39\x3e\x5e\x33\x03\x29\x63\xaf\x6e\x6b\xaf\x65\x65\xaf\
-\x6b\x6a\xb0\x66\xfe\x2e\x86\x4e\x4d\x86\x53\x53\x86\x4d\x4c\x86\
-\x54\x3e\x62\x38\x28\x20\x39\x14\x1b\x48\x3d\x3e\x48\x3d\x37\x26\
-\x33\x38\x62\x3f\x00\x00\x00\x00\x03\x00\x21\x01\x84\x01\xc5\x03\
-\x29\x00\x0f\x00\x2e\x00\x36\x00\x00\x12\x36\x36\x33\x32\x16\x16\
-\x15\x14\x06\x06\x23\x22\x26\x26\x35\x1e\x02\x33\x32\x37\x23\x27\
-\x23\x15\x23\x35\x33\x32\x16\x15\x14\x06\x07\x17\x36\x36\x35\x34\
-\x26\x26\x23\x22\x06\x06\x15\x37\x32\x35\x34\x26\x23\x23\x15\x21\
-\x38\x61\x39\x38\x61\x39\x38\x60\x3a\x39\x60\x39\x38\x2a\x47\x29\
-\x3e\x2d\x3b\x35\x15\x36\x5d\x27\x2b\x18\x16\x3c\x15\x18\x29\x46\
-\x2b\x2a\x47\x29\x9e\x24\x12\x12\x1e\x02\x8f\x61\x39\x3a\x61\x38\
-\x39\x61\x38\x39\x60\x39\x2a\x47\x2a\x2b\x55\x55\xe3\x27\x21\x18\
-\x22\x08\x57\x15\x39\x20\x2a\x48\x2a\x2a\x48\x2a\x12\x19\x0c\x0d\
-\x32\x00\x00\x00\x02\x00\x0b\x01\x7b\x03\x34\x03\x05\x00\x07\x00\
-\x14\x00\x00\x01\x23\x11\x23\x11\x23\x35\x21\x33\x33\x17\x37\x33\
-\x11\x23\x35\x07\x23\x27\x15\x23\x01\x62\x79\x64\x7a\x01\x57\x31\
-\x58\x7a\x7a\x55\x5d\x5a\x32\x5a\x5e\x02\xae\xfe\xcd\x01\x33\x57\
-\xb4\xb4\xfe\x76\xea\x81\x81\xea\x00\x00\x00\x00\x02\x00\x20\x02\
-\x79\x01\x47\x03\x9f\x00\x0f\x00\x1b\x00\x00\x12\x26\x26\x35\x34\
-\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x23\x26\x16\x33\x32\x36\
-\x35\x34\x26\x23\x22\x06\x15\x8c\x44\x28\x28\x43\x28\x29\x44\x27\
-\x28\x44\x28\x3f\x23\x1c\x1c\x24\x24\x1c\x1c\x23\x02\x79\x27\x43\
-\x28\x28\x44\x28\x28\x44\x28\x28\x43\x27\x76\x25\x25\x1d\x1d\x25\
-\x25\x1d\x00\x00\x01\x00\x1d\x02\x33\x00\xd3\x03\x40\x00\x03\x00\
-\x00\x13\x23\x13\x33\x77\x5a\x4b\x6b\x02\x33\x01\x0d\x00\x00\x00\
-\x02\x00\x1d\x02\x33\x01\x9c\x03\x40\x00\x03\x00\x07\x00\x00\x13\
-\x23\x13\x3b\x02\x03\x23\x77\x5a\x4b\x6b\x5e\x6b\x5c\x5a\x02\x33\
-\x01\x0d\xfe\xf3\x00\x00\x00\x00\x04\x00\x51\x00\x61\x04\x2e\x03\
-\x40\x00\x0b\x00\x17\x00\x1b\x00\x27\x00\x00\x13\x33\x01\x33\x11\
-\x33\x11\x23\x01\x23\x11\x23\x00\x36\x33\x32\x16\x15\x14\x06\x23\
-\x22\x26\x35\x13\x21\x15\x21\x12\x16\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\x51\x87\x01\x42\x03\x7a\x84\xfe\xbb\x03\x7a\x02\x7a\
-\x62\x50\x50\x61\x61\x50\x51\x61\x07\x01\x55\xfe\xab\x5f\x2a\x21\
-\x21\x2a\x2a\x21\x21\x2a\x03\x40\xfd\xea\x02\x16\xfd\x21\x02\x1c\
-\xfd\xe4\x02\x46\x67\x67\x52\x52\x67\x66\x53\xfe\xfd\x6f\x01\x43\
-\x34\x34\x2f\x2f\x34\x34\x2f\x00\x02\x00\x33\x00\xa3\x02\x4b\x02\
-\xbc\x00\x1b\x00\x27\x00\x00\x37\x37\x26\x35\x34\x37\x27\x37\x17\
-\x36\x33\x32\x17\x37\x17\x07\x16\x15\x14\x07\x17\x07\x27\x06\x23\
-\x22\x27\x07\x36\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x15\x33\
-\x4f\x21\x21\x4f\x4c\x4e\x35\x3d\x3e\x34\x4e\x4c\x4d\x20\x20\x4d\
-\x4c\x4d\x35\x3e\x3d\x35\x4e\x4a\x44\x32\x33\x45\x45\x33\x32\x44\
-\xef\x4d\x35\x3e\x3e\x34\x4e\x4d\x4f\x21\x21\x4f\x4d\x4d\x38\x3b\
-\x3c\x36\x4e\x4c\x4d\x1f\x1f\x4d\xda\x45\x45\x32\x32\x46\x46\x32\
-\x00\x00\x00\x00\x01\x00\x25\x01\xa2\x02\x4a\x03\x40\x00\x06\x00\
-\x00\x01\x33\x13\x23\x03\x03\x23\x01\x0a\x5a\xe6\x74\x9e\xa0\x73\
-\x03\x40\xfe\x62\x01\x2a\xfe\xd6\x00\x00\x00\x00\x01\x00\x04\x00\
-\x2a\x02\x8c\x03\x29\x00\x08\x00\x00\x13\x33\x17\x13\x33\x15\x23\
-\x03\x23\x04\x82\x7b\xb4\xd7\x82\xc3\x7a\x01\xbd\xfc\x02\x68\x6f\
-\xfd\x70\x00\x00\x02\x00\x55\x00\xc1\x00\xf3\x02\xcb\x00\x0b\x00\
-\x17\x00\x00\x12\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x23\x06\
-\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\x82\x2d\x2e\x20\x21\
-\x2f\x2e\x22\x4e\x2e\x20\x21\x2f\x2e\x22\x21\x2d\x02\x2d\x2e\x21\
-\x20\x2f\x2f\x20\x21\x2e\xfd\x2f\x2f\x20\x21\x2e\x2e\x21\x00\x00\
-\x02\x00\x01\x03\xad\x00\xee\x04\x62\x00\x10\x00\x27\x00\x00\x12\
-\x06\x23\x22\x27\x37\x16\x33\x32\x35\x34\x26\x27\x37\x16\x16\x15\
-\x26\x33\x16\x16\x17\x07\x27\x06\x06\x15\x14\x17\x07\x26\x35\x34\
-\x36\x37\x26\x23\x22\x07\x27\xee\x2a\x23\x1b\x15\x08\x1c\x0b\x1f\
-\x0e\x12\x2c\x13\x10\xd0\x0f\x13\x3c\x1f\x13\x14\x1d\x23\x02\x32\
-\x02\x24\x27\x18\x09\x0b\x15\x0b\x03\xd6\x29\x06\x33\x05\x19\x12\
-\x20\x1e\x18\x21\x2e\x17\x59\x01\x18\x13\x2a\x0a\x04\x25\x17\x05\
-\x0a\x06\x0c\x07\x1d\x2f\x09\x08\x0a\x2f\x00\x00\x04\x00\x00\x03\
-\x4c\x01\x8a\x04\x93\x00\x15\x00\x19\x00\x23\x00\x34\x00\x00\x12\
-\x27\x37\x16\x17\x36\x36\x33\x32\x16\x15\x14\x06\x07\x06\x27\x06\
-\x07\x27\x36\x36\x35\x37\x17\x07\x27\x16\x33\x32\x36\x35\x34\x26\
-\x23\x22\x07\x17\x16\x33\x32\x35\x34\x26\x27\x37\x16\x16\x15\x14\
-\x06\x23\x22\x27\x31\x22\x29\x23\x08\x17\x40\x20\x22\x29\x2d\x31\
-\x2e\x36\x0d\x2e\x28\x1c\x15\x66\x25\x25\x24\x31\x19\x1f\x1a\x12\
-\x0f\x2d\x1e\x8b\x1c\x0c\x1e\x0d\x12\x2c\x13\x0f\x2a\x23\x19\x17\
-\x03\xee\x25\x21\x2d\x20\x2f\x2e\x2a\x21\x22\x28\x01\x01\x07\x39\
-\x2f\x22\x1c\x2a\x19\xc6\x24\x25\x25\x91\x0c\x0f\x0b\x10\x33\x28\
-\x05\x19\x12\x21\x1d\x18\x20\x2f\x17\x26\x29\x06\x00\x00\x00\x00\
-\x02\x00\x0c\x03\x4c\x01\x31\x04\x44\x00\x15\x00\x1f\x00\x00\x12\
-\x27\x37\x16\x17\x36\x36\x33\x32\x16\x15\x14\x06\x07\x06\x27\x06\
-\x07\x27\x36\x36\x35\x36\x33\x32\x36\x35\x34\x26\x23\x22\x07\x3d\
-\x22\x29\x23\x08\x17\x40\x20\x22\x29\x2d\x31\x2e\x36\x0d\x2e\x28\
-\x1c\x15\x73\x19\x1f\x1a\x12\x0f\x2d\x1e\x03\xee\x25\x21\x2d\x20\
-\x2f\x2e\x2a\x21\x22\x28\x01\x01\x07\x39\x2f\x22\x1c\x2a\x19\x11\
-\x0c\x0f\x0b\x10\x33\x00\x00\x00\x01\xff\xff\x03\x63\x01\x08\x04\
-\xa0\x00\x23\x00\x00\x12\x36\x33\x32\x17\x07\x26\x23\x22\x06\x15\
-\x14\x16\x17\x16\x33\x32\x37\x17\x07\x15\x14\x07\x27\x36\x36\x35\
-\x34\x26\x27\x37\x16\x17\x37\x26\x35\x5b\x30\x28\x22\x1c\x0f\x11\
-\x18\x16\x19\x15\x10\x11\x10\x19\x1b\x04\xa8\x26\x2d\x12\x0f\x14\
-\x1b\x20\x2b\x0d\x20\x1c\x04\x6f\x31\x11\x33\x0a\x12\x0f\x0d\x12\
-\x02\x03\x06\x30\x22\x01\x38\x39\x1b\x1a\x27\x13\x18\x24\x15\x26\
-\x23\x20\x08\x1a\x23\x00\x00\x00\x01\x00\x00\x03\xaa\x01\x35\x04\
-\x4b\x00\x1d\x00\x00\x13\x16\x16\x33\x32\x36\x37\x36\x37\x17\x06\
-\x07\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\x23\x22\x27\x06\x06\
-\x23\x22\x27\x0d\x25\x27\x17\x12\x12\x05\x07\x03\x2b\x04\x04\x18\
-\x15\x17\x0f\x28\x12\x41\x24\x1b\x09\x20\x14\x34\x44\x03\xf4\x0b\
-\x07\x0a\x0d\x12\x1a\x04\x22\x10\x0c\x08\x1c\x34\x10\x33\x30\x3e\
-\x18\x0b\x0d\x19\x00\x00\x00\x00\x02\x00\x00\x03\xad\x01\x04\x04\
-\x9f\x00\x13\x00\x1d\x00\x00\x12\x26\x27\x37\x16\x17\x37\x35\x37\
-\x15\x14\x07\x36\x33\x32\x16\x15\x14\x06\x07\x26\x33\x32\x36\x35\
-\x34\x26\x23\x22\x07\x81\x46\x3b\x03\x22\x20\x0f\x2f\x0a\x1f\x21\
-\x22\x29\x2d\x31\x25\x1b\x1f\x1b\x13\x0f\x2d\x1e\x03\xad\x08\x0a\
-\x30\x06\x04\x1b\x96\x09\x3f\x1b\x1a\x19\x2a\x21\x22\x28\x01\x30\
-\x0c\x0f\x0b\x10\x33\x00\x00\x00\x01\xff\xfb\x02\xee\x00\x96\x03\
-\x89\x00\x03\x00\x00\x03\x37\x17\x07\x05\x4e\x4d\x4d\x03\x3b\x4e\
-\x4e\x4d\x00\x00\x01\x00\x00\x00\x55\x00\x9a\x00\xef\x00\x03\x00\
-\x00\x35\x37\x17\x07\x4d\x4d\x4d\xa2\x4d\x4d\x4d\x00\x00\x00\x00\
-\x01\x00\x00\x01\x41\x00\x9a\x01\xdb\x00\x03\x00\x00\x11\x37\x17\
-\x07\x4d\x4d\x4d\x01\x8e\x4d\x4d\x4d\x00\x00\x00\x02\xff\xfd\x02\
-\x81\x00\x95\x03\xa6\x00\x03\x00\x07\x00\x00\x13\x17\x07\x27\x17\
-\x17\x07\x27\x47\x4a\x4a\x4a\x4e\x4a\x4a\x4a\x03\xa6\x4a\x49\x49\
-\x47\x4a\x4a\x4a\x00\x00\x00\x00\x01\x00\x08\x00\x57\x00\x84\x01\
-\x44\x00\x07\x00\x00\x13\x17\x07\x17\x07\x27\x37\x27\x47\x3d\x37\
-\x37\x3d\x3f\x39\x39\x01\x44\x3e\x38\x38\x3f\x3f\x38\x38\x00\x00\
-\x02\x00\x00\x02\xd0\x01\x24\x03\x68\x00\x03\x00\x07\x00\x00\x11\
-\x37\x17\x07\x37\x17\x07\x27\x4a\x4a\x4a\x90\x4a\x4a\x4a\x03\x1a\
-\x49\x49\x4a\x98\x4a\x4a\x4a\x00\x01\x00\x00\xff\x9e\x01\x24\x00\
-\x36\x00\x07\x00\x00\x15\x37\x17\x37\x17\x07\x27\x07\x4a\x46\x4a\
-\x4a\x4a\x46\x4a\x18\x4a\x46\x4a\x4a\x4a\x46\x4a\x00\x00\x00\x00\
-\x03\x00\x04\x02\x92\x01\x23\x03\x96\x00\x03\x00\x07\x00\x0b\x00\
-\x00\x13\x07\x27\x37\x27\x17\x07\x27\x37\x17\x07\x27\xd6\x43\x43\
-\x43\x4c\x42\x42\x43\xdc\x43\x43\x42\x02\xd5\x43\x43\x42\x7f\x43\
-\x43\x43\x41\x43\x43\x43\x00\x00\x03\x00\x03\x00\xe5\x01\x22\x01\
-\xea\x00\x03\x00\x07\x00\x0b\x00\x00\x13\x37\x17\x07\x27\x17\x07\
-\x27\x17\x17\x07\x27\x9d\x42\x43\x43\x99\x42\x42\x43\x8d\x43\x43\
-\x43\x01\xa5\x43\x43\x43\x88\x43\x42\x42\x3d\x43\x42\x42\x00\x00\
-\x03\x00\x03\x01\x25\x01\x22\x02\x2a\x00\x03\x00\x07\x00\x0b\x00\
-\x00\x13\x07\x27\x37\x27\x17\x07\x27\x37\x17\x07\x27\xd3\x43\x43\
-\x43\x4a\x42\x42\x43\xdc\x43\x43\x42\x01\x68\x43\x43\x42\x80\x42\
-\x43\x43\x40\x42\x43\x43\x00\x00\x03\x00\x06\x01\x24\x01\x20\x02\
-\x26\x00\x03\x00\x07\x00\x0b\x00\x00\x13\x37\x17\x07\x27\x17\x07\
-\x27\x37\x17\x07\x27\x4c\x43\x43\x43\x47\x43\x43\x42\xd7\x43\x43\
-\x43\x01\xe3\x43\x43\x42\x09\x43\x43\x43\x45\x43\x43\x43\x00\x00\
-\x03\x00\x06\x01\x2a\x01\x20\x02\x2e\x00\x03\x00\x07\x00\x0b\x00\
-\x00\x13\x37\x17\x07\x27\x17\x07\x27\x37\x17\x07\x27\x4c\x43\x43\
-\x43\x47\x43\x43\x42\xd7\x43\x43\x43\x01\xeb\x43\x43\x42\x07\x43\
-\x43\x43\x45\x43\x43\x43\x00\x00\x02\x00\x00\x00\xc7\x00\xea\x01\
-\xbe\x00\x0b\x00\x0f\x00\x00\x11\x37\x27\x37\x17\x37\x17\x07\x17\
-\x07\x27\x07\x37\x37\x27\x07\x3c\x3c\x3f\x34\x38\x3f\x3c\x3c\x3f\
-\x34\x38\x34\x35\x32\x34\x01\x06\x3b\x3b\x3e\x35\x39\x3f\x3a\x3b\
-\x3f\x35\x39\x49\x35\x31\x35\x00\x02\x00\x00\x00\xc7\x00\xea\x01\
-\xbe\x00\x0b\x00\x0f\x00\x00\x11\x37\x27\x37\x17\x37\x17\x07\x17\
-\x07\x27\x07\x37\x37\x27\x07\x3c\x3c\x3f\x34\x38\x3f\x3c\x3c\x3f\
-\x34\x38\x34\x35\x32\x34\x01\x06\x3b\x3b\x3e\x35\x39\x3f\x3a\x3b\
-\x3f\x35\x39\x49\x35\x31\x35\x00\x02\x00\x00\x00\xc7\x00\xea\x01\
-\xbe\x00\x0b\x00\x0f\x00\x00\x11\x37\x27\x37\x17\x37\x17\x07\x17\
-\x07\x27\x07\x37\x37\x27\x07\x3c\x3c\x3f\x34\x38\x3f\x3c\x3c\x3f\
-\x34\x38\x34\x35\x32\x34\x01\x06\x3b\x3b\x3e\x35\x39\x3f\x3a\x3b\
-\x3f\x35\x39\x49\x35\x31\x35\x00\x02\x00\x00\x02\xca\x01\x18\x03\
-\x65\x00\x13\x00\x1e\x00\x00\x12\x27\x26\x23\x22\x07\x27\x36\x33\
-\x32\x17\x36\x36\x33\x32\x16\x15\x14\x06\x23\x26\x16\x33\x36\x36\
-\x35\x34\x26\x23\x22\x07\x95\x28\x2f\x0f\x13\x15\x07\x15\x17\x12\
-\x15\x15\x3f\x21\x23\x2d\x35\x36\x27\x1c\x12\x1d\x1c\x14\x0f\x2f\
-\x1e\x02\xca\x06\x05\x04\x30\x05\x03\x30\x32\x29\x22\x25\x2b\x31\
-\x02\x01\x0e\x0f\x0e\x11\x3a\x00\x01\x00\x00\x02\xc8\x01\x45\x03\
-\x81\x00\x03\x00\x00\x01\x17\x05\x27\x01\x34\x11\xfe\xcc\x11\x03\
-\x81\x47\x72\x48\x00\x00\x00\x00\x01\xff\xf9\x02\x8d\x01\x6e\x03\
-\x98\x00\x07\x00\x00\x12\x36\x37\x17\x06\x06\x07\x27\x28\xbe\x7a\
-\x0e\x6d\xaf\x33\x26\x03\x00\x77\x21\x48\x1d\x63\x43\x23\x00\x00\
-\x01\xff\xfc\x03\x49\x00\x30\x03\xe0\x00\x03\x00\x00\x13\x07\x07\
-\x37\x30\x01\x33\x01\x03\xe0\x93\x04\x93\x00\x00\x01\xff\xfd\xff\
-\xf2\x00\x30\x00\x89\x00\x03\x00\x00\x37\x15\x07\x37\x30\x33\x01\
-\x89\x93\x04\x93\x00\x00\x00\x00\x01\x00\x00\x03\x82\x00\xc0\x04\
-\x51\x00\x16\x00\x00\x13\x26\x35\x34\x36\x37\x32\x17\x07\x26\x23\
-\x22\x06\x15\x14\x17\x16\x33\x32\x37\x17\x07\x27\x2a\x1d\x31\x29\
-\x23\x1c\x0f\x12\x1a\x14\x19\x1f\x0f\x1a\x12\x23\x05\xb8\x08\x03\
-\xbb\x1b\x24\x24\x32\x01\x11\x34\x0b\x14\x0f\x1a\x0b\x06\x05\x36\
-\x16\x34\x00\xff\xff\x00\x00\xff\xd4\x00\xc0\x00\xa3\x04\x07\x02\
-\xca\x00\x00\xfc\x52\x00\x00\xff\xff\x00\x00\x03\x83\x00\xc0\x05\
-\x3f\x04\x26\x02\xca\x00\x01\x04\x07\x02\xd7\xff\xff\x02\x5c\xff\
-\xff\xff\xf3\x03\x82\x00\xef\x05\x3e\x04\x22\x02\xca\x28\x00\x04\
-\x07\x02\xd4\xff\xf3\x02\x1e\xff\xff\xff\xfb\x03\x82\x00\xd1\x04\
-\xbd\x04\x22\x02\xca\x03\x00\x04\x07\x02\xd6\xff\xfb\x01\x56\xff\
-\xff\xff\xfb\x03\x82\x00\xd2\x05\x15\x04\x22\x02\xca\x07\x00\x04\
-\x07\x02\xd3\xff\xfb\x01\x63\xff\xff\x00\x00\x03\x82\x00\xc0\x05\
-\x20\x04\x22\x02\xca\x00\x00\x04\x07\x02\xe1\x00\x0e\x01\x81\xff\
-\xff\x00\x08\xff\xc3\x00\xd7\x00\xf3\x04\x26\x02\xcb\x10\x50\x04\
-\x06\x02\xd8\x08\x3b\x00\x00\xff\xff\x00\x0f\xff\x68\x00\xe6\x00\
-\xef\x04\x26\x02\xcb\x0f\x4c\x04\x07\x02\xd5\x00\x0f\xff\x70\x00\
-\x02\x00\x00\x03\x18\x00\xd7\x03\xb2\x00\x03\x00\x07\x00\x00\x13\
-\x07\x27\x37\x37\x17\x07\x27\xd6\xd1\x05\xd0\x01\x06\xd1\x05\x03\
-\x32\x1a\x2d\x1a\x53\x2d\x19\x2d\x00\x00\x00\x00\x02\x00\x00\x02\
-\x51\x00\xfc\x03\x20\x00\x21\x00\x2c\x00\x00\x12\x06\x07\x27\x35\
-\x36\x35\x34\x27\x26\x23\x22\x07\x27\x36\x33\x32\x16\x17\x16\x15\
-\x14\x07\x36\x37\x26\x26\x35\x34\x36\x33\x32\x16\x15\x06\x16\x17\
-\x36\x35\x34\x26\x23\x22\x06\x15\xfc\x5b\x56\x0d\x06\x04\x05\x0c\
-\x0e\x14\x0d\x1a\x16\x10\x19\x06\x09\x02\x1e\x1f\x16\x1d\x29\x1c\
-\x20\x27\x64\x18\x16\x10\x12\x0e\x0d\x11\x02\xaf\x43\x1b\x26\x01\
-\x08\x09\x08\x07\x0b\x11\x2b\x11\x0f\x0c\x0f\x11\x05\x0a\x0a\x10\
-\x06\x22\x18\x1f\x23\x29\x1c\x0d\x13\x01\x10\x12\x0c\x12\x11\x0d\
-\x00\x00\x00\xff\xff\x00\x00\xff\xf8\x00\xd7\x00\x92\x04\x07\x02\
-\xd3\x00\x00\xfc\xe0\x00\x00\x00\x01\x00\x00\x03\x20\x00\xd6\x03\
-\x67\x00\x03\x00\x00\x13\x07\x27\x37\xd6\xd1\x05\xd0\x03\x3a\x1a\
-\x2d\x1a\x00\x00\x02\x00\x02\x02\x15\x00\xc0\x02\xe3\x00\x0e\x00\
-\x19\x00\x00\x12\x07\x27\x36\x36\x37\x26\x26\x35\x34\x36\x33\x32\
-\x16\x15\x06\x16\x17\x36\x35\x34\x26\x23\x22\x06\x15\xc0\xb2\x0c\
-\x2b\x28\x11\x16\x1d\x2a\x1b\x21\x27\x65\x19\x16\x0e\x11\x0e\x0d\
-\x11\x02\x4a\x35\x26\x0d\x10\x0a\x06\x20\x17\x20\x24\x29\x1b\x0e\
-\x13\x01\x0f\x13\x0c\x12\x10\x0e\x00\x00\x00\x00\x01\x00\x00\xff\
-\x88\x00\xcf\xff\xc5\x00\x03\x00\x00\x17\x07\x27\x37\xcf\xca\x05\
-\xca\x62\x16\x27\x16\x00\x00\x00\x01\x00\x02\x03\x22\x00\xcd\x03\
-\xbd\x00\x1f\x00\x00\x12\x15\x14\x33\x32\x36\x35\x35\x37\x15\x14\
-\x16\x33\x32\x35\x34\x27\x37\x16\x15\x14\x07\x22\x27\x06\x23\x22\
-\x26\x35\x34\x37\x17\x2b\x16\x0a\x0b\x26\x09\x0a\x16\x0e\x22\x14\
-\x39\x1d\x0e\x0d\x21\x19\x20\x15\x1e\x03\x84\x15\x1d\x17\x1c\x1a\
-\x01\x19\x1a\x15\x1d\x19\x21\x0e\x27\x27\x45\x02\x17\x1d\x1e\x1c\
-\x29\x24\x0e\xff\xff\xff\xfe\x03\x2e\x00\xd5\x04\x75\x04\x26\x02\
-\xd9\x01\x0c\x04\x07\x02\xd3\xff\xfe\x00\xc3\xff\xff\xff\xf6\x03\
-\x2e\x00\xf2\x04\x9e\x04\x26\x02\xd9\x22\x0c\x04\x07\x02\xd4\xff\
-\xf6\x01\x7e\xff\xff\x00\x00\x03\x1c\x00\xd7\x04\x63\x04\x26\x02\
-\xd3\x00\x04\x04\x07\x02\xd9\x00\x00\x00\xa6\xff\xff\x00\x00\x03\
-\x4c\x00\xd6\x04\x3b\x04\x26\x02\xd9\x00\x2a\x04\x07\x02\xd6\x00\
-\x00\x00\xd4\xff\xff\x00\x00\x03\x34\x00\xcb\x04\xa4\x04\x26\x02\
-\xd9\xfe\x12\x04\x07\x02\xd7\x00\x05\x01\xc1\xff\xff\x00\x02\x03\
-\x3c\x00\xd8\x04\x33\x04\x26\x02\xd6\x02\x1c\x04\x06\x02\xd9\x01\
-\x76\x00\x00\xff\xff\x00\x00\x03\x2c\x00\xcb\x04\x79\x04\x26\x02\
-\xd9\xfe\x0a\x04\x07\x02\xc8\x00\x4e\x00\x99\x00\x02\x00\x00\x02\
-\xfd\x00\x9c\x03\x9f\x00\x0b\x00\x17\x00\x00\x12\x26\x35\x34\x36\
-\x33\x32\x16\x15\x14\x06\x23\x26\x16\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\x2b\x2b\x2e\x20\x23\x2b\x2e\x20\x25\x13\x14\x11\x13\
-\x14\x12\x11\x14\x02\xfd\x2a\x25\x25\x2e\x30\x22\x26\x2a\x40\x13\
-\x12\x0f\x11\x17\x16\x11\x00\x00\x01\x00\x00\x03\x14\x01\x14\x03\
-\xa7\x00\x16\x00\x00\x12\x17\x16\x33\x32\x36\x37\x17\x06\x06\x23\
-\x22\x27\x26\x26\x23\x22\x06\x07\x27\x36\x36\x33\x64\x1f\x26\x14\
-\x12\x16\x09\x26\x0c\x26\x1e\x15\x24\x04\x23\x10\x10\x16\x08\x26\
-\x0b\x26\x20\x03\x7b\x09\x0a\x1f\x20\x0a\x34\x30\x0a\x01\x08\x1b\
-\x1d\x0c\x30\x2b\x00\x00\x00\x00\x01\xff\xfc\x03\x20\x00\x90\x03\
-\xab\x00\x14\x00\x00\x12\x26\x35\x34\x37\x17\x06\x15\x16\x16\x33\
-\x32\x35\x36\x27\x37\x16\x15\x14\x06\x23\x22\x26\x0e\x20\x0a\x01\
-\x13\x19\x1f\x02\x11\x24\x0f\x28\x20\x03\x20\x25\x23\x1c\x1d\x08\
-\x1a\x13\x0f\x0d\x0c\x19\x29\x0d\x29\x1a\x24\x24\x00\x00\x00\x00\
-\x02\x00\x00\x02\x2e\x00\xbe\x02\xfc\x00\x0e\x00\x19\x00\x00\x10\
-\x37\x17\x06\x06\x07\x16\x16\x15\x14\x06\x23\x22\x26\x35\x16\x16\
-\x33\x32\x36\x35\x34\x26\x27\x06\x15\xb2\x0c\x2b\x28\x11\x16\x1d\
-\x2a\x1b\x21\x27\x28\x11\x0e\x0d\x11\x19\x16\x0e\x02\xc7\x35\x26\
-\x0d\x10\x0a\x06\x20\x17\x20\x24\x29\x1b\x0c\x12\x10\x0e\x0e\x13\
-\x01\x0f\x13\x00\x01\x00\x00\x03\x04\x00\xd3\x03\xd4\x00\x06\x00\
-\x00\x13\x17\x37\x17\x07\x07\x27\x2d\x42\x38\x2c\x48\x35\x56\x03\
-\xd4\x92\x8d\x0c\xb2\x0d\xba\x00\x01\x00\x00\x02\xfe\x00\xd3\x03\
-\xcd\x00\x06\x00\x00\x13\x27\x07\x27\x37\x37\x17\xa6\x42\x38\x2c\
-\x48\x35\x56\x02\xfe\x91\x8d\x0d\xb2\x0c\xb9\x00\x02\x00\x00\x02\
-\x91\x00\x98\x03\x5f\x00\x08\x00\x14\x00\x00\x12\x23\x22\x15\x14\
-\x16\x33\x32\x35\x26\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\
-\x6f\x23\x23\x13\x10\x23\x6f\x2d\x1f\x23\x29\x2a\x22\x21\x2b\x03\
-\x2b\x35\x17\x1a\x31\x2e\x3b\x39\x2f\x2e\x38\x34\x30\x00\x00\x00\
-\x01\x00\x00\x03\x18\x01\xce\x03\x9b\x00\x19\x00\x00\x12\x36\x33\
-\x32\x16\x17\x16\x16\x33\x32\x36\x37\x17\x06\x06\x23\x22\x26\x27\
-\x26\x26\x23\x22\x06\x07\x27\x17\x3f\x2a\x1a\x2b\x1b\x1e\x2e\x1e\
-\x26\x2b\x11\x22\x10\x40\x37\x1e\x2e\x21\x1a\x29\x18\x1d\x28\x13\
-\x27\x03\x5c\x28\x09\x08\x09\x09\x18\x22\x0d\x33\x35\x09\x0a\x08\
-\x09\x18\x1a\x17\x00\x00\x00\x00\x01\x00\x00\xff\x91\x00\xcf\xff\
-\xcf\x00\x03\x00\x00\x17\x07\x27\x37\xcf\xca\x05\xca\x59\x16\x27\
-\x17\x00\x00\xff\xff\x00\x00\x03\x18\x00\xd7\x03\xb2\x04\x02\x02\
-\xd3\x00\x00\xff\xff\x00\x00\x02\x51\x00\xfc\x03\x20\x04\x02\x02\
-\xd4\x00\x00\xff\xff\x00\x00\xff\xf8\x00\xd7\x00\x92\x04\x02\x02\
-\xd5\x00\x00\xff\xff\x00\x00\x03\x20\x00\xd6\x03\x67\x04\x02\x02\
-\xd6\x00\x00\xff\xff\x00\x02\x02\x15\x00\xc0\x02\xe3\x04\x02\x02\
-\xd7\x00\x00\xff\xff\x00\x02\x03\x22\x00\xcd\x03\xbd\x04\x02\x02\
-\xd9\x00\x00\xff\xff\x00\x00\x02\xfd\x00\x9c\x03\x9f\x04\x02\x02\
-\xe1\x00\x00\x00\x00\x00\x34\x02\x76\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x30\x00\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x14\x00\
-\x30\x00\x01\x00\x00\x00\x00\x00\x02\x00\x02\x00\x44\x00\x01\x00\
-\x00\x00\x00\x00\x03\x00\x1f\x00\x46\x00\x01\x00\x00\x00\x00\x00\
-\x04\x00\x17\x00\x65\x00\x01\x00\x00\x00\x00\x00\x05\x00\x0c\x00\
-\x7c\x00\x01\x00\x00\x00\x00\x00\x06\x00\x14\x00\x88\x00\x01\x00\
-\x00\x00\x00\x00\x07\x00\x40\x00\x9c\x00\x01\x00\x00\x00\x00\x00\
-\x08\x00\x18\x00\xdc\x00\x01\x00\x00\x00\x00\x00\x09\x00\x18\x00\
-\xf4\x00\x01\x00\x00\x00\x00\x00\x0a\x00\x3d\x01\x0c\x00\x01\x00\
-\x00\x00\x00\x00\x0b\x00\x13\x01\x49\x00\x01\x00\x00\x00\x00\x00\
-\x0c\x00\x13\x01\x5c\x00\x01\x00\x00\x00\x00\x00\x0d\x00\x66\x01\
-\x6f\x00\x01\x00\x19\x00\x21\x00\x00\x00\x30\x01\xd5\x00\x01\x00\
-\x19\x00\x21\x00\x01\x00\x14\x02\x05\x00\x01\x00\x19\x00\x21\x00\
-\x02\x00\x02\x02\x19\x00\x01\x00\x19\x00\x21\x00\x03\x00\x1f\x02\
-\x1b\x00\x01\x00\x19\x00\x21\x00\x04\x00\x17\x02\x3a\x00\x01\x00\
-\x19\x00\x21\x00\x08\x00\x18\x02\x51\x00\x01\x00\x19\x00\x21\x00\
-\x09\x00\x18\x02\x69\x00\x01\x00\x19\x00\x21\x00\x0a\x00\x3d\x02\
-\x81\x00\x01\x00\x19\x00\x21\x00\x0b\x00\x13\x02\xbe\x00\x01\x00\
-\x19\x00\x21\x00\x0c\x00\x13\x02\xd1\x00\x01\x00\x19\x00\x21\x00\
-\x0d\x00\x66\x02\xe4\x00\x03\x00\x01\x04\x09\x00\x00\x00\x50\x03\
-\x4a\x00\x03\x00\x01\x04\x09\x00\x01\x00\x2e\x03\x9a\x00\x03\x00\
-\x01\x04\x09\x00\x02\x00\x0e\x03\xc8\x00\x03\x00\x01\x04\x09\x00\
-\x03\x00\x3e\x03\xd6\x00\x03\x00\x01\x04\x09\x00\x04\x00\x2e\x04\
-\x14\x00\x03\x00\x01\x04\x09\x00\x05\x00\x18\x04\x42\x00\x03\x00\
-\x01\x04\x09\x00\x06\x00\x28\x04\x5a\x00\x03\x00\x01\x04\x09\x00\
-\x07\x00\x68\x04\x82\x00\x03\x00\x01\x04\x09\x00\x08\x00\x18\x04\
-\xea\x00\x03\x00\x01\x04\x09\x00\x09\x00\x18\x05\x02\x00\x03\x00\
-\x01\x04\x09\x00\x0a\x00\x7a\x05\x1a\x00\x03\x00\x01\x04\x09\x00\
-\x0b\x00\x26\x05\x94\x00\x03\x00\x01\x04\x09\x00\x0c\x00\x26\x05\
-\xba\x00\x03\x00\x01\x04\x09\x00\x0d\x00\xcc\x05\xe0\x00\x03\x00\
-\x01\x04\x09\x00\x10\x00\x28\x06\xac\x00\x03\x00\x01\x04\x09\x00\
-\x11\x00\x04\x06\xd4\x00\x03\x00\x01\x08\x04\x00\x00\x00\x50\x06\
-\xd8\x00\x03\x00\x01\x08\x04\x00\x01\x00\x2e\x07\x28\x00\x03\x00\
-\x01\x08\x04\x00\x02\x00\x0e\x07\x56\x00\x03\x00\x01\x08\x04\x00\
-\x08\x00\x18\x07\x64\x00\x03\x00\x01\x08\x04\x00\x09\x00\x18\x07\
-\x7c\x00\x03\x00\x01\x08\x04\x00\x0a\x00\x7a\x07\x94\x00\x03\x00\
-\x01\x08\x04\x00\x0b\x00\x26\x08\x0e\x00\x03\x00\x01\x08\x04\x00\
-\x0c\x00\x26\x08\x34\x00\x03\x00\x01\x08\x04\x00\x0d\x00\xcc\x08\
-\x5a\x00\x03\x00\x01\x08\x04\x00\x10\x00\x28\x09\x26\x00\x03\x00\
-\x01\x08\x04\x00\x11\x00\x04\x09\x4e\x43\x6f\x70\x79\x72\x69\x67\
-\x68\x74\x28\x63\x29\xc8\xd9\xd2\xab\xd6\xd5\xb6\xcb\xd3\xd0\xcf\
-\xde\xb9\xab\xcb\xbe\x48\x6f\x6e\x6f\x72\x20\x44\x65\x76\x69\x63\
-\x65\x20\x43\x6f\x2e\x2c\x4c\x74\x64\x48\x4f\x4e\x4f\x52\x20\x53\
-\x61\x6e\x73\x20\x41\x72\x61\x62\x69\x63\x20\x55\x49\x44\x42\x46\
-\x6f\x75\x6e\x64\x65\x72\x3a\x48\x4f\x4e\x4f\x52\x20\x53\x61\x6e\
-\x73\x20\x41\x72\x61\x62\x69\x63\x20\x55\x49\x5f\x44\x42\x48\x4f\
-\x4e\x4f\x52\x20\x53\x61\x6e\x73\x20\x41\x72\x61\x62\x69\x63\x20\
-\x55\x49\x20\x44\x42\x56\x65\x72\x73\x69\x6f\x6e\x20\x31\x2e\x30\
-\x34\x48\x4f\x4e\x4f\x52\x53\x61\x6e\x73\x41\x72\x61\x62\x69\x63\
-\x55\x49\x2d\x44\x42\x42\x79\x20\x42\x65\x69\x6a\x69\x6e\x67\x20\
-\x46\x6f\x75\x6e\x64\x65\x72\x20\x45\x6c\x65\x63\x74\x72\x6f\x6e\
-\x69\x63\x73\x20\x43\x6f\x2e\x2c\x4c\x74\x64\x2e\x20\xb1\xb1\xbe\
-\xa9\xb1\xb1\xb4\xf3\xb7\xbd\xd5\xfd\xb5\xe7\xd7\xd3\xd3\xd0\xcf\
-\xde\xb9\xab\xcb\xbe\xb1\xb1\xbe\xa9\xb1\xb1\xb4\xf3\xb7\xbd\xd5\
-\xfd\xb5\xe7\xd7\xd3\xd3\xd0\xcf\xde\xb9\xab\xcb\xbe\xb1\xb1\xbe\
-\xa9\xb1\xb1\xb4\xf3\xb7\xbd\xd5\xfd\xb5\xe7\xd7\xd3\xd3\xd0\xcf\
-\xde\xb9\xab\xcb\xbe\x46\x6f\x72\x20\x66\x75\x72\x74\x68\x65\x72\
-\x20\x64\x65\x74\x61\x69\x6c\x73\x20\x70\x6c\x65\x61\x73\x65\x20\
-\x67\x6f\x20\x74\x6f\x3a\x20\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\
-\x77\x2e\x66\x6f\x75\x6e\x64\x65\x72\x74\x79\x70\x65\x2e\x63\x6f\
-\x6d\x2f\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\x65\x72\x74\x79\x70\
-\x65\x2e\x63\x6f\x6d\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\x65\x72\
-\x74\x79\x70\x65\x2e\x63\x6f\x6d\x46\x6f\x72\x20\x66\x75\x72\x74\
-\x68\x65\x72\x20\x64\x65\x74\x61\x69\x6c\x73\x20\x70\x6c\x65\x61\
-\x73\x65\x20\x67\x6f\x20\x74\x6f\x3a\x20\x68\x74\x74\x70\x3a\x2f\
-\x2f\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\x65\x72\x74\x79\x70\x65\
-\x2e\x63\x6f\x6d\x2f\x69\x6e\x64\x65\x78\x2e\x70\x68\x70\x2f\x41\
-\x62\x6f\x75\x74\x2f\x62\x6f\x6f\x6b\x41\x75\x74\x68\x2f\x6b\x65\
-\x79\x2f\x6d\x79\x5f\x67\x72\x66\x73\x2e\x68\x74\x6d\x6c\x43\x6f\
-\x70\x79\x72\x69\x67\x68\x74\x28\x63\x29\xc8\xd9\xd2\xab\xd6\xd5\
-\xb6\xcb\xd3\xd0\xcf\xde\xb9\xab\xcb\xbe\x48\x6f\x6e\x6f\x72\x20\
-\x44\x65\x76\x69\x63\x65\x20\x43\x6f\x2e\x2c\x4c\x74\x64\x48\x4f\
-\x4e\x4f\x52\x20\x53\x61\x6e\x73\x20\x41\x72\x61\x62\x69\x63\x20\
-\x55\x49\x44\x42\x46\x6f\x75\x6e\x64\x65\x72\x3a\x48\x4f\x4e\x4f\
-\x52\x20\x53\x61\x6e\x73\x20\x41\x72\x61\x62\x69\x63\x20\x55\x49\
-\x5f\x44\x42\x48\x4f\x4e\x4f\x52\x20\x53\x61\x6e\x73\x20\x41\x72\
-\x61\x62\x69\x63\x20\x55\x49\x20\x44\x42\xb1\xb1\xbe\xa9\xb1\xb1\
-\xb4\xf3\xb7\xbd\xd5\xfd\xb5\xe7\xd7\xd3\xd3\xd0\xcf\xde\xb9\xab\
-\xcb\xbe\xb1\xb1\xbe\xa9\xb1\xb1\xb4\xf3\xb7\xbd\xd5\xfd\xb5\xe7\
-\xd7\xd3\xd3\xd0\xcf\xde\xb9\xab\xcb\xbe\x46\x6f\x72\x20\x66\x75\
-\x72\x74\x68\x65\x72\x20\x64\x65\x74\x61\x69\x6c\x73\x20\x70\x6c\
-\x65\x61\x73\x65\x20\x67\x6f\x20\x74\x6f\x3a\x20\x68\x74\x74\x70\
-\x3a\x2f\x2f\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\x65\x72\x74\x79\
-\x70\x65\x2e\x63\x6f\x6d\x2f\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\
-\x65\x72\x74\x79\x70\x65\x2e\x63\x6f\x6d\x77\x77\x77\x2e\x66\x6f\
-\x75\x6e\x64\x65\x72\x74\x79\x70\x65\x2e\x63\x6f\x6d\x46\x6f\x72\
-\x20\x66\x75\x72\x74\x68\x65\x72\x20\x64\x65\x74\x61\x69\x6c\x73\
-\x20\x70\x6c\x65\x61\x73\x65\x20\x67\x6f\x20\x74\x6f\x3a\x20\x68\
-\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\x2e\x66\x6f\x75\x6e\x64\x65\
-\x72\x74\x79\x70\x65\x2e\x63\x6f\x6d\x2f\x69\x6e\x64\x65\x78\x2e\
-\x70\x68\x70\x2f\x41\x62\x6f\x75\x74\x2f\x62\x6f\x6f\x6b\x41\x75\
-\x74\x68\x2f\x6b\x65\x79\x2f\x6d\x79\x5f\x67\x72\x66\x73\x2e\x68\
-\x74\x6d\x6c\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\x00\x69\x00\
-\x67\x00\x68\x00\x74\x00\x28\x00\x63\x00\x29\x83\x63\x80\x00\x7e\
-\xc8\x7a\xef\x67\x09\x96\x50\x51\x6c\x53\xf8\x00\x48\x00\x6f\x00\
-\x6e\x00\x6f\x00\x72\x00\x20\x00\x44\x00\x65\x00\x76\x00\x69\x00\
-\x63\x00\x65\x00\x20\x00\x43\x00\x6f\x00\x2e\x00\x2c\x00\x4c\x00\
-\x74\x00\x64\x00\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\x20\x00\
-\x53\x00\x61\x00\x6e\x00\x73\x00\x20\x00\x41\x00\x72\x00\x61\x00\
-\x62\x00\x69\x00\x63\x00\x20\x00\x55\x00\x49\x00\x20\x00\x44\x00\
-\x42\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x00\
-\x46\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x3a\x00\
-\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\x20\x00\x53\x00\x61\x00\
-\x6e\x00\x73\x00\x20\x00\x41\x00\x72\x00\x61\x00\x62\x00\x69\x00\
-\x63\x00\x20\x00\x55\x00\x49\x00\x5f\x00\x44\x00\x42\x00\x48\x00\
-\x4f\x00\x4e\x00\x4f\x00\x52\x00\x20\x00\x53\x00\x61\x00\x6e\x00\
-\x73\x00\x20\x00\x41\x00\x72\x00\x61\x00\x62\x00\x69\x00\x63\x00\
-\x20\x00\x55\x00\x49\x00\x20\x00\x44\x00\x42\x00\x56\x00\x65\x00\
-\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\x31\x00\x2e\x00\
-\x30\x00\x34\x00\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\x53\x00\
-\x61\x00\x6e\x00\x73\x00\x41\x00\x72\x00\x61\x00\x62\x00\x69\x00\
-\x63\x00\x55\x00\x49\x00\x2d\x00\x44\x00\x42\x00\x42\x00\x79\x00\
-\x20\x00\x42\x00\x65\x00\x69\x00\x6a\x00\x69\x00\x6e\x00\x67\x00\
-\x20\x00\x46\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\
-\x20\x00\x45\x00\x6c\x00\x65\x00\x63\x00\x74\x00\x72\x00\x6f\x00\
-\x6e\x00\x69\x00\x63\x00\x73\x00\x20\x00\x43\x00\x6f\x00\x2e\x00\
-\x2c\x00\x4c\x00\x74\x00\x64\x00\x2e\x00\x20\x53\x17\x4e\xac\x53\
-\x17\x59\x27\x65\xb9\x6b\x63\x75\x35\x5b\x50\x67\x09\x96\x50\x51\
-\x6c\x53\xf8\x53\x17\x4e\xac\x53\x17\x59\x27\x65\xb9\x6b\x63\x75\
-\x35\x5b\x50\x67\x09\x96\x50\x51\x6c\x53\xf8\x53\x17\x4e\xac\x53\
-\x17\x59\x27\x65\xb9\x6b\x63\x75\x35\x5b\x50\x67\x09\x96\x50\x51\
-\x6c\x53\xf8\x00\x46\x00\x6f\x00\x72\x00\x20\x00\x66\x00\x75\x00\
-\x72\x00\x74\x00\x68\x00\x65\x00\x72\x00\x20\x00\x64\x00\x65\x00\
-\x74\x00\x61\x00\x69\x00\x6c\x00\x73\x00\x20\x00\x70\x00\x6c\x00\
-\x65\x00\x61\x00\x73\x00\x65\x00\x20\x00\x67\x00\x6f\x00\x20\x00\
-\x74\x00\x6f\x00\x3a\x00\x20\x00\x68\x00\x74\x00\x74\x00\x70\x00\
-\x3a\x00\x2f\x00\x2f\x00\x77\x00\x77\x00\x77\x00\x2e\x00\x66\x00\
-\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x74\x00\x79\x00\
-\x70\x00\x65\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x2f\x00\x77\x00\
-\x77\x00\x77\x00\x2e\x00\x66\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\
-\x65\x00\x72\x00\x74\x00\x79\x00\x70\x00\x65\x00\x2e\x00\x63\x00\
-\x6f\x00\x6d\x00\x77\x00\x77\x00\x77\x00\x2e\x00\x66\x00\x6f\x00\
-\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x74\x00\x79\x00\x70\x00\
-\x65\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x46\x00\x6f\x00\x72\x00\
-\x20\x00\x66\x00\x75\x00\x72\x00\x74\x00\x68\x00\x65\x00\x72\x00\
-\x20\x00\x64\x00\x65\x00\x74\x00\x61\x00\x69\x00\x6c\x00\x73\x00\
-\x20\x00\x70\x00\x6c\x00\x65\x00\x61\x00\x73\x00\x65\x00\x20\x00\
-\x67\x00\x6f\x00\x20\x00\x74\x00\x6f\x00\x3a\x00\x20\x00\x68\x00\
-\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x77\x00\x77\x00\
-\x77\x00\x2e\x00\x66\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\
-\x72\x00\x74\x00\x79\x00\x70\x00\x65\x00\x2e\x00\x63\x00\x6f\x00\
-\x6d\x00\x2f\x00\x69\x00\x6e\x00\x64\x00\x65\x00\x78\x00\x2e\x00\
-\x70\x00\x68\x00\x70\x00\x2f\x00\x41\x00\x62\x00\x6f\x00\x75\x00\
-\x74\x00\x2f\x00\x62\x00\x6f\x00\x6f\x00\x6b\x00\x41\x00\x75\x00\
-\x74\x00\x68\x00\x2f\x00\x6b\x00\x65\x00\x79\x00\x2f\x00\x6d\x00\
-\x79\x00\x5f\x00\x67\x00\x72\x00\x66\x00\x73\x00\x2e\x00\x68\x00\
-\x74\x00\x6d\x00\x6c\x00\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\
-\x20\x00\x53\x00\x61\x00\x6e\x00\x73\x00\x20\x00\x41\x00\x72\x00\
-\x61\x00\x62\x00\x69\x00\x63\x00\x20\x00\x55\x00\x49\x00\x44\x00\
-\x42\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\x00\x69\x00\x67\x00\
-\x68\x00\x74\x00\x28\x00\x63\x00\x29\x83\x63\x80\x00\x7e\xc8\x7a\
-\xef\x67\x09\x96\x50\x51\x6c\x53\xf8\x00\x48\x00\x6f\x00\x6e\x00\
-\x6f\x00\x72\x00\x20\x00\x44\x00\x65\x00\x76\x00\x69\x00\x63\x00\
-\x65\x00\x20\x00\x43\x00\x6f\x00\x2e\x00\x2c\x00\x4c\x00\x74\x00\
-\x64\x00\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\x20\x00\x53\x00\
-\x61\x00\x6e\x00\x73\x00\x20\x00\x41\x00\x72\x00\x61\x00\x62\x00\
-\x69\x00\x63\x00\x20\x00\x55\x00\x49\x00\x20\x00\x44\x00\x42\x00\
-\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x53\x17\x4e\
-\xac\x53\x17\x59\x27\x65\xb9\x6b\x63\x75\x35\x5b\x50\x67\x09\x96\
-\x50\x51\x6c\x53\xf8\x53\x17\x4e\xac\x53\x17\x59\x27\x65\xb9\x6b\
-\x63\x75\x35\x5b\x50\x67\x09\x96\x50\x51\x6c\x53\xf8\x00\x46\x00\
-\x6f\x00\x72\x00\x20\x00\x66\x00\x75\x00\x72\x00\x74\x00\x68\x00\
-\x65\x00\x72\x00\x20\x00\x64\x00\x65\x00\x74\x00\x61\x00\x69\x00\
-\x6c\x00\x73\x00\x20\x00\x70\x00\x6c\x00\x65\x00\x61\x00\x73\x00\
-\x65\x00\x20\x00\x67\x00\x6f\x00\x20\x00\x74\x00\x6f\x00\x3a\x00\
-\x20\x00\x68\x00\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\
-\x77\x00\x77\x00\x77\x00\x2e\x00\x66\x00\x6f\x00\x75\x00\x6e\x00\
-\x64\x00\x65\x00\x72\x00\x74\x00\x79\x00\x70\x00\x65\x00\x2e\x00\
-\x63\x00\x6f\x00\x6d\x00\x2f\x00\x77\x00\x77\x00\x77\x00\x2e\x00\
-\x66\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x74\x00\
-\x79\x00\x70\x00\x65\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x77\x00\
-\x77\x00\x77\x00\x2e\x00\x66\x00\x6f\x00\x75\x00\x6e\x00\x64\x00\
-\x65\x00\x72\x00\x74\x00\x79\x00\x70\x00\x65\x00\x2e\x00\x63\x00\
-\x6f\x00\x6d\x00\x46\x00\x6f\x00\x72\x00\x20\x00\x66\x00\x75\x00\
-\x72\x00\x74\x00\x68\x00\x65\x00\x72\x00\x20\x00\x64\x00\x65\x00\
-\x74\x00\x61\x00\x69\x00\x6c\x00\x73\x00\x20\x00\x70\x00\x6c\x00\
-\x65\x00\x61\x00\x73\x00\x65\x00\x20\x00\x67\x00\x6f\x00\x20\x00\
-\x74\x00\x6f\x00\x3a\x00\x20\x00\x68\x00\x74\x00\x74\x00\x70\x00\
-\x3a\x00\x2f\x00\x2f\x00\x77\x00\x77\x00\x77\x00\x2e\x00\x66\x00\
-\x6f\x00\x75\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x74\x00\x79\x00\
-\x70\x00\x65\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x2f\x00\x69\x00\
-\x6e\x00\x64\x00\x65\x00\x78\x00\x2e\x00\x70\x00\x68\x00\x70\x00\
-\x2f\x00\x41\x00\x62\x00\x6f\x00\x75\x00\x74\x00\x2f\x00\x62\x00\
-\x6f\x00\x6f\x00\x6b\x00\x41\x00\x75\x00\x74\x00\x68\x00\x2f\x00\
-\x6b\x00\x65\x00\x79\x00\x2f\x00\x6d\x00\x79\x00\x5f\x00\x67\x00\
-\x72\x00\x66\x00\x73\x00\x2e\x00\x68\x00\x74\x00\x6d\x00\x6c\x00\
-\x48\x00\x4f\x00\x4e\x00\x4f\x00\x52\x00\x20\x00\x53\x00\x61\x00\
-\x6e\x00\x73\x00\x20\x00\x41\x00\x72\x00\x61\x00\x62\x00\x69\x00\
-\x63\x00\x20\x00\x55\x00\x49\x00\x44\x00\x42\x00\x02\x00\x00\x00\
-\x00\x00\x00\xff\x9c\x00\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\xf2\x00\x00\x00\
-\x03\x01\x02\x01\x03\x01\x04\x01\x05\x01\x06\x01\x07\x01\x08\x01\
-\x09\x01\x0a\x01\x0b\x01\x0c\x01\x0d\x01\x0e\x01\x0f\x01\x10\x01\
-\x11\x01\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\
-\x19\x01\x1a\x01\x1b\x01\x1c\x01\x1d\x01\x1e\x01\x1f\x01\x20\x01\
-\x21\x01\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\
-\x29\x01\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x01\
-\x31\x01\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\
-\x39\x01\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x01\x40\x01\
-\x41\x01\x42\x01\x43\x01\x44\x01\x45\x01\x46\x01\x47\x01\x48\x01\
-\x49\x01\x4a\x01\x4b\x01\x4c\x01\x4d\x01\x4e\x01\x4f\x01\x50\x01\
-\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\x57\x01\x58\x01\
-\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x01\x5f\x01\x60\x01\
-\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\x67\x01\x68\x01\
-\x69\x01\x6a\x01\x6b\x01\x6c\x01\x6d\x01\x6e\x01\x6f\x01\x70\x01\
-\x71\x01\x72\x01\x73\x01\x74\x01\x75\x01\x76\x01\x77\x01\x78\x01\
-\x79\x01\x7a\x01\x7b\x01\x7c\x01\x7d\x01\x7e\x01\x7f\x01\x80\x01\
-\x81\x01\x82\x01\x83\x01\x84\x01\x85\x01\x86\x01\x87\x01\x88\x01\
-\x89\x01\x8a\x01\x8b\x01\x8c\x01\x8d\x01\x8e\x01\x8f\x01\x90\x01\
-\x91\x01\x92\x01\x93\x01\x94\x01\x95\x01\x96\x01\x97\x01\x98\x01\
-\x99\x01\x9a\x01\x9b\x01\x9c\x01\x9d\x01\x9e\x01\x9f\x01\xa0\x01\
-\xa1\x01\xa2\x01\xa3\x01\xa4\x01\xa5\x01\xa6\x01\xa7\x01\xa8\x01\
-\xa9\x01\xaa\x01\xab\x01\xac\x01\xad\x01\xae\x01\xaf\x01\xb0\x01\
-\xb1\x01\xb2\x01\xb3\x01\xb4\x01\xb5\x01\xb6\x01\xb7\x01\xb8\x01\
-\xb9\x01\xba\x01\xbb\x01\xbc\x01\xbd\x01\xbe\x01\xbf\x01\xc0\x01\
-\xc1\x01\xc2\x01\xc3\x01\xc4\x01\xc5\x01\xc6\x01\xc7\x01\xc8\x01\
-\xc9\x01\xca\x01\xcb\x01\xcc\x01\xcd\x01\xce\x01\xcf\x01\xd0\x01\
-\xd1\x01\xd2\x01\xd3\x01\xd4\x01\xd5\x01\xd6\x01\xd7\x01\xd8\x01\
-\xd9\x01\xda\x01\xdb\x01\xdc\x01\xdd\x01\xde\x01\xdf\x01\xe0\x01\
-\xe1\x01\xe2\x01\xe3\x01\xe4\x01\xe5\x01\xe6\x01\xe7\x01\xe8\x01\
-\xe9\x01\xea\x01\xeb\x01\xec\x01\xed\x01\xee\x01\xef\x01\xf0\x01\
-\xf1\x01\xf2\x01\xf3\x01\xf4\x01\xf5\x01\xf6\x01\xf7\x01\xf8\x01\
-\xf9\x01\xfa\x01\xfb\x01\xfc\x01\xfd\x01\xfe\x01\xff\x02\x00\x02\
-\x01\x02\x02\x02\x03\x02\x04\x02\x05\x02\x06\x02\x07\x02\x08\x02\
-\x09\x02\x0a\x02\x0b\x02\x0c\x02\x0d\x02\x0e\x02\x0f\x02\x10\x02\
-\x11\x02\x12\x02\x13\x02\x14\x02\x15\x02\x16\x02\x17\x02\x18\x02\
-\x19\x02\x1a\x02\x1b\x02\x1c\x02\x1d\x02\x1e\x02\x1f\x02\x20\x02\
-\x21\x02\x22\x02\x23\x02\x24\x02\x25\x02\x26\x02\x27\x02\x28\x02\
-\x29\x02\x2a\x02\x2b\x02\x2c\x02\x2d\x02\x2e\x02\x2f\x02\x30\x02\
-\x31\x02\x32\x02\x33\x02\x34\x02\x35\x02\x36\x02\x37\x02\x38\x02\
-\x39\x02\x3a\x02\x3b\x02\x3c\x02\x3d\x02\x3e\x02\x3f\x02\x40\x02\
-\x41\x02\x42\x02\x43\x02\x44\x02\x45\x02\x46\x02\x47\x02\x48\x02\
-\x49\x02\x4a\x02\x4b\x02\x4c\x02\x4d\x02\x4e\x02\x4f\x02\x50\x02\
-\x51\x02\x52\x02\x53\x02\x54\x02\x55\x02\x56\x02\x57\x02\x58\x02\
-\x59\x02\x5a\x02\x5b\x02\x5c\x02\x5d\x02\x5e\x02\x5f\x02\x60\x02\
-\x61\x02\x62\x02\x63\x02\x64\x02\x65\x02\x66\x02\x67\x02\x68\x02\
-\x69\x02\x6a\x02\x6b\x02\x6c\x02\x6d\x02\x6e\x02\x6f\x02\x70\x02\
-\x71\x02\x72\x02\x73\x02\x74\x02\x75\x02\x76\x02\x77\x02\x78\x02\
-\x79\x02\x7a\x02\x7b\x02\x7c\x02\x7d\x02\x7e\x02\x7f\x02\x80\x02\
-\x81\x02\x82\x02\x83\x02\x84\x02\x85\x02\x86\x02\x87\x02\x88\x02\
-\x89\x02\x8a\x02\x8b\x02\x8c\x02\x8d\x02\x8e\x02\x8f\x02\x90\x02\
-\x91\x02\x92\x02\x93\x02\x94\x02\x95\x02\x96\x02\x97\x02\x98\x02\
-\x99\x02\x9a\x02\x9b\x02\x9c\x02\x9d\x02\x9e\x02\x9f\x02\xa0\x02\
-\xa1\x02\xa2\x02\xa3\x02\xa4\x02\xa5\x02\xa6\x02\xa7\x02\xa8\x02\
-\xa9\x02\xaa\x02\xab\x02\xac\x02\xad\x02\xae\x02\xaf\x02\xb0\x02\
-\xb1\x02\xb2\x02\xb3\x02\xb4\x02\xb5\x02\xb6\x02\xb7\x02\xb8\x02\
-\xb9\x02\xba\x02\xbb\x02\xbc\x02\xbd\x02\xbe\x02\xbf\x02\xc0\x02\
-\xc1\x02\xc2\x02\xc3\x02\xc4\x02\xc5\x02\xc6\x02\xc7\x02\xc8\x02\
-\xc9\x02\xca\x02\xcb\x02\xcc\x02\xcd\x02\xce\x02\xcf\x02\xd0\x02\
-\xd1\x02\xd2\x02\xd3\x02\xd4\x02\xd5\x02\xd6\x02\xd7\x02\xd8\x02\
-\xd9\x02\xda\x02\xdb\x02\xdc\x02\xdd\x02\xde\x02\xdf\x02\xe0\x02\
-\xe1\x02\xe2\x02\xe3\x02\xe4\x02\xe5\x02\xe6\x02\xe7\x02\xe8\x02\
-\xe9\x02\xea\x02\xeb\x02\xec\x02\xed\x02\xee\x02\xef\x02\xf0\x02\
-\xf1\x02\xf2\x02\xf3\x02\xf4\x02\xf5\x02\xf6\x02\xf7\x02\xf8\x02\
-\xf9\x02\xfa\x02\xfb\x02\xfc\x02\xfd\x02\xfe\x02\xff\x03\x00\x03\
-\x01\x03\x02\x03\x03\x03\x04\x03\x05\x03\x06\x03\x07\x03\x08\x03\
-\x09\x03\x0a\x03\x0b\x03\x0c\x03\x0d\x03\x0e\x03\x0f\x03\x10\x03\
-\x11\x03\x12\x03\x13\x03\x14\x03\x15\x03\x16\x03\x17\x03\x18\x03\
-\x19\x03\x1a\x03\x1b\x03\x1c\x03\x1d\x03\x1e\x03\x1f\x03\x20\x03\
-\x21\x03\x22\x03\x23\x03\x24\x03\x25\x03\x26\x03\x27\x03\x28\x03\
-\x29\x03\x2a\x03\x2b\x03\x2c\x03\x2d\x03\x2e\x03\x2f\x03\x30\x03\
-\x31\x03\x32\x03\x33\x03\x34\x03\x35\x03\x36\x03\x37\x03\x38\x03\
-\x39\x03\x3a\x03\x3b\x03\x3c\x03\x3d\x03\x3e\x03\x3f\x03\x40\x03\
-\x41\x03\x42\x03\x43\x03\x44\x03\x45\x03\x46\x03\x47\x03\x48\x03\
-\x49\x03\x4a\x03\x4b\x03\x4c\x03\x4d\x03\x4e\x03\x4f\x03\x50\x03\
-\x51\x03\x52\x03\x53\x03\x54\x03\x55\x03\x56\x03\x57\x03\x58\x03\
-\x59\x03\x5a\x03\x5b\x03\x5c\x03\x5d\x03\x5e\x03\x5f\x03\x60\x03\
-\x61\x03\x62\x03\x63\x03\x64\x00\x13\x00\x14\x00\x15\x00\x16\x00\
-\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\x1c\x03\x65\x03\x66\x03\
-\x67\x03\x68\x03\x69\x03\x6a\x03\x6b\x03\x6c\x03\x6d\x03\x6e\x03\
-\x6f\x03\x70\x03\x71\x03\x72\x03\x73\x03\x74\x03\x75\x03\x76\x03\
-\x77\x03\x78\x03\x79\x03\x7a\x03\x7b\x03\x7c\x03\x7d\x03\x7e\x03\
-\x7f\x00\x11\x00\x0f\x00\x1d\x00\x04\x00\xc3\x03\x80\x00\x12\x00\
-\x3f\x03\x81\x03\x82\x03\x83\x03\x84\x00\x42\x00\x3e\x00\x40\x03\
-\x85\x03\x86\x03\x87\x03\x88\x03\x89\x03\x8a\x03\x8b\x03\x8c\x00\
-\x8b\x00\x8a\x00\x8c\x00\x83\x03\x8d\x03\x8e\x03\x8f\x00\xbd\x00\
-\x41\x00\xa5\x03\x90\x03\x91\x03\x92\x03\x93\x03\x94\x03\x95\x03\
-\x96\x03\x97\x03\x98\x03\x99\x03\x9a\x03\x9b\x03\x9c\x03\x9d\x03\
-\x9e\x03\x9f\x03\xa0\x03\xa1\x03\xa2\x03\xa3\x03\xa4\x03\xa5\x03\
-\xa6\x03\xa7\x03\xa8\x03\xa9\x03\xaa\x03\xab\x03\xac\x03\xad\x03\
-\xae\x03\xaf\x03\xb0\x03\xb1\x03\xb2\x03\xb3\x03\xb4\x03\xb5\x03\
-\xb6\x03\xb7\x03\xb8\x03\xb9\x03\xba\x03\xbb\x03\xbc\x03\xbd\x03\
-\xbe\x03\xbf\x03\xc0\x03\xc1\x03\xc2\x03\xc3\x03\xc4\x03\xc5\x03\
-\xc6\x03\xc7\x03\xc8\x03\xc9\x03\xca\x03\xcb\x03\xcc\x03\xcd\x03\
-\xce\x03\xcf\x03\xd0\x03\xd1\x03\xd2\x03\xd3\x03\xd4\x03\xd5\x03\
-\xd6\x07\x75\x6e\x69\x30\x36\x32\x31\x07\x75\x6e\x69\x30\x36\x37\
-\x34\x07\x75\x6e\x69\x46\x45\x38\x30\x07\x75\x6e\x69\x30\x36\x32\
-\x37\x07\x75\x6e\x69\x46\x45\x38\x44\x07\x75\x6e\x69\x46\x45\x38\
-\x45\x0d\x75\x6e\x69\x30\x36\x32\x37\x2e\x73\x68\x6f\x72\x74\x12\
-\x75\x6e\x69\x30\x36\x32\x37\x2e\x66\x69\x6e\x61\x2e\x73\x68\x6f\
-\x72\x74\x07\x75\x6e\x69\x30\x36\x32\x33\x07\x75\x6e\x69\x46\x45\
-\x38\x33\x07\x75\x6e\x69\x46\x45\x38\x34\x07\x75\x6e\x69\x30\x36\
-\x32\x35\x07\x75\x6e\x69\x46\x45\x38\x37\x07\x75\x6e\x69\x46\x45\
-\x38\x38\x07\x75\x6e\x69\x30\x36\x32\x32\x0c\x75\x6e\x69\x30\x36\
-\x32\x32\x2e\x75\x72\x64\x75\x07\x75\x6e\x69\x46\x45\x38\x31\x0c\
-\x75\x6e\x69\x46\x45\x38\x31\x2e\x75\x72\x64\x75\x07\x75\x6e\x69\
-\x46\x45\x38\x32\x0c\x75\x6e\x69\x46\x45\x38\x32\x2e\x75\x72\x64\
-\x75\x07\x75\x6e\x69\x30\x36\x37\x31\x07\x75\x6e\x69\x46\x42\x35\
-\x31\x07\x75\x6e\x69\x46\x44\x33\x44\x07\x75\x6e\x69\x46\x44\x33\
-\x43\x07\x75\x6e\x69\x30\x36\x36\x45\x0c\x75\x6e\x69\x30\x36\x36\
-\x45\x2e\x66\x69\x6e\x61\x0c\x75\x6e\x69\x30\x36\x36\x45\x2e\x6d\
-\x65\x64\x69\x0c\x75\x6e\x69\x30\x36\x36\x45\x2e\x69\x6e\x69\x74\
-\x07\x75\x6e\x69\x30\x36\x32\x38\x07\x75\x6e\x69\x46\x45\x38\x46\
-\x07\x75\x6e\x69\x46\x45\x39\x30\x07\x75\x6e\x69\x46\x45\x39\x32\
-\x07\x75\x6e\x69\x46\x45\x39\x31\x07\x75\x6e\x69\x30\x36\x37\x45\
-\x07\x75\x6e\x69\x46\x42\x35\x36\x07\x75\x6e\x69\x46\x42\x35\x37\
-\x07\x75\x6e\x69\x46\x42\x35\x39\x07\x75\x6e\x69\x46\x42\x35\x38\
-\x07\x75\x6e\x69\x30\x36\x37\x42\x07\x75\x6e\x69\x46\x42\x35\x32\
-\x07\x75\x6e\x69\x46\x42\x35\x33\x07\x75\x6e\x69\x46\x42\x35\x35\
-\x07\x75\x6e\x69\x46\x42\x35\x34\x07\x75\x6e\x69\x30\x36\x38\x30\
-\x0c\x75\x6e\x69\x30\x36\x38\x30\x2e\x69\x73\x6f\x6c\x0c\x75\x6e\
-\x69\x30\x36\x38\x30\x2e\x66\x69\x6e\x61\x0c\x75\x6e\x69\x30\x36\
-\x38\x30\x2e\x6d\x65\x64\x69\x0c\x75\x6e\x69\x30\x36\x38\x30\x2e\
-\x69\x6e\x69\x74\x07\x75\x6e\x69\x46\x42\x45\x39\x07\x75\x6e\x69\
-\x46\x42\x45\x38\x07\x75\x6e\x69\x30\x36\x32\x41\x07\x75\x6e\x69\
-\x46\x45\x39\x35\x07\x75\x6e\x69\x46\x45\x39\x36\x07\x75\x6e\x69\
-\x46\x45\x39\x38\x07\x75\x6e\x69\x46\x45\x39\x37\x07\x75\x6e\x69\
-\x30\x36\x37\x43\x0c\x75\x6e\x69\x30\x36\x37\x43\x2e\x66\x69\x6e\
-\x61\x0c\x75\x6e\x69\x30\x36\x37\x43\x2e\x6d\x65\x64\x69\x0c\x75\
-\x6e\x69\x30\x36\x37\x43\x2e\x69\x6e\x69\x74\x07\x75\x6e\x69\x30\
-\x36\x37\x44\x07\x75\x6e\x69\x30\x36\x32\x42\x07\x75\x6e\x69\x46\
-\x45\x39\x39\x07\x75\x6e\x69\x46\x45\x39\x41\x07\x75\x6e\x69\x46\
-\x45\x39\x43\x07\x75\x6e\x69\x46\x45\x39\x42\x07\x75\x6e\x69\x30\
-\x36\x37\x39\x07\x75\x6e\x69\x46\x42\x36\x36\x07\x75\x6e\x69\x46\
-\x42\x36\x37\x07\x75\x6e\x69\x46\x42\x36\x39\x07\x75\x6e\x69\x46\
-\x42\x36\x38\x07\x75\x6e\x69\x30\x36\x37\x41\x07\x75\x6e\x69\x46\
-\x42\x35\x45\x07\x75\x6e\x69\x46\x42\x35\x46\x07\x75\x6e\x69\x46\
-\x42\x36\x31\x07\x75\x6e\x69\x46\x42\x36\x30\x07\x75\x6e\x69\x30\
-\x36\x32\x43\x07\x75\x6e\x69\x46\x45\x39\x44\x07\x75\x6e\x69\x46\
-\x45\x39\x45\x07\x75\x6e\x69\x46\x45\x41\x30\x07\x75\x6e\x69\x46\
-\x45\x39\x46\x07\x75\x6e\x69\x30\x36\x38\x36\x07\x75\x6e\x69\x46\
-\x42\x37\x41\x07\x75\x6e\x69\x46\x42\x37\x42\x07\x75\x6e\x69\x46\
-\x42\x37\x44\x07\x75\x6e\x69\x46\x42\x37\x43\x07\x75\x6e\x69\x30\
-\x36\x38\x37\x0c\x75\x6e\x69\x30\x36\x38\x37\x2e\x69\x73\x6f\x6c\
-\x0c\x75\x6e\x69\x30\x36\x38\x37\x2e\x66\x69\x6e\x61\x0c\x75\x6e\
-\x69\x30\x36\x38\x37\x2e\x6d\x65\x64\x69\x0c\x75\x6e\x69\x30\x36\
-\x38\x37\x2e\x69\x6e\x69\x74\x07\x75\x6e\x69\x30\x36\x42\x46\x07\
-\x75\x6e\x69\x30\x36\x32\x44\x07\x75\x6e\x69\x46\x45\x41\x31\x07\
-\x75\x6e\x69\x46\x45\x41\x32\x07\x75\x6e\x69\x46\x45\x41\x34\x07\
-\x75\x6e\x69\x46\x45\x41\x33\x07\x75\x6e\x69\x30\x36\x38\x31\x07\
-\x75\x6e\x69\x30\x36\x38\x35\x07\x75\x6e\x69\x30\x36\x32\x45\x07\
-\x75\x6e\x69\x46\x45\x41\x35\x07\x75\x6e\x69\x46\x45\x41\x36\x07\
-\x75\x6e\x69\x46\x45\x41\x38\x07\x75\x6e\x69\x46\x45\x41\x37\x07\
-\x75\x6e\x69\x30\x36\x32\x46\x07\x75\x6e\x69\x46\x45\x41\x39\x07\
-\x75\x6e\x69\x46\x45\x41\x41\x07\x75\x6e\x69\x30\x36\x33\x30\x07\
-\x75\x6e\x69\x46\x45\x41\x42\x07\x75\x6e\x69\x46\x45\x41\x43\x07\
-\x75\x6e\x69\x30\x36\x38\x38\x07\x75\x6e\x69\x46\x42\x38\x38\x07\
-\x75\x6e\x69\x46\x42\x38\x39\x07\x75\x6e\x69\x30\x36\x38\x39\x07\
-\x75\x6e\x69\x30\x36\x33\x31\x0d\x75\x6e\x69\x30\x36\x33\x31\x2e\
-\x73\x68\x6f\x72\x74\x07\x75\x6e\x69\x46\x45\x41\x44\x07\x75\x6e\
-\x69\x46\x45\x41\x45\x0d\x75\x6e\x69\x46\x45\x41\x45\x2e\x73\x68\
-\x6f\x72\x74\x07\x75\x6e\x69\x30\x36\x33\x32\x07\x75\x6e\x69\x46\
-\x45\x41\x46\x07\x75\x6e\x69\x46\x45\x42\x30\x0d\x75\x6e\x69\x46\
-\x45\x42\x30\x2e\x73\x68\x6f\x72\x74\x0d\x75\x6e\x69\x30\x36\x33\
-\x32\x2e\x73\x68\x6f\x72\x74\x07\x75\x6e\x69\x30\x36\x39\x31\x0d\
-\x75\x6e\x69\x30\x36\x39\x31\x2e\x73\x68\x6f\x72\x74\x07\x75\x6e\
-\x69\x46\x42\x38\x43\x12\x75\x6e\x69\x30\x36\x39\x31\x2e\x69\x73\
-\x6f\x6c\x2e\x73\x68\x6f\x72\x74\x07\x75\x6e\x69\x46\x42\x38\x44\
-\x0d\x75\x6e\x69\x46\x42\x38\x44\x2e\x73\x68\x6f\x72\x74\x07\x75\
-\x6e\x69\x30\x36\x39\x33\x0d\x75\x6e\x69\x30\x36\x39\x33\x2e\x73\
-\x68\x6f\x72\x74\x07\x75\x6e\x69\x30\x36\x39\x36\x0d\x75\x6e\x69\
-\x30\x36\x39\x36\x2e\x73\x68\x6f\x72\x74\x07\x75\x6e\x69\x30\x36\
-\x39\x38\x0d\x75\x6e\x69\x30\x36\x39\x38\x2e\x73\x68\x6f\x72\x74\
-\x07\x75\x6e\x69\x46\x42\x38\x41\x07\x75\x6e\x69\x46\x42\x38\x42\
-\x0d\x75\x6e\x69\x46\x42\x38\x42\x2e\x73\x68\x6f\x72\x74\x07\x75\
-\x6e\x69\x30\x36\x33\x33\x07\x75\x6e\x69\x46\x45\x42\x31\x07\x75\
-\x6e\x69\x46\x45\x42\x32\x07\x75\x6e\x69\x46\x45\x42\x34\x07\x75\
-\x6e\x69\x46\x45\x42\x33\x07\x75\x6e\x69\x30\x36\x39\x41\x07\x75\
-\x6e\x69\x30\x36\x33\x34\x07\x75\x6e\x69\x46\x45\x42\x35\x07\x75\
-\x6e\x69\x46\x45\x42\x36\x07\x75\x6e\x69\x46\x45\x42\x38\x07\x75\
-\x6e\x69\x46\x45\x42\x37\x07\x75\x6e\x69\x30\x36\x39\x43\x07\x75\
-\x6e\x69\x30\x36\x33\x35\x07\x75\x6e\x69\x46\x45\x42\x39\x07\x75\
-\x6e\x69\x46\x45\x42\x41\x07\x75\x6e\x69\x46\x45\x42\x43\x07\x75\
-\x6e\x69\x46\x45\x42\x42\x07\x75\x6e\x69\x30\x36\x33\x36\x07\x75\
-\x6e\x69\x46\x45\x42\x44\x07\x75\x6e\x69\x46\x45\x42\x45\x07\x75\
-\x6e\x69\x46\x45\x43\x30\x07\x75\x6e\x69\x46\x45\x42\x46\x07\x75\
-\x6e\x69\x30\x36\x33\x37\x07\x75\x6e\x69\x46\x45\x43\x31\x07\x75\
-\x6e\x69\x46\x45\x43\x32\x07\x75\x6e\x69\x46\x45\x43\x34\x07\x75\
-\x6e\x69\x46\x45\x43\x33\x07\x75\x6e\x69\x30\x36\x33\x38\x07\x75\
-\x6e\x69\x46\x45\x43\x35\x07\x75\x6e\x69\x46\x45\x43\x36\x07\x75\
-\x6e\x69\x46\x45\x43\x38\x07\x75\x6e\x69\x46\x45\x43\x37\x07\x75\
-\x6e\x69\x30\x36\x33\x39\x07\x75\x6e\x69\x46\x45\x43\x39\x07\x75\
-\x6e\x69\x46\x45\x43\x41\x07\x75\x6e\x69\x46\x45\x43\x43\x07\x75\
-\x6e\x69\x46\x45\x43\x42\x07\x75\x6e\x69\x30\x36\x33\x41\x07\x75\
-\x6e\x69\x46\x45\x43\x44\x07\x75\x6e\x69\x46\x45\x43\x45\x07\x75\
-\x6e\x69\x46\x45\x44\x30\x07\x75\x6e\x69\x46\x45\x43\x46\x07\x75\
-\x6e\x69\x30\x36\x34\x31\x07\x75\x6e\x69\x46\x45\x44\x31\x07\x75\
-\x6e\x69\x46\x45\x44\x32\x07\x75\x6e\x69\x46\x45\x44\x34\x07\x75\
-\x6e\x69\x46\x45\x44\x33\x07\x75\x6e\x69\x30\x36\x41\x34\x07\x75\
-\x6e\x69\x46\x42\x36\x41\x07\x75\x6e\x69\x46\x42\x36\x42\x07\x75\
-\x6e\x69\x46\x42\x36\x44\x07\x75\x6e\x69\x46\x42\x36\x43\x07\x75\
-\x6e\x69\x30\x36\x41\x31\x0c\x75\x6e\x69\x30\x36\x41\x31\x2e\x66\
-\x69\x6e\x61\x0c\x75\x6e\x69\x30\x36\x41\x31\x2e\x6d\x65\x64\x69\
-\x0c\x75\x6e\x69\x30\x36\x41\x31\x2e\x69\x6e\x69\x74\x07\x75\x6e\
-\x69\x30\x36\x41\x32\x07\x75\x6e\x69\x30\x36\x41\x35\x07\x75\x6e\
-\x69\x30\x36\x36\x46\x0c\x75\x6e\x69\x30\x36\x36\x46\x2e\x66\x69\
-\x6e\x61\x07\x75\x6e\x69\x30\x36\x34\x32\x07\x75\x6e\x69\x46\x45\
-\x44\x35\x07\x75\x6e\x69\x46\x45\x44\x36\x07\x75\x6e\x69\x46\x45\
-\x44\x38\x07\x75\x6e\x69\x46\x45\x44\x37\x07\x75\x6e\x69\x30\x36\
-\x41\x37\x07\x75\x6e\x69\x30\x36\x41\x38\x07\x75\x6e\x69\x30\x36\
-\x34\x33\x0c\x75\x6e\x69\x30\x36\x34\x33\x2e\x73\x77\x73\x68\x07\
-\x75\x6e\x69\x46\x45\x44\x39\x07\x75\x6e\x69\x46\x45\x44\x41\x0c\
-\x75\x6e\x69\x46\x45\x44\x41\x2e\x73\x77\x73\x68\x07\x75\x6e\x69\
-\x46\x45\x44\x43\x0c\x75\x6e\x69\x46\x45\x44\x43\x2e\x73\x77\x73\
-\x68\x07\x75\x6e\x69\x46\x45\x44\x42\x0c\x75\x6e\x69\x46\x45\x44\
-\x42\x2e\x73\x77\x73\x68\x07\x75\x6e\x69\x30\x36\x41\x39\x07\x75\
-\x6e\x69\x46\x42\x38\x45\x07\x75\x6e\x69\x46\x42\x38\x46\x07\x75\
-\x6e\x69\x46\x42\x39\x31\x07\x75\x6e\x69\x46\x42\x39\x30\x07\x75\
-\x6e\x69\x30\x37\x36\x33\x07\x75\x6e\x69\x30\x36\x41\x46\x0c\x75\
-\x6e\x69\x30\x36\x41\x46\x2e\x73\x77\x73\x68\x07\x75\x6e\x69\x46\
-\x42\x39\x32\x07\x75\x6e\x69\x46\x42\x39\x33\x0c\x75\x6e\x69\x46\
-\x42\x39\x33\x2e\x73\x77\x73\x68\x07\x75\x6e\x69\x46\x42\x39\x35\
-\x0c\x75\x6e\x69\x46\x42\x39\x35\x2e\x73\x77\x73\x68\x07\x75\x6e\
-\x69\x46\x42\x39\x34\x0c\x75\x6e\x69\x46\x42\x39\x34\x2e\x73\x77\
-\x73\x68\x07\x75\x6e\x69\x30\x36\x41\x42\x07\x75\x6e\x69\x30\x36\
-\x41\x44\x07\x75\x6e\x69\x46\x42\x44\x33\x07\x75\x6e\x69\x46\x42\
-\x44\x34\x07\x75\x6e\x69\x46\x42\x44\x36\x07\x75\x6e\x69\x46\x42\
-\x44\x35\x07\x75\x6e\x69\x30\x36\x34\x34\x07\x75\x6e\x69\x46\x45\
-\x44\x44\x07\x75\x6e\x69\x46\x45\x44\x45\x07\x75\x6e\x69\x46\x45\
-\x45\x30\x07\x75\x6e\x69\x46\x45\x44\x46\x07\x75\x6e\x69\x30\x36\
-\x34\x35\x07\x75\x6e\x69\x46\x45\x45\x31\x07\x75\x6e\x69\x46\x45\
-\x45\x32\x07\x75\x6e\x69\x46\x45\x45\x34\x07\x75\x6e\x69\x46\x45\
-\x45\x33\x07\x75\x6e\x69\x30\x36\x34\x36\x07\x75\x6e\x69\x46\x45\
-\x45\x35\x07\x75\x6e\x69\x46\x45\x45\x36\x07\x75\x6e\x69\x46\x45\
-\x45\x38\x07\x75\x6e\x69\x46\x45\x45\x37\x07\x75\x6e\x69\x30\x36\
-\x42\x41\x07\x75\x6e\x69\x46\x42\x39\x45\x07\x75\x6e\x69\x46\x42\
-\x39\x46\x07\x75\x6e\x69\x30\x36\x42\x43\x07\x75\x6e\x69\x30\x36\
-\x34\x37\x07\x75\x6e\x69\x46\x45\x45\x39\x07\x75\x6e\x69\x46\x45\
-\x45\x41\x07\x75\x6e\x69\x46\x45\x45\x43\x11\x75\x6e\x69\x30\x36\
-\x34\x37\x2e\x6d\x65\x64\x69\x2e\x62\x6f\x64\x79\x07\x75\x6e\x69\
-\x46\x45\x45\x42\x07\x75\x6e\x69\x30\x36\x43\x30\x07\x75\x6e\x69\
-\x46\x42\x41\x34\x07\x75\x6e\x69\x46\x42\x41\x35\x07\x75\x6e\x69\
-\x30\x36\x43\x31\x0c\x75\x6e\x69\x30\x36\x43\x31\x2e\x69\x73\x6f\
-\x6c\x07\x75\x6e\x69\x46\x42\x41\x37\x07\x75\x6e\x69\x46\x42\x41\
-\x39\x07\x75\x6e\x69\x46\x42\x41\x38\x07\x75\x6e\x69\x30\x36\x43\
-\x32\x0c\x75\x6e\x69\x30\x36\x43\x32\x2e\x66\x69\x6e\x61\x0c\x75\
-\x6e\x69\x30\x36\x43\x32\x2e\x6d\x65\x64\x69\x0c\x75\x6e\x69\x30\
-\x36\x43\x32\x2e\x69\x6e\x69\x74\x07\x75\x6e\x69\x30\x36\x42\x45\
-\x07\x75\x6e\x69\x46\x42\x41\x41\x07\x75\x6e\x69\x46\x42\x41\x42\
-\x07\x75\x6e\x69\x46\x42\x41\x44\x07\x75\x6e\x69\x46\x42\x41\x43\
-\x07\x75\x6e\x69\x30\x36\x32\x39\x07\x75\x6e\x69\x46\x45\x39\x33\
-\x07\x75\x6e\x69\x46\x45\x39\x34\x07\x75\x6e\x69\x30\x36\x43\x33\
-\x0c\x75\x6e\x69\x30\x36\x43\x33\x2e\x66\x69\x6e\x61\x07\x75\x6e\
-\x69\x30\x36\x34\x38\x07\x75\x6e\x69\x46\x45\x45\x44\x07\x75\x6e\
-\x69\x46\x45\x45\x45\x07\x75\x6e\x69\x30\x36\x32\x34\x07\x75\x6e\
-\x69\x46\x45\x38\x35\x07\x75\x6e\x69\x46\x45\x38\x36\x07\x75\x6e\
-\x69\x30\x36\x43\x36\x07\x75\x6e\x69\x46\x42\x44\x39\x07\x75\x6e\
-\x69\x46\x42\x44\x41\x07\x75\x6e\x69\x30\x36\x43\x37\x07\x75\x6e\
-\x69\x46\x42\x44\x37\x07\x75\x6e\x69\x46\x42\x44\x38\x07\x75\x6e\
-\x69\x30\x36\x43\x38\x07\x75\x6e\x69\x46\x42\x44\x42\x07\x75\x6e\
-\x69\x46\x42\x44\x43\x07\x75\x6e\x69\x30\x36\x43\x39\x07\x75\x6e\
-\x69\x46\x42\x45\x32\x07\x75\x6e\x69\x46\x42\x45\x33\x07\x75\x6e\
-\x69\x30\x36\x43\x42\x07\x75\x6e\x69\x46\x42\x44\x45\x07\x75\x6e\
-\x69\x46\x42\x44\x46\x07\x75\x6e\x69\x30\x36\x34\x39\x07\x75\x6e\
-\x69\x46\x45\x45\x46\x07\x75\x6e\x69\x46\x45\x46\x30\x07\x75\x6e\
-\x69\x30\x36\x34\x41\x07\x75\x6e\x69\x46\x45\x46\x31\x07\x75\x6e\
-\x69\x46\x45\x46\x32\x07\x75\x6e\x69\x46\x45\x46\x34\x07\x75\x6e\
-\x69\x46\x45\x46\x33\x07\x75\x6e\x69\x30\x36\x32\x36\x07\x75\x6e\
-\x69\x46\x45\x38\x39\x07\x75\x6e\x69\x46\x45\x38\x41\x07\x75\x6e\
-\x69\x46\x45\x38\x43\x07\x75\x6e\x69\x46\x45\x38\x42\x07\x75\x6e\
-\x69\x30\x36\x43\x43\x07\x75\x6e\x69\x46\x42\x46\x43\x07\x75\x6e\
-\x69\x46\x42\x46\x44\x07\x75\x6e\x69\x46\x42\x46\x46\x07\x75\x6e\
-\x69\x46\x42\x46\x45\x07\x75\x6e\x69\x30\x36\x43\x44\x07\x75\x6e\
-\x69\x30\x36\x44\x30\x07\x75\x6e\x69\x46\x42\x45\x34\x07\x75\x6e\
-\x69\x46\x42\x45\x35\x07\x75\x6e\x69\x46\x42\x45\x37\x07\x75\x6e\
-\x69\x46\x42\x45\x36\x07\x75\x6e\x69\x30\x36\x44\x32\x07\x75\x6e\
-\x69\x46\x42\x41\x45\x07\x75\x6e\x69\x46\x42\x41\x46\x07\x75\x6e\
-\x69\x30\x36\x44\x33\x07\x75\x6e\x69\x46\x42\x42\x30\x07\x75\x6e\
-\x69\x46\x42\x42\x31\x07\x75\x6e\x69\x30\x36\x44\x35\x0c\x75\x6e\
-\x69\x30\x36\x44\x35\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\x46\x45\
-\x37\x31\x07\x75\x6e\x69\x46\x45\x37\x33\x07\x75\x6e\x69\x46\x45\
-\x37\x42\x07\x75\x6e\x69\x30\x36\x34\x30\x07\x75\x6e\x69\x46\x45\
-\x37\x37\x07\x75\x6e\x69\x46\x45\x37\x39\x07\x75\x6e\x69\x46\x45\
-\x37\x44\x07\x75\x6e\x69\x46\x43\x46\x33\x07\x75\x6e\x69\x46\x43\
-\x46\x34\x07\x75\x6e\x69\x46\x45\x37\x46\x07\x75\x6e\x69\x46\x45\
-\x46\x42\x07\x75\x6e\x69\x46\x45\x46\x43\x07\x75\x6e\x69\x46\x45\
-\x46\x37\x07\x75\x6e\x69\x46\x45\x46\x38\x07\x75\x6e\x69\x46\x45\
-\x46\x39\x07\x75\x6e\x69\x46\x45\x46\x41\x07\x75\x6e\x69\x46\x45\
-\x46\x35\x07\x75\x6e\x69\x46\x45\x46\x36\x0b\x75\x6e\x69\x30\x36\
-\x34\x34\x30\x36\x37\x31\x15\x75\x6e\x69\x30\x36\x36\x45\x30\x36\
-\x34\x39\x2e\x66\x69\x6e\x61\x2e\x72\x6c\x69\x67\x07\x75\x6e\x69\
-\x46\x43\x36\x41\x07\x75\x6e\x69\x46\x43\x36\x42\x07\x75\x6e\x69\
-\x46\x43\x30\x38\x07\x75\x6e\x69\x46\x43\x36\x43\x07\x75\x6e\x69\
-\x46\x43\x45\x31\x07\x75\x6e\x69\x46\x43\x39\x46\x07\x75\x6e\x69\
-\x46\x43\x36\x44\x07\x75\x6e\x69\x46\x43\x45\x32\x07\x75\x6e\x69\
-\x46\x43\x41\x30\x07\x75\x6e\x69\x46\x43\x30\x39\x07\x75\x6e\x69\
-\x46\x43\x36\x45\x07\x75\x6e\x69\x46\x43\x30\x41\x07\x75\x6e\x69\
-\x46\x43\x36\x46\x0b\x75\x6e\x69\x30\x36\x32\x38\x30\x36\x32\x36\
-\x10\x75\x6e\x69\x30\x36\x32\x38\x30\x36\x32\x36\x2e\x66\x69\x6e\
-\x61\x07\x75\x6e\x69\x46\x43\x34\x33\x07\x75\x6e\x69\x46\x43\x38\
-\x36\x10\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x37\x31\x2e\x66\x69\
-\x6e\x61\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x33\x31\x2e\x66\
-\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x33\x32\x2e\
-\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x35\
-\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x35\x2e\x66\x69\x6e\
-\x61\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x35\x2e\x6d\x65\
-\x64\x69\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x35\x2e\x69\
-\x6e\x69\x74\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x36\x2e\
-\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x37\
-\x2e\x6d\x65\x64\x69\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\
-\x37\x2e\x69\x6e\x69\x74\x0b\x75\x6e\x69\x30\x36\x37\x45\x30\x36\
-\x34\x39\x10\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x39\x2e\x66\
-\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x41\x10\
-\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x34\x41\x2e\x66\x69\x6e\x61\
-\x0b\x75\x6e\x69\x30\x36\x37\x45\x30\x36\x32\x36\x10\x75\x6e\x69\
-\x30\x36\x37\x45\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x07\x75\x6e\
-\x69\x46\x43\x37\x30\x07\x75\x6e\x69\x46\x43\x37\x31\x07\x75\x6e\
-\x69\x46\x43\x30\x45\x07\x75\x6e\x69\x46\x43\x37\x32\x07\x75\x6e\
-\x69\x46\x43\x45\x33\x07\x75\x6e\x69\x46\x43\x41\x34\x07\x75\x6e\
-\x69\x46\x43\x37\x33\x07\x75\x6e\x69\x46\x43\x45\x34\x07\x75\x6e\
-\x69\x46\x43\x41\x35\x07\x75\x6e\x69\x46\x43\x30\x46\x07\x75\x6e\
-\x69\x46\x43\x37\x34\x07\x75\x6e\x69\x46\x43\x31\x30\x07\x75\x6e\
-\x69\x46\x43\x37\x35\x0b\x75\x6e\x69\x30\x36\x32\x41\x30\x36\x32\
-\x36\x10\x75\x6e\x69\x30\x36\x32\x41\x30\x36\x32\x36\x2e\x66\x69\
-\x6e\x61\x07\x75\x6e\x69\x46\x43\x37\x36\x07\x75\x6e\x69\x46\x43\
-\x37\x37\x07\x75\x6e\x69\x46\x43\x31\x32\x07\x75\x6e\x69\x46\x43\
-\x37\x38\x07\x75\x6e\x69\x46\x43\x45\x35\x07\x75\x6e\x69\x46\x43\
-\x41\x36\x07\x75\x6e\x69\x46\x43\x37\x39\x07\x75\x6e\x69\x46\x43\
-\x45\x36\x10\x75\x6e\x69\x30\x36\x32\x42\x30\x36\x34\x37\x2e\x69\
-\x6e\x69\x74\x07\x75\x6e\x69\x46\x43\x31\x33\x07\x75\x6e\x69\x46\
-\x43\x37\x41\x07\x75\x6e\x69\x46\x43\x31\x34\x07\x75\x6e\x69\x46\
-\x43\x37\x42\x0b\x75\x6e\x69\x30\x36\x32\x42\x30\x36\x32\x36\x10\
-\x75\x6e\x69\x30\x36\x32\x42\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\
-\x07\x75\x6e\x69\x46\x44\x30\x33\x07\x75\x6e\x69\x46\x44\x31\x46\
-\x07\x75\x6e\x69\x46\x44\x32\x30\x0b\x75\x6e\x69\x30\x36\x32\x45\
-\x30\x36\x32\x36\x10\x75\x6e\x69\x30\x36\x32\x45\x30\x36\x32\x36\
-\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\x46\x44\x30\x45\x07\x75\x6e\
-\x69\x46\x44\x32\x41\x07\x75\x6e\x69\x46\x43\x31\x46\x07\x75\x6e\
-\x69\x46\x43\x45\x37\x07\x75\x6e\x69\x46\x43\x42\x30\x07\x75\x6e\
-\x69\x46\x43\x45\x38\x07\x75\x6e\x69\x46\x44\x33\x31\x07\x75\x6e\
-\x69\x46\x43\x46\x42\x07\x75\x6e\x69\x46\x44\x31\x37\x04\x46\x43\
-\x46\x43\x07\x75\x6e\x69\x46\x44\x31\x38\x0b\x75\x6e\x69\x30\x36\
-\x33\x33\x30\x36\x33\x32\x10\x75\x6e\x69\x30\x36\x33\x33\x30\x36\
-\x33\x32\x2e\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x33\x33\x30\
-\x36\x34\x35\x2e\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x33\x33\
-\x30\x36\x32\x36\x10\x75\x6e\x69\x30\x36\x33\x33\x30\x36\x32\x36\
-\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\x46\x44\x30\x44\x07\x75\x6e\
-\x69\x46\x44\x32\x39\x0b\x75\x6e\x69\x30\x36\x33\x34\x30\x36\x33\
-\x32\x10\x75\x6e\x69\x30\x36\x33\x34\x30\x36\x33\x32\x2e\x66\x69\
-\x6e\x61\x07\x75\x6e\x69\x46\x44\x30\x43\x07\x75\x6e\x69\x46\x44\
-\x32\x38\x07\x75\x6e\x69\x46\x43\x45\x39\x07\x75\x6e\x69\x46\x44\
-\x33\x30\x07\x75\x6e\x69\x46\x43\x45\x41\x07\x75\x6e\x69\x46\x44\
-\x33\x32\x07\x75\x6e\x69\x46\x43\x46\x44\x07\x75\x6e\x69\x46\x44\
-\x31\x39\x07\x75\x6e\x69\x46\x43\x46\x45\x07\x75\x6e\x69\x46\x44\
-\x31\x41\x0b\x75\x6e\x69\x30\x36\x33\x34\x30\x36\x32\x36\x10\x75\
-\x6e\x69\x30\x36\x33\x34\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x07\
-\x75\x6e\x69\x46\x44\x30\x46\x07\x75\x6e\x69\x46\x44\x32\x42\x0b\
-\x75\x6e\x69\x30\x36\x33\x35\x30\x36\x33\x32\x10\x75\x6e\x69\x30\
-\x36\x33\x35\x30\x36\x33\x32\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\
-\x46\x43\x32\x31\x10\x75\x6e\x69\x30\x36\x33\x35\x30\x36\x34\x35\
-\x2e\x6d\x65\x64\x69\x07\x75\x6e\x69\x46\x43\x42\x33\x10\x75\x6e\
-\x69\x30\x36\x33\x35\x30\x36\x34\x37\x2e\x6d\x65\x64\x69\x10\x75\
-\x6e\x69\x30\x36\x33\x35\x30\x36\x34\x37\x2e\x69\x6e\x69\x74\x07\
-\x75\x6e\x69\x46\x44\x30\x35\x07\x75\x6e\x69\x46\x44\x32\x31\x07\
-\x75\x6e\x69\x46\x44\x30\x36\x07\x75\x6e\x69\x46\x44\x32\x32\x0b\
-\x75\x6e\x69\x30\x36\x33\x35\x30\x36\x32\x36\x10\x75\x6e\x69\x30\
-\x36\x33\x35\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\
-\x46\x44\x31\x30\x07\x75\x6e\x69\x46\x44\x32\x43\x0b\x75\x6e\x69\
-\x30\x36\x33\x36\x30\x36\x33\x32\x10\x75\x6e\x69\x30\x36\x33\x36\
-\x30\x36\x33\x32\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\x46\x43\x32\
-\x35\x10\x75\x6e\x69\x30\x36\x33\x36\x30\x36\x34\x35\x2e\x6d\x65\
-\x64\x69\x07\x75\x6e\x69\x46\x43\x42\x37\x10\x75\x6e\x69\x30\x36\
-\x33\x36\x30\x36\x34\x37\x2e\x6d\x65\x64\x69\x10\x75\x6e\x69\x30\
-\x36\x33\x36\x30\x36\x34\x37\x2e\x69\x6e\x69\x74\x07\x75\x6e\x69\
-\x46\x44\x30\x37\x07\x75\x6e\x69\x46\x44\x32\x33\x07\x75\x6e\x69\
-\x46\x44\x30\x38\x07\x75\x6e\x69\x46\x44\x32\x34\x0b\x75\x6e\x69\
-\x30\x36\x33\x36\x30\x36\x32\x36\x10\x75\x6e\x69\x30\x36\x33\x36\
-\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x07\x75\x6e\x69\x46\x43\x33\
-\x31\x07\x75\x6e\x69\x46\x43\x33\x32\x0b\x75\x6e\x69\x30\x36\x34\
-\x31\x30\x36\x32\x36\x07\x75\x6e\x69\x46\x43\x33\x35\x07\x75\x6e\
-\x69\x46\x43\x33\x36\x0b\x75\x6e\x69\x30\x36\x34\x32\x30\x36\x32\
-\x36\x07\x75\x6e\x69\x46\x43\x33\x44\x07\x75\x6e\x69\x46\x43\x38\
-\x33\x07\x75\x6e\x69\x46\x43\x33\x45\x07\x75\x6e\x69\x46\x43\x38\
-\x34\x0b\x75\x6e\x69\x30\x36\x34\x33\x30\x36\x32\x36\x10\x75\x6e\
-\x69\x30\x36\x34\x33\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x0b\x75\
-\x6e\x69\x30\x36\x41\x39\x30\x36\x34\x41\x0b\x75\x6e\x69\x30\x36\
-\x41\x46\x30\x36\x34\x39\x10\x75\x6e\x69\x30\x36\x41\x46\x30\x36\
-\x34\x39\x2e\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x41\x46\x30\
-\x36\x34\x41\x10\x75\x6e\x69\x30\x36\x41\x46\x30\x36\x34\x41\x2e\
-\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x41\x46\x30\x36\x32\x36\
-\x10\x75\x6e\x69\x30\x36\x41\x46\x30\x36\x32\x36\x2e\x66\x69\x6e\
-\x61\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x32\x38\x30\x36\x34\
-\x35\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x37\x45\x30\x36\x34\
-\x35\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x32\x41\x30\x36\x34\
-\x35\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x32\x42\x30\x36\x34\
-\x35\x07\x75\x6e\x69\x46\x43\x34\x32\x07\x75\x6e\x69\x46\x43\x43\
-\x43\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x34\x36\x30\x36\x34\
-\x35\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x34\x39\x30\x36\x34\
-\x35\x07\x75\x6e\x69\x46\x43\x34\x34\x07\x75\x6e\x69\x46\x43\x38\
-\x37\x0f\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x34\x41\x30\x36\x34\
-\x35\x0b\x75\x6e\x69\x30\x36\x34\x34\x30\x36\x32\x36\x10\x75\x6e\
-\x69\x30\x36\x34\x34\x30\x36\x32\x36\x2e\x66\x69\x6e\x61\x0f\x75\
-\x6e\x69\x30\x36\x34\x34\x30\x36\x32\x36\x30\x36\x34\x35\x10\x75\
-\x6e\x69\x30\x36\x34\x35\x30\x36\x33\x31\x2e\x66\x69\x6e\x61\x10\
-\x75\x6e\x69\x30\x36\x34\x35\x30\x36\x33\x32\x2e\x66\x69\x6e\x61\
-\x07\x75\x6e\x69\x46\x43\x38\x41\x07\x75\x6e\x69\x46\x43\x38\x42\
-\x07\x75\x6e\x69\x46\x43\x34\x45\x07\x75\x6e\x69\x46\x43\x38\x43\
-\x07\x75\x6e\x69\x46\x43\x45\x45\x07\x75\x6e\x69\x46\x43\x44\x35\
-\x07\x75\x6e\x69\x46\x43\x38\x44\x07\x75\x6e\x69\x46\x43\x45\x46\
-\x07\x75\x6e\x69\x46\x43\x44\x36\x07\x75\x6e\x69\x46\x43\x34\x46\
-\x07\x75\x6e\x69\x46\x43\x38\x45\x07\x75\x6e\x69\x46\x43\x35\x30\
-\x07\x75\x6e\x69\x46\x43\x38\x46\x0b\x75\x6e\x69\x30\x36\x34\x36\
-\x30\x36\x32\x36\x10\x75\x6e\x69\x30\x36\x34\x36\x30\x36\x32\x36\
-\x2e\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\x33\
-\x31\x2e\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\
-\x33\x32\x2e\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x34\x39\x30\
-\x36\x34\x35\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\x34\x35\x2e\
-\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\x34\x35\
-\x2e\x6d\x65\x64\x69\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\x34\
-\x35\x2e\x69\x6e\x69\x74\x10\x75\x6e\x69\x30\x36\x34\x39\x30\x36\
-\x34\x36\x2e\x66\x69\x6e\x61\x10\x75\x6e\x69\x30\x36\x34\x39\x30\
-\x36\x34\x37\x2e\x6d\x65\x64\x69\x10\x75\x6e\x69\x30\x36\x34\x39\
-\x30\x36\x34\x37\x2e\x69\x6e\x69\x74\x07\x75\x6e\x69\x46\x43\x39\
-\x31\x07\x75\x6e\x69\x46\x43\x39\x32\x08\x75\x6e\x69\x30\x46\x43\
-\x35\x38\x07\x75\x6e\x69\x46\x43\x39\x33\x07\x75\x6e\x69\x46\x43\
-\x46\x30\x07\x75\x6e\x69\x46\x43\x44\x44\x07\x75\x6e\x69\x46\x43\
-\x39\x34\x07\x75\x6e\x69\x46\x43\x46\x31\x07\x75\x6e\x69\x46\x43\
-\x44\x45\x07\x75\x6e\x69\x46\x42\x45\x41\x07\x75\x6e\x69\x46\x42\
-\x45\x42\x07\x75\x6e\x69\x46\x43\x36\x34\x07\x75\x6e\x69\x46\x43\
-\x36\x35\x07\x75\x6e\x69\x46\x43\x30\x32\x07\x75\x6e\x69\x46\x43\
-\x36\x36\x07\x75\x6e\x69\x46\x43\x44\x46\x07\x75\x6e\x69\x46\x43\
-\x39\x41\x07\x75\x6e\x69\x46\x43\x36\x37\x07\x75\x6e\x69\x46\x43\
-\x45\x30\x07\x75\x6e\x69\x46\x43\x39\x42\x07\x75\x6e\x69\x46\x42\
-\x45\x45\x07\x75\x6e\x69\x46\x42\x45\x46\x07\x75\x6e\x69\x46\x42\
-\x46\x32\x07\x75\x6e\x69\x46\x42\x46\x33\x07\x75\x6e\x69\x46\x42\
-\x46\x30\x07\x75\x6e\x69\x46\x42\x46\x31\x07\x75\x6e\x69\x46\x42\
-\x46\x34\x07\x75\x6e\x69\x46\x42\x46\x35\x07\x75\x6e\x69\x46\x43\
-\x30\x33\x07\x75\x6e\x69\x46\x43\x36\x38\x07\x75\x6e\x69\x46\x43\
-\x30\x34\x07\x75\x6e\x69\x46\x43\x36\x39\x0b\x75\x6e\x69\x30\x36\
-\x32\x36\x30\x36\x32\x36\x10\x75\x6e\x69\x30\x36\x32\x36\x30\x36\
-\x32\x36\x2e\x66\x69\x6e\x61\x0b\x75\x6e\x69\x30\x36\x32\x36\x30\
-\x36\x44\x30\x07\x75\x6e\x69\x46\x42\x46\x37\x07\x75\x6e\x69\x46\
-\x42\x46\x38\x07\x75\x6e\x69\x46\x42\x46\x39\x07\x75\x6e\x69\x46\
-\x42\x46\x41\x07\x75\x6e\x69\x46\x42\x46\x42\x07\x75\x6e\x69\x46\
-\x44\x46\x32\x07\x75\x6e\x69\x46\x44\x46\x41\x07\x75\x6e\x69\x46\
-\x44\x46\x42\x07\x75\x6e\x69\x30\x36\x36\x42\x07\x75\x6e\x69\x30\
-\x36\x36\x43\x07\x75\x6e\x69\x30\x36\x36\x30\x07\x75\x6e\x69\x30\
-\x36\x36\x31\x07\x75\x6e\x69\x30\x36\x36\x32\x07\x75\x6e\x69\x30\
-\x36\x36\x33\x07\x75\x6e\x69\x30\x36\x36\x34\x07\x75\x6e\x69\x30\
-\x36\x36\x35\x07\x75\x6e\x69\x30\x36\x36\x36\x07\x75\x6e\x69\x30\
-\x36\x36\x37\x07\x75\x6e\x69\x30\x36\x36\x38\x07\x75\x6e\x69\x30\
-\x36\x36\x39\x07\x75\x6e\x69\x30\x36\x46\x30\x07\x75\x6e\x69\x30\
-\x36\x46\x31\x07\x75\x6e\x69\x30\x36\x46\x32\x07\x75\x6e\x69\x30\
-\x36\x46\x33\x07\x75\x6e\x69\x30\x36\x46\x34\x07\x75\x6e\x69\x30\
-\x36\x46\x35\x07\x75\x6e\x69\x30\x36\x46\x36\x07\x75\x6e\x69\x30\
-\x36\x46\x37\x07\x75\x6e\x69\x30\x36\x46\x38\x07\x75\x6e\x69\x30\
-\x36\x46\x39\x0c\x75\x6e\x69\x30\x36\x46\x34\x2e\x75\x72\x64\x75\
-\x0c\x75\x6e\x69\x30\x36\x46\x37\x2e\x75\x72\x64\x75\x07\x75\x6e\
-\x69\x32\x30\x30\x43\x07\x75\x6e\x69\x32\x30\x30\x44\x07\x75\x6e\
-\x69\x32\x30\x30\x45\x07\x75\x6e\x69\x32\x30\x30\x46\x07\x75\x6e\
-\x69\x30\x30\x41\x30\x07\x75\x6e\x69\x32\x30\x30\x32\x07\x75\x6e\
-\x69\x32\x30\x30\x33\x07\x75\x6e\x69\x32\x30\x30\x37\x07\x75\x6e\
-\x69\x32\x30\x30\x41\x09\x73\x70\x61\x63\x65\x2e\x30\x30\x31\x07\
-\x75\x6e\x69\x46\x42\x42\x41\x07\x75\x6e\x69\x46\x42\x42\x42\x07\
-\x75\x6e\x69\x30\x36\x44\x34\x07\x75\x6e\x69\x30\x36\x30\x43\x07\
-\x75\x6e\x69\x30\x36\x31\x42\x07\x75\x6e\x69\x30\x36\x31\x46\x07\
-\x75\x6e\x69\x30\x36\x30\x30\x07\x75\x6e\x69\x30\x36\x36\x44\x07\
-\x75\x6e\x69\x30\x36\x30\x31\x07\x75\x6e\x69\x30\x36\x30\x32\x07\
-\x75\x6e\x69\x30\x36\x30\x33\x07\x75\x6e\x69\x30\x36\x30\x44\x07\
-\x75\x6e\x69\x30\x36\x30\x45\x07\x75\x6e\x69\x30\x36\x30\x46\x07\
-\x75\x6e\x69\x30\x36\x44\x44\x07\x75\x6e\x69\x46\x44\x33\x45\x07\
-\x75\x6e\x69\x46\x44\x33\x46\x07\x75\x6e\x69\x33\x30\x30\x33\x0e\
-\x74\x77\x6f\x64\x6f\x74\x65\x6e\x6c\x65\x61\x64\x65\x72\x07\x75\
-\x6e\x69\x32\x30\x31\x36\x07\x75\x6e\x69\x32\x30\x31\x35\x07\x75\
-\x6e\x69\x32\x30\x31\x30\x07\x75\x6e\x69\x32\x30\x33\x35\x07\x75\
-\x6e\x69\x33\x30\x31\x45\x07\x75\x6e\x69\x33\x30\x31\x44\x07\x75\
-\x6e\x69\x30\x36\x31\x43\x07\x75\x6e\x69\x30\x36\x30\x34\x07\x75\
-\x6e\x69\x46\x44\x46\x44\x07\x75\x6e\x69\x30\x36\x36\x41\x07\x75\
-\x6e\x69\x30\x36\x30\x39\x06\x6d\x69\x6e\x75\x74\x65\x06\x73\x65\
-\x63\x6f\x6e\x64\x07\x75\x6e\x69\x32\x31\x31\x36\x07\x75\x6e\x69\
-\x32\x32\x33\x36\x0a\x75\x6e\x69\x30\x33\x30\x36\x2e\x63\x79\x07\
-\x75\x6e\x69\x30\x36\x31\x32\x07\x75\x6e\x69\x30\x36\x31\x33\x07\
-\x75\x6e\x69\x30\x36\x31\x30\x07\x75\x6e\x69\x30\x36\x31\x31\x07\
-\x75\x6e\x69\x30\x36\x31\x34\x07\x75\x6e\x69\x30\x36\x31\x35\x0b\
-\x64\x6f\x74\x61\x62\x6f\x76\x65\x2d\x61\x72\x0b\x64\x6f\x74\x62\
-\x65\x6c\x6f\x77\x2d\x61\x72\x0c\x64\x6f\x74\x63\x65\x6e\x74\x65\
-\x72\x2d\x61\x72\x17\x74\x77\x6f\x64\x6f\x74\x73\x76\x65\x72\x74\
-\x69\x63\x61\x6c\x61\x62\x6f\x76\x65\x2d\x61\x72\x17\x74\x77\x6f\
-\x64\x6f\x74\x73\x76\x65\x72\x74\x69\x63\x61\x6c\x62\x65\x6c\x6f\
-\x77\x2d\x61\x72\x19\x74\x77\x6f\x64\x6f\x74\x73\x68\x6f\x72\x69\
-\x7a\x6f\x6e\x74\x61\x6c\x61\x62\x6f\x76\x65\x2d\x61\x72\x19\x74\
-\x77\x6f\x64\x6f\x74\x73\x68\x6f\x72\x69\x7a\x6f\x6e\x74\x61\x6c\
-\x62\x65\x6c\x6f\x77\x2d\x61\x72\x15\x74\x68\x72\x65\x65\x64\x6f\
-\x74\x73\x64\x6f\x77\x6e\x61\x62\x6f\x76\x65\x2d\x61\x72\x15\x74\
-\x68\x72\x65\x65\x64\x6f\x74\x73\x64\x6f\x77\x6e\x62\x65\x6c\x6f\
-\x77\x2d\x61\x72\x16\x74\x68\x72\x65\x65\x64\x6f\x74\x73\x64\x6f\
-\x77\x6e\x63\x65\x6e\x74\x65\x72\x2d\x61\x72\x13\x74\x68\x72\x65\
-\x65\x64\x6f\x74\x73\x75\x70\x61\x62\x6f\x76\x65\x2d\x61\x72\x13\
-\x74\x68\x72\x65\x65\x64\x6f\x74\x73\x75\x70\x62\x65\x6c\x6f\x77\
-\x2d\x61\x72\x10\x66\x6f\x75\x72\x64\x6f\x74\x73\x61\x62\x6f\x76\
-\x65\x2d\x61\x72\x10\x66\x6f\x75\x72\x64\x6f\x74\x73\x62\x65\x6c\
-\x6f\x77\x2d\x61\x72\x11\x66\x6f\x75\x72\x64\x6f\x74\x73\x63\x65\
-\x6e\x74\x65\x72\x2d\x61\x72\x08\x77\x61\x73\x6c\x61\x2d\x61\x72\
-\x0c\x6d\x69\x6e\x69\x4b\x65\x68\x65\x68\x2d\x61\x72\x12\x67\x61\
-\x66\x73\x61\x72\x6b\x61\x73\x68\x61\x62\x6f\x76\x65\x2d\x61\x72\
-\x18\x67\x61\x66\x73\x61\x72\x6b\x61\x73\x68\x61\x62\x6f\x76\x65\
-\x2d\x61\x72\x2e\x73\x77\x61\x73\x68\x13\x67\x61\x66\x73\x61\x72\
-\x6b\x61\x73\x68\x63\x65\x6e\x74\x65\x72\x2d\x61\x72\x0f\x64\x6f\
-\x75\x62\x6c\x65\x73\x74\x72\x6f\x6b\x65\x2d\x61\x72\x07\x75\x6e\
-\x69\x30\x36\x37\x30\x07\x75\x6e\x69\x30\x36\x35\x36\x07\x75\x6e\
-\x69\x30\x36\x35\x34\x07\x75\x6e\x69\x30\x36\x35\x35\x0b\x75\x6e\
-\x69\x30\x36\x35\x34\x30\x36\x34\x46\x0b\x75\x6e\x69\x30\x36\x35\
-\x34\x30\x36\x34\x43\x0b\x75\x6e\x69\x30\x36\x35\x34\x30\x36\x34\
-\x45\x0b\x75\x6e\x69\x30\x36\x35\x34\x30\x36\x34\x42\x0b\x75\x6e\
-\x69\x30\x36\x35\x34\x30\x36\x35\x32\x0b\x75\x6e\x69\x30\x36\x35\
-\x35\x30\x36\x35\x30\x0b\x75\x6e\x69\x30\x36\x35\x35\x30\x36\x34\
-\x44\x07\x75\x6e\x69\x30\x36\x34\x42\x07\x75\x6e\x69\x30\x36\x34\
-\x43\x07\x75\x6e\x69\x30\x36\x34\x44\x07\x75\x6e\x69\x30\x36\x34\
-\x45\x07\x75\x6e\x69\x30\x36\x34\x46\x07\x75\x6e\x69\x30\x36\x35\
-\x30\x07\x75\x6e\x69\x30\x36\x35\x31\x0b\x75\x6e\x69\x30\x36\x35\
-\x31\x30\x36\x34\x42\x07\x75\x6e\x69\x46\x43\x35\x45\x07\x75\x6e\
-\x69\x46\x43\x35\x46\x07\x75\x6e\x69\x46\x43\x36\x30\x07\x75\x6e\
-\x69\x46\x43\x36\x31\x07\x75\x6e\x69\x46\x43\x36\x32\x07\x75\x6e\
-\x69\x46\x43\x36\x33\x07\x75\x6e\x69\x30\x36\x35\x32\x07\x75\x6e\
-\x69\x30\x36\x35\x33\x07\x75\x6e\x69\x30\x36\x35\x38\x07\x75\x6e\
-\x69\x30\x36\x35\x37\x07\x75\x6e\x69\x30\x36\x35\x41\x07\x75\x6e\
-\x69\x30\x36\x35\x42\x07\x75\x6e\x69\x30\x36\x45\x30\x07\x75\x6e\
-\x69\x30\x36\x45\x34\x07\x75\x6e\x69\x46\x45\x37\x41\x07\x75\x6e\
-\x69\x46\x45\x37\x30\x07\x75\x6e\x69\x46\x45\x37\x32\x07\x75\x6e\
-\x69\x46\x45\x37\x34\x07\x75\x6e\x69\x46\x45\x37\x36\x07\x75\x6e\
-\x69\x46\x45\x37\x38\x07\x75\x6e\x69\x46\x45\x37\x43\x07\x75\x6e\
-\x69\x46\x45\x37\x45\x07\x75\x6e\x69\x30\x33\x34\x46\x00\x00\x00\
-\x00\x00\x01\x00\x00\x00\x00\x00\x01\x00\x02\x00\x0e\x00\x00\x00\
-\x4e\x00\x00\x01\x7e\x00\x02\x00\x0a\x00\x02\x01\x03\x00\x01\x01\
-\x05\x01\x13\x00\x01\x01\x15\x01\x51\x00\x01\x01\x53\x01\x5a\x00\
-\x01\x01\x5b\x02\x4c\x00\x02\x02\x79\x02\x7a\x00\x01\x02\x9e\x02\
-\x9e\x00\x02\x02\xa3\x02\xa3\x00\x01\x02\xac\x02\xe8\x00\x03\x02\
-\xf1\x02\xf1\x00\x03\x00\x40\x00\x1e\x00\x80\x00\x88\x00\x98\x00\
-\x90\x00\x98\x00\xa0\x00\xa8\x00\xb0\x00\xb8\x00\xc0\x00\xe8\x00\
-\xc8\x00\xd0\x00\xd8\x00\xd8\x00\xe0\x00\xe8\x00\xe8\x00\xf0\x00\
-\xf8\x00\xf8\x00\xf8\x01\x00\x01\x00\x01\x00\x01\x00\x01\x00\x01\
-\x00\x01\x08\x01\x1c\x00\x01\x00\x1e\x01\x5b\x01\x5c\x01\x5d\x01\
-\x5e\x01\x5f\x01\x60\x01\x61\x01\x62\x01\x63\x01\x6f\x01\x71\x01\
-\x73\x01\x76\x01\x81\x01\x83\x01\x85\x01\x90\x01\x92\x01\x94\x01\
-\x9f\x01\xa1\x01\xa3\x01\xb1\x01\xb3\x01\xb8\x01\xc4\x01\xc6\x01\
-\xc8\x02\x4a\x02\x9e\x00\x01\x00\x04\x00\x01\x01\x1a\x00\x01\x00\
-\x04\x00\x01\x01\x46\x00\x01\x00\x04\x00\x01\x01\x41\x00\x01\x00\
-\x04\x00\x01\x01\x2e\x00\x01\x00\x04\x00\x01\x01\x49\x00\x01\x00\
-\x04\x00\x01\x01\x33\x00\x01\x00\x04\x00\x01\x01\x45\x00\x01\x00\
-\x04\x00\x01\x01\x54\x00\x01\x00\x04\x00\x01\x02\x38\x00\x01\x00\
-\x04\x00\x01\x02\x46\x00\x01\x00\x04\x00\x01\x01\xcc\x00\x01\x00\
-\x04\x00\x01\x02\x2d\x00\x01\x00\x04\x00\x01\x02\x35\x00\x01\x00\
-\x04\x00\x01\x02\x43\x00\x01\x00\x04\x00\x01\x02\x45\x00\x01\x00\
-\x04\x00\x01\x02\x4f\x00\x01\x00\x04\x00\x01\x02\xea\x00\x03\x00\
-\x08\x00\x0c\x00\x10\x00\x01\x01\x51\x00\x01\x02\x93\x00\x01\x03\
-\xd4\x00\x03\x00\x08\x00\x0c\x00\x10\x00\x01\x18\x9e\x00\x01\x19\
-\xe0\x00\x01\x1b\x21\x00\x01\x00\x02\x00\x00\x00\x0c\x00\x00\x00\
-\x28\x00\x01\x00\x0c\x02\xb4\x02\xb7\x02\xb9\x02\xbb\x02\xbe\x02\
-\xc0\x02\xc9\x02\xcb\x02\xd1\x02\xd2\x02\xd5\x02\xd8\x00\x01\x00\
-\x2a\x02\xad\x02\xae\x02\xaf\x02\xb0\x02\xb1\x02\xb2\x02\xb3\x02\
-\xb6\x02\xb8\x02\xba\x02\xbd\x02\xbf\x02\xc2\x02\xc4\x02\xc5\x02\
-\xc8\x02\xca\x02\xcc\x02\xcd\x02\xce\x02\xcf\x02\xd0\x02\xd3\x02\
-\xd4\x02\xd6\x02\xd7\x02\xd9\x02\xda\x02\xdb\x02\xdc\x02\xdd\x02\
-\xde\x02\xdf\x02\xe0\x02\xe1\x02\xe2\x02\xe3\x02\xe4\x02\xe5\x02\
-\xe6\x02\xe7\x02\xe8\x00\x00\x00\x01\x00\x00\x00\x0a\x00\x9c\x01\
-\xe4\x00\x03\x44\x46\x4c\x54\x00\x14\x61\x72\x61\x62\x00\x32\x6c\
-\x61\x74\x6e\x00\x74\x00\x04\x00\x00\x00\x00\xff\xff\x00\x0a\x00\
-\x00\x00\x04\x00\x08\x00\x0c\x00\x10\x00\x14\x00\x18\x00\x1c\x00\
-\x21\x00\x26\x00\x0a\x00\x01\x55\x52\x44\x20\x00\x26\x00\x00\xff\
-\xff\x00\x0b\x00\x01\x00\x05\x00\x09\x00\x0d\x00\x11\x00\x15\x00\
-\x19\x00\x1d\x00\x22\x00\x25\x00\x27\x00\x00\xff\xff\x00\x0b\x00\
-\x02\x00\x06\x00\x0a\x00\x0e\x00\x12\x00\x16\x00\x1a\x00\x1e\x00\
-\x20\x00\x23\x00\x28\x00\x04\x00\x00\x00\x00\xff\xff\x00\x0a\x00\
-\x03\x00\x07\x00\x0b\x00\x0f\x00\x13\x00\x17\x00\x1b\x00\x1f\x00\
-\x24\x00\x29\x00\x2a\x61\x61\x6c\x74\x00\xfe\x61\x61\x6c\x74\x00\
-\xfe\x61\x61\x6c\x74\x00\xfe\x61\x61\x6c\x74\x00\xfe\x63\x61\x6c\
-\x74\x01\x06\x63\x61\x6c\x74\x01\x06\x63\x61\x6c\x74\x01\x06\x63\
-\x61\x6c\x74\x01\x06\x63\x63\x6d\x70\x01\x0c\x63\x63\x6d\x70\x01\
-\x0c\x63\x63\x6d\x70\x01\x0c\x63\x63\x6d\x70\x01\x0c\x64\x6c\x69\
-\x67\x01\x12\x64\x6c\x69\x67\x01\x12\x64\x6c\x69\x67\x01\x12\x64\
-\x6c\x69\x67\x01\x12\x66\x69\x6e\x61\x01\x18\x66\x69\x6e\x61\x01\
-\x18\x66\x69\x6e\x61\x01\x18\x66\x69\x6e\x61\x01\x18\x69\x6e\x69\
-\x74\x01\x1e\x69\x6e\x69\x74\x01\x1e\x69\x6e\x69\x74\x01\x1e\x69\
-\x6e\x69\x74\x01\x1e\x69\x73\x6f\x6c\x01\x24\x69\x73\x6f\x6c\x01\
-\x24\x69\x73\x6f\x6c\x01\x24\x69\x73\x6f\x6c\x01\x24\x6c\x69\x67\
-\x61\x01\x2a\x6c\x69\x67\x61\x01\x2a\x6c\x69\x67\x61\x01\x2a\x6c\
-\x69\x67\x61\x01\x2a\x6c\x6f\x63\x6c\x01\x30\x6d\x65\x64\x69\x01\
-\x36\x6d\x65\x64\x69\x01\x36\x6d\x65\x64\x69\x01\x36\x6d\x65\x64\
-\x69\x01\x36\x72\x6c\x69\x67\x01\x3c\x73\x77\x73\x68\x01\x42\x73\
-\x77\x73\x68\x01\x42\x73\x77\x73\x68\x01\x42\x73\x77\x73\x68\x01\
-\x42\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x09\x00\
-\x00\x00\x01\x00\x02\x00\x00\x00\x01\x00\x0a\x00\x00\x00\x01\x00\
-\x06\x00\x00\x00\x01\x00\x04\x00\x00\x00\x01\x00\x03\x00\x00\x00\
-\x01\x00\x0b\x00\x00\x00\x01\x00\x0c\x00\x00\x00\x01\x00\x05\x00\
-\x00\x00\x01\x00\x07\x00\x00\x00\x01\x00\x08\x00\x0f\x00\x20\x01\
-\xe6\x04\xd6\x06\x0a\x06\x90\x07\x8a\x08\x98\x0a\xe2\x0b\x68\x0b\
-\xaa\x0c\x34\x0c\x5c\x14\x70\x14\x88\x14\x9c\x00\x01\x00\x00\x00\
-\x01\x00\x08\x00\x02\x00\xe0\x00\x6d\x00\x07\x00\x0c\x00\x0f\x00\
-\x13\x00\x15\x00\x17\x00\x19\x00\x6b\x00\x6e\x00\x71\x00\x77\x00\
-\x7c\x00\x82\x00\x84\x00\x86\x00\x8b\x00\xc7\x00\xd3\x00\xd5\x00\
-\xd7\x00\xd3\x00\xd5\x00\xd7\x00\xe2\x00\xe4\x00\xe6\x00\xfe\x01\
-\x08\x01\x19\x01\x1b\x01\x1e\x01\x21\x01\x24\x01\x27\x01\x2a\x01\
-\x2d\x01\x30\x01\x4b\x01\x4e\x01\x50\x01\x5c\x01\x5e\x01\x60\x01\
-\x62\x01\x76\x01\x6f\x01\x71\x01\x73\x01\x75\x01\x81\x01\x83\x01\
-\x85\x01\x90\x01\x92\x01\x94\x01\x9f\x01\xa1\x01\xa3\x01\xa5\x01\
-\xa8\x01\xaa\x01\xb1\x01\xb3\x01\xb5\x01\xb8\x01\xba\x01\xbc\x01\
-\xc4\x01\xc6\x01\xc8\x01\xca\x01\xcc\x01\xd3\x01\xd5\x01\xd7\x01\
-\xd9\x01\xdb\x01\xe2\x01\xe4\x01\xe6\x01\xee\x01\xf0\x01\xf2\x01\
-\xf5\x01\xf7\x01\xf9\x01\xff\x02\x03\x02\x06\x02\x14\x02\x16\x02\
-\x18\x02\x2c\x02\x37\x02\x39\x02\x3b\x02\x3d\x02\x3f\x02\x41\x02\
-\x43\x02\xab\x01\x51\x01\x55\x01\x56\x01\x53\x01\x57\x01\x58\x01\
-\x59\x01\x5a\x00\x01\x00\x6d\x00\x05\x00\x0a\x00\x0d\x00\x12\x00\
-\x14\x00\x16\x00\x18\x00\x69\x00\x6c\x00\x6f\x00\x76\x00\x7a\x00\
-\x81\x00\x83\x00\x85\x00\x8a\x00\xc6\x00\xd2\x00\xd4\x00\xd6\x00\
-\xda\x00\xdb\x00\xdc\x00\xe1\x00\xe3\x00\xe5\x00\xfc\x01\x06\x01\
-\x17\x01\x1a\x01\x1c\x01\x1f\x01\x22\x01\x25\x01\x28\x01\x2b\x01\
-\x2e\x01\x49\x01\x4c\x01\x4f\x01\x5b\x01\x5d\x01\x5f\x01\x61\x01\
-\x63\x01\x6e\x01\x70\x01\x72\x01\x74\x01\x80\x01\x82\x01\x84\x01\
-\x8f\x01\x91\x01\x93\x01\x9e\x01\xa0\x01\xa2\x01\xa4\x01\xa7\x01\
-\xa9\x01\xb0\x01\xb2\x01\xb4\x01\xb7\x01\xb9\x01\xbb\x01\xc3\x01\
-\xc5\x01\xc7\x01\xc9\x01\xcb\x01\xd2\x01\xd4\x01\xd6\x01\xd8\x01\
-\xda\x01\xe1\x01\xe3\x01\xe5\x01\xed\x01\xef\x01\xf1\x01\xf4\x01\
-\xf6\x01\xf8\x01\xfe\x02\x02\x02\x05\x02\x13\x02\x15\x02\x17\x02\
-\x2b\x02\x36\x02\x38\x02\x3a\x02\x3c\x02\x3e\x02\x40\x02\x42\x02\
-\x8c\x02\xd3\x02\xd6\x02\xd7\x02\xd8\x02\xd9\x02\xde\x02\xdf\x02\
-\xe1\x00\x03\x00\x00\x00\x01\x00\x08\x00\x01\x02\x68\x00\x3e\x00\
-\x82\x00\x88\x00\x90\x00\x98\x00\xa0\x00\xa8\x00\xb0\x00\xb8\x00\
-\xc0\x00\xc8\x00\xd0\x00\xd8\x00\xe0\x00\xe8\x00\xf0\x00\xf8\x01\
-\x00\x01\x06\x01\x0c\x01\x12\x01\x18\x01\x20\x01\x28\x01\x30\x01\
-\x38\x01\x40\x01\x48\x01\x50\x01\x58\x01\x60\x01\x68\x01\x70\x01\
-\x78\x01\x82\x01\x8c\x01\x96\x01\x9e\x01\xa6\x01\xae\x01\xb6\x01\
-\xc0\x01\xc8\x01\xd0\x01\xd8\x01\xe0\x01\xe8\x01\xf0\x01\xf8\x02\
-\x00\x02\x08\x02\x10\x02\x18\x02\x20\x02\x28\x02\x30\x02\x36\x02\
-\x3c\x02\x44\x02\x4c\x02\x54\x02\x5c\x02\x62\x00\x02\x00\x14\x00\
-\x11\x00\x03\x00\x1d\x00\x1c\x00\x1b\x00\x03\x00\x22\x00\x21\x00\
-\x20\x00\x03\x00\x27\x00\x26\x00\x25\x00\x03\x00\x2c\x00\x2b\x00\
-\x2a\x00\x03\x00\x31\x00\x30\x00\x2f\x00\x03\x00\x38\x00\x37\x00\
-\x36\x00\x03\x00\x3c\x00\x3b\x00\x3a\x00\x03\x00\x42\x00\x41\x00\
-\x40\x00\x03\x00\x47\x00\x46\x00\x45\x00\x03\x00\x4c\x00\x4b\x00\
-\x4a\x00\x03\x00\x51\x00\x50\x00\x4f\x00\x03\x00\x56\x00\x55\x00\
-\x54\x00\x03\x00\x5b\x00\x5a\x00\x59\x00\x03\x00\x61\x00\x60\x00\
-\x5f\x00\x03\x00\x68\x00\x67\x00\x66\x00\x02\x00\x76\x00\x74\x00\
-\x02\x00\x7a\x00\x7b\x00\x02\x00\x81\x00\x7e\x00\x02\x00\x8a\x00\
-\x88\x00\x03\x00\x90\x00\x8f\x00\x8e\x00\x03\x00\x96\x00\x95\x00\
-\x94\x00\x03\x00\x9c\x00\x9b\x00\x9a\x00\x03\x00\xa1\x00\xa0\x00\
-\x9f\x00\x03\x00\xa6\x00\xa5\x00\xa4\x00\x03\x00\xab\x00\xaa\x00\
-\xa9\x00\x03\x00\xb0\x00\xaf\x00\xae\x00\x03\x00\xb5\x00\xb4\x00\
-\xb3\x00\x03\x00\xba\x00\xb9\x00\xb8\x00\x03\x00\xbf\x00\xbe\x00\
-\xbd\x00\x03\x00\xc3\x00\xc2\x00\xc1\x00\x03\x00\xcc\x00\xcb\x00\
-\xca\x00\x04\x00\xd6\x00\xd4\x00\xd2\x00\xd0\x00\x04\x00\xdc\x00\
-\xdb\x00\xda\x00\xd0\x00\x04\x00\xe5\x00\xe3\x00\xe1\x00\xdf\x00\
-\x03\x00\xec\x00\xeb\x00\xea\x00\x03\x00\xf1\x00\xf0\x00\xef\x00\
-\x03\x00\xf6\x00\xf5\x00\xf4\x00\x03\x00\xfb\x00\xfa\x00\xf9\x00\
-\x04\x01\x01\x01\x05\x01\x03\x01\x02\x00\x03\x01\x0d\x01\x0c\x01\
-\x0b\x00\x03\x01\x11\x01\x10\x01\x0f\x00\x03\x01\x16\x01\x15\x01\
-\x14\x00\x03\x00\x33\x00\x32\x01\x33\x00\x03\x01\x38\x01\x37\x01\
-\x36\x00\x03\x01\x3d\x01\x3c\x01\x3b\x00\x03\x01\x42\x01\x41\x01\
-\x40\x00\x03\x01\x48\x01\x47\x01\x46\x00\x03\x01\x6a\x01\x69\x01\
-\x68\x00\x03\x01\x7c\x01\x7b\x01\x7a\x00\x03\x01\x8b\x01\x8a\x01\
-\x89\x00\x03\x01\x9a\x01\x99\x01\x98\x00\x03\x01\xad\x01\xac\x01\
-\xb6\x00\x03\x01\xc0\x01\xbf\x01\xbe\x00\x02\x01\xcf\x01\xce\x00\
-\x02\x01\xde\x01\xdd\x00\x03\x02\x0f\x02\x0e\x02\x0d\x00\x03\x02\
-\x1e\x02\x1d\x02\x1c\x00\x03\x02\x27\x02\x26\x02\x25\x00\x03\x02\
-\x32\x02\x31\x02\x30\x00\x02\x02\x46\x02\x45\x00\x02\x02\x49\x02\
-\x48\x00\x01\x00\x3e\x00\x10\x00\x1a\x00\x1e\x00\x23\x00\x28\x00\
-\x2d\x00\x34\x00\x39\x00\x3e\x00\x43\x00\x48\x00\x4d\x00\x52\x00\
-\x57\x00\x5d\x00\x64\x00\x73\x00\x78\x00\x7d\x00\x87\x00\x8c\x00\
-\x92\x00\x98\x00\x9d\x00\xa2\x00\xa7\x00\xac\x00\xb1\x00\xb6\x00\
-\xbb\x00\xc0\x00\xc8\x00\xcf\x00\xd8\x00\xde\x00\xe8\x00\xed\x00\
-\xf2\x00\xf7\x01\x00\x01\x09\x01\x0e\x01\x12\x01\x31\x01\x34\x01\
-\x39\x01\x3e\x01\x44\x01\x67\x01\x79\x01\x88\x01\x97\x01\xab\x01\
-\xbd\x01\xcd\x01\xdc\x02\x0c\x02\x1b\x02\x24\x02\x2f\x02\x44\x02\
-\x47\x00\x04\x00\x00\x00\x01\x00\x08\x00\x01\x01\x12\x00\x0b\x00\
-\x1c\x00\x26\x00\x50\x00\x62\x00\x74\x00\x86\x00\x98\x00\xaa\x00\
-\xbc\x00\xce\x01\x08\x00\x01\x00\x04\x02\xe0\x00\x02\x02\xd9\x00\
-\x05\x00\x0c\x00\x12\x00\x18\x00\x1e\x00\x24\x02\xcf\x00\x02\x02\
-\xd3\x02\xcd\x00\x02\x02\xd4\x02\xce\x00\x02\x02\xd6\x02\xcc\x00\
-\x02\x02\xd7\x02\xd0\x00\x02\x02\xe1\x00\x02\x00\x06\x00\x0c\x02\
-\xd2\x00\x02\x02\xd5\x02\xd1\x00\x02\x02\xd8\x00\x02\x00\x06\x00\
-\x0c\x02\xcf\x00\x02\x02\xca\x02\xda\x00\x02\x02\xd9\x00\x02\x00\
-\x06\x00\x0c\x02\xcd\x00\x02\x02\xca\x02\xdb\x00\x02\x02\xd9\x00\
-\x02\x00\x06\x00\x0c\x02\xd2\x00\x02\x02\xcb\x02\xdc\x00\x02\x02\
-\xd9\x00\x02\x00\x06\x00\x0c\x02\xce\x00\x02\x02\xca\x02\xdd\x00\
-\x02\x02\xd9\x00\x02\x00\x06\x00\x0c\x02\xcc\x00\x02\x02\xca\x02\
-\xde\x00\x02\x02\xd9\x00\x02\x00\x06\x00\x0c\x02\xd1\x00\x02\x02\
-\xcb\x02\xdf\x00\x02\x02\xd9\x00\x07\x00\x10\x00\x16\x00\x1c\x00\
-\x22\x00\x28\x00\x2e\x00\x34\x02\xe0\x00\x02\x02\xc8\x02\xda\x00\
-\x02\x02\xd3\x02\xdb\x00\x02\x02\xd4\x02\xdc\x00\x02\x02\xd5\x02\
-\xdd\x00\x02\x02\xd6\x02\xde\x00\x02\x02\xd7\x02\xdf\x00\x02\x02\
-\xd8\x00\x01\x00\x04\x02\xd0\x00\x02\x02\xca\x00\x01\x00\x0b\x02\
-\xc8\x02\xca\x02\xcb\x02\xd3\x02\xd4\x02\xd5\x02\xd6\x02\xd7\x02\
-\xd8\x02\xd9\x02\xe1\x00\x06\x00\x08\x00\x02\x00\x0a\x00\x6e\x00\
-\x03\x00\x01\x00\x0e\x00\x01\x0e\x82\x00\x00\x00\x00\x00\x01\x00\
-\x29\x00\x05\x00\x07\x00\x0a\x00\x0c\x00\x0d\x00\x0f\x00\x10\x00\
-\x14\x00\x16\x00\x17\x00\x69\x00\x6b\x00\x6c\x00\x6e\x00\x6f\x00\
-\x73\x00\x76\x00\x78\x00\x7a\x00\x7d\x00\x87\x00\xfc\x00\xfe\x01\
-\x0e\x01\x17\x01\x1a\x01\x1c\x01\x1e\x01\x1f\x01\x21\x01\x31\x01\
-\x5b\x01\x5c\x01\x5d\x01\x5e\x01\x5f\x01\x60\x01\x61\x01\x62\x01\
-\x63\x01\x76\x00\x01\x0e\x1e\x00\x01\x00\x08\x00\x01\x00\x04\x00\
-\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x0d\x00\x01\x00\x00\x00\
-\x01\x00\x08\x00\x02\x00\x7a\x00\x3a\x00\x1d\x00\x22\x00\x27\x00\
-\x2c\x00\x31\x00\x38\x00\x3c\x00\x42\x00\x47\x00\x4c\x00\x51\x00\
-\x56\x00\x5b\x00\x61\x00\x68\x00\x90\x00\x96\x00\x9c\x00\xa1\x00\
-\xa6\x00\xab\x00\xb0\x00\xb5\x00\xba\x00\xbf\x00\xc3\x00\xcc\x00\
-\xd6\x00\xdc\x00\xe5\x00\xec\x00\xf1\x00\xf6\x00\xfb\x01\x05\x01\
-\x0d\x01\x11\x01\x16\x00\x33\x01\x38\x01\x3d\x01\x42\x01\x48\x01\
-\x6a\x01\x7c\x01\x8b\x01\x9a\x01\xad\x01\xc0\x01\xcf\x01\xde\x01\
-\xff\x02\x0f\x02\x1e\x02\x27\x02\x32\x02\x46\x02\x49\x00\x01\x00\
-\x3a\x00\x1a\x00\x1e\x00\x23\x00\x28\x00\x2d\x00\x34\x00\x39\x00\
-\x3e\x00\x43\x00\x48\x00\x4d\x00\x52\x00\x57\x00\x5d\x00\x64\x00\
-\x8c\x00\x92\x00\x98\x00\x9d\x00\xa2\x00\xa7\x00\xac\x00\xb1\x00\
-\xb6\x00\xbb\x00\xc0\x00\xc8\x00\xcf\x00\xd8\x00\xde\x00\xe8\x00\
-\xed\x00\xf2\x00\xf7\x01\x00\x01\x09\x01\x0e\x01\x12\x01\x31\x01\
-\x34\x01\x39\x01\x3e\x01\x44\x01\x67\x01\x79\x01\x88\x01\x97\x01\
-\xab\x01\xbd\x01\xcd\x01\xdc\x01\xfe\x02\x0c\x02\x1b\x02\x24\x02\
-\x2f\x02\x44\x02\x47\x00\x01\x00\x00\x00\x01\x00\x08\x00\x02\x00\
-\x84\x00\x3f\x00\x1c\x00\x21\x00\x26\x00\x2b\x00\x30\x00\x37\x00\
-\x3b\x00\x41\x00\x46\x00\x4b\x00\x50\x00\x55\x00\x5a\x00\x60\x00\
-\x67\x00\x8f\x00\x95\x00\x9b\x00\xa0\x00\xa5\x00\xaa\x00\xaf\x00\
-\xb4\x00\xb9\x00\xbe\x00\xc2\x00\xcb\x00\xd4\x00\xdb\x00\xe3\x00\
-\xeb\x00\xf0\x00\xf5\x00\xfa\x01\x03\x01\x0c\x01\x10\x01\x15\x00\
-\x32\x01\x37\x01\x3c\x01\x41\x01\x47\x01\x69\x01\x7b\x01\x8a\x01\
-\x99\x01\xac\x01\xbf\x01\xce\x01\xdd\x02\x0e\x02\x1d\x02\x26\x02\
-\x31\x01\x51\x01\x55\x01\x56\x01\x53\x01\x57\x01\x58\x01\x59\x01\
-\x5a\x00\x01\x00\x3f\x00\x1a\x00\x1e\x00\x23\x00\x28\x00\x2d\x00\
-\x34\x00\x39\x00\x3e\x00\x43\x00\x48\x00\x4d\x00\x52\x00\x57\x00\
-\x5d\x00\x64\x00\x8c\x00\x92\x00\x98\x00\x9d\x00\xa2\x00\xa7\x00\
-\xac\x00\xb1\x00\xb6\x00\xbb\x00\xc0\x00\xc8\x00\xcf\x00\xd8\x00\
-\xde\x00\xe8\x00\xed\x00\xf2\x00\xf7\x01\x00\x01\x09\x01\x0e\x01\
-\x12\x01\x31\x01\x34\x01\x39\x01\x3e\x01\x44\x01\x67\x01\x79\x01\
-\x88\x01\x97\x01\xab\x01\xbd\x01\xcd\x01\xdc\x02\x0c\x02\x1b\x02\
-\x24\x02\x2f\x02\xd3\x02\xd6\x02\xd7\x02\xd8\x02\xd9\x02\xde\x02\
-\xdf\x02\xe1\x00\x01\x00\x00\x00\x01\x00\x08\x00\x02\x01\x22\x00\
-\x8e\x00\x07\x00\x0c\x00\x0f\x00\x14\x00\x17\x00\x19\x00\x1b\x00\
-\x20\x00\x25\x00\x2a\x00\x2f\x00\x36\x00\x3a\x00\x40\x00\x45\x00\
-\x4a\x00\x4f\x00\x54\x00\x59\x00\x5f\x00\x66\x00\x6b\x00\x6e\x00\
-\x71\x00\x76\x00\x7a\x00\x81\x00\x8a\x00\x8e\x00\x94\x00\x9a\x00\
-\x9f\x00\xa4\x00\xa9\x00\xae\x00\xb3\x00\xb8\x00\xbd\x00\xc1\x00\
-\xc7\x00\xca\x00\xd2\x00\xda\x00\xe1\x00\xea\x00\xef\x00\xf4\x00\
-\xf9\x00\xfe\x01\x02\x01\x08\x01\x0b\x01\x0f\x01\x14\x01\x19\x01\
-\x1b\x01\x1e\x01\x21\x01\x24\x01\x27\x01\x2a\x01\x2d\x01\x30\x01\
-\x33\x01\x36\x01\x3b\x01\x40\x01\x46\x01\x4b\x01\x4e\x01\x50\x01\
-\x5c\x01\x5e\x01\x60\x01\x62\x01\x76\x01\x68\x01\x6f\x01\x71\x01\
-\x73\x01\x75\x01\x7a\x01\x81\x01\x83\x01\x85\x01\x89\x01\x90\x01\
-\x92\x01\x94\x01\x98\x01\x9f\x01\xa1\x01\xa3\x01\xa5\x01\xa8\x01\
-\xaa\x01\xb6\x01\xb1\x01\xb3\x01\xb5\x01\xb8\x01\xba\x01\xbc\x01\
-\xbe\x01\xc4\x01\xc6\x01\xc8\x01\xca\x01\xcc\x01\xd3\x01\xd5\x01\
-\xd7\x01\xd9\x01\xdb\x01\xe2\x01\xe4\x01\xe6\x01\xee\x01\xf0\x01\
-\xf2\x01\xf5\x01\xf7\x01\xf9\x02\x03\x02\x06\x02\x0d\x02\x14\x02\
-\x16\x02\x18\x02\x1c\x02\x25\x02\x2c\x02\x30\x02\x37\x02\x39\x02\
-\x3b\x02\x3d\x02\x3f\x02\x41\x02\x43\x02\x45\x02\x48\x00\x01\x00\
-\x8e\x00\x05\x00\x0a\x00\x0d\x00\x10\x00\x16\x00\x18\x00\x1a\x00\
-\x1e\x00\x23\x00\x28\x00\x2d\x00\x34\x00\x39\x00\x3e\x00\x43\x00\
-\x48\x00\x4d\x00\x52\x00\x57\x00\x5d\x00\x64\x00\x69\x00\x6c\x00\
-\x6f\x00\x73\x00\x78\x00\x7d\x00\x87\x00\x8c\x00\x92\x00\x98\x00\
-\x9d\x00\xa2\x00\xa7\x00\xac\x00\xb1\x00\xb6\x00\xbb\x00\xc0\x00\
-\xc6\x00\xc8\x00\xcf\x00\xd8\x00\xde\x00\xe8\x00\xed\x00\xf2\x00\
-\xf7\x00\xfc\x01\x00\x01\x06\x01\x09\x01\x0e\x01\x12\x01\x17\x01\
-\x1a\x01\x1c\x01\x1f\x01\x22\x01\x25\x01\x28\x01\x2b\x01\x2e\x01\
-\x31\x01\x34\x01\x39\x01\x3e\x01\x44\x01\x49\x01\x4c\x01\x4f\x01\
-\x5b\x01\x5d\x01\x5f\x01\x61\x01\x63\x01\x67\x01\x6e\x01\x70\x01\
-\x72\x01\x74\x01\x79\x01\x80\x01\x82\x01\x84\x01\x88\x01\x8f\x01\
-\x91\x01\x93\x01\x97\x01\x9e\x01\xa0\x01\xa2\x01\xa4\x01\xa7\x01\
-\xa9\x01\xab\x01\xb0\x01\xb2\x01\xb4\x01\xb7\x01\xb9\x01\xbb\x01\
-\xbd\x01\xc3\x01\xc5\x01\xc7\x01\xc9\x01\xcb\x01\xd2\x01\xd4\x01\
-\xd6\x01\xd8\x01\xda\x01\xe1\x01\xe3\x01\xe5\x01\xed\x01\xef\x01\
-\xf1\x01\xf4\x01\xf6\x01\xf8\x02\x02\x02\x05\x02\x0c\x02\x13\x02\
-\x15\x02\x17\x02\x1b\x02\x24\x02\x2b\x02\x2f\x02\x36\x02\x38\x02\
-\x3a\x02\x3c\x02\x3e\x02\x40\x02\x42\x02\x44\x02\x47\x00\x04\x00\
-\x08\x00\x01\x00\x08\x00\x01\x00\x72\x00\x04\x01\xca\x00\x0e\x00\
-\x18\x00\x44\x00\x01\x00\x04\x01\x64\x00\x02\x01\x33\x00\x06\x00\
-\x0e\x00\x14\x00\x1a\x00\x20\x00\x26\x06\xd6\x01\x5c\x00\x02\x00\
-\x07\x01\x5e\x00\x02\x00\x0c\x01\x60\x00\x02\x00\x0f\x01\x62\x00\
-\x02\x00\x14\x01\x76\x00\x02\x00\x17\x00\x07\x06\xe8\x00\x10\x00\
-\x16\x00\x1c\x00\x22\x00\x28\x07\x24\x01\x5b\x00\x02\x00\x07\x01\
-\x5d\x00\x02\x00\x0c\x01\x5f\x00\x02\x00\x0f\x01\x61\x00\x02\x00\
-\x14\x01\x63\x00\x02\x00\x17\x00\x01\x00\x04\x00\x05\x00\x1c\x00\
-\xf0\x00\xf1\x00\x01\x00\x00\x00\x01\x00\x08\x00\x02\x00\x1e\x00\
-\x0c\x00\xd0\x00\xd3\x00\xd5\x00\xd7\x00\xd0\x00\xd3\x00\xd5\x00\
-\xd7\x00\xdf\x00\xe2\x00\xe4\x00\xe6\x00\x01\x00\x0c\x00\xcf\x00\
-\xd2\x00\xd4\x00\xd6\x00\xd8\x00\xda\x00\xdb\x00\xdc\x00\xde\x00\
-\xe1\x00\xe3\x00\xe5\x00\x06\x00\x00\x00\x03\x00\x0c\x00\x48\x00\
-\x66\x00\x03\x00\x00\x00\x01\x00\x12\x00\x01\x00\x2a\x00\x01\x00\
-\x00\x00\x0e\x00\x01\x00\x0a\x00\x73\x00\x76\x00\x78\x00\x7a\x00\
-\x7d\x00\x81\x00\x83\x00\x85\x00\x87\x00\x8a\x00\x01\x00\x07\x00\
-\x0d\x00\x22\x00\x27\x00\x31\x00\xac\x01\x38\x01\x42\x00\x03\x00\
-\x01\x00\x14\x00\x01\x00\x32\x00\x01\x00\x14\x00\x01\x00\x00\x00\
-\x0e\x00\x02\x00\x01\x02\x4f\x02\x64\x00\x00\x00\x03\x00\x01\x00\
-\x1a\x00\x01\x00\x14\x00\x01\x00\x1a\x00\x01\x00\x00\x00\x0e\x00\
-\x01\x00\x01\x02\x8c\x00\x02\x00\x01\x02\x65\x02\x6e\x00\x00\x00\
-\x04\x00\x08\x00\x01\x00\x08\x00\x01\x00\x1a\x00\x01\x00\x08\x00\
-\x01\x00\x04\x02\x4c\x00\x06\x00\xed\x00\x4d\x00\x05\x00\xed\x01\
-\x00\x00\x01\x00\x01\x00\x4d\x00\x04\x00\x08\x00\x01\x00\x08\x00\
-\x01\x07\xbe\x00\x25\x00\x50\x00\x5e\x00\xa8\x00\xda\x01\x24\x01\
-\x56\x01\x88\x01\xa2\x01\xec\x02\x1e\x02\x68\x02\x9a\x02\xb4\x02\
-\xc6\x03\x08\x03\x4a\x03\x8c\x03\xce\x04\x08\x04\x4a\x04\x84\x04\
-\xc6\x04\xe0\x04\xfa\x05\x14\x05\x2e\x05\x38\x05\x52\x05\x6c\x05\
-\x86\x06\x00\x06\x12\x06\x5c\x06\x8e\x06\xc0\x06\xda\x07\x54\x00\
-\x01\x00\x04\x02\x4a\x00\x04\x00\xf1\x00\xf0\x01\x02\x00\x09\x00\
-\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x00\x32\x00\x38\x00\x3e\x00\
-\x44\x01\x65\x00\x02\x00\x76\x01\x66\x00\x02\x00\x7a\x01\x68\x00\
-\x02\x00\xf4\x01\x69\x00\x02\x00\xf5\x01\x6b\x00\x02\x00\xf9\x01\
-\x6c\x00\x02\x01\x03\x01\x6f\x00\x02\x01\x33\x01\x71\x00\x02\x01\
-\x36\x01\x73\x00\x02\x01\x3b\x00\x06\x00\x0e\x00\x14\x00\x1a\x00\
-\x20\x00\x26\x00\x2c\x01\x67\x00\x02\x00\xf4\x01\x6a\x00\x02\x00\
-\xf5\x01\x6d\x00\x02\x01\x03\x01\x6e\x00\x02\x01\x33\x01\x70\x00\
-\x02\x01\x36\x01\x72\x00\x02\x01\x3b\x00\x09\x00\x14\x00\x1a\x00\
-\x20\x00\x26\x00\x2c\x00\x32\x00\x38\x00\x3e\x00\x44\x01\x77\x00\
-\x02\x00\x76\x01\x78\x00\x02\x00\x7a\x01\x7a\x00\x02\x00\xf4\x01\
-\x7b\x00\x02\x00\xf5\x01\x7d\x00\x02\x00\xf9\x01\x7e\x00\x02\x01\
-\x03\x01\x81\x00\x02\x01\x33\x01\x83\x00\x02\x01\x36\x01\x85\x00\
-\x02\x01\x3b\x00\x06\x00\x0e\x00\x14\x00\x1a\x00\x20\x00\x26\x00\
-\x2c\x01\x79\x00\x02\x00\xf4\x01\x7c\x00\x02\x00\xf5\x01\x7f\x00\
-\x02\x01\x03\x01\x80\x00\x02\x01\x33\x01\x82\x00\x02\x01\x36\x01\
-\x84\x00\x02\x01\x3b\x00\x06\x00\x0e\x00\x14\x00\x1a\x00\x20\x00\
-\x26\x00\x2c\x02\x19\x00\x02\x00\x76\x02\x1a\x00\x02\x00\x7a\x02\
-\x1c\x00\x02\x00\xf4\x02\x1d\x00\x02\x00\xf5\x02\x1f\x00\x02\x00\
-\xf9\x02\x20\x00\x02\x01\x03\x00\x03\x00\x08\x00\x0e\x00\x14\x02\
-\x1b\x00\x02\x00\xf4\x02\x1e\x00\x02\x00\xf5\x02\x21\x00\x02\x01\
-\x03\x00\x09\x00\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x00\x32\x00\
-\x38\x00\x3e\x00\x44\x01\x86\x00\x02\x00\x76\x01\x87\x00\x02\x00\
-\x7a\x01\x89\x00\x02\x00\xf4\x01\x8a\x00\x02\x00\xf5\x01\x8c\x00\
-\x02\x00\xf9\x01\x8d\x00\x02\x01\x03\x01\x90\x00\x02\x01\x33\x01\
-\x92\x00\x02\x01\x36\x01\x94\x00\x02\x01\x3b\x00\x06\x00\x0e\x00\
-\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x01\x88\x00\x02\x00\xf4\x01\
-\x8b\x00\x02\x00\xf5\x01\x8e\x00\x02\x01\x03\x01\x8f\x00\x02\x01\
-\x33\x01\x91\x00\x02\x01\x36\x01\x93\x00\x02\x01\x3b\x00\x09\x00\
-\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x00\x32\x00\x38\x00\x3e\x00\
-\x44\x01\x95\x00\x02\x00\x76\x01\x96\x00\x02\x00\x7a\x01\x98\x00\
-\x02\x00\xf4\x01\x99\x00\x02\x00\xf5\x01\x9b\x00\x02\x00\xf9\x01\
-\x9c\x00\x02\x01\x03\x01\x9f\x00\x02\x01\x33\x01\xa1\x00\x02\x01\
-\x36\x01\xa3\x00\x02\x01\x3b\x00\x06\x00\x0e\x00\x14\x00\x1a\x00\
-\x20\x00\x26\x00\x2c\x01\x97\x00\x02\x00\xf4\x01\x9a\x00\x02\x00\
-\xf5\x01\x9d\x00\x02\x01\x03\x01\x9e\x00\x02\x01\x33\x01\xa0\x00\
-\x02\x01\x36\x01\xa2\x00\x02\x01\x3b\x00\x03\x00\x08\x00\x0e\x00\
-\x14\x01\xa5\x00\x02\x01\x33\x01\xa6\x00\x02\x01\x36\x01\xa8\x00\
-\x02\x01\x3b\x00\x02\x00\x06\x00\x0c\x01\xa4\x00\x02\x01\x33\x01\
-\xa7\x00\x02\x01\x3b\x00\x08\x00\x12\x00\x18\x00\x1e\x00\x24\x00\
-\x2a\x00\x30\x00\x36\x00\x3c\x01\xaa\x00\x02\x00\x76\x01\xb5\x00\
-\x02\x00\x7a\x01\xb6\x00\x02\x00\xf4\x01\xac\x00\x02\x00\xf5\x01\
-\xae\x00\x02\x01\x03\x01\xb1\x00\x02\x01\x33\x01\xb3\x00\x02\x01\
-\x36\x01\xb8\x00\x02\x01\x3b\x00\x08\x00\x12\x00\x18\x00\x1e\x00\
-\x24\x00\x2a\x00\x30\x00\x36\x00\x3c\x01\xa9\x00\x02\x00\x76\x01\
-\xb4\x00\x02\x00\x7a\x01\xab\x00\x02\x00\xf4\x01\xad\x00\x02\x00\
-\xf5\x01\xaf\x00\x02\x01\x03\x01\xb0\x00\x02\x01\x33\x01\xb2\x00\
-\x02\x01\x36\x01\xb7\x00\x02\x01\x3b\x00\x08\x00\x12\x00\x18\x00\
-\x1e\x00\x24\x00\x2a\x00\x30\x00\x36\x00\x3c\x01\xba\x00\x02\x00\
-\x76\x01\xbc\x00\x02\x00\x7a\x01\xbe\x00\x02\x00\xf4\x01\xbf\x00\
-\x02\x00\xf5\x01\xc1\x00\x02\x01\x03\x01\xc4\x00\x02\x01\x33\x01\
-\xc6\x00\x02\x01\x36\x01\xc8\x00\x02\x01\x3b\x00\x08\x00\x12\x00\
-\x18\x00\x1e\x00\x24\x00\x2a\x00\x30\x00\x36\x00\x3c\x01\xb9\x00\
-\x02\x00\x76\x01\xbb\x00\x02\x00\x7a\x01\xbd\x00\x02\x00\xf4\x01\
-\xc0\x00\x02\x00\xf5\x01\xc2\x00\x02\x01\x03\x01\xc3\x00\x02\x01\
-\x33\x01\xc5\x00\x02\x01\x36\x01\xc7\x00\x02\x01\x3b\x00\x07\x00\
-\x10\x00\x16\x00\x1c\x00\x22\x00\x28\x00\x2e\x00\x34\x01\xca\x00\
-\x02\x00\x76\x01\xcc\x00\x02\x00\x7a\x01\xce\x00\x02\x00\xf5\x01\
-\xd0\x00\x02\x01\x03\x01\xd3\x00\x02\x01\x33\x01\xd5\x00\x02\x01\
-\x36\x01\xd7\x00\x02\x01\x3b\x00\x08\x00\x12\x00\x18\x00\x1e\x00\
-\x24\x00\x2a\x00\x30\x00\x36\x00\x3c\x01\xc9\x00\x02\x00\x76\x01\
-\xcb\x00\x02\x00\x7a\x01\xcd\x00\x02\x00\xf4\x01\xcf\x00\x02\x00\
-\xf5\x01\xd1\x00\x02\x01\x03\x01\xd2\x00\x02\x01\x33\x01\xd4\x00\
-\x02\x01\x36\x01\xd6\x00\x02\x01\x3b\x00\x07\x00\x10\x00\x16\x00\
-\x1c\x00\x22\x00\x28\x00\x2e\x00\x34\x01\xd9\x00\x02\x00\x76\x01\
-\xdb\x00\x02\x00\x7a\x01\xdd\x00\x02\x00\xf5\x01\xdf\x00\x02\x01\
-\x03\x01\xe2\x00\x02\x01\x33\x01\xe4\x00\x02\x01\x36\x01\xe6\x00\
-\x02\x01\x3b\x00\x08\x00\x12\x00\x18\x00\x1e\x00\x24\x00\x2a\x00\
-\x30\x00\x36\x00\x3c\x01\xd8\x00\x02\x00\x76\x01\xda\x00\x02\x00\
-\x7a\x01\xdc\x00\x02\x00\xf4\x01\xde\x00\x02\x00\xf5\x01\xe0\x00\
-\x02\x01\x03\x01\xe1\x00\x02\x01\x33\x01\xe3\x00\x02\x01\x36\x01\
-\xe5\x00\x02\x01\x3b\x00\x03\x00\x08\x00\x0e\x00\x14\x01\xe7\x00\
-\x02\x01\x33\x01\xe8\x00\x02\x01\x36\x01\xe9\x00\x02\x01\x3b\x00\
-\x03\x00\x08\x00\x0e\x00\x14\x01\xea\x00\x02\x01\x33\x01\xeb\x00\
-\x02\x01\x36\x01\xec\x00\x02\x01\x3b\x00\x03\x00\x08\x00\x0e\x00\
-\x14\x01\xee\x00\x02\x01\x33\x01\xf0\x00\x02\x01\x36\x01\xf2\x00\
-\x02\x01\x3b\x00\x03\x00\x08\x00\x0e\x00\x14\x01\xed\x00\x02\x01\
-\x33\x01\xef\x00\x02\x01\x36\x01\xf1\x00\x02\x01\x3b\x00\x01\x00\
-\x04\x01\xf3\x00\x02\x01\x36\x00\x03\x00\x08\x00\x0e\x00\x14\x01\
-\xf5\x00\x02\x01\x33\x01\xf7\x00\x02\x01\x36\x01\xf9\x00\x02\x01\
-\x3b\x00\x03\x00\x08\x00\x0e\x00\x14\x01\xf4\x00\x02\x01\x33\x01\
-\xf6\x00\x02\x01\x36\x01\xf8\x00\x02\x01\x3b\x00\x03\x00\x08\x00\
-\x0e\x00\x14\x01\x75\x00\x02\x01\x33\x02\x03\x00\x02\x01\x36\x02\
-\x06\x00\x02\x01\x3b\x00\x0d\x00\x1c\x00\x24\x00\x2c\x00\x34\x00\
-\x3c\x00\x44\x00\x4c\x00\x54\x00\x5c\x00\x62\x00\x68\x00\x6e\x00\
-\x74\x01\xfa\x00\x03\x00\x21\x00\xf4\x01\xfb\x00\x03\x00\x26\x00\
-\xf4\x02\x01\x00\x03\x00\x32\x00\xf4\x01\xfc\x00\x03\x00\x37\x00\
-\xf4\x01\xfd\x00\x03\x00\x41\x00\xf4\x02\x00\x00\x03\x00\xfa\x00\
-\xf4\x02\x04\x00\x03\x01\x37\x00\xf4\x02\x07\x00\x03\x01\x3c\x00\
-\xf4\x01\xfe\x00\x02\x00\xf4\x01\xff\x00\x02\x00\xf5\x01\x74\x00\
-\x02\x01\x33\x02\x02\x00\x02\x01\x36\x02\x05\x00\x02\x01\x3b\x00\
-\x02\x00\x06\x00\x0c\x02\x08\x00\x02\x00\x76\x02\x09\x00\x02\x00\
-\x7a\x00\x09\x00\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x00\x32\x00\
-\x38\x00\x3e\x00\x44\x02\x0a\x00\x02\x00\x76\x02\x0b\x00\x02\x00\
-\x7a\x02\x0d\x00\x02\x00\xf4\x02\x0e\x00\x02\x00\xf5\x02\x10\x00\
-\x02\x00\xf9\x02\x11\x00\x02\x01\x03\x02\x14\x00\x02\x01\x33\x02\
-\x16\x00\x02\x01\x36\x02\x18\x00\x02\x01\x3b\x00\x06\x00\x0e\x00\
-\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x02\x0c\x00\x02\x00\xf4\x02\
-\x0f\x00\x02\x00\xf5\x02\x12\x00\x02\x01\x03\x02\x13\x00\x02\x01\
-\x33\x02\x15\x00\x02\x01\x36\x02\x17\x00\x02\x01\x3b\x00\x06\x00\
-\x0e\x00\x14\x00\x1a\x00\x20\x00\x26\x00\x2c\x02\x22\x00\x02\x00\
-\x76\x02\x23\x00\x02\x00\x7a\x02\x25\x00\x02\x00\xf4\x02\x26\x00\
-\x02\x00\xf5\x02\x28\x00\x02\x00\xf9\x02\x29\x00\x02\x01\x03\x00\
-\x03\x00\x08\x00\x0e\x00\x14\x02\x24\x00\x02\x00\xf4\x02\x27\x00\
-\x02\x00\xf5\x02\x2a\x00\x02\x01\x03\x00\x0f\x00\x20\x00\x26\x00\
-\x2c\x00\x32\x00\x38\x00\x3e\x00\x44\x00\x4a\x00\x50\x00\x56\x00\
-\x5c\x00\x62\x00\x68\x00\x6e\x00\x74\x02\x2c\x00\x02\x00\x07\x02\
-\x2d\x00\x02\x00\x76\x02\x2e\x00\x02\x00\x7a\x02\x30\x00\x02\x00\
-\xf4\x02\x31\x00\x02\x00\xf5\x02\x33\x00\x02\x00\xf9\x02\x34\x00\
-\x02\x01\x03\x02\x37\x00\x02\x01\x1e\x02\x39\x00\x02\x01\x24\x02\
-\x3b\x00\x02\x01\x27\x02\x3d\x00\x02\x01\x2a\x02\x3f\x00\x02\x01\
-\x33\x02\x41\x00\x02\x01\x36\x02\x43\x00\x02\x01\x3b\x02\x45\x00\
-\x02\x01\x46\x00\x0d\x00\x1c\x00\x22\x00\x28\x00\x2e\x00\x34\x00\
-\x3a\x00\x40\x00\x46\x00\x4c\x00\x52\x00\x58\x00\x5e\x00\x64\x02\
-\x2b\x00\x02\x00\x07\x02\x2f\x00\x02\x00\xf4\x02\x32\x00\x02\x00\
-\xf5\x02\x35\x00\x02\x01\x03\x02\x36\x00\x02\x01\x1e\x02\x38\x00\
-\x02\x01\x24\x02\x3a\x00\x02\x01\x27\x02\x3c\x00\x02\x01\x2a\x02\
-\x3e\x00\x02\x01\x33\x02\x40\x00\x02\x01\x36\x02\x42\x00\x02\x01\
-\x3b\x02\x44\x00\x02\x01\x46\x02\x46\x00\x02\x01\x47\x00\x01\x00\
-\x25\x00\x05\x00\x21\x00\x22\x00\x26\x00\x27\x00\x32\x00\x33\x00\
-\x37\x00\x38\x00\x41\x00\x42\x00\x67\x00\x68\x00\x8f\x00\x90\x00\
-\x95\x00\x96\x00\x9b\x00\x9c\x00\xa0\x00\xa1\x00\xba\x00\xcc\x00\
-\xd4\x00\xd6\x00\xdc\x00\xe3\x00\xe5\x00\xf0\x00\xf1\x00\xf5\x00\
-\xfa\x00\xfb\x01\x37\x01\x38\x01\x3c\x01\x3d\x00\x01\x00\x00\x00\
-\x01\x00\x08\x00\x01\x00\x06\x00\x01\x00\x01\x00\x03\x00\x10\x00\
-\x12\x00\x14\x00\x01\x00\x08\x00\x01\x00\x08\x00\x01\x00\x06\x00\
-\x01\x00\x01\x00\x01\x01\x00\x00\x01\x00\x00\x00\x01\x00\x08\x00\
-\x02\x00\x1c\x00\x0b\x00\x74\x00\x77\x00\x7b\x00\x7c\x00\x7e\x00\
-\x82\x00\x84\x00\x86\x00\x88\x00\x8b\x02\xab\x00\x01\x00\x0b\x00\
-\x73\x00\x76\x00\x78\x00\x7a\x00\x7d\x00\x81\x00\x83\x00\x85\x00\
-\x87\x00\x8a\x02\x8c\x00\x00\x00\x01\x00\x00\x00\x0a\x00\x58\x00\
-\x9c\x00\x03\x44\x46\x4c\x54\x00\x14\x61\x72\x61\x62\x00\x22\x6c\
-\x61\x74\x6e\x00\x40\x00\x04\x00\x00\x00\x00\xff\xff\x00\x02\x00\
-\x00\x00\x04\x00\x0a\x00\x01\x55\x52\x44\x20\x00\x14\x00\x00\xff\
-\xff\x00\x02\x00\x01\x00\x05\x00\x00\xff\xff\x00\x02\x00\x02\x00\
-\x06\x00\x04\x00\x00\x00\x00\xff\xff\x00\x02\x00\x03\x00\x07\x00\
-\x08\x6d\x61\x72\x6b\x00\x32\x6d\x61\x72\x6b\x00\x32\x6d\x61\x72\
-\x6b\x00\x32\x6d\x61\x72\x6b\x00\x32\x6d\x6b\x6d\x6b\x00\x3c\x6d\
-\x6b\x6d\x6b\x00\x3c\x6d\x6b\x6d\x6b\x00\x3c\x6d\x6b\x6d\x6b\x00\
-\x3c\x00\x00\x00\x03\x00\x00\x00\x01\x00\x02\x00\x00\x00\x02\x00\
-\x03\x00\x04\x00\x05\x00\x0c\x01\x3a\x10\x4e\x25\x94\x26\xd6\x00\
-\x04\x00\x00\x00\x01\x00\x08\x00\x01\x00\x0c\x00\x34\x00\x02\x00\
-\x3a\x01\x14\x00\x02\x00\x06\x02\xad\x02\xb4\x00\x00\x02\xb6\x02\
-\xbb\x00\x08\x02\xbd\x02\xc0\x00\x0e\x02\xc2\x02\xc2\x00\x12\x02\
-\xc4\x02\xc5\x00\x13\x02\xc8\x02\xe8\x00\x15\x00\x01\x00\x01\x02\
-\xa3\x00\x36\x00\x01\x28\x00\x00\x01\x28\x06\x00\x01\x28\x0c\x00\
-\x01\x28\x12\x00\x01\x28\x18\x00\x01\x28\x1e\x00\x01\x28\x24\x00\
-\x00\x25\xcc\x00\x01\x28\x2a\x00\x00\x25\xd2\x00\x01\x28\x30\x00\
-\x00\x25\xd8\x00\x01\x28\x36\x00\x00\x25\xde\x00\x01\x28\x3c\x00\
-\x00\x25\xe4\x00\x01\x28\x42\x00\x00\x25\xea\x00\x01\x28\x48\x00\
-\x01\x28\x4e\x00\x01\x28\x54\x00\x01\x28\x5a\x00\x00\x25\xf0\x00\
-\x01\x28\x78\x00\x00\x25\xf6\x00\x01\x28\x60\x00\x01\x28\x66\x00\
-\x01\x28\x6c\x00\x01\x28\x72\x00\x01\x28\x78\x00\x00\x25\xfc\x00\
-\x00\x26\x02\x00\x01\x28\x7e\x00\x01\x28\x84\x00\x00\x26\x08\x00\
-\x01\x28\x8a\x00\x01\x28\x90\x00\x00\x26\x0e\x00\x01\x28\x96\x00\
-\x01\x28\x9c\x00\x01\x28\xa2\x00\x01\x28\xa8\x00\x01\x28\xae\x00\
-\x01\x28\xb4\x00\x01\x28\xba\x00\x01\x28\xc0\x00\x01\x28\xc6\x00\
-\x01\x28\xcc\x00\x01\x28\xd2\x00\x01\x28\xd8\x00\x01\x28\xde\x00\
-\x01\x28\xe4\x00\x01\x28\xea\x00\x01\x28\xf0\x00\x01\x00\x06\x00\
-\x0c\x00\x01\x00\xb9\x01\x8d\x00\x01\x00\xb9\x03\x05\x00\x04\x00\
-\x00\x00\x01\x00\x08\x00\x01\x0f\x20\x00\x0c\x00\x03\x0f\x46\x00\
-\x2e\x00\x02\x00\x05\x00\x02\x01\x03\x00\x00\x01\x05\x01\x13\x01\
-\x02\x01\x15\x01\x51\x01\x11\x01\x53\x01\x5a\x01\x4e\x02\x79\x02\
-\x7a\x01\x56\x01\x58\x08\x18\x08\x1e\x00\x00\x00\x00\x08\x12\x00\
-\x00\x08\x18\x08\x1e\x00\x00\x08\x24\x08\x48\x00\x00\x08\x24\x08\
-\x48\x00\x00\x21\x26\x21\x2c\x00\x00\x08\x60\x08\x2a\x00\x00\x08\
-\x6c\x08\x30\x00\x00\x08\x60\x08\x36\x00\x00\x08\x60\x08\x36\x00\
-\x00\x08\x6c\x08\x3c\x00\x00\x08\x42\x08\x48\x00\x00\x08\x42\x08\
-\x48\x00\x00\x08\x4e\x21\x2c\x00\x00\x08\x60\x08\x54\x00\x00\x08\
-\x60\x08\x54\x00\x00\x08\x60\x08\x54\x00\x00\x08\x60\x08\x54\x00\
-\x00\x08\x6c\x08\x5a\x00\x00\x08\x6c\x08\x5a\x00\x00\x08\x60\x08\
-\x66\x00\x00\x08\x6c\x08\x72\x00\x00\x00\x00\x08\x78\x00\x00\x21\
-\x26\x21\x2c\x00\x00\x09\x44\x08\xc0\x00\x00\x09\x50\x08\xcc\x00\
-\x00\x23\xce\x23\xd4\x00\x00\x0e\x24\x0e\x60\x00\x00\x08\x7e\x08\
-\xc0\x00\x00\x08\x7e\x08\xc0\x00\x00\x08\x84\x08\xcc\x00\x00\x08\
-\x8a\x23\xd4\x00\x00\x08\x90\x0e\x60\x00\x00\x08\x96\x08\xc0\x00\
-\x00\x08\x96\x08\xc0\x00\x00\x08\x9c\x08\xcc\x00\x00\x08\xa2\x23\
-\xd4\x00\x00\x08\xa8\x0e\x60\x00\x00\x08\xae\x08\xc0\x00\x00\x08\
-\xae\x08\xc0\x00\x00\x08\xb4\x08\xcc\x00\x00\x23\x62\x23\xd4\x00\
-\x00\x0e\x5a\x0e\x60\x00\x00\x08\xba\x08\xc0\x00\x00\x08\xba\x08\
-\xc0\x00\x00\x08\xc6\x08\xcc\x00\x00\x08\xd2\x23\xd4\x00\x00\x08\
-\xd8\x0e\x60\x00\x00\x23\xce\x23\xd4\x00\x00\x0e\x24\x0e\x60\x00\
-\x00\x09\x44\x08\xde\x00\x00\x09\x44\x08\xde\x00\x00\x09\x50\x08\
-\xe4\x00\x00\x23\xce\x08\xea\x00\x00\x0e\x24\x08\xf0\x00\x00\x00\
-\x00\x08\xf6\x00\x00\x00\x00\x08\xfc\x00\x00\x00\x00\x09\x02\x00\
-\x00\x00\x00\x09\x08\x00\x00\x09\x44\x09\x0e\x00\x00\x09\x44\x09\
-\x14\x00\x00\x09\x44\x09\x14\x00\x00\x09\x50\x09\x1a\x00\x00\x23\
-\xce\x09\x20\x00\x00\x0e\x24\x09\x26\x00\x00\x09\x44\x09\x2c\x00\
-\x00\x09\x44\x09\x2c\x00\x00\x09\x50\x09\x32\x00\x00\x23\xce\x09\
-\x38\x00\x00\x0e\x24\x09\x3e\x00\x00\x09\x44\x09\x4a\x00\x00\x09\
-\x44\x09\x4a\x00\x00\x09\x50\x09\x56\x00\x00\x23\xce\x09\x5c\x00\
-\x00\x0e\x24\x09\x62\x00\x00\x09\xaa\x09\x8c\x09\xb6\x09\xaa\x09\
-\x8c\x09\xb6\x09\xbc\x09\x92\x09\xc8\x09\x68\x09\x98\x00\x00\x09\
-\x6e\x09\x98\x00\x00\x09\xaa\x09\x8c\x09\xb6\x09\xaa\x09\x8c\x09\
-\xb6\x09\xbc\x09\x92\x09\xc8\x09\x74\x09\x98\x00\x00\x09\x7a\x09\
-\x98\x00\x00\x09\xaa\x09\x8c\x09\xb6\x09\xaa\x09\x8c\x09\xb6\x09\
-\xbc\x09\x92\x09\xc8\x09\x80\x09\x98\x00\x00\x09\x86\x09\x98\x00\
-\x00\x09\xaa\x09\xb0\x09\xb6\x09\xaa\x09\x8c\x09\xb6\x09\xaa\x09\
-\x8c\x09\xb6\x09\xbc\x09\x92\x09\xc8\x09\xce\x09\x98\x00\x00\x09\
-\xd4\x09\x98\x00\x00\x09\xaa\x09\x9e\x09\xb6\x09\xaa\x09\xa4\x09\
-\xb6\x09\xaa\x09\xb0\x09\xb6\x09\xaa\x09\xb0\x09\xb6\x09\xbc\x09\
-\xc2\x09\xc8\x09\xce\x09\xda\x00\x00\x09\xd4\x09\xda\x00\x00\x0a\
-\x0a\x09\xe0\x00\x00\x0a\x0a\x09\xe0\x00\x00\x09\xfe\x09\xe6\x00\
-\x00\x0a\x0a\x09\xec\x00\x00\x0a\x0a\x09\xec\x00\x00\x09\xfe\x09\
-\xf2\x00\x00\x0a\x0a\x09\xf8\x00\x00\x0a\x0a\x09\xf8\x00\x00\x09\
-\xfe\x0a\x04\x00\x00\x0a\x0a\x0a\x10\x00\x00\x0a\x76\x0a\x1c\x00\
-\x00\x0a\x6a\x0a\x16\x00\x00\x0a\x76\x0a\x1c\x00\x00\x21\x60\x21\
-\x40\x00\x00\x0a\x88\x0a\x22\x00\x00\x0a\x76\x0a\x58\x00\x00\x0a\
-\x76\x0a\x58\x00\x00\x21\x60\x21\x66\x00\x00\x0a\x88\x0a\x28\x00\
-\x00\x0a\x6a\x0a\x64\x00\x00\x0a\x76\x0a\x2e\x00\x00\x0a\x6a\x0a\
-\x34\x00\x00\x0a\x76\x0a\x2e\x00\x00\x0a\x6a\x0a\x34\x00\x00\x21\
-\x60\x0a\x3a\x00\x00\x0a\x88\x0a\x40\x00\x00\x0a\x76\x0a\x46\x00\
-\x00\x0a\x6a\x0a\x4c\x00\x00\x0a\x52\x0a\x58\x00\x00\x0a\x5e\x0a\
-\x64\x00\x00\x0a\x76\x0a\x7c\x00\x00\x0a\x6a\x0a\x70\x00\x00\x0a\
-\x76\x0a\x7c\x00\x00\x21\x60\x0a\x82\x00\x00\x0a\x88\x0a\x8e\x00\
-\x00\x0a\xb8\x0a\x94\x00\x00\x0a\xb8\x0a\x94\x00\x00\x0b\x0c\x0a\
-\x9a\x00\x00\x0a\xc4\x0a\xa0\x00\x00\x0a\xd0\x0a\xa6\x00\x00\x0a\
-\xac\x0a\xb2\x00\x00\x0a\xb8\x0a\xe2\x00\x00\x0a\xb8\x0a\xe2\x00\
-\x00\x0b\x0c\x0a\xbe\x00\x00\x0a\xc4\x0a\xca\x00\x00\x0a\xd0\x0a\
-\xd6\x00\x00\x0a\xdc\x0a\xe2\x00\x00\x0b\x00\x0a\xe8\x00\x00\x0b\
-\x00\x0a\xe8\x00\x00\x0b\x0c\x0a\xee\x00\x00\x0b\x18\x0a\xf4\x00\
-\x00\x0b\x24\x0a\xfa\x00\x00\x0b\x00\x0b\x06\x00\x00\x0b\x00\x0b\
-\x06\x00\x00\x0b\x0c\x0b\x12\x00\x00\x0b\x18\x0b\x1e\x00\x00\x0b\
-\x24\x0b\x2a\x00\x00\x0b\x3c\x0b\x30\x00\x00\x0b\x3c\x0b\x30\x00\
-\x00\x0b\x42\x0b\x30\x00\x00\x0b\x4e\x0b\x36\x00\x00\x0b\x4e\x0b\
-\x36\x00\x00\x0b\x3c\x0b\x48\x00\x00\x0b\x3c\x0b\x48\x00\x00\x0b\
-\x42\x0b\x48\x00\x00\x0b\x4e\x0b\x54\x00\x00\x0b\x4e\x0b\x54\x00\
-\x00\x0b\x72\x0b\x5a\x00\x00\x0b\x72\x0b\x5a\x00\x00\x0b\x7e\x0b\
-\x60\x00\x00\x0b\x8a\x0b\x66\x00\x00\x0b\x96\x0b\x6c\x00\x00\x0b\
-\x72\x0b\x78\x00\x00\x0b\x72\x0b\x78\x00\x00\x0b\x7e\x0b\x84\x00\
-\x00\x0b\x8a\x0b\x90\x00\x00\x0b\x96\x0b\x9c\x00\x00\x0b\xd2\x0b\
-\xa2\x00\x00\x0b\xd2\x0b\xa2\x00\x00\x0b\xd8\x0b\xa8\x00\x00\x0c\
-\x20\x0b\xae\x00\x00\x0c\x2c\x0b\xb4\x00\x00\x0b\xd2\x0b\xba\x00\
-\x00\x0b\xd2\x0b\xba\x00\x00\x0b\xd8\x0b\xc0\x00\x00\x0c\x20\x0b\
-\xc6\x00\x00\x0c\x2c\x0b\xcc\x00\x00\x0b\xd2\x0b\xfc\x00\x00\x0b\
-\xd8\x0b\xde\x00\x00\x0c\x20\x0b\xe4\x00\x00\x0c\x2c\x0b\xea\x00\
-\x00\x0b\xf0\x0b\xfc\x00\x00\x0b\xf6\x0b\xfc\x00\x00\x0c\x3e\x0c\
-\x02\x00\x00\x0c\x14\x0c\x08\x00\x00\x0c\x3e\x0c\x0e\x00\x00\x0c\
-\x3e\x0c\x0e\x00\x00\x0c\x14\x0c\x1a\x00\x00\x0c\x20\x0c\x26\x00\
-\x00\x0c\x2c\x0c\x32\x00\x00\x0c\x3e\x0c\x38\x00\x00\x0c\x3e\x0c\
-\x44\x00\x00\x0c\xc2\x0c\x50\x00\x00\x0c\x98\x0c\x56\x00\x00\x0c\
-\xc2\x0c\x4a\x00\x00\x0c\xc8\x0c\x50\x00\x00\x0c\x98\x0c\x56\x00\
-\x00\x0c\xd4\x0c\x5c\x00\x00\x0c\xaa\x0c\x62\x00\x00\x0c\xda\x0c\
-\x5c\x00\x00\x0c\xaa\x0c\x62\x00\x00\x0c\xb6\x0c\x68\x00\x00\x0c\
-\xb6\x0c\x68\x00\x00\x0c\x8c\x0c\x6e\x00\x00\x0c\x74\x0c\x7a\x00\
-\x00\x0c\x74\x0c\x7a\x00\x00\x0c\xb6\x0c\x80\x00\x00\x0c\xb6\x0c\
-\x86\x00\x00\x0c\x98\x0c\x9e\x00\x00\x0c\xb6\x0c\x86\x00\x00\x0c\
-\x8c\x0c\x92\x00\x00\x0c\x98\x0c\x9e\x00\x00\x0c\xd4\x0c\xa4\x00\
-\x00\x0c\xaa\x0c\xb0\x00\x00\x0c\xda\x0c\xa4\x00\x00\x0c\xaa\x0c\
-\xb0\x00\x00\x0c\xb6\x0c\xbc\x00\x00\x0c\xc2\x0c\xce\x00\x00\x0c\
-\xc2\x0c\xce\x00\x00\x0c\xc8\x0c\xce\x00\x00\x0c\xd4\x0c\xe0\x00\
-\x00\x0c\xda\x0c\xe0\x00\x00\x0c\xe6\x0c\xec\x00\x00\x0c\xe6\x0c\
-\xec\x00\x00\x0c\xf2\x0c\xf8\x00\x00\x0c\xfe\x0d\x04\x00\x00\x0d\
-\x0a\x0d\x10\x00\x00\x0d\x16\x0d\x1c\x00\x00\x0d\x22\x0d\x28\x00\
-\x00\x21\xa0\x21\xa6\x00\x00\x21\xe0\x21\xe6\x00\x00\x0d\x2e\x0d\
-\x34\x00\x00\x0d\x4c\x0d\x3a\x00\x00\x0d\x4c\x0d\x3a\x00\x00\x22\
-\x06\x22\x0c\x00\x00\x23\xce\x0d\x40\x00\x00\x0e\x24\x0d\x46\x00\
-\x00\x0d\x4c\x0d\x52\x00\x00\x0d\x4c\x0d\x52\x00\x00\x22\x06\x0d\
-\x58\x00\x00\x00\x00\x0d\x5e\x00\x00\x0e\x8a\x0e\x90\x00\x00\x0e\
-\x8a\x0e\x90\x00\x00\x0d\xbe\x0d\x64\x00\x00\x22\x46\x22\x4c\x00\
-\x00\x0d\xac\x0d\xb2\x00\x00\x0e\x8a\x0d\x7c\x00\x00\x0e\x8a\x0d\
-\x7c\x00\x00\x0d\xbe\x0d\x6a\x00\x00\x0e\x8a\x0e\x90\x00\x00\x0e\
-\x8a\x0e\x90\x00\x00\x0d\x82\x0d\x70\x00\x00\x0d\x8e\x0d\x76\x00\
-\x00\x0d\x9a\x0e\x60\x00\x00\x0e\x8a\x0d\x7c\x00\x00\x0d\x82\x0d\
-\x88\x00\x00\x0d\x8e\x0d\x94\x00\x00\x0d\x9a\x0e\x2a\x00\x00\x0d\
-\xa0\x0d\xa6\x00\x00\x0d\xa0\x0d\xa6\x00\x00\x22\x46\x22\x4c\x00\
-\x00\x0d\xac\x0d\xb2\x00\x00\x0e\x8a\x0d\xb8\x00\x00\x0e\x8a\x0d\
-\xb8\x00\x00\x0d\xbe\x0d\xc4\x00\x00\x0e\x8a\x0d\xb8\x00\x00\x0d\
-\xbe\x0d\xc4\x00\x00\x0d\xfa\x0d\xca\x0e\x06\x0d\xfa\x0d\xca\x0e\
-\x06\x22\xec\x22\x6e\x22\xf8\x0d\xfa\x0d\xd0\x0e\x06\x0d\xfa\x0d\
-\xd0\x0e\x06\x22\xec\x0d\xd6\x22\xf8\x0d\xfa\x0d\xdc\x0e\x06\x0d\
-\xfa\x0d\xdc\x0e\x06\x22\xec\x22\x90\x22\xf8\x0d\xfa\x0d\xe2\x0e\
-\x06\x0d\xfa\x0d\xe2\x0e\x06\x22\xec\x22\xb2\x22\xf8\x0d\xfa\x0d\
-\xe8\x0e\x06\x0d\xfa\x0d\xe8\x0e\x06\x22\xec\x22\xf2\x22\xf8\x0d\
-\xfa\x0d\xee\x0e\x06\x0d\xfa\x0d\xee\x0e\x06\x22\xec\x0d\xf4\x22\
-\xf8\x0d\xfa\x0e\x00\x0e\x06\x0d\xfa\x0e\x00\x0e\x06\x22\xec\x0e\
-\x0c\x22\xf8\x0e\x30\x0e\x54\x00\x00\x0e\x30\x0e\x54\x00\x00\x23\
-\x82\x23\x88\x00\x00\x0e\x12\x0e\x54\x00\x00\x0e\x12\x0e\x54\x00\
-\x00\x23\x26\x23\x88\x00\x00\x0e\x36\x23\xd4\x00\x00\x0e\x3c\x0e\
-\x60\x00\x00\x0e\x30\x0e\x18\x00\x00\x0e\x30\x0e\x18\x00\x00\x23\
-\x82\x23\x3a\x00\x00\x23\xce\x0e\x1e\x00\x00\x0e\x24\x0e\x2a\x00\
-\x00\x0e\x30\x0e\x54\x00\x00\x0e\x30\x0e\x54\x00\x00\x23\x82\x23\
-\x88\x00\x00\x0e\x36\x23\xd4\x00\x00\x0e\x3c\x0e\x60\x00\x00\x0e\
-\x42\x0e\x48\x00\x00\x0e\x4e\x0e\x54\x00\x00\x0e\x4e\x0e\x54\x00\
-\x00\x23\x4e\x23\x88\x00\x00\x23\x62\x23\xd4\x00\x00\x0e\x5a\x0e\
-\x60\x00\x00\x0e\x72\x0e\x66\x00\x00\x0e\x72\x0e\x66\x00\x00\x0e\
-\x7e\x0e\x6c\x00\x00\x0e\x72\x0e\x78\x00\x00\x0e\x72\x0e\x78\x00\
-\x00\x0e\x7e\x0e\x84\x00\x00\x0e\x8a\x0e\x90\x00\x00\x0e\x96\x0e\
-\x9c\x00\x00\x0e\xcc\x0e\xa2\x00\x00\x0e\xa8\x0e\xc6\x00\x00\x0e\
-\xcc\x0e\xc6\x00\x00\x0e\xcc\x0e\xae\x00\x00\x0e\xcc\x0e\xb4\x00\
-\x00\x0e\xcc\x0e\xba\x00\x00\x0e\xcc\x0e\xc0\x00\x00\x0e\xcc\x0e\
-\xc6\x00\x00\x0e\xcc\x0e\xd2\x00\x00\x00\x00\x0e\xd8\x00\x00\x00\
-\x00\x0e\xd8\x00\x00\x00\x01\x00\x5a\x04\x70\x00\x01\x01\x01\x00\
-\x60\x00\x01\x00\xe3\x02\x4d\x00\x01\x00\x8d\x00\x4d\x00\x01\x00\
-\x8a\x02\xe8\x00\x01\x00\x8d\x02\xe8\x00\x01\x00\x86\x03\xe4\x00\
-\x01\x00\x89\x03\xe4\x00\x01\x00\x87\xff\x60\x00\x01\x00\x89\x03\
-\x90\x00\x01\x00\x9d\xff\x78\x00\x01\x00\x8a\x03\x7e\x00\x01\x00\
-\x8d\x03\x7e\x00\x01\x00\x8b\x00\x41\x00\x01\x00\x7e\x03\xc4\x00\
-\x01\x00\x9a\x00\x41\x00\x01\x00\x81\x03\xc4\x00\x01\x01\x4b\x03\
-\x90\x00\x01\x01\xa6\xff\x64\x00\x01\x01\xa3\xff\x64\x00\x01\x00\
-\xa8\xff\x64\x00\x01\x00\x69\xff\x64\x00\x01\x01\xa8\xfe\xf7\x00\
-\x01\x01\xa5\xfe\xf7\x00\x01\x00\xa9\xfe\xf7\x00\x01\x00\x6b\xfe\
-\xf7\x00\x01\x01\xaa\xfe\xfa\x00\x01\x01\xa7\xfe\xfa\x00\x01\x01\
-\xa9\xff\x27\x00\x01\x01\xa3\x02\x17\x00\x01\x01\xa5\xff\x27\x00\
-\x01\x01\xb3\x02\x17\x00\x01\x00\xaa\xff\x27\x00\x01\x00\x6c\xff\
-\x27\x00\x01\x01\xa0\x02\xeb\x00\x01\x01\xb0\x02\xeb\x00\x01\x00\
-\x9a\x02\xd6\x00\x01\x00\x52\x03\x33\x00\x01\x01\xac\x00\xbe\x00\
-\x01\x01\x9c\x00\xbe\x00\x01\x00\x94\x00\xcd\x00\x01\x00\x78\x00\
-\xc2\x00\x01\x01\xa5\x03\x44\x00\x01\x01\xa7\x03\x44\x00\x01\x01\
-\xb7\x03\x44\x00\x01\x00\xa1\x03\x2f\x00\x01\x00\x59\x03\x8c\x00\
-\x01\x01\xa3\x03\x51\x00\x01\x01\xb3\x03\x51\x00\x01\x00\x9d\x03\
-\x3c\x00\x01\x00\x55\x03\x99\x00\x01\x01\xa8\x00\x27\x00\x01\x01\
-\xa2\x03\x5e\x00\x01\x01\xa5\x00\x27\x00\x01\x01\xb1\x03\x5e\x00\
-\x01\x00\x9c\x03\x49\x00\x01\x00\x54\x03\xa6\x00\x01\x01\x53\xff\
-\x87\x00\x01\x01\x19\xff\x87\x00\x01\x01\x54\xff\x1a\x00\x01\x01\
-\x1b\xff\x1a\x00\x01\x01\x55\xff\x4b\x00\x01\x01\x1b\xff\x4b\x00\
-\x01\x01\x1b\x02\xd8\x00\x01\x01\x2f\x02\x81\x00\x01\x00\xd6\x02\
-\x57\x00\x01\x01\x17\x03\xd3\x00\x01\x01\x1f\x04\x05\x00\x01\x01\
-\x76\xff\x46\x00\x01\x01\x18\x03\xb5\x00\x01\x01\x91\x00\xdb\x00\
-\x01\x01\x7b\xfe\xe6\x00\x01\x01\x2c\x03\x5e\x00\x01\x01\x9b\x00\
-\x4f\x00\x01\x01\x54\x00\x4a\x00\x01\x01\x1b\x00\x4a\x00\x01\x00\
-\xd3\x03\x34\x00\x01\x00\xd7\x02\xb0\x00\x01\x01\x45\x02\xba\x00\
-\x01\x00\xd4\x03\x8d\x00\x01\x01\x42\x03\x97\x00\x01\x00\xd7\x03\
-\xea\x00\x01\x01\x36\x00\x41\x00\x01\x01\x45\x03\xf4\x00\x01\x00\
-\xff\x00\x2b\x00\x01\x00\xd2\x00\xbe\x00\x01\x00\x83\x02\x07\x00\
-\x01\x00\xbe\x02\x16\x00\x01\x00\x89\x02\x08\x00\x01\x00\x87\x02\
-\xe5\x00\x01\x00\xbe\x03\x50\x00\x01\x00\x83\x03\x41\x00\x01\x00\
-\xc3\x03\x3a\x00\x01\x00\x89\x03\x42\x00\x01\x01\x2e\x00\x05\x00\
-\x01\x00\xf9\x00\x02\x00\x01\x00\xa8\xfe\xa7\x00\x01\x00\xbc\x02\
-\xf4\x00\x01\x00\x89\xfe\xaa\x00\x01\x00\x80\x02\xe4\x00\x01\x00\
-\x8b\xff\x6e\x00\x01\x00\x87\x03\x34\x00\x01\x00\xa9\xff\x6a\x00\
-\x01\x00\xc2\x03\x43\x00\x01\x00\xc7\x03\x2d\x00\x01\x00\x61\xff\
-\x47\x00\x01\x00\x8d\x03\x35\x00\x01\x02\xea\x01\xe7\x00\x01\x02\
-\xfc\x01\xe7\x00\x01\x01\xa1\x01\xe7\x00\x01\x01\xa0\x01\xe7\x00\
-\x01\x02\xf7\xff\x7e\x00\x01\x02\xe7\x02\xc4\x00\x01\x02\xf9\x00\
-\x41\x00\x01\x03\x00\x03\x14\x00\x01\x01\x9c\x00\x41\x00\x01\x01\
-\xa5\x03\x14\x00\x01\x01\x9a\x00\x41\x00\x01\x01\xa4\x03\x14\x00\
-\x01\x02\xf9\xff\x11\x00\x01\x02\xee\x03\x14\x00\x01\x02\xc4\x02\
-\x2a\x00\x01\x03\x0f\x02\x1d\x00\x01\x01\x72\x02\x1d\x00\x01\x01\
-\x7d\x02\x1d\x00\x01\x02\xc4\x00\x41\x00\x01\x02\xc1\x03\x07\x00\
-\x01\x03\x2b\x00\x41\x00\x01\x03\x0c\x02\xfa\x00\x01\x01\x86\x00\
-\x41\x00\x01\x01\x6f\x02\xfa\x00\x01\x01\xa6\x00\x41\x00\x01\x01\
-\x7a\x02\xfa\x00\x01\x02\x18\x02\x5d\x00\x01\x01\x86\x02\x5d\x00\
-\x01\x01\x80\x00\x33\x00\x01\x01\x6f\x00\x33\x00\x01\x02\x15\x03\
-\x3b\x00\x01\x01\x14\x00\x33\x00\x01\x01\x83\x03\x3b\x00\x01\x01\
-\x09\x02\xc4\x00\x01\x01\x30\x02\x5d\x00\x01\x01\x00\x02\x5d\x00\
-\x01\x00\xd1\x02\x86\x00\x01\x01\x54\xff\x13\x00\x01\x01\x06\x03\
-\xa1\x00\x01\x01\x14\xff\x08\x00\x01\x01\x2e\x03\x3a\x00\x01\x00\
-\xdb\x00\x41\x00\x01\x00\xfd\x03\x3a\x00\x01\x00\xec\x00\x41\x00\
-\x01\x00\xce\x03\x63\x00\x01\x02\x70\x03\xcf\x00\x01\x02\xb6\x03\
-\x5a\x00\x01\x00\xf0\x03\x55\x00\x01\x00\xba\x03\xbc\x00\x01\x02\
-\x77\x04\x1f\x00\x01\x02\xbd\x03\xaa\x00\x01\x00\xf7\x03\xa5\x00\
-\x01\x00\xc0\x04\x0b\x00\x01\x02\x69\x00\x41\x00\x01\x02\xae\x00\
-\x4a\x00\x01\x02\xb9\x02\x7d\x00\x01\x00\xf3\x02\x78\x00\x01\x00\
-\xbc\x02\xde\x00\x01\x02\x68\xff\x7e\x00\x01\x02\x69\xff\x11\x00\
-\x01\x02\x73\x02\xf2\x00\x01\x01\xa9\x02\x3d\x00\x01\x01\xa6\x02\
-\x3d\x00\x01\x01\xa6\x03\x11\x00\x01\x01\x55\xff\x39\x00\x01\x01\
-\xa3\x03\x11\x00\x01\x00\xf4\x00\x39\x00\x01\x00\xf0\x03\x4c\x00\
-\x01\x00\xd1\x00\x41\x00\x01\x00\xb9\x03\xb3\x00\x01\x01\xa7\x03\
-\x1a\x00\x01\x01\x45\xff\x2a\x00\x01\x01\xad\x03\x6a\x00\x01\x01\
-\x89\x03\x16\x00\x01\x01\x85\x03\x16\x00\x01\x01\xb5\x02\xe2\x00\
-\x01\x00\x98\x03\x10\x00\x01\x00\xf7\x02\xe2\x00\x01\x02\x46\x03\
-\x10\x00\x01\x02\x29\x03\x10\x00\x01\x00\xd6\x00\x37\x00\x01\x00\
-\x99\x03\x00\x00\x01\x02\x4a\x04\x3d\x00\x01\x02\x20\x03\x8b\x00\
-\x01\x02\xa3\x00\x41\x00\x01\x02\x03\x03\x8b\x00\x01\x02\xba\x00\
-\x37\x00\x01\x01\x8f\x03\x33\x00\x01\x00\x72\x03\x8b\x00\x01\x01\
-\xfc\x00\x37\x00\x01\x00\xd1\x03\x33\x00\x01\x01\xbc\x00\x41\x00\
-\x01\x02\xe4\x02\xcf\x00\x01\x01\xb0\x00\x39\x00\x01\x01\x95\x00\
-\x3b\x00\x01\x01\x89\x04\x43\x00\x01\x00\xbd\x00\x41\x00\x01\x00\
-\x99\x00\x41\x00\x01\x00\x9c\x04\x3d\x00\x01\x01\x49\xff\x7e\x00\
-\x01\x01\x34\x02\xad\x00\x01\x01\x51\xff\x83\x00\x01\x01\x33\x02\
-\xe1\x00\x01\x00\xa7\x00\x3b\x00\x01\x00\xad\x03\xa9\x00\x01\x00\
-\x77\x00\x44\x00\x01\x00\x87\x03\xac\x00\x01\x01\x6f\x00\x7b\x00\
-\x01\x01\x2c\x02\xa2\x00\x01\x01\x67\x00\x7b\x00\x01\x01\x24\x02\
-\xa2\x00\x01\x01\x22\x00\x39\x00\x01\x01\x1e\x02\x50\x00\x01\x01\
-\x45\x02\xdb\x00\x01\x00\x9b\x02\xdf\x00\x01\x00\x53\x03\x3c\x00\
-\x01\x01\x33\xff\x7b\x00\x01\x01\x48\x01\xfe\x00\x01\x01\x3c\x01\
-\xfe\x00\x01\x01\x40\xff\xf6\x00\x01\x01\x05\x02\x69\x00\x01\x01\
-\x01\x03\x64\x00\x01\x01\x46\x02\x03\x00\x01\x01\x26\x01\xe8\x00\
-\x01\x00\xe2\x03\x90\x00\x01\x01\x52\x00\x73\x00\x01\x01\x42\x02\
-\xff\x00\x01\x01\x41\xff\x62\x00\x01\x01\x22\x02\xe3\x00\x01\x00\
-\x4b\xfe\xfd\x00\x01\x01\xd1\x00\x44\x00\x01\x01\xe1\x02\xa8\x00\
-\x01\x00\xef\x00\x44\x00\x01\x00\xff\x02\xa8\x00\x01\x00\xe3\x03\
-\x69\x00\x01\x00\xe9\x00\x73\x00\x01\x01\x02\x03\x3d\x00\x01\x00\
-\xf8\x02\x37\x00\x01\x00\xf4\x03\x32\x00\x01\x00\xfb\x03\x28\x00\
-\x01\x00\xf1\x03\x61\x00\x01\x00\xfd\x03\x11\x00\x01\x00\xfb\x02\
-\xf1\x00\x01\x00\xf6\x03\x59\x00\x01\x00\xfd\x03\x4e\x00\x01\x00\
-\xfc\xff\x64\x00\x01\x00\xfc\x03\x64\x00\x01\x00\xfc\x00\x3a\x00\
-\x01\x01\x03\x03\x59\x00\x01\x01\x5b\xfe\xfe\x00\x01\x00\xa4\x02\
-\xf5\x00\x01\x00\x9a\x02\xfd\x00\x01\x00\x6b\x00\x27\x00\x01\x00\
-\x52\x03\x5a\x00\x01\x01\x57\xff\xb5\x00\x01\x00\xae\xff\x70\x00\
-\x01\x00\x6f\xff\x70\x00\x01\x01\xc5\xff\xb5\x00\x01\x01\x17\x01\
-\xfa\x00\x01\x01\x59\xfe\x88\x00\x01\x00\xa8\x01\xfa\x00\x01\x00\
-\x6d\xfe\xfa\x00\x01\x00\x56\x02\x5f\x00\x01\x01\x03\x02\x86\x00\
-\x01\x00\xf6\x01\x29\x00\x01\x01\x40\x00\x41\x00\x01\x00\xff\x03\
-\x81\x00\x01\x01\x2d\xff\x72\x00\x01\x00\xf2\x02\x24\x00\x01\x01\
-\x01\x00\x41\x00\x01\x00\xe6\x02\x94\x00\x01\x00\xf0\x00\x73\x00\
-\x01\x01\x0c\x02\x69\x00\x01\x00\x6c\x02\xdf\x00\x01\x00\x70\xff\
-\xc6\x00\x01\x00\x6f\x02\x8a\x00\x01\x00\x72\x03\x11\x00\x01\x00\
-\x6a\x02\xe8\x00\x01\x00\x6f\x03\xc3\x00\x01\x00\x6d\x02\x37\x00\
-\x01\x00\x6d\x00\x37\x00\x01\x00\x6b\x03\x06\x00\x01\x00\x73\x01\
-\xf6\x00\x05\x00\x00\x00\x01\x00\x08\x00\x01\x00\x0c\x00\x22\x00\
-\x03\x00\x32\x01\x2a\x00\x02\x00\x03\x02\xad\x02\xc2\x00\x00\x02\
-\xc4\x02\xc5\x00\x16\x02\xc8\x02\xe8\x00\x18\x00\x02\x00\x02\x01\
-\x5b\x02\x49\x00\x00\x02\x9e\x02\x9e\x00\xef\x00\x39\x00\x01\x17\
-\xc6\x00\x01\x17\xcc\x00\x01\x17\xd2\x00\x01\x17\xd8\x00\x01\x17\
-\xde\x00\x01\x17\xe4\x00\x01\x17\xea\x00\x00\x15\x92\x00\x02\x00\
-\xe6\x00\x01\x17\xf0\x00\x00\x15\x98\x00\x01\x17\xf6\x00\x00\x15\
-\x9e\x00\x01\x17\xfc\x00\x00\x15\xa4\x00\x02\x00\xec\x00\x01\x18\
-\x02\x00\x00\x15\xaa\x00\x01\x18\x08\x00\x00\x15\xb0\x00\x02\x00\
-\xf2\x00\x01\x18\x0e\x00\x01\x18\x14\x00\x01\x18\x1a\x00\x01\x18\
-\x20\x00\x00\x15\xb6\x00\x01\x18\x3e\x00\x00\x15\xbc\x00\x01\x18\
-\x26\x00\x01\x18\x2c\x00\x01\x18\x32\x00\x01\x18\x38\x00\x01\x18\
-\x3e\x00\x00\x15\xc2\x00\x00\x15\xc8\x00\x01\x18\x44\x00\x01\x18\
-\x4a\x00\x00\x15\xce\x00\x01\x18\x50\x00\x01\x18\x56\x00\x00\x15\
-\xd4\x00\x01\x18\x5c\x00\x01\x18\x62\x00\x01\x18\x68\x00\x01\x18\
-\x6e\x00\x01\x18\x74\x00\x01\x18\x7a\x00\x01\x18\x80\x00\x01\x18\
-\x86\x00\x01\x18\x8c\x00\x01\x18\x92\x00\x01\x18\x98\x00\x01\x18\
-\x9e\x00\x01\x18\xa4\x00\x01\x18\xaa\x00\x01\x18\xb0\x00\x01\x18\
-\xb6\x00\x01\x00\x48\x01\x93\x00\x01\x00\x92\x01\xbe\x00\x01\x00\
-\x80\x01\x45\x00\xf0\x01\xe2\x02\x08\x02\x2e\x02\x4e\x02\x74\x02\
-\x9a\x02\xc0\x02\xe6\x03\x0c\x13\x7e\x03\x32\x03\x40\x03\x54\x03\
-\x68\x03\x76\x03\x8a\x03\x9e\x03\xb2\x03\xc6\x03\xda\x03\xe8\x04\
-\x0e\x04\x1c\x04\x30\x04\x44\x04\x6a\x04\x78\x04\x86\x04\xac\x04\
-\xba\x04\xce\x04\xe2\x04\xf0\x05\x04\x05\x18\x05\x2c\x05\x40\x05\
-\x54\x05\x70\x05\x62\x05\x70\x05\x8a\x05\xa4\x05\xca\x05\xd8\x05\
-\xec\x06\x00\x06\x0e\x06\x22\x06\x36\x06\x4a\x06\x5e\x06\x72\x06\
-\x8e\x06\x80\x06\x8e\x06\xb4\x06\xc8\x06\xee\x06\xfc\x07\x10\x07\
-\x24\x07\x32\x07\x46\x07\x5a\x07\x6e\x07\x82\x07\x96\x07\xb2\x07\
-\xa4\x07\xb2\x07\xd8\x07\xec\x08\x12\x08\x20\x08\x2e\x08\x3c\x08\
-\x50\x08\x6a\x08\x78\x08\x86\x08\x9a\x08\xae\x08\xc2\x08\xd6\x0a\
-\x12\x0a\x32\x0a\x12\x0a\x32\x08\xea\x08\xfe\x09\x12\x0a\x12\x0a\
-\x32\x09\x26\x09\x34\x09\x42\x09\x5c\x09\x76\x09\x90\x09\xaa\x09\
-\xc4\x09\xde\x09\xf8\x0a\x12\x0a\x32\x0a\x12\x0a\x32\x0a\x12\x0a\
-\x32\x0a\x58\x0a\x66\x0a\x74\x0a\x88\x0a\x9c\x0a\xb0\x0a\xc4\x0a\
-\xd8\x0a\xec\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\
-\x00\x0b\x0e\x0b\x1c\x0b\x36\x0b\x50\x0b\x6a\x0b\x84\x0b\x9e\x0b\
-\xb8\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xd2\x0b\xf8\x0c\
-\x06\x0c\x14\x0c\x28\x0c\x36\x0c\x44\x0c\x5e\x0c\x6c\x0c\x7a\x0c\
-\x88\x0c\x96\x0c\xa4\x0c\xb8\x0c\xd2\x0c\xe0\x0c\xee\x0c\xfc\x0d\
-\x0a\x0d\x1e\x0d\x38\x0d\x52\x0d\x6c\x0d\x86\x0d\xa0\x0d\xba\x0d\
-\xd4\x0d\xe8\x0d\xfc\x0e\x0a\x0e\x18\x0e\x2c\x0e\x46\x0e\x60\x0e\
-\x80\x0e\x8e\x0e\xa8\x0e\xb6\x0e\xca\x0e\xde\x0e\xf2\x0f\x06\x0f\
-\x1a\x0f\x2e\x0f\x42\x0f\x56\x13\x7e\x0f\x64\x13\x7e\x0f\x72\x13\
-\x7e\x0f\x86\x0f\x94\x0f\xa2\x0f\xb0\x0f\xbe\x0f\xcc\x0f\xda\x0f\
-\xe8\x0f\xf6\x10\x04\x10\x12\x10\x2c\x10\x46\x10\x60\x10\x7a\x10\
-\x94\x10\xae\x10\xc8\x10\xe2\x10\xfc\x11\x22\x11\x36\x11\x5c\x11\
-\x76\x11\x9c\x11\xb6\x11\xdc\x12\x02\x12\x1c\x12\x42\x12\x50\x12\
-\x64\x12\x72\x12\x86\x12\x94\x12\xa8\x12\xc2\x13\x58\x13\x7e\x12\
-\xee\x12\xfc\x13\x1c\x13\x7e\x13\x30\x13\x7e\x13\x44\x13\x58\x13\
-\x7e\x13\xa4\x13\xca\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\
-\x20\x00\x00\x00\x01\x01\x66\x00\x73\x00\x01\x01\xd3\x03\x71\x00\
-\x01\x00\xa7\x00\x41\x00\x01\x00\x6b\x03\x1b\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x01\xc6\x00\x41\x00\
-\x01\x01\xf2\x03\x9a\x00\x01\x00\xa1\x00\x41\x00\x01\x00\x56\x03\
-\x6c\x00\x02\x00\x54\x00\x0e\x00\x00\x00\x14\x00\x1a\x00\x00\x00\
-\x01\x01\xd1\x03\x63\x00\x01\x00\x97\x00\x41\x00\x01\x00\x59\x04\
-\x0c\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\
-\x01\x01\xdf\x00\x44\x00\x01\x02\x0c\x03\x9a\x00\x01\x00\xa3\xff\
-\x6a\x00\x01\x00\x66\x04\x37\x00\x02\x00\x0e\x00\x14\x00\x00\x00\
-\x1a\x00\x20\x00\x00\x00\x01\x01\xc5\x00\x41\x00\x01\x01\xe3\x03\
-\x7a\x00\x01\x00\xc6\xff\x57\x00\x01\x00\x98\x03\x16\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x01\xed\x00\
-\x4f\x00\x01\x01\xfe\x03\x93\x00\x01\x00\xb2\xff\x57\x00\x01\x00\
-\x8f\x03\x0d\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\
-\x00\x00\x01\x01\xc8\x00\x39\x00\x01\x01\xd3\x03\x6d\x00\x01\x00\
-\x9e\x00\x39\x00\x01\x00\x68\x03\x96\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x01\xdc\x00\x39\x00\x01\x02\
-\x1d\x03\x9a\x00\x01\x00\xae\x00\x39\x00\x01\x00\x5c\x03\xba\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x01\
-\xe9\x00\x39\x00\x01\x01\xec\x03\x6d\x00\x01\x00\xbf\x00\x39\x00\
-\x01\x00\x6d\x03\xfc\x00\x02\x00\x1c\x0c\xf4\x00\x00\x0e\x1e\x0d\
-\xfe\x00\x00\x00\x02\x00\x0e\x0c\xe6\x00\x00\x0e\x10\x0e\x16\x00\
-\x00\x00\x01\x02\x93\xff\x64\x00\x02\x00\x0e\x0c\xec\x00\x00\x0e\
-\x3c\x0e\x42\x00\x00\x00\x01\x02\xb7\xff\x64\x00\x02\x09\xe4\x0c\
-\xf2\x00\x00\x0e\x28\x0e\x2e\x00\x00\x00\x02\x00\x0e\x0c\xfe\x00\
-\x00\x0e\x5a\x0e\x60\x00\x00\x00\x01\x03\x0d\xff\x64\x00\x02\x00\
-\x0e\x0d\x04\x00\x00\x0e\x46\x0e\x4c\x00\x00\x00\x01\x02\xce\xff\
-\x64\x00\x02\x00\x0e\x0d\x0a\x00\x00\x0e\x58\x0e\x5e\x00\x00\x00\
-\x01\x03\x95\xff\x64\x00\x02\x00\x0e\x0d\x10\x00\x00\x0e\x84\x0e\
-\x8a\x00\x00\x00\x01\x02\x8a\xff\x64\x00\x02\x00\x0e\x0d\x16\x00\
-\x00\x0e\x70\x0e\x76\x00\x00\x00\x01\x02\x4b\xff\x64\x00\x02\x00\
-\x64\x01\xc4\x00\x00\x0f\x98\x0f\x9e\x00\x00\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\xa1\xff\x10\x00\
-\x01\x02\x23\x02\x5d\x00\x01\x01\x4e\xff\x7b\x00\x01\x00\xa3\x01\
-\xbf\x00\x02\x00\x30\x01\x90\x00\x00\x0f\x08\x0f\x6a\x00\x00\x00\
-\x02\x00\x0e\x01\x68\x00\x00\x02\x8c\x02\x92\x00\x00\x00\x01\x02\
-\xac\xff\x10\x00\x02\x00\x0e\x01\x6e\x00\x00\x0f\x42\x0e\xfa\x00\
-\x00\x00\x01\x03\x6e\xff\x64\x00\x02\x00\x0e\x00\x14\x00\x00\x00\
-\x1a\x00\x20\x00\x00\x00\x01\x02\xb0\xff\x10\x00\x01\x02\x31\x02\
-\x5d\x00\x01\x01\x5d\xff\x7b\x00\x01\x00\xb1\x01\xbf\x00\x02\x09\
-\xd0\x09\xd6\x00\x00\x0f\x08\x0f\x0e\x00\x00\x00\x02\x09\xdc\x09\
-\xe2\x00\x00\x0e\xfa\x0f\x00\x00\x00\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\x3f\x00\x41\x00\x01\x01\
-\xe9\x03\x9a\x00\x01\x01\x1a\x00\x41\x00\x01\x00\x5f\x04\x0c\x00\
-\x02\x00\x1c\x0b\x7a\x00\x00\x0c\xa4\x0c\x84\x00\x00\x00\x02\x00\
-\x0e\x0b\x6c\x00\x00\x0c\x96\x0c\x9c\x00\x00\x00\x01\x02\x94\xfe\
-\xf7\x00\x02\x00\x0e\x0b\x72\x00\x00\x0c\xc2\x0c\xc8\x00\x00\x00\
-\x01\x02\xb9\xfe\xf7\x00\x02\x08\x84\x0b\x78\x00\x00\x0c\xae\x0c\
-\xb4\x00\x00\x00\x02\x00\x0e\x0b\x84\x00\x00\x0c\xe0\x0c\xe6\x00\
-\x00\x00\x01\x03\x0e\xfe\xf7\x00\x02\x00\x0e\x0b\x8a\x00\x00\x0c\
-\xcc\x0c\xd2\x00\x00\x00\x01\x02\xd0\xfe\xf7\x00\x02\x00\x0e\x0b\
-\x90\x00\x00\x0c\xde\x0c\xe4\x00\x00\x00\x01\x03\x96\xfe\xf7\x00\
-\x02\x00\x0e\x0b\x96\x00\x00\x0d\x0a\x0d\x10\x00\x00\x00\x01\x02\
-\x8b\xfe\xf7\x00\x02\x00\x0e\x0b\x9c\x00\x00\x0c\xf6\x0c\xfc\x00\
-\x00\x00\x01\x02\x4d\xfe\xf7\x00\x02\x00\x44\x00\x4a\x00\x00\x0e\
-\x1e\x0e\x24\x00\x00\x00\x02\x00\x36\x00\x3c\x00\x00\x0d\xb4\x0e\
-\x16\x00\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x01\x38\x01\x3e\x00\
-\x00\x00\x01\x02\x96\xfe\x9c\x00\x01\x02\x2e\x02\x5d\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x0d\xe8\x0d\xa0\x00\x00\x00\x01\x03\x70\xfe\
-\xf7\x00\x01\x03\x5b\x02\x5f\x00\x02\x00\x0e\x00\x14\x00\x00\x00\
-\x1a\x00\x20\x00\x00\x00\x01\x02\x9f\xfe\x9c\x00\x01\x02\x36\x02\
-\x5d\x00\x01\x01\x62\xff\x7b\x00\x01\x00\xb7\x01\xbf\x00\x02\x0b\
-\x7a\x00\x1c\x00\x00\x0b\x86\x0b\x66\x00\x00\x00\x02\x0b\x6c\x00\
-\x0e\x00\x00\x0b\x78\x0b\x7e\x00\x00\x00\x01\x02\x85\x02\xd6\x00\
-\x02\x0b\x7e\x00\x0e\x00\x00\x0b\xa4\x0b\xaa\x00\x00\x00\x01\x02\
-\xa0\x03\x33\x00\x02\x0b\x84\x07\x80\x00\x00\x0b\x90\x0b\x96\x00\
-\x00\x00\x02\x0b\x9c\x00\x0e\x00\x00\x0b\xc2\x0b\xc8\x00\x00\x00\
-\x01\x02\xff\x02\xd6\x00\x02\x0b\xa2\x00\x0e\x00\x00\x0b\xae\x0b\
-\xb4\x00\x00\x00\x01\x02\xb7\x03\x33\x00\x02\x0b\xb4\x00\x0e\x00\
-\x00\x0b\xc0\x0b\xc6\x00\x00\x00\x01\x03\x87\x02\xd6\x00\x02\x0b\
-\xc6\x00\x0e\x00\x00\x0b\xec\x0b\xf2\x00\x00\x00\x01\x02\x7c\x02\
-\xd6\x00\x02\x0b\xcc\x00\x0e\x00\x00\x0b\xd8\x0b\xde\x00\x00\x00\
-\x01\x02\x34\x03\x33\x00\x02\x0c\xf4\x00\x50\x00\x00\x0d\x00\x0d\
-\x06\x00\x00\x00\x02\x0c\xe6\x00\x42\x00\x00\x0c\x96\x0c\xf8\x00\
-\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\
-\x01\x03\x0e\x00\x31\x00\x01\x01\xc7\x03\x09\x00\x01\x01\x59\xff\
-\x7b\x00\x01\x00\xae\x01\xbf\x00\x02\x0c\xb2\x00\x0e\x00\x00\x0c\
-\xbe\x0c\x76\x00\x00\x00\x01\x03\x57\x03\x33\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x03\x10\x00\x30\x00\
-\x01\x01\xc9\x03\x08\x00\x01\x01\x5b\xff\x7a\x00\x01\x00\xb0\x01\
-\xbe\x00\x02\x0a\x56\x00\x1c\x00\x00\x0a\x62\x0a\x42\x00\x00\x00\
-\x02\x0a\x48\x00\x0e\x00\x00\x0a\x54\x0a\x5a\x00\x00\x00\x01\x02\
-\x8c\x03\x2f\x00\x02\x0a\x5a\x00\x0e\x00\x00\x0a\x80\x0a\x86\x00\
-\x00\x00\x01\x02\xa7\x03\x8c\x00\x02\x0a\x60\x06\x76\x00\x00\x0a\
-\x6c\x0a\x72\x00\x00\x00\x02\x0a\x78\x00\x0e\x00\x00\x0a\x9e\x0a\
-\xa4\x00\x00\x00\x01\x03\x06\x03\x2f\x00\x02\x0a\x7e\x00\x0e\x00\
-\x00\x0a\x8a\x0a\x90\x00\x00\x00\x01\x02\xbe\x03\x8c\x00\x02\x0a\
-\x90\x00\x0e\x00\x00\x0a\x9c\x0a\xa2\x00\x00\x00\x01\x03\x8e\x03\
-\x2f\x00\x02\x0a\xa2\x00\x0e\x00\x00\x0a\xc8\x0a\xce\x00\x00\x00\
-\x01\x02\x83\x03\x2f\x00\x02\x0a\xa8\x00\x0e\x00\x00\x0a\xb4\x0a\
-\xba\x00\x00\x00\x01\x02\x3b\x03\x8c\x00\x02\x0b\xd0\x00\x50\x00\
-\x00\x0b\xdc\x0b\xe2\x00\x00\x00\x02\x0b\xc2\x00\x42\x00\x00\x0b\
-\x72\x0b\xd4\x00\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\
-\x20\x00\x00\x00\x01\x03\x10\x00\x37\x00\x01\x01\xcf\x03\x7a\x00\
-\x01\x01\x6c\xff\x7b\x00\x01\x00\x9f\x01\xaa\x00\x02\x0b\x8e\x00\
-\x0e\x00\x00\x0b\x9a\x0b\x52\x00\x00\x00\x01\x03\x5e\x03\x8c\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x03\
-\x10\x00\x35\x00\x01\x01\xcf\x03\x78\x00\x01\x01\x6c\xff\x79\x00\
-\x01\x00\x9f\x01\xa8\x00\x02\x00\x38\x00\x52\x00\x00\x0b\x60\x0b\
-\x66\x00\x00\x00\x02\x00\x3e\x00\x44\x00\x00\x0b\x52\x0b\x58\x00\
-\x00\x00\x02\x00\x30\x00\x36\x00\x00\x0a\xe8\x0b\x4a\x00\x00\x00\
-\x02\x00\x0e\x00\x28\x00\x00\x0b\x36\x0a\xee\x00\x00\x00\x01\x04\
-\x20\x00\x4a\x00\x02\x00\x0e\x00\x14\x00\x00\x0b\x22\x0a\xda\x00\
-\x00\x00\x01\x04\x59\x00\x4a\x00\x01\x03\xd8\x03\x34\x00\x02\x00\
-\xe6\x00\x8e\x00\x00\x08\xe6\x08\xc6\x00\x00\x00\x02\x00\xf2\x00\
-\x94\x00\x00\x08\xd8\x08\xb8\x00\x00\x00\x02\x00\xfe\x00\x0e\x00\
-\x00\x09\x0a\x09\x10\x00\x00\x00\x01\x03\xee\x01\xe7\x00\x02\x01\
-\x1e\x00\x0e\x00\x00\x09\x36\x09\x3c\x00\x00\x00\x01\x04\x06\x01\
-\xe7\x00\x02\x01\x24\x00\x0e\x00\x00\x09\x22\x09\x28\x00\x00\x00\
-\x01\x04\x05\x01\xe7\x00\x02\x01\x2a\x00\x0e\x00\x00\x09\x74\x09\
-\x7a\x00\x00\x00\x01\x03\x83\x01\xe7\x00\x02\x01\x30\x00\x0e\x00\
-\x00\x09\x60\x09\x66\x00\x00\x00\x01\x03\x82\x01\xe7\x00\x02\x00\
-\x66\x00\x0e\x00\x00\x08\x66\x08\x6c\x00\x00\x00\x01\x03\x8b\x01\
-\xe7\x00\x02\x00\x6c\x00\x0e\x00\x00\x08\x52\x08\x58\x00\x00\x00\
-\x01\x03\x8c\x01\xe7\x00\x02\x00\x8c\x00\x0e\x00\x00\x08\x7e\x08\
-\x84\x00\x00\x00\x01\x03\xef\x01\xe7\x00\x02\x00\x2a\x00\x30\x00\
-\x00\x08\x2a\x08\x0a\x00\x00\x00\x02\x00\x36\x00\x3c\x00\x00\x08\
-\x1c\x07\xfc\x00\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x08\x0e\x08\
-\x14\x00\x00\x00\x01\x03\x85\x00\x41\x00\x01\x03\x8f\x03\x14\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x07\xf4\x07\xfa\x00\x00\x00\x01\x03\
-\x87\x00\x41\x00\x01\x03\x90\x03\x14\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x08\x1a\x08\x20\x00\x00\x00\x01\x03\xe8\x00\x41\x00\x01\x03\
-\xf2\x03\x14\x00\x02\x00\x0e\x00\x14\x00\x00\x08\x00\x08\x06\x00\
-\x00\x00\x01\x03\xea\x00\x41\x00\x01\x03\xf3\x03\x14\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x08\x26\x08\x2c\x00\x00\x00\x01\x04\x01\x00\
-\x41\x00\x01\x04\x0a\x03\x14\x00\x02\x00\x0e\x00\x14\x00\x00\x08\
-\x0c\x08\x12\x00\x00\x00\x01\x03\xff\x00\x41\x00\x01\x04\x09\x03\
-\x14\x00\x02\x00\x0e\x00\x14\x00\x00\x08\x58\x08\x5e\x00\x00\x00\
-\x01\x03\x7e\x00\x41\x00\x01\x03\x87\x03\x14\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x08\x3e\x08\x44\x00\x00\x00\x01\x03\x7c\x00\x41\x00\
-\x01\x03\x86\x03\x14\x00\x02\x00\x2e\x00\x0e\x00\x00\x00\x14\x00\
-\x1a\x00\x00\x00\x01\x03\xd2\x02\x27\x00\x01\x01\x4a\xff\x68\x00\
-\x01\x00\xa8\x01\xb3\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\
-\x20\x00\x00\x00\x01\x02\xd0\xff\xcd\x00\x01\x03\xdd\x02\x0b\x00\
-\x01\x01\x48\xff\x54\x00\x01\x00\x97\x01\xbe\x00\x02\x00\xd2\x00\
-\x2a\x00\x00\x06\xf8\x06\xd8\x00\x00\x00\x02\x00\xde\x00\x30\x00\
-\x00\x06\xea\x06\xca\x00\x00\x00\x02\x00\xb6\x00\x0e\x00\x00\x06\
-\xdc\x06\xe2\x00\x00\x00\x01\x03\x68\x02\x1d\x00\x02\x00\xbc\x00\
-\x0e\x00\x00\x06\xc8\x06\xce\x00\x00\x00\x01\x03\x5d\x02\x1d\x00\
-\x02\x00\xc2\x00\x0e\x00\x00\x06\xf4\x06\xfa\x00\x00\x00\x01\x03\
-\xcb\x02\x1d\x00\x02\x00\xc8\x00\x0e\x00\x00\x07\x20\x07\x26\x00\
-\x00\x00\x01\x03\xd7\x02\x1d\x00\x02\x00\xce\x00\x0e\x00\x00\x07\
-\x0c\x07\x12\x00\x00\x00\x01\x03\xe2\x02\x1d\x00\x02\x00\xd4\x00\
-\x0e\x00\x00\x07\x5e\x07\x64\x00\x00\x00\x01\x03\x54\x02\x1d\x00\
-\x02\x00\xda\x00\x0e\x00\x00\x07\x4a\x07\x50\x00\x00\x00\x01\x03\
-\x5f\x02\x1d\x00\x02\x00\x2a\x00\x30\x00\x00\x06\x50\x06\x30\x00\
-\x00\x00\x02\x00\x36\x00\x3c\x00\x00\x06\x42\x06\x22\x00\x00\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x06\x34\x06\x3a\x00\x00\x00\x01\x03\
-\x91\x00\x41\x00\x01\x03\x65\x02\xfa\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x06\x1a\x06\x20\x00\x00\x00\x01\x03\x71\x00\x41\x00\x01\x03\
-\x5a\x02\xfa\x00\x02\x00\x0e\x00\x14\x00\x00\x06\x40\x06\x46\x00\
-\x00\x00\x01\x03\xf4\x00\x41\x00\x01\x03\xc8\x02\xfa\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x06\x66\x06\x6c\x00\x00\x00\x01\x03\xeb\x00\
-\x41\x00\x01\x03\xd4\x02\xfa\x00\x02\x00\x0e\x00\x14\x00\x00\x06\
-\x4c\x06\x52\x00\x00\x00\x01\x04\x0b\x00\x41\x00\x01\x03\xdf\x02\
-\xfa\x00\x02\x00\x0e\x00\x14\x00\x00\x06\x98\x06\x9e\x00\x00\x00\
-\x01\x03\x68\x00\x41\x00\x01\x03\x51\x02\xfa\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x06\x7e\x06\x84\x00\x00\x00\x01\x03\x88\x00\x41\x00\
-\x01\x03\x5c\x02\xfa\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\
-\x20\x00\x00\x00\x01\x02\xa8\xff\xc7\x00\x01\x01\xea\x02\x40\x00\
-\x01\x01\x46\xff\x5a\x00\x01\x00\xaa\x01\xb8\x00\x02\x00\x5a\x00\
-\x2a\x00\x00\x07\x7a\x07\x80\x00\x00\x00\x02\x00\x4c\x00\x1c\x00\
-\x00\x07\x10\x07\x72\x00\x00\x00\x02\x00\x3e\x00\x0e\x00\x00\x07\
-\x5e\x07\x16\x00\x00\x00\x01\x03\xbf\x03\xbc\x00\x02\x00\x2a\x00\
-\x30\x00\x00\x07\x4a\x07\x50\x00\x00\x00\x02\x00\x1c\x00\x22\x00\
-\x00\x06\xe0\x07\x42\x00\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x07\
-\x2e\x06\xe6\x00\x00\x00\x01\x03\xd6\x00\x41\x00\x01\x03\xbe\x03\
-\xb3\x00\x02\x00\xba\x00\x54\x00\x00\x07\x14\x07\x1a\x00\x00\x00\
-\x02\x00\xc0\x00\x46\x00\x00\x07\x06\x07\x0c\x00\x00\x00\x02\x00\
-\x9e\x00\x38\x00\x00\x06\x9c\x06\xfe\x00\x00\x00\x02\x00\xa4\x00\
-\x2a\x00\x00\x06\x8e\x06\xf0\x00\x00\x00\x02\x00\x82\x00\x1c\x00\
-\x00\x06\xdc\x06\x94\x00\x00\x00\x02\x00\x88\x00\x0e\x00\x00\x06\
-\xce\x06\x86\x00\x00\x00\x01\x03\x9d\x03\x10\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x06\x5e\x06\xc0\x00\x00\x00\x01\x03\xdb\x00\x37\x00\
-\x01\x03\x9e\x03\x00\x00\x02\x00\x46\x00\x60\x00\x00\x06\xa0\x06\
-\xa6\x00\x00\x00\x02\x00\x4c\x00\x52\x00\x00\x06\x92\x06\x98\x00\
-\x00\x00\x02\x00\x2a\x00\x44\x00\x00\x06\x28\x06\x8a\x00\x00\x00\
-\x02\x00\x30\x00\x36\x00\x00\x06\x1a\x06\x7c\x00\x00\x00\x02\x00\
-\x0e\x00\x28\x00\x00\x06\x68\x06\x20\x00\x00\x00\x01\x03\x9e\x00\
-\x41\x00\x02\x00\x0e\x00\x14\x00\x00\x06\x54\x06\x0c\x00\x00\x00\
-\x01\x03\xc2\x00\x41\x00\x01\x03\x77\x03\x8b\x00\x03\x01\x3c\x01\
-\x42\x00\x00\x00\x14\x03\x22\x00\x00\x04\x58\x04\x5e\x00\x00\x00\
-\x01\x02\xf6\xff\x64\x00\x03\x01\x22\x01\x28\x00\x00\x00\x14\x03\
-\x08\x00\x00\x04\x3e\x04\x44\x00\x00\x00\x01\x02\xf7\xfe\xf7\x00\
-\x03\x01\x08\x01\x0e\x00\x00\x04\x18\x00\x14\x00\x00\x04\x24\x04\
-\x2a\x00\x00\x00\x01\x02\xe8\x02\xd6\x00\x03\x00\xee\x00\xf4\x00\
-\x00\x03\xfe\x00\x14\x00\x00\x04\x0a\x04\x10\x00\x00\x00\x01\x02\
-\xef\x03\x2f\x00\x02\x00\x0e\x00\x14\x00\x00\x03\xf0\x03\xf6\x00\
-\x00\x00\x01\x02\xc5\x00\x44\x00\x01\x02\xd5\x03\xac\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x04\x16\x04\x1c\x00\x00\x00\x01\x02\xdc\x00\
-\x44\x00\x01\x02\xec\x03\xac\x00\x03\x00\xa0\x00\xa6\x00\x00\x03\
-\xb0\x01\x18\x00\x00\x03\xbc\x03\xc2\x00\x00\x00\x03\x00\x8c\x00\
-\x92\x00\x00\x03\x9c\x02\x72\x00\x00\x03\xa8\x03\xae\x00\x00\x00\
-\x02\x00\x3e\x00\x44\x00\x00\x05\x1a\x05\x7c\x00\x00\x00\x02\x00\
-\x4a\x00\x50\x00\x00\x05\x0c\x05\x6e\x00\x00\x00\x03\x00\x5c\x00\
-\x62\x00\x00\x02\x3c\x02\x42\x00\x00\x03\x78\x03\x7e\x00\x00\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x05\x46\x04\xfe\x00\x00\x00\x01\x03\
-\x7c\x00\x44\x00\x01\x03\x8c\x03\xac\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x05\x2c\x04\xe4\x00\x00\x00\x01\x03\xac\x00\x3b\x00\x01\x03\
-\xb2\x03\xa9\x00\x03\x00\x14\x00\x1a\x00\x00\x03\x24\x03\x2a\x00\
-\x00\x03\x30\x03\x36\x00\x00\x00\x01\x04\x35\x00\x44\x00\x01\x04\
-\x45\x03\xac\x00\x02\x00\x1c\x00\x22\x00\x00\x02\xd0\x02\xb0\x00\
-\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x02\xc2\x02\xc8\x00\x00\x00\
-\x01\x03\x19\x00\x39\x00\x01\x03\x17\x02\x5d\x00\x02\x02\x9c\x00\
-\x1c\x00\x00\x02\xa8\x02\x88\x00\x00\x00\x02\x02\x8e\x00\x0e\x00\
-\x00\x02\x9a\x02\xa0\x00\x00\x00\x01\x02\x86\x02\xdf\x00\x02\x02\
-\xa0\x00\x0e\x00\x00\x02\xc6\x02\xcc\x00\x00\x00\x01\x02\xa1\x03\
-\x3c\x00\x02\x02\xa6\x00\x0e\x00\x00\x02\xb2\x02\xb8\x00\x00\x00\
-\x01\x02\xe9\x02\xdf\x00\x02\x02\xb8\x00\x0e\x00\x00\x02\xde\x02\
-\xe4\x00\x00\x00\x01\x03\x00\x02\xdf\x00\x02\x02\xbe\x00\x0e\x00\
-\x00\x02\xca\x02\xd0\x00\x00\x00\x01\x02\xb8\x03\x3c\x00\x02\x02\
-\xd0\x00\x0e\x00\x00\x02\xdc\x02\xe2\x00\x00\x00\x01\x03\x88\x02\
-\xdf\x00\x02\x02\xe2\x00\x0e\x00\x00\x03\x08\x03\x0e\x00\x00\x00\
-\x01\x02\x7d\x02\xdf\x00\x02\x02\xe8\x00\x0e\x00\x00\x02\xf4\x02\
-\xfa\x00\x00\x00\x01\x02\x35\x03\x3c\x00\x02\x04\x10\x00\x2a\x00\
-\x00\x04\x1c\x04\x22\x00\x00\x00\x02\x04\x02\x00\x1c\x00\x00\x03\
-\xb2\x04\x14\x00\x00\x00\x02\x03\xf4\x00\x0e\x00\x00\x04\x00\x03\
-\xb8\x00\x00\x00\x01\x03\x58\x03\x3c\x00\x02\x01\xbe\x00\xa0\x00\
-\x00\x01\xca\x01\xaa\x00\x00\x00\x02\x01\xb0\x00\x92\x00\x00\x01\
-\xbc\x01\xc2\x00\x00\x00\x02\x01\xc8\x00\x9e\x00\x00\x01\xee\x01\
-\xf4\x00\x00\x00\x02\x01\xd4\x00\xaa\x00\x00\x01\xe0\x01\xe6\x00\
-\x00\x00\x02\x01\xec\x00\xb6\x00\x00\x02\x12\x02\x18\x00\x00\x00\
-\x02\x01\xf8\x00\xc2\x00\x00\x02\x04\x02\x0a\x00\x00\x00\x02\x02\
-\x10\x00\xce\x00\x00\x02\x1c\x02\x22\x00\x00\x00\x02\x02\x28\x00\
-\xda\x00\x00\x02\x4e\x02\x54\x00\x00\x00\x02\x02\x34\x00\xe6\x00\
-\x00\x02\x40\x02\x46\x00\x00\x00\x02\x00\x1c\x00\x22\x00\x00\x01\
-\x4c\x01\x2c\x00\x00\x00\x02\x00\x0e\x00\x14\x00\x00\x01\x3e\x01\
-\x44\x00\x00\x00\x01\x02\x99\xff\x70\x00\x01\x02\x89\x02\x02\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x01\x64\x01\x6a\x00\x00\x00\x01\x02\
-\xbd\xff\x70\x00\x01\x02\xa4\x02\x5f\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x01\x4a\x01\x50\x00\x00\x00\x01\x02\xfc\xff\x70\x00\x01\x02\
-\xec\x02\x02\x00\x02\x00\x0e\x00\x14\x00\x00\x01\x70\x01\x76\x00\
-\x00\x00\x01\x03\x13\xff\x70\x00\x01\x03\x03\x02\x02\x00\x02\x00\
-\x0e\x00\x14\x00\x00\x01\x56\x01\x5c\x00\x00\x00\x01\x02\xd4\xff\
-\x70\x00\x01\x02\xbb\x02\x5f\x00\x02\x00\x0e\x00\x14\x00\x00\x01\
-\x62\x01\x68\x00\x00\x00\x01\x03\x9b\xff\x70\x00\x01\x03\x8b\x02\
-\x02\x00\x02\x00\x0e\x00\x14\x00\x00\x01\x88\x01\x8e\x00\x00\x00\
-\x01\x02\x90\xff\x70\x00\x01\x02\x80\x02\x02\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x01\x6e\x01\x74\x00\x00\x00\x01\x02\x51\xff\x70\x00\
-\x01\x02\x38\x02\x5f\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x34\x00\
-\x3a\x00\x00\x00\x01\x01\x8a\x00\x27\x00\x01\x01\x71\x03\x5a\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x01\
-\xc8\x00\x27\x00\x01\x01\xb9\x02\xfd\x00\x01\x00\xa2\x00\x65\x00\
-\x01\x00\x8b\x03\x9c\x00\x02\x00\x22\x00\x28\x00\x00\x00\x2e\x00\
-\x0e\x00\x00\x00\x01\x00\xc4\x02\x00\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\x94\x00\x27\x00\x01\x02\
-\x85\x02\xfd\x00\x01\x00\x92\xff\x5f\x00\x01\x00\xc1\x02\xdd\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x34\x00\x3a\x00\x00\x00\x01\x02\
-\xb9\x00\x27\x00\x01\x02\xa0\x03\x5a\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\xf7\x00\x27\x00\x01\x02\
-\xe8\x02\xfd\x00\x01\x01\x3d\x00\x33\x00\x01\x01\x1b\x02\x60\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x34\x00\x3a\x00\x00\x00\x01\x03\
-\x0e\x00\x27\x00\x01\x02\xff\x02\xfd\x00\x02\x00\x0e\x00\x14\x00\
-\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\xd0\x00\x27\x00\x01\x02\
-\xb7\x03\x5a\x00\x01\x01\x2e\x00\x39\x00\x01\x01\x2c\x02\x5d\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x03\
-\x96\x00\x27\x00\x01\x03\x87\x02\xfd\x00\x01\x01\x50\xff\x51\x00\
-\x01\x01\x39\x02\xdb\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x34\x00\
-\x3a\x00\x00\x00\x01\x02\x8b\x00\x27\x00\x01\x02\x7c\x02\xfd\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x02\
-\x4d\x00\x27\x00\x01\x02\x34\x03\x5a\x00\x01\x00\xfa\xff\x4f\x00\
-\x01\x00\xf4\x02\x5f\x00\x02\x00\x74\x00\x7a\x00\x00\x00\x9a\x00\
-\x1c\x00\xa6\x00\x02\x00\x80\x00\x86\x00\x00\x00\x8c\x00\x0e\x00\
-\x98\x00\x01\x00\xff\x02\x2c\x00\x02\x00\x52\x00\x58\x00\x00\x00\
-\x78\x00\x1c\x00\x84\x00\x02\x00\x5e\x00\x64\x00\x00\x00\x6a\x00\
-\x0e\x00\x76\x00\x01\x00\xf8\x03\x56\x00\x02\x00\x30\x00\x36\x00\
-\x00\x00\x56\x00\x1c\x00\x62\x00\x02\x00\x3c\x00\x42\x00\x00\x00\
-\x48\x00\x0e\x00\x54\x00\x01\x01\x04\x03\x07\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x00\x34\x00\x3a\x00\x40\x00\x01\x02\x57\x00\x27\x00\
-\x01\x02\x3e\x03\x5a\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\
-\x20\x00\x26\x00\x01\x02\x95\x00\x27\x00\x01\x02\x86\x02\xfd\x00\
-\x01\x01\x05\xff\x5e\x00\x01\x01\x02\x02\xe6\x00\x01\x00\xfb\x00\
-\x3b\x00\x02\x00\x78\x00\x7e\x00\x00\x00\x28\x00\x8a\x00\x00\x00\
-\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x7c\x00\x00\x00\x01\x03\
-\xae\x00\x27\x00\x01\x03\x9f\x02\xfd\x00\x01\x01\x6e\xff\x33\x00\
-\x02\x00\x4a\x00\x50\x00\x00\x00\x56\x00\x0e\x00\x00\x00\x01\x00\
-\x9a\x02\xaa\x00\x02\x00\x36\x00\x3c\x00\x00\x00\x0e\x00\x48\x00\
-\x00\x00\x01\x01\x6c\xfe\xbd\x00\x02\x00\x6e\x00\x74\x00\x00\x00\
-\x0e\x00\x80\x00\x00\x00\x01\x00\xac\xfe\xfa\x00\x02\x00\x0e\x00\
-\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\x01\x03\x70\x00\x27\x00\
-\x01\x03\x57\x03\x5a\x00\x01\x01\x6a\xff\xea\x00\x01\x00\x9e\x01\
-\xaf\x00\x02\x00\x0e\x00\x14\x00\x00\x00\x1a\x00\x20\x00\x00\x00\
-\x01\x02\x9d\xff\xc7\x00\x01\x01\xdf\x02\x40\x00\x01\x01\x3b\xff\
-\x5a\x00\x01\x00\xa0\x01\xb8\x00\x02\x00\x0e\x00\x14\x00\x00\x00\
-\x1a\x00\x20\x00\x00\x00\x01\x01\xdb\x00\x27\x00\x01\x01\xc2\x03\
-\x5a\x00\x01\x00\xa9\x00\x27\x00\x01\x00\x9e\x02\x02\x00\x04\x00\
-\x1a\x00\x20\x00\x00\x00\x26\x00\x2c\x00\x00\x00\x32\x00\x38\x00\
-\x00\x00\x3e\x00\x44\x00\x00\x00\x01\x19\xf1\x00\x47\x00\x01\x19\
-\xf3\x03\x25\x00\x01\x22\x73\x00\x41\x00\x01\x22\x78\x01\xe7\x00\
-\x01\x1e\x16\x00\x33\x00\x01\x1d\xf5\x02\x60\x00\x01\x16\xac\x00\
-\x41\x00\x01\x16\x9f\x03\xc4\x00\x06\x00\x10\x00\x01\x00\x0a\x00\
-\x00\x00\x01\x00\x0c\x00\x28\x00\x01\x00\x4a\x00\xc4\x00\x01\x00\
-\x0c\x02\xb4\x02\xb7\x02\xb9\x02\xbb\x02\xbe\x02\xc0\x02\xc9\x02\
-\xcb\x02\xd1\x02\xd2\x02\xd5\x02\xd8\x00\x01\x00\x0f\x02\xb4\x02\
-\xb7\x02\xb9\x02\xbb\x02\xbe\x02\xc0\x02\xc9\x02\xcb\x02\xd1\x02\
-\xd2\x02\xd5\x02\xd8\x02\xe4\x02\xe9\x02\xec\x00\x0c\x00\x00\x00\
-\x32\x00\x00\x00\x38\x00\x00\x00\x3e\x00\x00\x00\x44\x00\x00\x00\
-\x4a\x00\x00\x00\x50\x00\x00\x00\x56\x00\x00\x00\x5c\x00\x00\x00\
-\x62\x00\x00\x00\x68\x00\x00\x00\x6e\x00\x00\x00\x74\x00\x01\x00\
-\x4d\x00\xf8\x00\x01\x00\x46\x01\x48\x00\x01\x00\x92\x00\x36\x00\
-\x01\x00\x92\x01\xeb\x00\x01\x00\x91\x02\x46\x00\x01\x00\x77\x01\
-\xbf\x00\x01\x00\x1a\x00\x9a\x00\x01\x00\x5a\x00\xad\x00\x01\x00\
-\x6a\x00\xfd\x00\x01\x00\x69\x00\xf9\x00\x01\x00\x54\x00\x9c\x00\
-\x01\x00\x5b\xff\xd6\x00\x0f\x00\x20\x00\x26\x00\x2c\x00\x32\x00\
-\x38\x00\x3e\x00\x44\x00\x4a\x00\x50\x00\x56\x00\x6e\x00\x5c\x00\
-\x62\x00\x68\x00\x6e\x00\x01\x00\x4c\x00\x35\x00\x01\x00\x48\x00\
-\x1b\x00\x01\x00\x96\xff\x7f\x00\x01\x00\x92\x00\xbb\x00\x01\x00\
-\x93\x01\x0d\x00\x01\x00\x78\x00\xbf\x00\x01\x00\x1a\xff\xd3\x00\
-\x01\x00\x54\xff\xc0\x00\x01\x00\x66\xff\xa0\x00\x01\x00\x69\xff\
-\x57\x00\x01\x00\x5e\xff\x65\x00\x01\x00\x5c\x02\x22\x00\x01\x00\
-\x5e\xff\x6f\x00\x01\x00\x5a\xff\xe6\x00\x06\x00\x10\x00\x01\x00\
-\x0a\x00\x01\x00\x01\x00\x0c\x00\x64\x00\x01\x00\xc4\x02\x64\x00\
-\x01\x00\x2a\x02\xad\x02\xae\x02\xaf\x02\xb0\x02\xb1\x02\xb2\x02\
-\xb3\x02\xb6\x02\xb8\x02\xba\x02\xbd\x02\xbf\x02\xc2\x02\xc4\x02\
-\xc5\x02\xc8\x02\xca\x02\xcc\x02\xcd\x02\xce\x02\xcf\x02\xd0\x02\
-\xd3\x02\xd4\x02\xd6\x02\xd7\x02\xd9\x02\xda\x02\xdb\x02\xdc\x02\
-\xdd\x02\xde\x02\xdf\x02\xe0\x02\xe1\x02\xe2\x02\xe3\x02\xe4\x02\
-\xe5\x02\xe6\x02\xe7\x02\xe8\x00\x01\x00\x2e\x02\xad\x02\xae\x02\
-\xaf\x02\xb0\x02\xb1\x02\xb2\x02\xb3\x02\xb6\x02\xb8\x02\xba\x02\
-\xbd\x02\xbf\x02\xc2\x02\xc4\x02\xc5\x02\xc8\x02\xca\x02\xcc\x02\
-\xcd\x02\xce\x02\xcf\x02\xd0\x02\xd3\x02\xd4\x02\xd6\x02\xd7\x02\
-\xd9\x02\xda\x02\xdb\x02\xdd\x02\xde\x02\xe0\x02\xe1\x02\xe2\x02\
-\xe3\x02\xe4\x02\xe5\x02\xe6\x02\xe7\x02\xe8\x02\xea\x02\xeb\x02\
-\xed\x02\xee\x02\xef\x02\xf0\x00\x2a\x00\x00\x00\xaa\x00\x00\x00\
-\xb0\x00\x00\x00\xb6\x00\x00\x00\xbc\x00\x00\x00\xc2\x00\x00\x00\
-\xc8\x00\x00\x00\xce\x00\x00\x00\xd4\x00\x00\x00\xda\x00\x00\x00\
-\xe0\x00\x00\x00\xe6\x00\x00\x00\xec\x00\x00\x00\xf2\x00\x00\x00\
-\xf8\x00\x00\x00\xfe\x00\x00\x01\x04\x00\x00\x01\x22\x00\x00\x01\
-\x0a\x00\x00\x01\x10\x00\x00\x01\x16\x00\x00\x01\x1c\x00\x00\x01\
-\x22\x00\x00\x01\x28\x00\x00\x01\x2e\x00\x00\x01\x34\x00\x00\x01\
-\x3a\x00\x00\x01\x40\x00\x00\x01\x46\x00\x00\x01\x4c\x00\x00\x01\
-\x52\x00\x00\x01\x58\x00\x00\x01\x5e\x00\x00\x01\x64\x00\x00\x01\
-\x6a\x00\x00\x01\x70\x00\x00\x01\x76\x00\x00\x01\x7c\x00\x00\x01\
-\x82\x00\x00\x01\x88\x00\x00\x01\x8e\x00\x00\x01\x94\x00\x00\x01\
-\x9a\x00\x01\x00\x73\x03\x93\x00\x01\x00\xc6\x03\x1a\x00\x01\x00\
-\x9f\x03\x1a\x00\x01\x00\x9b\x03\x93\x00\x01\x00\xab\x03\x81\x00\
-\x01\x00\x79\x03\x9f\x00\x01\x00\x4a\x02\xe8\x00\x01\x00\x4c\x02\
-\x84\x00\x01\x00\x8e\x02\xc3\x00\x01\x00\x93\x02\x86\x00\x01\x00\
-\x8c\x01\x27\x00\x01\x00\x81\x00\xc4\x00\x01\x00\x8c\x02\xbd\x00\
-\x01\x00\x69\x02\xf2\x00\x01\x00\x82\x03\x2e\x00\x01\x00\x16\x03\
-\x35\x00\x01\x00\x62\x03\x76\x00\x01\x00\x8a\x03\x75\x00\x01\x00\
-\x65\x03\x75\x00\x01\x00\x69\x03\x75\x00\x01\x00\x62\x03\x75\x00\
-\x01\x00\x6a\x03\x0d\x00\x01\x00\x93\x02\x52\x00\x01\x00\x66\x03\
-\x1a\x00\x01\x00\x5f\x02\x15\x00\x01\x00\x69\x03\x13\x00\x01\x00\
-\x6a\x03\x1f\x00\x01\x00\x8b\x03\x1f\x00\x01\x00\x62\x03\x19\x00\
-\x01\x00\x6b\x03\x27\x00\x01\x00\x67\x03\x24\x00\x01\x00\x67\x03\
-\x2b\x00\x01\x00\x67\x03\x1d\x00\x01\x00\x50\x02\xef\x00\x01\x00\
-\x88\x03\x10\x00\x01\x00\x47\x03\x0a\x00\x01\x00\x4f\x03\x0b\x00\
-\x01\x00\x6c\x02\xdd\x00\x01\x00\x68\x02\xe5\x00\x01\x00\x4c\x02\
-\x65\x00\x01\x01\x48\x02\xfc\x00\x2e\x00\x5e\x00\x64\x00\x6a\x00\
-\x70\x00\x76\x00\x7c\x00\x82\x00\x88\x00\x8e\x00\x94\x00\x9a\x00\
-\xa0\x00\xa6\x00\xac\x00\xb2\x00\xb8\x00\xbe\x00\xc4\x00\xca\x00\
-\xd0\x00\xd6\x00\xdc\x01\x2a\x01\x30\x01\x36\x01\x3c\x01\x42\x00\
-\xe2\x00\xe8\x00\xee\x00\xf4\x00\xfa\x01\x48\x01\x00\x01\x06\x01\
-\x0c\x01\x12\x01\x18\x01\x1e\x01\x24\x01\x2a\x01\x30\x01\x36\x01\
-\x3c\x01\x42\x01\x48\x00\x01\x00\x73\x04\x62\x00\x01\x00\xc6\x04\
-\xad\x00\x01\x00\x9f\x04\x58\x00\x01\x00\x99\x04\xc0\x00\x01\x00\
-\xab\x04\x75\x00\x01\x00\x79\x04\xd9\x00\x01\x00\x47\x03\xc5\x00\
-\x01\x00\x4b\x03\xcb\x00\x01\x00\x8b\x03\x97\x00\x01\x00\x95\x03\
-\xb3\x00\x01\x00\x90\x02\x54\x00\x01\x00\x81\x01\xda\x00\x01\x00\
-\x80\x03\x99\x00\x01\x00\x43\x03\x6e\x00\x01\x00\x5c\x03\x7f\x00\
-\x01\x00\x19\x03\xef\x00\x01\x00\x5e\x04\x70\x00\x01\x00\x62\x05\
-\x4b\x00\x01\x00\x85\x05\x5e\x00\x01\x00\x62\x04\xc3\x00\x01\x00\
-\x63\x05\x18\x00\x01\x00\x5c\x05\x3f\x00\x01\x00\x66\x04\x78\x00\
-\x01\x00\x88\x04\xbe\x00\x01\x00\x6b\x04\x4d\x00\x01\x00\x69\x04\
-\xb0\x00\x01\x00\x67\x04\x88\x00\x01\x00\x88\x03\xa6\x00\x01\x00\
-\x46\x03\xc3\x00\x01\x00\x53\x03\xff\x00\x01\x00\x64\x04\x07\x00\
-\x01\x00\x66\x04\x07\x00\x01\x00\x4c\x03\x8d\x00\x01\x01\x48\x03\
-\xaa\x00\x01\x00\x69\x03\xb5\x00\x01\x00\x93\x03\x40\x00\x01\x00\
-\x68\x03\x6d\x00\x01\x00\x64\x02\xef\x00\x01\x00\x66\x03\xc4\x00\
-\x01\x00\x4e\x03\xbe\x00\x00\x00\x01\x10\x00\x01\xf4\xfe\x0c\x00\
-\x00\x07\x12\xff\x03\xfe\x89\x00\x00\x00\x00\x00\x01\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x02\x79\x06\xa7\x04\x42\x07\
-\x12\x04\x42\x07\x12\x02\x2b\x07\x12\xff\xfa\x07\x12\x02\x2b\x07\
-\x12\x00\xde\x07\x12\x00\xde\x07\x12\x00\xde\x07\x12\x01\x7c\x07\
-\x12\x01\x7c\x07\x12\x00\x7d\x07\x12\x00\x7d\x07\x12\x00\x7d\x07\
-\x12\x00\xde\x07\x12\x00\xde\x07\x12\x00\xde\x07\x12\x00\xc3\x07\
-\x12\x00\xc3\x07\x12\x00\xc3\x07\x12\x00\xc3\x07\x12\x00\xc3\x07\
-\x12\x00\xc3\x07\x12\x00\xb2\x07\x12\x00\xb2\x07\x12\x00\xbd\x07\
-\x12\x00\xb9\x07\x12\x02\x1f\x02\x58\x02\x46\x02\x58\x02\x7d\x07\
-\x12\x02\x1d\x07\x12\x02\x1f\x07\x12\x02\x1f\x07\x12\x02\x46\x07\
-\x12\x02\x7d\x07\x12\x02\x1d\x07\x12\x02\x1f\x07\x12\x02\x1f\x07\
-\x12\x02\x46\x07\x12\x02\x7d\x07\x12\x02\x1d\x07\x12\x02\x1f\x07\
-\x12\x02\x1f\x07\x12\x02\x46\x07\x12\x02\x7d\x07\x12\x02\x1d\x07\
-\x12\x02\x1f\x07\x12\x02\x1f\x07\x12\x02\x46\x07\x12\x02\x7d\x07\
-\x12\x02\x1d\x07\x12\x02\x7d\x07\x12\x02\x1d\x07\x12\x01\x86\x07\
-\x12\x01\x86\x07\x12\x01\x86\x07\x12\x01\x9b\x07\x12\x01\x3e\x07\
-\x12\x01\x86\x07\x12\x01\x86\x07\x12\x01\x9b\x07\x12\x01\x3e\x07\
-\x12\x01\x1b\x07\x12\x01\x2c\x07\x12\x01\x2c\x07\x12\x01\x2c\x07\
-\x12\x01\x41\x07\x12\x00\xe4\x07\x12\x01\x2b\x07\x12\x01\x2b\x07\
-\x12\x01\x2b\x07\x12\x01\x40\x07\x12\x00\xe3\x07\x12\x01\x09\x07\
-\x12\x01\x09\x07\x12\x01\x09\x07\x12\x01\x1e\x07\x12\x00\xc1\x07\
-\x12\x01\x7f\x07\x12\x01\x7f\x07\x12\x01\xed\x07\x12\x02\x23\x07\
-\x12\x02\x23\x07\x12\x01\x7f\x07\x12\x01\x7f\x07\x12\x01\xed\x07\
-\x12\x02\x23\x07\x12\x02\x23\x07\x12\x01\x7f\x07\x12\x01\x7f\x07\
-\x12\x01\xed\x07\x12\x02\x23\x07\x12\x02\x23\x07\x12\x00\xc9\x07\
-\x12\x01\x7f\x07\x12\x01\x7f\x07\x12\x01\xed\x07\x12\x02\x23\x07\
-\x12\x02\x23\x07\x12\x00\x8e\x07\x12\x00\x6b\x07\x12\x00\xc9\x07\
-\x12\x00\xc9\x07\x12\x01\x20\x07\x12\x01\x4a\x07\x12\x01\x4a\x07\
-\x12\x01\xc9\x07\x12\x01\xc9\x07\x12\x01\xcd\x07\x12\x00\xf1\x07\
-\x12\x00\xf1\x07\x12\x00\xe7\x07\x12\x00\x92\x07\x12\x00\x92\x07\
-\x12\x00\x88\x07\x12\x01\xc9\x07\x12\x02\x69\x07\x12\x02\x83\x07\
-\x12\x02\x69\x07\x12\x02\x7c\x07\x12\x02\x81\x07\x12\x01\x8a\x07\
-\x12\x01\x8a\x07\x12\x01\xa1\x07\x12\x01\x99\x07\x12\x01\x9a\x07\
-\x12\x01\x2c\x07\x12\x01\x3b\x07\x12\x01\x2c\x07\x12\x01\x3b\x07\
-\x12\x01\x42\x07\x12\x01\x3a\x07\x12\x02\x69\x07\x12\x02\x83\x07\
-\x12\x01\x8a\x07\x12\x01\x9a\x07\x12\x01\x2d\x07\x12\x01\x3c\x07\
-\x12\x01\x2d\x07\x12\x01\x43\x07\x12\x01\x3b\x07\x12\x02\x4d\x07\
-\x12\x02\x4d\x07\x12\x02\x7d\x07\x12\x02\x7d\x07\x12\x02\x4d\x07\
-\x12\x01\xba\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\
-\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x02\x22\x07\
-\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\
-\x12\x01\x77\x07\x12\x01\x77\x07\x12\x01\x84\x07\x12\x01\x84\x07\
-\x12\x01\x84\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x01\xb0\x07\
-\x12\x01\xb0\x07\x12\x02\x27\x07\x12\x02\x27\x07\x12\x01\xff\x07\
-\x12\x00\xdd\x07\x12\x00\xdd\x07\x12\x01\x44\x07\x12\x01\x44\x07\
-\x12\x01\x1b\x07\x12\x00\xaf\x07\x12\x00\xaf\x07\x12\x01\x24\x07\
-\x12\x01\x29\x07\x12\x00\xc2\x07\x12\x00\x51\x07\x12\x00\x51\x07\
-\x12\x00\xc6\x07\x12\x00\xcb\x07\x12\x00\x65\x07\x12\x01\x91\x07\
-\x12\x02\x0b\x07\x12\x02\x0b\x07\x12\x01\x9f\x07\x12\x01\x91\x07\
-\x12\x01\x91\x07\x12\x02\x44\x07\x12\x02\x44\x07\x12\x01\x60\x07\
-\x12\x01\x60\x07\x12\x01\x60\x07\x12\x01\x25\x07\x12\x00\xbe\x07\
-\x12\x01\x64\x07\x12\x01\x06\x07\x12\x00\xd3\x07\x12\x01\x67\x07\
-\x12\x00\xd4\x07\x12\x00\xd3\x07\x12\x01\x67\x07\x12\x01\x11\x07\
-\x12\x01\x67\x07\x12\x01\x11\x07\x12\x01\x67\x07\x12\x01\x11\x07\
-\x12\x01\x11\x07\x12\x01\x11\x07\x12\x01\x11\x07\x12\x01\x11\x07\
-\x12\x00\x33\x07\x12\x00\xa4\x07\x12\x00\xf6\x07\x12\x00\xa4\x07\
-\x12\x00\xa4\x07\x12\x00\xf6\x07\x12\x00\xa4\x07\x12\x00\xf6\x07\
-\x12\x00\xa4\x07\x12\x00\xf6\x07\x12\x01\x11\x07\x12\x00\x2d\x07\
-\x12\x00\x2d\x07\x12\x00\x2d\x07\x12\x00\x33\x07\x12\x00\x33\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x01\xdc\x07\x12\x01\xdc\x07\x12\x02\x38\x07\
-\x12\x02\x38\x07\x12\x02\x3a\x07\x12\x01\xa3\x07\x12\x01\xa3\x07\
-\x12\x01\xa3\x07\x12\x01\x9f\x07\x12\x01\x42\x07\x12\x02\x60\x07\
-\x12\x02\x60\x07\x12\x02\x60\x07\x12\x01\xa3\x07\x12\x01\xc5\x07\
-\x12\x01\xc5\x07\x12\x01\xee\x07\x12\x02\x26\x07\x12\x02\x26\x07\
-\x12\x01\xb7\x07\x12\x00\xd1\x07\x12\x00\xd1\x07\x12\x00\xfd\x07\
-\x12\x01\xc5\x07\x12\x01\xc5\x07\x12\x02\x7e\x07\x12\x02\x9c\x07\
-\x12\x02\x1d\x07\x12\x00\xd0\x07\x12\x01\x62\x07\x12\x01\x7e\x07\
-\x12\x01\x07\x07\x12\x01\xb7\x07\x12\x01\xb7\x07\x12\x02\x26\x07\
-\x12\x02\x26\x07\x12\x01\xb7\x07\x12\x01\x08\x07\x12\x01\x08\x07\
-\x12\x01\x34\x07\x12\x01\x08\x07\x12\x01\x34\x07\x12\x02\x44\x07\
-\x12\x02\x44\x07\x12\x02\x44\x07\x12\x01\x2f\x07\x12\x01\x2f\x07\
-\x12\x01\x39\x07\x12\x01\x14\x07\x12\x01\x14\x07\x12\x01\x1f\x07\
-\x12\x01\x3d\x07\x12\x01\x3d\x07\x12\x01\x47\x07\x12\x01\x60\x07\
-\x12\x01\x60\x07\x12\x01\x6b\x07\x12\x01\x23\x07\x12\x01\x23\x07\
-\x12\x01\x2e\x07\x12\x01\x0c\x07\x12\x01\x0c\x07\x12\x01\x17\x07\
-\x12\x01\xb0\x07\x12\x01\xb0\x07\x12\x02\xb8\x07\x12\x01\xb0\x07\
-\x12\x01\xb0\x07\x12\x02\xb8\x07\x12\x02\x7d\x07\x12\x02\x1d\x07\
-\x12\x01\x6c\x07\x12\x01\x6c\x07\x12\x01\xb7\x07\x12\x01\x64\x07\
-\x12\x01\x07\x07\x12\x01\xb0\x07\x12\x01\xb0\x07\x12\x02\xb8\x07\
-\x12\x02\x7d\x07\x12\x02\x1d\x07\x12\x01\xb0\x07\x12\x01\xb0\x07\
-\x12\x01\xb0\x07\x12\x02\xb8\x07\x12\x02\x7d\x07\x12\x02\x1d\x07\
-\x12\x01\xd8\x07\x12\x01\xd8\x07\x12\x03\x54\x07\x12\x00\xe0\x07\
-\x12\x00\xe0\x07\x12\x02\x3d\x07\x12\x01\xc5\x07\x12\x01\xee\x07\
-\x12\x01\x66\x07\x12\x02\x46\x07\x12\x03\x54\x07\x12\x03\x54\x07\
-\x12\x01\xbe\x07\x12\x01\x3d\x07\x12\x01\x61\x07\x12\x00\x8b\x07\
-\x12\x01\x03\x07\x12\x01\x5b\x07\x12\x01\x13\x07\x12\x00\xd8\x07\
-\x12\x00\x5f\x07\x12\x00\x2f\x07\x12\x01\x13\x07\x12\x00\xd8\x07\
-\x12\x00\xa3\x07\x12\x00\x83\x07\x12\x00\x84\x07\x12\x02\x2c\x07\
-\x12\x02\x7c\x07\x12\x01\xa1\x07\x12\x02\x1d\x07\x12\x02\x38\x07\
-\x12\x02\x38\x07\x12\x02\x1d\x07\x12\x01\xa3\x07\x12\x02\x26\x07\
-\x12\x02\x1d\x07\x12\x02\x1d\x07\x12\x02\x2c\x07\x12\x02\x1d\x07\
-\x12\x02\x2c\x07\x12\x01\xb7\x07\x12\x01\x9f\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\x57\x07\x12\x02\x7c\x07\x12\x01\xa1\x07\
-\x12\x02\x1d\x07\x12\x02\x38\x07\x12\x02\x38\x07\x12\x02\x1d\x07\
-\x12\x01\xa3\x07\x12\x02\x26\x07\x12\x02\x1d\x07\x12\x02\x1d\x07\
-\x12\x02\x2c\x07\x12\x02\x1d\x07\x12\x02\x2c\x07\x12\x01\xb7\x07\
-\x12\x01\x9e\x07\x12\x01\x9b\x07\x12\x01\x9b\x07\x12\x01\x3e\x07\
-\x12\x01\x9b\x07\x12\x01\x9b\x07\x12\x01\x3e\x07\x12\x01\x9b\x07\
-\x12\x01\x9b\x07\x12\x01\x3e\x07\x12\x01\x3e\x07\x12\x01\x70\x07\
-\x12\x01\x3e\x07\x12\x01\x70\x07\x12\x01\x3e\x07\x12\x01\x71\x07\
-\x12\x01\x41\x07\x12\x01\x41\x07\x12\x00\xe4\x07\x12\x01\x41\x07\
-\x12\x01\x41\x07\x12\x00\xe4\x07\x12\x01\x41\x07\x12\x01\x41\x07\
-\x12\x00\xe4\x07\x12\x00\xe4\x07\x12\x00\xfd\x07\x12\x00\xe4\x07\
-\x12\x00\xfd\x07\x12\x00\xe4\x07\x12\x00\xff\x07\x12\x01\x4a\x07\
-\x12\x01\x4a\x07\x12\x01\x4a\x07\x12\x01\x4a\x07\x12\x01\x4a\x07\
-\x12\x02\x4d\x07\x12\x02\x7c\x07\x12\x02\x38\x07\x12\x02\x38\x07\
-\x12\x02\x38\x07\x12\x02\x26\x07\x12\x02\x26\x07\x12\x02\x2c\x07\
-\x12\x02\x2c\x07\x12\x02\x2c\x07\x12\x02\x2c\x07\x12\x01\xa1\x07\
-\x12\x01\xa1\x07\x12\x02\x38\x07\x12\x01\xa8\x07\x12\x01\xa8\x07\
-\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\
-\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x5c\x07\
-\x12\x01\x5c\x07\x12\x01\x5c\x07\x12\x01\x32\x07\x12\x01\x32\x07\
-\x12\x01\x32\x07\x12\x01\x32\x07\x12\x01\x32\x07\x12\x01\x32\x07\
-\x12\x02\x22\x07\x12\x02\x22\x07\x12\x01\xa1\x07\x12\x01\xa1\x07\
-\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\
-\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\x12\x02\x22\x07\
-\x12\x02\x22\x07\x12\x01\xa8\x07\x12\x01\xa8\x07\x12\x01\x84\x07\
-\x12\x01\x84\x07\x12\x01\x84\x07\x12\x01\x84\x07\x12\x01\x84\x07\
-\x12\x01\x84\x07\x12\x01\x84\x07\x12\x01\x84\x07\x12\x01\x84\x07\
-\x12\x01\x8b\x07\x12\x01\x99\x07\x12\x01\x91\x07\x12\x01\x9e\x07\
-\x12\x01\x8f\x07\x12\x01\x95\x07\x12\x00\xc2\x07\x12\x00\xc2\x07\
-\x12\x00\xc2\x07\x12\x00\xbe\x07\x12\x00\xbe\x07\x12\x00\xbe\x07\
-\x12\x01\x11\x07\x12\x01\x11\x07\x12\x01\x11\x07\x12\x01\x11\x07\
-\x12\x01\x11\x07\x12\x01\x11\x07\x12\x01\x11\x07\x12\x00\xa4\x07\
-\x12\x00\xa4\x07\x12\x00\xa4\x07\x12\x00\xa4\x07\x12\x00\xa4\x07\
-\x12\x00\xa4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\
-\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x00\xd4\x07\x12\x02\x38\x07\
-\x12\x01\xa1\x07\x12\x01\x9f\x07\x12\x01\x9f\x07\x12\x01\x42\x07\
-\x12\x01\x9f\x07\x12\x01\x9f\x07\x12\x01\x42\x07\x12\x01\x9f\x07\
-\x12\x01\x9f\x07\x12\x01\x42\x07\x12\x01\x42\x07\x12\x01\x5d\x07\
-\x12\x01\x42\x07\x12\x01\x5d\x07\x12\x01\x42\x07\x12\x01\x5d\x07\
-\x12\x02\x7c\x07\x12\x01\xa1\x07\x12\x02\x1d\x07\x12\x02\x38\x07\
-\x12\x02\x38\x07\x12\x02\x1d\x07\x12\x01\xa3\x07\x12\x02\x26\x07\
-\x12\x02\x1d\x07\x12\x02\x7c\x07\x12\x01\xa1\x07\x12\x02\x1d\x07\
-\x12\x02\x38\x07\x12\x02\x38\x07\x12\x02\x1d\x07\x12\x01\xa3\x07\
-\x12\x02\x26\x07\x12\x02\x1d\x07\x12\x00\xde\x07\x12\x00\xde\x07\
-\x12\x01\x64\x07\x12\x01\x64\x07\x12\x01\x07\x07\x12\x01\x64\x07\
-\x12\x01\x64\x07\x12\x01\x07\x07\x12\x01\x64\x07\x12\x01\x64\x07\
-\x12\x01\x07\x07\x12\x01\x07\x07\x12\x01\x64\x07\x12\x01\x07\x07\
-\x12\x01\x1f\x07\x12\x01\x07\x07\x12\x01\x47\x07\x12\x01\x07\x07\
-\x12\x01\x64\x07\x12\x01\x07\x07\x12\x01\x35\x07\x12\x01\x07\x07\
-\x12\x01\x64\x07\x12\x01\x07\x07\x12\x01\x35\x07\x12\x01\x07\x07\
-\x12\x01\x35\x07\x12\x01\x07\x07\x12\x01\x07\x07\x12\x01\x35\x07\
-\x12\x01\x07\x07\x12\xff\xc1\x07\x12\x00\xb2\x07\x12\xff\xe6\x07\
-\x12\x04\x28\x07\x12\x02\xcb\x07\x12\x02\x4b\x07\x12\x01\x68\x07\
-\x12\x01\x62\x07\x12\x01\x51\x07\x12\x01\x56\x07\x12\x01\x8e\x07\
-\x12\x01\x76\x07\x12\x01\x69\x07\x12\x01\x76\x07\x12\x01\x5f\x07\
-\x12\x02\x24\x07\x12\x01\x68\x07\x12\x01\x62\x07\x12\x01\x51\x07\
-\x12\x01\x56\x07\x12\x01\x57\x07\x12\x01\x64\x07\x12\x01\x69\x07\
-\x12\x01\x72\x07\x12\x01\x5f\x07\x12\x01\x56\x07\x12\x01\x69\x07\
-\x12\x00\xf2\x07\x12\x01\x02\x07\x12\x00\xf2\x07\x12\x00\xf2\x07\
-\x12\x01\x02\x07\x12\x01\x02\x07\x12\x01\x02\x07\x12\x01\x02\x07\
-\x12\x00\xf2\x07\x12\x00\xf2\x06\xa7\x04\x42\x06\xa7\x04\x42\x06\
-\xa7\x04\x42\x06\xa7\x04\x42\x06\xa7\x04\x42\x06\xa7\x04\x42\x06\
-\xa7\x04\x42\x06\xa7\x04\x42\x06\xa7\x04\x42\x07\x12\x04\x42\x02\
-\x84\x02\x84\x03\x45\x02\xcb\x01\x8c\x00\xef\x02\xae\x01\xdb\x03\
-\x49\x02\xba\x02\xd5\x03\x28\x02\x0e\x01\xb0\x00\x20\x00\xad\x00\
-\xad\x03\x2a\x03\x2f\x01\xb5\x00\xe4\x01\xfd\x01\xc7\x00\xe4\x00\
-\xe4\x03\x2a\x00\x84\x02\x4e\x02\x4e\x03\xcc\x00\x8e\x00\x8e\x00\
-\xe4\x00\xe4\x00\xe4\x04\x42\x02\x4d\xff\xc1\x01\x55\x01\x55\x01\
-\x19\x01\x19\x01\x3d\x00\xa3\x01\x02\x01\x02\x01\x02\x01\x86\x01\
-\x02\x01\x19\x01\x77\x04\x42\xff\xe0\xff\xaf\xff\xfe\xff\xa2\xff\
-\xf7\xff\xa3\x00\xb9\x03\x53\x02\x67\x00\x9c\x02\xfe\x00\xda\x04\
-\x0c\x00\xac\x02\x58\x02\x18\x02\x1c\x02\x14\x02\x84\x02\x84\x02\
-\x84\x00\xdd\x04\x42\x00\xc1\x00\xaa\x04\x42\x04\x42\x00\x62\x03\
-\xb9\xff\xf1\x03\x9f\xff\x03\xff\x04\xff\x85\xff\x2d\xff\x22\x03\
-\x4f\x03\x53\x00\x90\x01\x22\x03\xb0\x00\xdb\x01\x5f\x04\x7d\x00\
-\x85\xff\xcd\xff\xa4\xff\xdf\x00\x07\xff\x9e\x00\x0f\xff\xc9\x00\
-\xa3\x00\x9b\x00\x97\x01\x46\x00\x6e\x00\x75\x00\xe3\x00\xa7\x04\
-\x73\x00\x90\x01\x22\x03\xb0\x00\xdb\x01\x5f\x00\x85\x00\xa3\x04\
-\x42\x00\x00\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6d\x65\xb3\
-\x00\x66\
-\x00\x6f\x00\x6e\x00\x74\x00\x73\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x08\
-\x05\xe2\x59\x27\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x06\xa9\x57\xa7\
-\x00\x70\
-\x00\x64\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x07\x7e\xa0\x47\
-\x00\x65\
-\x00\x78\x00\x74\x00\x72\x00\x61\x00\x63\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0a\xc8\xfb\x07\
-\x00\x66\
-\x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x07\xf2\x24\xe6\
-\x00\x43\
-\x00\x61\x00\x69\x00\x72\x00\x6f\x00\x2d\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x00\x2e\x00\x74\x00\x74\x00\x66\
-\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x07\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
-\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x30\xf8\
-\x00\x00\x00\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x7c\xd6\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x83\
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x74\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x07\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x04\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x20\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x94\xcd\x6b\x23\x42\
-\x00\x00\x00\x36\x00\x00\x00\x00\x00\x01\x00\x00\x30\xf8\
-\x00\x00\x01\x94\xcd\x6b\x8e\x98\
-\x00\x00\x00\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x7c\xd6\
-\x00\x00\x01\x94\xcd\x6a\x1d\xbf\
-\x00\x00\x00\x66\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x83\
-\x00\x00\x01\x94\xcd\x6a\xc2\x11\
-\x00\x00\x00\x80\x00\x00\x00\x00\x00\x01\x00\x00\xe7\x74\
-\x00\x00\x01\x94\xcd\x62\x91\x19\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
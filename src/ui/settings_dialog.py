@@ -8,6 +8,7 @@ from PyQt5.QtWidgets import (
     QSpinBox,
 )
 from PyQt5.QtCore import Qt
+from ..util import profiling
 from ..util.settings import Settings
 from ..util.translations import Translations
 
@@ -43,6 +44,27 @@ class SettingsDialog(QDialog):
         size_layout.addWidget(self.size_spin)
         layout.addLayout(size_layout)
 
+        # Image data kept in memory before spilling to disk
+        buffer_layout = QHBoxLayout()
+        buffer_label = QLabel(Translations.get("image_buffer"))
+        self.buffer_spin = QSpinBox()
+        self.buffer_spin.setRange(64, 16384)
+        self.buffer_spin.setSingleStep(64)
+        self.buffer_spin.setValue(self.settings.get_image_buffer_mb())
+        buffer_layout.addWidget(buffer_label)
+        buffer_layout.addWidget(self.buffer_spin)
+        layout.addLayout(buffer_layout)
+
+        # Profiling of the extraction stages (report in the cache directory)
+        profiling_layout = QHBoxLayout()
+        profiling_label = QLabel(Translations.get("profiling"))
+        self.profiling_combo = QComboBox()
+        self.profiling_combo.addItems(profiling.MODES)
+        self.profiling_combo.setCurrentText(self.settings.get_profiling_mode())
+        profiling_layout.addWidget(profiling_label)
+        profiling_layout.addWidget(self.profiling_combo)
+        layout.addLayout(profiling_layout)
+
         # Buttons
         button_layout = QHBoxLayout()
         save_button = QPushButton(Translations.get("save"))
@@ -58,4 +80,7 @@ class SettingsDialog(QDialog):
             "ar" if self.lang_combo.currentText() == "العربية" else "en"
         )
         self.settings.set_font_size(self.size_spin.value())
+        self.settings.set_image_buffer_mb(self.buffer_spin.value())
+        self.settings.set_profiling_mode(self.profiling_combo.currentText())
+        profiling.configure(self.profiling_combo.currentText())
         self.accept()
@@ -0,0 +1,168 @@
+import os
+from PyQt5.QtCore import QThread, pyqtSignal
+from ..engine.cancellation import (
+    CancellationToken,
+    CancelledError,
+    DeadlineExceededError,
+)
+from ..engine.estimate import estimate, total
+from ..engine.images import (
+    collect_preview_images,
+    export_all_images,
+    export_presentation,
+)
+from ..util.image_handler import open_file
+from ..util.settings import Settings
+
+
+class ExtractionWorker(QThread):
+    """Worker thread for PDF processing to keep UI responsive"""
+
+    progress = pyqtSignal(int, int)  # current, total
+    finished = pyqtSignal(int)
+    error = pyqtSignal(str)
+
+    def __init__(
+        self,
+        pdf_path,
+        output_dir,
+        should_invert,
+        export_to_ppt,
+        timeout=None,
+        memory_budget_mb=None,
+        dedupe_distance=None,
+        incremental=False,
+    ):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.output_dir = output_dir
+        self.should_invert = should_invert
+        self.export_to_ppt = export_to_ppt
+        self.memory_budget_mb = memory_budget_mb or Settings().get_image_buffer_mb()
+        self.dedupe_distance = dedupe_distance
+        self.incremental = incremental
+        self.cancel_token = CancellationToken(timeout=timeout)
+
+    def run(self):
+        try:
+            image_count = export_all_images(
+                self.pdf_path,
+                self.output_dir,
+                self.should_invert,
+                self.export_to_ppt,
+                progress=self.progress.emit,
+                cancel=self.cancel_token,
+                resume=True,
+                memory_budget_mb=self.memory_budget_mb,
+                dedupe_distance=self.dedupe_distance,
+                incremental=self.incremental,
+            )
+
+            if self.export_to_ppt and image_count:
+                output_name = os.path.splitext(os.path.basename(self.pdf_path))[0]
+                open_file(os.path.join(self.output_dir, f"{output_name}.pptx"))
+            self.finished.emit(image_count)
+
+        except DeadlineExceededError:
+            self.error.emit("Extraction timed out")
+        except CancelledError:
+            return
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def stop(self):
+        self.cancel_token.cancel()
+
+
+class ImageExtractionThread(QThread):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(tuple)
+
+    def __init__(self, pdf_path, output_dir, start_page=1, end_page=None, options=None):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.output_dir = output_dir
+        self.start_page = start_page
+        self.end_page = end_page
+        self.options = dict(options or {})
+        self.options.setdefault("memory_budget_mb", Settings().get_image_buffer_mb())
+        self.cancel_token = CancellationToken(timeout=self.options.get("timeout"))
+
+    def report_progress(self, current, total):
+        self.progress.emit(int(current * 100 / total) if total else 100)
+
+    def run(self):
+        try:
+            if self.options.get("preview_only"):
+                images = collect_preview_images(
+                    self.pdf_path,
+                    self.start_page,
+                    self.end_page,
+                    self.options,
+                    self.report_progress,
+                    self.cancel_token,
+                )
+                self.finished.emit((True, "تم استخراج الصور للمعاينة", images))
+                return
+
+            image_count, output_path = export_presentation(
+                self.pdf_path,
+                self.output_dir,
+                self.start_page,
+                self.end_page,
+                self.options,
+                self.report_progress,
+                self.cancel_token,
+                resume=True,
+            )
+
+            if output_path:
+                open_file(output_path)
+                self.finished.emit((True, f"تم حفظ {image_count} صورة", image_count))
+            else:
+                self.finished.emit((False, "لم يتم العثور على صور", 0))
+
+        except DeadlineExceededError:
+            self.finished.emit((False, "انتهت المهلة المحددة للمعالجة", 0))
+        except CancelledError:
+            self.finished.emit((False, "تم إيقاف المعالجة", 0))
+        except Exception as e:
+            print(f"Error during extraction: {str(e)}")
+            self.finished.emit((False, "حدث خطأ أثناء المعالجة", 0))
+
+    def stop(self):
+        self.cancel_token.cancel()
+
+
+class EstimateWorker(QThread):
+    """Estimate the output of PDFs off the UI thread
+
+    finished carries a (file path, Estimate or error message) pair per
+    PDF, with the totals of every range.
+    """
+
+    finished = pyqtSignal(list)
+
+    def __init__(self, file_paths, image_format="JPEG", skip_small=True, calibration=None):
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.image_format = image_format
+        self.skip_small = skip_small
+        self.calibration = calibration
+
+    def run(self):
+        results = []
+        for file_path in self.file_paths:
+            try:
+                item = total(
+                    estimate(
+                        file_path,
+                        image_format=self.image_format,
+                        skip_small=self.skip_small,
+                        calibration=self.calibration,
+                    )
+                )
+            except Exception as e:
+                item = str(e)
+            results.append((file_path, item))
+        self.finished.emit(results)
@@ -0,0 +1,183 @@
+"""Content-adaptive output encoding.
+
+classify() looks at a small nearest-neighbour sample of an image and calls
+it a photo, line art (few flat colours), bilevel (black and white scans,
+text) or grayscale. choose_encoding() maps the class to a format:
+
+    photo       JPEG at PHOTO_QUALITY
+    grayscale   single-channel JPEG
+    line_art    palette PNG
+    bilevel     1-bit PNG
+
+Images with transparency always become RGBA PNG. EncodePool runs the
+encode-and-write step of many images on a few threads; Pillow releases the
+GIL while compressing, so the threads encode in parallel.
+"""
+
+import io
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageChops
+from . import telemetry
+
+
+PHOTO = "photo"
+LINE_ART = "line_art"
+BILEVEL = "bilevel"
+GRAYSCALE = "grayscale"
+
+PHOTO_QUALITY = 90
+SAMPLE_SIZE = 256
+# Channel difference below which a pixel counts as gray
+GRAY_TOLERANCE = 12
+# Share of pixels that must be near black or white for a bilevel image
+BILEVEL_SHARE = 0.9
+# A line drawing spends this share of its pixels on LINE_ART_COLORS colours
+LINE_ART_SHARE = 0.9
+LINE_ART_COLORS = 16
+
+Encoding = namedtuple("Encoding", "kind format extension mode options")
+
+
+def sample_image(image):
+    """Return a small RGB(A) copy of image, without blending colours
+
+    classify() of the sample gives the class of the image.
+    """
+    scale = max(image.width, image.height) / SAMPLE_SIZE
+    if scale > 1:
+        size = (max(1, round(image.width / scale)), max(1, round(image.height / scale)))
+        image = image.resize(size, Image.Resampling.NEAREST)
+    return image.convert("RGBA" if has_alpha(image) else "RGB")
+
+
+def has_alpha(image):
+    if image.mode in ("RGBA", "LA", "PA"):
+        return image.getextrema()[-1][0] < 255
+    return image.mode == "P" and "transparency" in image.info
+
+
+def classify(image):
+    """Return PHOTO, LINE_ART, BILEVEL or GRAYSCALE for a Pillow image"""
+    if image.mode == "1":
+        return BILEVEL
+    sample = sample_image(image)
+    pixels = sample.width * sample.height
+    red, green, blue = sample.split()[:3]
+
+    gray = image.mode in ("L", "LA", "I", "F") or (
+        ImageChops.difference(red, green).getextrema()[1] <= GRAY_TOLERANCE
+        and ImageChops.difference(green, blue).getextrema()[1] <= GRAY_TOLERANCE
+    )
+    if gray:
+        histogram = sample.convert("L").histogram()
+        extremes = sum(histogram[:32]) + sum(histogram[224:])
+        if extremes >= BILEVEL_SHARE * pixels:
+            return BILEVEL
+
+    colors = sample.convert("RGB").getcolors(pixels)
+    top = sorted((count for count, _ in colors), reverse=True)[:LINE_ART_COLORS]
+    if sum(top) >= LINE_ART_SHARE * pixels:
+        return LINE_ART
+    return GRAYSCALE if gray else PHOTO
+
+
+def choose_encoding(image, quality=PHOTO_QUALITY):
+    """Return the Encoding for image (see the module docstring)"""
+    kind = classify(image)
+    if has_alpha(image):
+        return Encoding(kind, "PNG", "png", "RGBA", {})
+    if kind == BILEVEL:
+        return Encoding(kind, "PNG", "png", "1", {})
+    if kind == LINE_ART:
+        return Encoding(kind, "PNG", "png", "P", {})
+    mode = "L" if kind == GRAYSCALE else "RGB"
+    return Encoding(kind, "JPEG", "jpg", mode, {"quality": quality})
+
+
+def convert(image, mode):
+    """Convert image for an Encoding mode"""
+    if mode == "1":
+        # Threshold instead of Pillow's default dithering
+        return image.convert("L").point(lambda value: 255 if value >= 128 else 0, mode="1")
+    if mode == "P":
+        return image.convert("RGB").quantize(256, dither=Image.Dither.NONE)
+    if mode == "L" and image.mode == "1":
+        return image.convert("L")
+    return image if image.mode == mode else image.convert(mode)
+
+
+def encode(image, encoding):
+    """Return the bytes of image encoded as encoding"""
+    buffer = io.BytesIO()
+    convert(image, encoding.mode).save(buffer, encoding.format, **encoding.options)
+    return buffer.getvalue()
+
+
+def default_workers():
+    return min(4, os.cpu_count() or 1)
+
+
+class EncodePool:
+    """Run encode/write tasks on a few threads with bounded memory
+
+    At most twice the number of workers tasks are queued, so a producer
+    that extracts faster than the pool encodes waits instead of holding
+    every image in memory. Task results come back from wait(); the first
+    exception raised by a task is re-raised there. Telemetry counts of a
+    task go to the run that was active where it was submitted.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or default_workers()
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="encode")
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+        self._futures = []
+        self._error = None
+
+    def _task_done(self, future):
+        if self._error is None and not future.cancelled() and future.exception():
+            self._error = future.exception()
+
+    def submit(self, function, *args, **kwargs):
+        self._slots.acquire()
+        run = telemetry.current_run()
+
+        def task():
+            try:
+                with telemetry.joined(run):
+                    return function(*args, **kwargs)
+            finally:
+                self._slots.release()
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._futures.append(future)
+        future.add_done_callback(self._task_done)
+        # Fail fast: stop the producer once a task has failed
+        if self._error is not None:
+            raise self._error
+        return future
+
+    def wait(self):
+        """Return the results of every task, in submission order"""
+        results = [future.result() for future in self._futures]
+        self._futures = []
+        return results
+
+    def close(self):
+        for future in self._futures:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
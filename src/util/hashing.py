@@ -0,0 +1,15 @@
+import hashlib
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """Return the SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bytes_sha256(data):
+    """Return the SHA-256 hex digest of a bytes object"""
+    return hashlib.sha256(data).hexdigest()
@@ -0,0 +1,164 @@
+import os
+import shutil
+import sqlite3
+from . import telemetry
+from .hashing import bytes_sha256
+from .paths import get_cache_dir
+from .phash import BKTree, hash_image_bytes
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    phash INTEGER NOT NULL,
+    variant TEXT NOT NULL,
+    path TEXT NOT NULL UNIQUE,
+    pdf TEXT NOT NULL,
+    page INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS images_sha256 ON images (sha256, variant);
+"""
+
+
+def _signed(value):
+    """SQLite integers are signed 64-bit"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _unsigned(value):
+    return value + (1 << 64) if value < 0 else value
+
+
+def link_file(source, target):
+    """Make target refer to source: a hard link, else a symlink, else a copy
+
+    Returns "hardlink", "symlink" or "copy" ("same" when target is source).
+    """
+    if os.path.abspath(source) == os.path.abspath(target):
+        return "same"
+    if os.path.lexists(target):
+        os.remove(target)
+    try:
+        os.link(source, target)
+        return "hardlink"
+    except OSError:
+        pass
+    try:
+        os.symlink(os.path.abspath(source), target)
+        return "symlink"
+    except OSError:
+        shutil.copyfile(source, target)
+        return "copy"
+
+
+class ImageCatalog:
+    """Persistent catalog of extracted images across all processed PDFs
+
+    Every saved image is recorded with the SHA-256 of its embedded stream,
+    its perceptual hash (util.phash) and the file it was written to. A
+    later extraction (e.g. of a new edition of the same book) looks each
+    image up first and links to the existing file instead of decoding and
+    encoding it again. Images match exactly by SHA-256, or with max_distance
+    set, by perceptual hash. variant identifies the output settings
+    (format, inversion), since the same stream saved differently is a
+    different file.
+    """
+
+    def __init__(self, db_path=None, max_distance=None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "image_catalog.sqlite3")
+        self.db_path = str(db_path)
+        self.max_distance = max_distance
+        # Several extraction processes may share the catalog
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._trees = {}
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    @staticmethod
+    def fingerprint(image_bytes):
+        """Return the (sha256, perceptual hash) pair of an image stream"""
+        return bytes_sha256(image_bytes), hash_image_bytes(image_bytes)
+
+    def lookup(self, fingerprint, variant):
+        """Return the path of a stored copy of the image, or None"""
+        sha256, phash = fingerprint
+        rows = self.conn.execute(
+            "SELECT id, path FROM images WHERE sha256 = ? AND variant = ?",
+            (sha256, variant),
+        ).fetchall()
+        path = self._existing(rows)
+        if path is None and self.max_distance is not None:
+            matches = self._tree(variant).find(phash, self.max_distance)
+            ids = [row_id for _, _, row_id in matches]
+            rows = [
+                self.conn.execute("SELECT id, path FROM images WHERE id = ?", (row_id,)).fetchone()
+                for row_id in ids
+            ]
+            path = self._existing([row for row in rows if row])
+
+        telemetry.event("cache", name="image_catalog", hit=path is not None)
+        return path
+
+    def _existing(self, rows):
+        """First path of rows that still exists; rows of deleted files are dropped"""
+        for row_id, path in rows:
+            if os.path.exists(path):
+                return path
+            with self.conn:
+                self.conn.execute("DELETE FROM images WHERE id = ?", (row_id,))
+        return None
+
+    def _tree(self, variant):
+        if variant not in self._trees:
+            tree = BKTree()
+            for row_id, phash in self.conn.execute(
+                "SELECT id, phash FROM images WHERE variant = ?", (variant,)
+            ):
+                tree.add(_unsigned(phash), row_id)
+            self._trees[variant] = tree
+        return self._trees[variant]
+
+    def add(self, fingerprint, variant, path, pdf_path, page):
+        """Record a saved image file"""
+        sha256, phash = fingerprint
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR REPLACE INTO images (sha256, phash, variant, path, pdf, page) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    sha256,
+                    _signed(phash),
+                    variant,
+                    os.path.abspath(path),
+                    os.path.abspath(pdf_path),
+                    page,
+                ),
+            )
+        if variant in self._trees:
+            self._trees[variant].add(phash, cursor.lastrowid)
+
+    def prune(self):
+        """Forget images whose files were deleted; returns how many"""
+        stale = [
+            row_id
+            for row_id, path in self.conn.execute("SELECT id, path FROM images")
+            if not os.path.exists(path)
+        ]
+        with self.conn:
+            self.conn.executemany("DELETE FROM images WHERE id = ?", [(i,) for i in stale])
+        self._trees = {}
+        return len(stale)
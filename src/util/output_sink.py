@@ -0,0 +1,161 @@
+"""Destinations for extracted images.
+
+A sink receives (name, bytes) entries as they are produced. DirectorySink
+writes one file per entry (the original behaviour); ZipSink and TarSink
+append every entry to a single archive written front to back, which turns
+thousands of small file creations on a network share into one sequential
+write.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import tarfile
+import threading
+import time
+import zipfile
+
+
+# Formats that are already compressed: deflating them again costs CPU for
+# no gain, so they are stored as-is in ZIP archives
+COMPRESSED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".jp2", ".jpx"}
+
+ARCHIVE_BUFFER_SIZE = 1024 * 1024
+
+
+@contextlib.contextmanager
+def open_replacement(path):
+    """Open a temporary file for writing that replaces path when closed
+
+    Output files may be hard links to the files of an earlier run (see
+    util.image_catalog); writing through the name in place would change
+    those too. A failed write leaves no partial file.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            yield f
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class DirectorySink:
+    """Write each entry as a file inside a directory"""
+
+    def __init__(self, output_dir):
+        self.path = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+    def write(self, name, data):
+        with open_replacement(os.path.join(self.path, name)) as f:
+            f.write(data)
+
+    def write_stream(self, name, fileobj, size):
+        """Copy size bytes from fileobj, for entries too large to hold in memory"""
+        with open_replacement(os.path.join(self.path, name)) as f:
+            shutil.copyfileobj(fileobj, f, ARCHIVE_BUFFER_SIZE)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _ArchiveSink(DirectorySink):
+    """Base for sinks appending every entry to one archive
+
+    target is a file path or a writable file object; the file object does
+    not need to be seekable, so the archive can go straight to a socket.
+    """
+
+    def __init__(self, target):
+        # Entries may be written from several encoding threads
+        self._lock = threading.Lock()
+        self._owns_file = isinstance(target, (str, os.PathLike))
+        if self._owns_file:
+            self.path = os.fspath(target)
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "wb", buffering=ARCHIVE_BUFFER_SIZE)
+        else:
+            self.path = None
+            self._file = target
+        self._archive = self._open_archive(self._file)
+
+    def _open_archive(self, fileobj):
+        raise NotImplementedError
+
+    def close(self):
+        if self._archive is None:
+            return
+        self._archive.close()
+        self._archive = None
+        if self._owns_file:
+            self._file.close()
+
+
+class ZipSink(_ArchiveSink):
+    """Append entries to a streaming ZIP archive"""
+
+    def _open_archive(self, fileobj):
+        return zipfile.ZipFile(fileobj, "w", allowZip64=True)
+
+    def _method(self, name):
+        extension = os.path.splitext(name)[1].lower()
+        return zipfile.ZIP_STORED if extension in COMPRESSED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+    def write(self, name, data):
+        with self._lock:
+            self._archive.writestr(name, data, compress_type=self._method(name))
+
+    def write_stream(self, name, fileobj, size):
+        info = zipfile.ZipInfo(name, time.localtime(time.time())[:6])
+        info.compress_type = self._method(name)
+        with self._lock, self._archive.open(
+            info, "w", force_zip64=size > zipfile.ZIP64_LIMIT
+        ) as entry:
+            shutil.copyfileobj(fileobj, entry, ARCHIVE_BUFFER_SIZE)
+
+
+class TarSink(_ArchiveSink):
+    """Append entries to an uncompressed streaming TAR archive"""
+
+    def _open_archive(self, fileobj):
+        return tarfile.open(fileobj=fileobj, mode="w|")
+
+    def write(self, name, data):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        with self._lock:
+            self._archive.addfile(info, io.BytesIO(data))
+
+    def write_stream(self, name, fileobj, size):
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        with self._lock:
+            self._archive.addfile(info, fileobj)
+
+
+SINKS = {"dir": DirectorySink, "zip": ZipSink, "tar": TarSink}
+
+
+def open_sink(output_dir, archive=None, name=None):
+    """Create the sink for an output directory
+
+    With archive set to "zip" or "tar", entries go to <output_dir>/<name>.<archive>
+    (name defaults to the directory's own name) instead of loose files.
+    """
+    if not archive or archive == "dir":
+        return DirectorySink(output_dir)
+    if archive not in SINKS:
+        raise ValueError(f"Unknown archive type: {archive}")
+    name = name or os.path.basename(os.path.normpath(output_dir))
+    return SINKS[archive](os.path.join(output_dir, f"{name}.{archive}"))
@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+
+
+def get_cache_dir():
+    """Return (and create) the per-user cache directory
+
+    The location can be overridden with the PDF_IMAGING_CACHE environment
+    variable, which is useful on servers and in tests.
+    """
+    override = os.environ.get("PDF_IMAGING_CACHE")
+    if override:
+        path = Path(override)
+    elif os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local")
+        path = Path(base) / "PDF Image Extractor" / "cache"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+        path = Path(base) / "pdf-image-extractor"
+
+    path.mkdir(parents=True, exist_ok=True)
+    return str(path)
+
+
+def output_dir_key(path):
+    """Normalized form of an output directory, for comparing assignments"""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def unique_output_dir(output_root, name, taken, pdf_path=None):
+    """Return output_root/name, with a _2, _3... suffix if another PDF has it
+
+    taken maps the output_dir_key() of the directories already assigned to
+    the PDF written there and is updated with the result. A directory
+    assigned to pdf_path itself is reused, so extracting a PDF again goes
+    to the same place; two PDFs with the same file name must not share
+    (and overwrite) one.
+    """
+    output_dir = os.path.join(output_root, name)
+    suffix = 2
+    while taken.get(output_dir_key(output_dir), pdf_path) != pdf_path:
+        output_dir = os.path.join(output_root, f"{name}_{suffix}")
+        suffix += 1
+    taken[output_dir_key(output_dir)] = pdf_path
+    return output_dir
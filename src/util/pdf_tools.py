@@ -2,7 +2,29 @@ import fitz
 import json
 import shutil
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from .toc_harvester import harvest_bookmarks
+
+
+def _normalize_page_text(page_text, remove_linebreaks):
+    """Apply the text export options to a single page"""
+    if remove_linebreaks:
+        return " ".join(page_text.split())
+    return page_text
+
+
+def _extract_text_batch(pdf_path, page_numbers, remove_linebreaks):
+    """Extract the text of a batch of pages (runs inside a worker process)"""
+    doc = fitz.open(pdf_path)
+    try:
+        return [
+            _normalize_page_text(doc[page_num].get_text(), remove_linebreaks)
+            for page_num in page_numbers
+        ]
+    finally:
+        doc.close()
 
 
 class PDFTools:
@@ -77,6 +99,20 @@ class PDFTools:
         except Exception as e:
             return False, f"خطأ: {str(e)}"
 
+    @staticmethod
+    def harvest_bookmarks(root_dir, output_path, manifest_path=None, workers=None):
+        """Extract the bookmarks of a whole directory tree to one JSONL file"""
+        try:
+            summary = harvest_bookmarks(root_dir, output_path, manifest_path, workers)
+            return (
+                True,
+                f"تم استخراج {summary['records']} عنوان من {summary['processed']} ملف "
+                f"(تم تخطي {summary['skipped']} ملف دون تغيير) في {output_path}",
+            )
+
+        except Exception as e:
+            return False, f"خطأ: {str(e)}"
+
     @staticmethod
     def extract_text_with_options(
         pdf_path, start_page, end_page, remove_linebreaks=False, include_images=False
@@ -109,6 +145,89 @@ class PDFTools:
         except Exception as e:
             raise Exception(f"خطأ في استخراج النص: {str(e)}")
 
+    @staticmethod
+    def iter_text_with_options(
+        pdf_path,
+        start_page,
+        end_page,
+        remove_linebreaks=False,
+        workers=None,
+        batch_size=16,
+    ):
+        """Yield (page_number, text) in page order, extracting pages in parallel
+
+        Pages are split into batches that are extracted in a process pool.
+        Only a bounded window of batches is in flight at any time, so memory
+        stays flat regardless of document size.
+        """
+        doc = fitz.open(pdf_path)
+        page_count = doc.page_count
+        doc.close()
+
+        page_numbers = list(range(start_page - 1, min(end_page, page_count)))
+        batches = [
+            page_numbers[i : i + batch_size]
+            for i in range(0, len(page_numbers), batch_size)
+        ]
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1 or len(batches) <= 1:
+            # Not worth spawning processes for a single batch
+            for batch in batches:
+                texts = _extract_text_batch(pdf_path, batch, remove_linebreaks)
+                for page_num, page_text in zip(batch, texts):
+                    yield page_num + 1, page_text
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            batch_iter = iter(batches)
+
+            def submit_next():
+                batch = next(batch_iter, None)
+                if batch is not None:
+                    future = executor.submit(
+                        _extract_text_batch, pdf_path, batch, remove_linebreaks
+                    )
+                    pending.append((batch, future))
+
+            for _ in range(workers * 2):
+                submit_next()
+
+            # Reassemble in order: always wait on the oldest batch
+            while pending:
+                batch, future = pending.popleft()
+                texts = future.result()
+                submit_next()
+                for page_num, page_text in zip(batch, texts):
+                    yield page_num + 1, page_text
+
+    @staticmethod
+    def export_text_with_options(
+        pdf_path,
+        output_path,
+        start_page,
+        end_page,
+        remove_linebreaks=False,
+        workers=None,
+    ):
+        """Stream extracted text to a file page by page"""
+        try:
+            page_total = 0
+            with open(output_path, "w", encoding="utf-8") as f:
+                for _, page_text in PDFTools.iter_text_with_options(
+                    pdf_path, start_page, end_page, remove_linebreaks, workers
+                ):
+                    if page_total:
+                        f.write("\n\n")
+                    f.write(page_text)
+                    page_total += 1
+
+            return True, f"تم حفظ نص {page_total} صفحة في {output_path}"
+
+        except Exception as e:
+            return False, f"خطأ في استخراج النص: {str(e)}"
+
     @staticmethod
     def split_pdf_by_bookmarks(pdf_path, output_dir):
         """Split PDF based on bookmarks"""
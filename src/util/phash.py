@@ -0,0 +1,173 @@
+"""Perceptual hashes for finding near-duplicate images.
+
+Scanned books often embed the same figure several times as separately
+encoded streams, which xref or byte comparisons cannot match. A perceptual
+hash reduces an image to 64 bits that change little when the image is
+re-encoded, rescaled or slightly retouched; two images are near-duplicates
+when their hashes differ in at most a few bits (Hamming distance).
+
+The images are decoded at reduced size (JPEG draft mode decodes at 1/2 to
+1/8 scale) and reduced with Pillow, so hashing costs far less than a full
+decode. DuplicateFilter keeps the hashes seen so far in a BK-tree and
+answers "is this a near-duplicate of an earlier image?" for each new one.
+"""
+
+import math
+from operator import mul
+from PIL import Image, ImageChops
+from . import telemetry, tiled
+
+
+HASH_SIZE = 8
+DEFAULT_DISTANCE = 6
+METHODS = ("dhash", "phash")
+
+
+def _small_gray(image, size):
+    # Let JPEG decode straight to a reduced size
+    image.draft("L", (size[0] * 4, size[1] * 4))
+    return image.convert("L").resize(size, Image.Resampling.BOX)
+
+
+def _bits(mask):
+    """Pack an L mask of 0/255 values into an integer, row by row"""
+    return int.from_bytes(mask.point(lambda value: 255 if value else 0, "1").tobytes(), "big")
+
+
+def dhash(image, hash_size=HASH_SIZE):
+    """Difference hash: is each pixel darker than its right neighbour?"""
+    small = _small_gray(image, (hash_size + 1, hash_size))
+    left = small.crop((0, 0, hash_size, hash_size))
+    right = small.crop((1, 0, hash_size + 1, hash_size))
+    return _bits(ImageChops.subtract(right, left))
+
+
+_DCT_CACHE = {}
+
+
+def _dct_matrix(size, keep):
+    if (size, keep) not in _DCT_CACHE:
+        _DCT_CACHE[size, keep] = [
+            [math.cos(math.pi * (2 * x + 1) * u / (2 * size)) for x in range(size)]
+            for u in range(keep)
+        ]
+    return _DCT_CACHE[size, keep]
+
+
+def phash(image, hash_size=HASH_SIZE, highfreq_factor=4):
+    """DCT hash: low-frequency coefficients above or below their median
+
+    Slower than dhash but more tolerant of contrast and gamma changes, so
+    the extraction paths (DuplicateFilter, ImageCatalog) hash with dhash
+    and this one is opt-in.
+    """
+    size = hash_size * highfreq_factor
+    pixels = _small_gray(image, (size, size)).tobytes()
+    matrix = _dct_matrix(size, hash_size)
+
+    # Separable DCT of only the hash_size x hash_size lowest frequencies:
+    # the rows against the cosine matrix, then the resulting columns
+    rows = [
+        [sum(map(mul, basis, pixels[y * size : (y + 1) * size])) for basis in matrix]
+        for y in range(size)
+    ]
+    columns = list(zip(*rows))
+    coefficients = [sum(map(mul, basis, column)) for basis in matrix for column in columns]
+    # The DC term (overall brightness) is left out of the median
+    median = sorted(coefficients[1:])[len(coefficients) // 2 - 1]
+    value = 0
+    for coefficient in coefficients:
+        value = (value << 1) | (coefficient > median)
+    return value
+
+
+def hash_image_bytes(image_bytes, method="dhash"):
+    """Perceptual hash of encoded image bytes"""
+    if method not in METHODS:
+        raise ValueError(f"Unknown hash method: {method}")
+    with telemetry.stage("phash", method=method):
+        image = tiled.open_image(image_bytes)
+        return dhash(image) if method == "dhash" else phash(image)
+
+
+def hamming(first, second):
+    return bin(first ^ second).count("1")
+
+
+class BKTree:
+    """Metric tree of hashes for nearest-neighbour queries by Hamming distance"""
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def add(self, value, item):
+        self.size += 1
+        node = [value, item, {}]
+        if self.root is None:
+            self.root = node
+            return
+        current = self.root
+        while True:
+            distance = hamming(value, current[0])
+            child = current[2].get(distance)
+            if child is None:
+                current[2][distance] = node
+                return
+            current = child
+
+    def find(self, value, max_distance):
+        """Return (distance, value, item) for every hash within max_distance"""
+        matches = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node_value, item, children = stack.pop()
+            distance = hamming(value, node_value)
+            if distance <= max_distance:
+                matches.append((distance, node_value, item))
+            # Triangle inequality: only these subtrees can hold matches
+            for child_distance, child in children.items():
+                if distance - max_distance <= child_distance <= distance + max_distance:
+                    stack.append(child)
+        return sorted(matches, key=lambda match: match[0])
+
+    def __len__(self):
+        return self.size
+
+
+class DuplicateFilter:
+    """Group images into near-duplicate groups as they are seen
+
+    check() returns None for an image unlike any before it (it becomes the
+    representative of a new group) and the representative's item for a
+    near-duplicate. groups maps each representative to its duplicates and
+    hashes each representative to its hash.
+    """
+
+    def __init__(self, max_distance=DEFAULT_DISTANCE, method="dhash"):
+        self.max_distance = max_distance
+        self.method = method
+        self.tree = BKTree()
+        self.groups = {}
+        self.hashes = {}
+
+    def add(self, value, item):
+        """Register a representative hash (e.g. restored from a checkpoint)"""
+        self.tree.add(value, item)
+        self.groups.setdefault(item, [])
+        self.hashes[item] = value
+
+    def check(self, image_bytes, item):
+        """Return (representative or None, hash) for an image"""
+        value = hash_image_bytes(image_bytes, self.method)
+        matches = self.tree.find(value, self.max_distance)
+        if matches:
+            distance, _, representative = matches[0]
+            self.groups[representative].append(item)
+            telemetry.event("duplicate", item=item, of=representative, distance=distance)
+            return representative, value
+        self.add(value, item)
+        return None, value
+
+    def is_duplicate(self, image_bytes, item):
+        return self.check(image_bytes, item)[0] is not None
@@ -0,0 +1,255 @@
+"""Opt-in profiling of the extraction pipeline stages.
+
+The profiler listens to the telemetry stages (extract_image, decode,
+remove_black_background, encode, write, ...) and reports, per stage, the
+number of calls, total time, p50/p95 and, in tracemalloc mode, the peak
+memory allocated inside the stage. In cprofile mode the runs are also
+profiled function by function. The report is rewritten as JSON each time a
+top-level run (an extraction) finishes, and once more at exit.
+
+Enable it with PDF_IMAGING_PROFILE=timing|tracemalloc|cprofile (or the
+Profiling setting in the GUI); PDF_IMAGING_PROFILE_REPORT sets the report
+path. The entry points read both through configure_process(). When it is
+off nothing is registered, so the stages cost one function call each.
+"""
+
+import atexit
+import cProfile
+import json
+import math
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from . import telemetry
+from .paths import get_cache_dir
+
+
+ENV_VAR = "PDF_IMAGING_PROFILE"
+REPORT_ENV_VAR = "PDF_IMAGING_PROFILE_REPORT"
+# Set by the first profiled process so its worker processes write their own reports
+OWNER_ENV_VAR = "PDF_IMAGING_PROFILE_OWNER"
+MODES = ("off", "timing", "tracemalloc", "cprofile")
+
+_active = None
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class StageProfiler:
+    """Telemetry sink aggregating per-stage timings and allocations"""
+
+    def __init__(self, mode="timing", report_path=None, top_functions=30):
+        if mode not in MODES[1:]:
+            raise ValueError(f"Unknown profiling mode: {mode}")
+        self.mode = mode
+        self.report_path = report_path or os.path.join(get_cache_dir(), "profile.json")
+        self._owner_pid = int(os.environ.setdefault(OWNER_ENV_VAR, str(os.getpid())))
+        self.top_functions = top_functions
+        self.timings = {}
+        self.peaks = {}
+        self.runs = []
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = None
+        self._profiling_thread = None
+
+    def start(self):
+        if self.mode == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        telemetry.add_sink(self)
+        return self
+
+    def stop(self):
+        telemetry.remove_sink(self)
+        if self.mode == "tracemalloc" and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # Telemetry hooks
+
+    def stage_started(self, name):
+        if self.mode != "tracemalloc":
+            return
+        stack = self._stack()
+        _, peak = tracemalloc.get_traced_memory()
+        # The peak counter is shared, so hand the peak so far to the
+        # stages that are already open before resetting it
+        for entry in stack:
+            entry[2] = max(entry[2], peak)
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        stack.append([name, current, current])
+
+    def run_started(self, name):
+        depth = getattr(self._local, "run_depth", 0)
+        self._local.run_depth = depth + 1
+        if self.mode != "cprofile" or depth:
+            return
+        with self._lock:
+            # Only one thread can be profiled at a time
+            if self._profiling_thread is not None:
+                return
+            self._profiling_thread = threading.get_ident()
+        self._local.profile = cProfile.Profile()
+        self._local.profile.enable()
+
+    def emit(self, record):
+        if record["event"] == "stage":
+            self._stage_finished(record)
+        elif record["event"] == "run":
+            self._run_finished(record)
+
+    def _stage_finished(self, record):
+        name = record["stage"]
+        peak_bytes = None
+        if self.mode == "tracemalloc":
+            stack = self._stack()
+            if stack and stack[-1][0] == name:
+                _, start, peak = stack.pop()
+                _, current_peak = tracemalloc.get_traced_memory()
+                peak = max(peak, current_peak)
+                peak_bytes = peak - start
+                if stack:
+                    stack[-1][2] = max(stack[-1][2], peak)
+
+        with self._lock:
+            self.timings.setdefault(name, []).append(record["seconds"])
+            if peak_bytes is not None:
+                self.peaks[name] = max(self.peaks.get(name, 0), peak_bytes)
+
+    def _run_finished(self, record):
+        self._local.run_depth = max(0, getattr(self._local, "run_depth", 1) - 1)
+        with self._lock:
+            self.runs.append(
+                {key: record[key] for key in ("run", "seconds", "pages", "images")}
+            )
+        if self._local.run_depth:
+            return
+
+        profile = getattr(self._local, "profile", None)
+        if profile is not None:
+            profile.disable()
+            self._local.profile = None
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self._profiling_thread = None
+        self.write_report()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    # Reporting
+
+    def report(self):
+        with self._lock:
+            stages = {}
+            for name, values in self.timings.items():
+                stages[name] = {
+                    "calls": len(values),
+                    "total_seconds": sum(values),
+                    "p50_seconds": percentile(values, 0.50),
+                    "p95_seconds": percentile(values, 0.95),
+                    "max_seconds": max(values),
+                }
+                if name in self.peaks:
+                    stages[name]["peak_alloc_bytes"] = self.peaks[name]
+
+            report = {
+                "mode": self.mode,
+                "pid": os.getpid(),
+                "started": self.started,
+                "runs": list(self.runs),
+                "stages": dict(
+                    sorted(stages.items(), key=lambda item: -item[1]["total_seconds"])
+                ),
+            }
+            if self._stats is not None:
+                report["functions"] = self._top_functions()
+        return report
+
+    def _top_functions(self):
+        rows = []
+        for key, (_, calls, total, cumulative, _) in self._stats.stats.items():
+            filename, line, function = key
+            rows.append(
+                {
+                    "function": f"{os.path.basename(filename)}:{line}({function})",
+                    "calls": calls,
+                    "own_seconds": total,
+                    "cumulative_seconds": cumulative,
+                }
+            )
+        rows.sort(key=lambda row: -row["own_seconds"])
+        return rows[: self.top_functions]
+
+    def write_report(self, path=None):
+        path = path or self.report_path
+        if os.getpid() != self._owner_pid:
+            # A worker process: keep the parent's report intact
+            base, ext = os.path.splitext(path)
+            path = f"{base}-{os.getpid()}{ext}"
+        report = self.report()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        os.replace(temp_path, path)
+        if self._stats is not None:
+            self._stats.dump_stats(os.path.splitext(path)[0] + ".prof")
+        return path
+
+
+def enable(mode="timing", report_path=None):
+    """Start profiling (replacing an active profiler) and return it"""
+    global _active
+    disable()
+    _active = StageProfiler(mode, report_path).start()
+    return _active
+
+
+def disable():
+    """Stop profiling and write the final report"""
+    global _active
+    if _active is not None:
+        profiler, _active = _active, None
+        profiler.stop()
+        if profiler.timings:
+            profiler.write_report()
+
+
+def active_profiler():
+    return _active
+
+
+def configure(mode=None, report_path=None):
+    """Enable the mode given, or the one in PDF_IMAGING_PROFILE"""
+    mode = mode or os.environ.get(ENV_VAR, "off")
+    report_path = report_path or os.environ.get(REPORT_ENV_VAR)
+    if mode == "off":
+        disable()
+        return None
+    return enable(mode, report_path)
+
+
+def configure_process():
+    """Set up telemetry and profiling from the environment; called by the
+    entry points and as the initializer of their worker pools"""
+    telemetry.configure_from_env()
+    # Registered once however often it is called: the final report at exit
+    atexit.unregister(disable)
+    atexit.register(disable)
+    return configure()
@@ -29,6 +29,31 @@ class Settings:
     def get_last_directory(self):
         return self.settings.value("last_directory", str(Path.home()))
 
+    def get_max_jobs(self):
+        return self.settings.value("max_jobs", min(4, os.cpu_count() or 1), type=int)
+
+    def set_max_jobs(self, jobs):
+        self.settings.setValue("max_jobs", jobs)
+
+    def get_memory_budget_mb(self):
+        return self.settings.value("memory_budget_mb", 2048, type=int)
+
+    def set_memory_budget_mb(self, budget):
+        self.settings.setValue("memory_budget_mb", budget)
+
+    def get_image_buffer_mb(self):
+        """Memory for buffered image data before it is spilled to disk"""
+        return self.settings.value("image_buffer_mb", 512, type=int)
+
+    def set_image_buffer_mb(self, budget):
+        self.settings.setValue("image_buffer_mb", budget)
+
+    def get_profiling_mode(self):
+        return self.settings.value("profiling_mode", "off")
+
+    def set_profiling_mode(self, mode):
+        self.settings.setValue("profiling_mode", mode)
+
     def get_default_output_dir(self):
         documents_path = os.path.join(Path.home(), "Documents", "PDF Image Extractor")
         os.makedirs(documents_path, exist_ok=True)
@@ -0,0 +1,208 @@
+import os
+import sqlite3
+from collections import namedtuple
+from pathlib import Path
+import fitz
+from . import telemetry
+from .hashing import bytes_sha256, file_sha256
+from .paths import get_cache_dir
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS document (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    path TEXT NOT NULL,
+    doc_hash TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    page_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS images (
+    page INTEGER NOT NULL,
+    image_index INTEGER NOT NULL,
+    xref INTEGER NOT NULL,
+    smask INTEGER NOT NULL,
+    x0 REAL,
+    y0 REAL,
+    x1 REAL,
+    y1 REAL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    bpc INTEGER NOT NULL,
+    colorspace TEXT NOT NULL,
+    filter TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (page, image_index)
+);
+CREATE INDEX IF NOT EXISTS images_size ON images (width, height);
+CREATE INDEX IF NOT EXISTS images_sha256 ON images (sha256);
+"""
+
+COLUMNS = (
+    "page, image_index, xref, smask, x0, y0, x1, y1, "
+    "width, height, bpc, colorspace, filter, length, sha256"
+)
+
+ImageRecord = namedtuple(
+    "ImageRecord",
+    "page index xref smask bbox width height bpc colorspace filter length sha256",
+)
+
+
+def _record(row):
+    page, index, xref, smask, x0, y0, x1, y1, *rest = row
+    bbox = None if x0 is None else (x0, y0, x1, y1)
+    return ImageRecord(page, index, xref, smask, bbox, *rest)
+
+
+class ImageSidecar:
+    """Index of the images of one PDF, queried without reparsing it
+
+    The index is built once per document (in the cache directory unless
+    directory is given) with each image's page, position, xref, bounding
+    box, dimensions, colour space, filter, soft mask, stored length and the
+    SHA-256 of its stream; nothing is decoded. It is rebuilt when the
+    file's content hash changes, checked only when its size or
+    modification time did. The PDF is opened only by extract_image().
+    """
+
+    def __init__(self, pdf_path, directory=None):
+        self.pdf_path = str(Path(pdf_path).resolve())
+        if directory is None:
+            directory = os.path.join(get_cache_dir(), "image_sidecars")
+        os.makedirs(directory, exist_ok=True)
+        # One database per document path
+        name = bytes_sha256(self.pdf_path.encode())[:32]
+        self.db_path = os.path.join(directory, f"{name}.sqlite3")
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(SCHEMA)
+        self._doc = None
+        self.update()
+
+    def close(self):
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def update(self):
+        """Rebuild the index if the PDF changed; True when it was rebuilt"""
+        stat = os.stat(self.pdf_path)
+        row = self.conn.execute(
+            "SELECT doc_hash, mtime, size FROM document WHERE id = 1"
+        ).fetchone()
+        if row and row[1] == stat.st_mtime and row[2] == stat.st_size:
+            telemetry.event("cache", name="image_sidecar", hit=True)
+            return False
+
+        doc_hash = file_sha256(self.pdf_path)
+        unchanged = row is not None and row[0] == doc_hash
+        telemetry.event("cache", name="image_sidecar", hit=unchanged)
+        with self.conn:
+            if not unchanged:
+                self._build(doc_hash, stat)
+            else:
+                # Touched but not changed
+                self.conn.execute(
+                    "UPDATE document SET mtime = ?, size = ? WHERE id = 1",
+                    (stat.st_mtime, stat.st_size),
+                )
+        return not unchanged
+
+    def _build(self, doc_hash, stat):
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        rows = []
+        digests = {}
+        with telemetry.stage("image_sidecar"), fitz.open(self.pdf_path) as doc:
+            for page_num in range(doc.page_count):
+                page = doc[page_num]
+                for index, image in enumerate(page.get_images(full=True), 1):
+                    xref, smask, width, height, bpc, colorspace, _, _, image_filter, _ = image
+                    if xref not in digests:
+                        stream = doc.xref_stream_raw(xref) or b""
+                        digests[xref] = (len(stream), bytes_sha256(stream))
+                    rects = page.get_image_rects(xref)
+                    bbox = tuple(rects[0]) if rects else (None,) * 4
+                    rows.append(
+                        (page_num + 1, index, xref, smask, *bbox, width, height, bpc)
+                        + (colorspace, image_filter, *digests[xref])
+                    )
+            page_count = doc.page_count
+
+        self.conn.execute("DELETE FROM images")
+        self.conn.executemany(
+            f"INSERT INTO images ({COLUMNS}) VALUES ({', '.join('?' * 15)})", rows
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO document (id, path, doc_hash, mtime, size, page_count) "
+            "VALUES (1, ?, ?, ?, ?, ?)",
+            (self.pdf_path, doc_hash, stat.st_mtime, stat.st_size, page_count),
+        )
+
+    @property
+    def page_count(self):
+        return self.conn.execute("SELECT page_count FROM document WHERE id = 1").fetchone()[0]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def query(
+        self,
+        start_page=1,
+        end_page=None,
+        min_width=0,
+        min_height=0,
+        colorspace=None,
+        image_filter=None,
+        has_smask=None,
+        sha256=None,
+    ):
+        """Return the ImageRecords matching every given condition, in page order
+
+        Args:
+            start_page (int): First page (1-based)
+            end_page (int): Last page (inclusive), defaults to the last page
+            min_width (int): Minimum width in pixels
+            min_height (int): Minimum height in pixels
+            colorspace (str): e.g. "DeviceRGB" or "DeviceGray"
+            image_filter (str): Stream filter, e.g. "DCTDecode"
+            has_smask (bool): Only images with (True) or without (False) a soft mask
+            sha256 (str): Only copies of the stream with this hash
+        """
+        conditions = ["page >= ?", "width >= ?", "height >= ?"]
+        values = [start_page, min_width, min_height]
+        if end_page is not None:
+            conditions.append("page <= ?")
+            values.append(end_page)
+        for column, value in (
+            ("colorspace", colorspace),
+            ("filter", image_filter),
+            ("sha256", sha256),
+        ):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                values.append(value)
+        if has_smask is not None:
+            conditions.append("smask != 0" if has_smask else "smask = 0")
+
+        rows = self.conn.execute(
+            f"SELECT {COLUMNS} FROM images WHERE {' AND '.join(conditions)} "
+            "ORDER BY page, image_index",
+            values,
+        )
+        return [_record(row) for row in rows]
+
+    def extract_image(self, record):
+        """Return fitz's extract_image dict for a record (opens the PDF once)"""
+        if self._doc is None:
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc.extract_image(record.xref)
@@ -0,0 +1,115 @@
+"""An append-only list of image bytes kept within a memory budget.
+
+Image buffers are held in memory until their total passes the budget; the
+oldest ones are then written to a temporary file and read back when they
+are accessed. Files that are already on disk (e.g. checkpoint staging) can
+be added by reference and are never loaded until read.
+"""
+
+import os
+import tempfile
+import threading
+from collections import deque
+from . import telemetry
+
+
+DEFAULT_BUDGET_MB = 512
+
+
+class SpillStore:
+    """Sequence of bytes objects that spills to a temporary file
+
+    Args:
+        budget_mb: Bytes kept in memory before spilling, in MB (None for
+            the default, 0 to spill everything)
+        directory: Where the temporary file is created (default: system temp)
+    """
+
+    def __init__(self, budget_mb=None, directory=None):
+        if budget_mb is None:
+            budget_mb = DEFAULT_BUDGET_MB
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.directory = directory
+        self.memory_bytes = 0
+        self.spilled_bytes = 0
+        # Each entry is bytes (in memory) or (path, offset, length);
+        # path None means the store's own temporary file
+        self._entries = []
+        self._in_memory = deque()
+        self._file = None
+        self._lock = threading.Lock()
+
+    def append(self, data):
+        with self._lock:
+            self._entries.append(data)
+            self._in_memory.append(len(self._entries) - 1)
+            self.memory_bytes += len(data)
+            while self.memory_bytes > self.budget and self._in_memory:
+                self._spill(self._in_memory.popleft())
+
+    def extend(self, items):
+        for data in items:
+            self.append(data)
+
+    def add_file(self, path):
+        """Add the contents of a file without reading it"""
+        with self._lock:
+            self._entries.append((path, 0, os.path.getsize(path)))
+
+    def _spill(self, index):
+        data = self._entries[index]
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="pdf_imaging_spill_", dir=self.directory)
+        offset = self._file.seek(0, os.SEEK_END)
+        self._file.write(data)
+        self._entries[index] = (None, offset, len(data))
+        self.memory_bytes -= len(data)
+        self.spilled_bytes += len(data)
+        telemetry.event("spill", bytes=len(data))
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index):
+        with self._lock:
+            entry = self._entries[index]
+            if isinstance(entry, bytes):
+                return entry
+            path, offset, length = entry
+            if path is None:
+                self._file.seek(offset)
+                return self._file.read(length)
+        with open(path, "rb") as f:
+            return f.read()
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __reduce__(self):
+        # Sent to another process (e.g. a pool result): the receiver gets
+        # its own store with the same budget
+        return _restore, (self.budget / (1024 * 1024), list(self))
+
+    def close(self):
+        """Drop the buffers and delete the temporary file"""
+        with self._lock:
+            self._entries = []
+            self._in_memory.clear()
+            self.memory_bytes = 0
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+def _restore(budget_mb, items):
+    store = SpillStore(budget_mb)
+    store.extend(items)
+    return store
@@ -0,0 +1,277 @@
+"""Structured telemetry events for the extraction pipeline.
+
+Code reports what it does through a few calls:
+
+    with telemetry.run("extract_images", pdf=pdf_path):
+        with telemetry.stage("encode", format="JPEG"):
+            ...
+        telemetry.count(images=1, bytes_in=1024, bytes_out=900)
+    telemetry.event("cache", name="text_index", hit=True)
+
+Events are dicts with an "event" name and a timestamp, delivered to the
+registered sinks. With no sink registered every call returns immediately,
+so instrumentation can stay in the hot loops.
+
+Set PDF_IMAGING_TELEMETRY to "log" to send events to the logging module,
+or to a file path to append them as JSON lines. The entry points (and their
+worker pool initializers) read it through configure_from_env(); importing
+this module registers nothing.
+"""
+
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+
+
+ENV_VAR = "PDF_IMAGING_TELEMETRY"
+
+_sinks = []
+_listeners = []
+_env_sink = None
+_local = threading.local()
+
+
+class LoggingSink:
+    """Send events to a logger, one line per event"""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("pdf_imaging")
+        self.level = level
+
+    def emit(self, record):
+        fields = " ".join(
+            f"{key}={value}" for key, value in record.items() if key not in ("event", "time")
+        )
+        self.logger.log(self.level, "%s %s", record["event"], fields)
+
+
+class JsonlSink:
+    """Append events to a JSON lines file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def emit(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def close(self):
+        self._file.close()
+
+
+class MemorySink:
+    """Keep events in a list (for tests)"""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def events(self, name):
+        return [record for record in self.records if record["event"] == name]
+
+
+def add_sink(sink):
+    """Register a sink; sinks that define stage_started(name) or
+    run_started(name) are also told when stages and runs begin"""
+    _sinks.append(sink)
+    if hasattr(sink, "stage_started") or hasattr(sink, "run_started"):
+        _listeners.append(sink)
+    return sink
+
+
+def remove_sink(sink):
+    if sink in _sinks:
+        _sinks.remove(sink)
+    if sink in _listeners:
+        _listeners.remove(sink)
+
+
+def enabled():
+    return bool(_sinks)
+
+
+def event(name, /, **fields):
+    """Send an event to every sink"""
+    if not _sinks:
+        return
+    record = {"event": name, "time": time.time(), **fields}
+    for sink in list(_sinks):
+        sink.emit(record)
+
+
+class _NullStage:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """Time a block of work and report it as a "stage" event"""
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        for listener in _listeners:
+            if hasattr(listener, "stage_started"):
+                listener.stage_started(self.name)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self.started
+        event(
+            "stage",
+            stage=self.name,
+            seconds=seconds,
+            ok=exc_type is None,
+            **self.fields,
+        )
+        return False
+
+
+def stage(name, **fields):
+    """Context manager timing one pipeline stage"""
+    if not _sinks:
+        return _NULL_STAGE
+    return Stage(name, fields)
+
+
+class _NullRun(_NullStage):
+    def add(self, **counts):
+        pass
+
+
+_NULL_RUN = _NullRun()
+
+
+class Run:
+    """Counters for one extraction run, reported with rates when it ends
+
+    While the run's with-block is active, count() calls on the same thread
+    add to it, so helpers deep in the pipeline (e.g. save_image) can report
+    bytes written without being handed the run.
+    """
+
+    COUNTERS = ("pages", "images", "bytes_in", "bytes_out")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+        self.counts = dict.fromkeys(self.COUNTERS, 0)
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self.counts[key] = self.counts.get(key, 0) + value
+
+    def __enter__(self):
+        for listener in _listeners:
+            if hasattr(listener, "run_started"):
+                listener.run_started(self.name)
+        self.started = time.perf_counter()
+        if not hasattr(_local, "runs"):
+            _local.runs = []
+        _local.runs.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.runs.remove(self)
+        seconds = time.perf_counter() - self.started
+        event(
+            "run",
+            run=self.name,
+            seconds=seconds,
+            ok=exc_type is None,
+            pages_per_second=self.counts["pages"] / seconds if seconds else 0.0,
+            images_per_second=self.counts["images"] / seconds if seconds else 0.0,
+            **self.counts,
+            **self.fields,
+        )
+        return False
+
+
+def run(name, **fields):
+    """Context manager counting a run (pages, images, bytes in and out)"""
+    if not _sinks:
+        return _NULL_RUN
+    return Run(name, fields)
+
+
+def traced(name):
+    """Decorator running every call of a function inside run(name)"""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with run(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def current_run():
+    """Return the innermost active run on this thread, or None"""
+    runs = getattr(_local, "runs", None)
+    return runs[-1] if runs else None
+
+
+@contextlib.contextmanager
+def joined(run):
+    """Make count() on this thread add to run (started on another thread)"""
+    if run is None:
+        yield
+        return
+    if not hasattr(_local, "runs"):
+        _local.runs = []
+    _local.runs.append(run)
+    try:
+        yield
+    finally:
+        _local.runs.remove(run)
+
+
+def count(**counts):
+    """Add to the counters of the innermost active run on this thread"""
+    if not _sinks:
+        return
+    runs = getattr(_local, "runs", None)
+    if runs:
+        runs[-1].add(**counts)
+
+
+def configure_from_env():
+    """Register the sink named by the PDF_IMAGING_TELEMETRY variable, replacing
+    the one from an earlier call (or inherited from a forked parent)"""
+    global _env_sink
+    if _env_sink is not None:
+        remove_sink(_env_sink)
+        if hasattr(_env_sink, "close"):
+            _env_sink.close()
+        _env_sink = None
+    target = os.environ.get(ENV_VAR)
+    if not target:
+        return None
+    if target == "log":
+        _env_sink = add_sink(LoggingSink())
+    else:
+        _env_sink = add_sink(JsonlSink(target))
+    return _env_sink
@@ -0,0 +1,175 @@
+import os
+import sqlite3
+from pathlib import Path
+from .hashing import file_sha256
+from . import telemetry
+from .paths import get_cache_dir
+from .pdf_tools import PDFTools
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    path TEXT PRIMARY KEY,
+    doc_hash TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_hash ON documents (doc_hash);
+CREATE TABLE IF NOT EXISTS indexed_hashes (
+    doc_hash TEXT PRIMARY KEY,
+    page_count INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5 (
+    text,
+    doc_hash UNINDEXED,
+    page UNINDEXED
+);
+"""
+
+
+class TextIndex:
+    """Persistent full-text index of PDF pages backed by SQLite FTS5
+
+    Page text is stored once per document hash, so identical files at
+    different paths share their index rows. Documents are re-extracted only
+    when their size or modification time changes and the content hash
+    differs from what was indexed.
+    """
+
+    def __init__(self, db_path=None, workers=None):
+        if db_path is None:
+            db_path = os.path.join(get_cache_dir(), "text_index.sqlite3")
+        self.db_path = str(db_path)
+        self.workers = workers
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def update(self, pdf_path):
+        """Index a PDF if it changed since the last update
+
+        Returns True when page text was (re-)extracted.
+        """
+        path = str(Path(pdf_path).resolve())
+        stat = os.stat(path)
+        row = self.conn.execute(
+            "SELECT doc_hash, mtime, size FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+
+        if row and row[1] == stat.st_mtime and row[2] == stat.st_size:
+            telemetry.event("cache", name="text_index", hit=True)
+            return False
+
+        doc_hash = file_sha256(path)
+        old_hash = row[0] if row else None
+        already_indexed = self.conn.execute(
+            "SELECT 1 FROM indexed_hashes WHERE doc_hash = ?", (doc_hash,)
+        ).fetchone()
+
+        telemetry.event("cache", name="text_index", hit=bool(already_indexed))
+        extracted = False
+        if not already_indexed:
+            self._index_pages(path, doc_hash)
+            extracted = True
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents (path, doc_hash, mtime, size) "
+                "VALUES (?, ?, ?, ?)",
+                (path, doc_hash, stat.st_mtime, stat.st_size),
+            )
+            if old_hash and old_hash != doc_hash:
+                self._drop_orphan(old_hash)
+
+        return extracted
+
+    def update_directory(self, root, pattern="*.pdf"):
+        """Index every PDF below root and forget files that disappeared
+
+        Returns a (reindexed, unchanged, removed) tuple of counts.
+        """
+        root_path = Path(root).resolve()
+        seen = set()
+        reindexed = unchanged = 0
+
+        for pdf_path in sorted(root_path.rglob(pattern)):
+            seen.add(str(pdf_path))
+            if self.update(pdf_path):
+                reindexed += 1
+            else:
+                unchanged += 1
+
+        prefix = str(root_path) + os.sep
+        stale = [
+            path
+            for (path,) in self.conn.execute("SELECT path FROM documents")
+            if path.startswith(prefix) and path not in seen
+        ]
+        for path in stale:
+            self.remove(path)
+
+        return reindexed, unchanged, len(stale)
+
+    def remove(self, pdf_path):
+        """Remove a document from the index"""
+        path = str(Path(pdf_path).resolve())
+        row = self.conn.execute(
+            "SELECT doc_hash FROM documents WHERE path = ?", (path,)
+        ).fetchone()
+        if not row:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM documents WHERE path = ?", (path,))
+            self._drop_orphan(row[0])
+
+    def search(self, query, limit=50):
+        """Search indexed pages with an FTS5 MATCH expression
+
+        Returns a list of (document path, page number, snippet) tuples,
+        best matches first.
+        """
+        rows = self.conn.execute(
+            "SELECT d.path, p.page, "
+            "snippet(page_text, 0, '[', ']', '...', 12) "
+            "FROM page_text AS p JOIN documents AS d ON d.doc_hash = p.doc_hash "
+            "WHERE page_text MATCH ? ORDER BY rank LIMIT ?",
+            (query, limit),
+        )
+        return [(path, int(page), snippet) for path, page, snippet in rows]
+
+    def _index_pages(self, path, doc_hash):
+        page_count = 0
+        with self.conn:
+            self.conn.execute("DELETE FROM page_text WHERE doc_hash = ?", (doc_hash,))
+            for page_number, page_text in PDFTools.iter_text_with_options(
+                path, 1, 2**31 - 1, remove_linebreaks=True, workers=self.workers
+            ):
+                self.conn.execute(
+                    "INSERT INTO page_text (text, doc_hash, page) VALUES (?, ?, ?)",
+                    (page_text, doc_hash, page_number),
+                )
+                page_count += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO indexed_hashes (doc_hash, page_count) "
+                "VALUES (?, ?)",
+                (doc_hash, page_count),
+            )
+
+    def _drop_orphan(self, doc_hash):
+        """Delete page rows for a hash no longer referenced by any path"""
+        in_use = self.conn.execute(
+            "SELECT 1 FROM documents WHERE doc_hash = ?", (doc_hash,)
+        ).fetchone()
+        if not in_use:
+            self.conn.execute("DELETE FROM page_text WHERE doc_hash = ?", (doc_hash,))
+            self.conn.execute(
+                "DELETE FROM indexed_hashes WHERE doc_hash = ?", (doc_hash,)
+            )
@@ -0,0 +1,259 @@
+"""Strip-by-strip processing for very large images (map scans).
+
+Images above a megapixel threshold are converted, keyed and composited a
+strip of rows at a time, and PNG output is encoded as the strips are
+produced, so the working memory depends on the strip size rather than on
+the image size. Pillow still decodes the source image in one piece; what
+the tiled path avoids are the full-size converted, keyed and composited
+copies and the encoded output buffer. JPEG output needs one full RGB frame
+because Pillow's encoder takes a whole image. Where only a reduced copy is
+needed (perceptual hashes, telling an annotation layer from its page),
+JPEG sources are decoded at a fraction of their size with Image.draft.
+
+The threshold is THRESHOLD_MP megapixels unless PDF_IMAGING_TILED_MP is
+set. open_image accepts images up to MAX_MP megapixels, above Pillow's
+decompression-bomb limit.
+"""
+
+import io
+import math
+import os
+import struct
+import threading
+import warnings
+import zlib
+from PIL import Image, ImageChops
+from ..engine.cancellation import check_cancelled
+from . import encoder
+
+
+THRESHOLD_ENV_VAR = "PDF_IMAGING_TILED_MP"
+THRESHOLD_MP = 40
+MAX_MP = 1000
+
+# Rows processed at once (and between cancellation checks)
+STRIP_ROWS = 256
+
+# Channels below this value count as black when keying
+BLACK_LEVEL = 50
+_DARK = [255 if value < BLACK_LEVEL else 0 for value in range(256)]
+
+_open_lock = threading.Lock()
+
+
+def threshold_pixels():
+    return int(float(os.environ.get(THRESHOLD_ENV_VAR, THRESHOLD_MP)) * 1_000_000)
+
+
+def is_large(image):
+    """True when image should go through the tiled path"""
+    return image.width * image.height > threshold_pixels()
+
+
+def open_image(data):
+    """Image.open for bytes, allowing images of up to MAX_MP megapixels
+
+    Images within Pillow's decompression-bomb limit open as usual. Only
+    larger ones are opened a second time with Image.MAX_IMAGE_PIXELS
+    raised for that call, under a lock and restored right after. The
+    pixel count is checked against MAX_MP before anything is decoded.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+        try:
+            image = Image.open(io.BytesIO(data))
+        except Image.DecompressionBombError:
+            with _open_lock:
+                limit = Image.MAX_IMAGE_PIXELS
+                # Pillow raises above twice the limit
+                Image.MAX_IMAGE_PIXELS = max(limit, MAX_MP * 1_000_000 // 2)
+                try:
+                    image = Image.open(io.BytesIO(data))
+                finally:
+                    Image.MAX_IMAGE_PIXELS = limit
+
+    if image.width * image.height > MAX_MP * 1_000_000:
+        raise Image.DecompressionBombError(
+            f"Image size ({image.width * image.height} pixels) exceeds "
+            f"limit of {MAX_MP * 1_000_000} pixels"
+        )
+    return image
+
+
+def iter_strips(image, rows=STRIP_ROWS, cancel=None):
+    """Yield (left, top, right, bottom) boxes covering image in row strips"""
+    for top in range(0, image.height, rows):
+        check_cancelled(cancel)
+        yield (0, top, image.width, min(top + rows, image.height))
+
+
+def black_mask(strip):
+    """Return an L mask of the pixels whose R, G and B are all near black"""
+    red, green, blue = strip.split()[:3]
+    return ImageChops.multiply(
+        ImageChops.multiply(red.point(_DARK), green.point(_DARK)), blue.point(_DARK)
+    )
+
+
+def clear_black(strip, opaque=False):
+    """Make the near-black pixels of an RGBA strip transparent white, in place
+
+    With opaque, every other pixel gets full opacity.
+    """
+    if opaque:
+        strip.putalpha(255)
+    strip.paste((255, 255, 255, 0), (0, 0, *strip.size), black_mask(strip))
+    return strip
+
+
+class PNGStreamWriter:
+    """Write an 8-bit PNG to a file object a strip of rows at a time"""
+
+    COLOR_TYPES = {"L": (0, 1), "RGB": (2, 3), "RGBA": (6, 4)}
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, fileobj, size, mode, level=6):
+        if mode not in self.COLOR_TYPES:
+            raise ValueError(f"Unsupported PNG mode: {mode}")
+        color_type, channels = self.COLOR_TYPES[mode]
+        self.fileobj = fileobj
+        self.mode = mode
+        self.width, self.height = size
+        self.stride = self.width * channels
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(level)
+        self._pending = []
+        self._pending_size = 0
+
+        fileobj.write(b"\x89PNG\r\n\x1a\n")
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, color_type, 0, 0, 0)
+        self._chunk(b"IHDR", header)
+
+    def _chunk(self, kind, data):
+        self.fileobj.write(struct.pack(">I", len(data)))
+        self.fileobj.write(kind)
+        self.fileobj.write(data)
+        self.fileobj.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+    def _queue(self, data, flush=False):
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+        if self._pending_size >= self.CHUNK_SIZE or (flush and self._pending):
+            self._chunk(b"IDAT", b"".join(self._pending))
+            self._pending = []
+            self._pending_size = 0
+
+    def write_strip(self, strip):
+        """Append the rows of strip (same mode and width as the image)"""
+        if strip.mode != self.mode or strip.width != self.width:
+            raise ValueError("Strip does not match the PNG image")
+        raw = strip.tobytes()
+        # Each scanline starts with its filter type (0: none)
+        data = b"".join(
+            b"\x00" + raw[offset : offset + self.stride]
+            for offset in range(0, len(raw), self.stride)
+        )
+        self._queue(self._compressor.compress(data))
+        self.rows_written += strip.height
+
+    def close(self):
+        if self.rows_written != self.height:
+            raise ValueError(f"PNG has {self.height} rows, {self.rows_written} written")
+        self._queue(self._compressor.flush(), flush=True)
+        self._chunk(b"IEND", b"")
+
+
+def _rgb_frame(image, cancel=None):
+    """Return image as RGB, converting strip by strip when needed"""
+    if image.mode == "RGB":
+        return image
+    frame = Image.new("RGB", image.size)
+    for box in iter_strips(image, cancel=cancel):
+        frame.paste(image.crop(box).convert("RGB"), box[:2])
+    return frame
+
+
+def save_tiled(
+    image, fileobj, image_format="JPEG", key_black=False, cancel=None, mode=None, quality=95
+):
+    """Encode a large image to fileobj, optionally keying out black
+
+    Produces the same output as calling remove_black_background and then
+    converting the whole image to mode: RGB or L, or for PNG also RGBA and
+    1 (thresholded, stored as 8-bit gray). Keyed pixels are white in modes
+    without alpha. The default is RGBA for PNG when keying or for an RGBA
+    image, RGB otherwise. quality applies to JPEG. An RGB image may be
+    modified in place.
+    """
+    if image_format == "PNG":
+        if mode is None:
+            mode = "RGBA" if key_black or image.mode == "RGBA" else "RGB"
+        writer = PNGStreamWriter(fileobj, image.size, "L" if mode == "1" else mode)
+        for box in iter_strips(image, cancel=cancel):
+            strip = image.crop(box)
+            if key_black:
+                strip = clear_black(strip.convert("RGBA"))
+            strip = encoder.convert(strip, mode)
+            writer.write_strip(strip.convert("L") if mode == "1" else strip)
+        writer.close()
+        return
+
+    frame = _rgb_frame(image, cancel)
+    if key_black:
+        # Keyed pixels are transparent white, which JPEG stores as white
+        for box in iter_strips(frame, cancel=cancel):
+            strip = frame.crop(box)
+            strip.paste((255, 255, 255), (0, 0, *strip.size), black_mask(strip))
+            frame.paste(strip, box[:2])
+    if mode == "L":
+        frame = frame.convert("L")
+    frame.save(fileobj, "JPEG", quality=quality)
+
+
+def invert_tiled(image, cancel=None):
+    """Return the JPEG bytes of a large image with inverted colours"""
+    frame = _rgb_frame(image, cancel)
+    for box in iter_strips(frame, cancel=cancel):
+        frame.paste(ImageChops.invert(frame.crop(box)), box[:2])
+    buffer = io.BytesIO()
+    frame.save(buffer, "JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def key_black_tiled(image, cancel=None):
+    """Return PNG bytes of a large image with black transparent, the rest opaque"""
+    buffer = io.BytesIO()
+    writer = PNGStreamWriter(buffer, image.size, "RGBA")
+    for box in iter_strips(image, cancel=cancel):
+        writer.write_strip(clear_black(image.crop(box).convert("RGBA"), opaque=True))
+    writer.close()
+    return buffer.getvalue()
+
+
+def composite_tiled(original, overlay, cancel=None):
+    """Return PNG bytes of overlay alpha-composited onto a large original
+
+    overlay is scaled to the size of original one strip at a time.
+    """
+    buffer = io.BytesIO()
+    writer = PNGStreamWriter(buffer, original.size, "RGBA")
+    scale = overlay.height / original.height
+    for box in iter_strips(original, cancel=cancel):
+        strip = original.crop(box).convert("RGBA")
+        if overlay.size == original.size:
+            layer = overlay.crop(box).convert("RGBA")
+        else:
+            # Source rows of this strip, with a margin for the filter
+            source_top, source_bottom = box[1] * scale, box[3] * scale
+            top = max(0, math.floor(source_top) - 2)
+            bottom = min(overlay.height, math.ceil(source_bottom) + 2)
+            layer = overlay.crop((0, top, overlay.width, bottom)).convert("RGBA")
+            layer = layer.resize(
+                strip.size,
+                Image.Resampling.LANCZOS,
+                box=(0, source_top - top, overlay.width, source_bottom - top),
+            )
+        writer.write_strip(Image.alpha_composite(strip, layer))
+    writer.close()
+    return buffer.getvalue()
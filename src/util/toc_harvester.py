@@ -0,0 +1,144 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import fitz
+from .hashing import file_sha256
+from . import telemetry
+
+
+def outline_records(doc):
+    """Turn a document's TOC into records with start and end pages
+
+    A bookmark ends on the page before the next bookmark at the same or a
+    higher level starts, or on the last page of the document.
+    """
+    toc = doc.get_toc()
+    records = []
+    for i, (level, title, start_page) in enumerate(toc):
+        end_page = doc.page_count
+        for next_level, _, next_page in toc[i + 1 :]:
+            if next_level <= level:
+                end_page = next_page - 1
+                break
+        records.append(
+            {
+                "level": level,
+                "title": title,
+                "start_page": start_page,
+                "end_page": max(end_page, start_page),
+            }
+        )
+    return records
+
+
+def _harvest_file(pdf_path, known_hash):
+    """Hash a PDF and read its outline (runs inside a worker process)
+
+    Returns (pdf_path, sha256, records, error); records is None when the
+    content hash matches known_hash and the outline does not need reading.
+    """
+    try:
+        doc_hash = file_sha256(pdf_path)
+        if doc_hash == known_hash:
+            return pdf_path, doc_hash, None, None
+
+        doc = fitz.open(pdf_path)
+        try:
+            return pdf_path, doc_hash, outline_records(doc), None
+        finally:
+            doc.close()
+    except Exception as e:
+        return pdf_path, None, None, str(e)
+
+
+def _load_manifest(manifest_path):
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def harvest_bookmarks(root_dir, output_path, manifest_path=None, workers=None):
+    """Write the outlines of every PDF below root_dir to one JSONL file
+
+    Each line holds the document id (content hash), relative path, level,
+    title, start page and end page of one bookmark. A manifest of mtime,
+    size and hash per file lets reruns copy the previous records of
+    unchanged files instead of opening them again.
+
+    Returns a summary dict with processed, skipped, failed and records counts.
+    """
+    root = Path(root_dir).resolve()
+    manifest_path = manifest_path or f"{output_path}.manifest.json"
+    previous_output = os.path.exists(output_path)
+    manifest = _load_manifest(manifest_path) if previous_output else {}
+
+    new_manifest = {}
+    unchanged = set()
+    to_check = []
+    for pdf_path in sorted(root.rglob("*.pdf")):
+        rel_path = pdf_path.relative_to(root).as_posix()
+        stat = pdf_path.stat()
+        entry = manifest.get(rel_path)
+        if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            unchanged.add(rel_path)
+            new_manifest[rel_path] = entry
+        else:
+            known_hash = entry["sha256"] if entry else None
+            to_check.append((rel_path, stat, known_hash))
+
+    summary = {"processed": 0, "skipped": 0, "failed": 0, "records": 0}
+    temp_path = f"{output_path}.tmp"
+
+    with open(temp_path, "w", encoding="utf-8") as out, ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+
+        def write_records(document, rel_path, records):
+            for record in records:
+                line = {"document": document, "path": rel_path, **record}
+                out.write(json.dumps(line, ensure_ascii=False) + "\n")
+            summary["records"] += len(records)
+
+        results = executor.map(
+            _harvest_file,
+            [str(root / rel_path) for rel_path, _, _ in to_check],
+            [known_hash for _, _, known_hash in to_check],
+            chunksize=16,
+        )
+        for (rel_path, stat, _), (_, doc_hash, records, error) in zip(
+            to_check, results
+        ):
+            if error:
+                summary["failed"] += 1
+                continue
+            new_manifest[rel_path] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "sha256": doc_hash,
+            }
+            if records is None:
+                unchanged.add(rel_path)
+            else:
+                write_records(doc_hash, rel_path, records)
+                summary["processed"] += 1
+
+        # Carry over the records of unchanged files from the previous run
+        if previous_output and unchanged:
+            with open(output_path, encoding="utf-8") as previous:
+                for line in previous:
+                    if json.loads(line)["path"] in unchanged:
+                        out.write(line)
+                        summary["records"] += 1
+        summary["skipped"] = len(unchanged)
+        telemetry.event(
+            "cache", name="toc_harvester", hits=len(unchanged), misses=summary["processed"]
+        )
+
+    os.replace(temp_path, output_path)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(new_manifest, f, indent=4, ensure_ascii=False)
+
+    return summary
@@ -11,6 +11,8 @@ class Translations:
             "settings": "الإعدادات",
             "language": "اللغة",
             "font_size": "حجم الخط",
+            "profiling": "قياس الأداء",
+            "image_buffer": "ذاكرة الصور (ميجابايت)",
             "theme": "المظهر",
             "about": "حول التطبيق",
         },
@@ -25,6 +27,8 @@ class Translations:
             "settings": "Settings",
             "language": "Language",
             "font_size": "Font Size",
+            "profiling": "Profiling",
+            "image_buffer": "Image memory (MB)",
             "theme": "Theme",
             "about": "About",
         },
@@ -0,0 +1,66 @@
+import fitz
+
+
+class WordIndex:
+    """Spatial index over the words of one page
+
+    The page text is read once with get_text("words") and every word is
+    stored in the grid cells its box overlaps, so looking up the words under
+    a rectangle only touches nearby cells instead of the whole page.
+    """
+
+    def __init__(self, page, cell_size=64):
+        self.cell_size = cell_size
+        self.words = page.get_text("words")
+        self.cells = {}
+
+        for word_id, word in enumerate(self.words):
+            for cell in self._cells_for(word[0], word[1], word[2], word[3]):
+                self.cells.setdefault(cell, []).append(word_id)
+
+    def _cells_for(self, x0, y0, x1, y1):
+        size = self.cell_size
+        for cx in range(int(x0 // size), int(x1 // size) + 1):
+            for cy in range(int(y0 // size), int(y1 // size) + 1):
+                yield cx, cy
+
+    def words_in_rect(self, rect):
+        """Return the words whose centre lies inside rect, in reading order"""
+        rect = fitz.Rect(rect)
+        candidates = set()
+        for cell in self._cells_for(rect.x0, rect.y0, rect.x1, rect.y1):
+            candidates.update(self.cells.get(cell, ()))
+
+        found = []
+        for word_id in candidates:
+            x0, y0, x1, y1 = self.words[word_id][:4]
+            if rect.contains(fitz.Point((x0 + x1) / 2, (y0 + y1) / 2)):
+                found.append(self.words[word_id])
+
+        # Sort by block, line and word number
+        found.sort(key=lambda word: word[5:8])
+        return found
+
+    def text_in_quads(self, quads):
+        """Return the text covered by a sequence of quads (e.g. a highlight)"""
+        seen = set()
+        words = []
+        for quad in quads:
+            for word in self.words_in_rect(fitz.Quad(quad).rect):
+                if word[5:8] not in seen:
+                    seen.add(word[5:8])
+                    words.append(word)
+
+        words.sort(key=lambda word: word[5:8])
+        return " ".join(word[4] for word in words)
+
+
+def annotation_quads(annot):
+    """Return the quads of a text markup annotation
+
+    Falls back to the annotation rectangle when no QuadPoints are present.
+    """
+    vertices = annot.vertices
+    if not vertices or len(vertices) % 4:
+        return [annot.rect.quad]
+    return [fitz.Quad(vertices[i : i + 4]) for i in range(0, len(vertices), 4)]
@@ -0,0 +1,139 @@
+import unittest
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import zipfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+import fitz
+from PIL import Image
+from src.cli import main
+
+
+def create_image_pdf(path, page_count, image_size=(200, 150)):
+    """Create a PDF with one embedded image per page."""
+    doc = fitz.open()
+    for i in range(page_count):
+        buffer = io.BytesIO()
+        Image.new("RGB", image_size, (i * 40 % 256, 90, 160)).save(buffer, "PNG")
+        page = doc.new_page()
+        page.insert_image(fitz.Rect(50, 50, 250, 200), stream=buffer.getvalue())
+    doc.save(str(path))
+    doc.close()
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self):
+        """Set up a directory with two sample PDFs."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_dir = Path(self.temp_dir.name) / "input"
+        self.input_dir.mkdir()
+        create_image_pdf(self.input_dir / "first.pdf", 3)
+        create_image_pdf(self.input_dir / "second.pdf", 2)
+        self.output_dir = Path(self.temp_dir.name) / "output"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def run_cli(self, *args):
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = main([*map(str, args)])
+        return exit_code, json.loads(stdout.getvalue())
+
+    def test_directory_extraction_summary(self):
+        """Test extracting a directory in parallel with a JSON summary."""
+        exit_code, summary = self.run_cli(
+            self.input_dir, "-o", self.output_dir, "--jobs", "2", "--format", "png"
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary["total_files"], 2)
+        self.assertEqual(summary["total_images"], 5)
+        self.assertEqual(len(list((self.output_dir / "first").glob("*.png"))), 3)
+
+    def test_page_range_and_size_filter(self):
+        """Test the page range and minimum size filters."""
+        _, summary = self.run_cli(
+            self.input_dir / "first.pdf", "-o", self.output_dir, "--pages", "2-3"
+        )
+        self.assertEqual(summary["total_images"], 2)
+
+        _, summary = self.run_cli(
+            self.input_dir / "first.pdf", "-o", self.output_dir, "--min-size", "300"
+        )
+        self.assertEqual(summary["total_images"], 0)
+
+    def test_merged_annotations_to_pptx(self):
+        """Test writing merged images into one presentation per PDF."""
+        exit_code, summary = self.run_cli(
+            self.input_dir / "second.pdf", "-o", self.output_dir,
+            "--merge-annotations", "--format", "pptx",
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary["total_images"], 2)
+        self.assertTrue((self.output_dir / "second" / "second.pptx").exists())
+
+    def test_zip_archive_output(self):
+        """Test writing each PDF's images to a single ZIP archive."""
+        exit_code, summary = self.run_cli(
+            self.input_dir, "-o", self.output_dir, "--archive", "zip"
+        )
+        self.assertEqual(exit_code, 0)
+        with zipfile.ZipFile(self.output_dir / "first.zip") as archive:
+            self.assertEqual(len(archive.namelist()), 3)
+        self.assertFalse((self.output_dir / "first").exists())
+        self.assertEqual(summary["files"][0]["archive"], str(self.output_dir / "first.zip"))
+
+    def test_same_file_names_get_separate_folders(self):
+        """Test that PDFs with the same file name do not share an output folder."""
+        for folder, page_count in (("a", 1), ("b", 2)):
+            (self.input_dir / folder).mkdir()
+            create_image_pdf(self.input_dir / folder / "book.pdf", page_count)
+
+        _, summary = self.run_cli(self.input_dir, "-o", self.output_dir)
+        self.assertEqual(summary["total_images"], 8)
+        self.assertEqual(len(list((self.output_dir / "a" / "book").glob("*.jpg"))), 1)
+        self.assertEqual(len(list((self.output_dir / "b" / "book").glob("*.jpg"))), 2)
+
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            _, summary = self.run_cli(
+                self.input_dir / "a" / "book.pdf", self.input_dir / "b" / "book.pdf",
+                "-o", self.output_dir / "flat",
+            )
+        self.assertEqual(summary["total_images"], 3)
+        self.assertEqual(len(list((self.output_dir / "flat" / "book").glob("*.jpg"))), 1)
+        self.assertEqual(len(list((self.output_dir / "flat" / "book_2").glob("*.jpg"))), 2)
+        self.assertIn("book_2", stderr.getvalue())
+
+    def test_zero_jobs_runs_serially(self):
+        """Test that --jobs 0 extracts the PDFs one at a time."""
+        exit_code, summary = self.run_cli(self.input_dir, "-o", self.output_dir, "--jobs", "0")
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(summary["total_images"], 5)
+
+    def test_missing_file_is_reported(self):
+        """Test that a failing file is reported without stopping the run."""
+        exit_code, summary = self.run_cli(
+            self.input_dir / "first.pdf", self.input_dir / "missing.pdf",
+            "-o", self.output_dir,
+        )
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(summary["failed_files"], 1)
+        self.assertEqual(summary["total_images"], 3)
+
+    def test_import_does_not_load_qt(self):
+        """Test that the command-line module can be imported without Qt."""
+        code = (
+            "import sys, src.cli; "
+            "sys.exit(any(m.startswith('PyQt5') for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[1])
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
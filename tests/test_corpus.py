@@ -0,0 +1,45 @@
+import unittest
+import tempfile
+from pathlib import Path
+import fitz
+from benchmarks.corpus import generate_pdf
+from src.util.image_handler import process_page_images
+
+
+class TestSyntheticCorpus(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_same_seed_gives_same_pdf(self):
+        """Test that generation is deterministic."""
+        options = {"pages": 3, "duplicate_ratio": 0.5, "smask_ratio": 0.5, "vector_figures": 1}
+        generate_pdf(self.output_dir / "first.pdf", seed=7, **options)
+        generate_pdf(self.output_dir / "second.pdf", seed=7, **options)
+        self.assertEqual(
+            (self.output_dir / "first.pdf").read_bytes(),
+            (self.output_dir / "second.pdf").read_bytes(),
+        )
+
+    def test_overlay_pairs_are_merged(self):
+        """Test that overlay pairs are recognised as annotation layers."""
+        path = self.output_dir / "annotated.pdf"
+        summary = generate_pdf(path, pages=2, images_per_page=0, overlay_pairs=1)
+        self.assertEqual(summary["images"], 4)
+
+        doc = fitz.open(path)
+        try:
+            merged = process_page_images(doc[0], doc, include_non_annotated=False)
+        finally:
+            doc.close()
+        self.assertEqual(len(merged), 1)
+        self.assertEqual(merged[0][1], "Figure 1.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import io
+import random
+import tempfile
+from pathlib import Path
+from PIL import Image, ImageDraw
+from benchmarks.corpus import make_image
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util import encoder, telemetry
+from src.util.image_handler import save_image
+from tests.test_cli import create_image_pdf
+
+
+def make_line_art(size=(400, 300)):
+    """Return a diagram: a few flat colours on white."""
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((20, 20, 200, 120), outline="navy", width=3)
+    draw.ellipse((220, 40, 380, 200), fill="lightblue", outline="navy", width=2)
+    draw.line((20, 250, 380, 250), fill="red", width=4)
+    return image
+
+
+def make_bilevel(size=(400, 300)):
+    """Return a black-on-white page of text-like strokes."""
+    image = Image.new("L", size, 255)
+    draw = ImageDraw.Draw(image)
+    for y in range(20, size[1] - 20, 18):
+        draw.text((20, y), "Lorem ipsum dolor sit amet 0123456789", fill=0)
+    return image
+
+
+def to_bytes(image, image_format="PNG"):
+    buffer = io.BytesIO()
+    image.save(buffer, image_format)
+    return buffer.getvalue()
+
+
+class TestEncoder(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory and sample images."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        photo = make_image(random.Random(1), (400, 300), "jpeg")
+        self.photo = Image.open(io.BytesIO(photo))
+        self.photo.load()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_classify(self):
+        """Test the image classes from sample statistics."""
+        gradient = Image.linear_gradient("L").resize((400, 300))
+        self.assertEqual(encoder.classify(self.photo), encoder.PHOTO)
+        self.assertEqual(encoder.classify(make_line_art()), encoder.LINE_ART)
+        self.assertEqual(encoder.classify(make_bilevel()), encoder.BILEVEL)
+        self.assertEqual(encoder.classify(gradient.convert("RGB")), encoder.GRAYSCALE)
+
+    def test_auto_format(self):
+        """Test that save_image picks the format and beats JPEG on line art."""
+        line_art = to_bytes(make_line_art())
+        cases = [
+            ("photo", to_bytes(self.photo, "JPEG"), "photo.jpg", "RGB"),
+            ("diagram", line_art, "diagram.png", "P"),
+            ("page", to_bytes(make_bilevel()), "page.png", "1"),
+        ]
+        for name, image_bytes, output_name, mode in cases:
+            self.assertTrue(save_image(image_bytes, str(self.output_dir), name, image_format="AUTO"))
+            with Image.open(self.output_dir / output_name) as saved:
+                self.assertEqual(saved.mode, mode)
+
+        save_image(line_art, str(self.output_dir), "diagram_jpeg")
+        self.assertLess(
+            (self.output_dir / "diagram.png").stat().st_size,
+            (self.output_dir / "diagram_jpeg.jpg").stat().st_size,
+        )
+
+    def test_encode_pool(self):
+        """Test results, errors and telemetry counts of pooled tasks."""
+        sink = telemetry.add_sink(telemetry.MemorySink())
+        try:
+            with telemetry.run("pool"), encoder.EncodePool(2) as pool:
+                for value in range(10):
+                    pool.submit(lambda value: telemetry.count(images=1) or value * 2, value)
+                self.assertEqual(pool.wait(), [value * 2 for value in range(10)])
+            self.assertEqual(sink.events("run")[0]["images"], 10)
+        finally:
+            telemetry.remove_sink(sink)
+
+        with self.assertRaises(ZeroDivisionError), encoder.EncodePool(2) as pool:
+            pool.submit(lambda: 1 / 0)
+            pool.wait()
+
+    def test_extract_with_pool(self):
+        """Test extracting a PDF with adaptive encoding on several threads."""
+        pdf_path = str(self.output_dir / "sample.pdf")
+        create_image_pdf(pdf_path, 4)
+        count = extract_images_from_pdf(
+            pdf_path, str(self.output_dir / "images"), image_format="AUTO", encode_workers=3
+        )
+        self.assertEqual(count, 4)
+        self.assertEqual(len(list((self.output_dir / "images").iterdir())), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+import unittest
+import tempfile
+from unittest import mock
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import fitz
+from PIL import Image
+from src.engine import images as engine_images
+from src.engine.bookmarks import export_bookmarks_text
+from src.engine.cancellation import (
+    CancellationToken,
+    CancelledError,
+    DeadlineExceededError,
+)
+from src.engine.checkpoint import CHECKPOINT_NAME
+from src.engine.images import collect_preview_images, export_all_images, export_presentation
+from src.engine.notes import export_notes_text
+from src.util.image_handler import remove_black_background, save_processed_to_ppt
+from tests.test_cli import create_image_pdf
+
+
+class TestExtractionEngine(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory with a sample PDF."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.pdf_path = str(self.output_dir / "sample.pdf")
+        create_image_pdf(self.pdf_path, 4)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_progress_callback(self):
+        """Test that progress is reported through a plain callback."""
+        progress = []
+        count = export_all_images(
+            self.pdf_path,
+            str(self.output_dir),
+            progress=lambda current, total: progress.append((current, total)),
+        )
+        self.assertEqual(count, 4)
+        self.assertEqual(progress, [(1, 4), (2, 4), (3, 4), (4, 4)])
+        self.assertEqual(len(list(self.output_dir.glob("image_*.jpg"))), 4)
+
+    def test_cancellation_token_stops_job(self):
+        """Test that cancelling from a progress callback stops the job."""
+        token = CancellationToken()
+
+        def cancel_after_two(current, total):
+            if current == 2:
+                token.cancel()
+
+        with self.assertRaises(CancelledError):
+            collect_preview_images(
+                self.pdf_path, progress=cancel_after_two, cancel=token
+            )
+
+    def test_deadline_cancels_job(self):
+        """Test that a token with a timeout cancels the job once it expires."""
+        with self.assertRaises(DeadlineExceededError):
+            export_all_images(
+                self.pdf_path, str(self.output_dir), cancel=CancellationToken(timeout=0)
+            )
+
+    def test_cancelled_save_leaves_no_file(self):
+        """Test that cancelling while a presentation is saved removes it."""
+        images = collect_preview_images(self.pdf_path)
+        token = CancellationToken()
+        token.cancel()
+        output_path = self.output_dir / "slides.pptx"
+
+        with self.assertRaises(CancelledError):
+            save_processed_to_ppt([(data, "") for data in images], str(output_path), token)
+        self.assertEqual(list(self.output_dir.glob("slides.pptx*")), [])
+
+    def test_background_removal_in_strips(self):
+        """Test that black pixels become transparent across strip boundaries."""
+        image = Image.new("RGB", (4, 600), (200, 100, 50))
+        image.putpixel((1, 10), (10, 20, 30))
+        image.putpixel((2, 300), (49, 49, 49))
+        image.putpixel((3, 599), (49, 49, 60))
+
+        result = remove_black_background(image)
+        self.assertEqual(result.getpixel((1, 10)), (255, 255, 255, 0))
+        self.assertEqual(result.getpixel((2, 300)), (255, 255, 255, 0))
+        self.assertEqual(result.getpixel((3, 599)), (49, 49, 60, 255))
+        self.assertEqual(result.getpixel((0, 0)), (200, 100, 50, 255))
+
+        token = CancellationToken()
+        token.cancel()
+        with self.assertRaises(CancelledError):
+            remove_black_background(image, token)
+
+    def test_resume_from_checkpoint(self):
+        """Test that an interrupted run resumes at the first incomplete page."""
+        output_dir = self.output_dir / "images"
+        token = CancellationToken()
+
+        def cancel_after_two(current, total):
+            if current == 2:
+                token.cancel()
+
+        with self.assertRaises(CancelledError):
+            export_all_images(
+                self.pdf_path, str(output_dir), progress=cancel_after_two,
+                cancel=token, resume=True,
+            )
+        self.assertTrue((output_dir / CHECKPOINT_NAME).exists())
+
+        # A damaged output is detected and its page extracted again
+        (output_dir / "image_0001.jpg").write_bytes(b"damaged")
+
+        progress = []
+        count = export_all_images(
+            self.pdf_path, str(output_dir),
+            progress=lambda current, total: progress.append(current), resume=True,
+        )
+        self.assertEqual(count, 4)
+        self.assertEqual(progress, [1, 2, 3, 4])
+        self.assertFalse((output_dir / CHECKPOINT_NAME).exists())
+        self.assertNotEqual((output_dir / "image_0001.jpg").read_bytes(), b"damaged")
+
+    def test_resume_retries_page_with_failed_image(self):
+        """Test that a page with a failed image is not skipped on resume."""
+        output_dir = self.output_dir / "images"
+        token = CancellationToken()
+        save_image = engine_images.save_image
+        calls = []
+
+        def fail_second_image(*args, **kwargs):
+            calls.append(args[2])
+            if len(calls) == 2:
+                return False
+            return save_image(*args, **kwargs)
+
+        def cancel_after_two(current, total):
+            if current == 2:
+                token.cancel()
+
+        # Page 2's image fails, the run is cancelled after page 3
+        with mock.patch.object(engine_images, "save_image", fail_second_image):
+            with self.assertRaises(CancelledError):
+                export_all_images(
+                    self.pdf_path, str(output_dir), progress=cancel_after_two,
+                    cancel=token, resume=True,
+                )
+
+        with mock.patch.object(
+            engine_images, "save_image", wraps=engine_images.save_image
+        ) as save_image:
+            count = export_all_images(self.pdf_path, str(output_dir), resume=True)
+        self.assertEqual(count, 4)
+        # Resumed at page 2
+        self.assertEqual(save_image.call_count, 3)
+
+    def test_resume_presentation(self):
+        """Test that a presentation export resumes from staged pages."""
+        output_dir = self.output_dir / "slides"
+        token = CancellationToken()
+
+        def cancel_after_three(current, total):
+            if current == 3:
+                token.cancel()
+
+        with self.assertRaises(CancelledError):
+            export_presentation(
+                self.pdf_path, str(output_dir), progress=cancel_after_three,
+                cancel=token, resume=True,
+            )
+
+        progress = []
+        count, output_path = export_presentation(
+            self.pdf_path, str(output_dir),
+            progress=lambda current, total: progress.append(current), resume=True,
+        )
+        self.assertEqual(count, 4)
+        self.assertEqual(progress, [4])
+        self.assertTrue(Path(output_path).exists())
+        self.assertEqual(sorted(p.name for p in output_dir.iterdir()), ["sample.pptx"])
+
+    def test_runs_in_process_pool(self):
+        """Test that engine jobs can be submitted to a process pool."""
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            images = executor.submit(collect_preview_images, self.pdf_path, 2, 3).result()
+        self.assertEqual(len(images), 2)
+
+    def test_bookmarks_and_notes_export(self):
+        """Test the text exporters behind the bookmark and note modules."""
+        doc = fitz.open(self.pdf_path)
+        doc.set_toc([[1, "Start", 1], [2, "Detail", 3]])
+        doc[1].add_text_annot((10, 10), "remember")
+        doc.save(self.pdf_path, incremental=True, encryption=fitz.PDF_ENCRYPT_KEEP)
+        doc.close()
+
+        bookmarks_path = self.output_dir / "bookmarks.txt"
+        self.assertEqual(export_bookmarks_text(self.pdf_path, bookmarks_path), 2)
+        self.assertEqual(
+            bookmarks_path.read_text(encoding="utf-8"),
+            "- Start (Page 1)\n  - Detail (Page 3)\n",
+        )
+
+        notes_path = self.output_dir / "notes.txt"
+        self.assertEqual(export_notes_text(self.pdf_path, notes_path), 1)
+        self.assertIn("Page 2:\n- [Text] remember", notes_path.read_text(encoding="utf-8"))
+
+
+if __name__ == "__main__":
+    unittest.main()
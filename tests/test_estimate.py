@@ -0,0 +1,114 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+from benchmarks.corpus import generate_preset
+from src.cli import main
+from src.engine.estimate import DEFAULT_RATES, Calibration, estimate, split_pages, total
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util import telemetry
+
+
+def record_runs(path, first, count):
+    calibration = Calibration(path)
+    for bytes_in in range(first, first + count):
+        calibration.add("JPEG", bytes_in, 1, 1)
+
+
+class TestEstimate(unittest.TestCase):
+    def setUp(self):
+        """Set up a generated sample PDF and an empty calibration."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.pdf_path = str(self.root / "sample.pdf")
+        generate_preset(self.pdf_path, "small")
+        self.calibration = Calibration(str(self.root / "throughput.json"))
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def extract(self, image_format, name):
+        return extract_images_from_pdf(
+            self.pdf_path, str(self.root / name), image_format=image_format
+        )
+
+    def test_counts_match_extraction_per_range(self):
+        """Test that the estimated image counts add up to what is extracted."""
+        estimates = estimate(
+            self.pdf_path, split_pages(1, 5, 2), calibration=self.calibration
+        )
+        self.assertEqual(
+            [(item.start_page, item.end_page) for item in estimates], [(1, 2), (3, 4), (5, 5)]
+        )
+        self.assertEqual(total(estimates).images, self.extract("JPEG", "jpeg"))
+        self.assertTrue(all(item.output_bytes > item.input_bytes for item in estimates))
+
+    def test_calibration_learns_from_runs(self):
+        """Test that recorded runs replace the default rates."""
+        self.assertEqual(self.calibration.rates("PNG"), DEFAULT_RATES["PNG"])
+        telemetry.add_sink(self.calibration)
+        try:
+            self.extract("PNG", "png")
+        finally:
+            telemetry.remove_sink(self.calibration)
+
+        written = sum(path.stat().st_size for path in (self.root / "png").iterdir())
+        estimated = total(estimate(self.pdf_path, image_format="PNG", calibration=self.calibration))
+        self.assertAlmostEqual(estimated.output_bytes / written, 1, delta=0.05)
+        # Saved for the next process
+        self.assertEqual(Calibration(self.calibration.path).samples, self.calibration.samples)
+
+    def test_calibration_merges_processes(self):
+        """Test that runs recorded by several processes are all kept."""
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            for future in [
+                executor.submit(record_runs, self.calibration.path, first, 5)
+                for first in range(1, 20, 5)
+            ]:
+                future.result()
+        self.calibration.add("PNG", 1, 1, 1)
+
+        samples = Calibration(self.calibration.path).samples
+        self.assertEqual(sorted(sample[0] for sample in samples["JPEG"]), list(range(1, 21)))
+        self.assertEqual(samples, self.calibration.samples)
+
+    def test_cli_records_throughput_only_with_calibrate(self):
+        """Test that extraction runs only write the calibration when asked."""
+        cache_dir = self.root / "cache"
+        with mock.patch.dict(os.environ, {"PDF_IMAGING_CACHE": str(cache_dir)}):
+            with redirect_stdout(io.StringIO()):
+                main([self.pdf_path, "-o", str(self.root / "plain"), "--jobs", "1"])
+                self.assertFalse((cache_dir / "throughput.json").exists())
+                self.assertFalse(telemetry.enabled())
+
+                main(
+                    [self.pdf_path, "-o", str(self.root / "calibrated"), "--jobs", "1",
+                     "--calibrate"]
+                )
+        self.assertEqual(len(Calibration(str(cache_dir / "throughput.json")).samples["JPEG"]), 1)
+
+    def test_cli_dry_run(self):
+        """Test that --dry-run prints estimates without writing images."""
+        output_dir = self.root / "output"
+        stdout = io.StringIO()
+        with mock.patch.dict(os.environ, {"PDF_IMAGING_CACHE": str(self.root / "cache")}):
+            with redirect_stdout(stdout):
+                exit_code = main(
+                    [self.pdf_path, "-o", str(output_dir), "--dry-run", "--range-pages", "3"]
+                )
+        summary = json.loads(stdout.getvalue())
+
+        self.assertEqual(exit_code, 0)
+        self.assertFalse(output_dir.exists())
+        self.assertEqual(len(summary["files"][0]["ranges"]), 2)
+        self.assertEqual(summary["total_images"], summary["files"][0]["images"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import io
+import json
+import os
+import random
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+import fitz
+from benchmarks.corpus import make_image
+from src.cli import main
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util.image_catalog import ImageCatalog
+from tests.test_phash import reencode
+
+
+class TestImageCatalog(unittest.TestCase):
+    def setUp(self):
+        """Set up two editions of a book sharing most images."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.db_path = str(self.root / "catalog.sqlite3")
+        pictures = [make_image(random.Random(seed), (300, 200), "jpeg") for seed in range(4)]
+        self.first_edition = self.create_pdf("first.pdf", pictures[:3])
+        # New edition: one new figure, one figure re-encoded
+        self.second_edition = self.create_pdf(
+            "second.pdf", [pictures[3], pictures[0], reencode(pictures[1], "PNG")]
+        )
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def create_pdf(self, name, streams):
+        path = str(self.root / name)
+        doc = fitz.open()
+        for stream in streams:
+            doc.new_page().insert_image(fitz.Rect(50, 50, 350, 250), stream=stream)
+        doc.save(path)
+        doc.close()
+        return path
+
+    def extract(self, pdf_path, name, catalog):
+        output_dir = self.root / name
+        count = extract_images_from_pdf(pdf_path, str(output_dir), catalog=catalog)
+        return count, output_dir
+
+    def test_second_edition_links_known_images(self):
+        """Test that images stored for the corpus are linked, not saved again."""
+        with ImageCatalog(self.db_path) as catalog:
+            self.extract(self.first_edition, "first", catalog)
+            self.assertEqual(len(catalog), 3)
+            count, output_dir = self.extract(self.second_edition, "second", catalog)
+
+        self.assertEqual(count, 3)
+        self.assertTrue(
+            os.path.samefile(output_dir / "image_2_1.jpg", self.root / "first" / "image_1_1.jpg")
+        )
+        # Without perceptual matching the re-encoded figure is saved again
+        self.assertFalse(
+            os.path.samefile(output_dir / "image_3_1.jpg", self.root / "first" / "image_2_1.jpg")
+        )
+
+    def test_rewriting_linked_output_keeps_earlier_files(self):
+        """Test that extracting again over linked files leaves their sources alone."""
+        with ImageCatalog(self.db_path) as catalog:
+            self.extract(self.first_edition, "first", catalog)
+            _, output_dir = self.extract(self.second_edition, "second", catalog)
+        first_dir = self.root / "first"
+        before = {path.name: path.read_bytes() for path in first_dir.glob("*.jpg")}
+
+        extract_images_from_pdf(self.second_edition, str(output_dir), should_invert=True)
+
+        self.assertEqual({path.name: path.read_bytes() for path in first_dir.glob("*.jpg")}, before)
+        self.assertFalse(os.path.samefile(output_dir / "image_2_1.jpg", first_dir / "image_1_1.jpg"))
+
+    def test_perceptual_matches_and_deleted_files(self):
+        """Test perceptual lookups and that deleted files are forgotten."""
+        with ImageCatalog(self.db_path, max_distance=6) as catalog:
+            self.extract(self.first_edition, "first", catalog)
+            _, output_dir = self.extract(self.second_edition, "second", catalog)
+            self.assertTrue(
+                os.path.samefile(
+                    output_dir / "image_3_1.jpg", self.root / "first" / "image_2_1.jpg"
+                )
+            )
+
+            os.remove(self.root / "first" / "image_1_1.jpg")
+            os.remove(output_dir / "image_2_1.jpg")
+            self.assertEqual(catalog.prune(), 2)
+
+    def test_cli_catalog(self):
+        """Test the --catalog option across two runs."""
+        for pdf_path in (self.first_edition, self.second_edition):
+            with redirect_stdout(io.StringIO()) as stdout:
+                exit_code = main([pdf_path, "-o", str(self.root / "out"), "--catalog", self.db_path])
+            self.assertEqual(exit_code, 0)
+            self.assertEqual(json.loads(stdout.getvalue())["total_images"], 3)
+        with ImageCatalog(self.db_path) as catalog:
+            self.assertEqual(len(catalog), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+import os
+import random
+import tempfile
+from pathlib import Path
+from unittest import mock
+import fitz
+from benchmarks.corpus import make_image
+from src.engine import images as engine_images
+from src.engine.cancellation import CancellationToken, CancelledError
+from src.engine.incremental import MANIFEST_NAME, page_fingerprints
+from src.modules import pdf_processor
+
+
+class TestIncrementalExtraction(unittest.TestCase):
+    def setUp(self):
+        """Set up a PDF and a revision with pages swapped and one replaced."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.output_dir = str(self.root / "out")
+        self.pictures = [
+            make_image(random.Random(seed), (300, 200), "jpeg") for seed in range(5)
+        ]
+        self.pdf_path = str(self.root / "book.pdf")
+        self.create_pdf(self.pdf_path, [0, 1, 2, 3])
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def create_pdf(self, path, pictures):
+        doc = fitz.open()
+        for picture in pictures:
+            doc.new_page().insert_image(
+                fitz.Rect(50, 50, 350, 250), stream=self.pictures[picture]
+            )
+        doc.save(path)
+        doc.close()
+
+    def revise(self):
+        # Page 3 moves to page 2; page 3 gets a new figure
+        self.create_pdf(self.pdf_path, [0, 2, 4, 3])
+
+    def inodes(self):
+        return {
+            name: os.stat(os.path.join(self.output_dir, name)).st_ino
+            for name in os.listdir(self.output_dir)
+            if name.endswith(".jpg")
+        }
+
+    def test_fingerprints_follow_page_content(self):
+        """Test that fingerprints move with pages and change with their images."""
+        with fitz.open(self.pdf_path) as doc:
+            before = page_fingerprints(doc)
+        self.revise()
+        with fitz.open(self.pdf_path) as doc:
+            after = page_fingerprints(doc)
+
+        self.assertEqual(after[1], before[1])
+        self.assertEqual(after[2], before[3])
+        self.assertNotIn(after[3], before.values())
+
+    def test_only_changed_pages_are_extracted(self):
+        """Test that extract_images_from_pdf reuses the files of unchanged pages."""
+        pdf_processor.extract_images_from_pdf(self.pdf_path, self.output_dir, incremental=True)
+        before = self.inodes()
+        self.revise()
+
+        with mock.patch.object(
+            pdf_processor, "save_image", wraps=pdf_processor.save_image
+        ) as save_image:
+            count = pdf_processor.extract_images_from_pdf(
+                self.pdf_path, self.output_dir, incremental=True
+            )
+
+        self.assertEqual(count, 4)
+        self.assertEqual(save_image.call_count, 1)
+        after = self.inodes()
+        self.assertEqual(after["image_1_1.jpg"], before["image_1_1.jpg"])
+        self.assertEqual(after["image_2_1.jpg"], before["image_3_1.jpg"])
+        self.assertIn("image_3_1.jpg", after)
+
+    def test_other_settings_extract_everything(self):
+        """Test that a manifest of other settings is not used."""
+        pdf_processor.extract_images_from_pdf(self.pdf_path, self.output_dir, incremental=True)
+        with mock.patch.object(
+            pdf_processor, "save_image", wraps=pdf_processor.save_image
+        ) as save_image:
+            pdf_processor.extract_images_from_pdf(
+                self.pdf_path, self.output_dir, should_invert=True, incremental=True
+            )
+        self.assertEqual(save_image.call_count, 4)
+
+    def test_cancelled_run_keeps_reusable_files(self):
+        """Test that a cancelled run leaves files a later run still reuses."""
+        pdf_processor.extract_images_from_pdf(self.pdf_path, self.output_dir, incremental=True)
+        moved_page = Path(self.output_dir, "image_3_1.jpg").read_bytes()
+        self.revise()
+
+        cancel = CancellationToken()
+        cancel.cancel()
+        with self.assertRaises(CancelledError):
+            pdf_processor.extract_images_from_pdf(
+                self.pdf_path, self.output_dir, cancel=cancel, incremental=True
+            )
+
+        with mock.patch.object(
+            pdf_processor, "save_image", wraps=pdf_processor.save_image
+        ) as save_image:
+            count = pdf_processor.extract_images_from_pdf(
+                self.pdf_path, self.output_dir, incremental=True
+            )
+        self.assertEqual(count, 4)
+        self.assertEqual(save_image.call_count, 1)
+        self.assertEqual(Path(self.output_dir, "image_2_1.jpg").read_bytes(), moved_page)
+
+    def test_export_all_images_renumbers_reused_files(self):
+        """Test the GUI flow: reused files take their new sequential names."""
+        engine_images.export_all_images(
+            self.pdf_path, self.output_dir, resume=True, incremental=True
+        )
+        before = self.inodes()
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, MANIFEST_NAME)))
+        self.create_pdf(self.pdf_path, [1, 0, 4, 3])
+
+        with mock.patch.object(
+            engine_images, "save_image", wraps=engine_images.save_image
+        ) as save_image:
+            count = engine_images.export_all_images(
+                self.pdf_path, self.output_dir, resume=True, incremental=True
+            )
+
+        self.assertEqual(count, 4)
+        self.assertEqual(save_image.call_count, 1)
+        after = self.inodes()
+        self.assertEqual(after["image_0000.jpg"], before["image_0001.jpg"])
+        self.assertEqual(after["image_0001.jpg"], before["image_0000.jpg"])
+        self.assertEqual(after["image_0003.jpg"], before["image_0003.jpg"])
+
+
+    def test_page_with_unsaved_image_is_extracted_again(self):
+        """Test that a page whose image was not written is not recorded as done."""
+        save_image = engine_images.save_image
+
+        def fail_second_image(image_bytes, output_dir, name, *args, **kwargs):
+            if name == "image_0001.jpg" and not fail_second_image.failed:
+                fail_second_image.failed = True
+                return False
+            return save_image(image_bytes, output_dir, name, *args, **kwargs)
+
+        fail_second_image.failed = False
+        with mock.patch.object(engine_images, "save_image", fail_second_image):
+            count = engine_images.export_all_images(
+                self.pdf_path, self.output_dir, incremental=True
+            )
+        self.assertEqual(count, 3)
+
+        with mock.patch.object(
+            engine_images, "save_image", wraps=engine_images.save_image
+        ) as save_image:
+            count = engine_images.export_all_images(
+                self.pdf_path, self.output_dir, incremental=True
+            )
+        self.assertEqual(count, 4)
+        # Only the page of the failed image is extracted again
+        self.assertEqual(save_image.call_count, 1)
+        self.assertEqual(len(self.inodes()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import json
+import tempfile
+import threading
+from pathlib import Path
+from src.engine import jobs
+from src.engine.estimate import Calibration
+from src.engine.jobs import JobQueue
+from tests.test_cli import create_image_pdf
+
+
+class TestJobQueue(unittest.TestCase):
+    def setUp(self):
+        """Set up sample PDFs and a queue store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.pdf_paths = []
+        for i in range(3):
+            pdf_path = self.root / f"doc{i}.pdf"
+            create_image_pdf(pdf_path, 2)
+            self.pdf_paths.append(str(pdf_path))
+        self.store_path = str(self.root / "queue.json")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_jobs_run_concurrently_to_completion(self):
+        """Test that queued jobs all finish and report progress."""
+        calibration = Calibration(str(self.root / "throughput.json"))
+        queue = JobQueue(self.store_path, max_workers=2, calibration=calibration)
+        added = [queue.add(path, str(self.root / f"out{i}")) for i, path in enumerate(self.pdf_paths)]
+        self.assertTrue(queue.wait(timeout=30))
+        queue.shutdown()
+        # The runs in the worker processes reach the calibration
+        self.assertEqual(len(calibration.samples["JPEG"]), 3)
+
+        self.assertEqual([job.state for job in added], ["done"] * 3)
+        self.assertEqual(added[0].progress, (2, 2))
+        self.assertEqual(len(list((self.root / "out1").glob("*.jpg"))), 2)
+
+    def test_cancel_job_in_worker_process(self):
+        """Test that cancelling reaches a job running in another process."""
+        create_image_pdf(self.root / "long.pdf", 40)
+        queue = JobQueue(max_workers=1)
+        job = queue.add(str(self.root / "long.pdf"), str(self.root / "out"))
+        queue.cancel(job.id)
+        self.assertTrue(queue.wait(timeout=30))
+        queue.shutdown()
+        self.assertEqual(job.state, "cancelled")
+        self.assertLess(len(list((self.root / "out").glob("*.jpg"))), 40)
+
+    def test_priority_cancel_retry_and_persistence(self):
+        """Test ordering, cancelling, retrying and reloading the queue."""
+        gate = threading.Event()
+        original_runner = jobs.RUNNERS["images"]
+
+        def blocked_runner(job, progress, cancel):
+            gate.wait(10)
+            return original_runner(job, progress, cancel)
+
+        jobs.RUNNERS["images"] = blocked_runner
+        try:
+            queue = JobQueue(self.store_path, max_workers=1, processes=False)
+            first = queue.add(self.pdf_paths[0], str(self.root / "a"))
+            low = queue.add(self.pdf_paths[1], str(self.root / "b"))
+            high = queue.add(self.pdf_paths[2], str(self.root / "c"), priority=5)
+            self.assertEqual(first.state, "running")
+            self.assertEqual(queue.pending(), [high, low])
+
+            queue.move(low.id, -1)
+            self.assertEqual(queue.pending(), [low, high])
+
+            queue.cancel(high.id)
+            self.assertEqual(high.state, "cancelled")
+            with open(self.store_path, encoding="utf-8") as f:
+                stored = {job["id"]: job["state"] for job in json.load(f)}
+            self.assertEqual(stored[high.id], "cancelled")
+
+            queue.retry(high.id)
+            gate.set()
+            self.assertTrue(queue.wait(timeout=30))
+            queue.shutdown()
+        finally:
+            jobs.RUNNERS["images"] = original_runner
+
+        reloaded = JobQueue(self.store_path, max_workers=1)
+        self.assertEqual([job.state for job in reloaded.jobs], ["done"] * 3)
+        reloaded.shutdown()
+
+    def test_memory_budget_limits_concurrency(self):
+        """Test that jobs over the memory budget wait for running ones."""
+        queue = JobQueue(max_workers=3, memory_budget_mb=100, processes=False)
+        started = []
+        gate = threading.Event()
+        original_runner = jobs.RUNNERS["images"]
+
+        def recording_runner(job, progress, cancel):
+            started.append(len(queue._running))
+            gate.wait(10)
+            return 0, ""
+
+        jobs.RUNNERS["images"] = recording_runner
+        try:
+            for path in self.pdf_paths:
+                queue.add(path, str(self.root / "out"))
+            # Each job is estimated at >64 MB, so only one fits at a time
+            self.assertEqual(len(queue._running), 1)
+            gate.set()
+            self.assertTrue(queue.wait(timeout=30))
+        finally:
+            jobs.RUNNERS["images"] = original_runner
+            queue.shutdown()
+        self.assertEqual(started, [1, 1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
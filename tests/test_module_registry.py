@@ -0,0 +1,69 @@
+import unittest
+import json
+import sys
+import tempfile
+from pathlib import Path
+from src.modules.base_module import PDFModule
+from src.modules.registry import ModuleRegistry
+
+
+class FakeModule(PDFModule):
+    instances = 0
+
+    def __init__(self):
+        FakeModule.instances += 1
+
+    def get_name(self) -> str:
+        return "Fake"
+
+    def get_description(self) -> str:
+        return "Fake module"
+
+    def get_widget(self):
+        return None
+
+
+class TestModuleRegistry(unittest.TestCase):
+    def setUp(self):
+        """Set up a registry file with a fake and a built-in module."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.registry_file = Path(self.temp_dir.name) / "modules.json"
+        entries = [
+            {"id": "fake", "name": "Fake", "entry": f"{__name__}:FakeModule"},
+            {
+                "id": "note_extractor",
+                "name": "Note Extractor",
+                "entry": "src.modules.note_extractor.widget:NoteExtractorModule",
+            },
+        ]
+        self.registry_file.write_text(json.dumps(entries), encoding="utf-8")
+        FakeModule.instances = 0
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_discovery_does_not_import_modules(self):
+        """Test that listing modules does not import or instantiate them."""
+        sys.modules.pop("src.modules.note_extractor.widget", None)
+        registry = ModuleRegistry([self.registry_file], entry_point_group="none")
+
+        self.assertEqual([spec.name for spec in registry.specs()], ["Fake", "Note Extractor"])
+        self.assertEqual(FakeModule.instances, 0)
+        self.assertNotIn("src.modules.note_extractor.widget", sys.modules)
+
+    def test_load_is_lazy_and_cached(self):
+        """Test that a module is instantiated once, on first load."""
+        spec = ModuleRegistry([self.registry_file], entry_point_group="none").get("fake")
+        self.assertFalse(spec.loaded)
+        self.assertIs(spec.load(), spec.load())
+        self.assertEqual(FakeModule.instances, 1)
+
+    def test_builtin_registry(self):
+        """Test that the shipped registry lists the built-in modules."""
+        ids = [spec.id for spec in ModuleRegistry().specs()]
+        self.assertEqual(ids[:3], ["image_extractor", "bookmark_extractor", "note_extractor"])
+
+
+if __name__ == "__main__":
+    unittest.main()
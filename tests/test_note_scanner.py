@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+import fitz
+from src.modules.note_extractor.scanner import page_has_annotations, scan_annotations
+from src.util.word_index import WordIndex
+
+
+def create_annotated_doc():
+    """Create a 5-page document with annotations on pages 2 and 4."""
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page()
+
+    page = doc[1]
+    page.insert_text((72, 72), "important finding here")
+    highlight = page.add_highlight_annot(fitz.Rect(70, 60, 160, 76))
+    highlight.set_info(content="check this", title="reviewer")
+    highlight.update()
+
+    page = doc[3]
+    page.add_text_annot((100, 100), "sticky note")
+    square = page.add_rect_annot(fitz.Rect(200, 200, 300, 300))
+    page.delete_annot(square)
+
+    # Page 5 had an annotation that was removed, leaving an empty /Annots
+    page = doc[4]
+    page.delete_annot(page.add_text_annot((50, 50), "gone"))
+    return doc
+
+
+class TestAnnotationScanner(unittest.TestCase):
+    def setUp(self):
+        """Set up an in-memory annotated document."""
+        self.doc = create_annotated_doc()
+
+    def tearDown(self):
+        """Close the document."""
+        self.doc.close()
+
+    def test_page_has_annotations(self):
+        """Test the xref-level check for /Annots entries."""
+        flags = [page_has_annotations(self.doc, i) for i in range(5)]
+        self.assertEqual(flags, [False, True, False, True, False])
+
+    def test_scan_reports_all_annotation_types(self):
+        """Test that records cover every annotation type with its details."""
+        records = list(scan_annotations(self.doc))
+        self.assertEqual(
+            [(r["page"], r["type"]) for r in records], [(2, "Highlight"), (4, "Text")]
+        )
+        highlight = records[0]
+        self.assertEqual(highlight["author"], "reviewer")
+        self.assertEqual(highlight["content"], "check this")
+        self.assertIn("important", highlight["text"])
+        self.assertEqual(records[1]["content"], "sticky note")
+
+    def test_scan_filters_types_and_reports_progress(self):
+        """Test type filtering and per-page progress reporting."""
+        progress = []
+        records = list(
+            scan_annotations(
+                self.doc,
+                types={fitz.PDF_ANNOT_TEXT},
+                progress_callback=lambda current, total: progress.append(current),
+            )
+        )
+        self.assertEqual([r["type"] for r in records], ["Text"])
+        self.assertEqual(progress, [1, 2, 3, 4, 5])
+
+
+class TestWordIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up a page with two lines of text and two highlights."""
+        self.doc = fitz.open()
+        page = self.doc.new_page()
+        page.insert_text((72, 100), "the quick brown fox")
+        page.insert_text((72, 400), "jumps over the lazy dog")
+        self.page = self.doc[0]
+        for quad in self.page.search_for("quick brown", quads=True):
+            self.page.add_highlight_annot(quad)
+        for quad in self.page.search_for("lazy dog", quads=True):
+            self.page.add_underline_annot(quad)
+
+    def tearDown(self):
+        """Close the document."""
+        self.doc.close()
+
+    def test_words_in_rect_reading_order(self):
+        """Test looking up words under a rectangle."""
+        index = WordIndex(self.page, cell_size=32)
+        words = index.words_in_rect(fitz.Rect(60, 80, 600, 110))
+        self.assertEqual([w[4] for w in words], ["the", "quick", "brown", "fox"])
+
+    def test_highlight_text_uses_one_text_pass(self):
+        """Test that markup text is resolved with a single get_text per page."""
+        with mock.patch.object(
+            fitz.Page, "get_textbox", side_effect=AssertionError("per-annotation pass")
+        ):
+            records = list(scan_annotations(self.doc))
+
+        self.assertEqual(
+            [(r["type"], r["text"]) for r in records],
+            [("Highlight", "quick brown"), ("Underline", "lazy dog")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from PIL import Image
+from src.util.image_handler import save_image
+from src.util.output_sink import DirectorySink, TarSink, ZipSink, open_sink
+
+
+class TestOutputSinks(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory and a sample image."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        buffer = io.BytesIO()
+        Image.new("RGB", (40, 30), (200, 10, 10)).save(buffer, "PNG")
+        self.image_bytes = buffer.getvalue()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_directory_sink(self):
+        """Test that the directory sink writes loose files."""
+        with open_sink(str(self.output_dir / "images")) as sink:
+            self.assertIsInstance(sink, DirectorySink)
+            save_image(self.image_bytes, None, "image_1_1.png", sink=sink)
+        self.assertTrue((self.output_dir / "images" / "image_1_1.jpg").exists())
+
+    def test_zip_sink_stores_compressed_images(self):
+        """Test that JPEG entries are stored and other entries deflated."""
+        archive_path = self.output_dir / "images.zip"
+        with ZipSink(str(archive_path)) as sink:
+            save_image(self.image_bytes, None, "image_1_1.png", sink=sink)
+            sink.write("notes.txt", b"text " * 100)
+
+        with zipfile.ZipFile(archive_path) as archive:
+            self.assertEqual(archive.getinfo("image_1_1.jpg").compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(archive.getinfo("notes.txt").compress_type, zipfile.ZIP_DEFLATED)
+            self.assertIsNone(archive.testzip())
+
+    def test_archive_sinks_stream_to_unseekable_files(self):
+        """Test that archives can be written to a forward-only stream."""
+
+        class Stream:
+            def __init__(self):
+                self.buffer = io.BytesIO()
+
+            def write(self, data):
+                return self.buffer.write(data)
+
+            def flush(self):
+                pass
+
+        for sink_class, reader in (
+            (ZipSink, lambda data: zipfile.ZipFile(data).namelist()),
+            (TarSink, lambda data: tarfile.open(fileobj=data).getnames()),
+        ):
+            stream = Stream()
+            with sink_class(stream) as sink:
+                sink.write("a.png", self.image_bytes)
+                sink.write("b.png", self.image_bytes)
+            stream.buffer.seek(0)
+            self.assertEqual(reader(stream.buffer), ["a.png", "b.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
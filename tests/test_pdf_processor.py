@@ -1,10 +1,15 @@
 import unittest
 import os
 from pathlib import Path
+from unittest import mock
+import fitz
+from src.engine.cancellation import CancellationToken, CancelledError
+from src.modules import pdf_processor
 from src.modules.pdf_processor import extract_images_from_pdf
 from src.util.image_handler import save_image
 from PIL import Image
 import io
+from benchmarks.corpus import generate_pdf
 
 
 class TestPDFProcessor(unittest.TestCase):
@@ -19,12 +24,14 @@ class TestPDFProcessor(unittest.TestCase):
 
         # Path to a sample PDF for testing
         self.sample_pdf = self.test_dir / "sample.pdf"
+        self.sample_summary = create_sample_pdf(self.sample_pdf)
 
     def tearDown(self):
         """Clean up after each test method."""
         # Remove all files in the output directory
         for file in self.output_dir.glob("*"):
             file.unlink()
+        self.sample_pdf.unlink(missing_ok=True)
 
     def test_extract_images_with_invalid_pdf(self):
         """Test handling of non-existent PDF file."""
@@ -42,6 +49,7 @@ class TestPDFProcessor(unittest.TestCase):
 
         # Check if images were extracted
         self.assertGreater(num_images, 0, "No images were extracted")
+        self.assertEqual(num_images, self.sample_summary["images"])
 
         # Check if files were created
         extracted_files = list(self.output_dir.glob("*"))
@@ -52,6 +60,23 @@ class TestPDFProcessor(unittest.TestCase):
         )
 
 
+    def test_document_closed_when_extraction_fails(self):
+        """Test that the PDF is closed when extraction stops with an error."""
+        opened = []
+        real_open = fitz.open
+
+        def recording_open(*args):
+            opened.append(real_open(*args))
+            return opened[-1]
+
+        cancel = CancellationToken()
+        cancel.cancel()
+        with mock.patch.object(pdf_processor.fitz, "open", recording_open):
+            with self.assertRaises(CancelledError):
+                extract_images_from_pdf(str(self.sample_pdf), str(self.output_dir), cancel=cancel)
+        self.assertTrue(opened[0].is_closed)
+
+
 class TestImageHandler(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures before each test method."""
@@ -63,6 +88,10 @@ class TestImageHandler(unittest.TestCase):
         for file in self.output_dir.glob("*"):
             file.unlink()
 
+    # Kept as written: save_image does not invert by default, and inverting
+    # removes a black background rather than darkening white (see
+    # test_save_image_removes_black_background)
+    @unittest.expectedFailure
     def test_save_image(self):
         """Test saving and inverting an image."""
         # Create a simple test image
@@ -91,13 +120,43 @@ class TestImageHandler(unittest.TestCase):
             all(x < 128 for x in pixel), "Image doesn't appear to be inverted"
         )
 
+    def test_save_image_removes_black_background(self):
+        """Test that inverting turns a black background white."""
+        # Create a test image: black background on the left half
+        test_image = Image.new("RGB", (100, 100), color="white")
+        test_image.paste((0, 0, 0), (0, 0, 50, 100))
+        buffer = io.BytesIO()
+        test_image.save(buffer, format="JPEG")
+        image_bytes = buffer.getvalue()
 
-def create_sample_pdf():
+        result = save_image(image_bytes, str(self.output_dir), "test.jpg", should_invert=True)
+        self.assertTrue(result, "Image save failed")
+
+        saved_image = Image.open(self.output_dir / "test.jpg")
+        pixel = saved_image.getpixel((10, 50))
+        self.assertTrue(
+            all(x > 200 for x in pixel), "Black background was not removed"
+        )
+        pixel = saved_image.getpixel((90, 50))
+        self.assertTrue(all(x > 200 for x in pixel), "Content was changed")
+
+
+def create_sample_pdf(path):
     """
     Helper function to create a sample PDF for testing.
-    You would need to implement this based on your needs.
+
+    Builds a small deterministic document with JPEG and PNG images (some
+    with an alpha channel) and vector drawings, and returns its summary.
     """
-    pass
+    return generate_pdf(
+        path,
+        pages=3,
+        images_per_page=2,
+        formats=("jpeg", "png"),
+        smask_ratio=0.3,
+        vector_figures=1,
+        seed=1,
+    )
 
 
 if __name__ == "__main__":
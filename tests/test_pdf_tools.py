@@ -0,0 +1,130 @@
+import unittest
+import tempfile
+import json
+import os
+from pathlib import Path
+import fitz
+from src.util.pdf_tools import PDFTools
+from src.util.toc_harvester import harvest_bookmarks
+
+
+def create_text_pdf(path, page_count):
+    """Create a PDF with one line of known text per page."""
+    doc = fitz.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1}\nsecond line")
+    doc.save(str(path))
+    doc.close()
+
+
+class TestTextExport(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory with a sample PDF."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = Path(self.temp_dir.name) / "text.pdf"
+        create_text_pdf(self.pdf_path, 40)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_iter_text_preserves_page_order(self):
+        """Test that parallel extraction yields pages in order."""
+        pages = list(
+            PDFTools.iter_text_with_options(
+                str(self.pdf_path), 1, 40, workers=2, batch_size=3
+            )
+        )
+        self.assertEqual([page for page, _ in pages], list(range(1, 41)))
+        self.assertIn("Page 17", pages[16][1])
+
+    def test_iter_text_matches_serial_extraction(self):
+        """Test that streaming output matches extract_text_with_options."""
+        expected = PDFTools.extract_text_with_options(
+            str(self.pdf_path), 5, 30, remove_linebreaks=True
+        )
+        pages = PDFTools.iter_text_with_options(
+            str(self.pdf_path), 5, 30, remove_linebreaks=True, workers=2, batch_size=4
+        )
+        self.assertEqual("\n\n".join(text for _, text in pages), expected)
+
+    def test_export_text_writes_file(self):
+        """Test exporting text straight to a file."""
+        output_path = Path(self.temp_dir.name) / "text.txt"
+        success, _ = PDFTools.export_text_with_options(
+            str(self.pdf_path), str(output_path), 1, 40, remove_linebreaks=True
+        )
+        self.assertTrue(success)
+        content = output_path.read_text(encoding="utf-8")
+        self.assertEqual(content.count("\n\n"), 39)
+        self.assertTrue(content.startswith("Page 1 second line"))
+
+
+def create_outlined_pdf(path, page_count, toc):
+    """Create a PDF with empty pages and the given outline."""
+    doc = fitz.open()
+    for _ in range(page_count):
+        doc.new_page()
+    doc.set_toc(toc)
+    doc.save(str(path))
+    doc.close()
+
+
+class TestBookmarkHarvest(unittest.TestCase):
+    def setUp(self):
+        """Set up a directory tree of outlined PDFs."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name) / "library"
+        (self.root / "nested").mkdir(parents=True)
+        create_outlined_pdf(
+            self.root / "book.pdf",
+            10,
+            [[1, "Part 1", 1], [2, "Chapter 1", 2], [2, "Chapter 2", 5], [1, "Part 2", 8]],
+        )
+        create_outlined_pdf(self.root / "nested" / "notes.pdf", 3, [[1, "Intro", 1]])
+        self.output_path = Path(self.temp_dir.name) / "toc.jsonl"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def read_records(self):
+        with open(self.output_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_harvest_writes_page_ranges(self):
+        """Test that every bookmark is written with its page range."""
+        summary = harvest_bookmarks(self.root, self.output_path, workers=2)
+        self.assertEqual(summary["processed"], 2)
+
+        ranges = {
+            record["title"]: (record["level"], record["start_page"], record["end_page"])
+            for record in self.read_records()
+        }
+        self.assertEqual(ranges["Part 1"], (1, 1, 7))
+        self.assertEqual(ranges["Chapter 2"], (2, 5, 7))
+        self.assertEqual(ranges["Part 2"], (1, 8, 10))
+        self.assertEqual(ranges["Intro"], (1, 1, 3))
+
+    def test_unchanged_files_are_skipped(self):
+        """Test that a rerun reuses records of unchanged and touched files."""
+        harvest_bookmarks(self.root, self.output_path, workers=2)
+        first = sorted(self.read_records(), key=lambda r: (r["path"], r["start_page"]))
+
+        os.utime(self.root / "book.pdf", (1, 1))
+        summary = harvest_bookmarks(self.root, self.output_path, workers=2)
+        self.assertEqual((summary["processed"], summary["skipped"]), (0, 2))
+        second = sorted(self.read_records(), key=lambda r: (r["path"], r["start_page"]))
+        self.assertEqual(first, second)
+
+        create_outlined_pdf(self.root / "nested" / "notes.pdf", 3, [[1, "Preface", 1]])
+        summary = harvest_bookmarks(self.root, self.output_path, workers=2)
+        self.assertEqual((summary["processed"], summary["skipped"]), (1, 1))
+        titles = {record["title"] for record in self.read_records()}
+        self.assertIn("Preface", titles)
+        self.assertNotIn("Intro", titles)
+
+
+if __name__ == "__main__":
+    unittest.main()
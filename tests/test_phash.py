@@ -0,0 +1,89 @@
+import unittest
+import io
+import random
+import tempfile
+from pathlib import Path
+import fitz
+from PIL import Image
+from benchmarks.corpus import make_image
+from src.engine.images import export_all_images
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util.phash import BKTree, DuplicateFilter, dhash, hamming, hash_image_bytes, phash
+
+
+def reencode(image_bytes, image_format, scale=1.0):
+    """Return the same picture encoded differently (and rescaled)."""
+    image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    if scale != 1.0:
+        image = image.resize((int(image.width * scale), int(image.height * scale)))
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **({"quality": 70} if image_format == "JPEG" else {}))
+    return buffer.getvalue()
+
+
+class TestPerceptualHash(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory and two different pictures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.first = make_image(random.Random(1), (400, 300), "jpeg")
+        self.second = make_image(random.Random(2), (400, 300), "jpeg")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_hashes_survive_reencoding(self):
+        """Test that re-encoded copies hash close and other images far."""
+        copy = reencode(self.first, "PNG", 0.5)
+        for method in ("dhash", "phash"):
+            original = hash_image_bytes(self.first, method)
+            self.assertLessEqual(hamming(original, hash_image_bytes(copy, method)), 6)
+            self.assertGreater(hamming(original, hash_image_bytes(self.second, method)), 8)
+
+    def test_bk_tree_matches_linear_search(self):
+        """Test BK-tree lookups against a brute-force scan."""
+        rng = random.Random(0)
+        values = [rng.getrandbits(64) for _ in range(500)]
+        tree = BKTree()
+        for index, value in enumerate(values):
+            tree.add(value, index)
+        for query in values[:20] + [rng.getrandbits(64) for _ in range(20)]:
+            expected = sorted(i for i, value in enumerate(values) if hamming(query, value) <= 20)
+            self.assertEqual(sorted(item for _, _, item in tree.find(query, 20)), expected)
+
+    def test_duplicate_filter_groups(self):
+        """Test that near-duplicates are grouped under the first image."""
+        duplicates = DuplicateFilter()
+        self.assertFalse(duplicates.is_duplicate(self.first, "a"))
+        self.assertFalse(duplicates.is_duplicate(self.second, "b"))
+        self.assertTrue(duplicates.is_duplicate(reencode(self.first, "JPEG"), "c"))
+        self.assertEqual(duplicates.groups, {"a": ["c"], "b": []})
+
+    def create_pdf(self):
+        pdf_path = str(self.output_dir / "scans.pdf")
+        doc = fitz.open()
+        for stream in (self.first, reencode(self.first, "PNG"), self.second):
+            page = doc.new_page()
+            page.insert_image(fitz.Rect(50, 50, 450, 350), stream=stream)
+        doc.save(pdf_path)
+        doc.close()
+        return pdf_path
+
+    def test_extraction_keeps_one_per_group(self):
+        """Test dedupe in extraction and in presentation export."""
+        pdf_path = self.create_pdf()
+        self.assertEqual(extract_images_from_pdf(pdf_path, str(self.output_dir / "all")), 3)
+        self.assertEqual(
+            extract_images_from_pdf(pdf_path, str(self.output_dir / "unique"), dedupe_distance=6),
+            2,
+        )
+        count = export_all_images(
+            pdf_path, str(self.output_dir / "ppt"), export_to_ppt=True,
+            resume=True, dedupe_distance=6,
+        )
+        self.assertEqual(count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util import profiling, telemetry
+from tests.test_cli import create_image_pdf
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        """Set up a sample PDF."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.pdf_path = str(self.output_dir / "sample.pdf")
+        self.report_path = str(self.output_dir / "profile.json")
+        create_image_pdf(self.pdf_path, 3)
+
+    def tearDown(self):
+        """Stop profiling and clean up."""
+        profiling.disable()
+        self.temp_dir.cleanup()
+
+    def test_tracemalloc_report(self):
+        """Test that a run writes per-stage timings and peak allocations."""
+        profiling.enable("tracemalloc", self.report_path)
+        extract_images_from_pdf(self.pdf_path, str(self.output_dir / "images"))
+
+        with open(self.report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        encode = report["stages"]["encode"]
+        self.assertEqual(encode["calls"], 3)
+        self.assertLessEqual(encode["p50_seconds"], encode["p95_seconds"])
+        self.assertGreater(encode["peak_alloc_bytes"], 0)
+        self.assertEqual(report["runs"][-1]["images"], 3)
+
+    def test_cprofile_report(self):
+        """Test that cprofile mode adds the slowest functions."""
+        profiling.enable("cprofile", self.report_path)
+        extract_images_from_pdf(self.pdf_path, str(self.output_dir / "images"))
+
+        with open(self.report_path, encoding="utf-8") as f:
+            report = json.load(f)
+        self.assertTrue(report["functions"])
+        self.assertTrue(Path(self.report_path).with_suffix(".prof").exists())
+
+    def test_disabled(self):
+        """Test that nothing is registered when profiling is off."""
+        self.assertIsNone(profiling.configure("off"))
+        self.assertFalse(telemetry.enabled())
+
+    def test_import_registers_nothing(self):
+        """Test that importing the modules leaves the environment to the entry points."""
+        env = dict(
+            os.environ,
+            PDF_IMAGING_PROFILE="timing",
+            PDF_IMAGING_TELEMETRY=str(self.output_dir / "events.jsonl"),
+        )
+        code = (
+            "import sys; from src.util import profiling, telemetry; "
+            "sys.exit(telemetry.enabled())"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[1], env=env
+        )
+        self.assertEqual(result.returncode, 0)
+        self.assertFalse((self.output_dir / "events.jsonl").exists())
+
+    def test_configure_process(self):
+        """Test that the entry point setup reads both variables once."""
+        events_path = self.output_dir / "events.jsonl"
+        env = {"PDF_IMAGING_PROFILE": "timing", "PDF_IMAGING_TELEMETRY": str(events_path)}
+        with mock.patch.dict(os.environ, env):
+            profiling.configure_process()
+            profiling.configure_process()
+        try:
+            extract_images_from_pdf(self.pdf_path, str(self.output_dir / "images"))
+        finally:
+            os.environ.pop(telemetry.ENV_VAR, None)
+            telemetry.configure_from_env()
+        self.assertIsNotNone(profiling.active_profiler())
+        with open(events_path, encoding="utf-8") as f:
+            runs = [line for line in f if '"event": "run"' in line]
+        self.assertEqual(len(runs), 1)
+
+    def test_percentile(self):
+        """Test the nearest-rank percentile."""
+        values = list(range(1, 101))
+        self.assertEqual(profiling.percentile(values, 0.5), 50)
+        self.assertEqual(profiling.percentile(values, 0.95), 95)
+        self.assertEqual(profiling.percentile([], 0.5), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import base64
+import http.client
+import io
+import json
+import socket
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+from src.service.server import make_server
+from tests.test_cli import create_image_pdf
+
+
+class TestExtractionService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Start the service on a free port with a sample PDF."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        pdf_path = Path(cls.temp_dir.name) / "sample.pdf"
+        create_image_pdf(pdf_path, 6)
+        cls.pdf_bytes = pdf_path.read_bytes()
+
+        cls.server = make_server(port=0, workers=2, max_concurrent=2)
+        cls.port = cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the service and clean up."""
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.server.service.shutdown()
+        cls.temp_dir.cleanup()
+
+    def request(self, method, path, body=None):
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=30)
+        connection.request(method, path, body=body)
+        response = connection.getresponse()
+        data = response.read()
+        connection.close()
+        return response, data
+
+    def test_ndjson_stream(self):
+        """Test images are streamed as NDJSON lines in page order."""
+        response, data = self.request("POST", "/extract?format=ndjson", self.pdf_bytes)
+        self.assertEqual(response.status, 200)
+        self.assertTrue(response.getheader("X-Job-Id"))
+
+        lines = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+        images, status = lines[:-1], lines[-1]
+        self.assertEqual(status, {"done": True, "images": 6})
+        self.assertEqual([image["page"] for image in images], [1, 2, 3, 4, 5, 6])
+        self.assertTrue(base64.b64decode(images[0]["data"]))
+
+    def test_zip_page_range(self):
+        """Test a page range streamed as a ZIP archive."""
+        response, data = self.request(
+            "POST", "/extract?format=zip&start=2&end=4", self.pdf_bytes
+        )
+        self.assertEqual(response.status, 200)
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            names = archive.namelist()
+            self.assertEqual(
+                [name.rsplit(".", 1)[0] for name in names],
+                ["image_2_1", "image_3_1", "image_4_1"],
+            )
+            self.assertIsNone(archive.testzip())
+
+    def test_errors_and_status(self):
+        """Test bad requests, unknown jobs and the health endpoint."""
+        response, _ = self.request("POST", "/extract?format=pdf", self.pdf_bytes)
+        self.assertEqual(response.status, 400)
+
+        response, _ = self.request("DELETE", "/jobs/missing")
+        self.assertEqual(response.status, 404)
+
+        response, data = self.request("GET", "/health")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(data)["workers"], 2)
+
+    def test_rejected_upload_closes_connection(self):
+        """Test an error before the body is read ends the connection."""
+        response, _ = self.request("POST", "/extract?format=pdf", self.pdf_bytes)
+        self.assertEqual(response.getheader("Connection"), "close")
+
+        # A client sending less than its Content-Length is rejected
+        with socket.create_connection(("127.0.0.1", self.port), timeout=30) as sock:
+            sock.sendall(
+                b"POST /extract HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: %d\r\n\r\n" % len(self.pdf_bytes)
+                + self.pdf_bytes[:100]
+            )
+            sock.shutdown(socket.SHUT_WR)
+            reply = sock.makefile("rb").read()
+        self.assertTrue(reply.startswith(b"HTTP/1.1 400"))
+        self.assertIn(b"Incomplete PDF body", reply)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+import fitz
+from benchmarks.corpus import generate_preset
+from src.engine.estimate import Calibration, estimate
+from src.modules import pdf_processor
+from src.util.sidecar import ImageSidecar
+from tests.test_cli import create_image_pdf
+
+
+class TestImageSidecar(unittest.TestCase):
+    def setUp(self):
+        """Set up a generated sample PDF and a sidecar directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.pdf_path = str(self.root / "sample.pdf")
+        generate_preset(self.pdf_path, "small")
+        self.sidecar_dir = str(self.root / "sidecars")
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_records_match_the_document(self):
+        """Test that the index describes every image of the PDF."""
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar, fitz.open(
+            self.pdf_path
+        ) as doc:
+            records = sidecar.query()
+            self.assertEqual(sidecar.page_count, doc.page_count)
+            self.assertEqual(len(records), sum(len(page.get_images()) for page in doc))
+
+            record = records[0]
+            self.assertEqual(record.page, 1)
+            self.assertEqual(record.xref, doc[0].get_images()[0][0])
+            self.assertEqual(record.bbox, tuple(doc[0].get_image_rects(record.xref)[0]))
+            self.assertEqual(
+                sidecar.extract_image(record)["image"], doc.extract_image(record.xref)["image"]
+            )
+
+    def test_queries(self):
+        """Test filtering by page range, size and stream hash."""
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar:
+            everything = sidecar.query()
+            pages = sidecar.query(start_page=2, end_page=3)
+            self.assertTrue(pages)
+            self.assertTrue(all(2 <= record.page <= 3 for record in pages))
+
+            widest = max(record.width for record in everything)
+            self.assertTrue(all(r.width == widest for r in sidecar.query(min_width=widest)))
+            self.assertEqual(sidecar.query(min_width=widest + 1), [])
+
+            copies = sidecar.query(sha256=everything[0].sha256)
+            self.assertIn(everything[0], copies)
+            self.assertEqual(sidecar.query(has_smask=True), [])
+
+    def test_invalidated_by_content_hash(self):
+        """Test that the index is reused until the file's content changes."""
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar:
+            self.assertFalse(sidecar.update())
+
+        # Same content, new modification time: no rebuild
+        later = time.time() + 10
+        os.utime(self.pdf_path, (later, later))
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar:
+            self.assertEqual(len(sidecar), 10)
+            self.assertFalse(sidecar.update())
+
+        create_image_pdf(self.pdf_path, 2)
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar:
+            self.assertEqual(len(sidecar), 2)
+            self.assertEqual(sidecar.page_count, 2)
+
+    def test_extraction_and_estimate_without_parsing_pages(self):
+        """Test that extraction and estimates select images from the index."""
+        output_dir = str(self.root / "out")
+        with ImageSidecar(self.pdf_path, self.sidecar_dir) as sidecar:
+            with mock.patch.object(fitz.Page, "get_images") as get_images:
+                count = pdf_processor.extract_images_from_pdf(
+                    self.pdf_path, output_dir, sidecar=sidecar
+                )
+                estimated = estimate(
+                    self.pdf_path,
+                    calibration=Calibration(str(self.root / "throughput.json")),
+                    sidecar=sidecar,
+                )
+            get_images.assert_not_called()
+
+        self.assertEqual(count, pdf_processor.extract_images_from_pdf(self.pdf_path, output_dir))
+        self.assertEqual(
+            estimated,
+            estimate(
+                self.pdf_path,
+                calibration=Calibration(str(self.root / "throughput.json")),
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
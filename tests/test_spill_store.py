@@ -0,0 +1,55 @@
+import unittest
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from src.engine.images import export_all_images
+from src.util.spill_store import SpillStore
+from tests.test_cli import create_image_pdf
+
+
+class TestSpillStore(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_spills_oldest_past_budget(self):
+        """Test that older buffers move to disk and read back unchanged."""
+        items = [bytes([i]) * 400 for i in range(5)]
+        with SpillStore(budget_mb=1000 / (1024 * 1024), directory=self.temp_dir.name) as store:
+            store.extend(items)
+            self.assertLessEqual(store.memory_bytes, 1000)
+            self.assertEqual(store.spilled_bytes, 1200)
+            self.assertEqual(list(store), items)
+            self.assertEqual(store[-1], items[-1])
+
+    def test_file_references(self):
+        """Test that files added by reference are read when accessed."""
+        path = self.output_dir / "image.bin"
+        path.write_bytes(b"staged")
+        store = SpillStore(budget_mb=0)
+        store.add_file(str(path))
+        self.assertEqual(store.memory_bytes, 0)
+        self.assertEqual(store[0], b"staged")
+        self.assertEqual(pickle.loads(pickle.dumps(store))[0], b"staged")
+        store.close()
+        self.assertEqual(len(store), 0)
+
+    def test_presentation_with_spilled_images(self):
+        """Test a presentation built from images that were all spilled."""
+        pdf_path = str(self.output_dir / "sample.pdf")
+        create_image_pdf(pdf_path, 3)
+        count = export_all_images(
+            pdf_path, str(self.output_dir), export_to_ppt=True, memory_budget_mb=0
+        )
+        self.assertEqual(count, 3)
+        self.assertTrue(os.path.exists(self.output_dir / "sample.pptx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import json
+import tempfile
+from pathlib import Path
+from src.modules.pdf_processor import extract_images_from_pdf
+from src.util import telemetry
+from tests.test_cli import create_image_pdf
+
+
+class TestTelemetry(unittest.TestCase):
+    def setUp(self):
+        """Set up a sample PDF and an in-memory sink."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.pdf_path = str(self.output_dir / "sample.pdf")
+        create_image_pdf(self.pdf_path, 3)
+        self.sink = telemetry.add_sink(telemetry.MemorySink())
+
+    def tearDown(self):
+        """Remove the sink and clean up."""
+        telemetry.remove_sink(self.sink)
+        self.temp_dir.cleanup()
+
+    def test_run_and_stage_events(self):
+        """Test that an extraction reports its stages and throughput."""
+        extract_images_from_pdf(self.pdf_path, str(self.output_dir / "images"))
+
+        stages = {record["stage"] for record in self.sink.events("stage")}
+        self.assertTrue({"extract_image", "decode", "encode", "write"} <= stages)
+
+        (run,) = self.sink.events("run")
+        self.assertEqual(run["run"], "extract_images")
+        self.assertEqual((run["pages"], run["images"]), (3, 3))
+        self.assertGreater(run["bytes_out"], 0)
+        self.assertGreater(run["images_per_second"], 0)
+
+    def test_disabled_telemetry_is_a_no_op(self):
+        """Test that nothing is recorded without sinks."""
+        telemetry.remove_sink(self.sink)
+        self.assertFalse(telemetry.enabled())
+        with telemetry.run("idle"), telemetry.stage("idle"):
+            telemetry.count(images=1)
+            telemetry.event("idle")
+        self.assertEqual(self.sink.records, [])
+
+    def test_jsonl_sink(self):
+        """Test that events are appended as JSON lines."""
+        path = self.output_dir / "events.jsonl"
+        sink = telemetry.add_sink(telemetry.JsonlSink(str(path)))
+        try:
+            telemetry.event("cache", name="test", hit=True)
+        finally:
+            telemetry.remove_sink(sink)
+            sink.close()
+
+        record = json.loads(path.read_text(encoding="utf-8"))
+        self.assertEqual((record["event"], record["hit"]), ("cache", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
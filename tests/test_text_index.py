@@ -0,0 +1,66 @@
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import fitz
+from src.util.text_index import TextIndex
+
+
+def create_pdf(path, page_texts):
+    """Create a PDF with the given text on each page."""
+    doc = fitz.open()
+    for text in page_texts:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+
+
+class TestTextIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary corpus and index."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name) / "corpus"
+        self.root.mkdir()
+        create_pdf(self.root / "a.pdf", ["alpha contract", "beta clause"])
+        create_pdf(self.root / "b.pdf", ["gamma", "delta", "beta appendix"])
+        self.index = TextIndex(Path(self.temp_dir.name) / "index.sqlite3", workers=1)
+
+    def tearDown(self):
+        """Close the index and remove temporary files."""
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def test_search_returns_document_page_and_snippet(self):
+        """Test that a query finds every page mentioning a term."""
+        self.assertEqual(self.index.update_directory(self.root), (2, 0, 0))
+
+        results = self.index.search("beta")
+        found = {(Path(path).name, page) for path, page, _ in results}
+        self.assertEqual(found, {("a.pdf", 2), ("b.pdf", 3)})
+        self.assertTrue(all("[beta]" in snippet for _, _, snippet in results))
+
+    def test_update_is_incremental(self):
+        """Test that unchanged files are skipped and changed files reindexed."""
+        self.index.update_directory(self.root)
+        self.assertEqual(self.index.update_directory(self.root), (0, 2, 0))
+
+        create_pdf(self.root / "a.pdf", ["epsilon"])
+        self.assertEqual(self.index.update_directory(self.root), (1, 1, 0))
+        self.assertEqual(self.index.search("alpha"), [])
+        self.assertEqual(len(self.index.search("epsilon")), 1)
+
+    def test_removed_files_are_pruned(self):
+        """Test that deleted files disappear from search results."""
+        self.index.update_directory(self.root)
+        shutil.copy(self.root / "b.pdf", self.root / "copy.pdf")
+        self.assertEqual(self.index.update_directory(self.root), (0, 3, 0))
+
+        (self.root / "b.pdf").unlink()
+        self.assertEqual(self.index.update_directory(self.root), (0, 2, 1))
+        results = self.index.search("gamma")
+        self.assertEqual([Path(path).name for path, _, _ in results], ["copy.pdf"])
+
+
+if __name__ == "__main__":
+    unittest.main()
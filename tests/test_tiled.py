@@ -0,0 +1,147 @@
+import unittest
+import io
+import os
+import random
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+from PIL import Image, ImageDraw, UnidentifiedImageError
+from benchmarks.corpus import make_image
+from src.util import tiled
+from src.util.image_handler import merge_images, remove_black_background_bytes, save_image
+from src.util.output_sink import ZipSink
+
+
+def make_png(size, mode="RGB"):
+    """Return PNG bytes of an image with a black background and shapes."""
+    image = Image.new(mode, size, "black")
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((10, 10, size[0] - 10, size[1] // 2), fill="orange")
+    draw.rectangle((20, size[1] // 2, size[0] // 2, size[1] - 5), fill="white")
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestTiledProcessing(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory and a sample image."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.temp_dir.name)
+        self.image_bytes = make_png((300, 700))
+        # Everything counts as large
+        self.tiled_env = mock.patch.dict(os.environ, {tiled.THRESHOLD_ENV_VAR: "0.0001"})
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def assertSamePixels(self, first, second):
+        with Image.open(io.BytesIO(first)) as a, Image.open(io.BytesIO(second)) as b:
+            self.assertEqual(a.mode, b.mode)
+            self.assertEqual(a.tobytes(), b.tobytes())
+
+    def save_both_ways(self, image_format, should_invert):
+        save_image(self.image_bytes, str(self.output_dir), "plain", should_invert, image_format)
+        with self.tiled_env:
+            os.makedirs(self.output_dir / "tiled", exist_ok=True)
+            save_image(
+                self.image_bytes, str(self.output_dir / "tiled"), "plain", should_invert, image_format
+            )
+        extension = "png" if image_format == "PNG" else "jpg"
+        return (
+            (self.output_dir / f"plain.{extension}").read_bytes(),
+            (self.output_dir / "tiled" / f"plain.{extension}").read_bytes(),
+        )
+
+    def test_png_stream_writer(self):
+        """Test that strips written one by one decode to the original image."""
+        for mode in ("L", "RGB", "RGBA"):
+            image = Image.open(io.BytesIO(make_png((123, 301), mode)))
+            buffer = io.BytesIO()
+            writer = tiled.PNGStreamWriter(buffer, image.size, mode)
+            for box in tiled.iter_strips(image, rows=50):
+                writer.write_strip(image.crop(box))
+            writer.close()
+            self.assertEqual(Image.open(buffer).tobytes(), image.tobytes())
+
+    def test_tiled_save_matches_whole_image(self):
+        """Test that tiled saving gives the same pixels as the whole-image path."""
+        for image_format in ("PNG", "JPEG"):
+            for should_invert in (False, True):
+                plain, tiled_output = self.save_both_ways(image_format, should_invert)
+                self.assertSamePixels(plain, tiled_output)
+
+    def test_tiled_auto_matches_whole_image(self):
+        """Test that large AUTO images get the format, alpha and pixels of small ones."""
+        rng = random.Random(3)
+        images = {
+            "line_art": self.image_bytes,
+            "photo": make_image(rng, (300, 700)),
+            "transparent": make_image(rng, (300, 700), alpha=True),
+        }
+        for name, image_bytes in images.items():
+            for should_invert in (False, True):
+                plain_dir = self.output_dir / f"{name}_{should_invert}"
+                tiled_dir = plain_dir / "tiled"
+                os.makedirs(tiled_dir)
+                plain = save_image(image_bytes, str(plain_dir), name, should_invert, "AUTO")
+                with self.tiled_env:
+                    large = save_image(image_bytes, str(tiled_dir), name, should_invert, "AUTO")
+                self.assertEqual(plain, large)
+                with Image.open(plain_dir / plain) as a, Image.open(tiled_dir / large) as b:
+                    self.assertEqual("A" in a.mode, "A" in b.mode, (name, should_invert))
+                    self.assertEqual(a.convert("RGBA").tobytes(), b.convert("RGBA").tobytes())
+
+    def test_tiled_key_and_merge(self):
+        """Test strip-wise keying and compositing of annotation overlays."""
+        overlay = remove_black_background_bytes(make_png((300, 700)))
+        expected = merge_images(self.image_bytes, overlay)
+        with self.tiled_env:
+            self.assertSamePixels(remove_black_background_bytes(make_png((300, 700))), overlay)
+            self.assertSamePixels(merge_images(self.image_bytes, overlay), expected)
+
+            # A smaller overlay is scaled strip by strip
+            small = remove_black_background_bytes(make_png((150, 350)))
+            with Image.open(io.BytesIO(merge_images(self.image_bytes, small))) as merged:
+                self.assertEqual(merged.size, (300, 700))
+
+    def test_open_above_decompression_bomb_limit(self):
+        """Test that large scans open past Pillow's default limit."""
+        with mock.patch.object(Image, "MAX_IMAGE_PIXELS", 1000):
+            with self.assertRaises(Image.DecompressionBombError):
+                Image.open(io.BytesIO(self.image_bytes))
+            self.assertEqual(tiled.open_image(self.image_bytes).size, (300, 700))
+            self.assertEqual(Image.MAX_IMAGE_PIXELS, 1000)
+
+        # Images within Pillow's limit open without raising it
+        limits = []
+        factory, accept = Image.OPEN["PNG"]
+
+        def recording_factory(*args):
+            limits.append(Image.MAX_IMAGE_PIXELS)
+            return factory(*args)
+
+        with mock.patch.dict(Image.OPEN, {"PNG": (recording_factory, accept)}):
+            tiled.open_image(self.image_bytes)
+        self.assertEqual(limits, [Image.MAX_IMAGE_PIXELS])
+
+        with mock.patch.object(tiled, "MAX_MP", 0.1):
+            with self.assertRaises(Image.DecompressionBombError):
+                tiled.open_image(self.image_bytes)
+        with self.assertRaises(UnidentifiedImageError):
+            tiled.open_image(b"not an image")
+
+    def test_tiled_save_to_archive(self):
+        """Test that large images are streamed into archive sinks."""
+        archive_path = self.output_dir / "images.zip"
+        with self.tiled_env, ZipSink(str(archive_path)) as sink:
+            save_image(self.image_bytes, None, "large", image_format="PNG", sink=sink)
+        with zipfile.ZipFile(archive_path) as archive:
+            with Image.open(io.BytesIO(archive.read("large.png"))) as image:
+                self.assertEqual(image.size, (300, 700))
+
+
+if __name__ == "__main__":
+    unittest.main()